@@ -2,7 +2,6 @@
 Minimalistic CBOR implementation, supports only what we need in cardano.
 """
 
-import ustruct as struct
 from micropython import const
 
 from trezor import log
@@ -28,133 +27,182 @@ _CBOR_BREAK = const(0x1F)
 _CBOR_RAW_TAG = const(0x18)
 
 
-def _header(typ, l: int):
+def _write_header(w, typ: int, l: int):
     if l < 24:
-        return struct.pack(">B", typ + l)
+        w.append(typ + l)
     elif l < 2 ** 8:
-        return struct.pack(">BB", typ + 24, l)
+        w.append(typ + 24)
+        w.append(l)
     elif l < 2 ** 16:
-        return struct.pack(">BH", typ + 25, l)
+        w.append(typ + 25)
+        _write_uint_be(w, l, 2)
     elif l < 2 ** 32:
-        return struct.pack(">BI", typ + 26, l)
+        w.append(typ + 26)
+        _write_uint_be(w, l, 4)
     elif l < 2 ** 64:
-        return struct.pack(">BQ", typ + 27, l)
+        w.append(typ + 27)
+        _write_uint_be(w, l, 8)
     else:
         raise NotImplementedError("Length %d not suppported" % l)
 
 
-def _cbor_encode(value):
+def _write_uint_be(w, n: int, size: int):
+    for shift in range((size - 1) * 8, -1, -8):
+        w.append((n >> shift) & 0xFF)
+
+
+def _cbor_encode(w, value):
     if isinstance(value, int):
-        yield _header(_CBOR_UNSIGNED_INT, value)
-    elif isinstance(value, bytes):
-        yield _header(_CBOR_BYTE_STRING, len(value))
-        yield value
-    elif isinstance(value, bytearray):
-        yield _header(_CBOR_BYTE_STRING, len(value))
-        yield bytes(value)
+        _write_header(w, _CBOR_UNSIGNED_INT, value)
+    elif isinstance(value, (bytes, bytearray)):
+        _write_header(w, _CBOR_BYTE_STRING, len(value))
+        w.extend(value)
     elif isinstance(value, list):
         # definite-length valued list
-        yield _header(_CBOR_ARRAY, len(value))
+        _write_header(w, _CBOR_ARRAY, len(value))
         for x in value:
-            yield from _cbor_encode(x)
+            _cbor_encode(w, x)
     elif isinstance(value, dict):
-        yield _header(_CBOR_MAP, len(value))
+        _write_header(w, _CBOR_MAP, len(value))
         for k, v in value.items():
-            yield from _cbor_encode(k)
-            yield from _cbor_encode(v)
+            _cbor_encode(w, k)
+            _cbor_encode(w, v)
     elif isinstance(value, Tagged):
-        yield _header(_CBOR_TAG, value.tag)
-        yield from _cbor_encode(value.value)
+        _write_header(w, _CBOR_TAG, value.tag)
+        _cbor_encode(w, value.value)
     elif isinstance(value, IndefiniteLengthArray):
-        yield bytes([_CBOR_ARRAY + 31])
+        w.append(_CBOR_ARRAY + 31)
         for x in value.array:
-            yield from _cbor_encode(x)
-        yield bytes([_CBOR_PRIMITIVE + 31])
+            _cbor_encode(w, x)
+        w.append(_CBOR_PRIMITIVE + 31)
     elif isinstance(value, Raw):
-        yield value.value
+        w.extend(value.value)
     else:
         if __debug__:
             log.debug(__name__, "not implemented (encode): %s", type(value))
         raise NotImplementedError()
 
 
-def _read_length(cbor, aux):
-    if aux == _CBOR_UINT8_FOLLOWS:
-        return (cbor[0], cbor[1:])
-    elif aux == _CBOR_UINT16_FOLLOWS:
-        res = cbor[1]
-        res += cbor[0] << 8
-        return (res, cbor[2:])
-    elif aux == _CBOR_UINT32_FOLLOWS:
-        res = cbor[3]
-        res += cbor[2] << 8
-        res += cbor[1] << 16
-        res += cbor[0] << 24
-        return (res, cbor[4:])
-    elif aux == _CBOR_UINT64_FOLLOWS:
-        res = cbor[7]
-        res += cbor[6] << 8
-        res += cbor[5] << 16
-        res += cbor[4] << 24
-        res += cbor[3] << 32
-        res += cbor[2] << 40
-        res += cbor[1] << 48
-        res += cbor[0] << 56
-        return (res, cbor[8:])
+def _read_length(cbor, ofs: int, aux: int):
+    if aux < _CBOR_UINT8_FOLLOWS:
+        return (aux, ofs)
+    elif aux <= _CBOR_UINT64_FOLLOWS:
+        end = ofs + (1 << (aux - _CBOR_UINT8_FOLLOWS))
+        if end > len(cbor):
+            raise ValueError
+        res = 0
+        while ofs < end:
+            res = (res << 8) | cbor[ofs]
+            ofs += 1
+        return (res, ofs)
     else:
         raise NotImplementedError("Length %d not suppported" % aux)
 
 
-def _cbor_decode(cbor):
-    fb = cbor[0]
-    data = b""
+def _cbor_decode(cbor, ofs: int):
+    if ofs >= len(cbor):
+        raise ValueError
+    fb = cbor[ofs]
     fb_type = fb & _CBOR_TYPE_MASK
     fb_aux = fb & _CBOR_INFO_BITS
+    ofs += 1
     if fb_type == _CBOR_UNSIGNED_INT:
-        if fb_aux < 0x18:
-            return (fb_aux, cbor[1:])
-        else:
-            val, data = _read_length(cbor[1:], fb_aux)
-            return (int(val), data)
+        return _read_length(cbor, ofs, fb_aux)
     elif fb_type == _CBOR_BYTE_STRING:
-        ln, data = _read_length(cbor[1:], fb_aux)
-        return (data[0:ln], data[ln:])
+        ln, ofs = _read_length(cbor, ofs, fb_aux)
+        if ofs + ln > len(cbor):
+            raise ValueError
+        return (bytes(cbor[ofs : ofs + ln]), ofs + ln)
     elif fb_type == _CBOR_ARRAY:
+        res = []
         if fb_aux == _CBOR_VAR_FOLLOWS:
-            res = []
-            data = cbor[1:]
             while True:
-                item, data = _cbor_decode(data)
-                if item == _CBOR_PRIMITIVE + _CBOR_BREAK:
-                    break
+                if ofs >= len(cbor):
+                    raise ValueError
+                if cbor[ofs] == _CBOR_PRIMITIVE + _CBOR_BREAK:
+                    return (res, ofs + 1)
+                item, ofs = _cbor_decode(cbor, ofs)
                 res.append(item)
-            return (res, data)
         else:
-            if fb_aux < _CBOR_UINT8_FOLLOWS:
-                ln = fb_aux
-                data = cbor[1:]
-            else:
-                ln, data = _read_length(cbor[1:], fb_aux)
-            res = []
+            ln, ofs = _read_length(cbor, ofs, fb_aux)
             for i in range(ln):
-                item, data = _cbor_decode(data)
+                item, ofs = _cbor_decode(cbor, ofs)
                 res.append(item)
-            return (res, data)
+            return (res, ofs)
     elif fb_type == _CBOR_MAP:
-        return ({}, cbor[1:])
+        return ({}, ofs)
     elif fb_type == _CBOR_TAG:
-        if cbor[1] == _CBOR_RAW_TAG:  # only tag 24 (0x18) is supported
-            return _cbor_decode(cbor[2:])
+        if ofs < len(cbor) and cbor[ofs] == _CBOR_RAW_TAG:
+            # only tag 24 (0x18) is supported
+            return _cbor_decode(cbor, ofs + 1)
         else:
             raise NotImplementedError()
     elif fb_type == _CBOR_PRIMITIVE:  # only break code is supported
-        return (cbor[0], cbor[1:])
+        return (fb, ofs)
     else:
         if __debug__:
-            log.debug(__name__, "not implemented (decode): %s", cbor[0])
+            log.debug(__name__, "not implemented (decode): %s", fb)
         raise NotImplementedError()
 
 
+async def _aread_length(reader, buf: memoryview, aux: int):
+    if aux < _CBOR_UINT8_FOLLOWS:
+        return aux
+    elif aux <= _CBOR_UINT64_FOLLOWS:
+        n = 1 << (aux - _CBOR_UINT8_FOLLOWS)
+        await reader.areadinto(buf[:n])
+        res = 0
+        for i in range(n):
+            res = (res << 8) | buf[i]
+        return res
+    else:
+        raise NotImplementedError("Length %d not suppported" % aux)
+
+
+async def _cbor_adecode(reader, buf: memoryview):
+    await reader.areadinto(buf[:1])
+    fb = buf[0]
+    fb_type = fb & _CBOR_TYPE_MASK
+    fb_aux = fb & _CBOR_INFO_BITS
+    if fb_type == _CBOR_UNSIGNED_INT:
+        return await _aread_length(reader, buf, fb_aux)
+    elif fb_type == _CBOR_BYTE_STRING:
+        ln = await _aread_length(reader, buf, fb_aux)
+        data = bytearray(ln)
+        await reader.areadinto(data)
+        return bytes(data)
+    elif fb_type == _CBOR_ARRAY:
+        res = []
+        if fb_aux == _CBOR_VAR_FOLLOWS:
+            while True:
+                item = await _cbor_adecode(reader, buf)
+                if item is _BREAK:
+                    return res
+                res.append(item)
+        else:
+            ln = await _aread_length(reader, buf, fb_aux)
+            for i in range(ln):
+                res.append(await _cbor_adecode(reader, buf))
+            return res
+    elif fb_type == _CBOR_MAP:
+        return {}
+    elif fb_type == _CBOR_TAG:
+        await reader.areadinto(buf[:1])
+        if buf[0] == _CBOR_RAW_TAG:  # only tag 24 (0x18) is supported
+            return await _cbor_adecode(reader, buf)
+        else:
+            raise NotImplementedError()
+    elif fb_type == _CBOR_PRIMITIVE:  # only break code is supported
+        return _BREAK if fb == _CBOR_PRIMITIVE + _CBOR_BREAK else fb
+    else:
+        if __debug__:
+            log.debug(__name__, "not implemented (decode): %s", fb)
+        raise NotImplementedError()
+
+
+_BREAK = object()  # break code of an indefinite-length array, see _cbor_adecode()
+
+
 class Tagged:
     def __init__(self, tag, value):
         self.tag = tag
@@ -172,12 +220,40 @@ class IndefiniteLengthArray:
         self.array = array
 
 
-def encode(value):
-    return b"".join(_cbor_encode(value))
+def encode(value) -> bytes:
+    w = bytearray()
+    _cbor_encode(w, value)
+    return bytes(w)
+
+
+def encode_into(w, value):
+    """
+    Encode `value` into `w`, which can be a preallocated `bytearray` or a
+    `HashWriter`, anything with `append()` and `extend()`.
+    """
+    _cbor_encode(w, value)
 
 
 def decode(cbor: bytes):
-    res, check = _cbor_decode(cbor)
-    if not (check == b""):
+    res, ofs = _cbor_decode(cbor, 0)
+    if ofs != len(cbor):
         raise ValueError()
     return res
+
+
+def decode_from(cbor, ofs: int = 0):
+    """
+    Decode one item from `cbor` (bytes, bytearray or memoryview) starting at
+    `ofs`.  Returns the item and the offset right after it, the remaining
+    data are never copied.
+    """
+    return _cbor_decode(cbor, ofs)
+
+
+async def decode_stream(reader):
+    """
+    Decode one item by pulling its data from `reader`, an async reader with
+    `areadinto(buf)`, such as the wire codec reader.  Only the decoded item
+    is allocated, the input is not buffered.
+    """
+    return await _cbor_adecode(reader, memoryview(bytearray(8)))
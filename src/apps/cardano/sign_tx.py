@@ -73,13 +73,15 @@ async def sign_tx(ctx, msg):
     progress.init(msg.transactions_count, "Loading data")
 
     try:
-        # request transactions
-        transactions = []
+        transaction = Transaction(msg.inputs, msg.outputs, keychain, msg.protocol_magic)
+
+        # request transactions, only the spent output amounts are kept
         tx_req = CardanoTxRequest()
         for index in range(msg.transactions_count):
             progress.advance()
             tx_ack = await request_transaction(ctx, tx_req, index)
-            transactions.append(tx_ack.transaction)
+            transaction.add_prev_tx(tx_ack.transaction)
+            tx_ack = None  # do not hold the raw tx while waiting for the next one
 
         # clear progress bar
         display_homescreen()
@@ -88,9 +90,6 @@ async def sign_tx(ctx, msg):
             await validate_path(ctx, validate_full_path, keychain, i.address_n)
 
         # sign the transaction bundle and prepare the result
-        transaction = Transaction(
-            msg.inputs, msg.outputs, transactions, keychain, msg.protocol_magic
-        )
         tx_body, tx_hash = transaction.serialise_tx()
         tx = CardanoSignedTx(tx_body=tx_body, tx_hash=tx_hash)
 
@@ -115,34 +114,39 @@ async def sign_tx(ctx, msg):
 
 
 class Transaction:
-    def __init__(
-        self,
-        inputs: list,
-        outputs: list,
-        transactions: list,
-        keychain,
-        protocol_magic: int,
-    ):
+    def __init__(self, inputs: list, outputs: list, keychain, protocol_magic: int):
         self.inputs = inputs
         self.outputs = outputs
-        self.transactions = transactions
         self.keychain = keychain
+        # amounts of the outputs spent by inputs, see add_prev_tx()
+        self.input_coins = [None] * len(inputs)
         # attributes have to be always empty in current Cardano
         self.attributes = {}
 
         self.network_name = KNOWN_PROTOCOL_MAGICS.get(protocol_magic, "Unknown")
         self.protocol_magic = protocol_magic
 
+    def add_prev_tx(self, raw_transaction: bytes):
+        """
+        Hash a previous transaction and keep the amounts of its outputs that
+        are spent by the inputs.  The transaction itself is not retained.
+        """
+        tx_hash = hashlib.blake2b(data=bytes(raw_transaction), outlen=32).digest()
+        outputs = None
+        for index, input in enumerate(self.inputs):
+            if self.input_coins[index] is None and bytes(input.prev_hash) == tx_hash:
+                if outputs is None:
+                    outputs = cbor.decode(raw_transaction)[1]
+                self.input_coins[index] = outputs[input.prev_index][1]
+
     def _process_inputs(self):
-        input_coins = []
         input_hashes = []
         output_indexes = []
         types = []
-        tx_data = {}
 
-        for raw_transaction in self.transactions:
-            tx_hash = hashlib.blake2b(data=bytes(raw_transaction), outlen=32).digest()
-            tx_data[tx_hash] = cbor.decode(raw_transaction)
+        for index, amount in enumerate(self.input_coins):
+            if amount is None:
+                raise wire.ProcessError("No tx data sent for input " + str(index))
 
         for input in self.inputs:
             input_hashes.append(input.prev_hash)
@@ -154,17 +158,6 @@ class Transaction:
             _, node = derive_address_and_node(self.keychain, input.address_n)
             nodes.append(node)
 
-        for index, output_index in enumerate(output_indexes):
-            tx_hash = bytes(input_hashes[index])
-            if tx_hash in tx_data:
-                tx = tx_data[tx_hash]
-                outputs = tx[1]
-                amount = outputs[output_index][1]
-                input_coins.append(amount)
-            else:
-                raise wire.ProcessError("No tx data sent for input " + str(index))
-
-        self.input_coins = input_coins
         self.nodes = nodes
         self.types = types
         self.input_hashes = input_hashes
@@ -258,11 +251,11 @@ class Transaction:
 
         outputs_cbor = cbor.IndefiniteLengthArray(outputs_cbor)
 
-        tx_aux_cbor = [inputs_cbor, outputs_cbor, self.attributes]
-        tx_hash = hashlib.blake2b(data=cbor.encode(tx_aux_cbor), outlen=32).digest()
+        tx_aux_cbor = cbor.encode([inputs_cbor, outputs_cbor, self.attributes])
+        tx_hash = hashlib.blake2b(data=tx_aux_cbor, outlen=32).digest()
 
         witnesses = self._build_witnesses(tx_hash)
-        tx_body = cbor.encode([tx_aux_cbor, witnesses])
+        tx_body = cbor.encode([cbor.Raw(tx_aux_cbor), witnesses])
 
         self.fee = self.compute_fee(
             self.input_coins, self.outgoing_coins, self.change_coins
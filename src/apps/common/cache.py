@@ -4,6 +4,8 @@ from apps.common import storage
 
 _cached_seed = None
 _cached_passphrase = None
+# data the apps derived from the seed, dropped together with it
+_cached_session_data = {}
 
 
 def get_state(prev_state: bytes = None, passphrase: str = None) -> bytes:
@@ -50,7 +52,16 @@ def set_passphrase(passphrase):
     _cached_passphrase = passphrase
 
 
+def get_session_data(key):
+    return _cached_session_data.get(key)
+
+
+def set_session_data(key, value):
+    _cached_session_data[key] = value
+
+
 def clear(skip_passphrase: bool = False):
+    _cached_session_data.clear()
     set_seed(None)
     if skip_passphrase:
         set_passphrase("")
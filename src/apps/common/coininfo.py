@@ -63,1145 +63,1162 @@ class CoinInfo:
 
 
 # fmt: off
-COINS = [
-    CoinInfo(
-        coin_name="Bitcoin",
-        coin_shortcut="BTC",
-        address_type=0,
-        address_type_p2sh=5,
-        maxfee_kb=2000000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="bc",
-        cashaddr_prefix=None,
-        slip44=0,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+# attributes of the supported coins in the order of CoinInfo arguments,
+# sorted by coin_name
+COIN_DATA = (
+    (
+        "Actinium",  # coin_name
+        "ACM",  # coin_shortcut
+        53,  # address_type
+        55,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Actinium Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "acm",  # bech32_prefix
+        None,  # cashaddr_prefix
+        228,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Testnet",
-        coin_shortcut="TEST",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=10000000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=0x045f1cf6,
-        bech32_prefix="tb",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Axe",  # coin_name
+        "AXE",  # coin_shortcut
+        55,  # address_type
+        16,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "DarkCoin Signed Message:\n",  # signed_message_header
+        0x02fe52cc,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        4242,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Actinium",
-        coin_shortcut="ACM",
-        address_type=53,
-        address_type_p2sh=55,
-        maxfee_kb=40000000,
-        signed_message_header="Actinium Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="acm",
-        cashaddr_prefix=None,
-        slip44=228,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bcash",  # coin_name
+        "BCH",  # coin_shortcut
+        0,  # address_type
+        5,  # address_type_p2sh
+        500000,  # maxfee_kb
+        "Bitcoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        "bitcoincash",  # cashaddr_prefix
+        145,  # slip44
+        False,  # segwit
+        0,  # fork_id
+        True,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Axe",
-        coin_shortcut="AXE",
-        address_type=55,
-        address_type_p2sh=16,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x02fe52cc,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=4242,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bcash Testnet",  # coin_name
+        "TBCH",  # coin_shortcut
+        111,  # address_type
+        196,  # address_type_p2sh
+        10000000,  # maxfee_kb
+        "Bitcoin Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        "bchtest",  # cashaddr_prefix
+        1,  # slip44
+        False,  # segwit
+        0,  # fork_id
+        True,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="BitCash",
-        coin_shortcut="BITC",
-        address_type=230,
-        address_type_p2sh=235,
-        maxfee_kb=30000000,
-        signed_message_header="Bitcash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=230,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bgold",  # coin_name
+        "BTG",  # coin_shortcut
+        38,  # address_type
+        23,  # address_type_p2sh
+        500000,  # maxfee_kb
+        "Bitcoin Gold Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "btg",  # bech32_prefix
+        None,  # cashaddr_prefix
+        156,  # slip44
+        True,  # segwit
+        79,  # fork_id
+        True,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bitcloud",
-        coin_shortcut="BTDX",
-        address_type=25,
-        address_type_p2sh=5,
-        maxfee_kb=1000000,
-        signed_message_header="Diamond Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=218,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bgold Testnet",  # coin_name
+        "TBTG",  # coin_shortcut
+        111,  # address_type
+        196,  # address_type_p2sh
+        500000,  # maxfee_kb
+        "Bitcoin Gold Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        0x044a5262,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "tbtg",  # bech32_prefix
+        None,  # cashaddr_prefix
+        156,  # slip44
+        True,  # segwit
+        79,  # fork_id
+        True,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bcash",
-        coin_shortcut="BCH",
-        address_type=0,
-        address_type_p2sh=5,
-        maxfee_kb=500000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix="bitcoincash",
-        slip44=145,
-        segwit=False,
-        fork_id=0,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "BitCash",  # coin_name
+        "BITC",  # coin_shortcut
+        230,  # address_type
+        235,  # address_type_p2sh
+        30000000,  # maxfee_kb
+        "Bitcash Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        230,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bcash Testnet",
-        coin_shortcut="TBCH",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=10000000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix="bchtest",
-        slip44=1,
-        segwit=False,
-        fork_id=0,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bitcloud",  # coin_name
+        "BTDX",  # coin_shortcut
+        25,  # address_type
+        5,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Diamond Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        218,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bgold",
-        coin_shortcut="BTG",
-        address_type=38,
-        address_type_p2sh=23,
-        maxfee_kb=500000,
-        signed_message_header="Bitcoin Gold Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="btg",
-        cashaddr_prefix=None,
-        slip44=156,
-        segwit=True,
-        fork_id=79,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bitcoin",  # coin_name
+        "BTC",  # coin_shortcut
+        0,  # address_type
+        5,  # address_type_p2sh
+        2000000,  # maxfee_kb
+        "Bitcoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        "bc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        0,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bgold Testnet",
-        coin_shortcut="TBTG",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=500000,
-        signed_message_header="Bitcoin Gold Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="tbtg",
-        cashaddr_prefix=None,
-        slip44=156,
-        segwit=True,
-        fork_id=79,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bitcore",  # coin_name
+        "BTX",  # coin_shortcut
+        3,  # address_type
+        125,  # address_type_p2sh
+        2000000,  # maxfee_kb
+        "BitCore Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        "btx",  # bech32_prefix
+        None,  # cashaddr_prefix
+        160,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bprivate",
-        coin_shortcut="BTCP",
-        address_type=4901,
-        address_type_p2sh=5039,
-        maxfee_kb=1000000,
-        signed_message_header="BitcoinPrivate Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=183,
-        segwit=False,
-        fork_id=42,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bitsend",  # coin_name
+        "BSD",  # coin_shortcut
+        102,  # address_type
+        5,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Bitsend Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        91,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bitcore",
-        coin_shortcut="BTX",
-        address_type=3,
-        address_type_p2sh=125,
-        maxfee_kb=2000000,
-        signed_message_header="BitCore Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="btx",
-        cashaddr_prefix=None,
-        slip44=160,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Bprivate",  # coin_name
+        "BTCP",  # coin_shortcut
+        4901,  # address_type
+        5039,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "BitcoinPrivate Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        183,  # slip44
+        False,  # segwit
+        42,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Bitsend",
-        coin_shortcut="BSD",
-        address_type=102,
-        address_type_p2sh=5,
-        maxfee_kb=1000000,
-        signed_message_header="Bitsend Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=91,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Capricoin",  # coin_name
+        "CPC",  # coin_shortcut
+        28,  # address_type
+        35,  # address_type_p2sh
+        2000000,  # maxfee_kb
+        "Capricoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        289,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Capricoin",
-        coin_shortcut="CPC",
-        address_type=28,
-        address_type_p2sh=35,
-        maxfee_kb=2000000,
-        signed_message_header="Capricoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=289,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Dash",  # coin_name
+        "DASH",  # coin_shortcut
+        76,  # address_type
+        16,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "DarkCoin Signed Message:\n",  # signed_message_header
+        0x02fe52cc,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        5,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Dash",
-        coin_shortcut="DASH",
-        address_type=76,
-        address_type_p2sh=16,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x02fe52cc,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=5,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Dash Testnet",  # coin_name
+        "tDASH",  # coin_shortcut
+        140,  # address_type
+        19,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "DarkCoin Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Dash Testnet",
-        coin_shortcut="tDASH",
-        address_type=140,
-        address_type_p2sh=19,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Decred",  # coin_name
+        "DCR",  # coin_shortcut
+        1855,  # address_type
+        1818,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Decred Signed Message:\n",  # signed_message_header
+        0x02fda926,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        42,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        True,  # decred
+        'secp256k1-decred',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Decred",
-        coin_shortcut="DCR",
-        address_type=1855,
-        address_type_p2sh=1818,
-        maxfee_kb=1000000,
-        signed_message_header="Decred Signed Message:\n",
-        xpub_magic=0x02fda926,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=42,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=True,
-        curve_name='secp256k1-decred',
+    (
+        "Decred Testnet",  # coin_name
+        "TDCR",  # coin_shortcut
+        3873,  # address_type
+        3836,  # address_type_p2sh
+        10000000,  # maxfee_kb
+        "Decred Signed Message:\n",  # signed_message_header
+        0x043587d1,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        True,  # decred
+        'secp256k1-decred',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Decred Testnet",
-        coin_shortcut="TDCR",
-        address_type=3873,
-        address_type_p2sh=3836,
-        maxfee_kb=10000000,
-        signed_message_header="Decred Signed Message:\n",
-        xpub_magic=0x043587d1,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=True,
-        curve_name='secp256k1-decred',
+    (
+        "Denarius",  # coin_name
+        "DNR",  # coin_shortcut
+        30,  # address_type
+        90,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "Denarius Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        116,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Denarius",
-        coin_shortcut="DNR",
-        address_type=30,
-        address_type_p2sh=90,
-        maxfee_kb=100000,
-        signed_message_header="Denarius Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=116,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "DigiByte",  # coin_name
+        "DGB",  # coin_shortcut
+        30,  # address_type
+        63,  # address_type_p2sh
+        500000,  # maxfee_kb
+        "DigiByte Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "dgb",  # bech32_prefix
+        None,  # cashaddr_prefix
+        20,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="DigiByte",
-        coin_shortcut="DGB",
-        address_type=30,
-        address_type_p2sh=63,
-        maxfee_kb=500000,
-        signed_message_header="DigiByte Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="dgb",
-        cashaddr_prefix=None,
-        slip44=20,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Dogecoin",  # coin_name
+        "DOGE",  # coin_shortcut
+        30,  # address_type
+        22,  # address_type_p2sh
+        1000000000,  # maxfee_kb
+        "Dogecoin Signed Message:\n",  # signed_message_header
+        0x02facafd,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        3,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Dogecoin",
-        coin_shortcut="DOGE",
-        address_type=30,
-        address_type_p2sh=22,
-        maxfee_kb=1000000000,
-        signed_message_header="Dogecoin Signed Message:\n",
-        xpub_magic=0x02facafd,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=3,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Feathercoin",  # coin_name
+        "FTC",  # coin_shortcut
+        14,  # address_type
+        5,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Feathercoin Signed Message:\n",  # signed_message_header
+        0x0488bc26,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "fc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        8,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Feathercoin",
-        coin_shortcut="FTC",
-        address_type=14,
-        address_type_p2sh=5,
-        maxfee_kb=40000000,
-        signed_message_header="Feathercoin Signed Message:\n",
-        xpub_magic=0x0488bc26,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="fc",
-        cashaddr_prefix=None,
-        slip44=8,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Flashcoin",  # coin_name
+        "FLASH",  # coin_shortcut
+        68,  # address_type
+        130,  # address_type_p2sh
+        4000000,  # maxfee_kb
+        "Flashcoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        120,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Flashcoin",
-        coin_shortcut="FLASH",
-        address_type=68,
-        address_type_p2sh=130,
-        maxfee_kb=4000000,
-        signed_message_header="Flashcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=120,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Florincoin",  # coin_name
+        "FLO",  # coin_shortcut
+        35,  # address_type
+        94,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Florincoin Signed Message:\n",  # signed_message_header
+        0x00174921,  # xpub_magic
+        0x01b26ef6,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "flo",  # bech32_prefix
+        None,  # cashaddr_prefix
+        216,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Florincoin",
-        coin_shortcut="FLO",
-        address_type=35,
-        address_type_p2sh=94,
-        maxfee_kb=40000000,
-        signed_message_header="Florincoin Signed Message:\n",
-        xpub_magic=0x00174921,
-        xpub_magic_segwit_p2sh=0x01b26ef6,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="flo",
-        cashaddr_prefix=None,
-        slip44=216,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Fujicoin",  # coin_name
+        "FJC",  # coin_shortcut
+        36,  # address_type
+        16,  # address_type_p2sh
+        10000000,  # maxfee_kb
+        "FujiCoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        "fc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        75,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Fujicoin",
-        coin_shortcut="FJC",
-        address_type=36,
-        address_type_p2sh=16,
-        maxfee_kb=10000000,
-        signed_message_header="FujiCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="fc",
-        cashaddr_prefix=None,
-        slip44=75,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "GameCredits",  # coin_name
+        "GAME",  # coin_shortcut
+        38,  # address_type
+        62,  # address_type_p2sh
+        5000000,  # maxfee_kb
+        "GameCredits Signed Message:\n",  # signed_message_header
+        0x019d9cfe,  # xpub_magic
+        0x01b26ef6,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "game",  # bech32_prefix
+        None,  # cashaddr_prefix
+        101,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Gincoin",
-        coin_shortcut="GIN",
-        address_type=38,
-        address_type_p2sh=10,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x02fe52cc,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=2000,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Gincoin",  # coin_name
+        "GIN",  # coin_shortcut
+        38,  # address_type
+        10,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "DarkCoin Signed Message:\n",  # signed_message_header
+        0x02fe52cc,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        2000,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="GameCredits",
-        coin_shortcut="GAME",
-        address_type=38,
-        address_type_p2sh=62,
-        maxfee_kb=5000000,
-        signed_message_header="GameCredits Signed Message:\n",
-        xpub_magic=0x019d9cfe,
-        xpub_magic_segwit_p2sh=0x01b26ef6,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="game",
-        cashaddr_prefix=None,
-        slip44=101,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Groestlcoin",  # coin_name
+        "GRS",  # coin_shortcut
+        36,  # address_type
+        5,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "GroestlCoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        "grs",  # bech32_prefix
+        None,  # cashaddr_prefix
+        17,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1-groestl',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Groestlcoin",
-        coin_shortcut="GRS",
-        address_type=36,
-        address_type_p2sh=5,
-        maxfee_kb=100000,
-        signed_message_header="GroestlCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="grs",
-        cashaddr_prefix=None,
-        slip44=17,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-groestl',
+    (
+        "Groestlcoin Testnet",  # coin_name
+        "tGRS",  # coin_shortcut
+        111,  # address_type
+        196,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "GroestlCoin Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        0x044a5262,  # xpub_magic_segwit_p2sh
+        0x045f1cf6,  # xpub_magic_segwit_native
+        "tgrs",  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1-groestl',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Groestlcoin Testnet",
-        coin_shortcut="tGRS",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=100000,
-        signed_message_header="GroestlCoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=0x045f1cf6,
-        bech32_prefix="tgrs",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-groestl',
+    (
+        "Komodo",  # coin_name
+        "KMD",  # coin_shortcut
+        60,  # address_type
+        85,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Komodo Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        141,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Komodo",
-        coin_shortcut="KMD",
-        address_type=60,
-        address_type_p2sh=85,
-        maxfee_kb=1000000,
-        signed_message_header="Komodo Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=141,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Koto",  # coin_name
+        "KOTO",  # coin_shortcut
+        6198,  # address_type
+        6203,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Koto Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        510,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Koto",
-        coin_shortcut="KOTO",
-        address_type=6198,
-        address_type_p2sh=6203,
-        maxfee_kb=1000000,
-        signed_message_header="Koto Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=510,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Litecoin",  # coin_name
+        "LTC",  # coin_shortcut
+        48,  # address_type
+        50,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Litecoin Signed Message:\n",  # signed_message_header
+        0x019da462,  # xpub_magic
+        0x01b26ef6,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "ltc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        2,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Litecoin",
-        coin_shortcut="LTC",
-        address_type=48,
-        address_type_p2sh=50,
-        maxfee_kb=40000000,
-        signed_message_header="Litecoin Signed Message:\n",
-        xpub_magic=0x019da462,
-        xpub_magic_segwit_p2sh=0x01b26ef6,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="ltc",
-        cashaddr_prefix=None,
-        slip44=2,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Litecoin Testnet",  # coin_name
+        "TLTC",  # coin_shortcut
+        111,  # address_type
+        58,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Litecoin Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "tltc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Litecoin Testnet",
-        coin_shortcut="TLTC",
-        address_type=111,
-        address_type_p2sh=58,
-        maxfee_kb=40000000,
-        signed_message_header="Litecoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="tltc",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Megacoin",  # coin_name
+        "MEC",  # coin_shortcut
+        50,  # address_type
+        5,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "MegaCoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        217,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Megacoin",
-        coin_shortcut="MEC",
-        address_type=50,
-        address_type_p2sh=5,
-        maxfee_kb=1000000,
-        signed_message_header="MegaCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=217,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Monacoin",  # coin_name
+        "MONA",  # coin_shortcut
+        50,  # address_type
+        55,  # address_type_p2sh
+        5000000,  # maxfee_kb
+        "Monacoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "mona",  # bech32_prefix
+        None,  # cashaddr_prefix
+        22,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Monacoin",
-        coin_shortcut="MONA",
-        address_type=50,
-        address_type_p2sh=55,
-        maxfee_kb=5000000,
-        signed_message_header="Monacoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="mona",
-        cashaddr_prefix=None,
-        slip44=22,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "MonetaryUnit",  # coin_name
+        "MUE",  # coin_shortcut
+        16,  # address_type
+        76,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "MonetaryUnit Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        31,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="MonetaryUnit",
-        coin_shortcut="MUE",
-        address_type=16,
-        address_type_p2sh=76,
-        maxfee_kb=100000,
-        signed_message_header="MonetaryUnit Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=31,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Myriad",  # coin_name
+        "XMY",  # coin_shortcut
+        50,  # address_type
+        9,  # address_type_p2sh
+        2000000,  # maxfee_kb
+        "Myriadcoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        90,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Myriad",
-        coin_shortcut="XMY",
-        address_type=50,
-        address_type_p2sh=9,
-        maxfee_kb=2000000,
-        signed_message_header="Myriadcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=90,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "NIX",  # coin_name
+        "NIX",  # coin_shortcut
+        38,  # address_type
+        53,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "NIX Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "nix",  # bech32_prefix
+        None,  # cashaddr_prefix
+        400,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="NIX",
-        coin_shortcut="NIX",
-        address_type=38,
-        address_type_p2sh=53,
-        maxfee_kb=40000000,
-        signed_message_header="NIX Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="nix",
-        cashaddr_prefix=None,
-        slip44=400,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Namecoin",  # coin_name
+        "NMC",  # coin_shortcut
+        52,  # address_type
+        5,  # address_type_p2sh
+        10000000,  # maxfee_kb
+        "Namecoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        7,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Namecoin",
-        coin_shortcut="NMC",
-        address_type=52,
-        address_type_p2sh=5,
-        maxfee_kb=10000000,
-        signed_message_header="Namecoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=7,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "PIVX",  # coin_name
+        "PIVX",  # coin_shortcut
+        30,  # address_type
+        13,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "DarkNet Signed Message:\n",  # signed_message_header
+        0x022d2533,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        119,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="PIVX",
-        coin_shortcut="PIVX",
-        address_type=30,
-        address_type_p2sh=13,
-        maxfee_kb=100000,
-        signed_message_header="DarkNet Signed Message:\n",
-        xpub_magic=0x022d2533,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=119,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "PIVX Testnet",  # coin_name
+        "tPIVX",  # coin_shortcut
+        139,  # address_type
+        19,  # address_type_p2sh
+        100000,  # maxfee_kb
+        "DarkNet Signed Message:\n",  # signed_message_header
+        0x3a8061a0,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="PIVX Testnet",
-        coin_shortcut="tPIVX",
-        address_type=139,
-        address_type_p2sh=19,
-        maxfee_kb=100000,
-        signed_message_header="DarkNet Signed Message:\n",
-        xpub_magic=0x3a8061a0,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Pesetacoin",  # coin_name
+        "PTC",  # coin_shortcut
+        47,  # address_type
+        22,  # address_type_p2sh
+        1000000000,  # maxfee_kb
+        "Pesetacoin Signed Message:\n",  # signed_message_header
+        0x0488c42e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "null",  # bech32_prefix
+        None,  # cashaddr_prefix
+        109,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Pesetacoin",
-        coin_shortcut="PTC",
-        address_type=47,
-        address_type_p2sh=22,
-        maxfee_kb=1000000000,
-        signed_message_header="Pesetacoin Signed Message:\n",
-        xpub_magic=0x0488c42e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="null",
-        cashaddr_prefix=None,
-        slip44=109,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Primecoin",  # coin_name
+        "XPM",  # coin_shortcut
+        23,  # address_type
+        83,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Primecoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        24,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Primecoin",
-        coin_shortcut="XPM",
-        address_type=23,
-        address_type_p2sh=83,
-        maxfee_kb=1000000,
-        signed_message_header="Primecoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=24,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Qtum",  # coin_name
+        "QTUM",  # coin_shortcut
+        58,  # address_type
+        50,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Qtum Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        "qc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        2301,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Qtum",
-        coin_shortcut="QTUM",
-        address_type=58,
-        address_type_p2sh=50,
-        maxfee_kb=40000000,
-        signed_message_header="Qtum Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="qc",
-        cashaddr_prefix=None,
-        slip44=2301,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Qtum Testnet",  # coin_name
+        "tQTUM",  # coin_shortcut
+        120,  # address_type
+        110,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Qtum Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        0x044a5262,  # xpub_magic_segwit_p2sh
+        0x045f1cf6,  # xpub_magic_segwit_native
+        "tq",  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Qtum Testnet",
-        coin_shortcut="tQTUM",
-        address_type=120,
-        address_type_p2sh=110,
-        maxfee_kb=40000000,
-        signed_message_header="Qtum Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=0x045f1cf6,
-        bech32_prefix="tq",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Ravencoin",  # coin_name
+        "RVN",  # coin_shortcut
+        60,  # address_type
+        122,  # address_type_p2sh
+        2000000,  # maxfee_kb
+        "Ravencoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        175,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Ravencoin",
-        coin_shortcut="RVN",
-        address_type=60,
-        address_type_p2sh=122,
-        maxfee_kb=2000000,
-        signed_message_header="Ravencoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=175,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "SmartCash",  # coin_name
+        "SMART",  # coin_shortcut
+        63,  # address_type
+        18,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "SmartCash Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        224,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1-smart',  # curve_name
     ),
-    CoinInfo(
-        coin_name="SmartCash",
-        coin_shortcut="SMART",
-        address_type=63,
-        address_type_p2sh=18,
-        maxfee_kb=1000000,
-        signed_message_header="SmartCash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=224,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-smart',
+    (
+        "SmartCash Testnet",  # coin_name
+        "tSMART",  # coin_shortcut
+        65,  # address_type
+        21,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "SmartCash Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        224,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1-smart',  # curve_name
     ),
-    CoinInfo(
-        coin_name="SmartCash Testnet",
-        coin_shortcut="tSMART",
-        address_type=65,
-        address_type_p2sh=21,
-        maxfee_kb=1000000,
-        signed_message_header="SmartCash Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=224,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-smart',
+    (
+        "Stakenet",  # coin_name
+        "XSN",  # coin_shortcut
+        76,  # address_type
+        16,  # address_type_p2sh
+        2000000,  # maxfee_kb
+        "DarkCoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        0x04b24746,  # xpub_magic_segwit_native
+        "xc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        199,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Stakenet",
-        coin_shortcut="XSN",
-        address_type=76,
-        address_type_p2sh=16,
-        maxfee_kb=2000000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="xc",
-        cashaddr_prefix=None,
-        slip44=199,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Testnet",  # coin_name
+        "TEST",  # coin_shortcut
+        111,  # address_type
+        196,  # address_type_p2sh
+        10000000,  # maxfee_kb
+        "Bitcoin Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        0x044a5262,  # xpub_magic_segwit_p2sh
+        0x045f1cf6,  # xpub_magic_segwit_native
+        "tb",  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Vertcoin",
-        coin_shortcut="VTC",
-        address_type=71,
-        address_type_p2sh=5,
-        maxfee_kb=40000000,
-        signed_message_header="Vertcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="vtc",
-        cashaddr_prefix=None,
-        slip44=28,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Vertcoin",  # coin_name
+        "VTC",  # coin_shortcut
+        71,  # address_type
+        5,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Vertcoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "vtc",  # bech32_prefix
+        None,  # cashaddr_prefix
+        28,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Viacoin",
-        coin_shortcut="VIA",
-        address_type=71,
-        address_type_p2sh=33,
-        maxfee_kb=40000000,
-        signed_message_header="Viacoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="via",
-        cashaddr_prefix=None,
-        slip44=14,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Viacoin",  # coin_name
+        "VIA",  # coin_shortcut
+        71,  # address_type
+        33,  # address_type_p2sh
+        40000000,  # maxfee_kb
+        "Viacoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        0x049d7cb2,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        "via",  # bech32_prefix
+        None,  # cashaddr_prefix
+        14,  # slip44
+        True,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="ZClassic",
-        coin_shortcut="ZCL",
-        address_type=7352,
-        address_type_p2sh=7357,
-        maxfee_kb=1000000,
-        signed_message_header="Zcash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=147,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "ZClassic",  # coin_name
+        "ZCL",  # coin_shortcut
+        7352,  # address_type
+        7357,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Zcash Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        147,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Zcash",
-        coin_shortcut="ZEC",
-        address_type=7352,
-        address_type_p2sh=7357,
-        maxfee_kb=1000000,
-        signed_message_header="Zcash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=133,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Zcash",  # coin_name
+        "ZEC",  # coin_shortcut
+        7352,  # address_type
+        7357,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Zcash Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        133,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Zcash Testnet",
-        coin_shortcut="TAZ",
-        address_type=7461,
-        address_type_p2sh=7354,
-        maxfee_kb=10000000,
-        signed_message_header="Zcash Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Zcash Testnet",  # coin_name
+        "TAZ",  # coin_shortcut
+        7461,  # address_type
+        7354,  # address_type_p2sh
+        10000000,  # maxfee_kb
+        "Zcash Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Zcoin",
-        coin_shortcut="XZC",
-        address_type=82,
-        address_type_p2sh=7,
-        maxfee_kb=1000000,
-        signed_message_header="Zcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=136,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Zcoin",  # coin_name
+        "XZC",  # coin_shortcut
+        82,  # address_type
+        7,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Zcoin Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        136,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Zcoin Testnet",
-        coin_shortcut="tXZC",
-        address_type=65,
-        address_type_p2sh=178,
-        maxfee_kb=1000000,
-        signed_message_header="Zcoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Zcoin Testnet",  # coin_name
+        "tXZC",  # coin_shortcut
+        65,  # address_type
+        178,  # address_type_p2sh
+        1000000,  # maxfee_kb
+        "Zcoin Signed Message:\n",  # signed_message_header
+        0x043587cf,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        1,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        False,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-    CoinInfo(
-        coin_name="Zencash",
-        coin_shortcut="ZEN",
-        address_type=8329,
-        address_type_p2sh=8342,
-        maxfee_kb=2000000,
-        signed_message_header="Zencash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=121,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=True,
-        decred=False,
-        curve_name='secp256k1',
+    (
+        "Zencash",  # coin_name
+        "ZEN",  # coin_shortcut
+        8329,  # address_type
+        8342,  # address_type_p2sh
+        2000000,  # maxfee_kb
+        "Zencash Signed Message:\n",  # signed_message_header
+        0x0488b21e,  # xpub_magic
+        None,  # xpub_magic_segwit_p2sh
+        None,  # xpub_magic_segwit_native
+        None,  # bech32_prefix
+        None,  # cashaddr_prefix
+        121,  # slip44
+        False,  # segwit
+        None,  # fork_id
+        False,  # force_bip143
+        True,  # bip115
+        False,  # decred
+        'secp256k1',  # curve_name
     ),
-]
+)
+
+# indexes into COIN_DATA sorted by coin_shortcut and by slip44, coins sharing
+# the same key keep the order of the coin definitions
+COIN_DATA_BY_SHORTCUT = (
+    0, 1, 2, 6, 10, 8, 11, 7, 4, 9, 12, 13, 15, 18, 17, 19,
+    23, 21, 22, 20, 24, 25, 26, 28, 29, 30, 32, 33, 34, 36, 37, 38,
+    40, 42, 44, 45, 53, 3, 5, 16, 48, 31, 50, 49, 35, 41, 47, 54,
+    51, 52, 56, 14, 27, 39, 43, 46, 55,
+)
+COIN_DATA_BY_SLIP44 = (
+    8, 48, 3, 14, 16, 27, 31, 39, 43, 53, 55, 30, 19, 13, 37, 20,
+    50, 26, 18, 33, 41, 49, 34, 15, 23, 35, 10, 24, 40, 17, 38, 21,
+    56, 52, 54, 28, 2, 51, 4, 5, 9, 44, 11, 47, 22, 32, 7, 45,
+    46, 0, 6, 12, 36, 29, 25, 42, 1,
+)
@@ -90,13 +90,38 @@ ATTRIBUTES = (
     ("decred", bool),
     ("curve_name", lambda r: repr(r.replace("_", "-"))),
 )
+
+def index_lines(index):
+    for i in range(0, len(index), 16):
+        yield " ".join("%d," % x for x in index[i:i + 16])
+
+coins = list(supported_on("trezor2", bitcoin))
+by_name = sorted(range(len(coins)), key=lambda i: coins[i]["coin_name"])
+position = {c: i for i, c in enumerate(by_name)}
+by_shortcut = sorted(by_name, key=lambda c: (coins[c]["coin_shortcut"], c))
+by_slip44 = sorted(by_name, key=lambda c: (coins[c]["slip44"], c))
 %>\
-COINS = [
-% for coin in supported_on("trezor2", bitcoin):
-    CoinInfo(
+# attributes of the supported coins in the order of CoinInfo arguments,
+# sorted by coin_name
+COIN_DATA = (
+% for c in by_name:
+    (
         % for attr, func in ATTRIBUTES:
-        ${attr}=${func(coin[attr])},
+        ${func(coins[c][attr])},  # ${attr}
         % endfor
     ),
 % endfor
-]
+)
+
+# indexes into COIN_DATA sorted by coin_shortcut and by slip44, coins sharing
+# the same key keep the order of the coin definitions
+COIN_DATA_BY_SHORTCUT = (
+% for line in index_lines([position[c] for c in by_shortcut]):
+    ${line}
+% endfor
+)
+COIN_DATA_BY_SLIP44 = (
+% for line in index_lines([position[c] for c in by_slip44]):
+    ${line}
+% endfor
+)
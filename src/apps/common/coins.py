@@ -1,22 +1,65 @@
-from apps.common.coininfo import COINS
+from micropython import const
+
+from apps.common.coininfo import (
+    COIN_DATA,
+    COIN_DATA_BY_SHORTCUT,
+    COIN_DATA_BY_SLIP44,
+    CoinInfo,
+)
+
+# positions of the looked-up attributes in COIN_DATA entries
+_COIN_NAME = const(0)
+_COIN_SHORTCUT = const(1)
+_SLIP44 = const(11)
+
+# CoinInfo objects are created on the first lookup of the coin
+_coins = {}  # index into COIN_DATA -> CoinInfo
 
 
 def by_shortcut(shortcut):
-    for c in COINS:
-        if c.coin_shortcut == shortcut:
-            return c
-    raise ValueError('Unknown coin shortcut "%s"' % shortcut)
+    c = _find(COIN_DATA_BY_SHORTCUT, _COIN_SHORTCUT, shortcut)
+    if c is None:
+        raise ValueError('Unknown coin shortcut "%s"' % shortcut)
+    return c
 
 
 def by_name(name):
-    for c in COINS:
-        if c.coin_name == name:
-            return c
-    raise ValueError('Unknown coin name "%s"' % name)
+    c = _find(None, _COIN_NAME, name)
+    if c is None:
+        raise ValueError('Unknown coin name "%s"' % name)
+    return c
 
 
 def by_slip44(slip44):
-    for c in COINS:
-        if c.slip44 == slip44:
-            return c
-    raise ValueError("Unknown coin slip44 index %d" % slip44)
+    c = _find(COIN_DATA_BY_SLIP44, _SLIP44, slip44)
+    if c is None:
+        raise ValueError("Unknown coin slip44 index %d" % slip44)
+    return c
+
+
+def _find(order, attr, key):
+    """
+    Binary search for the first coin with attribute `attr` equal to `key`.
+    `order` is a tuple of COIN_DATA indexes sorted by `attr`, or None if
+    COIN_DATA itself is sorted by `attr`.
+    """
+    if key is None:
+        return None
+    lo = 0
+    hi = len(COIN_DATA)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        i = order[mid] if order is not None else mid
+        if COIN_DATA[i][attr] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == len(COIN_DATA):
+        return None
+    i = order[lo] if order is not None else lo
+    if COIN_DATA[i][attr] != key:
+        return None
+    c = _coins.get(i)
+    if c is None:
+        c = _coins[i] = CoinInfo(*COIN_DATA[i])
+    return c
@@ -1,3 +1,5 @@
+from micropython import const
+
 from trezor import ui, wire
 from trezor.crypto import bip32
 
@@ -6,23 +8,32 @@ from apps.common.request_passphrase import protect_by_passphrase
 
 allow = list
 
+_NODE_CACHE_SIZE = const(8)  # number of cached intermediate nodes
+
 
 class Keychain:
     """
     Keychain provides an API for deriving HD keys from previously allowed
-    key-spaces.
+    key-spaces.  Parents of the derived nodes are kept in a small LRU cache,
+    so that sibling nodes are derived from their cached parent.
     """
 
     def __init__(self, seed: bytes, namespaces: list):
         self.seed = seed
         self.namespaces = namespaces
         self.roots = [None] * len(namespaces)
+        self.nodes = {}  # (curve_name, path) -> HDNode
+        self.nodes_lru = []  # keys of self.nodes, most recently used last
 
     def __del__(self):
         for root in self.roots:
             if root is not None:
                 root.__del__()
+        for node in self.nodes.values():
+            node.__del__()
         del self.roots
+        del self.nodes
+        del self.nodes_lru
         del self.seed
 
     def validate_path(self, checked_path: list):
@@ -51,11 +62,45 @@ class Keychain:
             self.roots[root_index] = root
 
         # TODO check for ed25519?
-        # derive child node from the root
-        node = root.clone()
-        node.derive_path(suffix)
+        # derive child node from the root, or from the cached parent
+        if len(suffix) < 2:
+            node = root.clone()
+            node.derive_path(suffix)
+        else:
+            parent = self._derive_parent(root, len(path), node_path, curve_name)
+            node = parent.clone()
+            node.derive(node_path[-1])
         return node
 
+    def _derive_parent(
+        self, root: bip32.HDNode, root_depth: int, node_path: list, curve_name: str
+    ) -> bip32.HDNode:
+        key = (curve_name, tuple(node_path[:-1]))
+        parent = self.nodes.get(key)
+        if parent is not None:
+            self.nodes_lru.remove(key)
+            self.nodes_lru.append(key)
+            return parent
+
+        # start from the deepest cached ancestor, or from the root
+        node = root
+        depth = len(node_path) - 2
+        while depth > root_depth:
+            ancestor = self.nodes.get((curve_name, tuple(node_path[:depth])))
+            if ancestor is not None:
+                node = ancestor
+                break
+            depth -= 1
+        parent = node.clone()
+        parent.derive_path(node_path[depth:-1])
+
+        # cache the parent, evict the least recently used node if full
+        if len(self.nodes_lru) >= _NODE_CACHE_SIZE:
+            self.nodes.pop(self.nodes_lru.pop(0)).__del__()
+        self.nodes[key] = parent
+        self.nodes_lru.append(key)
+        return parent
+
 
 async def get_keychain(ctx: wire.Context, namespaces: list) -> Keychain:
     if not storage.is_initialized():
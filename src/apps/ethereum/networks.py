@@ -13,22 +13,42 @@ def shortcut_by_chain_id(chain_id, tx_type=None):
 
 
 def by_chain_id(chain_id):
-    for n in NETWORKS:
-        if n.chain_id == chain_id:
-            return n
-    return None
+    i = _find(None, "chain_id", chain_id)
+    return NETWORKS[i] if i is not None else None
 
 
 def by_slip44(slip44):
-    for n in NETWORKS:
-        if n.slip44 == slip44:
-            return n
-    return None
+    i = _find(NETWORKS_BY_SLIP44, "slip44", slip44)
+    return NETWORKS[i] if i is not None else None
 
 
 def all_slip44_ids_hardened():
-    for n in NETWORKS:
-        yield n.slip44 | HARDENED
+    return SLIP44_IDS_HARDENED
+
+
+def _find(order, attr, key):
+    """
+    Binary search for the index of the first network with attribute `attr`
+    equal to `key`.  `order` is a tuple of NETWORKS indexes sorted by `attr`,
+    or None if NETWORKS itself is sorted by `attr`.
+    """
+    if key is None:
+        return None
+    lo = 0
+    hi = len(NETWORKS)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        i = order[mid] if order is not None else mid
+        if getattr(NETWORKS[i], attr) < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == len(NETWORKS):
+        return None
+    i = order[lo] if order is not None else lo
+    if getattr(NETWORKS[i], attr) != key:
+        return None
+    return i
 
 
 class NetworkInfo:
@@ -43,6 +63,7 @@ class NetworkInfo:
 
 
 # fmt: off
+# sorted by chain_id
 NETWORKS = [
     NetworkInfo(
         chain_id=1,
@@ -234,3 +255,37 @@ NETWORKS = [
         rskip60=False,
     ),
 ]
+
+# indexes into NETWORKS sorted by slip44, networks sharing the same slip44
+# keep the order of the network definitions
+NETWORKS_BY_SLIP44 = (
+    2, 3, 8, 11, 23, 1, 0, 10, 13, 4, 6, 12, 26, 25, 14, 15, 5, 16, 17, 18, 19, 9, 20, 7, 21, 22, 24,
+)
+
+# distinct slip44 ids of all networks, hardened
+SLIP44_IDS_HARDENED = (
+    1 | HARDENED,
+    40 | HARDENED,
+    60 | HARDENED,
+    61 | HARDENED,
+    76 | HARDENED,
+    108 | HARDENED,
+    137 | HARDENED,
+    163 | HARDENED,
+    164 | HARDENED,
+    184 | HARDENED,
+    237 | HARDENED,
+    820 | HARDENED,
+    1128 | HARDENED,
+    1620 | HARDENED,
+    1987 | HARDENED,
+    2018 | HARDENED,
+    2894 | HARDENED,
+    6060 | HARDENED,
+    31102 | HARDENED,
+    37310 | HARDENED,
+    200625 | HARDENED,
+    246529 | HARDENED,
+    1313114 | HARDENED,
+)
+# fmt: on
@@ -13,22 +13,42 @@ def shortcut_by_chain_id(chain_id, tx_type=None):
 
 
 def by_chain_id(chain_id):
-    for n in NETWORKS:
-        if n.chain_id == chain_id:
-            return n
-    return None
+    i = _find(None, "chain_id", chain_id)
+    return NETWORKS[i] if i is not None else None
 
 
 def by_slip44(slip44):
-    for n in NETWORKS:
-        if n.slip44 == slip44:
-            return n
-    return None
+    i = _find(NETWORKS_BY_SLIP44, "slip44", slip44)
+    return NETWORKS[i] if i is not None else None
 
 
 def all_slip44_ids_hardened():
-    for n in NETWORKS:
-        yield n.slip44 | HARDENED
+    return SLIP44_IDS_HARDENED
+
+
+def _find(order, attr, key):
+    """
+    Binary search for the index of the first network with attribute `attr`
+    equal to `key`.  `order` is a tuple of NETWORKS indexes sorted by `attr`,
+    or None if NETWORKS itself is sorted by `attr`.
+    """
+    if key is None:
+        return None
+    lo = 0
+    hi = len(NETWORKS)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        i = order[mid] if order is not None else mid
+        if getattr(NETWORKS[i], attr) < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == len(NETWORKS):
+        return None
+    i = order[lo] if order is not None else lo
+    if getattr(NETWORKS[i], attr) != key:
+        return None
+    return i
 
 
 class NetworkInfo:
@@ -41,10 +61,19 @@ class NetworkInfo:
         self.name = name
         self.rskip60 = rskip60
 
+<%
+networks = list(supported_on("trezor2", eth))
+by_chain_id = sorted(range(len(networks)), key=lambda i: (networks[i].chain_id, i))
+position = {n: i for i, n in enumerate(by_chain_id)}
+by_slip44 = sorted(by_chain_id, key=lambda n: (networks[n].slip44, n))
+slip44_ids = sorted(set(n.slip44 for n in networks))
+%>\
 
 # fmt: off
+# sorted by chain_id
 NETWORKS = [
-% for n in supported_on("trezor2", eth):
+% for i in by_chain_id:
+<% n = networks[i] %>\
     NetworkInfo(
         chain_id=${n.chain_id},
         slip44=${n.slip44},
@@ -54,3 +83,17 @@ NETWORKS = [
     ),
 % endfor
 ]
+
+# indexes into NETWORKS sorted by slip44, networks sharing the same slip44
+# keep the order of the network definitions
+NETWORKS_BY_SLIP44 = (
+    ${" ".join("%d," % position[n] for n in by_slip44)}
+)
+
+# distinct slip44 ids of all networks, hardened
+SLIP44_IDS_HARDENED = (
+% for slip44 in slip44_ids:
+    ${slip44} | HARDENED,
+% endfor
+)
+# fmt: on
@@ -1,1101 +1,1195 @@
 # generated from tokens.py.mako
 # do not edit manually!
+import ustruct
+from micropython import const
+
+# every token is a record of _RECORD_LEN bytes in _TOKENS, sorted by its key:
+# chain_id (uint32 big endian) + address (20 bytes), then decimals (uint8),
+# offset (uint16 big endian) and length (uint8) of the symbol in _SYMBOLS
+_KEY_LEN = const(24)
+_RECORD_LEN = const(28)
 
 
 def token_by_chain_address(chain_id, address):
-    for token in tokens:
-        if chain_id == token[0] and address == token[1]:
-            return token
+    if chain_id is None or not 0 <= chain_id <= 0xFFFFFFFF or len(address) != 20:
+        return UNKNOWN_TOKEN
+    key = ustruct.pack(">L", chain_id) + address
+    lo = 0
+    hi = len(_TOKENS) // _RECORD_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ofs = mid * _RECORD_LEN
+        k = _TOKENS[ofs : ofs + _KEY_LEN]
+        if k < key:
+            lo = mid + 1
+        elif k > key:
+            hi = mid
+        else:
+            decimals, sym_ofs, sym_len = ustruct.unpack_from(
+                ">BHB", _TOKENS, ofs + _KEY_LEN
+            )
+            symbol = _SYMBOLS[sym_ofs : sym_ofs + sym_len].decode()
+            return (chain_id, bytes(address), symbol, decimals)
     return UNKNOWN_TOKEN
 
 
 UNKNOWN_TOKEN = (None, None, None, None)
 
-
 # fmt: off
-tokens = [
-    (64, b"\x99\x1e\x7f\xe4\xb0\x5f\x2b\x3d\xb1\xd7\x88\xe7\x05\x96\x3f\x5d\x64\x7b\x00\x44", "MINING", 18),  # ella / Ella Mining Tokens
-    (31102, b"\x72\xea\x35\x08\xd9\xd8\x17\xa9\x14\x65\xab\xb5\x9b\xe1\x0f\xef\x98\x57\xa0\x55", "DGT", 0),  # esn / DGT
-    (31102, b"\x01\x46\xb9\xdc\xd9\xfb\x2a\xbc\x1b\x5b\x13\x6c\x28\xd2\x0d\x00\x37\x52\x69\x61", "TOPM", 18),  # esn / TOPM
-    (61, b"\x08\x5f\xb4\xf2\x40\x31\xea\xed\xbc\x2b\x61\x1a\xa5\x28\xf2\x23\x43\xeb\x52\xdb", "BEC", 8),  # etc / BEC
-    (61, b"\x6a\xda\x6f\x48\xc8\x15\x68\x95\x02\xc4\x3e\xc1\xa5\x9f\x1b\x5d\xd3\xc0\x4e\x1f", "UNV", 18),  # etc / UniversalCoin
-    (1, b"\x4e\x84\xe9\xe5\xfb\x0a\x97\x26\x28\xcf\x45\x68\xc4\x03\x16\x7e\xf1\xd4\x04\x31", "$FFC", 18),  # eth / $Fluzcoin
-    (1, b"\xa0\x24\xe8\x05\x7e\xec\x47\x4a\x9b\x23\x56\x83\x37\x07\xdd\x05\x79\xe2\x6e\xf3", "$FXY", 18),  # eth / $FIXY NETWORK
-    (1, b"\xcd\xb7\xec\xfd\x34\x03\xee\xf3\x88\x2c\x65\xb7\x61\xef\x9b\x50\x54\x89\x0a\x47", "$HUR", 18),  # eth / $Hurify Token
-    (1, b"\x7d\xd7\xf5\x6d\x69\x7c\xc0\xf2\xb5\x2b\xd5\x5c\x05\x7f\x37\x8f\x1f\xe6\xab\x4b", "$TEAK", 18),  # eth / $TEAK
-    (1, b"\xb6\xed\x76\x44\xc6\x94\x16\xd6\x7b\x52\x2e\x20\xbc\x29\x4a\x9a\x9b\x40\x5b\x31", "0xBTC", 8),  # eth / 0xBitcoin
-    (1, b"\x0f\x72\x71\x4b\x35\xa3\x66\x28\x5d\xf8\x58\x86\xa2\xee\x17\x46\x01\x29\x2a\x17", "1SG", 18),  # eth / 1SG
-    (1, b"\xaf\x30\xd2\xa7\xe9\x0d\x7d\xc3\x61\xc8\xc4\x58\x5e\x9b\xb7\xd2\xf6\xf1\x5b\xc7", "1ST", 18),  # eth / FirstBlood
-    (1, b"\xfd\xbc\x1a\xdc\x26\xf0\xf8\xf8\x60\x6a\x5d\x63\xb7\xd3\xa3\xcd\x21\xc2\x2b\x23", "1WO", 8),  # eth / 1World
-    (1, b"\x00\x73\xe5\xe5\x2e\x2b\x4f\xe2\x18\xd7\x5d\x99\x4e\xe2\xb3\xc8\x2f\x9c\x87\xea", "22x", 8),  # eth / 22x Fund
-    (1, b"\x9f\xc0\x58\x32\x20\xeb\x44\xfa\xee\x9e\x2d\xc1\xe6\x3f\x39\x20\x4d\xdd\x90\x90", "2DC", 18),  # eth / DualChain
-    (1, b"\xae\xc9\x8a\x70\x88\x10\x41\x48\x78\xc3\xbc\xdf\x46\xaa\xd3\x1d\xed\x4a\x45\x57", "300", 18),  # eth / 300 Token Sparta
-    (1, b"\x43\x02\x41\x36\x8c\x1d\x29\x3f\xda\x21\xdb\xa8\xbb\x7a\xf3\x20\x07\xc5\x91\x09", "3LT", 8),  # eth / TrillionToken
-    (1, b"\xcc\x7d\x26\xd8\xea\x62\x81\xbb\x36\x3c\x84\x48\x51\x5f\x2c\x61\xf7\xbc\x19\xf0", "ABCH", 18),  # eth / ABBC Cash
-    (1, b"\xb9\x8d\x4c\x97\x42\x5d\x99\x08\xe6\x6e\x53\xa6\xfd\xf6\x73\xac\xca\x0b\xe9\x86", "ABT", 18),  # eth / ArcBlock Token
-    (1, b"\x0e\x8d\x6b\x47\x1e\x33\x2f\x14\x0e\x7d\x9d\xbb\x99\xe5\xe3\x82\x2f\x72\x8d\xa6", "ABYSS", 18),  # eth / The Abyss
-    (1, b"\x13\xf1\xb7\xfd\xfb\xe1\xfc\x66\x67\x6d\x56\x48\x3e\x21\xb1\xec\xb4\x0b\x58\xe2", "ACC", 18),  # eth / Accelerator Network
-    (1, b"\x06\x14\x71\x10\x02\x2b\x76\x8b\xa8\xf9\x9a\x8f\x38\x5d\xf1\x1a\x15\x1a\x9c\xc8", "ACE", 0),  # eth / ACE (TokenStars)
-    (1, b"\x2b\xaa\xc9\x33\x0c\xf9\xac\x47\x9d\x81\x91\x95\x79\x4d\x79\xad\x0c\x76\x16\xe3", "ADB", 18),  # eth / adbank
-    (1, b"\xe6\x9a\x35\x3b\x31\x52\xdd\x7b\x70\x6f\xf7\xdd\x40\xfe\x1d\x18\xb7\x80\x2d\x31", "ADH", 18),  # eth / AdHive Token
-    (1, b"\x88\x10\xc6\x34\x70\xd3\x86\x39\x95\x4c\x6b\x41\xaa\xc5\x45\x84\x8c\x46\x48\x4a", "ADI", 18),  # eth / Aditus
-    (1, b"\x66\x0e\x71\x48\x37\x85\xf6\x61\x33\x54\x8b\x10\xf6\x92\x6d\xc3\x32\xb0\x6e\x61", "ADL", 18),  # eth / Adelphoi
-    (1, b"\x42\x28\x66\xa8\xf0\xb0\x32\xc5\xcf\x1d\xfb\xde\xf3\x1a\x20\xf4\x50\x95\x62\xb0", "ADST", 0),  # eth / AdShares
-    (1, b"\xd0\xd6\xd6\xc5\xfe\x4a\x67\x7d\x34\x3c\xc4\x33\x53\x6b\xb7\x17\xba\xe1\x67\xdd", "ADT", 9),  # eth / AdToken
-    (1, b"\x44\x70\xbb\x87\xd7\x7b\x96\x3a\x01\x3d\xb9\x39\xbe\x33\x2f\x92\x7f\x2b\x99\x2e", "ADX", 4),  # eth / AdEx Network
-    (1, b"\x5c\xa9\xa7\x1b\x1d\x01\x84\x9c\x0a\x95\x49\x0c\xc0\x05\x59\x71\x7f\xcf\x0d\x1d", "AE", 18),  # eth / aeternity
-    (1, b"\xfb\x48\xe0\xde\xa8\x37\xf9\x43\x83\x09\xa7\xe9\xf0\xcf\xe7\xee\x33\x53\xa8\x4e", "AFA", 2),  # eth / Africahead Ipparts
-    (1, b"\x8e\xb2\x43\x19\x39\x37\x16\x66\x8d\x76\x8d\xce\xc2\x93\x56\xae\x9c\xff\xe2\x85", "AGI", 8),  # eth / SingularityNET
-    (1, b"\x51\x21\xe3\x48\xe8\x97\xda\xef\x1e\xef\x23\x95\x9a\xb2\x90\xe5\x55\x7c\xf2\x74", "AI", 18),  # eth / POLY AI
-    (1, b"\x37\xe8\x78\x9b\xb9\x99\x6c\xac\x91\x56\xcd\x5f\x5f\xd3\x25\x99\xe6\xb9\x12\x89", "AID", 18),  # eth / AidCoin
-    (1, b"\x4c\xed\xa7\x90\x6a\x5e\xd2\x17\x97\x85\xcd\x3a\x40\xa6\x9e\xe8\xbc\x99\xc4\x66", "AION", 8),  # eth / Aion
-    (1, b"\x27\xdc\xe1\xec\x4d\x3f\x72\xc3\xe4\x57\xcc\x50\x35\x4f\x1f\x97\x5d\xde\xf4\x88", "AIR", 8),  # eth / AirToken
-    (1, b"\x10\x63\xce\x52\x42\x65\xd5\xa3\xa6\x24\xf4\x91\x4a\xcd\x57\x3d\xd8\x9c\xe9\x88", "AIX", 18),  # eth / Aigang
-    (1, b"\x1c\xa4\x3a\x17\x0b\xad\x61\x93\x22\xe6\xf5\x4d\x46\xb5\x7e\x50\x4d\xb6\x63\xaa", "AKC", 18),  # eth / ARTWOOK COIN
-    (1, b"\x18\x1a\x63\x74\x6d\x3a\xdc\xf3\x56\xcb\xc7\x3a\xce\x22\x83\x2f\xfb\xb1\xee\x5a", "ALCO", 8),  # eth / ALCO
-    (1, b"\x42\x89\xc0\x43\xa1\x23\x92\xf1\x02\x73\x07\xfb\x58\x27\x2d\x8e\xbd\x85\x39\x12", "ALI", 18),  # eth / AiLink Token
-    (1, b"\xea\x61\x0b\x11\x53\x47\x77\x20\x74\x8d\xc1\x3e\xd3\x78\x00\x39\x41\xd8\x4f\xab", "ALIS", 18),  # eth / ALIS Token
-    (1, b"\x63\x8a\xc1\x49\xea\x8e\xf9\xa1\x28\x6c\x41\xb9\x77\x01\x7a\xa7\x35\x9e\x6c\xfa", "ALTS", 18),  # eth / ALTS Token
-    (1, b"\x49\xb1\x27\xbc\x33\xce\x7e\x15\x86\xec\x28\xce\xc6\xa6\x5b\x11\x25\x96\xc8\x22", "ALX", 18),  # eth / ALAX
-    (1, b"\x4d\xc3\x64\x3d\xbc\x64\x2b\x72\xc1\x58\xe7\xf3\xd2\xff\x23\x2d\xf6\x1c\xb6\xce", "AMB", 18),  # eth / Amber Token
-    (1, b"\x94\x9b\xed\x88\x6c\x73\x9f\x1a\x32\x73\x62\x9b\x33\x20\xdb\x0c\x50\x24\xc7\x19", "AMIS", 9),  # eth / AMIS
-    (1, b"\xca\x0e\x72\x69\x60\x0d\x35\x3f\x70\xb1\x4a\xd1\x18\xa4\x95\x75\x45\x5c\x0f\x2f", "AMLT", 18),  # eth / AMLT
-    (1, b"\x73\x7f\x98\xac\x8c\xa5\x9f\x2c\x68\xad\x65\x8e\x3c\x3d\x8c\x89\x63\xe4\x0a\x4c", "AMN", 18),  # eth / Amon
-    (1, b"\x38\xc8\x7a\xa8\x9b\x2b\x8c\xd9\xb9\x5b\x73\x6e\x1f\xa7\xb6\x12\xea\x97\x21\x69", "AMO", 18),  # eth / AMO Coin
-    (1, b"\x84\x93\x6c\xf7\x63\x0a\xa3\xe2\x7d\xd9\xaf\xf9\x68\xb1\x40\xd5\xae\xe4\x9f\x5a", "AMTC", 8),  # eth / AmberTime Coin
-    (1, b"\x96\x0b\x23\x6a\x07\xcf\x12\x26\x63\xc4\x30\x33\x50\x60\x9a\x66\xa7\xb2\x88\xc0", "ANT", 18),  # eth / Aragon
-    (1, b"\x9a\xb1\x65\xd7\x95\x01\x9b\x6d\x8b\x3e\x97\x1d\xda\x91\x07\x14\x21\x30\x5e\x5a", "AOA", 18),  # eth / Aurora
-    (1, b"\x4c\x0f\xbe\x1b\xb4\x66\x12\x91\x5e\x79\x67\xd2\xc3\x21\x3c\xd4\xd8\x72\x57\xad", "APIS", 18),  # eth / APIS
-    (1, b"\x1a\x7a\x8b\xd9\x10\x6f\x2b\x8d\x97\x7e\x08\x58\x2d\xc7\xd2\x4c\x72\x3a\xb0\xdb", "APPC", 18),  # eth / AppCoins
-    (1, b"\x23\xae\x3c\x5b\x39\xb1\x2f\x06\x93\xe0\x54\x35\xee\xaa\x1e\x51\xd8\xc6\x15\x30", "APT", 18),  # eth / AIGang
-    (1, b"\xaf\xbe\xc4\xd6\x5b\xc7\xb1\x16\xd8\x51\x07\xfd\x05\xd9\x12\x49\x10\x29\xbf\x46", "ARB", 18),  # eth / ARBITRAGE
-    (1, b"\xac\x70\x9f\xcb\x44\xa4\x3c\x35\xf0\xda\x4e\x31\x63\xb1\x17\xa1\x7f\x37\x70\xf5", "ARC", 18),  # eth / Arcade Token
-    (1, b"\x12\x45\xef\x80\xf4\xd9\xe0\x2e\xd9\x42\x53\x75\xe8\xf6\x49\xb9\x22\x1b\x31\xd8", "ARCT", 8),  # eth / ArbitrageCT
-    (1, b"\x75\xaa\x7b\x0d\x02\x53\x2f\x38\x33\xb6\x6c\x7f\x0a\xd3\x53\x76\xd3\x73\xdd\xf8", "ARD", 18),  # eth / Accord
-    (1, b"\xba\x5f\x11\xb1\x6b\x15\x57\x92\xcf\x3b\x2e\x68\x80\xe8\x70\x68\x59\xa8\xae\xb6", "ARN", 8),  # eth / Aeron
-    (1, b"\xfe\xc0\xcf\x7f\xe0\x78\xa5\x00\xab\xf1\x5f\x12\x84\x95\x8f\x22\x04\x9c\x2c\x7e", "ART", 18),  # eth / Maecenas
-    (1, b"\x77\x05\xfa\xa3\x4b\x16\xeb\x6d\x77\xdf\xc7\x81\x2b\xe2\x36\x7b\xa6\xb0\x24\x8e", "ARX", 8),  # eth / ARX
-    (1, b"\xb0\xd9\x26\xc1\xbc\x3d\x78\x06\x4f\x3e\x10\x75\xd5\xbd\x9a\x24\xf3\x5a\xe6\xc5", "ARXT", 18),  # eth / Assistive Reality ARX
-    (1, b"\xa5\xf8\xfc\x09\x21\x88\x0c\xb7\x34\x23\x68\xbd\x12\x8e\xb8\x05\x04\x42\xb1\xa1", "ARY", 18),  # eth / Block Array
-    (1, b"\x27\x05\x4b\x13\xb1\xb7\x98\xb3\x45\xb5\x91\xa4\xd2\x2e\x65\x62\xd4\x7e\xa7\x5a", "AST", 4),  # eth / Airswap
-    (1, b"\x7b\x22\x93\x8c\xa8\x41\xaa\x39\x2c\x93\xdb\xb7\xf4\xc4\x21\x78\xe3\xd6\x5e\x88", "ASTRO", 4),  # eth / AstroTokens
-    (1, b"\x78\xb7\xfa\xda\x55\xa6\x4d\xd8\x95\xd8\xc8\xc3\x57\x79\xdd\x8b\x67\xfa\x8a\x05", "ATL", 18),  # eth / ATLANT
-    (1, b"\x9b\x11\xef\xca\xaa\x18\x90\xf6\xee\x52\xc6\xbb\x7c\xf8\x15\x3a\xc5\xd7\x41\x39", "ATM", 8),  # eth / ATMChain
-    (1, b"\x97\xae\xb5\x06\x6e\x1a\x59\x0e\x86\x8b\x51\x14\x57\xbe\xb6\xfe\x99\xd3\x29\xf5", "ATMI", 18),  # eth / Atonomi
-    (1, b"\x88\x78\x34\xd3\xb8\xd4\x50\xb6\xba\xb1\x09\xc2\x52\xdf\x3d\xa2\x86\xd7\x3c\xe4", "ATT", 18),  # eth / Atmatrix Token
-    (1, b"\x63\x39\x78\x4d\x94\x78\xda\x43\x10\x6a\x42\x91\x96\x77\x2a\x02\x9c\x2f\x17\x7d", "ATTN", 18),  # eth / Attention Token
-    (1, b"\x1a\x0f\x2a\xb4\x6e\xc6\x30\xf9\xfd\x63\x80\x29\x02\x7b\x55\x2a\xfa\x64\xb9\x4c", "ATX", 18),  # eth / Aston
-    (1, b"\xc1\x2d\x09\x9b\xe3\x15\x67\xad\xd4\xe4\xe4\xd0\xd4\x56\x91\xc3\xf5\x8f\x56\x63", "AUC", 18),  # eth / Auctus
-    (1, b"\xcd\xcf\xc0\xf6\x6c\x52\x2f\xd0\x86\xa1\xb7\x25\xea\x3c\x0e\xeb\x9f\x9e\x88\x14", "AURA", 18),  # eth / Aurora DAO
-    (1, b"\x62\x2d\xff\xcc\x4e\x83\xc6\x4b\xa9\x59\x53\x0a\x5a\x55\x80\x68\x7a\x57\x58\x1b", "AUTO", 18),  # eth / Cube
-    (1, b"\xed\x24\x79\x80\x39\x6b\x10\x16\x9b\xb1\xd3\x6f\x6e\x27\x8e\xd1\x67\x00\xa6\x0f", "AVA", 4),  # eth / AVA
-    (1, b"\x0d\x88\xed\x6e\x74\xbb\xfd\x96\xb8\x31\x23\x16\x38\xb6\x6c\x05\x57\x1e\x82\x4f", "AVT", 18),  # eth / Aventus
-    (1, b"\xcd\x4b\x4b\x0f\x32\x84\xa3\x3a\xc4\x9c\x67\x96\x1e\xc6\xe1\x11\x70\x83\x18\xcf", "AX1", 5),  # eth / AX1 Mining Token
-    (1, b"\x9a\xf2\xc6\xb1\xa2\x8d\x3d\x6b\xc0\x84\xbd\x26\x7f\x70\xe9\x0d\x49\x74\x1d\x5b", "AXP", 8),  # eth / AXP
-    (1, b"\xc3\x9e\x62\x6a\x04\xc5\x97\x1d\x77\x0e\x31\x97\x60\xd7\x92\x65\x02\x97\x5e\x47", "AXPR", 18),  # eth / aXpire
-    (1, b"\x5d\x51\xfc\xce\xd3\x11\x4a\x8b\xb5\xe9\x0c\xdd\x0f\x9d\x68\x2b\xcb\xcc\x53\x93", "B2BX", 18),  # eth / B2BX
-    (1, b"\x99\x8b\x3b\x82\xbc\x9d\xba\x17\x39\x90\xbe\x7a\xfb\x77\x27\x88\xb5\xac\xb8\xbd", "BANCA", 18),  # eth / Banca
-    (1, b"\xf8\x7f\x0d\x91\x53\xfe\xa5\x49\xc7\x28\xad\x61\xcb\x80\x15\x95\xa6\x8b\x73\xde", "BANX", 18),  # eth / BANX
-    (1, b"\x2a\x05\xd2\x2d\xb0\x79\xbc\x40\xc2\xf7\x7a\x1d\x1f\xf7\x03\xa5\x6e\x63\x1c\xc1", "BAS", 8),  # eth / BitAsean
-    (1, b"\x0d\x87\x75\xf6\x48\x43\x06\x79\xa7\x09\xe9\x8d\x2b\x0c\xb6\x25\x0d\x28\x87\xef", "BAT", 18),  # eth / Basic Attention Token
-    (1, b"\x9a\x02\x42\xb7\xa3\x3d\xac\xbe\x40\xed\xb9\x27\x83\x4f\x96\xeb\x39\xf8\xfb\xcb", "BAX", 18),  # eth / BABB
-    (1, b"\xe7\xd3\xe4\x41\x3e\x29\xae\x35\xb0\x89\x31\x40\xf4\x50\x09\x65\xc7\x43\x65\xe5", "BBC", 18),  # eth / TraDove B2BCoin
-    (1, b"\x37\xd4\x05\x10\xa2\xf5\xbc\x98\xaa\x7a\x0f\x7b\xf4\xb3\x45\x3b\xcf\xb9\x0a\xc1", "BBI", 18),  # eth / Beluga Banking Infrastructure Token
-    (1, b"\x4a\x60\x58\x66\x6c\xf1\x05\x7e\xac\x3c\xd3\xa5\xa6\x14\x62\x05\x47\x55\x9f\xc9", "BBK", 18),  # eth / BRICKBLOCK TOKEN
-    (1, b"\x35\xa6\x96\x42\x85\x70\x83\xba\x2f\x30\xbf\xab\x73\x5d\xac\xc7\xf0\xba\xc9\x69", "BBN", 18),  # eth / Banyan Network
-    (1, b"\x84\xf7\xc4\x4b\x6f\xed\x10\x80\xf6\x47\xe3\x54\xd5\x52\x59\x5b\xe2\xcc\x60\x2f", "BBO", 18),  # eth / Bigbom
-    (1, b"\x2e\xcb\x13\xa8\xc4\x58\xc3\x79\xc4\xd9\xa7\x25\x9e\x20\x2d\xe0\x3c\x8f\x3d\x19", "BC", 18),  # eth / Block-Chain.com
-    (1, b"\x73\x67\xa6\x80\x39\xd4\x70\x4f\x30\xbf\xbf\x6d\x94\x80\x20\xc3\xb0\x7d\xfc\x59", "BCBC", 18),  # eth / Beercoin
-    (1, b"\x1e\x79\x7c\xe9\x86\xc3\xcf\xf4\x47\x2f\x7d\x38\xd5\xc4\xab\xa5\x5d\xfe\xfe\x40", "BCDN", 15),  # eth / BlockCDN
-    (1, b"\xac\xfa\x20\x9f\xb7\x3b\xf3\xdd\x5b\xbf\xb1\x10\x1b\x9b\xc9\x99\xc4\x90\x62\xa5", "BCDT", 18),  # eth / Blockchain Certified Data Token
-    (1, b"\xbc\x12\x34\x55\x2e\xbe\xa3\x2b\x51\x21\x19\x03\x56\xbb\xa6\xd3\xbb\x22\x5b\xb5", "BCL", 18),  # eth / BCL
-    (1, b"\x1c\x44\x81\x75\x0d\xaa\x5f\xf5\x21\xa2\xa7\x49\x0d\x99\x81\xed\x46\x46\x5d\xbd", "BCPT", 18),  # eth / BlockMason Credit Protocol Token
-    (1, b"\x10\x14\x61\x3e\x2b\x3c\xbc\x4d\x57\x50\x54\xd4\x98\x2e\x58\x0d\x9b\x99\xd7\xb1", "BCV", 8),  # eth / BitCapitalVendor Token
-    (1, b"\x19\x61\xb3\x33\x19\x69\xed\x52\x77\x07\x51\xfc\x71\x8e\xf5\x30\x83\x8b\x6d\xee", "BDG", 18),  # eth / BitDegree Token
-    (1, b"\x4d\x8f\xc1\x45\x3a\x0f\x35\x9e\x99\xc9\x67\x59\x54\xe6\x56\xd8\x0d\x99\x6f\xbf", "BEE", 18),  # eth / Bee Token
-    (1, b"\x74\xc1\xe4\xb8\xca\xe5\x92\x69\xec\x1d\x85\xd3\xd4\xf3\x24\x39\x60\x48\xf4\xac", "BeerCoin", 0),  # eth / BeerCoin
-    (1, b"\x6a\xeb\x95\xf0\x6c\xda\x84\xca\x34\x5c\x2d\xe0\xf3\xb7\xf9\x69\x23\xa4\x4f\x4c", "BERRY", 14),  # eth / Berry
-    (1, b"\x8a\xa3\x3a\x78\x99\xfc\xc8\xea\x5f\xbe\x6a\x60\x8a\x10\x9c\x38\x93\xa1\xb8\xb2", "BET", 18),  # eth / DAO.Casino
-    (1, b"\x14\xc9\x26\xf2\x29\x00\x44\xb6\x47\xe1\xbf\x20\x72\xe6\x7b\x49\x5e\xff\x19\x05", "BETHER", 18),  # eth / Bethereum
-    (1, b"\x76\x31\x86\xeb\x8d\x48\x56\xd5\x36\xed\x44\x78\x30\x29\x71\x21\x4f\xeb\xc6\xa9", "BETR", 18),  # eth / BetterBetting
-    (1, b"\x38\x39\xd8\xba\x31\x27\x51\xaa\x02\x48\xfe\xd6\xa8\xba\xcb\x84\x30\x8e\x20\xed", "BEZ", 18),  # eth / Bezop
-    (1, b"\xee\x74\x11\x0f\xb5\xa1\x00\x7b\x06\x28\x2e\x0d\xe5\xd7\x3a\x61\xbf\x41\xd9\xcd", "BHPC", 18),  # eth / BHPCash
-    (1, b"\xfe\x5d\x90\x8c\x9a\xd8\x5f\x65\x11\x85\xda\xa6\xa4\x77\x07\x26\xe2\xb2\x7d\x09", "BHR", 18),  # eth / BETHER
-    (1, b"\x08\x9b\x85\xfa\x15\xf7\x2c\x10\x88\xcb\xbe\xf2\x3a\x49\xdb\x80\xb9\x1d\xd5\x21", "BIT", 8),  # eth / BlockEstate Investment Token
-    (1, b"\x08\xb4\xc8\x66\xae\x9d\x1b\xe5\x6a\x06\xe0\xc3\x02\x05\x4b\x4f\xfe\x06\x7b\x43", "BITCAR", 8),  # eth / BitCar Token
-    (1, b"\xf3\xd2\x9f\xb9\x8d\x2d\xc5\xe7\x8c\x87\x19\x8d\xee\xf9\x93\x77\x34\x5f\xd6\xf1", "BITPARK", 8),  # eth / BITPARK
-    (1, b"\xb3\x10\x4b\x4b\x9d\xa8\x20\x25\xe8\xb9\xf8\xfb\x28\xb3\x55\x3c\xe2\xf6\x70\x69", "BIX", 18),  # eth / Bibox Token
-    (1, b"\xb2\xbf\xeb\x70\xb9\x03\xf1\xba\xac\x7f\x2b\xa2\xc6\x29\x34\xc7\xe5\xb9\x74\xc4", "BKB", 8),  # eth / BetKing Bankroll Token
-    (1, b"\x3c\xf9\xe0\xc3\x85\xa5\xab\xec\x9f\xd2\xa7\x17\x90\xaa\x34\x4c\x4e\x8e\x35\x70", "BKRx", 18),  # eth / BlockRx
-    (1, b"\x45\x24\x5b\xc5\x92\x19\xee\xaa\xf6\xcd\x3f\x38\x2e\x07\x8a\x46\x1f\xf9\xde\x7b", "BKX", 18),  # eth / BANKEX
-    (1, b"\xca\x29\xdb\x42\x21\xc1\x11\x88\x8a\x7e\x80\xb1\x2e\xac\x8a\x26\x6d\xa3\xee\x0d", "BLN", 18),  # eth / Bolenum
-    (1, b"\x10\x7c\x45\x04\xcd\x79\xc5\xd2\x69\x6e\xa0\x03\x0a\x8d\xd4\xe9\x26\x01\xb8\x2e", "BLT", 18),  # eth / Bloom
-    (1, b"\x53\x9e\xfe\x69\xbc\xdd\x21\xa8\x3e\xfd\x91\x22\x57\x1a\x64\xcc\x25\xe0\x28\x2b", "BLUE", 8),  # eth / Ethereum Blue
-    (1, b"\xce\x59\xd2\x9b\x09\xaa\xe5\x65\xfe\xee\xf8\xe5\x2f\x47\xc3\xcd\x53\x68\xc6\x63", "BLX (Bullion)", 18),  # eth / Bullion Crypto
-    (1, b"\xe5\xa7\xc1\x29\x72\xf3\xbb\xfe\x70\xed\x29\x52\x1c\x89\x49\xb8\xaf\x6a\x09\x70", "BLX (Iconomi)", 18),  # eth / Iconomi
-    (1, b"\x57\x32\x04\x6a\x88\x37\x04\x40\x4f\x28\x4c\xe4\x1f\xfa\xdd\x5b\x00\x7f\xd6\x68", "BLZ", 18),  # eth / Bluzelle
-    (1, b"\xdf\x6e\xf3\x43\x35\x07\x80\xbf\x8c\x34\x10\xbf\x06\x2e\x0c\x01\x5b\x1d\xd6\x71", "BMC", 8),  # eth / Blackmoon Crypto BMC Token
-    (1, b"\xf0\x28\xad\xee\x51\x53\x3b\x1b\x47\xbe\xaa\x89\x0f\xeb\x54\xa4\x57\xf5\x1e\x89", "BMT", 18),  # eth / BMT
-    (1, b"\x98\x6e\xe2\xb9\x44\xc4\x2d\x01\x7f\x52\xaf\x21\xc4\xc6\x9b\x84\xdb\xea\x35\xd8", "BMX", 18),  # eth / BitMart Token
-    (1, b"\xb8\xc7\x74\x82\xe4\x5f\x1f\x44\xde\x17\x45\xf5\x2c\x74\x42\x6c\x63\x1b\xdd\x52", "BNB", 18),  # eth / Binance Coin
-    (1, b"\xda\x2c\x42\x4f\xc9\x8c\x74\x1c\x2d\x4e\xf2\xf4\x28\x97\xce\xfe\xd8\x97\xca\x75", "BNFT", 9),  # eth / Benefits Coin
-    (1, b"\xda\x80\xb2\x00\x38\xbd\xf9\x68\xc7\x30\x7b\xb5\x90\x7a\x46\x94\x82\xcf\x62\x51", "BNN", 8),  # eth / BrokerNekoNetwork
-    (1, b"\x1f\x57\x3d\x6f\xb3\xf1\x3d\x68\x9f\xf8\x44\xb4\xce\x37\x79\x4d\x79\xa7\xff\x1c", "BNT", 18),  # eth / Bancor
-    (1, b"\xd2\xd6\x15\x86\x83\xae\xe4\xcc\x83\x80\x67\x72\x72\x09\xa0\xaa\xf4\x35\x9d\xe3", "BNTY", 18),  # eth / Bounty0x Token
-    (1, b"\xdf\x34\x79\x11\x91\x0b\x6c\x9a\x42\x86\xba\x8e\x2e\xe5\xea\x4a\x39\xeb\x21\x34", "BOB", 18),  # eth / Bob's repair
-    (1, b"\xcc\x34\x36\x6e\x38\x42\xca\x1b\xd3\x6c\x1f\x32\x4d\x15\x25\x79\x60\xfc\xc8\x01", "BON", 18),  # eth / Bonpay
-    (1, b"\x7f\x1e\x2c\x7d\x6a\x69\xbf\x34\x82\x4d\x72\xc5\x3b\x45\x50\xe8\x95\xc0\xd8\xc2", "BOP", 8),  # eth / BlockOptiopns Token
-    (1, b"\xc2\xc6\x3f\x23\xec\x5e\x97\xef\xbd\x75\x65\xdf\x9e\xc7\x64\xfd\xc7\xd4\xe9\x1d", "BOU", 18),  # eth / Boule Coin
-    (1, b"\x13\x9d\x93\x97\x27\x4b\xb9\xe2\xc2\x9a\x9a\xa8\xaa\x0b\x58\x74\xd3\x0d\x62\xe3", "BOUTS", 18),  # eth / BoutsPro
-    (1, b"\x78\x01\x16\xd9\x1e\x55\x92\xe5\x8a\x3b\x3c\x76\xa3\x51\x57\x1b\x39\xab\xce\xc6", "BOXX", 15),  # eth / BOXX Token [Blockparty]
-    (1, b"\x32\x76\x82\x77\x9b\xab\x2b\xf4\xd1\x33\x7e\x89\x74\xab\x9d\xe8\x27\x5a\x7c\xa8", "BPT", 18),  # eth / Blockport Token
-    (1, b"\x5a\xf2\xbe\x19\x3a\x6a\xbc\xa9\xc8\x81\x70\x01\xf4\x57\x44\x77\x7d\xb3\x07\x56", "BQX", 8),  # eth / Bitquence
-    (1, b"\x9e\x77\xd5\xa1\x25\x1b\x6f\x7d\x45\x67\x22\xa6\xea\xc6\xd2\xd5\x98\x0b\xd8\x91", "BRAT", 8),  # eth / BROTHER
-    (1, b"\x55\x8e\xc3\x15\x2e\x2e\xb2\x17\x49\x05\xcd\x19\xae\xa4\xe3\x4a\x23\xde\x9a\xd6", "BRD", 18),  # eth / Bread
-    (1, b"\x80\x04\x63\x05\xaa\xab\x08\xf6\x03\x3b\x56\xa3\x60\xc1\x84\x39\x11\x65\xdc\x2d", "BRLN", 18),  # eth / Berlin Coin
-    (1, b"\xf2\x6e\xf5\xe0\x54\x53\x84\xb7\xdc\xc0\xf2\x97\xf2\x67\x41\x89\x58\x68\x30\xdf", "BSDC", 18),  # eth / BSDC
-    (1, b"\x50\x9a\x38\xb7\xa1\xcc\x0d\xcd\x83\xaa\x9d\x06\x21\x46\x63\xd9\xec\x7c\x7f\x4a", "BST", 18),  # eth / BlocksquareToken
-    (1, b"\x02\x72\x58\x36\xeb\xf3\xec\xdb\x1c\xdf\x1c\x7b\x02\xfc\xbb\xfa\xa2\x73\x6a\xf8", "BTCA", 8),  # eth / BitAir
-    (1, b"\x08\x86\x94\x9c\x1b\x8c\x41\x28\x60\xc4\x26\x4c\xeb\x80\x83\xd1\x36\x5e\x86\xcf", "BTCE", 8),  # eth / EthereumBitcoin
-    (1, b"\x5a\xcd\x19\xb9\xc9\x1e\x59\x6b\x1f\x06\x2f\x18\xe3\xd0\x2d\xa7\xed\x8d\x1e\x50", "BTCL", 8),  # eth / BTC Lite
-    (1, b"\x87\xf5\xe8\xc3\x42\x52\x18\x83\x7f\x3c\xb6\x7d\xb9\x41\xaf\x0c\x01\x32\x3e\x56", "BTCONE", 18),  # eth / BitCoin One
-    (1, b"\x6a\xac\x8c\xb9\x86\x1e\x42\xbf\x82\x59\xf5\xab\xdc\x6a\xe3\xae\x89\x90\x9e\x11", "BTCR", 8),  # eth / BitCoin Red
-    (1, b"\x73\xdd\x06\x9c\x29\x9a\x5d\x69\x1e\x98\x36\x24\x3b\xca\xec\x9c\x8c\x1d\x87\x34", "BTE", 8),  # eth / BTE
-    (1, b"\xfa\xd5\x72\xdb\x56\x6e\x52\x34\xac\x9f\xc3\xd5\x70\xc4\xed\xc0\x05\x0e\xaa\x92", "BTH", 18),  # eth / Bytether
-    (1, b"\xa0\x2e\x3b\xb9\xce\xbc\x03\x95\x26\x01\xb3\x72\x4b\x49\x40\xe0\x84\x5b\xeb\xcf", "BTHR", 18),  # eth / Bethereum
-    (1, b"\xdb\x86\x46\xf5\xb4\x87\xb5\xdd\x97\x9f\xac\x61\x83\x50\xe8\x50\x18\xf5\x57\xd4", "BTK", 18),  # eth / Bitcoin Token
-    (1, b"\xcb\x97\xe6\x5f\x07\xda\x24\xd4\x6b\xcd\xd0\x78\xeb\xeb\xd7\xc6\xe6\xe3\xd7\x50", "BTM", 8),  # eth / Bytom
-    (1, b"\x36\x90\x5f\xc9\x32\x80\xf5\x23\x62\xa1\xcb\xab\x15\x1f\x25\xdc\x46\x74\x2f\xb5", "BTO", 18),  # eth / Bottos
-    (1, b"\x16\xb0\xe6\x2a\xc1\x3a\x2f\xae\xd3\x6d\x18\xbc\xe2\x35\x6d\x25\xab\x3c\xfa\xd3", "BTQ", 18),  # eth / Bitcoin Boutique
-    (1, b"\x49\x9a\x6b\x77\xbc\x25\xc2\x6b\xcf\x82\x65\xe2\x10\x2b\x1b\x3d\xd1\x61\x70\x24", "BTR", 18),  # eth / Bitether
-    (1, b"\x03\xc7\x80\xcd\x55\x45\x98\x59\x2b\x97\xb7\x25\x6d\xda\xad\x75\x99\x45\xb1\x25", "BTRN", 18),  # eth / Biotron
-    (1, b"\x08\x0a\xa0\x7e\x2c\x71\x85\x15\x0d\x7e\x4d\xa9\x88\x38\xa8\xd2\xfe\xac\x3d\xfc", "BTT", 0),  # eth / Bitether
-    (1, b"\xfa\x45\x6c\xf5\x52\x50\xa8\x39\x08\x8b\x27\xee\x32\xa4\x24\xd7\xda\xcb\x54\xff", "BTTX", 18),  # eth / Blocktrade.com
-    (1, b"\xb6\x83\xd8\x3a\x53\x2e\x2c\xb7\xdf\xa5\x27\x5e\xed\x36\x98\x43\x63\x71\xcc\x9f", "BTU", 18),  # eth / BTU Protocol
-    (1, b"\xe5\xf8\x67\xde\x1e\xa8\x13\x46\xdf\x51\x81\xb8\xb4\x8d\xd6\xb0\xbb\x33\x57\xb0", "BTZ", 18),  # eth / BTZ by Bunz
-    (1, b"\xca\x3c\x18\xa6\x5b\x80\x2e\xc2\x67\xf8\xf4\x80\x25\x45\xe7\xf5\x3d\x24\xc7\x5e", "BUC", 18),  # eth / BeeUnity Chain
-    (1, b"\xbd\x16\x8c\xbf\x9d\x3a\x37\x5b\x38\xdc\x51\xa2\x02\xb5\xe8\xa4\xe5\x20\x69\xed", "BWX", 18),  # eth / Blue Whale Token
-    (1, b"\x43\x75\xe7\xad\x8a\x01\xb8\xec\x3e\xd0\x41\x39\x9f\x62\xd9\xcd\x12\x0e\x00\x63", "BZ", 18),  # eth / Bit-Z Token
-    (1, b"\xe1\xae\xe9\x84\x95\x36\x5f\xc1\x79\x69\x9c\x1b\xb3\xe7\x61\xfa\x71\x6b\xee\x62", "BZNT", 18),  # eth / Bezant
-    (1, b"\x26\xe7\x53\x07\xfc\x0c\x02\x14\x72\xfe\xb8\xf7\x27\x83\x95\x31\xf1\x12\xf3\x17", "C20", 18),  # eth / Crypto20's Token
-    (1, b"\xd4\x2d\xeb\xe4\xed\xc9\x2b\xd5\xa3\xfb\xb4\x24\x3e\x1e\xcc\xf6\xd6\x3a\x4a\x5d", "C8", 18),  # eth / Carboneum
-    (1, b"\x7d\x4b\x8c\xce\x05\x91\xc9\x04\x4a\x22\xee\x54\x35\x33\xb7\x2e\x97\x6e\x36\xc3", "CAG", 18),  # eth / Change Bank
-    (1, b"\x1d\x46\x24\x14\xfe\x14\xcf\x48\x9c\x7a\x21\xca\xc7\x85\x09\xf4\xbf\x8c\xd7\xc0", "CAN", 6),  # eth / CanYaCoin
-    (1, b"\x04\xf2\xe7\x22\x1f\xdb\x1b\x52\xa6\x81\x69\xb2\x57\x93\xe5\x14\x78\xff\x03\x29", "CAPP", 2),  # eth / Cappasity
-    (1, b"\xa5\x17\xa4\x6b\xaa\xd6\xb0\x54\xa7\x6b\xd1\x9c\x46\x84\x4f\x71\x7f\xe6\x9f\xea", "CARB", 8),  # eth / CarbCoin
-    (1, b"\x21\x08\xe6\x2d\x33\x5b\xbd\xc8\x9e\xc3\xe9\xd8\x58\x2f\x18\xdc\xfb\x0c\xdf\xf4", "CARCO", 8),  # eth / CARCO
-    (1, b"\xbf\x18\xf2\x46\xb9\x30\x1f\x23\x1e\x95\x61\xb3\x5a\x38\x79\x76\x9b\xb4\x63\x75", "CARE", 18),  # eth / Token CARE
-    (1, b"\xe8\x78\x0b\x48\xbd\xb0\x5f\x92\x86\x97\xa5\xe8\x15\x5f\x67\x2e\xd9\x14\x62\xf7", "CAS", 18),  # eth / Cashaa
-    (1, b"\x12\x34\x56\x74\x61\xd3\xf8\xdb\x74\x96\x58\x17\x74\xbd\x86\x9c\x83\xd5\x1c\x93", "CAT (BitClave)", 18),  # eth / BitClave
-    (1, b"\x56\xba\x2e\xe7\x89\x04\x61\xf4\x63\xf7\xbe\x02\xaa\xc3\x09\x9f\x6d\x58\x11\xa8", "CAT (BlockCAT)", 18),  # eth / BlockCAT
-    (1, b"\x68\xe1\x4b\xb5\xa4\x5b\x96\x81\x32\x7e\x16\xe5\x28\x08\x4b\x9d\x96\x2c\x1a\x39", "CATs (BitClave)_Old", 18),  # eth / CATs (BitClave)_Old
-    (1, b"\x26\xdb\x54\x39\xf6\x51\xca\xf4\x91\xa8\x7d\x48\x79\x9d\xa8\x1f\x19\x1b\xdb\x6b", "CBC", 8),  # eth / CashBet Coin
-    (1, b"\x05\xc3\x61\x7c\xbf\x13\x04\xb9\x26\x0a\xa6\x1e\xc9\x60\xf1\x15\xd6\x7b\xec\xea", "CBIX", 18),  # eth / Cubrix
-    (1, b"\x95\xef\xd1\xfe\x60\x99\xf6\x5a\x7e\xd5\x24\xde\xf4\x87\x48\x32\x21\x09\x49\x47", "CBM", 18),  # eth / CryptoBonusMiles
-    (1, b"\x07\x6c\x97\xe1\xc8\x69\x07\x2e\xe2\x2f\x8c\x91\x97\x8c\x99\xb4\xbc\xb0\x25\x91", "CBT", 18),  # eth / CommerceBlock
-    (1, b"\xc1\x66\x03\x87\x05\xff\xba\xb3\x79\x41\x85\xb3\xa9\xd9\x25\x63\x2a\x1d\xf3\x7d", "CC3", 18),  # eth / Coal Coin
-    (1, b"\x28\x57\x7a\x6d\x31\x55\x9b\xd2\x65\xce\x3a\xdb\x62\xd0\x45\x85\x50\xf7\xb8\xa7", "CCC (CryptoCrashCourse)", 18),  # eth / CryptoCrashCourse
-    (1, b"\xbe\x11\xee\xb1\x86\xe6\x24\xb8\xf2\x6a\x50\x45\x57\x5a\x13\x40\xe4\x05\x45\x52", "CCC (ICONOMI)", 18),  # eth / CCC (ICONOMI)
-    (1, b"\x37\x89\x03\xa0\x3f\xb2\xc3\xac\x76\xbb\x52\x77\x3e\x3c\xe1\x13\x40\x37\x7a\x32", "CCCX", 18),  # eth / Clipper Coin
-    (1, b"\xd3\x48\xe0\x7a\x28\x06\x50\x5b\x85\x61\x23\x04\x5d\x27\xae\xed\x90\x92\x4b\x50", "CCLC", 8),  # eth / Christ Coin
-    (1, b"\x67\x9b\xad\xc5\x51\x62\x6e\x01\xb2\x3c\xee\xce\xfb\xc9\xb8\x77\xea\x18\xfc\x46", "CCO", 18),  # eth / Ccore
-    (1, b"\x31\x5c\xe5\x9f\xaf\xd3\xa8\xd5\x62\xb7\xec\x1c\x85\x42\x38\x2d\x27\x10\xb0\x6c", "CCS", 18),  # eth / CacaoShares
-    (1, b"\x33\x6f\x64\x6f\x87\xd9\xf6\xbc\x6e\xd4\x2d\xd4\x6e\x8b\x3f\xd9\xdb\xd1\x5c\x22", "CCT", 18),  # eth / Crystal Clear Token
-    (1, b"\x8a\x95\xca\x44\x8a\x52\xc0\xad\xf0\x05\x4b\xb3\x40\x2d\xc5\xe0\x9c\xd6\xb2\x32", "CDL", 18),  # eth / Confideal
-    (1, b"\x17\x7d\x39\xac\x67\x6e\xd1\xc6\x7a\x2b\x26\x8a\xd7\xf1\xe5\x88\x26\xe5\xb0\xaf", "CDT", 18),  # eth / CoinDash
-    (1, b"\xb0\x56\xc3\x8f\x6b\x7d\xc4\x06\x43\x67\x40\x3e\x26\x42\x4c\xd2\xc6\x06\x55\xe1", "CEEK", 18),  # eth / CEEK VR Token
-    (1, b"\x11\x22\xb6\xa0\xe0\x0d\xce\x05\x63\x08\x2b\x6e\x29\x53\xf3\xa9\x43\x85\x5c\x1f", "CENNZ", 18),  # eth / Centrality
-    (1, b"\xf6\x60\xca\x1e\x22\x8e\x7b\xe1\xfa\x8b\x4f\x55\x83\x14\x5e\x31\x14\x7f\xb5\x77", "CET", 18),  # eth / DICE Money Dicet
-    (1, b"\x5d\xff\x89\xa2\xca\xa4\xd7\x6b\xc2\x86\xf7\x4d\x67\xbd\x71\x8e\xb8\x34\xda\x61", "CFC", 18),  # eth / CryptFillCoin
-    (1, b"\x12\xfe\xf5\xe5\x7b\xf4\x58\x73\xcd\x9b\x62\xe9\xdb\xd7\xbf\xb9\x9e\x32\xd7\x3e", "CFI", 18),  # eth / Cofound.it
-    (1, b"\x69\x56\x98\x3f\x8b\x3c\xe1\x73\xb4\xab\x84\x36\x1a\xa0\xad\x52\xf3\x8d\x93\x6f", "CFTY", 8),  # eth / Crafty Token
-    (1, b"\xf3\xdb\x75\x60\xe8\x20\x83\x46\x58\xb5\x90\xc9\x62\x34\xc3\x33\xcd\x3d\x5e\x5e", "CHP", 18),  # eth / CoinPoker
-    (1, b"\xba\x9d\x41\x99\xfa\xb4\xf2\x6e\xfe\x35\x51\xd4\x90\xe3\x82\x14\x86\xf1\x35\xba", "CHSB", 8),  # eth / SwissBorg
-    (1, b"\x14\x60\xa5\x80\x96\xd8\x0a\x50\xa2\xf1\xf9\x56\xdd\xa4\x97\x61\x1f\xa4\xf1\x65", "CHX", 18),  # eth / Own
-    (1, b"\xf7\x5f\xbf\xa2\xf6\x81\x86\x0b\x9a\x6d\x19\xfc\x3f\xf3\xd3\x4c\xb3\x22\xe2\xd6", "CIYA", 18),  # eth / CRYPTORIYA
-    (1, b"\x3a\xbd\xff\x32\xf7\x6b\x42\xe7\x63\x5b\xdb\x7e\x42\x5f\x02\x31\xa5\xf3\xab\x17", "CJT", 18),  # eth / ConnectJob
-    (1, b"\x06\x01\x2c\x8c\xf9\x7b\xea\xd5\xde\xae\x23\x70\x70\xf9\x58\x7f\x8e\x7a\x26\x6d", "CK", 0),  # eth / CK
-    (1, b"\xe8\x1d\x72\xd1\x4b\x15\x16\xe6\x8a\xc3\x19\x0a\x46\xc9\x33\x02\xcc\x8e\xd6\x0f", "CL", 18),  # eth / Coinlancer
-    (1, b"\xb1\xc1\xcb\x8c\x7c\x19\x92\xdb\xa2\x4e\x62\x8b\xf7\xd3\x8e\x71\xda\xd4\x6a\xeb", "CLB", 18),  # eth / Cloudbric
-    (1, b"\x3d\xc9\xa4\x2f\xa7\xaf\xe5\x7b\xe0\x3c\x58\xfd\x7f\x44\x11\xb1\xe4\x66\xc5\x08", "CLL", 18),  # eth / CryptoLiveLeak
-    (1, b"\x41\x62\x17\x8b\x78\xd6\x98\x54\x80\xa3\x08\xb2\x19\x0e\xe5\x51\x74\x60\x40\x6d", "CLN", 18),  # eth / ColuLocalNetwork
-    (1, b"\x7f\xce\x28\x56\x89\x9a\x68\x06\xee\xef\x70\x80\x79\x85\xfc\x75\x54\xc6\x63\x40", "CLP", 9),  # eth / CryptoLending
-    (1, b"\x3e\xdd\x23\x5c\x3e\x84\x0c\x1f\x29\x28\x6b\x2e\x39\x37\x0a\x25\x5c\x7b\x6f\xdb", "CMBT", 8),  # eth / CMBToken
-    (1, b"\x7e\x66\x75\x25\x52\x1c\xf6\x13\x52\xe2\xe0\x1b\x50\xfa\xaa\xe7\xdf\x39\x74\x9a", "CMC", 18),  # eth / CryptoMart
-    (1, b"\x47\xbc\x01\x59\x77\x98\xdc\xd7\x50\x6d\xcc\xa3\x6a\xc4\x30\x2f\xc9\x3a\x8c\xfb", "CMCT", 8),  # eth / Crowd Machine Compute Token
-    (1, b"\xf8\x5f\xee\xa2\xfd\xd8\x1d\x51\x17\x7f\x6b\x8f\x35\xf0\xe6\x73\x4c\xe4\x5f\x5f", "CMT", 18),  # eth / CyberMiles Token
-    (1, b"\xeb\xf2\xf9\xe8\xde\x96\x0f\x64\xec\x0f\xdc\xda\x6c\xb2\x82\x42\x31\x33\x34\x7b", "CNB", 8),  # eth / Canabio
-    (1, b"\xd4\xc4\x35\xf5\xb0\x9f\x85\x5c\x33\x17\xc8\x52\x4c\xb1\xf5\x86\xe4\x27\x95\xfa", "CND", 18),  # eth / Cindicator
-    (1, b"\x87\x13\xd2\x66\x37\xcf\x49\xe1\xb6\xb4\xa7\xce\x57\x10\x6a\xab\xc9\x32\x53\x43", "CNN", 18),  # eth / Content Neutrality Network
-    (1, b"\xb4\xb1\xd2\xc2\x17\xec\x07\x76\x58\x4c\xe0\x8d\x3d\xd9\x8f\x90\xed\xed\xa4\x4b", "CO2", 18),  # eth / Climatecoin
-    (1, b"\x57\x4b\x36\xbc\xed\x44\x33\x38\x87\x5d\x17\x1c\xc3\x77\xe6\x91\xf7\xd4\xf8\x87", "CO2Bit", 18),  # eth / CO2Bit
-    (1, b"\xb2\xf7\xeb\x1f\x2c\x37\x64\x5b\xe6\x1d\x73\x95\x30\x35\x36\x0e\x76\x8d\x81\xe6", "COB", 18),  # eth / Cobinhood Token
-    (1, b"\x31\x36\xef\x85\x15\x92\xac\xf4\x9c\xa4\xc8\x25\x13\x1e\x36\x41\x70\xfa\x32\xb3", "COFI", 18),  # eth / CoinFi Token
-    (1, b"\x0c\x91\xb0\x15\xab\xa6\xf7\xb4\x73\x8d\xcd\x36\xe7\x41\x01\x38\xb2\x9a\xdc\x29", "COIL", 8),  # eth / CoinOil
-    (1, b"\x72\x5b\x19\x0b\xc0\x77\xff\xde\x17\xcf\x54\x9a\xa8\xba\x25\xe2\x98\x55\x0b\x18", "CORI", 2),  # eth / Corrently Invest Token
-    (1, b"\xc4\xbc\xd6\x4c\xb2\x16\xd4\x9f\xd3\xc6\x43\xa3\x27\x62\xf3\x46\x26\xb4\x5a\x1a", "COSM", 18),  # eth / Cosmo Coin
-    (1, b"\xe2\xfb\x65\x29\xef\x56\x6a\x08\x0e\x6d\x23\xde\x0b\xd3\x51\x31\x10\x87\xd5\x67", "COV", 18),  # eth / Covesting
-    (1, b"\x0e\xbb\x61\x42\x04\xe4\x7c\x09\xb6\xc3\xfe\xb9\xaa\xec\xad\x8e\xe0\x60\xe2\x3e", "CPAY", 0),  # eth / Cryptopay
-    (1, b"\xb7\x87\xd4\xea\xc8\x89\x97\x30\xbb\x8c\x57\xfc\x3c\x99\x8c\x49\xc5\x24\x4e\xc0", "CPEX", 8),  # eth / CoinPulseToken
-    (1, b"\x70\x64\xaa\xb3\x9a\x0f\xcf\x72\x21\xc3\x39\x67\x19\xd0\x91\x7a\x65\xe3\x55\x15", "CPLO", 18),  # eth / CPOLLO
-    (1, b"\xf4\x47\x45\xfb\xd4\x1f\x6a\x1b\xa1\x51\xdf\x19\x0d\xb0\x56\x4c\x5f\xcc\x44\x10", "CPY", 18),  # eth / COPYTRACK
-    (1, b"\x7f\x58\x5b\x91\x30\xc6\x4e\x9e\x9f\x47\x0b\x61\x8a\x7b\xad\xd0\x3d\x79\xca\x7e", "CR7", 18),  # eth / CR7Coin
-    (1, b"\xae\xf3\x8f\xbf\xbf\x93\x2d\x1a\xef\x3b\x80\x8b\xc8\xfb\xd8\xcd\x8e\x1f\x8b\xc5", "CRB", 8),  # eth / Creditbit
-    (1, b"\x2c\xf6\x18\xc1\x90\x41\xd9\xdb\x33\x0d\x82\x22\xb8\x60\xa6\x24\x02\x1f\x30\xfb", "CRBT", 18),  # eth / Cruisebit
-    (1, b"\xf4\x1e\x5f\xbc\x2f\x6a\xac\x20\x0d\xd8\x61\x9e\x12\x1c\xe1\xf0\x5d\x15\x00\x77", "CRC", 18),  # eth / CryCash
-    (1, b"\x67\x2a\x1a\xd4\xf6\x67\xfb\x18\xa3\x33\xaf\x13\x66\x7a\xa0\xaf\x1f\x5b\x5b\xdd", "CRED", 18),  # eth / Verify
-    (1, b"\x4e\x06\x03\xe2\xa2\x7a\x30\x48\x0e\x5e\x3a\x4f\xe5\x48\xe2\x9e\xf1\x2f\x64\xbe", "CREDO", 18),  # eth / Credo / Bitbounce
-    (1, b"\xf4\x9c\xdd\x50\xad\x40\x8d\x38\x7d\x61\x1f\x88\xa6\x47\x17\x9c\x3d\xe3\x49\x2b", "CRGO", 18),  # eth / CargoCoin
-    (1, b"\x92\x38\xbf\xb7\x81\xa5\x5e\xac\xc3\xcf\x05\xf7\xdf\x94\x03\x8c\x19\x8c\xd9\xb9", "CRMT", 8),  # eth / Cremit
-    (1, b"\x80\xa7\xe0\x48\xf3\x7a\x50\x50\x03\x51\xc2\x04\xcb\x40\x77\x66\xfa\x3b\xae\x7f", "CRPT", 18),  # eth / CrypteriumToken
-    (1, b"\xf0\xda\x11\x86\xa4\x97\x72\x26\xb9\x13\x5d\x06\x13\xee\x72\xe2\x29\xec\x3f\x4d", "CRT", 18),  # eth / CreamtoeCoin
-    (1, b"\xe4\xc9\x4d\x45\xf7\xae\xf7\x01\x8a\x5d\x66\xf4\x4a\xf7\x80\xec\x60\x23\x37\x8e", "CryptoCarbon", 6),  # eth / CryptoCarbon
-    (1, b"\x46\xb9\xad\x94\x4d\x10\x59\x45\x0d\xa1\x16\x35\x11\x06\x9c\x71\x8f\x69\x9d\x31", "CS", 6),  # eth / Credits
-    (1, b"\x29\xd7\x52\x77\xac\x7f\x03\x35\xb2\x16\x5d\x08\x95\xe8\x72\x5c\xbf\x65\x8d\x73", "CSNO", 8),  # eth / BitDice
-    (1, b"\xbb\x49\xa5\x1e\xe5\xa6\x6c\xa3\xa8\xcb\xe5\x29\x37\x9b\xa4\x4b\xa6\x7e\x67\x71", "CST", 18),  # eth / Cryptosolartech
-    (1, b"\x45\x45\x75\x0f\x39\xaf\x6b\xe4\xf2\x37\xb6\x86\x9d\x4e\xcc\xa9\x28\xfd\x5a\x85", "CTF", 18),  # eth / CryptoTask
-    (1, b"\xc8\x7c\x5d\xd8\x6a\x3d\x56\x7f\xf2\x87\x01\x88\x6f\xb0\x74\x5a\xaa\x89\x8d\xa4", "CTG", 18),  # eth / CT Global Token
-    (1, b"\x9e\x7d\x29\xbd\x49\x9b\x6c\x7d\xa2\xa5\xb2\xea\xfc\xf4\xa3\x9d\x3b\xd8\x45\xd1", "CTGC", 18),  # eth / Convenient To Go
-    (1, b"\xbf\x4c\xfd\x7d\x1e\xde\xee\xa5\xf6\x60\x08\x27\x41\x1b\x41\xa2\x1e\xb0\x8a\xbd", "CTL", 2),  # eth / CTL
-    (1, b"\x96\xa6\x56\x09\xa7\xb8\x4e\x88\x42\x73\x2d\xeb\x08\xf5\x6c\x3e\x21\xac\x6f\x8a", "CTR", 18),  # eth / Centra
-    (1, b"\xe3\xfa\x17\x7a\xce\xcf\xb8\x67\x21\xcf\x6f\x9f\x42\x06\xbd\x3b\xd6\x72\xd7\xd5", "CTT", 18),  # eth / ChainTrade Token
-    (1, b"\x66\x2a\xbc\xad\x0b\x7f\x34\x5a\xb7\xff\xb1\xb1\xfb\xb9\xdf\x78\x94\xf1\x8e\x66", "CTX", 18),  # eth / CarTaxi
-    (1, b"\xea\x11\x75\x5a\xe4\x1d\x88\x9c\xee\xc3\x9a\x63\xe6\xff\x75\xa0\x2b\xc1\xc0\x0d", "CTXC", 18),  # eth / Cortex
-    (1, b"\xda\x6c\xb5\x8a\x0d\x0c\x01\x61\x0a\x29\xc5\xa6\x5c\x30\x3e\x13\xe8\x85\x88\x7c", "cV", 18),  # eth / carVertical
-    (1, b"\x41\xe5\x56\x00\x54\x82\x4e\xa6\xb0\x73\x2e\x65\x6e\x3a\xd6\x4e\x20\xe9\x4e\x45", "CVC", 8),  # eth / Civic
-    (1, b"\xbe\x42\x8c\x38\x67\xf0\x5d\xea\x2a\x89\xfc\x76\xa1\x02\xb5\x44\xea\xc7\xf7\x72", "CVT", 18),  # eth / CyberVein
-    (1, b"\x21\x34\x05\x7c\x0b\x46\x1f\x89\x8d\x37\x5c\xea\xd6\x52\xac\xae\x62\xb5\x95\x41", "CXC", 18),  # eth / CoxxxCoin
-    (1, b"\xb6\xee\x96\x68\x77\x1a\x79\xbe\x79\x67\xee\x29\xa6\x3d\x41\x84\xf8\x09\x71\x43", "CXO", 18),  # eth / CargoX
-    (1, b"\x3f\x06\xb5\xd7\x84\x06\xcd\x97\xbd\xf1\x0f\x5c\x42\x0b\x24\x1d\x32\x75\x9c\x80", "CYFM", 18),  # eth / CyberFM
-    (1, b"\x78\xc2\x92\xd1\x44\x5e\x6b\x95\x58\xbf\x42\xe8\xbc\x36\x92\x71\xde\xd0\x62\xea", "CYMT", 8),  # eth / CyberMusic
-    (1, b"\x02\x23\xfc\x70\x57\x42\x14\xf6\x58\x13\xfe\x33\x6d\x87\x0a\xc4\x7e\x14\x7f\xae", "CZR", 18),  # eth / CanonChain
-    (1, b"\xda\xb0\xc3\x1b\xf3\x4c\x89\x7f\xb0\xfe\x90\xd1\x2e\xc9\x40\x1c\xaf\x5c\x36\xec", "DAB", 0),  # eth / DAB
-    (1, b"\xa3\x11\x08\xe5\xba\xb5\x49\x45\x60\xdb\x34\xc9\x54\x92\x65\x8a\xf2\x39\x35\x7c", "DACS", 18),  # eth / DACSEE
-    (1, b"\xfb\x2f\x26\xf2\x66\xfb\x28\x05\xa3\x87\x23\x0f\x2a\xa0\xa3\x31\xb4\xd9\x6f\xba", "DADI", 18),  # eth / DADI
-    (1, b"\x89\xd2\x4a\x6b\x4c\xcb\x1b\x6f\xaa\x26\x25\xfe\x56\x2b\xdd\x9a\x23\x26\x03\x59", "DAI", 18),  # eth / Dai Stablecoin v1.0
-    (1, b"\x07\xd9\xe4\x9e\xa4\x02\x19\x4b\xf4\x8a\x82\x76\xda\xfb\x16\xe4\xed\x63\x33\x17", "DALC", 8),  # eth / DaleCoin
-    (1, b"\x9b\x70\x74\x0e\x70\x8a\x08\x3c\x6f\xf3\x8d\xf5\x22\x97\x02\x0f\x5d\xfa\xa5\xee", "DAN", 10),  # eth / DaneelToken
-    (1, b"\xbb\x9b\xc2\x44\xd7\x98\x12\x3f\xde\x78\x3f\xcc\x1c\x72\xd3\xbb\x8c\x18\x94\x13", "DAO", 16),  # eth / DAO
-    (1, b"\x81\xc9\x15\x1d\xe0\xc8\xba\xfc\xd3\x25\xa5\x7e\x3d\xb5\xa5\xdf\x1c\xeb\xf7\x9c", "DAT", 18),  # eth / Datum Token
-    (1, b"\x0c\xf0\xee\x63\x78\x8a\x08\x49\xfe\x52\x97\xf3\x40\x7f\x70\x1e\x12\x2c\xc0\x23", "DATA", 18),  # eth / Streamr DATAcoin
-    (1, b"\x1b\x5f\x21\xee\x98\xee\xd4\x8d\x29\x2e\x8e\x2d\x3e\xd8\x2b\x40\xa9\x72\x8a\x22", "DATABroker", 18),  # eth / DataBrokerDAO Token
-    (1, b"\xab\xbb\xb6\x44\x7b\x68\xff\xd6\x14\x1d\xa7\x7c\x18\xc7\xb5\x87\x6e\xd6\xc5\xab", "DATX", 18),  # eth / DATx
-    (1, b"\xd8\x2d\xf0\xab\xd3\xf5\x14\x25\xeb\x15\xef\x75\x80\xfd\xa5\x57\x27\x87\x5f\x14", "DAV", 18),  # eth / DAV Token
-    (1, b"\x0b\x4b\xdc\x47\x87\x91\x89\x72\x74\x65\x2d\xc1\x5e\xf5\xc1\x35\xca\xe6\x1e\x60", "DAX", 18),  # eth / DAEX
-    (1, b"\x61\x72\x5f\x3d\xb4\x00\x4a\xfe\x01\x47\x45\xb2\x1d\xab\x1e\x16\x77\xcc\x32\x8b", "DAXT", 18),  # eth / Digital Asset Exchange Token
-    (1, b"\xe8\x14\xae\xe9\x60\xa8\x52\x08\xc3\xdb\x54\x2c\x53\xe7\xd4\xa6\xc8\xd5\xf6\x0f", "DAY", 18),  # eth / ChronoLogic DAY
-    (1, b"\x9b\x68\xbf\xae\x21\xdf\x5a\x51\x09\x31\xa2\x62\xce\xcf\x63\xf4\x13\x38\xf2\x64", "DBET", 18),  # eth / DecentBet
-    (1, b"\x38\x6f\xaa\x47\x03\xa3\x4a\x7f\xdb\x19\xbe\xc2\xe1\x4f\xd4\x27\xc9\x63\x84\x16", "DCA", 18),  # eth / DoBetAcceptBet
-    (1, b"\xff\xa9\x3a\xac\xf4\x92\x97\xd5\x1e\x21\x18\x17\x45\x28\x39\x05\x2f\xdf\xb9\x61", "DCC", 18),  # eth / Distributed Credit Chain
-    (1, b"\x39\x9a\x0e\x6f\xbe\xb3\xd7\x4c\x85\x35\x74\x39\xf4\xc8\xae\xd9\x67\x8a\x5c\xbf", "DCL", 3),  # eth / DCL
-    (1, b"\x08\xd3\x2b\x0d\xa6\x3e\x2c\x3b\xcf\x80\x19\xc9\xc5\xd8\x49\xd7\xa9\xd7\x91\xe6", "DCN", 0),  # eth / Dentacoin
-    (1, b"\xcc\x4e\xf9\xee\xaf\x65\x6a\xc1\xa2\xab\x88\x67\x43\xe9\x8e\x97\xe0\x90\xed\x38", "DDF", 18),  # eth / DDF
-    (1, b"\x15\x12\x02\xc9\xc1\x8e\x49\x56\x56\xf3\x72\x28\x1f\x49\x3e\xb7\x69\x89\x61\xd5", "DEB", 18),  # eth / DEBITUM
-    (1, b"\x07\x5c\x60\xee\x2c\xd3\x08\xff\x47\x87\x3b\x38\xbd\x9a\x0f\xa5\x85\x33\x82\xc4", "DEEZ", 18),  # eth / DeezNuts
-    (1, b"\xde\x1e\x0a\xe6\x10\x1b\x46\x52\x0c\xf6\x6f\xdc\x0b\x10\x59\xc5\xcc\x3d\x10\x6c", "DELTA", 8),  # eth / DeltaChain
-    (1, b"\x35\x97\xbf\xd5\x33\xa9\x9c\x9a\xa0\x83\x58\x7b\x07\x44\x34\xe6\x1e\xb0\xa2\x58", "DENT", 8),  # eth / DENT
-    (1, b"\xdd\x94\xde\x9c\xfe\x06\x35\x77\x05\x1a\x5e\xb7\x46\x5d\x08\x31\x7d\x88\x08\xb6", "Devcon2 Token", 0),  # eth / Devcon2 Token
-    (1, b"\x20\xe9\x48\x67\x79\x4d\xba\x03\x0e\xe2\x87\xf1\x40\x6e\x10\x0d\x03\xc8\x4c\xd3", "DEW", 18),  # eth / DEW
-    (1, b"\x49\x7b\xae\xf2\x94\xc1\x1a\x5f\x0f\x5b\xea\x3f\x2a\xdb\x30\x73\xdb\x44\x8b\x56", "DEX", 18),  # eth / DEX
-    (1, b"\xe0\xb7\x92\x7c\x4a\xf2\x37\x65\xcb\x51\x31\x4a\x0e\x05\x21\xa9\x64\x5f\x0e\x2a", "DGD", 9),  # eth / Digix DAO
-    (1, b"\xf6\xcf\xe5\x3d\x6f\xeb\xae\xea\x05\x1f\x40\x0f\xf5\xfc\x14\xf0\xcb\xbd\xac\xa1", "DGPT", 18),  # eth / DigiPulse
-    (1, b"\x6a\xed\xbf\x8d\xff\x31\x43\x72\x20\xdf\x35\x19\x50\xba\x2a\x33\x62\x16\x8d\x1b", "DGS", 8),  # eth / Dragonglass
-    (1, b"\x1c\x83\x50\x14\x78\xf1\x32\x09\x77\x04\x70\x08\x49\x6d\xac\xbd\x60\xbb\x15\xef", "DGTX", 18),  # eth / DigitexFutures
-    (1, b"\x4f\x3a\xfe\xc4\xe5\xa3\xf2\xa6\xa1\xa4\x11\xde\xf7\xd7\xdf\xe5\x0e\xe0\x57\xbf", "DGX", 9),  # eth / Digix Gold Token
-    (1, b"\x55\xb9\xa1\x1c\x2e\x83\x51\xb4\xff\xc7\xb1\x15\x61\x14\x8b\xfa\xc9\x97\x78\x55", "DGX1", 9),  # eth / Digix Gold Token 1.0
-    (1, b"\x2e\x07\x1d\x29\x66\xaa\x7d\x8d\xec\xb1\x00\x58\x85\xba\x19\x77\xd6\x03\x8a\x65", "DICE", 16),  # eth / Etheroll
-    (1, b"\xc7\x19\xd0\x10\xb6\x3e\x5b\xbf\x2c\x05\x51\x87\x2c\xd5\x31\x6e\xd2\x6a\xcd\x83", "DIP", 18),  # eth / Decentralized Insurance Protocol
-    (1, b"\xf1\x49\x22\x00\x1a\x2f\xb8\x54\x1a\x43\x39\x05\x43\x7a\xe9\x54\x41\x9c\x24\x39", "DIT", 8),  # eth / Digital Insurance Token
-    (1, b"\x13\xf1\x1c\x99\x05\xa0\x8c\xa7\x6e\x3e\x85\x3b\xe6\x3d\x4f\x09\x44\x32\x6c\x72", "DIVX", 18),  # eth / DIVX
-    (1, b"\xba\x18\x7b\x09\xff\xa8\xdd\xdc\x80\xd2\x57\x1e\xd3\xcb\xc4\xbe\x0a\xf6\x9e\x0c", "DKP", 18),  # eth / Draggin Karma Points
-    (1, b"\x07\xe3\xc7\x06\x53\x54\x8b\x04\xf0\xa7\x59\x70\xc1\xf8\x1b\x4c\xbb\xfb\x60\x6f", "DLT", 18),  # eth / Agrello
-    (1, b"\x2c\xcb\xff\x3a\x04\x2c\x68\x71\x6e\xd2\xa2\xcb\x0c\x54\x4a\x9f\x1d\x19\x35\xe1", "DMT", 8),  # eth / DMarket Token
-    (1, b"\x82\xb0\xe5\x04\x78\xee\xaf\xde\x39\x2d\x45\xd1\x25\x9e\xd1\x07\x1b\x6f\xda\x81", "DNA", 18),  # eth / EncrypGen
-    (1, b"\x0a\xbd\xac\xe7\x0d\x37\x90\x23\x5a\xf4\x48\xc8\x85\x47\x60\x3b\x94\x56\x04\xea", "DNT", 18),  # eth / District0x Network Token
-    (1, b"\xe4\x3e\x20\x41\xdc\x37\x86\xe1\x66\x96\x1e\xd9\x48\x4a\x55\x39\x03\x3d\x10\xfb", "DNX", 18),  # eth / DenCity
-    (1, b"\xe5\xda\xda\x80\xaa\x64\x77\xe8\x5d\x09\x74\x7f\x28\x42\xf7\x99\x3d\x0d\xf7\x1c", "DOCK", 18),  # eth / Dock
-    (1, b"\x90\x6b\x3f\x8b\x78\x45\x84\x01\x88\xea\xb5\x3c\x3f\x5a\xd3\x48\xa7\x87\x75\x2f", "DOR", 15),  # eth / Dorado
-    (1, b"\xac\x32\x11\xa5\x02\x54\x14\xaf\x28\x66\xff\x09\xc2\x3f\xc1\x8b\xc9\x7e\x79\xb1", "DOV", 18),  # eth / Dovu
-    (1, b"\x01\xb3\xec\x4a\xae\x1b\x87\x29\x52\x9b\xeb\x49\x65\xf2\x7d\x00\x87\x88\xb0\xeb", "DPP", 18),  # eth / Digital Assets Power Play
-    (1, b"\x82\xf4\xde\xd9\xce\xc9\xb5\x75\x0f\xbf\xf5\xc2\x18\x5a\xee\x35\xaf\xc1\x65\x87", "DREAM", 6),  # eth / DREAM
-    (1, b"\x41\x9c\x4d\xb4\xb9\xe2\x5d\x6d\xb2\xad\x96\x91\xcc\xb8\x32\xc8\xd9\xfd\xa0\x5e", "DRGN", 18),  # eth / Dragon
-    (1, b"\xe3\x0e\x02\xf0\x49\x95\x7e\x2a\x59\x07\x58\x9e\x06\xba\x64\x6f\xb2\xc3\x21\xba", "DRPU", 8),  # eth / DCORP Utility
-    (1, b"\x9a\xf4\xf2\x69\x41\x67\x7c\x70\x6c\xfe\xcf\x6d\x33\x79\xff\x01\xbb\x85\xd5\xab", "DRT", 8),  # eth / DomRaider
-    (1, b"\x62\xd4\xc0\x46\x44\x31\x4f\x35\x86\x8b\xa4\xc6\x5c\xc2\x7a\x77\x68\x1d\xe7\xa9", "DRVH", 18),  # eth / Driveholic Token
-    (1, b"\x1e\x09\xbd\x8c\xad\xb4\x41\x63\x2e\x44\x1d\xb3\xe1\xd7\x99\x09\xee\x0a\x22\x56", "DSC", 1),  # eth / Digital Safe Coin
-    (1, b"\x03\xe3\xf0\xc2\x59\x65\xf1\x3d\xbb\xc5\x82\x46\x73\x8c\x18\x3e\x27\xb2\x6a\x56", "DSCP", 18),  # eth / Disciplina Token
-    (1, b"\x68\xd5\x34\x41\xc0\xe2\x53\xf7\x6c\x50\x0e\x55\x1b\xde\xa3\xd1\x02\x20\x6c\x9a", "DST", 18),  # eth / Dimensions Strike Token
-    (1, b"\x5a\xdc\x96\x1d\x6a\xc3\xf7\x06\x2d\x2e\xa4\x5f\xef\xb8\xd8\x16\x7d\x44\xb1\x90", "DTH", 18),  # eth / dether
-    (1, b"\xd2\x34\xbf\x24\x10\xa0\x00\x9d\xf9\xc3\xc6\x3b\x61\x0c\x09\x73\x8f\x18\xcc\xd7", "DTR", 8),  # eth / Dynamic Trading Rights
-    (1, b"\xc2\x04\x64\xe0\xc3\x73\x48\x6d\x2b\x33\x35\x57\x6e\x83\xa2\x18\xb1\x61\x8a\x5e", "DTRC", 18),  # eth / Datarius Credit
-    (1, b"\xf9\xf7\xc2\x9c\xfd\xf1\x9f\xcf\x1f\x2a\xa6\xb8\x4a\xa3\x67\xbc\xf1\xbd\x16\x76", "DTT", 18),  # eth / Delphi Tech Token
-    (1, b"\x8d\xb5\x4c\xa5\x69\xd3\x01\x9a\x2b\xa1\x26\xd0\x3c\x37\xc4\x4b\x5e\xf8\x1e\xf6", "DXT", 8),  # eth / Datawallet
-    (1, b"\xce\x5c\x60\x3c\x78\xd0\x47\xef\x43\x03\x2e\x96\xb5\xb7\x85\x32\x4f\x75\x3a\x4f", "E4ROW", 2),  # eth / E4ROW
-    (1, b"\x99\x4f\x0d\xff\xdb\xae\x0b\xbf\x09\xb6\x52\xd6\xf1\x1a\x49\x3f\xd3\x3f\x42\xb9", "EAGLE", 18),  # eth / EagleCoin
-    (1, b"\x90\x0b\x44\x49\x23\x6a\x7b\xb2\x6b\x28\x66\x01\xdd\x14\xd2\xbd\xe7\xa6\xac\x6c", "EARTH", 8),  # eth / Earth Token
-    (1, b"\x31\xf3\xd9\xd1\xbe\xce\x0c\x03\x3f\xf7\x8f\xa6\xda\x60\xa6\x04\x8f\x3e\x13\xc5", "EBC", 18),  # eth / EBCoin
-    (1, b"\xaf\xc3\x97\x88\xc5\x1f\x0c\x1f\xf7\xb5\x53\x17\xf3\xe7\x02\x99\xe5\x21\xff\xf6", "eBCH", 8),  # eth / eBCH
-    (1, b"\xeb\x7c\x20\x02\x71\x72\xe5\xd1\x43\xfb\x03\x0d\x50\xf9\x1c\xec\xe2\xd1\x48\x5d", "EBTC", 8),  # eth / eBitcoin
-    (1, b"\xa5\x78\xac\xc0\xcb\x78\x75\x78\x1b\x78\x80\x90\x3f\x45\x94\xd1\x3c\xfa\x8b\x98", "ECN", 2),  # eth / ECN
-    (1, b"\x17\xf9\x34\x75\xd2\xa9\x78\xf5\x27\xc3\xf7\xc4\x4a\xbf\x44\xad\xfb\xa6\x0d\x5c", "ECO2", 2),  # eth / EtherCO2
-    (1, b"\x17\x1d\x75\x0d\x42\xd6\x61\xb6\x2c\x27\x7a\x6b\x48\x6a\xdb\x82\x34\x8c\x3e\xca", "ECOM", 18),  # eth / Omnitude
-    (1, b"\xfa\x1d\xe2\xee\x97\xe4\xc1\x0c\x94\xc9\x1c\xb2\xb5\x06\x2b\x89\xfb\x14\x0b\x82", "EDC", 6),  # eth / Education Credits
-    (1, b"\x08\x71\x1d\x3b\x02\xc8\x75\x8f\x2f\xb3\xab\x4e\x80\x22\x84\x18\xa7\xf8\xe3\x9c", "EDG", 0),  # eth / Edgeless
-    (1, b"\xce\xd4\xe9\x31\x98\x73\x4d\xda\xff\x84\x92\xd5\x25\xbd\x25\x8d\x49\xeb\x38\x8e", "EDO", 18),  # eth / Eidoo
-    (1, b"\xc5\x28\xc2\x8f\xec\x0a\x90\xc0\x83\x32\x8b\xc4\x5f\x58\x7e\xe2\x15\x76\x0a\x0f", "EDR", 18),  # eth / Endor Protocol Token
-    (1, b"\x2a\x22\xe5\xcc\xa0\x0a\x3d\x63\x30\x8f\xa3\x9f\x29\x20\x2e\xb1\xb3\x9e\xef\x52", "EDU", 18),  # eth / EDU Token
-    (1, b"\xb5\x3a\x96\xbc\xbd\xd9\xcf\x78\xdf\xf2\x0b\xab\x6c\x2b\xe7\xba\xec\x8f\x00\xf8", "eGAS", 8),  # eth / ETH GAS
-    (1, b"\x8e\x1b\x44\x8e\xc7\xad\xfc\x7f\xa3\x5f\xc2\xe8\x85\x67\x8b\xd3\x23\x17\x6e\x34", "EGT", 18),  # eth / Egretia Token
-    (1, b"\xf9\xf0\xfc\x71\x67\xc3\x11\xdd\x2f\x1e\x21\xe9\x20\x4f\x87\xeb\xa9\x01\x2f\xb2", "EHT", 8),  # eth / EasyHomes
-    (1, b"\xa6\xa8\x40\xe5\x0b\xca\xa5\x0d\xa0\x17\xb9\x1a\x0d\x86\xb8\xb2\xd4\x11\x56\xee", "EKO", 18),  # eth / EchoLink
-    (1, b"\xba\xb1\x65\xdf\x94\x55\xaa\x0f\x2a\xed\x1f\x25\x65\x52\x0b\x91\xdd\xad\xb4\xc8", "EKT", 8),  # eth / EDUCare
-    (1, b"\xd4\x9f\xf1\x36\x61\x45\x13\x13\xca\x15\x53\xfd\x69\x54\xbd\x1d\x9b\x6e\x02\xb9", "ELEC", 18),  # eth / Electrify.Asia
-    (1, b"\xbf\x21\x79\x85\x9f\xc6\xd5\xbe\xe9\xbf\x91\x58\x63\x2d\xc5\x16\x78\xa4\x10\x0e", "ELF", 18),  # eth / ELF Token
-    (1, b"\xc8\xc6\xa3\x1a\x4a\x80\x6d\x37\x10\xa7\xb3\x8b\x7b\x29\x6d\x2f\xab\xcc\xdb\xa8", "ELIX", 18),  # eth / Elixir Token
-    (1, b"\x44\x19\x7a\x4c\x44\xd6\xa0\x59\x29\x7c\xaf\x6b\xe4\xf7\xe1\x72\xbd\x56\xca\xaf", "ELTCOIN", 8),  # eth / ELTCOIN
-    (1, b"\xa9\x55\x92\xdc\xff\xa3\xc0\x80\xb4\xb4\x0e\x45\x9c\x5f\x56\x92\xf6\x7d\xb7\xf8", "ELY", 18),  # eth / ELYCOIN
-    (1, b"\xb6\x7b\x88\xa2\x57\x08\xa3\x5a\xe7\xc2\xd7\x36\xd3\x98\xd2\x68\xce\x4f\x7f\x83", "EMON", 8),  # eth / Etheremon
-    (1, b"\x95\xda\xaa\xb9\x80\x46\x84\x6b\xf4\xb2\x85\x3e\x23\xcb\xa2\x36\xfa\x39\x4a\x31", "EMONT", 8),  # eth / Etheremon Token
-    (1, b"\x95\x01\xbf\xc4\x88\x97\xdc\xee\xad\xf7\x31\x13\xef\x63\x5d\x2f\xf7\xee\x4b\x97", "EMT", 18),  # eth / easyMINE Token
-    (1, b"\xb8\x02\xb2\x4e\x06\x37\xc2\xb8\x7d\x2e\x8b\x77\x84\xc0\x55\xbb\xe9\x21\x01\x1a", "EMV", 2),  # eth / EMovieVenture
-    (1, b"\x03\x9f\x50\x50\xde\x49\x08\xf9\xb5\xdd\xf4\x0a\x4f\x3a\xa3\xf3\x29\x08\x63\x87", "ENC", 18),  # eth / Ethernet.Cash
-    (1, b"\xf0\xee\x6b\x27\xb7\x59\xc9\x89\x3c\xe4\xf0\x94\xb4\x9a\xd2\x8f\xd1\x5a\x23\xe4", "ENG", 8),  # eth / Enigma
-    (1, b"\x5d\xba\xc2\x4e\x98\xe2\xa4\xf4\x3a\xdc\x0d\xc8\x2a\xf4\x03\xfc\xa0\x63\xce\x2c", "ENGT", 18),  # eth / Engagement Token
-    (1, b"\xf6\x29\xcb\xd9\x4d\x37\x91\xc9\x25\x01\x52\xbd\x8d\xfb\xdf\x38\x0e\x2a\x3b\x9c", "ENJ", 18),  # eth / ENJIN
-    (1, b"\x5b\xc7\xe5\xf0\xab\x8b\x2e\x10\xd2\xd0\xa3\xf2\x17\x39\xfc\xe6\x24\x59\xae\xf3", "ENTRP", 18),  # eth / Hut34 Entropy Token
-    (1, b"\x7e\x9e\x43\x1a\x0b\x8c\x4d\x53\x2c\x74\x5b\x10\x43\xc7\xfa\x29\xa4\x8d\x4f\xba", "eosDAC", 18),  # eth / eosDAC
-    (1, b"\x35\xba\xa7\x20\x38\xf1\x27\xf9\xf8\xc8\xf9\xb4\x91\x04\x9f\x64\xf3\x77\x91\x4d", "EPX", 4),  # eth / ethPoker.io EPX
-    (1, b"\x50\xee\x67\x46\x89\xd7\x5c\x0f\x88\xe8\xf8\x3c\xfe\x8c\x4b\x69\xe8\xfd\x59\x0d", "EPY", 8),  # eth / Emphy
-    (1, b"\x47\xdd\x62\xd4\xd0\x75\xde\xad\x71\xd0\xe0\x02\x99\xfc\x56\xa2\xd7\x47\xbe\xbb", "EQL", 18),  # eth / Equal
-    (1, b"\x74\xce\xda\x77\x28\x1b\x33\x91\x42\xa3\x68\x17\xfa\x5f\x9e\x29\x41\x2b\xab\x85", "ERO", 8),  # eth / Eroscoin
-    (1, b"\x92\xa5\xb0\x4d\x0e\xd5\xd9\x4d\x7a\x19\x3d\x1d\x33\x4d\x3d\x16\x99\x6f\x4e\x13", "ERT", 18),  # eth / Eristica
-    (1, b"\xe8\xa1\xdf\x95\x8b\xe3\x79\x04\x5e\x2b\x46\xa3\x1a\x98\xb9\x3a\x2e\xcd\xfd\xed", "ESZ", 18),  # eth / ESZCoin
-    (1, b"\x1b\x97\x43\xf5\x56\xd6\x5e\x75\x7c\x4c\x65\x0b\x45\x55\xba\xf3\x54\xcb\x8b\xd3", "ETBS", 12),  # eth / Ethbits
-    (1, b"\xdd\x74\xa7\xa3\x76\x9f\xa7\x25\x61\xb3\xa6\x9e\x65\x96\x8f\x49\x74\x8c\x69\x0c", "ETCH", 18),  # eth / ETCH
-    (1, b"\x28\xc8\xd0\x1f\xf6\x33\xea\x9c\xd8\xfc\x6a\x45\x1d\x74\x57\x88\x9e\x69\x8d\xe6", "ETG", 0),  # eth / Ethereum Gold
-    (1, b"\x3a\x26\x74\x6d\xdb\x79\xb1\xb8\xe4\x45\x0e\x3f\x4f\xfe\x32\x85\xa3\x07\x38\x7e", "ETHB", 8),  # eth / EtherBTC
-    (1, b"\xdb\xfb\x42\x3e\x9b\xbf\x16\x29\x43\x88\xe0\x76\x96\xa5\x12\x0e\x4c\xeb\xa0\xc5", "ETHD", 18),  # eth / Ethereum Dark
-    (1, b"\x3c\x4a\x3f\xfd\x81\x3a\x10\x7f\xeb\xd5\x7b\x2f\x01\xbc\x34\x42\x64\xd9\x0f\xde", "ETK", 2),  # eth / EnergiToken
-    (1, b"\x69\x27\xc6\x9f\xb4\xda\xf2\x04\x3f\xbb\x1c\xb7\xb8\x6c\x56\x61\x41\x6b\xea\x29", "ETR", 18),  # eth / Etheruem Risen
-    (1, b"\xdb\x25\xf2\x11\xab\x05\xb1\xc9\x7d\x59\x55\x16\xf4\x57\x94\x52\x8a\x80\x7a\xd8", "EURS", 2),  # eth / STASIS EURS
-    (1, b"\xab\xdf\x14\x78\x70\x23\x5f\xcf\xc3\x41\x53\x82\x8c\x76\x9a\x70\xb3\xfa\xe0\x1f", "EURT", 6),  # eth / EUR Tether (erc20)
-    (1, b"\x52\x36\x30\x97\x6e\xb6\x14\x76\x21\xb5\xc3\x1c\x78\x1e\xbe\x2e\xc2\xa8\x06\xe0", "eUSD", 18),  # eth / Ether-Backed USD Nomins (erc20)
-    (1, b"\xb6\x2d\x18\xde\xa7\x40\x45\xe8\x22\x35\x2c\xe4\xb3\xee\x77\x31\x9d\xc5\xff\x2f", "EVC", 18),  # eth / EventChain
-    (1, b"\x92\x31\x08\xa4\x39\xc4\xe8\xc2\x31\x5c\x4f\x65\x21\xe5\xce\x95\xb4\x4e\x9b\x4c", "EVE", 18),  # eth / Devery
-    (1, b"\xf3\xdb\x5f\xa2\xc6\x6b\x7a\xf3\xeb\x0c\x0b\x78\x25\x10\x81\x6c\xbe\x48\x13\xb8", "EVX", 4),  # eth / EVX Token
-    (1, b"\x44\x49\x97\xb7\xe7\xfc\x83\x0e\x20\x08\x9a\xfe\xa3\x07\x8c\xd5\x18\xfc\xf2\xa2", "EWO", 18),  # eth / EWO Token
-    (1, b"\x00\xc4\xb3\x98\x50\x06\x45\xeb\x5d\xa0\x0a\x1a\x37\x9a\x88\xb1\x16\x83\xba\x01", "EXC", 18),  # eth / Eximchain Token
-    (1, b"\xc9\x8e\x06\x39\xc6\xd2\xec\x03\x7a\x61\x53\x41\xc3\x69\x66\x6b\x11\x0e\x80\xe5", "EXMR", 8),  # eth / eXMRcoin
-    (1, b"\xe4\x69\xc4\x47\x3a\xf8\x22\x17\xb3\x0c\xf1\x7b\x10\xbc\xdb\x6c\x8c\x79\x6e\x75", "EXRN", 0),  # eth / EXRNchain
-    (1, b"\x5c\x74\x3a\x35\xe9\x03\xf6\xc5\x84\x51\x4e\xc6\x17\xac\xee\x06\x11\xcf\x44\xf3", "EXY", 18),  # eth / Experty
-    (1, b"\x5e\x60\x16\xae\x7d\x7c\x49\xd3\x47\xdc\xf8\x34\x86\x0b\x9f\x3e\xe2\x82\x81\x2b", "EZT", 8),  # eth / EZToken
-    (1, b"\xb6\x77\x34\x52\x1e\xab\xbe\x9c\x77\x37\x29\xdb\x73\xe1\x6c\xc2\xdf\xb2\x0a\x58", "E\u20b9", 2),  # eth / eRupee
-    (1, b"\x0a\x1d\x2f\xf7\x15\x6a\x48\x13\x15\x53\xcf\x38\x1f\x22\x0b\xbe\xdb\x4e\xfa\x37", "FABA", 18),  # eth / FABA
-    (1, b"\x1c\xca\xa0\xf2\xa7\x21\x0d\x76\xe1\xfd\xec\x74\x0d\x5f\x32\x3e\x2e\x1b\x16\x72", "FACE", 18),  # eth / Faceter
-    (1, b"\x19\x0e\x56\x9b\xe0\x71\xf4\x0c\x70\x4e\x15\x82\x5f\x28\x54\x81\xcb\x74\xb6\xcc", "FAM", 12),  # eth / FAM
-    (1, b"\x90\x16\x2f\x41\x88\x6c\x09\x46\xd0\x99\x99\x73\x6f\x1c\x15\xc8\xa1\x05\xa4\x21", "FAN", 18),  # eth / Fan Token
-    (1, b"\x23\x35\x20\x36\xe9\x11\xa2\x2c\xfc\x69\x2b\x5e\x2e\x19\x66\x92\x65\x8a\xde\xd9", "FDZ", 18),  # eth / Friendz
-    (1, b"\xd9\xa8\xcf\xe2\x1c\x23\x2d\x48\x50\x65\xcb\x62\xa9\x68\x66\x79\x9d\x46\x45\xf7", "FGP", 18),  # eth / FingerPrint
-    (1, b"\x52\xfb\x36\xc8\x3a\xd3\x3c\x18\x24\x91\x2f\xc8\x10\x71\xca\x5e\xeb\x8a\xb3\x90", "FID", 18),  # eth / Fidelium
-    (1, b"\xdf\xc3\xe8\x57\xc8\xcc\xea\x76\x57\xe0\xed\x98\xab\x92\xe0\x48\xe3\x8d\xee\x0f", "FIH", 18),  # eth / FidelityHouse Token
-    (1, b"\x00\x9e\x86\x49\x23\xb4\x92\x63\xc7\xf1\x0d\x19\xb7\xf8\xab\x7a\x9a\x5a\xad\x33", "FKX", 18),  # eth / Knoxstertoken
-    (1, b"\xf0\x4a\x8a\xc5\x53\xfc\xed\xb5\xba\x99\xa6\x47\x99\x15\x58\x26\xc1\x36\xb0\xbe", "FLIXX", 18),  # eth / Flixxo
-    (1, b"\x04\x93\x99\xa6\xb0\x48\xd5\x29\x71\xf7\xd1\x22\xae\x21\xa1\x53\x27\x22\x28\x5f", "FLOT", 18),  # eth / Fire Lotto
-    (1, b"\x3a\x1b\xda\x28\xad\xb5\xb0\xa8\x12\xa7\xcf\x10\xa1\x95\x0c\x92\x0f\x79\xbc\xd3", "FLP", 18),  # eth / FLIP Token
-    (1, b"\x9a\xef\xbe\x0b\x3c\x3b\xa9\xea\xb2\x62\xcb\x98\x56\xe8\x15\x7a\xb7\x64\x8e\x09", "FLR", 18),  # eth / Flair Coin
-    (1, b"\x95\x4b\x5d\xe0\x9a\x55\xe5\x97\x55\xac\xbd\xa2\x9e\x1e\xb7\x4a\x45\xd3\x01\x75", "FLUZ", 18),  # eth / Fluz Fluz Global
-    (1, b"\x70\xb1\x47\xe0\x1e\x92\x85\xe7\xce\x68\xb9\xba\x43\x7f\xe3\xa9\x19\x0e\x75\x6a", "FLX", 18),  # eth / BitFlux
-    (1, b"\xb4\xd0\xfd\xfc\x84\x97\xae\xf9\x7d\x3c\x28\x92\xae\x68\x2e\xe0\x60\x64\xa2\xbc", "FMF", 18),  # eth / Formosa Financial Token
-    (1, b"\x4d\xf4\x7b\x49\x69\xb2\x91\x1c\x96\x65\x06\xe3\x59\x2c\x41\x38\x94\x93\x95\x3b", "FND", 18),  # eth / FundRequest
-    (1, b"\x07\x07\x68\x1f\x34\x4d\xeb\x24\x18\x40\x37\xfc\x02\x28\x85\x6f\x21\x37\xb0\x2e", "FNKOS", 18),  # eth / FNKOS
-    (1, b"\xbd\x4b\x60\xa1\x38\xb3\xfc\xe3\x58\x4e\xa0\x1f\x50\xc0\x90\x8c\x18\xf9\x67\x7a", "FNTB", 8),  # eth / Fintab
-    (1, b"\x2a\x09\x3b\xcf\x0c\x98\xef\x74\x4b\xb6\xf6\x9d\x74\xf2\xf8\x56\x05\x32\x42\x90", "FOOD", 8),  # eth / FoodCoin
-    (1, b"\x42\x70\xbb\x23\x8f\x6d\xd8\xb1\xc3\xca\x01\xf9\x6c\xa6\x5b\x26\x47\xc0\x6d\x3c", "FOTA", 18),  # eth / Fortuna
-    (1, b"\x8c\x39\xaf\xdf\x7b\x17\xf1\x2c\x55\x32\x08\x55\x5e\x51\xab\x86\xe6\x9c\x35\xaa", "FR8", 8),  # eth / Fr8 Network
-    (1, b"\x0a\xbe\xfb\x76\x11\xcb\x3a\x01\xea\x3f\xad\x85\xf3\x3c\x3c\x93\x4f\x8e\x2c\xf4", "FRD", 18),  # eth / FARAD Cryptoken
-    (1, b"\x17\xe6\x7d\x1c\xb4\xe3\x49\xb9\xca\x4b\xc3\xe1\x7c\x7d\xf2\xa3\x97\xa7\xbb\x64", "FREC", 18),  # eth / Freyrchain
-    (1, b"\x48\xdf\x4e\x02\x96\xf9\x08\xce\xab\x04\x28\xa5\x18\x2d\x19\xb3\x1f\xc0\x37\xd6", "FRV", 8),  # eth / Fitrova
-    (1, b"\xd0\x35\x2a\x01\x9e\x9a\xb9\xd7\x57\x77\x6f\x53\x23\x77\xaa\xeb\xd3\x6f\xd5\x41", "FSN", 18),  # eth / Fusion
-    (1, b"\x78\xa7\x3b\x6c\xbc\x5d\x18\x3c\xe5\x6e\x78\x6f\x6e\x90\x5c\xad\xec\x63\x54\x7b", "FT", 18),  # eth / Fabric Token
-    (1, b"\x94\x3e\xd8\x52\xda\xdb\x5c\x39\x38\xec\xdc\x68\x83\x71\x8d\xf8\x14\x2d\xe4\xc8", "FTI", 18),  # eth / FansTime
-    (1, b"\x20\x23\xdc\xf7\xc4\x38\xc8\xc8\xc0\xb0\xf2\x8d\xba\xe1\x55\x20\xb4\xf3\xee\x20", "FTR", 18),  # eth / Futourist Token
-    (1, b"\x2a\xec\x18\xc5\x50\x0f\x21\x35\x9c\xe1\xbe\xa5\xdc\x17\x77\x34\x4d\xf4\xc0\xdc", "FTT", 18),  # eth / FarmaTrust Token
-    (1, b"\xd5\x59\xf2\x02\x96\xff\x48\x95\xda\x39\xb5\xbd\x9a\xdd\x54\xb4\x42\x59\x6a\x61", "FTX", 18),  # eth / FintruX Network
-    (1, b"\x41\x87\x5c\x23\x32\xb0\x87\x7c\xdf\xaa\x69\x9b\x64\x14\x02\xb7\xd4\x64\x2c\x32", "FTXT", 8),  # eth / FUTURAX
-    (1, b"\xea\x38\xea\xa3\xc8\x6c\x8f\x9b\x75\x15\x33\xba\x2e\x56\x2d\xeb\x9a\xcd\xed\x40", "FUEL", 18),  # eth / Etherparty FUEL
-    (1, b"\x41\x9d\x0d\x8b\xdd\x9a\xf5\xe6\x06\xae\x22\x32\xed\x28\x5a\xff\x19\x0e\x71\x1b", "FUN", 8),  # eth / Funfair
-    (1, b"\xc9\x2d\x6e\x3e\x64\x30\x2c\x59\xd7\x34\xf3\x29\x2e\x2a\x13\xa1\x3d\x7e\x18\x17", "FXC", 8),  # eth / FUTURAX
-    (1, b"\x18\x29\xaa\x04\x5e\x21\xe0\xd5\x95\x80\x02\x4a\x95\x1d\xb4\x80\x96\xe0\x17\x82", "FXT", 18),  # eth / FuzeX
-    (1, b"\x88\xfc\xfb\xc2\x2c\x6d\x3d\xba\xa2\x5a\xf4\x78\xc5\x78\x97\x83\x39\xbd\xe7\x7a", "FYN", 18),  # eth / Fund Yourself Now
-    (1, b"\x8f\x09\x21\xf3\x05\x55\x62\x41\x43\xd4\x27\xb3\x40\xb1\x15\x69\x14\x88\x2c\x10", "FYP", 18),  # eth / FlypMe
-    (1, b"\xe5\xae\xe1\x63\x51\x31\x19\xf4\xf7\x50\x37\x6c\x71\x87\x66\xb4\x0f\xa3\x7a\x5f", "Fzcoin", 18),  # eth / Frozencoin Network
-    (1, b"\xf6\x74\x51\xdc\x84\x21\xf0\xe0\xaf\xeb\x52\xfa\xa8\x10\x10\x34\xed\x08\x1e\xd9", "GAM", 8),  # eth / Gambit
-    (1, b"\x68\x71\x74\xf8\xc4\x9c\xeb\x77\x29\xd9\x25\xc3\xa9\x61\x50\x7e\xa4\xac\x7b\x28", "GAT", 18),  # eth / Global Awards Token
-    (1, b"\x70\x88\x76\xf4\x86\xe4\x48\xee\x89\xeb\x33\x2b\xfb\xc8\xe5\x93\x55\x30\x58\xb9", "GAVEL", 18),  # eth / GAVEL
-    (1, b"\x75\x85\xf8\x35\xae\x2d\x52\x27\x22\xd2\x68\x43\x23\xa0\xba\x83\x40\x1f\x32\xf5", "GBT", 18),  # eth / GBT
-    (1, b"\x12\xfc\xd6\x46\x3e\x66\x97\x4c\xf7\xbb\xc2\x4f\xfc\x4d\x40\xd6\xbe\x45\x82\x83", "GBX", 18),  # eth / Globitex
-    (1, b"\xdb\x0f\x69\x30\x6f\xf8\xf9\x49\xf2\x58\xe8\x3f\x6b\x87\xee\x5d\x05\x2d\x0b\x23", "GCP", 18),  # eth / Globcoin Crypto Platform
-    (1, b"\x4f\x4f\x0d\xb4\xde\x90\x3b\x88\xf2\xb1\xa2\x84\x79\x71\xe2\x31\xd5\x4f\x8f\xd3", "GEE", 8),  # eth / Geens NPO
-    (1, b"\x24\x08\x3b\xb3\x00\x72\x64\x3c\x3b\xb9\x0b\x44\xb7\x28\x58\x60\xa7\x55\xe6\x87", "GELD", 18),  # eth / GELD
-    (1, b"\xc7\xbb\xa5\xb7\x65\x58\x1e\xfb\x2c\xdd\x26\x79\xdb\x5b\xea\x9e\xe7\x9b\x20\x1f", "GEM", 18),  # eth / Gems
-    (1, b"\x54\x3f\xf2\x27\xf6\x4a\xa1\x7e\xa1\x32\xbf\x98\x86\xca\xb5\xdb\x55\xdc\xad\xdf", "GEN", 18),  # eth / DAOstack
-    (1, b"\x6d\xd4\xe4\xaa\xd2\x9a\x40\xed\xd6\xa4\x09\xb9\xc1\x62\x51\x86\xc9\x85\x5b\x4d", "GENE", 8),  # eth / Parkgene
-    (1, b"\x8a\x85\x42\x88\xa5\x97\x60\x36\xa7\x25\x87\x91\x64\xca\x3e\x91\xd3\x0c\x6a\x1b", "GET", 18),  # eth / GET Protocol
-    (1, b"\xfc\xd8\x62\x98\x56\x28\xb2\x54\x06\x1f\x7a\x91\x80\x35\xb8\x03\x40\xd0\x45\xd3", "GIF", 18),  # eth / GIFcoin Token
-    (1, b"\xae\x4f\x56\xf0\x72\xc3\x4c\x0a\x65\xb3\xae\x3e\x4d\xb7\x97\xd8\x31\x43\x9d\x93", "GIM", 8),  # eth / Gimli
-    (1, b"\x71\xd0\x1d\xb8\xd6\xa2\xfb\xea\x7f\x8d\x43\x45\x99\xc2\x37\x98\x0c\x23\x4e\x4c", "GLA", 8),  # eth / Gladius
-    (1, b"\xb3\xbd\x49\xe2\x8f\x8f\x83\x2b\x8d\x1e\x24\x61\x06\x99\x1e\x54\x6c\x32\x35\x02", "GMT", 18),  # eth / GMT
-    (1, b"\x68\x10\xe7\x76\x88\x0c\x02\x93\x3d\x47\xdb\x1b\x9f\xc0\x59\x08\xe5\x38\x6b\x96", "GNO", 18),  # eth / Gnosis
-    (1, b"\xa7\x44\x76\x44\x31\x19\xa9\x42\xde\x49\x85\x90\xfe\x1f\x24\x54\xd7\xd4\xac\x0d", "GNT", 18),  # eth / Golem
-    (1, b"\x6e\xc8\xa2\x4c\xab\xdc\x33\x9a\x06\xa1\x72\xf8\x22\x3e\xa5\x57\x05\x5a\xda\xa5", "GNX", 9),  # eth / Genaro Network
-    (1, b"\x24\x75\x51\xf2\xeb\x33\x62\xe2\x22\xc7\x42\xe9\xc7\x88\xb8\x95\x7d\x9b\xc8\x7e", "GNY", 18),  # eth / GNY
-    (1, b"\xea\xb4\x31\x93\xcf\x06\x23\x07\x3c\xa8\x9d\xb9\xb7\x12\x79\x63\x56\xfa\x74\x14", "GOLDX", 18),  # eth / GOLDX
-    (1, b"\x42\x3b\x5f\x62\xb3\x28\xd0\xd6\xd4\x48\x70\xf4\xee\xe3\x16\xbe\xfa\x0b\x2d\xf5", "GOT", 18),  # eth / GoNetwork
-    (1, b"\x12\xb1\x9d\x3e\x2c\xcc\x14\xda\x04\xfa\xe3\x3e\x63\x65\x2c\xe4\x69\xb3\xf2\xfd", "GRID", 12),  # eth / Grid+
-    (1, b"\xb4\x44\x20\x8c\xb0\x51\x6c\x15\x01\x78\xfc\xf9\xa5\x26\x04\xbc\x04\xa1\xac\xea", "GRMD", 18),  # eth / GreenMed
-    (1, b"\xc1\x71\x95\xbd\xe4\x9d\x70\xce\xfc\xf8\xa9\xf2\xee\x17\x59\xff\xc2\x7b\xf0\xb1", "GROO", 18),  # eth / Groocoin
-    (1, b"\x0a\x9a\x9c\xe6\x00\xd0\x8b\xf9\xb7\x6f\x49\xfa\x4e\x7b\x38\xa6\x7e\xbe\xb1\xe6", "GROW", 8),  # eth / Growchain
-    (1, b"\x22\x8b\xa5\x14\x30\x9f\xfd\xf0\x3a\x81\xa2\x05\xa6\xd0\x40\xe4\x29\xd6\xe8\x0c", "GSC", 18),  # eth / Global Social Chain
-    (1, b"\xe5\x30\x44\x1f\x4f\x73\xbd\xb6\xdc\x2f\xa5\xaf\x7c\x3f\xc5\xfd\x55\x1e\xc8\x38", "GSE", 4),  # eth / GSENetwork
-    (1, b"\xb7\x08\x35\xd7\x82\x2e\xbb\x94\x26\xb5\x65\x43\xe3\x91\x84\x6c\x10\x7b\xd3\x2c", "GTC", 18),  # eth / GTC Token
-    (1, b"\x02\x5a\xba\xd9\xe5\x18\x51\x6f\xda\xaf\xbd\xcd\xb9\x70\x1b\x37\xfb\x7e\xf0\xfa", "GTKT", 0),  # eth / GTKT
-    (1, b"\xc5\xbb\xae\x50\x78\x1b\xe1\x66\x93\x06\xb9\xe0\x01\xef\xf5\x7a\x29\x57\xb0\x9d", "GTO", 5),  # eth / Gifto
-    (1, b"\xbd\xcf\xbf\x5c\x4d\x91\xab\xc0\xbc\x97\x09\xc7\x28\x6d\x00\x06\x3c\x0e\x6f\x22", "GUESS", 2),  # eth / Peerguess
-    (1, b"\x98\x47\x34\x5d\xe8\xb6\x14\xc9\x56\x14\x6b\xbe\xa5\x49\x33\x6d\x9c\x8d\x26\xb6", "GULD", 8),  # eth / GULD ERC20
-    (1, b"\xf7\xb0\x98\x29\x8f\x7c\x69\xfc\x14\x61\x0b\xf7\x1d\x5e\x02\xc6\x07\x92\x89\x4c", "GUP", 3),  # eth / Matchpool
-    (1, b"\x05\x6f\xd4\x09\xe1\xd7\xa1\x24\xbd\x70\x17\x45\x9d\xfe\xa2\xf3\x87\xb6\xd5\xcd", "GUSD", 2),  # eth / Gemini dollar
-    (1, b"\x10\x3c\x3a\x20\x9d\xa5\x9d\x3e\x7c\x4a\x89\x30\x7e\x66\x52\x1e\x08\x1c\xfd\xf0", "GVT", 18),  # eth / Genesis Vision
-    (1, b"\x58\xca\x30\x65\xc0\xf2\x4c\x7c\x96\xae\xe8\xd6\x05\x6b\x5b\x5d\xec\xf9\xc2\xf8", "GXC", 10),  # eth / GXC
-    (1, b"\x22\xf0\xaf\x8d\x78\x85\x1b\x72\xee\x79\x9e\x05\xf5\x4a\x77\x00\x15\x86\xb1\x8a", "GXVC", 10),  # eth / Genevieve VC
-    (1, b"\x9d\xae\x8b\x7f\x6d\x37\xea\x8e\x5d\x32\xc6\xc3\xe8\x56\xa6\xd8\xa1\xd3\xb3\x63", "GZB", 18),  # eth / GigziBlack
-    (1, b"\x8c\x65\xe9\x92\x29\x7d\x5f\x09\x2a\x75\x6d\xef\x24\xf4\x78\x1a\x28\x01\x98\xff", "GZE", 18),  # eth / GazeCoin
-    (1, b"\xe6\x38\xdc\x39\xb6\xad\xbe\xe8\x52\x6b\x5c\x22\x38\x0b\x4b\x45\xda\xf4\x6d\x8e", "GZR", 6),  # eth / Gizer
-    (1, b"\x48\xc1\xb2\xf3\xef\xa8\x5f\xba\xfb\x2a\xb9\x51\xbf\x4b\xa8\x60\xa0\x8c\xdb\xb7", "HAND", 0),  # eth / ShowHand
-    (1, b"\x5a\x56\x7e\x28\xdb\xfa\x2b\xbd\x3e\xf1\x3c\x0a\x01\xbe\x11\x47\x45\x34\x96\x57", "HAPPY", 2),  # eth / Happiness
-    (1, b"\x90\x02\xd4\x48\x5b\x75\x94\xe3\xe8\x50\xf0\xa2\x06\x71\x3b\x30\x51\x13\xf6\x9e", "HAT", 18),  # eth / Hawala Today
-    (1, b"\xe2\x49\x2f\x8d\x2a\x26\x18\xd8\x70\x9c\xa9\x9b\x1d\x8d\x75\x71\x3b\xd8\x40\x89", "HB", 18),  # eth / HeartBout
-    (1, b"\xdd\x6c\x68\xbb\x32\x46\x2e\x01\x70\x50\x11\xa4\xe2\xad\x1a\x60\x74\x0f\x21\x7f", "HBT", 15),  # eth / Hubii Network
-    (1, b"\xe3\x4e\x19\x44\xe7\x76\xf3\x9b\x92\x52\x79\x0a\x05\x27\xeb\xda\x64\x7a\xe6\x68", "HBZ", 18),  # eth / HBZ coin
-    (1, b"\xff\xe8\x19\x6b\xc2\x59\xe8\xde\xdc\x54\x4d\x93\x57\x86\xaa\x47\x09\xec\x3e\x64", "HDG", 18),  # eth / Hedge Crypto
-    (1, b"\x95\xc4\xbe\x85\x34\xd6\x9c\x24\x8c\x06\x23\xc4\xc9\xa7\xa2\xa0\x01\xc1\x73\x37", "HDL", 18),  # eth / HOLDER.TECH
-    (1, b"\x49\x1c\x9a\x23\xdb\x85\x62\x3e\xed\x45\x5a\x8e\xfd\xd6\xab\xa9\xb9\x11\xc5\xdf", "HER", 18),  # eth / HeroNode
-    (1, b"\xba\x21\x84\x52\x0a\x1c\xc4\x9a\x61\x59\xc5\x7e\x61\xe1\x84\x4e\x08\x56\x15\xb6", "HGT", 8),  # eth / HelloGold
-    (1, b"\x9b\xb1\xdb\x14\x45\xb8\x32\x13\xa5\x6d\x90\xd3\x31\x89\x4b\x3f\x26\x21\x8e\x4e", "HIBT", 18),  # eth / HiBTC Token
-    (1, b"\xa9\x24\x0f\xbc\xac\x1f\x0b\x9a\x6a\xdf\xb0\x4a\x53\xc8\xe3\xb0\xcc\x1d\x14\x44", "HIG", 18),  # eth / ethereumhigh
-    (1, b"\x14\xf3\x7b\x57\x42\x42\xd3\x66\x55\x8d\xb6\x1f\x33\x35\x28\x9a\x50\x35\xc5\x06", "HKG", 3),  # eth / HKG
-    (1, b"\x9e\x6b\x2b\x11\x54\x2f\x2b\xc5\x2f\x30\x29\x07\x7a\xce\x37\xe8\xfd\x83\x8d\x7f", "HKN", 8),  # eth / Hacken
-    (1, b"\x88\xac\x94\xd5\xd1\x75\x13\x03\x47\xfc\x95\xe1\x09\xd7\x7a\xc0\x9d\xbf\x5a\xb7", "HKY", 18),  # eth / Hicky
-    (1, b"\x66\xeb\x65\xd7\xab\x8e\x95\x67\xba\x0f\xa6\xe3\x7c\x30\x59\x56\xc5\x34\x15\x74", "HLX", 5),  # eth / Helex
-    (1, b"\xaa\x0b\xb1\x0c\xec\x1f\xa3\x72\xeb\x3a\xbc\x17\xc9\x33\xfc\x6b\xa8\x63\xdd\x9e", "HMC", 18),  # eth / Hms Token
-    (1, b"\xcb\xcc\x0f\x03\x6e\xd4\x78\x8f\x63\xfc\x0f\xee\x32\x87\x3d\x6a\x74\x87\xb9\x08", "HMQ", 8),  # eth / Humaniq
-    (1, b"\xb4\x5d\x7b\xc4\xce\xbc\xab\x98\xad\x09\xba\xbd\xf8\xc8\x18\xb2\x29\x2b\x67\x2c", "HODL", 18),  # eth / HODLCoin
-    (1, b"\x5b\x07\x51\x71\x3b\x25\x27\xd7\xf0\x02\xc0\xc4\xe2\xa3\x7e\x12\x19\x61\x0a\x6b", "HORSE", 18),  # eth / Ethorse
-    (1, b"\x6c\x6e\xe5\xe3\x1d\x82\x8d\xe2\x41\x28\x2b\x96\x06\xc8\xe9\x8e\xa4\x85\x26\xe2", "HOT (Holo)", 18),  # eth / Holo Token
-    (1, b"\x9a\xf8\x39\x68\x7f\x6c\x94\x54\x2a\xc5\xec\xe2\xe3\x17\xda\xae\x35\x54\x93\xa1", "HOT (Hydro)", 18),  # eth / Hydro Protocol
-    (1, b"\x38\xc6\xa6\x83\x04\xcd\xef\xb9\xbe\xc4\x8b\xbf\xaa\xba\x5c\x5b\x47\x81\x8b\xb2", "HPB", 18),  # eth / HPBCoin
-    (1, b"\x55\x4c\x20\xb7\xc4\x86\xbe\xee\x43\x92\x77\xb4\x54\x0a\x43\x45\x66\xdc\x4c\x02", "HST", 18),  # eth / Decision Token
-    (1, b"\x6f\x25\x96\x37\xdc\xd7\x4c\x76\x77\x81\xe3\x7b\xc6\x13\x3c\xd6\xa6\x8a\xa1\x61", "HT", 18),  # eth / Huobi Token
-    (1, b"\xc0\xeb\x85\x28\x5d\x83\x21\x7c\xd7\xc8\x91\x70\x2b\xcb\xc0\xfc\x40\x1e\x2d\x9d", "HVN", 8),  # eth / Hiveterminal Token
-    (1, b"\xeb\xbd\xf3\x02\xc9\x40\xc6\xbf\xd4\x9c\x6b\x16\x5f\x45\x7f\xdb\x32\x46\x49\xbc", "HYDRO", 18),  # eth / Hydro
-    (1, b"\xc1\xe2\x09\x7d\x78\x8d\x33\x70\x1b\xa3\xcc\x27\x73\xbf\x67\x15\x5e\xc9\x3f\xc4", "IAD", 18),  # eth / IADOWR Coin
-    (1, b"\x5a\x84\x96\x9b\xb6\x63\xfb\x64\xf6\xd0\x15\xdc\xf9\xf6\x22\xae\xdc\x79\x67\x50", "ICE", 18),  # eth / ICE
-    (1, b"\x88\x86\x66\xca\x69\xe0\xf1\x78\xde\xd6\xd7\x5b\x57\x26\xce\xe9\x9a\x87\xd6\x98", "ICN", 18),  # eth / ICONOMI
-    (1, b"\xa3\x3e\x72\x9b\xf4\xfd\xeb\x86\x8b\x53\x4e\x1f\x20\x52\x34\x63\xd9\xc4\x6b\xee", "ICO", 10),  # eth / ICO
-    (1, b"\x01\x4b\x50\x46\x65\x90\x34\x0d\x41\x30\x7c\xc5\x4d\xce\xe9\x90\xc8\xd5\x8a\xa8", "ICOS", 6),  # eth / ICOS
-    (1, b"\xb5\xa5\xf2\x26\x94\x35\x2c\x15\xb0\x03\x23\x84\x4a\xd5\x45\xab\xb2\xb1\x10\x28", "ICX", 18),  # eth / ICON
-    (1, b"\x81\x4c\xaf\xd4\x78\x2d\x2e\x72\x81\x70\xfd\xa6\x82\x57\x98\x3f\x03\x32\x1c\x58", "IDEA", 0),  # eth / IDEA Token
-    (1, b"\x51\x36\xc9\x8a\x80\x81\x1c\x3f\x46\xbd\xda\x8b\x5c\x45\x55\xcf\xd9\xf8\x12\xf0", "IDH", 6),  # eth / indaHash
-    (1, b"\xcc\x13\xfc\x62\x7e\xff\xd6\xe3\x5d\x2d\x27\x06\xea\x3c\x4d\x73\x96\xc6\x10\xea", "IDXM", 8),  # eth / IDEX Membership
-    (1, b"\x85\x9a\x9c\x0b\x44\xcb\x70\x66\xd9\x56\xa9\x58\xb0\xb8\x2e\x54\xc9\xe4\x4b\x4b", "IETH", 8),  # eth / iEthereum
-    (1, b"\x76\x54\x91\x5a\x1b\x82\xd6\xd2\xd0\xaf\xc3\x7c\x52\xaf\x55\x6e\xa8\x98\x3c\x7e", "IFT", 18),  # eth / InvestFeed
-    (1, b"\x8a\x88\xf0\x4e\x0c\x90\x50\x54\xd2\xf3\x3b\x26\xbb\x3a\x46\xd7\x09\x1a\x03\x9a", "IG", 18),  # eth / IGToken
-    (1, b"\xed\xa8\xb0\x16\xef\xa8\xb1\x16\x12\x08\xcf\x04\x1c\xd8\x69\x72\xee\xe0\xf3\x1e", "IHT", 18),  # eth / I HOUSE TOKEN
-    (1, b"\x16\x66\x2f\x73\xdf\x3e\x79\xe5\x4c\x6c\x59\x38\xb4\x31\x3f\x92\xc5\x24\xc1\x20", "IIC", 18),  # eth / IIC
-    (1, b"\x88\xae\x96\x84\x5e\x15\x75\x58\xef\x59\xe9\xff\x90\xe7\x66\xe2\x2e\x48\x03\x90", "IKB", 0),  # eth / IKB
-    (1, b"\xe3\x83\x1c\x5a\x98\x2b\x27\x9a\x19\x84\x56\xd5\x77\xcf\xb9\x04\x24\xcb\x63\x40", "IMC", 6),  # eth / Immune Coin
-    (1, b"\xf8\xe3\x86\xed\xa8\x57\x48\x4f\x5a\x12\xe4\xb5\xda\xa9\x98\x4e\x06\xe7\x37\x05", "IND", 18),  # eth / Indorse
-    (1, b"\x24\xdd\xff\x6d\x8b\x8a\x42\xd8\x35\xaf\x3b\x44\x0d\xe9\x1f\x33\x86\x55\x4a\xa4", "ING", 18),  # eth / Iungo
-    (1, b"\x48\xe5\x41\x3b\x73\xad\xd2\x43\x4e\x47\x50\x4e\x2a\x22\xd1\x49\x40\xdb\xfe\x78", "INRM", 3),  # eth / Integrated Money
-    (1, b"\x5b\x2e\x4a\x70\x0d\xfb\xc5\x60\x06\x1e\x95\x7e\xde\xc8\xf6\xee\xeb\x74\xa3\x20", "INS", 10),  # eth / Insolar
-    (1, b"\xc7\x2f\xe8\xe3\xdd\x5b\xef\x0f\x9f\x31\xf2\x59\x39\x9f\x30\x12\x72\xef\x2a\x2d", "INSTAR", 18),  # eth / Insights Network
-    (1, b"\x0b\x76\x54\x4f\x6c\x41\x3a\x55\x5f\x30\x9b\xf7\x62\x60\xd1\xe0\x23\x77\xc0\x2a", "INT", 6),  # eth / Internet Node Token
-    (1, b"\xec\xe8\x36\x17\xdb\x20\x8a\xd2\x55\xad\x4f\x45\xda\xf8\x1e\x25\x13\x75\x35\xbb", "INV", 8),  # eth / Invacio
-    (1, b"\xa8\x00\x6c\x4c\xa5\x6f\x24\xd6\x83\x67\x27\xd1\x06\x34\x93\x20\xdb\x7f\xef\x82", "INXT", 8),  # eth / Internxt
-    (1, b"\xfa\x1a\x85\x6c\xfa\x34\x09\xcf\xa1\x45\xfa\x4e\x20\xeb\x27\x0d\xf3\xeb\x21\xab", "IOST", 18),  # eth / IOSToken
-    (1, b"\xc3\x4b\x21\xf6\xf8\xe5\x1c\xc9\x65\xc2\x39\x3b\x3c\xcf\xa3\xb8\x2b\xeb\x24\x03", "IoT", 6),  # eth / IoTコイン
-    (1, b"\x6f\xb3\xe0\xa2\x17\x40\x7e\xff\xf7\xca\x06\x2d\x46\xc2\x6e\x5d\x60\xa1\x4d\x69", "IOTX", 18),  # eth / IoTeX Network
-    (1, b"\x64\xcd\xf8\x19\xd3\xe7\x5a\xc8\xec\x21\x7b\x34\x96\xd7\xce\x16\x7b\xe4\x2e\x80", "IPL", 18),  # eth / InsurePal token
-    (1, b"\x00\x1f\x0a\xa5\xda\x15\x58\x5e\x5b\x23\x05\xdb\xab\x2b\xac\x42\x5e\xa7\x10\x07", "IPSX", 18),  # eth / IP Exchange
-    (1, b"\x0d\xb8\xd8\xb7\x6b\xc3\x61\xba\xcb\xb7\x2e\x2c\x49\x1e\x06\x08\x5a\x97\xab\x31", "IQN", 18),  # eth / IQeon
-    (1, b"\x0c\xf7\x13\xb1\x1c\x9b\x98\x6e\xc4\x0d\x65\xbd\x4f\x7f\xbd\x50\xf6\xff\x2d\x64", "IST34", 18),  # eth / IST34 Token
-    (1, b"\x5e\x6b\x6d\x9a\xba\xd9\x09\x3f\xdc\x86\x1e\xa1\x60\x0e\xba\x1b\x35\x5c\xd9\x40", "ITC", 18),  # eth / IoT Chain
-    (1, b"\x0a\xef\x06\xdc\xcc\xc5\x31\xe5\x81\xf0\x44\x00\x59\xe6\xff\xcc\x20\x60\x39\xee", "ITT", 8),  # eth / ITT Token
-    (1, b"\xa4\xea\x68\x7a\x2a\x7f\x29\xcf\x2d\xc6\x6b\x39\xc6\x8e\x44\x11\xc0\xd0\x0c\x49", "IVY", 18),  # eth / IvyKoin Public Network Tokens
-    (1, b"\xfc\xa4\x79\x62\xd4\x5a\xdf\xdf\xd1\xab\x2d\x97\x23\x15\xdb\x4c\xe7\xcc\xf0\x94", "IXT", 8),  # eth / InsureX
-    (1, b"\x0d\x26\x2e\x5d\xc4\xa0\x6a\x0f\x1c\x90\xce\x79\xc7\xa6\x0c\x09\xdf\xc8\x84\xe4", "J8T", 8),  # eth / J8T Token
-    (1, b"\xe2\xd8\x2d\xc7\xda\x0e\x6f\x88\x2e\x96\x84\x64\x51\xf4\xfa\xbc\xc8\xf9\x05\x28", "JC", 18),  # eth / Jesus Coin
-    (1, b"\x87\x27\xc1\x12\xc7\x12\xc4\xa0\x33\x71\xac\x87\xa7\x4d\xd6\xab\x10\x4a\xf7\x68", "JET", 18),  # eth / JET
-    (1, b"\x77\x34\x50\x33\x5e\xd4\xec\x3d\xb4\x5a\xf7\x4f\x34\xf2\xc8\x53\x48\x64\x5d\x39", "JetCoins", 18),  # eth / JetCoins
-    (1, b"\xa5\xfd\x1a\x79\x1c\x4d\xfc\xaa\xcc\x96\x3d\x4f\x73\xc6\xae\x58\x24\x14\x9e\xa7", "JNT", 18),  # eth / Jibrel Network
-    (1, b"\xdb\x45\x5c\x71\xc1\xbc\x2d\xe4\xe8\x0c\xa4\x51\x18\x40\x41\xef\x32\x05\x40\x01", "JOT", 18),  # eth / Jury.Online Token
-    (1, b"\xdd\xe1\x2a\x12\xa6\xf6\x71\x56\xe0\xda\x67\x2b\xe0\x5c\x37\x4e\x1b\x0a\x3e\x57", "JOY", 6),  # eth / JOYSO
-    (1, b"\x14\x10\x43\x4b\x03\x46\xf5\xbe\x67\x8d\x0f\xb5\x54\xe5\xc7\xab\x62\x0f\x8f\x4a", "KAN", 18),  # eth / BitKan
-    (1, b"\x0d\x6d\xd9\xf6\x8d\x24\xec\x1d\x5f\xe2\x17\x4f\x3e\xc8\xda\xb5\x2b\x52\xba\xf5", "KC", 18),  # eth / KMCC
-    (1, b"\x72\xd3\x2a\xc1\xc5\xe6\x6b\xfc\x5b\x08\x80\x62\x71\xf8\xee\xf9\x15\x54\x51\x64", "KEE", 0),  # eth / CryptoKEE
-    (1, b"\x27\x69\x5e\x09\x14\x9a\xdc\x73\x8a\x97\x8e\x9a\x67\x8f\x99\xe4\xc3\x9e\x9e\xb9", "KICK", 8),  # eth / KICK
-    (1, b"\x81\x8f\xc6\xc2\xec\x59\x86\xbc\x6e\x2c\xbf\x00\x93\x9d\x90\x55\x6a\xb1\x2c\xe5", "KIN", 18),  # eth / Kin Foundation
-    (1, b"\x46\x18\x51\x9d\xe4\xc3\x04\xf3\x44\x4f\xfa\x7f\x81\x2d\xdd\xc2\x97\x1c\xc6\x88", "KIND", 8),  # eth / Kind Ads Token
-    (1, b"\xdd\x97\x4d\x5c\x2e\x29\x28\xde\xa5\xf7\x1b\x98\x25\xb8\xb6\x46\x68\x6b\xd2\x00", "KNC", 18),  # eth / Kyber Network
-    (1, b"\x8e\x56\x10\xab\x5e\x39\xd2\x68\x28\x16\x76\x40\xea\x29\x82\x3f\xe1\xdd\x58\x43", "KNDC", 8),  # eth / KanadeCoin
-    (1, b"\xff\x5c\x25\xd2\xf4\x0b\x47\xc4\xa3\x7f\x98\x9d\xe9\x33\xe2\x65\x62\xef\x0a\xc0", "KNT", 16),  # eth / Kora Network Token
-    (1, b"\xb5\xc3\x3f\x96\x5c\x88\x99\xd2\x55\xc3\x4c\xdd\x2a\x3e\xfa\x8a\xbc\xbb\x3d\xea", "KPR", 18),  # eth / KPRCoin
-    (1, b"\x46\x4e\xbe\x77\xc2\x93\xe4\x73\xb4\x8c\xfe\x96\xdd\xcf\x88\xfc\xf7\xbf\xda\xc0", "KRL", 18),  # eth / Kryll
-    (1, b"\xdf\x13\x38\xfb\xaf\xe7\xaf\x17\x89\x15\x16\x27\xb8\x86\x78\x1b\xa5\x56\xef\x9a", "KUE", 18),  # eth / Kuende Token
-    (1, b"\x24\x1b\xa6\x72\x57\x4a\x78\xa3\xa6\x04\xcd\xd0\xa9\x44\x29\xa7\x3a\x84\xa3\x24", "KWATT", 18),  # eth / 4NEW
-    (1, b"\x95\x41\xfd\x8b\x9b\x5f\xa9\x73\x81\x78\x37\x83\xce\xbf\x2f\x5f\xa7\x93\xc2\x62", "KZN", 8),  # eth / KaizenCoin
-    (1, b"\xe5\x03\x65\xf5\xd6\x79\xcb\x98\xa1\xdd\x62\xd6\xf6\xe5\x8e\x59\x32\x1b\xcd\xdf", "LA", 18),  # eth / LATOKEN
-    (1, b"\xfd\x10\x7b\x47\x3a\xb9\x0e\x8f\xbd\x89\x87\x21\x44\xa3\xdc\x92\xc4\x0f\xa8\xc9", "LALA", 18),  # eth / LALA World Token
-    (1, b"\x2f\x85\xe5\x02\xa9\x88\xaf\x76\xf7\xee\x6d\x83\xb7\xdb\x8d\x6c\x0a\x82\x3b\xf9", "LATX", 8),  # eth / LatiumX
-    (1, b"\xfe\x5f\x14\x1b\xf9\x4f\xe8\x4b\xc2\x8d\xed\x0a\xb9\x66\xc1\x6b\x17\x49\x06\x57", "LBA", 18),  # eth / Cred
-    (1, b"\xaa\x19\x96\x1b\x6b\x85\x8d\x9f\x18\xa1\x15\xf2\x5a\xa1\xd9\x8a\xbc\x1f\xdb\xa8", "LCS", 18),  # eth / LocalCoinSwap
-    (1, b"\x51\x02\x79\x1c\xa0\x2f\xc3\x59\x53\x98\x40\x0b\xfe\x0e\x33\xd7\xb6\xc8\x22\x67", "LDC", 18),  # eth / LEADCOIN
-    (1, b"\x5b\x26\xc5\xd0\x77\x2e\x5b\xba\xc8\xb3\x18\x2a\xe9\xa1\x3f\x9b\xb2\xd0\x37\x65", "LEDU", 8),  # eth / Education Ecosystem
-    (1, b"\x80\xfb\x78\x4b\x7e\xd6\x67\x30\xe8\xb1\xdb\xd9\x82\x0a\xfd\x29\x93\x1a\xab\x03", "LEND", 18),  # eth / EHTLend
-    (1, b"\x0f\x4c\xa9\x26\x60\xef\xad\x97\xa9\xa7\x0c\xb0\xfe\x96\x9c\x75\x54\x39\x77\x2c", "LEV", 9),  # eth / Leverj
-    (1, b"\xc7\x98\xcd\x1c\x49\xdb\x0e\x29\x73\x12\xe4\xc6\x82\x75\x26\x68\xce\x1d\xb2\xad", "LFR", 5),  # eth / LifeRun Coin
-    (1, b"\xc5\x20\xf3\xac\x30\x3a\x10\x7d\x8f\x4b\x08\xb3\x26\xb6\xea\x66\xa4\xf9\x61\xcd", "LG", 18),  # eth / LG
-    (1, b"\x12\x3a\xb1\x95\xdd\x38\xb1\xb4\x05\x10\xd4\x67\xa6\xa3\x59\xb2\x01\xaf\x05\x6f", "LGO", 8),  # eth / LGO Exchange
-    (1, b"\x2e\xb8\x6e\x8f\xc5\x20\xe0\xf6\xbb\x5d\x9a\xf0\x8f\x92\x4f\xe7\x05\x58\xab\x89", "LGR", 8),  # eth / Logarithm
-    (1, b"\xe6\xdf\xbf\x1f\xac\xa9\x50\x36\xb8\xe7\x6e\x1f\xb2\x89\x33\xd0\x25\xb7\x6c\xc0", "LIBER", 18),  # eth / Libereum
-    (1, b"\xeb\x99\x51\x02\x16\x98\xb4\x2e\x43\x99\xf9\xcb\xb6\x26\x7a\xa3\x5f\x82\xd5\x9d", "LIF", 18),  # eth / Winding Tree
-    (1, b"\xff\x18\xdb\xc4\x87\xb4\xc2\xe3\x22\x2d\x11\x59\x52\xba\xbf\xda\x8b\xa5\x2f\x5f", "LIFE", 18),  # eth / LIFE
-    (1, b"\x02\xf6\x1f\xd2\x66\xda\x6e\x8b\x10\x2d\x41\x21\xf5\xce\x7b\x99\x26\x40\xcf\x98", "LIKE", 18),  # eth / LikeCoin
-    (1, b"\x51\x49\x10\x77\x1a\xf9\xca\x65\x6a\xf8\x40\xdf\xf8\x3e\x82\x64\xec\xf9\x86\xca", "LINK (Chainlink)", 18),  # eth / LINK Chainlink
-    (1, b"\x24\xa7\x7c\x1f\x17\xc5\x47\x10\x5e\x14\x81\x3e\x51\x7b\xe0\x6b\x00\x40\xaa\x76", "LIVE", 18),  # eth / LIVE Token
-    (1, b"\x49\xbd\x2d\xa7\x5b\x1f\x7a\xf1\xe4\xdf\xd6\xb1\x12\x5f\xec\xde\x59\xdb\xec\x58", "LKY", 18),  # eth / Linkey
-    (1, b"\x25\xb6\x32\x5f\x5b\xb1\xc1\xe0\x3c\xfb\xc3\xe5\x3f\x47\x0e\x1f\x1c\xa0\x22\xe3", "LML", 18),  # eth / Lisk Machine Learning
-    (1, b"\x09\x47\xb0\xe6\xd8\x21\x37\x88\x05\xc9\x59\x82\x91\x38\x5c\xe7\xc7\x91\xa6\xb2", "LND", 18),  # eth / Lendingblock
-    (1, b"\x5e\x33\x46\x44\x40\x10\x13\x53\x22\x26\x8a\x46\x30\xd2\xed\x5f\x8d\x09\x44\x6c", "LOC", 18),  # eth / LockChain
-    (1, b"\x9c\x23\xd6\x7a\xea\x7b\x95\xd8\x09\x42\xe3\x83\x6b\xcd\xf7\xe7\x08\xa7\x47\xc2", "LOCI", 18),  # eth / LOCIcoin
-    (1, b"\xc6\x45\x00\xdd\x7b\x0f\x17\x94\x80\x7e\x67\x80\x2f\x8a\xbb\xf5\xf8\xff\xb0\x54", "LOCUS", 18),  # eth / Locus Chain
-    (1, b"\x21\xae\x23\xb8\x82\xa3\x40\xa2\x22\x82\x16\x20\x86\xbc\x98\xd3\xe2\xb7\x30\x18", "LOK", 18),  # eth / LOK
-    (1, b"\x25\x3c\x7d\xd0\x74\xf4\xba\xcb\x30\x53\x87\xf9\x22\x22\x5a\x4f\x73\x7c\x08\xbd", "LOOK", 18),  # eth / LookRev
-    (1, b"\xa4\xe8\xc3\xec\x45\x61\x07\xea\x67\xd3\x07\x5b\xf9\xe3\xdf\x3a\x75\x82\x3d\xb0", "LOOM", 18),  # eth / Loom Network
-    (1, b"\x5a\x27\x6a\xeb\x77\xbc\xfd\xac\x8a\xc6\xf3\x1b\xbc\x74\x16\xae\x1a\x85\xee\xf2", "LOVE", 0),  # eth / Love
-    (1, b"\x58\xb6\xa8\xa3\x30\x23\x69\xda\xec\x38\x33\x34\x67\x24\x04\xee\x73\x3a\xb2\x39", "LPT", 18),  # eth / Livepeer Token
-    (1, b"\xef\x68\xe7\xc6\x94\xf4\x0c\x82\x02\x82\x1e\xdf\x52\x5d\xe3\x78\x24\x58\x63\x9f", "LRC", 18),  # eth / Loopring
-    (1, b"\x5d\xbe\x29\x6f\x97\xb2\x3c\x4a\x6a\xa6\x18\x3d\x73\xe5\x74\xd0\x2b\xa5\xc7\x19", "LUC", 18),  # eth / LUCToken
-    (1, b"\xfb\x12\xe3\xcc\xa9\x83\xb9\xf5\x9d\x90\x91\x2f\xd1\x7f\x8d\x74\x5a\x8b\x29\x53", "LUCK", 0),  # eth / LUCK
-    (1, b"\xa8\x9b\x59\x34\x86\x34\x47\xf6\xe4\xfc\x53\xb3\x15\xa9\x3e\x87\x3b\xda\x69\xa3", "LUM", 18),  # eth / Lumino Coin
-    (1, b"\xfa\x05\xa7\x3f\xfe\x78\xef\x8f\x1a\x73\x94\x73\xe4\x62\xc5\x4b\xae\x65\x67\xd9", "LUN", 18),  # eth / Lunyr
-    (1, b"\x57\xad\x67\xac\xf9\xbf\x01\x5e\x48\x20\xfb\xd6\x6e\xa1\xa2\x1b\xed\x88\x52\xec", "LYM", 18),  # eth / Lympo
-    (1, b"\xdd\x41\xfb\xd1\xae\x95\xc5\xd9\xb1\x98\x17\x4a\x28\xe0\x4b\xe6\xb3\xd1\xaa\x27", "LYS", 8),  # eth / Lightyears
-    (1, b"\x3f\x4b\x72\x66\x68\xda\x46\xf5\xe0\xe7\x5a\xa5\xd4\x78\xac\xec\x9f\x38\x21\x0f", "M-ETH", 18),  # eth / M-ETH
-    (1, b"\x5b\x09\xa0\x37\x1c\x1d\xa4\x4a\x8e\x24\xd3\x6b\xf5\xde\xb1\x14\x1a\x84\xd8\x75", "MAD", 18),  # eth / MAD
-    (1, b"\xe2\x5b\xce\xc5\xd3\x80\x1c\xe3\xa7\x94\x07\x9b\xf9\x4a\xdf\x1b\x8c\xcd\x80\x2d", "MAN", 18),  # eth / Matrix AI Network
-    (1, b"\x0f\x5d\x2f\xb2\x9f\xb7\xd3\xcf\xee\x44\x4a\x20\x02\x98\xf4\x68\x90\x8c\xc9\x42", "MANA", 18),  # eth / Decentraland MANA
-    (1, b"\xfd\xcc\x07\xab\x60\x66\x0d\xe5\x33\xb5\xad\x26\xe1\x45\x7b\x56\x5a\x9d\x59\xbd", "MART", 18),  # eth / Martcoin
-    (1, b"\x38\x64\x67\xf1\xf3\xdd\xbe\x83\x24\x48\x65\x04\x18\x31\x1a\x47\x9e\xec\xfc\x57", "MBRS", 0),  # eth / Embers
-    (1, b"\x93\xe6\x82\x10\x7d\x1e\x9d\xef\xb0\xb5\xee\x70\x1c\x71\x70\x7a\x4b\x2e\x46\xbc", "MCAP", 8),  # eth / MCAP
-    (1, b"\x13\x8a\x87\x52\x09\x3f\x4f\x9a\x79\xaa\xed\xf4\x8d\x4b\x92\x48\xfa\xb9\x3c\x9c", "MCI", 18),  # eth / Musiconomi
-    (1, b"\xb6\x3b\x60\x6a\xc8\x10\xa5\x2c\xca\x15\xe4\x4b\xb6\x30\xfd\x42\xd8\xd1\xd8\x3d", "MCO", 8),  # eth / Crypto.com
-    (1, b"\x51\xdb\x5a\xd3\x5c\x67\x1a\x87\x20\x7d\x88\xfc\x11\xd5\x93\xac\x0c\x84\x15\xbd", "MDA", 18),  # eth / Moeda Loyalty Points
-    (1, b"\x66\x18\x60\x08\xc1\x05\x06\x27\xf9\x79\xd4\x64\xea\xbb\x25\x88\x60\x56\x3d\xbe", "MDS", 18),  # eth / MediShares
-    (1, b"\x81\x4e\x09\x08\xb1\x2a\x99\xfe\xcf\x5b\xc1\x01\xbb\x5d\x0b\x8b\x5c\xdf\x7d\x26", "MDT", 18),  # eth / Measurable Data Token
-    (1, b"\xfd\x1e\x80\x50\x8f\x24\x3e\x64\xce\x23\x4e\xa8\x8a\x5f\xd2\x82\x7c\x71\xd4\xb7", "MEDX", 8),  # eth / MediBloc [ERC20]
-    (1, b"\x5b\x8d\x43\xff\xde\x4a\x29\x82\xb9\xa5\x38\x7c\xdf\x21\xd5\x4e\xad\x64\xac\x8d", "MEST", 18),  # eth / Monaco Estate
-    (1, b"\xa3\xd5\x8c\x4e\x56\xfe\xdc\xae\x3a\x7c\x43\xa7\x25\xae\xe9\xa7\x1f\x0e\xce\x4e", "MET", 18),  # eth / Metronome
-    (1, b"\xfe\xf3\x88\x4b\x60\x3c\x33\xef\x8e\xd4\x18\x33\x46\xe0\x93\xa1\x73\xc9\x4d\xa6", "METM", 18),  # eth / MetaMorph
-    (1, b"\x67\x10\xc6\x34\x32\xa2\xde\x02\x95\x4f\xc0\xf8\x51\xdb\x07\x14\x6a\x6c\x03\x12", "MFG", 18),  # eth / SyncFab Smart Manufacturing Blockchain
-    (1, b"\xdf\x2c\x72\x38\x19\x8a\xd8\xb3\x89\x66\x65\x74\xf2\xd8\xbc\x41\x1a\x4b\x74\x28", "MFT", 18),  # eth / Mainframe Token
-    (1, b"\x05\xd4\x12\xce\x18\xf2\x40\x40\xbb\x3f\xa4\x5c\xf2\xc6\x9e\x50\x65\x86\xd8\xe8", "MFTU", 18),  # eth / Mainstream For The Underground
-    (1, b"\x40\x39\x50\x44\xac\x3c\x0c\x57\x05\x19\x06\xda\x93\x8b\x54\xbd\x65\x57\xf2\x12", "MGO", 8),  # eth / MobileGo
-    (1, b"\x3a\x12\x37\xd3\x8d\x0f\xb9\x45\x13\xf8\x5d\x61\x67\x9c\xad\x7f\x38\x50\x72\x42", "MIC", 18),  # eth / Mindexcoin
-    (1, b"\x4a\x52\x7d\x8f\xc1\x3c\x52\x03\xab\x24\xba\x09\x44\xf4\xcb\x14\x65\x8d\x1d\xb6", "MITX", 18),  # eth / Morpheus Infrastructure Token
-    (1, b"\x9f\x8f\x72\xaa\x93\x04\xc8\xb5\x93\xd5\x55\xf1\x2e\xf6\x58\x9c\xc3\xa5\x79\xa2", "MKR", 18),  # eth / MakerDAO
-    (1, b"\x79\x39\x88\x2b\x54\xfc\xf0\xbc\xae\x6b\x53\xde\xc3\x9a\xd6\xe8\x06\x17\x64\x42", "MKT", 8),  # eth / Mikado
-    (1, b"\xec\x67\x00\x5c\x4e\x49\x8e\xc7\xf5\x5e\x09\x2b\xd1\xd3\x5c\xbc\x47\xc9\x18\x92", "MLN (new)", 18),  # eth / Melonport
-    (1, b"\xbe\xb9\xef\x51\x4a\x37\x9b\x99\x7e\x07\x98\xfd\xcc\x90\x1e\xe4\x74\xb6\xd9\xa1", "[deprecated] MLN (old)", 18),  # eth / Melonport
-    (1, b"\x1a\x95\xb2\x71\xb0\x53\x5d\x15\xfa\x49\x93\x2d\xab\xa3\x1b\xa6\x12\xb5\x29\x46", "MNE", 8),  # eth / Minereum
-    (1, b"\xa9\x87\x7b\x1e\x05\xd0\x35\x89\x91\x31\xdb\xd1\xe4\x03\x82\x51\x66\xd0\x9f\x92", "MNT", 18),  # eth / Media Network Token
-    (1, b"\x83\xce\xe9\xe0\x86\xa7\x7e\x49\x2e\xe0\xbb\x93\xc2\xb0\x43\x7a\xd6\xfd\xec\xcc", "MNTP", 18),  # eth / Goldmint MNT Prelaunch Token
-    (1, b"\x86\x5e\xc5\x8b\x06\xbf\x63\x05\xb8\x86\x79\x3a\xa2\x0a\x2d\xa3\x1d\x03\x4e\x68", "MOC", 18),  # eth / Moss Coin
-    (1, b"\x95\x7c\x30\xab\x04\x26\xe0\xc9\x3c\xd8\x24\x1e\x2c\x60\x39\x2d\x08\xc6\xac\x8e", "MOD", 0),  # eth / Modum
-    (1, b"\x26\x3c\x61\x84\x80\xdb\xe3\x5c\x30\x0d\x8d\x5e\xcd\xa1\x9b\xbb\x98\x6a\xca\xed", "MOT", 18),  # eth / Olympus Labs
-    (1, b"\x44\xbf\x22\x94\x9f\x9c\xc8\x4b\x61\xb9\x32\x8a\x9d\x88\x5d\x1b\x5c\x80\x6b\x41", "MOZO", 2),  # eth / Mozo Token
-    (1, b"\xf4\x53\xb5\xb9\xd4\xe0\xb5\xc6\x2f\xfb\x25\x6b\xb2\x37\x8c\xc2\xbc\x8e\x8a\x89", "MRK", 8),  # eth / MARK.SPACE
-    (1, b"\x82\x12\x5a\xfe\x01\x81\x9d\xff\x15\x35\xd0\xd6\x27\x6d\x57\x04\x52\x91\xb6\xc0", "MRL", 18),  # eth / Marcelo
-    (1, b"\x21\xf0\xf0\xfd\x31\x41\xee\x9e\x11\xb3\xd7\xf1\x3a\x10\x28\xcd\x51\x5f\x45\x9c", "MRP", 18),  # eth / MoneyRebel Token
-    (1, b"\xab\x6c\xf8\x7a\x50\xf1\x7d\x7f\x5e\x1f\xea\xf8\x1b\x6f\xe9\xff\xbe\x8e\xbf\x84", "MRV", 18),  # eth / MRV
-    (1, b"\x68\xaa\x3f\x23\x2d\xa9\xbd\xc2\x34\x34\x65\x54\x57\x94\xef\x3e\xea\x52\x09\xbd", "MSP", 18),  # eth / Mothership
-    (1, b"\xaf\x4d\xce\x16\xda\x28\x77\xf8\xc9\xe0\x05\x44\xc9\x3b\x62\xac\x40\x63\x1f\x16", "MTH", 5),  # eth / Monetha
-    (1, b"\xf4\x33\x08\x93\x66\x89\x9d\x83\xa9\xf2\x6a\x77\x3d\x59\xec\x7e\xcf\x30\x35\x5e", "MTL", 8),  # eth / Metal
-    (1, b"\x41\xdb\xec\xc1\xcd\xc5\x51\x7c\x6f\x76\xf6\xa6\xe8\x36\xad\xbe\xe2\x75\x4d\xe3", "MTN", 18),  # eth / MedToken
-    (1, b"\x7f\xc4\x08\x01\x11\x65\x76\x0e\xe3\x1b\xe2\xbf\x20\xda\xf4\x50\x35\x66\x92\xaf", "MTR", 8),  # eth / Mitrav
-    (1, b"\x1e\x49\xff\x77\xc3\x55\xa3\xe3\x8d\x66\x51\xce\x84\x04\xaf\x0e\x48\xc5\x39\x5f", "MTRc", 18),  # eth / MTRCToken
-    (1, b"\x0a\xf4\x4e\x27\x84\x63\x72\x18\xdd\x1d\x32\xa3\x22\xd4\x4e\x60\x3a\x8f\x0c\x6a", "MTX", 18),  # eth / Matryx
-    (1, b"\x51\x56\x69\xd3\x08\xf8\x87\xfd\x83\xa4\x71\xc7\x76\x4f\x5d\x08\x48\x86\xd3\x4d", "MUXE", 18),  # eth / MUXE
-    (1, b"\xa8\x49\xea\xae\x99\x4f\xb8\x6a\xfa\x73\x38\x2e\x9b\xd8\x8c\x2b\x6b\x18\xdc\x71", "MVL", 18),  # eth / Mass Vehicle Ledger Token
-    (1, b"\x8a\x77\xe4\x09\x36\xbb\xc2\x7e\x80\xe9\xa3\xf5\x26\x36\x8c\x96\x78\x69\xc8\x6d", "MVP", 18),  # eth / Merculet
-    (1, b"\x64\x25\xc6\xbe\x90\x2d\x69\x2a\xe2\xdb\x75\x2b\x3c\x26\x8a\xfa\xdb\x09\x9d\x3b", "MWAT", 18),  # eth / RED MWAT
-    (1, b"\xf7\xe9\x83\x78\x16\x09\x01\x23\x07\xf2\x51\x4f\x63\xd5\x26\xd8\x3d\x24\xf4\x66", "MYD", 16),  # eth / MYD
-    (1, b"\xa6\x45\x26\x4c\x56\x03\xe9\x6c\x3b\x0b\x07\x8c\xda\xb6\x87\x33\x79\x4b\x0a\x71", "MYST", 8),  # eth / Mysterium
-    (1, b"\x8d\x80\xde\x8a\x78\x19\x83\x96\x32\x9d\xfa\x76\x9a\xd5\x4d\x24\xbf\x90\xe7\xaa", "NAC", 18),  # eth / Nami ICO
-    (1, b"\xff\xe0\x2e\xe4\xc6\x9e\xdf\x1b\x34\x0f\xca\xd6\x4f\xbd\x6b\x37\xa7\xb9\xe2\x65", "NANJ", 8),  # eth / NANJCOIN
-    (1, b"\x5d\x65\xd9\x71\x89\x5e\xdc\x43\x8f\x46\x5c\x17\xdb\x69\x92\x69\x8a\x52\x31\x8d", "NAS", 18),  # eth / Nebula
-    (1, b"\x58\x80\x47\x36\x5d\xf5\xba\x58\x9f\x92\x36\x04\xaa\xc2\x3d\x67\x35\x55\xc6\x23", "NAVI", 18),  # eth / NaviToken
-    (1, b"\x17\xf8\xaf\xb6\x3d\xfc\xdc\xc9\x0e\xbe\x6e\x84\xf0\x60\xcc\x30\x6a\x98\x25\x7d", "NBAI", 18),  # eth / NebulaAiToken
-    (1, b"\x9f\x19\x56\x17\xfa\x8f\xba\xd9\x54\x0c\x5d\x11\x3a\x99\xa0\xa0\x17\x2a\xae\xdc", "NBC", 18),  # eth / Niobium Coin
-    (1, b"\x80\x98\x26\xcc\xea\xb6\x8c\x38\x77\x26\xaf\x96\x27\x13\xb6\x4c\xb5\xcb\x3c\xca", "NCASH", 18),  # eth / Nucleus Vision
-    (1, b"\x9e\x46\xa3\x8f\x5d\xaa\xbe\x86\x83\xe1\x07\x93\xb0\x67\x49\xee\xf7\xd7\x33\xd1", "NCT", 18),  # eth / Nectar
-    (1, b"\xa5\x4d\xdc\x7b\x3c\xce\x7f\xc8\xb1\xe3\xfa\x02\x56\xd0\xdb\x80\xd2\xc1\x09\x70", "NDC", 18),  # eth / Neverdie
-    (1, b"\x19\x66\xd7\x18\xa5\x65\x56\x6e\x8e\x20\x27\x92\x65\x8d\x7b\x5f\xf4\xec\xe4\x69", "NDX", 18),  # eth / nDEX
-    (1, b"\xcc\x80\xc0\x51\x05\x7b\x77\x4c\xd7\x50\x67\xdc\x48\xf8\x98\x7c\x4e\xb9\x7a\x5e", "NEC", 18),  # eth / Ethfinex Nectar Token
-    (1, b"\xd8\x44\x62\x36\xfa\x95\xb9\xb5\xf9\xfd\x0f\x8e\x7d\xf1\xa9\x44\x82\x3c\x68\x3d", "NEEO", 18),  # eth / NEEO
-    (1, b"\xcf\xb9\x86\x37\xbc\xae\x43\xc1\x33\x23\xea\xa1\x73\x1c\xed\x2b\x71\x69\x62\xfd", "NET", 18),  # eth / NIMIQ
-    (1, b"\xa8\x23\xe6\x72\x20\x06\xaf\xe9\x9e\x91\xc3\x0f\xf5\x29\x50\x52\xfe\x6b\x8e\x32", "NEU", 18),  # eth / NEU Fund
-    (1, b"\x81\x49\x64\xb1\xbc\xea\xf2\x4e\x26\x29\x6d\x03\x1e\xad\xf1\x34\xa2\xca\x41\x05", "NEWB", 0),  # eth / Newbium
-    (1, b"\xb6\x21\x32\xe3\x5a\x6c\x13\xee\x1e\xe0\xf8\x4d\xc5\xd4\x0b\xad\x8d\x81\x52\x06", "NEXO", 18),  # eth / Nexo
-    (1, b"\x72\xdd\x4b\x6b\xd8\x52\xa3\xaa\x17\x2b\xe4\xd6\xc5\xa6\xdb\xec\x58\x8c\xf1\x31", "NGC", 18),  # eth / NAGA Coin
-    (1, b"\xe2\x65\x17\xa9\x96\x72\x99\x45\x3d\x3f\x1b\x48\xaa\x00\x5e\x61\x27\xe6\x72\x10", "NIMFA", 18),  # eth / Ninfa Money
-    (1, b"\x55\x54\xe0\x4e\x76\x53\x3e\x1d\x14\xc5\x2f\x05\xbe\xef\x6c\x9d\x32\x9e\x1e\x30", "NIO", 0),  # eth / Autonio
-    (1, b"\x17\x76\xe1\xf2\x6f\x98\xb1\xa5\xdf\x9c\xd3\x47\x95\x3a\x26\xdd\x3c\xb4\x66\x71", "NMR", 18),  # eth / Numerai
-    (1, b"\x58\xa4\x88\x41\x82\xd9\xe8\x35\x59\x7f\x40\x5e\x5f\x25\x82\x90\xe4\x6a\xe7\xc2", "NOAH", 18),  # eth / Noah Coin
-    (1, b"\xf4\xfa\xea\x45\x55\x75\x35\x4d\x26\x99\xbc\x20\x9b\x0a\x65\xca\x99\xf6\x99\x82", "NOBS", 18),  # eth / No BS Crypto
-    (1, b"\x64\x3b\x68\x70\xbe\xab\xee\x94\x1b\x92\x60\xa0\xa8\x78\xbc\xf4\xa6\x1f\xb0\xf1", "NONE", 0),  # eth / None
-    (1, b"\xec\x46\xf8\x20\x7d\x76\x60\x12\x45\x4c\x40\x8d\xe2\x10\xbc\xbc\x22\x43\xe7\x1c", "NOX", 18),  # eth / Nitro
-    (1, b"\x4c\xe6\xb3\x62\xbc\x77\xa2\x49\x66\xdd\xa9\x07\x8f\x9c\xef\x81\xb3\xb8\x86\xa7", "NPER", 18),  # eth / NPER
-    (1, b"\x28\xb5\xe1\x2c\xce\x51\xf1\x55\x94\xb0\xb9\x1d\x5b\x5a\xda\xa7\x0f\x68\x4a\x02", "NPX", 2),  # eth / NaPoleonX
-    (1, b"\xa1\x5c\x7e\xbe\x1f\x07\xca\xf6\xbf\xf0\x97\xd8\xa5\x89\xfb\x8a\xc4\x9a\xe5\xb3", "NPXS", 18),  # eth / Pundi X Token
-    (1, b"\x8a\x99\xed\x8a\x1b\x20\x49\x03\xee\x46\xe7\x33\xf2\xc1\x28\x6f\x6d\x20\xb1\x77", "NTO", 18),  # eth / Fujinto
-    (1, b"\x22\x33\x79\x9e\xe2\x68\x3d\x75\xdf\xef\xac\xbc\xd2\xa2\x6c\x78\xd3\x4b\x47\x0d", "NTWK", 18),  # eth / Network
-    (1, b"\x24\x5e\xf4\x7d\x4d\x05\x05\xec\xf3\xac\x46\x3f\x4d\x81\xf4\x1a\xde\x8f\x1f\xd1", "NUG", 18),  # eth / Nuggets Token
-    (1, b"\xb9\x13\x18\xf3\x5b\xdb\x26\x2e\x94\x23\xbc\x7c\x7c\x2a\x3a\x93\xdd\x93\xc9\x2c", "NULS", 18),  # eth / NULS
-    (1, b"\x45\xe4\x2d\x65\x9d\x9f\x94\x66\xcd\x5d\xf6\x22\x50\x60\x33\x14\x5a\x9b\x89\xbc", "NxC", 3),  # eth / Nexium
-    (1, b"\x76\x27\xde\x4b\x93\x26\x3a\x6a\x75\x70\xb8\xda\xfa\x64\xba\xe8\x12\xe5\xc3\x94", "NXX", 8),  # eth / NXX
-    (1, b"\x5e\x88\x8b\x83\xb7\x28\x7e\xed\x4f\xb7\xda\x7b\x7d\x0a\x0d\x4c\x73\x5d\x94\xb3", "OAK", 18),  # eth / OAK
-    (1, b"\x70\x1c\x24\x4b\x98\x8a\x51\x3c\x94\x59\x73\xde\xfa\x05\xde\x93\x3b\x23\xfe\x1d", "OAX", 18),  # eth / OAX
-    (1, b"\x02\x35\xfe\x62\x4e\x04\x4a\x05\xee\xd7\xa4\x3e\x16\xe3\x08\x3b\xc8\xa4\x28\x7a", "OCC", 18),  # eth / Original Crypto Coin
-    (1, b"\x40\x92\x67\x8e\x4e\x78\x23\x0f\x46\xa1\x53\x4c\x0f\xbc\x8f\xa3\x97\x80\x89\x2b", "OCN", 18),  # eth / Odyssey
-    (1, b"\xbf\x52\xf2\xab\x39\xe2\x6e\x09\x51\xd2\xa0\x2b\x49\xb7\x70\x2a\xbe\x30\x40\x6a", "ODE", 18),  # eth / ODEM Token
-    (1, b"\xbe\xef\x54\x6a\xc8\xa4\xe0\xa8\x0d\xc1\xe2\xd6\x96\x96\x8e\xf5\x41\x38\xf1\xd4", "OJX", 18),  # eth / Ojooo Coin
-    (1, b"\xc6\x6e\xa8\x02\x71\x7b\xfb\x98\x33\x40\x02\x64\xdd\x12\xc2\xbc\xea\xa3\x4a\x6d", "OLD_MKR", 18),  # eth / MakerDAO
-    (1, b"\x9d\x92\x23\x43\x6d\xdd\x46\x6f\xc2\x47\xe9\xdb\xbd\x20\x20\x7e\x64\x0f\xef\x58", "OLE", 18),  # eth / Olive
-    (1, b"\x64\xa6\x04\x93\xd8\x88\x72\x8c\xf4\x26\x16\xe0\x34\xa0\xdf\xea\xe3\x8e\xfc\xf0", "OLT", 18),  # eth / OneLedger Token
-    (1, b"\xd2\x61\x14\xcd\x6e\xe2\x89\xac\xcf\x82\x35\x0c\x8d\x84\x87\xfe\xdb\x8a\x0c\x07", "OMG", 18),  # eth / OmiseGO
-    (1, b"\x04\x71\x87\xe5\x34\x77\xbe\x70\xdb\xe8\xea\x5b\x79\x93\x18\xf2\xe1\x65\x05\x2f", "OMT", 18),  # eth / OTCMAKER Token
-    (1, b"\xb5\xdb\xc6\xd3\xcf\x38\x00\x79\xdf\x3b\x27\x13\x56\x64\xb6\xbc\xf4\x5d\x18\x69", "OMX", 8),  # eth / Shivom
-    (1, b"\x4d\x80\x75\x09\xae\xce\x24\xc0\xfa\x5a\x10\x2b\x6a\x3b\x05\x9e\xc6\xe1\x43\x92", "ONE", 18),  # eth / Menlo One
-    (1, b"\xb2\x3b\xe7\x35\x73\xbc\x7e\x03\xdb\x6e\x5d\xfc\x62\x40\x53\x68\x71\x6d\x28\xa8", "ONEK", 18),  # eth / One K Token
-    (1, b"\xd3\x41\xd1\x68\x0e\xee\xe3\x25\x5b\x8c\x4c\x75\xbc\xce\x7e\xb5\x7f\x14\x4d\xae", "ONG", 18),  # eth / SoMee.Social
-    (1, b"\x68\x63\xbe\x0e\x7c\xf7\xce\x86\x0a\x57\x47\x60\xe9\x02\x0d\x51\x9a\x8b\xdc\x47", "ONL", 18),  # eth / On.Live
-    (1, b"\x43\x55\xfc\x16\x0f\x74\x32\x8f\x9b\x38\x3d\xf2\xec\x58\x9b\xb3\xdf\xd8\x2b\xa0", "OPT", 18),  # eth / Opus Foundation
-    (1, b"\x83\x29\x04\x86\x39\x78\xb9\x48\x02\x12\x31\x06\xe6\xeb\x49\x1b\xdf\x0d\xf9\x28", "OPTI", 18),  # eth / OptiToken
-    (1, b"\xff\x56\xcc\x6b\x1e\x6d\xed\x34\x7a\xa0\xb7\x67\x6c\x85\xab\x0b\x3d\x08\xb0\xfa", "ORBS", 18),  # eth / Orbs
-    (1, b"\x6f\x59\xe0\x46\x1a\xe5\xe2\x79\x9f\x1f\xb3\x84\x7f\x05\xa6\x3b\x16\xd0\xdb\xf8", "ORCA", 18),  # eth / ORCA Token
-    (1, b"\xd2\xfa\x8f\x92\xea\x72\xab\xb3\x5d\xbd\x6d\xec\xa5\x71\x73\xd2\x2d\xb2\xba\x49", "ORI", 18),  # eth / Origami
-    (1, b"\x51\x6e\x54\x36\xba\xfd\xc1\x10\x83\x65\x4d\xe7\xbb\x9b\x95\x38\x2d\x08\xd5\xde", "ORME", 8),  # eth / Ormeus Coin
-    (1, b"\xeb\x9a\x4b\x18\x58\x16\xc3\x54\xdb\x92\xdb\x09\xcc\x3b\x50\xbe\x60\xb9\x01\xb6", "ORS", 18),  # eth / Origin Sport
-    (1, b"\x2c\x4e\x8f\x2d\x74\x61\x13\xd0\x69\x6c\xe8\x9b\x35\xf0\xd8\xbf\x88\xe0\xae\xca", "OST", 18),  # eth / Simple Token 'OST'
-    (1, b"\x88\x1e\xf4\x82\x11\x98\x2d\x01\xe2\xcb\x70\x92\xc9\x15\xe6\x47\xcd\x40\xd8\x5c", "OTN", 18),  # eth / Open Trading Network
-    (1, b"\x17\x0b\x27\x5c\xed\x08\x9f\xff\xae\xbf\xe9\x27\xf4\x45\xa3\x50\xed\x91\x60\xdc", "OWN", 8),  # eth / OWNDATA
-    (1, b"\x65\xa1\x50\x14\x96\x4f\x21\x02\xff\x58\x64\x7e\x16\xa1\x6a\x6b\x9e\x14\xbc\xf6", "Ox Fina", 3),  # eth / Ox Fina
-    (1, b"\xb9\xbb\x08\xab\x7e\x9f\xa0\xa1\x35\x6b\xd4\xa3\x9e\xc0\xca\x26\x7e\x03\xb0\xb3", "PAI", 18),  # eth / PCHAIN
-    (1, b"\xfe\xda\xe5\x64\x26\x68\xf8\x63\x6a\x11\x98\x7f\xf3\x86\xbf\xd2\x15\xf9\x42\xee", "PAL", 18),  # eth / PolicyPal Network
-    (1, b"\xea\x5f\x88\xe5\x4d\x98\x2c\xbb\x0c\x44\x1c\xde\x4e\x79\xbc\x30\x5e\x5b\x43\xbc", "PARETO", 18),  # eth / PARETO
-    (1, b"\xf3\xb3\xca\xd0\x94\xb8\x93\x92\xfc\xe5\xfa\xfd\x40\xbc\x03\xb8\x0f\x2b\xc6\x24", "PAT", 18),  # eth / Patron
-    (1, b"\x69\x44\x04\x59\x5e\x30\x75\xa9\x42\x39\x7f\x46\x6a\xac\xd4\x62\xff\x1a\x7b\xd0", "PATENTS", 18),  # eth / PATENTS
-    (1, b"\xf8\x13\xf3\x90\x2b\xbc\x00\xa6\xdc\xe3\x78\x63\x4d\x3b\x79\xd8\x4f\x98\x03\xd7", "PATH", 18),  # eth / PATH
-    (1, b"\x8e\x87\x0d\x67\xf6\x60\xd9\x5d\x5b\xe5\x30\x38\x0d\x0e\xc0\xbd\x38\x82\x89\xe1", "PAX", 18),  # eth / Paxos Standard (PAX)
-    (1, b"\xb9\x70\x48\x62\x8d\xb6\xb6\x61\xd4\xc2\xaa\x83\x3e\x95\xdb\xe1\xa9\x05\xb2\x80", "PAY", 18),  # eth / TenX
-    (1, b"\x55\x64\x8d\xe1\x98\x36\x33\x85\x49\x13\x0b\x1a\xf5\x87\xf1\x6b\xea\x46\xf6\x6b", "PBL", 18),  # eth / PBL
-    (1, b"\xf4\xc0\x7b\x18\x65\xbc\x32\x6a\x3c\x01\x33\x94\x92\xca\x75\x38\xfd\x03\x8c\xc0", "PBT", 4),  # eth / Primalbase Token (PBT)
-    (1, b"\x36\x18\x51\x6f\x45\xcd\x3c\x91\x3f\x81\xf9\x98\x7a\xf4\x10\x77\x93\x2b\xc4\x0d", "PCL", 8),  # eth / Peculium
-    (1, b"\x53\x14\x8b\xb4\x55\x17\x07\xed\xf5\x1a\x1e\x8d\x7a\x93\x69\x8d\x18\x93\x12\x25", "PCLOLD", 8),  # eth / PeculiumOLD
-    (1, b"\x0d\xb0\x3b\x6c\xde\x0b\x2d\x42\x7c\x64\xa0\x4f\xea\xfd\x82\x59\x38\x36\x8f\x1f", "PDATA", 18),  # eth / PDATA
-    (1, b"\x8a\xe5\x6a\x68\x50\xa7\xcb\xea\xc3\xc3\xab\x2c\xb3\x11\xe7\x62\x01\x67\xea\xc8", "PEG", 18),  # eth / PEG Network Token
-    (1, b"\x58\x84\x96\x9e\xc0\x48\x05\x56\xe1\x1d\x11\x99\x80\x13\x6a\x4c\x17\xed\xde\xd1", "PET", 18),  # eth / PETHEREUM
-    (1, b"\xec\x18\xf8\x98\xb4\x07\x6a\x3e\x18\xf1\x08\x9d\x33\x37\x6c\xc3\x80\xbd\xe6\x1d", "PETRO", 18),  # eth / PETRO
-    (1, b"\x55\xc2\xa0\xc1\x71\xd9\x20\x84\x35\x60\x59\x4d\xe3\xd6\xee\xcc\x09\xef\xc0\x98", "PEXT", 4),  # eth / PEX-Token
-    (1, b"\x2f\xa3\x2a\x39\xfc\x1c\x39\x9e\x0c\xc7\xb2\x93\x58\x68\xf5\x16\x5d\xe7\xce\x97", "PFR", 8),  # eth / Payfair
-    (1, b"\x13\xc2\xfa\xb6\x35\x4d\x37\x90\xd8\xec\xe4\xf0\xf1\xa3\x28\x0b\x4a\x25\xad\x96", "PHI", 18),  # eth / PHI Token
-    (1, b"\xe6\x45\x09\xf0\xbf\x07\xce\x2d\x29\xa7\xef\x19\xa8\xa9\xbc\x06\x54\x77\xc1\xb4", "PIPL", 8),  # eth / PIPL Coin
-    (1, b"\x0f\xf1\x61\x07\x1e\x62\x7a\x0e\x6d\xe1\x38\x10\x5c\x73\x97\x0f\x86\xca\x79\x22", "PIT", 18),  # eth / Paypite v2
-    (1, b"\x8e\xff\xd4\x94\xeb\x69\x8c\xc3\x99\xaf\x62\x31\xfc\xcd\x39\xe0\x8f\xd2\x0b\x15", "PIX", 0),  # eth / Lampix
-    (1, b"\x02\xf2\xd4\xa0\x4e\x6e\x01\xac\xe8\x8b\xd2\xcd\x63\x28\x75\x54\x3b\x2e\xf5\x77", "PKG", 18),  # eth / PKG Token
-    (1, b"\x26\x04\xfa\x40\x6b\xe9\x57\xe5\x42\xbe\xb8\x9e\x67\x54\xfc\xde\x68\x15\xe8\x3f", "PKT", 18),  # eth / Playkey
-    (1, b"\x59\x41\x6a\x25\x62\x8a\x76\xb4\x73\x0e\xc5\x14\x86\x11\x4c\x32\xe0\xb5\x82\xa1", "PLASMA", 6),  # eth / PLASMA
-    (1, b"\x0a\xff\xa0\x6e\x7f\xbe\x5b\xc9\xa7\x64\xc9\x79\xaa\x66\xe8\x25\x6a\x63\x1f\x02", "PLBT", 6),  # eth / Polybius
-    (1, b"\xe3\x81\x85\x04\xc1\xb3\x2b\xf1\x55\x7b\x16\xc2\x38\xb2\xe0\x1f\xd3\x14\x9c\x17", "PLR", 18),  # eth / Pillar Project
-    (1, b"\xe4\x3a\xc1\x71\x4f\x73\x94\x17\x3b\x15\xe7\xcf\xf3\x1a\x63\xd5\x23\xce\x4f\xb9", "PLS", 18),  # eth / DACPLAY Token
-    (1, b"\xd8\x91\x2c\x10\x68\x1d\x8b\x21\xfd\x37\x42\x24\x4f\x44\x65\x8d\xba\x12\x26\x4e", "PLU", 18),  # eth / Pluton
-    (1, b"\x84\x6c\x66\xcf\x71\xc4\x3f\x80\x40\x3b\x51\xfe\x39\x06\xb3\x59\x9d\x63\x33\x6f", "PMA", 18),  # eth / PumaPay
-    (1, b"\x81\xb4\xd0\x86\x45\xda\x11\x37\x4a\x03\x74\x9a\xb1\x70\x83\x6e\x4e\x53\x97\x67", "PMNT", 9),  # eth / Paymon
-    (1, b"\x93\xed\x3f\xbe\x21\x20\x7e\xc2\xe8\xf2\xd3\xc3\xde\x6e\x05\x8c\xb7\x3b\xc0\x4d", "PNK", 18),  # eth / Pinakion
-    (1, b"\x67\x58\xb7\xd4\x41\xa9\x73\x9b\x98\x55\x2b\x37\x37\x03\xd8\xd3\xd1\x4f\x9e\x62", "POA20", 18),  # eth / POA ERC20 on Foundation
-    (1, b"\x0e\x09\x89\xb1\xf9\xb8\xa3\x89\x83\xc2\xba\x80\x53\x26\x9c\xa6\x2e\xc9\xb1\x95", "POE", 8),  # eth / Po.et Tokens
-    (1, b"\x43\xf6\xa1\xbe\x99\x2d\xee\x40\x87\x21\x74\x84\x90\x77\x2b\x15\x14\x3c\xe0\xa7", "POIN", 0),  # eth / Potatoin
-    (1, b"\x70\x5e\xe9\x6c\x1c\x16\x08\x42\xc9\x2c\x1a\xec\xfc\xff\xcc\xc9\xc4\x12\xe3\xd9", "POLL", 18),  # eth / ClearPoll
-    (1, b"\x99\x92\xec\x3c\xf6\xa5\x5b\x00\x97\x8c\xdd\xf2\xb2\x7b\xc6\x88\x2d\x88\xd1\xec", "POLY", 18),  # eth / Polymath Network
-    (1, b"\x77\x9b\x7b\x71\x3c\x86\xe3\xe6\x77\x4f\x50\x40\xd9\xcc\xc2\xd4\x3a\xd3\x75\xf8", "POOL", 8),  # eth / Stake Pool
-    (1, b"\x5d\x85\x8b\xcd\x53\xe0\x85\x92\x06\x20\x54\x92\x14\xa8\xb2\x7c\xe2\xf0\x46\x70", "POP", 18),  # eth / POP Network Token
-    (1, b"\xee\x60\x9f\xe2\x92\x12\x8c\xad\x03\xb7\x86\xdb\xb9\xbc\x26\x34\xcc\xdb\xe7\xfc", "POS", 18),  # eth / PoSToken
-    (1, b"\x59\x58\x32\xf8\xfc\x6b\xf5\x9c\x85\xc5\x27\xfe\xc3\x74\x0a\x1b\x7a\x36\x12\x69", "POWR", 6),  # eth / PowerLedger
-    (1, b"\xc4\x22\x09\xac\xcc\x14\x02\x9c\x10\x12\xfb\x56\x80\xd9\x5f\xbd\x60\x36\xe2\xa0", "PPP", 18),  # eth / PayPie
-    (1, b"\xd4\xfa\x14\x60\xf5\x37\xbb\x90\x85\xd2\x2c\x7b\xcc\xb5\xdd\x45\x0e\xf2\x8e\x3a", "PPT", 8),  # eth / Populous
-    (1, b"\x88\xa3\xe4\xf3\x5d\x64\xaa\xd4\x1a\x6d\x40\x30\xac\x9a\xfe\x43\x56\xcb\x84\xfa", "PRE", 18),  # eth / Presearch
-    (1, b"\x77\x28\xdf\xef\x5a\xbd\x46\x86\x69\xeb\x7f\x9b\x48\xa7\xf7\x0a\x50\x1e\xd2\x9d", "PRG", 6),  # eth / Paragon
-    (1, b"\x3a\xdf\xc4\x99\x9f\x77\xd0\x4c\x83\x41\xba\xc5\xf3\xa7\x6f\x58\xdf\xf5\xb3\x7a", "PRIX", 8),  # eth / Privatix
-    (1, b"\x18\x44\xb2\x15\x93\x26\x26\x68\xb7\x24\x8d\x0f\x57\xa2\x20\xca\xab\xa4\x6a\xb9", "PRL", 18),  # eth / Oyster Pearl
-    (1, b"\xa3\x14\x9e\x0f\xa0\x06\x1a\x90\x07\xfa\xf3\x07\x07\x4c\xdc\xd2\x90\xf0\xe2\xfd", "PRON", 8),  # eth / PronCoin
-    (1, b"\x16\x37\x33\xbc\xc2\x8d\xbf\x26\xb4\x1a\x8c\xfa\x83\xe3\x69\xb5\xb3\xaf\x74\x1b", "PRS", 18),  # eth / Persians
-    (1, b"\x0c\x04\xd4\xf3\x31\xda\x8d\xf7\x5f\x9e\x2e\x27\x1e\x3f\x3f\x14\x94\xc6\x6c\x36", "PRSP", 9),  # eth / PRSP
-    (1, b"\x5d\x4a\xbc\x77\xb8\x40\x5a\xd1\x77\xd8\xac\x66\x82\xd5\x84\xec\xbf\xd4\x6c\xec", "PST", 18),  # eth / Primas
-    (1, b"\x66\x49\x7a\x28\x3e\x0a\x00\x7b\xa3\x97\x4e\x83\x77\x84\xc6\xae\x32\x34\x47\xde", "PT", 18),  # eth / PornToken
-    (1, b"\x49\x46\x58\x3c\x5b\x86\xe0\x1c\xcd\x30\xc7\x1a\x05\x61\x7d\x06\xe3\xe7\x30\x60", "PTON", 18),  # eth / PTON
-    (1, b"\x8a\xe4\xbf\x2c\x33\xa8\xe6\x67\xde\x34\xb5\x49\x38\xb0\xcc\xd0\x3e\xb8\xcc\x06", "PTOY", 8),  # eth / Patientory
-    (1, b"\x46\x89\xa4\xe1\x69\xeb\x39\xcc\x90\x78\xc0\x94\x0e\x21\xff\x1a\xa8\xa3\x9b\x9c", "PTT", 18),  # eth / Proton Token
-    (1, b"\x55\x12\xe1\xd6\xa7\xbe\x42\x4b\x43\x23\x12\x6b\x4f\x9e\x86\xd0\x23\xf9\x57\x64", "PTWO", 18),  # eth / PornTokenV2
-    (1, b"\xef\x6b\x4c\xe8\xc9\xbc\x83\x74\x4f\xbc\xde\x26\x57\xb3\x2e\xc1\x87\x90\x45\x8a", "PUC", 0),  # eth / Pour Coin
-    (1, b"\xe2\x5f\xf6\xeb\x95\x9b\xce\x67\x97\x57\x78\xe4\x6a\x47\x75\x0c\x24\x3b\x6b\x99", "PURC", 18),  # eth / PureCarbon
-    (1, b"\xc1\x48\x30\xe5\x3a\xa3\x44\xe8\xc1\x46\x03\xa9\x12\x29\xa0\xb9\x25\xb0\xb2\x62", "PXT", 8),  # eth / Populous XBRL Token (PXT)
-    (1, b"\x77\x03\xc3\x5c\xff\xdc\x5c\xda\x8d\x27\xaa\x3d\xf2\xf9\xba\x69\x64\x54\x4b\x6e", "PYLNT", 18),  # eth / Pylon Network
-    (1, b"\x61\x8e\x75\xac\x90\xb1\x2c\x60\x49\xba\x3b\x27\xf5\xd5\xf8\x65\x1b\x00\x37\xf6", "QASH", 6),  # eth / QASH
-    (1, b"\x67\x1a\xbb\xe5\xce\x65\x24\x91\x98\x53\x42\xe8\x54\x28\xeb\x1b\x07\xbc\x6c\x64", "QAU", 8),  # eth / QAU
-    (1, b"\xcb\x5e\xa3\xc1\x90\xd8\xf8\x2d\xea\xdf\x7c\xe5\xaf\x85\x5d\xdb\xf3\x3e\x39\x62", "QBIT", 6),  # eth / Qubitica
-    (1, b"\x24\x67\xaa\x6b\x5a\x23\x51\x41\x6f\xd4\xc3\xde\xf8\x46\x2d\x84\x1f\xee\xec\xec", "QBX", 18),  # eth / qiibeeToken
-    (1, b"\xea\x26\xc4\xac\x16\xd4\xa5\xa1\x06\x82\x0b\xc8\xae\xe8\x5f\xd0\xb7\xb2\xb6\x64", "QKC", 18),  # eth / QuarkChain
-    (1, b"\x4a\x22\x0e\x60\x96\xb2\x5e\xad\xb8\x83\x58\xcb\x44\x06\x8a\x32\x48\x25\x46\x75", "QNT", 18),  # eth / Quant
-    (1, b"\xff\xaa\x5f\xfc\x45\x5d\x91\x31\xf8\xa2\x71\x3a\x74\x1f\xd1\x96\x03\x30\x50\x8b", "QRG", 18),  # eth / QRG
-    (1, b"\x69\x7b\xea\xc2\x8b\x09\xe1\x22\xc4\x33\x2d\x16\x39\x85\xe8\xa7\x31\x21\xb9\x7f", "QRL", 8),  # eth / QRL
-    (1, b"\x99\xea\x4d\xb9\xee\x77\xac\xd4\x0b\x11\x9b\xd1\xdc\x4e\x33\xe1\xc0\x70\xb8\x0d", "QSP", 18),  # eth / Quantstamp Token
-    (1, b"\x2c\x3c\x1f\x05\x18\x7d\xba\x7a\x5f\x2d\xd4\x7d\xca\x57\x28\x1c\x4d\x4f\x18\x3f", "QTQ", 18),  # eth / TiiQu's Q Token
-    (1, b"\x9a\x64\x2d\x6b\x33\x68\xdd\xc6\x62\xca\x24\x4b\xad\xf3\x2c\xda\x71\x60\x05\xbc", "QTUM", 18),  # eth / Qtum
-    (1, b"\x26\x4d\xc2\xde\xdc\xdc\xbb\x89\x75\x61\xa5\x7c\xba\x50\x85\xca\x41\x6f\xb7\xb4", "QUN", 18),  # eth / QunQun
-    (1, b"\x11\x83\xf9\x2a\x56\x24\xd6\x8e\x85\xff\xb9\x17\x0f\x16\xbf\x04\x43\xb4\xc2\x42", "QVT", 18),  # eth / QVT
-    (1, b"\x48\xf7\x75\xef\xbe\x4f\x5e\xce\x6e\x0d\xf2\xf7\xb5\x93\x2d\xf5\x68\x23\xb9\x90", "R", 0),  # eth / Revain
-    (1, b"\x45\xed\xb5\x35\x94\x2a\x8c\x84\xd9\xf4\xb5\xd3\x7e\x1b\x25\xf9\x1e\xa4\x80\x4c", "RAO", 18),  # eth / RadioYo
-    (1, b"\xe8\x66\x3a\x64\xa9\x61\x69\xff\x4d\x95\xb4\x29\x9e\x7a\xe9\xa7\x6b\x90\x5b\x31", "RATING", 8),  # eth / DPRating
-    (1, b"\xfc\x2c\x4d\x8f\x95\x00\x2c\x14\xed\x0a\x7a\xa6\x51\x02\xca\xc9\xe5\x95\x3b\x5e", "RBLX", 18),  # eth / Rublix
-    (1, b"\xf9\x70\xb8\xe3\x6e\x23\xf7\xfc\x3f\xd7\x52\xee\xa8\x6f\x8b\xe8\xd8\x33\x75\xa6", "RCN", 18),  # eth / Ripio Credit Network
-    (1, b"\x25\x5a\xa6\xdf\x07\x54\x0c\xb5\xd3\xd2\x97\xf0\xd0\xd4\xd8\x4c\xb5\x2b\xc8\xe6", "RDN", 18),  # eth / Raiden Network
-    (1, b"\x76\x7b\xa2\x91\x5e\xc3\x44\x01\x5a\x79\x38\xe3\xee\xdf\xec\x27\x85\x19\x5d\x05", "REA", 18),  # eth / Realisto
-    (1, b"\x92\x14\xec\x02\xcb\x71\xcb\xa0\xad\xa6\x89\x6b\x8d\xa2\x60\x73\x6a\x67\xab\x10", "REAL", 18),  # eth / Real Estate Asset Ledger
-    (1, b"\x5f\x53\xf7\xa8\x07\x56\x14\xb6\x99\xba\xad\x0b\xc2\xc8\x99\xf4\xba\xd8\xfb\xbf", "REBL", 18),  # eth / Rebellious
-    (1, b"\x76\x96\x0d\xcc\xd5\xa1\xfe\x79\x9f\x7c\x29\xbe\x9f\x19\xce\xb4\x62\x7a\xeb\x2f", "RED", 18),  # eth / Red Community Token
-    (1, b"\xb5\x63\x30\x0a\x3b\xac\x79\xfc\x09\xb9\x3b\x6f\x84\xce\x0d\x44\x65\xa2\xac\x27", "REDC", 18),  # eth / RedCab
-    (1, b"\x89\x30\x35\x00\xa7\xab\xfb\x17\x8b\x27\x4f\xd8\x9f\x24\x69\xc2\x64\x95\x1e\x1f", "REF", 8),  # eth / RefToken
-    (1, b"\x83\x98\x4d\x61\x42\x93\x4b\xb5\x35\x79\x3a\x82\xad\xb0\xa4\x6e\xf0\xf6\x6b\x6d", "REM", 4),  # eth / Remme
-    (1, b"\x13\xcb\x85\x82\x3f\x78\xcf\xf3\x8f\x0b\x0e\x90\xd3\xe9\x75\xb8\xcb\x3a\xad\x64", "REMI", 18),  # eth / REMI
-    (1, b"\x40\x8e\x41\x87\x6c\xcc\xdc\x0f\x92\x21\x06\x00\xef\x50\x37\x26\x56\x05\x2a\x38", "REN", 18),  # eth / Republic Token
-    (1, b"\x19\x85\x36\x5e\x9f\x78\x35\x9a\x9b\x6a\xd7\x60\xe3\x24\x12\xf4\xa4\x45\xe8\x62", "REP", 18),  # eth / Augur
-    (1, b"\xe9\x43\x27\xd0\x7f\xc1\x79\x07\xb4\xdb\x78\x8e\x5a\xdf\x2e\xd4\x24\xad\xdf\xf6", "[deprecated] REP", 18),  # eth / Augur
-    (1, b"\x8f\x82\x21\xaf\xbb\x33\x99\x8d\x85\x84\xa2\xb0\x57\x49\xba\x73\xc3\x7a\x93\x8a", "REQ", 18),  # eth / Request Network
-    (1, b"\xf0\x5a\x93\x82\xa4\xc3\xf2\x9e\x27\x84\x50\x27\x54\x29\x3d\x88\xb8\x35\x10\x9c", "REX", 18),  # eth / imbrex
-    (1, b"\xd0\x92\x9d\x41\x19\x54\xc4\x74\x38\xdc\x1d\x87\x1d\xd6\x08\x1f\x5c\x5e\x14\x9c", "RFR", 4),  # eth / Refereum
-    (1, b"\x4c\x38\x3b\xdc\xae\x52\xa6\xe1\xcb\x81\x0c\x76\xc7\x0d\x6f\x31\xa2\x49\xec\x9b", "RGS", 8),  # eth / Rusgas
-    (1, b"\x16\x82\x96\xbb\x09\xe2\x4a\x88\x80\x5c\xb9\xc3\x33\x56\x53\x6b\x98\x0d\x3f\xc5", "RHOC", 8),  # eth / RChain
-    (1, b"\xdd\x00\x72\x78\xb6\x67\xf6\xbe\xf5\x2f\xd0\xa4\xc2\x36\x04\xaa\x1f\x96\x03\x9a", "RIPT", 8),  # eth / RiptideCoin
-    (1, b"\x0b\x17\x24\xcc\x9f\xda\x01\x86\x91\x1e\xf6\xa7\x59\x49\xe9\xc0\xd3\xf0\xf2\xf3", "RIYA", 8),  # eth / Etheriya
-    (1, b"\x10\x6a\xa4\x92\x95\xb5\x25\xfc\xf9\x59\xaa\x75\xec\x3f\x7d\xcb\xf5\x35\x2f\x1c", "RKT", 18),  # eth / Rock
-    (1, b"\x60\x7f\x4c\x5b\xb6\x72\x23\x0e\x86\x72\x08\x55\x32\xf7\xe9\x01\x54\x4a\x73\x75", "RLC", 9),  # eth / IEx.ec
-    (1, b"\xcc\xed\x5b\x82\x88\x08\x6b\xe8\xc3\x8e\x23\x56\x7e\x68\x4c\x37\x40\xbe\x4d\x48", "RLT", 10),  # eth / RouletteToken
-    (1, b"\xbe\x99\xb0\x97\x09\xfc\x75\x3b\x09\xbc\xf5\x57\xa9\x92\xf6\x60\x5d\x59\x97\xb0", "RLTY", 8),  # eth / SMARTRealty
-    (1, b"\x4a\x42\xd2\xc5\x80\xf8\x3d\xce\x40\x4a\xca\xd1\x8d\xab\x26\xdb\x11\xa1\x75\x0e", "RLX", 18),  # eth / Relex
-    (1, b"\x7d\xc4\xf4\x12\x94\x69\x7a\x79\x03\xc4\x02\x7f\x6a\xc5\x28\xc5\xd1\x4c\xd7\xeb", "RMC", 8),  # eth / RemiCoin
-    (1, b"\x8d\x56\x82\x94\x1c\xe4\x56\x90\x0b\x12\xd4\x7a\xc0\x6a\x88\xb4\x7c\x76\x4c\xe1", "RMESH", 18),  # eth / RightMesh Token
-    (1, b"\x09\x96\xbf\xb5\xd0\x57\xfa\xa2\x37\x64\x0e\x25\x06\xbe\x7b\x4f\x9c\x46\xde\x0b", "RNDR", 18),  # eth / Render Token
-    (1, b"\xff\x60\x3f\x43\x94\x6a\x3a\x28\xdf\x5e\x6a\x73\x17\x25\x55\xd8\xc8\xb0\x23\x86", "RNT", 18),  # eth / OneRoot Network
-    (1, b"\x1f\xe7\x0b\xe7\x34\xe4\x73\xe5\x72\x1e\xa5\x7c\x8b\x5b\x01\xe6\xca\xa5\x26\x86", "RNTB", 18),  # eth / BitRent
-    (1, b"\x1b\xcb\xc5\x41\x66\xf6\xba\x14\x99\x34\x87\x0b\x60\x50\x61\x99\xb6\xc9\xdb\x6d", "ROC", 10),  # eth / ROC
-    (1, b"\xa4\x01\x06\x13\x4c\x5b\xf4\xc4\x14\x11\x55\x4e\x6d\xb9\x9b\x95\xa1\x5e\xd9\xd8", "ROCK", 18),  # eth / Rocket Token
-    (1, b"\xc1\x6b\x54\x2f\xf4\x90\xe0\x1f\xcc\x0d\xc5\x8a\x60\xe1\xef\xdc\x3e\x35\x7c\xa6", "ROCK2", 0),  # eth / ICE ROCK MINING
-    (1, b"\x0e\x3d\xe3\xb0\xe3\xd6\x17\xfd\x8d\x1d\x80\x88\x63\x9b\xa8\x77\xfe\xb4\xd7\x42", "ROCK2PAY", 18),  # eth / ICE ROCK MINING
-    (1, b"\xc9\xde\x4b\x7f\x0c\x3d\x99\x1e\x96\x71\x58\xe4\xd4\xbf\xa4\xb5\x1e\xc0\xb1\x14", "ROK", 18),  # eth / Rocketchain
-    (1, b"\x49\x93\xcb\x95\xc7\x44\x3b\xdc\x06\x15\x5c\x5f\x56\x88\xbe\x9d\x8f\x69\x99\xa5", "ROUND", 18),  # eth / ROUND
-    (1, b"\xb4\xef\xd8\x5c\x19\x99\x9d\x84\x25\x13\x04\xbd\xa9\x9e\x90\xb9\x23\x00\xbd\x93", "RPL", 18),  # eth / Rocket Pool
-    (1, b"\xec\x49\x1c\x10\x88\xea\xe9\x92\xb7\xa2\x14\xef\xb0\xa2\x66\xad\x09\x27\xa7\x2a", "RTB", 18),  # eth / AB-Chain RTB
-    (1, b"\x3f\xd8\xf3\x9a\x96\x2e\xfd\xa0\x49\x56\x98\x1c\x31\xab\x89\xfa\xb5\xfb\x8b\xc8", "RTH", 18),  # eth / Rotharium
-    (1, b"\x54\xb2\x93\x22\x60\x00\xcc\xbf\xc0\x4d\xf9\x02\xee\xc5\x67\xcb\x4c\x35\xa9\x03", "RTN", 18),  # eth / RiderToken
-    (1, b"\xf2\x78\xc1\xca\x96\x90\x95\xff\xdd\xde\xd0\x20\x29\x0c\xf8\xb5\xc4\x24\xac\xe2", "RUFF", 18),  # eth / Ruff
-    (1, b"\xde\xe0\x2d\x94\xbe\x49\x29\xd2\x6f\x67\xb6\x4a\xda\x7a\xcf\x19\x14\x00\x7f\x10", "RUNE", 18),  # eth / Rune
-    (1, b"\x41\xf6\x15\xe2\x4f\xab\xd2\xb0\x97\xa3\x20\xe9\xe6\xc1\xf4\x48\xcb\x40\x52\x1c", "RVL", 18),  # eth / RVL
-    (1, b"\x3d\x1b\xa9\xbe\x9f\x66\xb8\xee\x10\x19\x11\xbc\x36\xd3\xfb\x56\x2e\xac\x22\x44", "RVT", 18),  # eth / Rivetz
-    (1, b"\x1e\xc8\xfe\x51\xa9\xb6\xa3\xa6\xc4\x27\xd1\x7d\x9e\xcc\x30\x60\xfb\xc4\xa4\x5c", "S-A-PAT", 18),  # eth / S-A-PAT
-    (1, b"\x3e\xb9\x1d\x23\x7e\x49\x1e\x0d\xee\x85\x82\xc4\x02\xd8\x5c\xb4\x40\xfb\x6b\x54", "S-ETH", 18),  # eth / S-ETH
-    (1, b"\xab\xc1\x28\x0a\x01\x87\xa2\x02\x0c\xc6\x75\x43\x7a\xed\x40\x01\x85\xf8\x6d\xb6", "SAC", 18),  # eth / Smart Application Chain
-    (1, b"\x41\x56\xd3\x34\x2d\x5c\x38\x5a\x87\xd2\x64\xf9\x06\x53\x73\x35\x92\x00\x05\x81", "SALT", 8),  # eth / Salt Lending Token
-    (1, b"\x7c\x5a\x0c\xe9\x26\x7e\xd1\x9b\x22\xf8\xca\xe6\x53\xf1\x98\xe3\xe8\xda\xf0\x98", "SAN", 18),  # eth / Santiment
-    (1, b"\x78\xfe\x18\xe4\x1f\x43\x6e\x19\x81\xa3\xa6\x0d\x15\x57\xc8\xa7\xa9\x37\x04\x61", "SCANDI", 2),  # eth / Scandiweb Coin
-    (1, b"\xd7\x63\x17\x87\xb4\xdc\xc8\x7b\x12\x54\xcf\xd1\xe5\xce\x48\xe9\x68\x23\xde\xe8", "SCL", 8),  # eth / SocialCoin
-    (1, b"\x24\xdc\xc8\x81\xe7\xdd\x73\x05\x46\x83\x44\x52\xf2\x18\x72\xd5\xcb\x4b\x52\x93", "SCRL", 18),  # eth / SCRL
-    (1, b"\xb1\xee\xf1\x47\x02\x8e\x9f\x48\x0d\xbc\x5c\xca\xa3\x27\x7d\x41\x7d\x1b\x85\xf0", "SEELE", 18),  # eth / Seele
-    (1, b"\xa1\x3f\x07\x43\x95\x1b\x4f\x6e\x3e\x3a\xa0\x39\xf6\x82\xe1\x72\x79\xf5\x2b\xc3", "SENC", 18),  # eth / Sentinel Chain
-    (1, b"\x4c\xa7\x41\x85\x53\x2d\xc1\x78\x95\x27\x19\x4e\x5b\x9c\x86\x6d\xd3\x3f\x4e\x82", "SenSatorI", 18),  # eth / SenSatorI Token
-    (1, b"\x67\x45\xfa\xb6\x80\x1e\x37\x6c\xd2\x4f\x03\x57\x2b\x9c\x9b\x0d\x4e\xdd\xdc\xcf", "SENSE", 8),  # eth / Sensay
-    (1, b"\xa4\x4e\x51\x37\x29\x3e\x85\x5b\x1b\x7b\xc7\xe2\xc6\xf8\xcd\x79\x6f\xfc\xb0\x37", "SENT", 8),  # eth / SENTinel
-    (1, b"\xe0\x6e\xda\x74\x35\xba\x74\x9b\x04\x73\x80\xce\xd4\x91\x21\xdd\xe9\x33\x34\xae", "SET", 0),  # eth / SET
-    (1, b"\x98\xf5\xe9\xb7\xf0\xe3\x39\x56\xc0\x44\x3e\x81\xbf\x7d\xeb\x8b\x5b\x1e\xd5\x45", "SEXY", 18),  # eth / Sexy Token
-    (1, b"\xa1\xcc\xc1\x66\xfa\xf0\xe9\x98\xb3\xe3\x32\x25\xa1\xa0\x30\x1b\x1c\x86\x11\x9d", "SGEL", 18),  # eth / SGELDER
-    (1, b"\xb2\x13\x5a\xb9\x69\x5a\x76\x78\xdd\x59\x0b\x1a\x99\x6c\xb0\xf3\x7b\xcb\x07\x18", "SGN", 9),  # eth / Signals Network
-    (1, b"\x33\xc6\x23\xa2\xba\xaf\xeb\x8d\x15\xdf\xaf\x3c\xe4\x40\x95\xef\xec\x83\xd7\x2c", "SGP", 18),  # eth / SGPay
-    (1, b"\xcb\x5a\x05\xbe\xf3\x25\x76\x13\xe9\x84\xc1\x7d\xbc\xf0\x39\x95\x2b\x6d\x88\x3f", "SGR", 8),  # eth / Sugar Exchange
-    (1, b"\xe2\x5b\x0b\xba\x01\xdc\x56\x30\x31\x2b\x6a\x21\x92\x7e\x57\x80\x61\xa1\x3f\x55", "SHIP", 18),  # eth / ShipChain
-    (1, b"\xef\x2e\x99\x66\xeb\x61\xbb\x49\x4e\x53\x75\xd5\xdf\x8d\x67\xb7\xdb\x8a\x78\x0d", "SHIT", 0),  # eth / SHIT
-    (1, b"\x85\x42\x32\x5b\x72\xc6\xd9\xfc\x0a\xd2\xca\x96\x5a\x78\x43\x54\x13\xa9\x15\xa0", "SHL", 18),  # eth / Oyster Shell
-    (1, b"\xef\x24\x63\x09\x93\x60\xa0\x85\xf1\xf1\x0b\x07\x6e\xd7\x2e\xf6\x25\x49\x7a\x06", "SHP", 18),  # eth / Sharpe Platform Token
-    (1, b"\x8a\x18\x7d\x52\x85\xd3\x16\xbc\xbc\x9a\xda\xfc\x08\xb5\x1d\x70\xa0\xd8\xe0\x00", "SIFT", 0),  # eth / SIFT
-    (1, b"\x68\x88\xa1\x6e\xa9\x79\x2c\x15\xa4\xdc\xf2\xf6\xc6\x23\xd0\x55\xc8\xed\xe7\x92", "SIG", 18),  # eth / Signal
-    (1, b"\x4a\xf3\x28\xc5\x29\x21\x70\x6d\xcb\x73\x9f\x25\x78\x62\x10\x49\x91\x69\xaf\xe6", "SKB", 8),  # eth / Sakura Bloom
-    (1, b"\x13\xdb\x74\xb3\xcf\x51\x2f\x65\xc4\xb9\x16\x83\x94\x0b\x4f\x39\x55\xe0\x50\x85", "SKE", 8),  # eth / Super Keep Token
-    (1, b"\x2b\xdc\x0d\x42\x99\x60\x17\xfc\xe2\x14\xb2\x16\x07\xa5\x15\xda\x41\xa9\xe0\xc5", "SKIN", 6),  # eth / SKIN
-    (1, b"\xd9\x9b\x8a\x7f\xa4\x8e\x25\xcc\xe8\x3b\x81\x81\x22\x20\xa3\xe0\x3b\xf6\x4e\x5f", "SKM", 18),  # eth / Skrumble Network
-    (1, b"\x49\x94\xe8\x18\x97\xa9\x20\xc0\xfe\xa2\x35\xeb\x8c\xed\xee\xd3\xc6\xff\xf6\x97", "SKO1", 18),  # eth / Sikoba
-    (1, b"\x4c\x38\x2f\x8e\x09\x61\x5a\xc8\x6e\x08\xce\x58\x26\x6c\xc2\x27\xe7\xd4\xd9\x13", "SKR", 6),  # eth / SKR Token
-    (1, b"\x72\x97\x86\x2b\x96\x70\xff\x01\x51\x92\x79\x9c\xc8\x49\x72\x6c\x88\xbf\x1d\x77", "SKYM", 18),  # eth / Skymap Token
-    (1, b"\x7a\x5f\xf2\x95\xdc\x82\x39\xd5\xc2\x37\x4e\x4d\x89\x42\x02\xaa\xf0\x29\xca\xb6", "SLT", 3),  # eth / Smartlands
-    (1, b"\x79\x28\xc8\xab\xf1\xf7\x4e\xf9\xf9\x6d\x4d\x0a\x44\xe3\xb4\x20\x9d\x36\x07\x85", "SLY", 18),  # eth / Selfllery
-    (1, b"\x39\x01\x3f\x96\x1c\x37\x8f\x02\xc2\xb8\x2a\x6e\x1d\x31\xe9\x81\x27\x86\xfd\x9d", "SMS", 3),  # eth / Speed Mining Service
-    (1, b"\x19\x8a\x87\xb3\x11\x41\x43\x91\x3d\x42\x29\xfb\x0f\x6d\x4b\xcb\x44\xaa\x8a\xff", "SNBL", 8),  # eth / Snowball
-    (1, b"\xf4\x13\x41\x46\xaf\x2d\x51\x1d\xd5\xea\x8c\xdb\x1c\x4a\xc8\x8c\x57\xd6\x04\x04", "SNC", 18),  # eth / SunContract
-    (1, b"\xf3\x33\xb2\xac\xe9\x92\xac\x2b\xbd\x87\x98\xbf\x57\xbc\x65\xa0\x61\x84\xaf\xba", "SND", 0),  # eth / Sandcoin
-    (1, b"\xcf\xd6\xae\x8b\xf1\x3f\x42\xde\x14\x86\x73\x51\xea\xff\x7a\x8a\x3b\x9f\xbb\xe7", "SNG", 8),  # eth / SINERGIA
-    (1, b"\xae\xc2\xe8\x7e\x0a\x23\x52\x66\xd9\xc5\xad\xc9\xde\xb4\xb2\xe2\x9b\x54\xd0\x09", "SNGLS", 0),  # eth / SingularDTV
-    (1, b"\x44\xf5\x88\xae\xeb\x8c\x44\x47\x14\x39\xd1\x27\x0b\x36\x03\xc6\x6a\x92\x62\xf1", "SNIP", 18),  # eth / SNIP
-    (1, b"\x98\x3f\x6d\x60\xdb\x79\xea\x8c\xa4\xeb\x99\x68\xc6\xaf\xf8\xcf\xa0\x4b\x3c\x63", "SNM", 18),  # eth / SONM
-    (1, b"\xbd\xc5\xba\xc3\x9d\xbe\x13\x2b\x1e\x03\x0e\x89\x8a\xe3\x83\x00\x17\xd7\xd9\x69", "SNOV", 18),  # eth / Snovian.Space
-    (1, b"\x74\x4d\x70\xfd\xbe\x2b\xa4\xcf\x95\x13\x16\x26\x61\x4a\x17\x63\xdf\x80\x5b\x9e", "SNT", 18),  # eth / Status Network Token
-    (1, b"\x28\x59\x02\x1e\xe7\xf2\xcb\x10\x16\x2e\x67\xf3\x3a\xf2\xd2\x27\x64\xb3\x1a\xff", "SNTR", 4),  # eth / Silent Notary
-    (1, b"\xc0\x11\xa7\x24\x00\xe5\x8e\xcd\x99\xee\x49\x7c\xf8\x9e\x37\x75\xd4\xbd\x73\x2f", "SNX", 18),  # eth / Synthetix Network Token
-    (1, b"\xd6\x59\x60\xfa\xcb\x8e\x4a\x2d\xfc\xb2\xc2\x21\x2c\xb2\xe4\x4a\x02\xe2\xa5\x7e", "SOAR", 6),  # eth / Soarcoin
-    (1, b"\x2d\x0e\x95\xbd\x47\x95\xd7\xac\xe0\xda\x3c\x0f\xf7\xb7\x06\xa5\x97\x0e\xb9\xd3", "SOC", 18),  # eth / All Sports
-    (1, b"\x1f\x54\x63\x8b\x77\x37\x19\x3f\xfd\x86\xc1\x9e\xc5\x19\x07\xa7\xc4\x17\x55\xd8", "SOL", 6),  # eth / Sola Token
-    (1, b"\x1c\x62\xac\xa2\xb7\x60\x5d\xb3\x60\x6e\xac\xda\x7b\xc6\x7a\x18\x57\xdd\xb8\xff", "SONIQ", 18),  # eth / Soniq
-    (1, b"\xbb\x1f\x24\xc0\xc1\x55\x4b\x99\x90\x22\x2f\x03\x6b\x0a\xad\x6e\xe4\xca\xec\x29", "SOUL", 18),  # eth / CryptoSoul
-    (1, b"\x42\xd6\x62\x2d\xec\xe3\x94\xb5\x49\x99\xfb\xd7\x3d\x10\x81\x23\x80\x6f\x6a\x18", "SPANK", 18),  # eth / SpankChain
-    (1, b"\x58\xbf\x7d\xf5\x7d\x9d\xa7\x11\x3c\x4c\xcb\x49\xd8\x46\x3d\x49\x08\xc7\x35\xcb", "SPARC", 18),  # eth / SPARC
-    (1, b"\x24\xae\xf3\xbf\x1a\x47\x56\x15\x00\xf9\x43\x0d\x74\xed\x40\x97\xc4\x7f\x51\xf2", "SPARTA", 4),  # eth / SPARTA
-    (1, b"\x1d\xea\x97\x9a\xe7\x6f\x26\x07\x18\x70\xf8\x24\x08\x8d\xa7\x89\x79\xeb\x91\xc8", "SPD", 18),  # eth / SPINDLE
-    (1, b"\x85\x08\x93\x89\xc1\x4b\xd9\xc7\x7f\xc2\xb8\xf0\xc3\xd1\xdc\x33\x63\xbf\x06\xef", "SPF", 18),  # eth / Sportify
-    (1, b"\x38\x33\xdd\xa0\xae\xb6\x94\x7b\x98\xce\x45\x4d\x89\x36\x6c\xba\x8c\xc5\x55\x28", "SPHTX", 18),  # eth / SPHTX
-    (1, b"\x03\x24\xdd\x19\x5d\x0c\xd5\x3f\x9f\x07\xbe\xe6\xa4\x8e\xe7\xa2\x0b\xad\x73\x8f", "SPICE", 8),  # eth / SPiCE VC Token
-    (1, b"\x20\xf7\xa3\xdd\xf2\x44\xdc\x92\x99\x97\x5b\x4d\xa1\xc3\x9f\x8d\x5d\x75\xf0\x5a", "SPN", 6),  # eth / Sapien
-    (1, b"\x05\xaa\xaa\x82\x9a\xfa\x40\x7d\x83\x31\x5c\xde\xd1\xd4\x5e\xb1\x60\x25\x91\x0c", "SPX", 18),  # eth / Sp8de
-    (1, b"\x68\xd5\x7c\x9a\x1c\x35\xf6\x3e\x2c\x83\xee\x8e\x49\xa6\x4e\x9d\x70\x52\x8d\x25", "SRN", 18),  # eth / Sirin Labs
-    (1, b"\x6e\x20\x50\xcb\xfb\x3e\xd8\xa4\xd3\x9b\x64\xcc\x9f\x47\xe7\x11\xa0\x3a\x5a\x89", "SSH", 18),  # eth / StreamShares
-    (1, b"\x62\x4d\x52\x0b\xab\x2e\x4a\xd8\x39\x35\xfa\x50\x3f\xb1\x30\x61\x43\x74\xe8\x50", "SSP", 4),  # eth / Smartshare
-    (1, b"\x4a\x89\xcd\x48\x6f\xa9\x96\xad\x50\xc0\xa6\x3c\x35\xc7\x87\x02\xf5\x42\x2a\x50", "STABIT", 3),  # eth / StabitCoin
-    (1, b"\x9a\x00\x5c\x9a\x89\xbd\x72\xa4\xbd\x27\x72\x1e\x7a\x09\xa3\xc1\x1d\x2b\x03\xc4", "STAC", 18),  # eth / Starter Coin
-    (1, b"\x28\x67\x08\xf0\x69\x22\x59\x05\x19\x46\x73\x75\x5f\x12\x35\x9e\x6a\xff\x6f\xe1", "STACS", 18),  # eth / STACS
-    (1, b"\xf7\x0a\x64\x2b\xd3\x87\xf9\x43\x80\xff\xb9\x04\x51\xc2\xc8\x1d\x4e\xb8\x2c\xbc", "STAR", 18),  # eth / Star Token
-    (1, b"\x09\xbc\xa6\xeb\xab\x05\xee\x2a\xe9\x45\xbe\x4e\xda\x51\x39\x3d\x94\xbf\x7b\x99", "STB", 4),  # eth / STABLE Token
-    (1, b"\x62\x9a\xee\x55\xed\x49\x58\x1c\x33\xab\x27\xf9\x40\x3f\x79\x92\xa2\x89\xff\xd5", "STC", 18),  # eth / StrikeCoin Token
-    (1, b"\xae\x73\xb3\x8d\x1c\x9a\x8b\x27\x41\x27\xec\x30\x16\x0a\x49\x27\xc4\xd7\x18\x24", "STK", 18),  # eth / STK Token
-    (1, b"\x59\x93\x46\x77\x9e\x90\xfc\x3f\x5f\x99\x7b\x5e\xa7\x15\x34\x98\x20\xf9\x15\x71", "STN", 4),  # eth / Saturn Network
-    (1, b"\xb6\x4e\xf5\x1c\x88\x89\x72\xc9\x08\xcf\xac\xf5\x9b\x47\xc1\xaf\xbc\x0a\xb8\xac", "STORJ", 8),  # eth / STORJ
-    (1, b"\xd0\xa4\xb8\x94\x6c\xb5\x2f\x06\x61\x27\x3b\xfb\xc6\xfd\x0e\x0c\x75\xfc\x64\x33", "STORM", 18),  # eth / Storm Token
-    (1, b"\xec\xd5\x70\xbb\xf7\x47\x61\xb9\x60\xfa\x04\xcc\x10\xfe\x2c\x4e\x86\xff\xda\x36", "STP", 8),  # eth / StashPay
-    (1, b"\x5c\x3a\x22\x85\x10\xd2\x46\xb7\x8a\x37\x65\xc2\x02\x21\xcb\xf3\x08\x2b\x44\xa4", "STQ", 18),  # eth / Storiqa
-    (1, b"\xba\xe2\x35\x82\x3d\x72\x55\xd9\xd4\x86\x35\xce\xd4\x73\x52\x27\x24\x4c\xd5\x83", "STR", 18),  # eth / Staker
-    (1, b"\x46\x49\x24\x73\x75\x5e\x8d\xf9\x60\xf8\x03\x48\x77\xf6\x17\x32\xd7\x18\xce\x96", "STRC", 8),  # eth / STRC
-    (1, b"\x03\x71\xa8\x2e\x4a\x9d\x0a\x43\x12\xf3\xee\x2a\xc9\xc6\x95\x85\x12\x89\x13\x72", "STU", 18),  # eth / bitJob
-    (1, b"\x00\x6b\xea\x43\xba\xa3\xf7\xa6\xf7\x65\xf1\x4f\x10\xa1\xa1\xb0\x83\x34\xef\x45", "STX", 18),  # eth / StoxToken
-    (1, b"\x12\x48\x0e\x24\xeb\x5b\xec\x1a\x9d\x43\x69\xca\xb6\xa8\x0c\xad\x3c\x0a\x37\x7a", "SUB", 2),  # eth / Substratum
-    (1, b"\xe1\x20\xc1\xec\xbf\xdf\xea\x7f\x0a\x8f\x0e\xe3\x00\x63\x49\x1e\x8c\x26\xfe\xdf", "SUR", 8),  # eth / Suretly
-    (1, b"\x57\xab\x1e\x02\xfe\xe2\x37\x74\x58\x0c\x11\x97\x40\x12\x9e\xac\x70\x81\xe9\xd3", "sUSD", 18),  # eth / USD Synth (sUSD)
-    (1, b"\xbd\xeb\x4b\x83\x25\x1f\xb1\x46\x68\x7f\xa1\x9d\x1c\x66\x0f\x99\x41\x1e\xef\xe3", "SVD", 18),  # eth / savedroid
-    (1, b"\x0b\xb2\x17\xe4\x0f\x8a\x5c\xb7\x9a\xdf\x04\xe1\xaa\xb6\x0e\x5a\xbd\x0d\xfc\x1e", "SWFTC", 8),  # eth / SwftCoin
-    (1, b"\x9e\x88\x61\x34\x18\xcf\x03\xdc\xa5\x4d\x6a\x2c\xf6\xad\x93\x4a\x78\xc7\xa1\x7a", "SWM", 18),  # eth / Swarm Fund Token
-    (1, b"\xb9\xe7\xf8\x56\x8e\x08\xd5\x65\x9f\x5d\x29\xc4\x99\x71\x73\xd8\x4c\xdf\x26\x07", "SWT", 18),  # eth / Swarm City Token
-    (1, b"\x12\xb3\x06\xfa\x98\xf4\xcb\xb8\xd4\x45\x7f\xdf\xf3\xa0\xa0\xa5\x6f\x07\xcc\xdf", "SXDT", 18),  # eth / Spectre.ai D-Token
-    (1, b"\x2c\x82\xc7\x3d\x5b\x34\xaa\x01\x59\x89\x46\x2b\x29\x48\xcd\x61\x6a\x37\x64\x1f", "SXUT", 18),  # eth / Spectre.ai U-Token
-    (1, b"\x10\xb1\x23\xfd\xdd\xe0\x03\x24\x31\x99\xaa\xd0\x35\x22\x06\x5d\xc0\x58\x27\xa0", "SYN", 18),  # eth / Synapse
-    (1, b"\xe7\x77\x5a\x6e\x9b\xcf\x90\x4e\xb3\x9d\xa2\xb6\x8c\x5e\xfb\x4f\x93\x60\xe0\x8c", "TaaS", 6),  # eth / Token-as-a-Service
-    (1, b"\x1d\x4c\xcc\x31\xda\xb6\xea\x20\xf4\x61\xd3\x29\xa0\x56\x2c\x1c\x58\x41\x25\x15", "TALAO", 18),  # eth / Talao
-    (1, b"\xc2\x7a\x2f\x05\xfa\x57\x7a\x83\xba\x0f\xdb\x4c\x38\x44\x3c\x07\x18\x35\x65\x01", "TAU", 18),  # eth / Lamden Tau
-    (1, b"\xfa\xcc\xd5\xfc\x83\xc3\xe4\xc3\xc1\xac\x1e\xf3\x5d\x15\xad\xf0\x6b\xcf\x20\x9c", "TBC2", 8),  # eth / TBC2
-    (1, b"\xaf\xe6\x05\x11\x34\x1a\x37\x48\x8d\xe2\x5b\xef\x35\x19\x52\x56\x2e\x31\xfc\xc1", "TBT", 8),  # eth / TBitBot
-    (1, b"\x3a\x92\xbd\x39\x6a\xef\x82\xaf\x98\xeb\xc0\xaa\x90\x30\xd2\x5a\x23\xb1\x1c\x6b", "TBX", 18),  # eth / Tokenbox
-    (1, b"\xfa\x0e\xf5\xe0\x34\xca\xe1\xae\x75\x2d\x59\xbd\xb8\xad\xcd\xe3\x7e\xd7\xab\x97", "TCA", 18),  # eth / TangguoTao Token
-    (1, b"\x99\x72\xa0\xf2\x41\x94\x44\x7e\x73\xa7\xe8\xb6\xcd\x26\xa5\x2e\x02\xdd\xfa\xd5", "TCH", 0),  # eth / Thore Cash
-    (1, b"\x2a\x1d\xba\xbe\x65\xc5\x95\xb0\x02\x2e\x75\x20\x8c\x34\x01\x41\x39\xd5\xd3\x57", "TDH", 18),  # eth / TrustedHealth
-    (1, b"\x1c\x79\xab\x32\xc6\x6a\xca\xa1\xe9\xe8\x19\x52\xb8\xaa\xa5\x81\xb4\x3e\x54\xe7", "TEAM", 4),  # eth / TEAM (TokenStars)
-    (1, b"\xdd\x16\xec\x0f\x66\xe5\x4d\x45\x3e\x67\x56\x71\x3e\x53\x33\x55\x98\x90\x40\xe4", "TEN", 18),  # eth / Tokenomy
-    (1, b"\xe5\xf1\x66\xc0\xd8\x87\x2b\x68\x79\x00\x61\x31\x7b\xb6\xcc\xa0\x45\x82\xc9\x12", "TFD", 18),  # eth / TE-FOOD
-    (1, b"\xa7\xf9\x76\xc3\x60\xeb\xbe\xd4\x46\x5c\x28\x55\x68\x4d\x1a\xae\x52\x71\xef\xa9", "TFL", 8),  # eth / TrueFlip
-    (1, b"\xf8\xe0\x6e\x4e\x4a\x80\x28\x7f\xdc\xa5\xb0\x2d\xcc\xec\xaa\x9d\x09\x54\x84\x0f", "TGAME", 18),  # eth / Truegame
-    (1, b"\xac\x3d\xa5\x87\xea\xc2\x29\xc9\x89\x6d\x91\x9a\xbc\x23\x5c\xa4\xfd\x7f\x72\xc1", "TGT", 1),  # eth / Target Coin
-    (1, b"\x38\x83\xf5\xe1\x81\xfc\xca\xf8\x41\x0f\xa6\x1e\x12\xb5\x9b\xad\x96\x3f\xb6\x45", "THETA", 18),  # eth / Theta Token
-    (1, b"\x1c\xb3\x20\x9d\x45\xb2\xa6\x0b\x7f\xbc\xa1\xcc\xdb\xf8\x7f\x67\x42\x37\xa4\xaa", "THR", 4),  # eth / ThoreCoin
-    (1, b"\x4f\x27\x05\x3f\x32\xed\xa8\xaf\x84\x95\x64\x37\xbc\x00\xe5\xff\xa7\x00\x32\x87", "THRT", 18),  # eth / Thrive Token
-    (1, b"\xfe\x7b\x91\x5a\x0b\xaa\x0e\x79\xf8\x5c\x55\x53\x26\x65\x13\xf7\xc1\xc0\x3e\xd0", "THUG", 18),  # eth / THUG
-    (1, b"\x99\x99\x67\xe2\xec\x8a\x74\xb7\xc8\xe9\xdb\x19\xe0\x39\xd9\x20\xb3\x1d\x39\xd0", "TIE", 18),  # eth / Ties.DB
-    (1, b"\xee\xe2\xd0\x0e\xb7\xde\xb8\xdd\x69\x24\x18\x7f\x5a\xa3\x49\x6b\x7d\x06\xe6\x2a", "TIG", 18),  # eth / Tigereum
-    (1, b"\x65\x31\xf1\x33\xe6\xde\xeb\xe7\xf2\xdc\xe5\xa0\x44\x1a\xa7\xef\x33\x0b\x4e\x53", "TIME", 8),  # eth / Chronobank
-    (1, b"\x80\xbc\x55\x12\x56\x1c\x7f\x85\xa3\xa9\x50\x8c\x7d\xf7\x90\x1b\x37\x0f\xa1\xdf", "TIO", 18),  # eth / TIO
-    (1, b"\xea\x1f\x34\x6f\xaf\x02\x3f\x97\x4e\xb5\xad\xaf\x08\x8b\xbc\xdf\x02\xd7\x61\xf4", "TIX", 18),  # eth / Blocktix
-    (1, b"\xda\xe1\xba\xf2\x49\x96\x4b\xc4\xb6\xac\x98\xc3\x12\x2f\x0e\x3e\x78\x5f\xd2\x79", "TKA", 18),  # eth / Tokia
-    (1, b"\x06\x75\xda\xa9\x47\x25\xa5\x28\xb0\x5a\x3a\x88\x63\x5c\x03\xea\x96\x4b\xfa\x7e", "TKLN", 18),  # eth / Taklimakan Network
-    (1, b"\xaa\xaf\x91\xd9\xb9\x0d\xf8\x00\xdf\x4f\x55\xc2\x05\xfd\x69\x89\xc9\x77\xe7\x3a", "TKN", 8),  # eth / TokenCard
-    (1, b"\xb4\x5a\x50\x54\x5b\xee\xab\x73\xf3\x8f\x31\xe5\x97\x37\x68\xc4\x21\x80\x5e\x5e", "TKR", 18),  # eth / TKRToken
-    (1, b"\xb3\x61\x65\x50\xab\xc8\xaf\x79\xc7\xa5\x90\x2d\xef\x9e\xfa\x3b\xc9\xa9\x52\x00", "TLX", 8),  # eth / Telex
-    (1, b"\x32\x09\xf9\x8b\xeb\xf0\x14\x9b\x76\x9c\xe2\x6d\x71\xf7\xae\xa8\xe4\x35\xef\xea", "TMT", 18),  # eth / TRAXIA
-    (1, b"\xb0\x28\x07\x43\xb4\x4b\xf7\xdb\x4b\x6b\xe4\x82\xb2\xba\x7b\x75\xe5\xda\x09\x6c", "TNS", 18),  # eth / Transcodium
-    (1, b"\x08\xf5\xa9\x23\x5b\x08\x17\x3b\x75\x69\xf8\x36\x45\xd2\xc7\xfb\x55\xe8\xcc\xd8", "TNT", 8),  # eth / Tierion Network Token
-    (1, b"\x9a\x49\xf0\x2e\x12\x8a\x8e\x98\x9b\x44\x3a\x8f\x94\x84\x3c\x09\x18\xbf\x45\xe7", "TOK", 8),  # eth / TOKOK
-    (1, b"\x8b\x35\x30\x21\x18\x93\x75\x59\x17\x23\xe7\x38\x42\x62\xf4\x57\x09\xa3\xc3\xdc", "TOMO", 18),  # eth / Tomocoin
-    (1, b"\x8e\xb9\x65\xee\x9c\xcf\xbc\xe7\x6c\x0a\x06\x26\x44\x92\xc0\xaf\xef\xc2\x82\x6d", "TOOR", 18),  # eth / ToorCoin
-    (1, b"\xaa\x7a\x9c\xa8\x7d\x36\x94\xb5\x75\x5f\x21\x3b\x5d\x04\x09\x4b\x8d\x0f\x0a\x6f", "TRAC", 18),  # eth / OriginTrail
-    (1, b"\x12\x75\x95\x12\xd3\x26\x30\x3b\x45\xf1\xce\xc8\xf7\xb6\xfd\x96\xf3\x87\x77\x8e", "TRAK", 18),  # eth / TrakInvest
-    (1, b"\x56\x6f\xd7\x99\x9b\x1f\xc3\x98\x80\x22\xbd\x38\x50\x7a\x48\xf0\xbc\xf2\x2c\x77", "TRCN", 18),  # eth / The Real Coin
-    (1, b"\x30\xce\xcb\x54\x61\xa4\x49\xa9\x00\x81\xf5\xa5\xf5\x5d\xb4\xe0\x48\x39\x7b\xab", "TRCT", 8),  # eth / Tracto
-    (1, b"\x33\xf9\x0d\xee\x07\xc6\xe8\xb9\x68\x2d\xd2\x0f\x73\xe6\xc3\x58\xb2\xed\x0f\x03", "TRDT", 0),  # eth / Trident Group
-    (1, b"\xcb\x94\xbe\x6f\x13\xa1\x18\x2e\x4a\x4b\x61\x40\xcb\x7b\xf2\x02\x5d\x28\xe4\x1b", "TRST", 6),  # eth / WeTrust
-    (1, b"\x6b\x87\x99\x9b\xe8\x73\x58\x06\x5b\xbd\xe4\x1e\x8a\x0f\xe0\xb7\xb1\xcd\x25\x14", "TSW", 18),  # eth / TeslaWatt
-    (1, b"\xaa\xb6\x06\x81\x78\x09\x84\x1e\x8b\x11\x68\xbe\x87\x79\xee\xaf\x67\x44\xef\x64", "TTA", 18),  # eth / Tend Token
-    (1, b"\x93\x89\x43\x48\x52\xb9\x4b\xba\xd4\xc8\xaf\xed\x5b\x7b\xdb\xc5\xff\x0c\x22\x75", "TTC", 18),  # eth / TTC Protocol
-    (1, b"\x9c\xda\x8a\x60\xdd\x5a\xfa\x15\x6c\x95\xbd\x97\x44\x28\xd9\x1a\x08\x12\xe0\x54", "TTU", 18),  # eth / TaTaTu
-    (1, b"\x00\x00\x00\x00\x00\x08\x5d\x47\x80\xb7\x31\x19\xb6\x44\xae\x5e\xcd\x22\xb3\x76", "TUSD", 18),  # eth / TrueUSD
-    (1, b"\x8d\xd5\xfb\xce\x2f\x6a\x95\x6c\x30\x22\xba\x36\x63\x75\x90\x11\xdd\x51\xe7\x3e", "[deprecated] TUSD", 18),  # eth / TrueUSD
-    (1, b"\x2e\xf1\xab\x8a\x26\x18\x7c\x58\xbb\x8a\xae\xb1\x1b\x2f\xc6\xd2\x5c\x5c\x07\x16", "TWN", 18),  # eth / The World News
-    (1, b"\xfb\xd0\xd1\xc7\x7b\x50\x17\x96\xa3\x5d\x86\xcf\x91\xd6\x5d\x97\x78\xee\xe6\x95", "TWNKL", 3),  # eth / Twinkle
-    (1, b"\x84\x00\xd9\x4a\x5c\xb0\xfa\x0d\x04\x1a\x37\x88\xe3\x95\x28\x5d\x61\xc9\xee\x5e", "UBT", 8),  # eth / Unibright
-    (1, b"\x92\xe5\x2a\x1a\x23\x5d\x9a\x10\x3d\x97\x09\x01\x06\x6c\xe9\x10\xaa\xce\xfd\x37", "UCASH", 8),  # eth / U.CASH
-    (1, b"\xaa\xf3\x70\x55\x18\x8f\xee\xe4\x86\x9d\xe6\x34\x64\x93\x7e\x68\x3d\x61\xb2\xa1", "UCN", 18),  # eth / UChain
-    (1, b"\xea\x09\x7a\x2b\x1d\xb0\x06\x27\xb2\xfa\x17\x46\x0a\xd2\x60\xc0\x16\x01\x69\x77", "UFR", 18),  # eth / Upfiring
-    (1, b"\x24\x69\x27\x91\xbc\x44\x4c\x5c\xd0\xb8\x1e\x3c\xbc\xab\xa4\xb0\x4a\xcd\x1f\x3b", "UKG", 18),  # eth / UnikoinGold
-    (1, b"\x89\x20\x5a\x3a\x3b\x2a\x69\xde\x6d\xbf\x7f\x01\xed\x13\xb2\x10\x8b\x2c\x43\xe7", "Unicorn", 0),  # eth / Unicorn
-    (1, b"\x6b\xa4\x60\xab\x75\xcd\x2c\x56\x34\x3b\x35\x17\xff\xeb\xa6\x07\x48\x65\x4d\x26", "UP", 8),  # eth / UpToken
-    (1, b"\xc8\x6d\x05\x48\x09\x62\x34\x32\x21\x0c\x10\x7a\xf2\xe3\xf6\x19\xdc\xfb\xf6\x52", "UPP", 18),  # eth / Sentinel Protocol
-    (1, b"\xd0\x1d\xb7\x3e\x04\x78\x55\xef\xb4\x14\xe6\x20\x20\x98\xc4\xbe\x4c\xd2\x42\x3b", "UQC", 18),  # eth / Uquid Coin
-    (1, b"\x93\x16\x84\x13\x9f\x75\x6c\x24\xec\x07\x31\xe9\xf7\x4f\xe5\x0e\x55\x48\xdd\xef", "URB", 18),  # eth / Urbit Data
-    (1, b"\xa0\xb8\x69\x91\xc6\x21\x8b\x36\xc1\xd1\x9d\x4a\x2e\x9e\xb0\xce\x36\x06\xeb\x48", "USDC", 6),  # eth / USD//Coin
-    (1, b"\xd7\x60\xad\xdf\xb2\x4d\x9c\x01\xfe\x4b\xfe\xa7\x47\x5c\x5e\x36\x36\x68\x40\x58", "USDM", 2),  # eth / Mether (USDM)
-    (1, b"\xa4\xbd\xb1\x1d\xc0\xa2\xbe\xc8\x8d\x24\xa3\xaa\x1e\x6b\xb1\x72\x01\x11\x2e\xbe", "USDS", 6),  # eth / StableUSD
-    (1, b"\xda\xc1\x7f\x95\x8d\x2e\xe5\x23\xa2\x20\x62\x06\x99\x45\x97\xc1\x3d\x83\x1e\xc7", "USDT", 6),  # eth / USD Tether (erc20)
-    (1, b"\x70\xa7\x28\x33\xd6\xbf\x7f\x50\x8c\x82\x24\xce\x59\xea\x1e\xf3\xd0\xea\x3a\x38", "UTK", 18),  # eth / UTRUST
-    (1, b"\x9e\x33\x19\x63\x6e\x21\x26\xe3\xc0\xbc\x9e\x31\x34\xae\xc5\xe1\x50\x8a\x46\xc7", "UTNP", 18),  # eth / Universa
-    (1, b"\x16\xf8\x12\xbe\x7f\xff\x02\xca\xf6\x62\xb8\x5d\x5d\x58\xa5\xda\x65\x72\xd4\xdf", "UTT", 8),  # eth / United Traders Token
-    (1, b"\x35\x43\x63\x8e\xd4\xa9\x00\x6e\x48\x40\xb1\x05\x94\x42\x71\xbc\xea\x15\x60\x5d", "UUU", 18),  # eth / U Networks
-    (1, b"\x57\xc7\x5e\xcc\xc8\x55\x71\x36\xd3\x26\x19\xa1\x91\xfb\xcd\xc8\x85\x60\xd7\x11", "VDG", 0),  # eth / VeriDocGlobal
-    (1, b"\x82\xbd\x52\x6b\xdb\x71\x8c\x6d\x4d\xd2\x29\x1e\xd0\x13\xa5\x18\x6c\xae\x2d\xca", "VDOC", 18),  # eth / Duty of Care Token
-    (1, b"\x34\x0d\x2b\xde\x5e\xb2\x8c\x1e\xed\x91\xb2\xf7\x90\x72\x3e\x3b\x16\x06\x13\xb7", "VEE", 18),  # eth / BLOCKv
-    (1, b"\xd8\x50\x94\x2e\xf8\x81\x1f\x2a\x86\x66\x92\xa6\x23\x01\x1b\xde\x52\xa4\x62\xc1", "VEN", 18),  # eth / VeChain
-    (1, b"\xeb\xed\x4f\xf9\xfe\x34\x41\x3d\xb8\xfc\x82\x94\x55\x6b\xbd\x15\x28\xa4\xda\xca", "VENUS", 3),  # eth / VENUS
-    (1, b"\x8f\x34\x70\xa7\x38\x8c\x05\xee\x4e\x7a\xf3\xd0\x1d\x8c\x72\x2b\x0f\xf5\x23\x74", "VERI", 18),  # eth / Veritaseum
-    (1, b"\x2c\x97\x4b\x2d\x0b\xa1\x71\x6e\x64\x4c\x1f\xc5\x99\x82\xa8\x9d\xdd\x2f\xf7\x24", "VIB", 18),  # eth / Viberate
-    (1, b"\xe8\xff\x5c\x9c\x75\xde\xb3\x46\xac\xac\x49\x3c\x46\x3c\x89\x50\xbe\x03\xdf\xba", "VIBE", 18),  # eth / VIBE Coin
-    (1, b"\x88\x24\x48\xf8\x3d\x90\xb2\xbf\x47\x7a\xf2\xea\x79\x32\x7f\xde\xa1\x33\x5d\x93", "VIBEX", 18),  # eth / VIBEX Exchange Token
-    (1, b"\xf0\x3f\x8d\x65\xba\xfa\x59\x86\x11\xc3\x49\x51\x24\x09\x3c\x56\xe8\xf6\x38\xf0", "VIEW", 18),  # eth / Viewly
-    (1, b"\xd2\x94\x6b\xe7\x86\xf3\x5c\x3c\xc4\x02\xc2\x9b\x32\x36\x47\xab\xda\x79\x90\x71", "VIKKY", 8),  # eth / VikkyToken
-    (1, b"\xf3\xe0\x14\xfe\x81\x26\x78\x70\x62\x41\x32\xef\x3a\x64\x6b\x8e\x83\x85\x3a\x96", "VIN", 18),  # eth / VIN
-    (1, b"\x23\xb7\x5b\xc7\xaa\xf2\x8e\x2d\x66\x28\xc3\xf4\x24\xb3\x88\x2f\x8f\x07\x2a\x3c", "VIT", 18),  # eth / Vice Industry Token
-    (1, b"\x1b\x79\x3e\x49\x23\x77\x58\xdb\xd8\xb7\x52\xaf\xc9\xeb\x4b\x32\x9d\x5d\xa0\x16", "VITE", 18),  # eth / Vite
-    (1, b"\x51\x94\x75\xb3\x16\x53\xe4\x6d\x20\xcd\x09\xf9\xfd\xcf\x3b\x12\xbd\xac\xb4\xf5", "VIU", 18),  # eth / Viuly
-    (1, b"\x92\x2a\xc4\x73\xa3\xcc\x24\x1f\xd3\xa0\x04\x9e\xd1\x45\x36\x45\x2d\x58\xd7\x3c", "VLD", 18),  # eth / VETRI
-    (1, b"\xc3\xbc\x9e\xb7\x1f\x75\xec\x43\x9a\x6b\x6c\x8e\x8b\x74\x6f\xcf\x5b\x62\xf7\x03", "VOC", 18),  # eth / VORMACOIN
-    (1, b"\x83\xee\xa0\x0d\x83\x8f\x92\xde\xc4\xd1\x47\x56\x97\xb9\xf4\xd3\x53\x7b\x56\xe3", "VOISE", 8),  # eth / Voise
-    (1, b"\x5c\x54\x3e\x7a\xe0\xa1\x10\x4f\x78\x40\x6c\x34\x0e\x9c\x64\xfd\x9f\xce\x51\x70", "VSL", 18),  # eth / Vdice
-    (1, b"\x4b\x96\xbf\x1f\xef\x93\xa2\x16\x91\x4f\xc8\x43\xd8\x12\x07\xa0\x27\xce\x52\xb3", "VUU", 18),  # eth / Vuulr Token
-    (1, b"\x97\x20\xb4\x67\xa7\x10\x38\x2a\x23\x2a\x32\xf5\x40\xbd\xce\xd7\xd6\x62\xa1\x0b", "VZT", 18),  # eth / Vezt
-    (1, b"\x4b\xbb\xc5\x7a\xf2\x70\x13\x8e\xf2\xff\x2c\x50\xdb\xfa\xd6\x84\xe9\xe0\xe6\x04", "WAB", 18),  # eth / WABnetwork
-    (1, b"\x28\x6b\xda\x14\x13\xa2\xdf\x81\x73\x1d\x49\x30\xce\x2f\x86\x2a\x35\xa6\x09\xfe", "WABI", 18),  # eth / Tael
-    (1, b"\x82\x9a\x4c\xa1\x30\x33\x83\xf1\x08\x2b\x6b\x1f\xb9\x37\x11\x6e\x4b\x3b\x56\x05", "WATT", 18),  # eth / WorkChain App Token
-    (1, b"\x39\xbb\x25\x9f\x66\xe1\xc5\x9d\x5a\xbe\xf8\x83\x75\x97\x9b\x4d\x20\xd9\x80\x22", "WAX", 8),  # eth / WAX
-    (1, b"\x74\x95\x1b\x67\x7d\xe3\x2d\x59\x6e\xe8\x51\xa2\x33\x33\x69\x26\xe6\xa2\xcd\x09", "WBA", 7),  # eth / WeBetCrypto
-    (1, b"\x22\x60\xfa\xc5\xe5\x54\x2a\x77\x3a\xa4\x4f\xbc\xfe\xdf\x7c\x19\x3b\xc2\xc5\x99", "WBTC", 8),  # eth / Wrapped Bitcoin
-    (1, b"\x8f\x93\x6f\xe0\xfa\xf0\x60\x4c\x9c\x0e\xf2\x40\x6b\xde\x0a\x65\x36\x55\x15\xd6", "WCN", 18),  # eth / WorldCoinNetwork
-    (1, b"\x6a\x0a\x97\xe4\x7d\x15\xaa\xd1\xd1\x32\xa1\xac\x79\xa4\x80\xe3\xf2\x07\x90\x63", "WCT", 18),  # eth / WePower
-    (1, b"\x84\x0f\xe7\x5a\xbf\xad\xc0\xf2\xd5\x40\x37\x82\x95\x71\xb2\x78\x2e\x91\x9c\xe4", "WEB", 18),  # eth / Webcoin
-    (1, b"\xc0\x2a\xaa\x39\xb2\x23\xfe\x8d\x0a\x0e\x5c\x4f\x27\xea\xd9\x08\x3c\x75\x6c\xc2", "WETH", 18),  # eth / WETH
-    (1, b"\xf4\xfe\x95\x60\x38\x81\xd0\xe0\x79\x54\xfd\x76\x05\xe0\xe9\xa9\x16\xe4\x2c\x44", "WHEN", 18),  # eth / WHEN Token
-    (1, b"\xd3\xc0\x07\x72\xb2\x4d\x99\x7a\x81\x22\x49\xca\x63\x7a\x92\x1e\x81\x35\x77\x01", "WILD", 18),  # eth / WILD Token
-    (1, b"\x89\x93\x38\xb8\x4d\x25\xac\x50\x5a\x33\x2a\xdc\xe7\x40\x2d\x69\x7d\x94\x74\x94", "WIN", 8),  # eth / WCOIN
-    (1, b"\x66\x70\x88\xb2\x12\xce\x3d\x06\xa1\xb5\x53\xa7\x22\x1e\x1f\xd1\x90\x00\xd9\xaf", "WINGS", 18),  # eth / WINGS
-    (1, b"\x1b\x22\xc3\x2c\xd9\x36\xcb\x97\xc2\x8c\x56\x90\xa0\x69\x5a\x82\xab\xf6\x88\xe6", "WISH", 18),  # eth / MyWish
-    (1, b"\xbf\xbe\x53\x32\xf1\x72\xd7\x78\x11\xbc\x6c\x27\x28\x44\xf3\xe5\x4a\x7b\x23\xbb", "WMK", 18),  # eth / WemarkToken
-    (1, b"\xd7\x3a\x66\xb8\xfb\x26\xbe\x8b\x0a\xcd\x7c\x52\xbd\x32\x50\x54\xac\x7d\x46\x8b", "WNK", 18),  # eth / Woonk
-    (1, b"\xf9\xd9\x70\x2d\x03\x14\x07\xf4\x25\xa4\x41\x26\x82\xfd\xc5\x6b\x07\xd0\x52\x62", "WOC", 0),  # eth / WallOfChain
-    (1, b"\x62\x08\x72\x45\x08\x71\x25\xd3\xdb\x5b\x9a\x3d\x71\x3d\x78\xe7\xbb\xc3\x1e\x54", "WPC", 18),  # eth / WorldPeaceCoin
-    (1, b"\x4c\xf4\x88\x38\x7f\x03\x5f\xf0\x8c\x37\x15\x15\x56\x2c\xba\x71\x2f\x90\x15\xd4", "WPR", 18),  # eth / WePower Token
-    (1, b"\x72\xad\xad\xb4\x47\x78\x4d\xd7\xab\x1f\x47\x24\x67\x75\x0f\xc4\x85\xe4\xcb\x2d", "WRC", 6),  # eth / Worldcore
-    (1, b"\x71\xe8\xd7\x4f\xf1\xc9\x23\xe3\x69\xd0\xe7\x0d\xfb\x09\x86\x66\x29\xc4\xdd\x35", "WRK", 18),  # eth / WorkCoin
-    (1, b"\xb7\xcb\x1c\x96\xdb\x6b\x22\xb0\xd3\xd9\x53\x6e\x01\x08\xd0\x62\xbd\x48\x8f\x74", "WTC", 18),  # eth / Waltonchain
-    (1, b"\x84\x11\x9c\xb3\x3e\x8f\x59\x0d\x75\xc2\xd6\xea\x4e\x6b\x07\x41\xa7\x49\x4e\xda", "WTT", 0),  # eth / WTT
-    (1, b"\xd8\x95\x0f\xde\xaa\x10\x30\x4b\x7a\x7f\xd0\x3a\x2f\xc6\x6b\xc3\x9f\x3c\x71\x1a", "WYS", 18),  # eth / wystoken
-    (1, b"\x05\x60\x17\xc5\x5a\xe7\xae\x32\xd1\x2a\xef\x7c\x67\x9d\xf8\x3a\x85\xca\x75\xff", "WYV", 18),  # eth / WyvernToken
-    (1, b"\x91\x0d\xfc\x18\xd6\xea\x3d\x6a\x71\x24\xa6\xf8\xb5\x45\x8f\x28\x10\x60\xfa\x4c", "X8X", 18),  # eth / X8X
-    (1, b"\x4d\xf8\x12\xf6\x06\x4d\xef\x1e\x5e\x02\x9f\x1c\xa8\x58\x77\x7c\xc9\x8d\x2d\x81", "XAUR", 8),  # eth / Xaurum
-    (1, b"\x49\xae\xc0\x75\x2e\x68\xd0\x28\x2d\xb5\x44\xc6\x77\xf6\xba\x40\x7b\xa1\x7e\xd7", "XBL", 18),  # eth / Billionaire Token
-    (1, b"\x28\xde\xe0\x1d\x53\xfe\xd0\xed\xf5\xf6\xe3\x10\xbf\x8e\xf9\x31\x15\x13\xae\x40", "XBP", 18),  # eth / BlitzPredict
-    (1, b"\x4d\x82\x9f\x8c\x92\xa6\x69\x1c\x56\x30\x0d\x02\x0c\x9e\x0d\xb9\x84\xcf\xe2\xba", "XCC", 18),  # eth / CoinCrowd
-    (1, b"\xb4\x27\x20\x71\xec\xad\xd6\x9d\x93\x3a\xdc\xd1\x9c\xa9\x9f\xe8\x06\x64\xfc\x08", "XCHF", 18),  # eth / CryptoFranc
-    (1, b"\x1e\x26\xb3\xd0\x7e\x57\xf4\x53\xca\xe3\x0f\x7d\xdd\x2f\x94\x5f\x5b\xf3\xef\x33", "XCLR", 8),  # eth / ClearCoin
-    (1, b"\x41\xab\x1b\x6f\xcb\xb2\xfa\x9d\xce\xd8\x1a\xcb\xde\xc1\x3e\xa6\x31\x5f\x2b\xf2", "XDCE", 18),  # eth / XinFin Network
-    (1, b"\xa0\x17\xac\x5f\xac\x59\x41\xf9\x50\x10\xb1\x25\x70\xb8\x12\xc9\x74\x46\x9c\x2c", "XES", 18),  # eth / Proxeus
-    (1, b"\x05\x4c\x64\x74\x1d\xba\xfd\xc1\x97\x84\x50\x54\x94\x02\x98\x23\xd8\x9c\x3b\x13", "XET", 8),  # eth / ETERNAL TOKEN
-    (1, b"\x16\xaf\x5b\xfb\x4a\xe7\xe4\x75\xb9\xad\xc3\xbf\x5c\xb2\xf1\xe6\xa5\x0d\x79\x40", "XFS", 8),  # eth / Fanship
-    (1, b"\xf6\xb6\xaa\x0e\xf0\xf5\xed\xc2\xc1\xc5\xd9\x25\x47\x7f\x97\xea\xf6\x63\x03\xe7", "XGG", 8),  # eth / Going Gems
-    (1, b"\x53\x3e\xf0\x98\x4b\x2f\xaa\x22\x7a\xcc\x62\x0c\x67\xcc\xe1\x2a\xa3\x9c\xd8\xcd", "XGM", 8),  # eth / XGM
-    (1, b"\x30\xf4\xa3\xe0\xab\x7a\x76\x73\x3d\x8b\x60\xb8\x9d\xd9\x3c\x3d\x0b\x4c\x9e\x2f", "XGT", 18),  # eth / XGT
-    (1, b"\xb1\x10\xec\x7b\x1d\xcb\x8f\xab\x8d\xed\xbf\x28\xf5\x3b\xc6\x3e\xa5\xbe\xdd\x84", "XID", 8),  # eth / Sphere Identity
-    (1, b"\x44\x44\x9f\xa4\xd6\x07\xf8\x07\xd1\xed\x4a\x69\xad\x94\x29\x71\x72\x83\x91\xc8", "XMCT", 18),  # eth / XMED Chain
-    (1, b"\x0f\x8c\x45\xb8\x96\x78\x4a\x1e\x40\x85\x26\xb9\x30\x05\x19\xef\x86\x60\x20\x9c", "XMX", 8),  # eth / XMax
-    (1, b"\xbc\x86\x72\x7e\x77\x0d\xe6\x8b\x10\x60\xc9\x1f\x6b\xb6\x94\x5c\x73\xe1\x03\x88", "XNK", 18),  # eth / Ink Protocol
-    (1, b"\xab\x95\xe9\x15\xc1\x23\xfd\xed\x5b\xdf\xb6\x32\x5e\x35\xef\x55\x15\xf1\xea\x69", "XNN", 18),  # eth / XENON
-    (1, b"\x57\x2e\x6f\x31\x80\x56\xba\x0c\x5d\x47\xa4\x22\x65\x31\x13\x84\x3d\x25\x06\x91", "XNT", 0),  # eth / XNT
-    (1, b"\x15\x3e\xd9\xcc\x1b\x79\x29\x79\xd2\xbd\xe0\xbb\xf4\x5c\xc2\xa7\xe4\x36\xa5\xf9", "XOV", 18),  # eth / XOVBank
-    (1, b"\x90\x52\x8a\xeb\x3a\x2b\x73\x6b\x78\x0f\xd1\xb6\xc4\x78\xbb\x7e\x1d\x64\x31\x70", "XPA", 18),  # eth / XPA
-    (1, b"\xbb\x1f\xa4\xfd\xeb\x34\x59\x73\x3b\xf6\x7e\xbc\x6f\x89\x30\x03\xfa\x97\x6a\x82", "XPAT", 18),  # eth / Pangea Arbitration Token
-    (1, b"\xb2\x47\x54\xbe\x79\x28\x15\x53\xdc\x1a\xdc\x16\x0d\xdf\x5c\xd9\xb7\x43\x61\xa4", "XRL", 9),  # eth / XRL
-    (1, b"\x0f\x51\x3f\xfb\x49\x26\xff\x82\xd7\xf6\x0a\x05\x06\x90\x47\xac\xa2\x95\xc4\x13", "XSC", 18),  # eth / XSC
-    (1, b"\x55\x29\x6f\x69\xf4\x0e\xa6\xd2\x0e\x47\x85\x33\xc1\x5a\x6b\x08\xb6\x54\xe7\x58", "XYO", 18),  # eth / XYO
-    (1, b"\x92\x21\x05\xfa\xd8\x15\x3f\x51\x6b\xcf\xb8\x29\xf5\x6d\xc0\x97\xa0\xe1\xd7\x05", "YEE", 18),  # eth / Yee Token
-    (1, b"\xcb\xea\xec\x69\x94\x31\x85\x7f\xdb\x4d\x37\xad\xdb\xbd\xc2\x0e\x13\x2d\x49\x03", "YOYOW", 18),  # eth / YOYOW
-    (1, b"\xd9\xa1\x2c\xde\x03\xa8\x6e\x80\x04\x96\x46\x98\x58\xde\x85\x81\xd3\xa5\x35\x3d", "YUP", 18),  # eth / Crowdholding
-    (1, b"\x0f\x33\xbb\x20\xa2\x82\xa7\x64\x9c\x7b\x3a\xff\x64\x4f\x08\x4a\x93\x48\xe9\x33", "YUPIE", 18),  # eth / YUPIE
-    (1, b"\x67\x81\xa0\xf8\x4c\x7e\x9e\x84\x6d\xcb\x84\xa9\xa5\xbd\x49\x33\x30\x67\xb1\x04", "ZAP", 18),  # eth / ZAP
-    (1, b"\xb9\xef\x77\x0b\x6a\x5e\x12\xe4\x59\x83\xc5\xd8\x05\x45\x25\x8a\xa3\x8f\x3b\x78", "ZCN", 10),  # eth / 0chain
-    (1, b"\x20\x08\xe3\x05\x7b\xd7\x34\xe1\x0a\xd1\x3c\x9e\xae\x45\xff\x13\x2a\xbc\x17\x22", "ZCO", 8),  # eth / Zebi
-    (1, b"\x7a\x41\xe0\x51\x7a\x5e\xca\x4f\xdb\xc7\xfb\xeb\xa4\xd4\xc4\x7b\x9f\xf6\xdc\x63", "ZCS", 18),  # eth / Zeusshield
-    (1, b"\xe7\xe4\x27\x9b\x80\xd3\x19\xed\xe2\x88\x98\x55\x13\x5a\x22\x02\x1b\xaf\x09\x07", "ZEUS", 18),  # eth / ZeusNetwork
-    (1, b"\x05\xf4\xa4\x2e\x25\x1f\x2d\x52\xb8\xed\x15\xe9\xfe\xda\xac\xfc\xef\x1f\xad\x27", "ZIL", 12),  # eth / Zilliqa
-    (1, b"\x4a\xac\x46\x1c\x86\xab\xfa\x71\xe9\xd0\x0d\x9a\x2c\xde\x8d\x74\xe4\xe1\xae\xea", "ZINC", 18),  # eth / ZINC
-    (1, b"\xa9\xd2\x92\x7d\x3a\x04\x30\x9e\x00\x8b\x6a\xf6\xe2\xe2\x82\xae\x29\x52\xe7\xfd", "ZIP", 18),  # eth / Zipper
-    (1, b"\xed\xd7\xc9\x4f\xd7\xb4\x97\x1b\x91\x6d\x15\x06\x7b\xc4\x54\xb9\xe1\xba\xd9\x80", "ZIPT", 18),  # eth / Zippie
-    (1, b"\xf3\xc0\x92\xca\x8c\xd6\xd3\xd4\xca\x00\x4d\xc1\xd0\xf1\xfe\x8c\xca\xb5\x35\x99", "ZIX", 18),  # eth / ZIX
-    (1, b"\xfd\x89\x71\xd5\xe8\xe1\x74\x0c\xe2\xd0\xa8\x40\x95\xfc\xa4\xde\x72\x9d\x0c\x16", "ZLA", 18),  # eth / Zilla
-    (1, b"\x55\x4f\xfc\x77\xf4\x25\x1a\x9f\xb3\xc0\xe3\x59\x0a\x6a\x20\x5f\x8d\x4e\x06\x7d", "ZMN", 18),  # eth / ZMINE
-    (1, b"\xb5\xb8\xf5\x61\x6f\xe4\x2d\x5c\xec\xa3\xe8\x7f\x3f\xdd\xbd\xd8\xf4\x96\xd7\x60", "ZPR", 18),  # eth / ZPER
-    (1, b"\xe4\x1d\x24\x89\x57\x1d\x32\x21\x89\x24\x6d\xaf\xa5\xeb\xde\x1f\x46\x99\xf4\x98", "ZRX", 18),  # eth / 0x Project
-    (1, b"\xe3\x86\xb1\x39\xed\x37\x15\xca\x4b\x18\xfd\x52\x67\x1b\xdc\xea\x1c\xdf\xe4\xb1", "ZST", 8),  # eth / Zeus Exchange
-    (1, b"\xe8\xf9\xfa\x97\x7e\xa5\x85\x59\x1d\x9f\x39\x46\x81\x31\x8c\x16\x55\x25\x77\xfb", "ZTX", 18),  # eth / ZTX
-    (1, b"\x83\xe2\xbe\x8d\x11\x4f\x96\x61\x22\x13\x84\xb3\xa5\x0d\x24\xb9\x6a\x56\x53\xf5", "ZXC", 18),  # eth / 0xcert Protocol Token
-    (42, b"\x86\x67\x55\x92\x54\x24\x1d\xde\xd4\xd1\x13\x92\xf8\x68\xd7\x20\x92\x76\x53\x67", "Aeternity", 18),  # kov / Aeternity
-    (42, b"\xc4\x37\x5b\x7d\xe8\xaf\x5a\x38\xa9\x35\x48\xeb\x84\x53\xa4\x98\x22\x2c\x4f\xf2", "DAI", 18),  # kov / RadarRelay test Dai Stablecoin v1.0
-    (42, b"\xee\xe3\x87\x06\x57\xe4\x71\x66\x70\xf1\x85\xdf\x08\x65\x2d\xd8\x48\xfe\x8f\x7e", "DGD", 18),  # kov / RadarRelay test Digix DAO Token
-    (42, b"\xef\x7f\xff\x64\x38\x9b\x81\x4a\x94\x6f\x3e\x92\x10\x55\x13\x70\x5c\xa6\xb9\x90", "GNT", 18),  # kov / RadarRelay test Golem Network Token
-    (42, b"\x3c\x67\xf7\xd4\xde\xcf\x77\x95\x22\x5f\x51\xb5\x41\x34\xf8\x11\x37\x38\x5f\x83", "GUP", 3),  # kov / GUP
-    (42, b"\x1d\xad\x47\x83\xcf\x3f\xe3\x08\x5c\x14\x26\x15\x7a\xb1\x75\xa6\x11\x9a\x04\xba", "MKR", 18),  # kov / RadarRelay test MakerDAO
-    (42, b"\x32\x3b\x5d\x4c\x32\x34\x5c\xed\x77\x39\x3b\x35\x30\xb1\xee\xd0\xf3\x46\x42\x9d", "MLN", 18),  # kov / RadarRelay test Melon Tokens
-    (42, b"\xb1\x88\x45\xc2\x60\xf6\x80\xd5\xb9\xd8\x46\x49\x63\x88\x13\xe3\x42\xe4\xf8\xc9", "REP", 18),  # kov / RadarRelay test Augur Reputation Token
-    (42, b"\x6f\xf6\xc0\xff\x1d\x68\xb9\x64\x90\x1f\x98\x6d\x4c\x9f\xa3\xac\x68\x34\x65\x70", "ZRX", 18),  # kov / RadarRelay test 0x Protocol Token
-    (4, b"\x39\x8a\x7a\x69\xf3\xc5\x91\x81\xa1\xff\xe3\x4b\xed\x11\xdc\xb5\xdf\x86\x3a\x8a", "AETH", 18),  # rin / AKASHA Tokens
-    (4, b"\xe2\x78\x26\xee\x77\x8b\x6f\x78\xa4\x9a\x68\x6d\xa7\xd6\x4f\x6e\x7b\x08\x4a\x4f", "BHNT", 0),  # rin / Berlin Hack&Tell winner token
-    (4, b"\x8b\x65\xd4\xb7\xee\x3f\xff\xa9\x86\xc5\x77\xf0\xf4\xb7\x0a\x21\xba\xe3\xdd\x54", "CTGA", 18),  # rin / Convenient To Go
-    (4, b"\x27\x5a\x5b\x34\x65\x99\xb5\x69\x17\xe7\xb1\xc9\xde\x01\x9d\xcf\x9e\xad\x86\x1a", "KC", 18),  # rin / Karma Token
-    (4, b"\x64\x75\xa7\xfa\x6e\xd2\xd5\x18\x0f\x0e\x0a\x07\xc2\xd9\x51\xd1\x2c\x0e\xdb\x91", "NONE", 0),  # rin / None
-    (4, b"\x12\xfe\x17\x4c\x09\x7f\x6b\x3e\x87\x6b\x3b\x06\x0c\x90\x61\xf4\xb9\xde\xbb\x80", "PPD", 18),  # rin / PP Donation
-    (4, b"\x36\x15\x75\x70\x11\x11\x25\x60\x52\x15\x36\x25\x8c\x1e\x73\x25\xae\x3b\x48\xae", "RDN", 18),  # rin / Raiden
-    (4, b"\x0a\x05\x7a\x87\xce\x9c\x56\xd7\xe3\x36\xb4\x17\xc7\x9c\xf3\x0e\x8d\x27\x86\x0b", "WALL", 15),  # rin / WALLETH Community-Token
-    (3, b"\x95\xd7\x32\x1e\xdc\xe5\x19\x41\x9b\xa1\xdb\xc6\x0a\x89\xba\xfb\xf5\x5e\xac\x0d", "*PLASMA", 6),  # rop / *PLASMA
-    (3, b"\xa1\xba\xcc\xa0\xe1\x2d\x40\x91\xec\x1f\x92\xe7\xca\xe3\x39\x4c\xc9\x85\x4d\x3d", "dqr30", 18),  # rop / DQR
-    (3, b"\x6f\x95\xa3\xb6\x82\xf8\xe9\xaa\xcc\x86\xd0\x57\xa6\xdf\x88\xa0\xe6\x81\x45\xa8", "ILSC", 2),  # rop / IsraCoin
-    (3, b"\xfd\x5a\x69\xa1\x30\x95\x95\xff\x51\x21\x55\x3f\x52\xc8\xa5\xb2\xb1\xb3\x10\x31", "NONE", 0),  # rop / None
-    (8, b"\xff\x3b\xf0\x57\xad\xf3\xb0\xe0\x15\xb6\x46\x53\x31\xa6\x23\x6e\x55\x68\x82\x74", "BEER", 0),  # ubq / BEER
-    (8, b"\x08\x53\x3d\x6a\x06\xce\x36\x52\x98\xb1\x2e\xf9\x2e\xb4\x07\xcb\xa8\xaa\x82\x73", "CEFS", 8),  # ubq / CEFS
-    (8, b"\x94\xad\x7e\x41\xc1\xd4\x40\x22\xc4\xf4\x7c\xb1\xba\x01\x9f\xd1\xa0\x22\xc5\x36", "DOT", 8),  # ubq / DOT
-    (8, b"\x4b\x48\x99\xa1\x0f\x3e\x50\x7d\xb2\x07\xb0\xee\x24\x26\x02\x9e\xfa\x16\x8a\x67", "QWARK", 8),  # ubq / QWARK
-    (8, b"\x5e\x17\x15\xbb\x79\x80\x5b\xd6\x72\x72\x97\x60\xb3\xf7\xf3\x4d\x6f\x48\x50\x98", "RICKS", 8),  # ubq / RICKS
-]
+_TOKENS = (
+    b"\x00\x00\x00\x01\x00\x00\x00\x00\x00\x08\x5d\x47\x80\xb7\x31\x19\xb6\x44\xae\x5e\xcd\x22\xb3\x76\x12\x00\x00\x04"  # eth / TUSD / TrueUSD
+    b"\x00\x00\x00\x01\x00\x1f\x0a\xa5\xda\x15\x58\x5e\x5b\x23\x05\xdb\xab\x2b\xac\x42\x5e\xa7\x10\x07\x12\x00\x04\x04"  # eth / IPSX / IP Exchange
+    b"\x00\x00\x00\x01\x00\x6b\xea\x43\xba\xa3\xf7\xa6\xf7\x65\xf1\x4f\x10\xa1\xa1\xb0\x83\x34\xef\x45\x12\x00\x08\x03"  # eth / STX / StoxToken
+    b"\x00\x00\x00\x01\x00\x73\xe5\xe5\x2e\x2b\x4f\xe2\x18\xd7\x5d\x99\x4e\xe2\xb3\xc8\x2f\x9c\x87\xea\x08\x00\x0b\x03"  # eth / 22x / 22x Fund
+    b"\x00\x00\x00\x01\x00\x9e\x86\x49\x23\xb4\x92\x63\xc7\xf1\x0d\x19\xb7\xf8\xab\x7a\x9a\x5a\xad\x33\x12\x00\x0e\x03"  # eth / FKX / Knoxstertoken
+    b"\x00\x00\x00\x01\x00\xc4\xb3\x98\x50\x06\x45\xeb\x5d\xa0\x0a\x1a\x37\x9a\x88\xb1\x16\x83\xba\x01\x12\x00\x11\x03"  # eth / EXC / Eximchain Token
+    b"\x00\x00\x00\x01\x01\x4b\x50\x46\x65\x90\x34\x0d\x41\x30\x7c\xc5\x4d\xce\xe9\x90\xc8\xd5\x8a\xa8\x06\x00\x14\x04"  # eth / ICOS / ICOS
+    b"\x00\x00\x00\x01\x01\xb3\xec\x4a\xae\x1b\x87\x29\x52\x9b\xeb\x49\x65\xf2\x7d\x00\x87\x88\xb0\xeb\x12\x00\x18\x03"  # eth / DPP / Digital Assets Power Play
+    b"\x00\x00\x00\x01\x02\x23\xfc\x70\x57\x42\x14\xf6\x58\x13\xfe\x33\x6d\x87\x0a\xc4\x7e\x14\x7f\xae\x12\x00\x1b\x03"  # eth / CZR / CanonChain
+    b"\x00\x00\x00\x01\x02\x35\xfe\x62\x4e\x04\x4a\x05\xee\xd7\xa4\x3e\x16\xe3\x08\x3b\xc8\xa4\x28\x7a\x12\x00\x1e\x03"  # eth / OCC / Original Crypto Coin
+    b"\x00\x00\x00\x01\x02\x5a\xba\xd9\xe5\x18\x51\x6f\xda\xaf\xbd\xcd\xb9\x70\x1b\x37\xfb\x7e\xf0\xfa\x00\x00\x21\x04"  # eth / GTKT / GTKT
+    b"\x00\x00\x00\x01\x02\x72\x58\x36\xeb\xf3\xec\xdb\x1c\xdf\x1c\x7b\x02\xfc\xbb\xfa\xa2\x73\x6a\xf8\x08\x00\x25\x04"  # eth / BTCA / BitAir
+    b"\x00\x00\x00\x01\x02\xf2\xd4\xa0\x4e\x6e\x01\xac\xe8\x8b\xd2\xcd\x63\x28\x75\x54\x3b\x2e\xf5\x77\x12\x00\x29\x03"  # eth / PKG / PKG Token
+    b"\x00\x00\x00\x01\x02\xf6\x1f\xd2\x66\xda\x6e\x8b\x10\x2d\x41\x21\xf5\xce\x7b\x99\x26\x40\xcf\x98\x12\x00\x2c\x04"  # eth / LIKE / LikeCoin
+    b"\x00\x00\x00\x01\x03\x24\xdd\x19\x5d\x0c\xd5\x3f\x9f\x07\xbe\xe6\xa4\x8e\xe7\xa2\x0b\xad\x73\x8f\x08\x00\x30\x05"  # eth / SPICE / SPiCE VC Token
+    b"\x00\x00\x00\x01\x03\x71\xa8\x2e\x4a\x9d\x0a\x43\x12\xf3\xee\x2a\xc9\xc6\x95\x85\x12\x89\x13\x72\x12\x00\x35\x03"  # eth / STU / bitJob
+    b"\x00\x00\x00\x01\x03\x9f\x50\x50\xde\x49\x08\xf9\xb5\xdd\xf4\x0a\x4f\x3a\xa3\xf3\x29\x08\x63\x87\x12\x00\x38\x03"  # eth / ENC / Ethernet.Cash
+    b"\x00\x00\x00\x01\x03\xc7\x80\xcd\x55\x45\x98\x59\x2b\x97\xb7\x25\x6d\xda\xad\x75\x99\x45\xb1\x25\x12\x00\x3b\x04"  # eth / BTRN / Biotron
+    b"\x00\x00\x00\x01\x03\xe3\xf0\xc2\x59\x65\xf1\x3d\xbb\xc5\x82\x46\x73\x8c\x18\x3e\x27\xb2\x6a\x56\x12\x00\x3f\x04"  # eth / DSCP / Disciplina Token
+    b"\x00\x00\x00\x01\x04\x71\x87\xe5\x34\x77\xbe\x70\xdb\xe8\xea\x5b\x79\x93\x18\xf2\xe1\x65\x05\x2f\x12\x00\x43\x03"  # eth / OMT / OTCMAKER Token
+    b"\x00\x00\x00\x01\x04\x93\x99\xa6\xb0\x48\xd5\x29\x71\xf7\xd1\x22\xae\x21\xa1\x53\x27\x22\x28\x5f\x12\x00\x46\x04"  # eth / FLOT / Fire Lotto
+    b"\x00\x00\x00\x01\x04\xf2\xe7\x22\x1f\xdb\x1b\x52\xa6\x81\x69\xb2\x57\x93\xe5\x14\x78\xff\x03\x29\x02\x00\x4a\x04"  # eth / CAPP / Cappasity
+    b"\x00\x00\x00\x01\x05\x4c\x64\x74\x1d\xba\xfd\xc1\x97\x84\x50\x54\x94\x02\x98\x23\xd8\x9c\x3b\x13\x08\x00\x4e\x03"  # eth / XET / ETERNAL TOKEN
+    b"\x00\x00\x00\x01\x05\x60\x17\xc5\x5a\xe7\xae\x32\xd1\x2a\xef\x7c\x67\x9d\xf8\x3a\x85\xca\x75\xff\x12\x00\x51\x03"  # eth / WYV / WyvernToken
+    b"\x00\x00\x00\x01\x05\x6f\xd4\x09\xe1\xd7\xa1\x24\xbd\x70\x17\x45\x9d\xfe\xa2\xf3\x87\xb6\xd5\xcd\x02\x00\x54\x04"  # eth / GUSD / Gemini dollar
+    b"\x00\x00\x00\x01\x05\xaa\xaa\x82\x9a\xfa\x40\x7d\x83\x31\x5c\xde\xd1\xd4\x5e\xb1\x60\x25\x91\x0c\x12\x00\x58\x03"  # eth / SPX / Sp8de
+    b"\x00\x00\x00\x01\x05\xc3\x61\x7c\xbf\x13\x04\xb9\x26\x0a\xa6\x1e\xc9\x60\xf1\x15\xd6\x7b\xec\xea\x12\x00\x5b\x04"  # eth / CBIX / Cubrix
+    b"\x00\x00\x00\x01\x05\xd4\x12\xce\x18\xf2\x40\x40\xbb\x3f\xa4\x5c\xf2\xc6\x9e\x50\x65\x86\xd8\xe8\x12\x00\x5f\x04"  # eth / MFTU / Mainstream For The Underground
+    b"\x00\x00\x00\x01\x05\xf4\xa4\x2e\x25\x1f\x2d\x52\xb8\xed\x15\xe9\xfe\xda\xac\xfc\xef\x1f\xad\x27\x0c\x00\x63\x03"  # eth / ZIL / Zilliqa
+    b"\x00\x00\x00\x01\x06\x01\x2c\x8c\xf9\x7b\xea\xd5\xde\xae\x23\x70\x70\xf9\x58\x7f\x8e\x7a\x26\x6d\x00\x00\x66\x02"  # eth / CK / CK
+    b"\x00\x00\x00\x01\x06\x14\x71\x10\x02\x2b\x76\x8b\xa8\xf9\x9a\x8f\x38\x5d\xf1\x1a\x15\x1a\x9c\xc8\x00\x00\x68\x03"  # eth / ACE / ACE (TokenStars)
+    b"\x00\x00\x00\x01\x06\x75\xda\xa9\x47\x25\xa5\x28\xb0\x5a\x3a\x88\x63\x5c\x03\xea\x96\x4b\xfa\x7e\x12\x00\x6b\x04"  # eth / TKLN / Taklimakan Network
+    b"\x00\x00\x00\x01\x07\x07\x68\x1f\x34\x4d\xeb\x24\x18\x40\x37\xfc\x02\x28\x85\x6f\x21\x37\xb0\x2e\x12\x00\x6f\x05"  # eth / FNKOS / FNKOS
+    b"\x00\x00\x00\x01\x07\x5c\x60\xee\x2c\xd3\x08\xff\x47\x87\x3b\x38\xbd\x9a\x0f\xa5\x85\x33\x82\xc4\x12\x00\x74\x04"  # eth / DEEZ / DeezNuts
+    b"\x00\x00\x00\x01\x07\x6c\x97\xe1\xc8\x69\x07\x2e\xe2\x2f\x8c\x91\x97\x8c\x99\xb4\xbc\xb0\x25\x91\x12\x00\x78\x03"  # eth / CBT / CommerceBlock
+    b"\x00\x00\x00\x01\x07\xd9\xe4\x9e\xa4\x02\x19\x4b\xf4\x8a\x82\x76\xda\xfb\x16\xe4\xed\x63\x33\x17\x08\x00\x7b\x04"  # eth / DALC / DaleCoin
+    b"\x00\x00\x00\x01\x07\xe3\xc7\x06\x53\x54\x8b\x04\xf0\xa7\x59\x70\xc1\xf8\x1b\x4c\xbb\xfb\x60\x6f\x12\x00\x7f\x03"  # eth / DLT / Agrello
+    b"\x00\x00\x00\x01\x08\x0a\xa0\x7e\x2c\x71\x85\x15\x0d\x7e\x4d\xa9\x88\x38\xa8\xd2\xfe\xac\x3d\xfc\x00\x00\x82\x03"  # eth / BTT / Bitether
+    b"\x00\x00\x00\x01\x08\x71\x1d\x3b\x02\xc8\x75\x8f\x2f\xb3\xab\x4e\x80\x22\x84\x18\xa7\xf8\xe3\x9c\x00\x00\x85\x03"  # eth / EDG / Edgeless
+    b"\x00\x00\x00\x01\x08\x86\x94\x9c\x1b\x8c\x41\x28\x60\xc4\x26\x4c\xeb\x80\x83\xd1\x36\x5e\x86\xcf\x08\x00\x88\x04"  # eth / BTCE / EthereumBitcoin
+    b"\x00\x00\x00\x01\x08\x9b\x85\xfa\x15\xf7\x2c\x10\x88\xcb\xbe\xf2\x3a\x49\xdb\x80\xb9\x1d\xd5\x21\x08\x00\x8c\x03"  # eth / BIT / BlockEstate Investment Token
+    b"\x00\x00\x00\x01\x08\xb4\xc8\x66\xae\x9d\x1b\xe5\x6a\x06\xe0\xc3\x02\x05\x4b\x4f\xfe\x06\x7b\x43\x08\x00\x8f\x06"  # eth / BITCAR / BitCar Token
+    b"\x00\x00\x00\x01\x08\xd3\x2b\x0d\xa6\x3e\x2c\x3b\xcf\x80\x19\xc9\xc5\xd8\x49\xd7\xa9\xd7\x91\xe6\x00\x00\x95\x03"  # eth / DCN / Dentacoin
+    b"\x00\x00\x00\x01\x08\xf5\xa9\x23\x5b\x08\x17\x3b\x75\x69\xf8\x36\x45\xd2\xc7\xfb\x55\xe8\xcc\xd8\x08\x00\x98\x03"  # eth / TNT / Tierion Network Token
+    b"\x00\x00\x00\x01\x09\x47\xb0\xe6\xd8\x21\x37\x88\x05\xc9\x59\x82\x91\x38\x5c\xe7\xc7\x91\xa6\xb2\x12\x00\x9b\x03"  # eth / LND / Lendingblock
+    b"\x00\x00\x00\x01\x09\x96\xbf\xb5\xd0\x57\xfa\xa2\x37\x64\x0e\x25\x06\xbe\x7b\x4f\x9c\x46\xde\x0b\x12\x00\x9e\x04"  # eth / RNDR / Render Token
+    b"\x00\x00\x00\x01\x09\xbc\xa6\xeb\xab\x05\xee\x2a\xe9\x45\xbe\x4e\xda\x51\x39\x3d\x94\xbf\x7b\x99\x04\x00\xa2\x03"  # eth / STB / STABLE Token
+    b"\x00\x00\x00\x01\x0a\x1d\x2f\xf7\x15\x6a\x48\x13\x15\x53\xcf\x38\x1f\x22\x0b\xbe\xdb\x4e\xfa\x37\x12\x00\xa5\x04"  # eth / FABA / FABA
+    b"\x00\x00\x00\x01\x0a\x9a\x9c\xe6\x00\xd0\x8b\xf9\xb7\x6f\x49\xfa\x4e\x7b\x38\xa6\x7e\xbe\xb1\xe6\x08\x00\xa9\x04"  # eth / GROW / Growchain
+    b"\x00\x00\x00\x01\x0a\xbd\xac\xe7\x0d\x37\x90\x23\x5a\xf4\x48\xc8\x85\x47\x60\x3b\x94\x56\x04\xea\x12\x00\xad\x03"  # eth / DNT / District0x Network Token
+    b"\x00\x00\x00\x01\x0a\xbe\xfb\x76\x11\xcb\x3a\x01\xea\x3f\xad\x85\xf3\x3c\x3c\x93\x4f\x8e\x2c\xf4\x12\x00\xb0\x03"  # eth / FRD / FARAD Cryptoken
+    b"\x00\x00\x00\x01\x0a\xef\x06\xdc\xcc\xc5\x31\xe5\x81\xf0\x44\x00\x59\xe6\xff\xcc\x20\x60\x39\xee\x08\x00\xb3\x03"  # eth / ITT / ITT Token
+    b"\x00\x00\x00\x01\x0a\xf4\x4e\x27\x84\x63\x72\x18\xdd\x1d\x32\xa3\x22\xd4\x4e\x60\x3a\x8f\x0c\x6a\x12\x00\xb6\x03"  # eth / MTX / Matryx
+    b"\x00\x00\x00\x01\x0a\xff\xa0\x6e\x7f\xbe\x5b\xc9\xa7\x64\xc9\x79\xaa\x66\xe8\x25\x6a\x63\x1f\x02\x06\x00\xb9\x04"  # eth / PLBT / Polybius
+    b"\x00\x00\x00\x01\x0b\x17\x24\xcc\x9f\xda\x01\x86\x91\x1e\xf6\xa7\x59\x49\xe9\xc0\xd3\xf0\xf2\xf3\x08\x00\xbd\x04"  # eth / RIYA / Etheriya
+    b"\x00\x00\x00\x01\x0b\x4b\xdc\x47\x87\x91\x89\x72\x74\x65\x2d\xc1\x5e\xf5\xc1\x35\xca\xe6\x1e\x60\x12\x00\xc1\x03"  # eth / DAX / DAEX
+    b"\x00\x00\x00\x01\x0b\x76\x54\x4f\x6c\x41\x3a\x55\x5f\x30\x9b\xf7\x62\x60\xd1\xe0\x23\x77\xc0\x2a\x06\x00\xc4\x03"  # eth / INT / Internet Node Token
+    b"\x00\x00\x00\x01\x0b\xb2\x17\xe4\x0f\x8a\x5c\xb7\x9a\xdf\x04\xe1\xaa\xb6\x0e\x5a\xbd\x0d\xfc\x1e\x08\x00\xc7\x05"  # eth / SWFTC / SwftCoin
+    b"\x00\x00\x00\x01\x0c\x04\xd4\xf3\x31\xda\x8d\xf7\x5f\x9e\x2e\x27\x1e\x3f\x3f\x14\x94\xc6\x6c\x36\x09\x00\xcc\x04"  # eth / PRSP / PRSP
+    b"\x00\x00\x00\x01\x0c\x91\xb0\x15\xab\xa6\xf7\xb4\x73\x8d\xcd\x36\xe7\x41\x01\x38\xb2\x9a\xdc\x29\x08\x00\xd0\x04"  # eth / COIL / CoinOil
+    b"\x00\x00\x00\x01\x0c\xf0\xee\x63\x78\x8a\x08\x49\xfe\x52\x97\xf3\x40\x7f\x70\x1e\x12\x2c\xc0\x23\x12\x00\xd4\x04"  # eth / DATA / Streamr DATAcoin
+    b"\x00\x00\x00\x01\x0c\xf7\x13\xb1\x1c\x9b\x98\x6e\xc4\x0d\x65\xbd\x4f\x7f\xbd\x50\xf6\xff\x2d\x64\x12\x00\xd8\x05"  # eth / IST34 / IST34 Token
+    b"\x00\x00\x00\x01\x0d\x26\x2e\x5d\xc4\xa0\x6a\x0f\x1c\x90\xce\x79\xc7\xa6\x0c\x09\xdf\xc8\x84\xe4\x08\x00\xdd\x03"  # eth / J8T / J8T Token
+    b"\x00\x00\x00\x01\x0d\x6d\xd9\xf6\x8d\x24\xec\x1d\x5f\xe2\x17\x4f\x3e\xc8\xda\xb5\x2b\x52\xba\xf5\x12\x00\xe0\x02"  # eth / KC / KMCC
+    b"\x00\x00\x00\x01\x0d\x87\x75\xf6\x48\x43\x06\x79\xa7\x09\xe9\x8d\x2b\x0c\xb6\x25\x0d\x28\x87\xef\x12\x00\xe2\x03"  # eth / BAT / Basic Attention Token
+    b"\x00\x00\x00\x01\x0d\x88\xed\x6e\x74\xbb\xfd\x96\xb8\x31\x23\x16\x38\xb6\x6c\x05\x57\x1e\x82\x4f\x12\x00\xe5\x03"  # eth / AVT / Aventus
+    b"\x00\x00\x00\x01\x0d\xb0\x3b\x6c\xde\x0b\x2d\x42\x7c\x64\xa0\x4f\xea\xfd\x82\x59\x38\x36\x8f\x1f\x12\x00\xe8\x05"  # eth / PDATA / PDATA
+    b"\x00\x00\x00\x01\x0d\xb8\xd8\xb7\x6b\xc3\x61\xba\xcb\xb7\x2e\x2c\x49\x1e\x06\x08\x5a\x97\xab\x31\x12\x00\xed\x03"  # eth / IQN / IQeon
+    b"\x00\x00\x00\x01\x0e\x09\x89\xb1\xf9\xb8\xa3\x89\x83\xc2\xba\x80\x53\x26\x9c\xa6\x2e\xc9\xb1\x95\x08\x00\xf0\x03"  # eth / POE / Po.et Tokens
+    b"\x00\x00\x00\x01\x0e\x3d\xe3\xb0\xe3\xd6\x17\xfd\x8d\x1d\x80\x88\x63\x9b\xa8\x77\xfe\xb4\xd7\x42\x12\x00\xf3\x08"  # eth / ROCK2PAY / ICE ROCK MINING
+    b"\x00\x00\x00\x01\x0e\x8d\x6b\x47\x1e\x33\x2f\x14\x0e\x7d\x9d\xbb\x99\xe5\xe3\x82\x2f\x72\x8d\xa6\x12\x00\xfb\x05"  # eth / ABYSS / The Abyss
+    b"\x00\x00\x00\x01\x0e\xbb\x61\x42\x04\xe4\x7c\x09\xb6\xc3\xfe\xb9\xaa\xec\xad\x8e\xe0\x60\xe2\x3e\x00\x01\x00\x04"  # eth / CPAY / Cryptopay
+    b"\x00\x00\x00\x01\x0f\x33\xbb\x20\xa2\x82\xa7\x64\x9c\x7b\x3a\xff\x64\x4f\x08\x4a\x93\x48\xe9\x33\x12\x01\x04\x05"  # eth / YUPIE / YUPIE
+    b"\x00\x00\x00\x01\x0f\x4c\xa9\x26\x60\xef\xad\x97\xa9\xa7\x0c\xb0\xfe\x96\x9c\x75\x54\x39\x77\x2c\x09\x01\x09\x03"  # eth / LEV / Leverj
+    b"\x00\x00\x00\x01\x0f\x51\x3f\xfb\x49\x26\xff\x82\xd7\xf6\x0a\x05\x06\x90\x47\xac\xa2\x95\xc4\x13\x12\x01\x0c\x03"  # eth / XSC / XSC
+    b"\x00\x00\x00\x01\x0f\x5d\x2f\xb2\x9f\xb7\xd3\xcf\xee\x44\x4a\x20\x02\x98\xf4\x68\x90\x8c\xc9\x42\x12\x01\x0f\x04"  # eth / MANA / Decentraland MANA
+    b"\x00\x00\x00\x01\x0f\x72\x71\x4b\x35\xa3\x66\x28\x5d\xf8\x58\x86\xa2\xee\x17\x46\x01\x29\x2a\x17\x12\x01\x13\x03"  # eth / 1SG / 1SG
+    b"\x00\x00\x00\x01\x0f\x8c\x45\xb8\x96\x78\x4a\x1e\x40\x85\x26\xb9\x30\x05\x19\xef\x86\x60\x20\x9c\x08\x01\x16\x03"  # eth / XMX / XMax
+    b"\x00\x00\x00\x01\x0f\xf1\x61\x07\x1e\x62\x7a\x0e\x6d\xe1\x38\x10\x5c\x73\x97\x0f\x86\xca\x79\x22\x12\x01\x19\x03"  # eth / PIT / Paypite v2
+    b"\x00\x00\x00\x01\x10\x14\x61\x3e\x2b\x3c\xbc\x4d\x57\x50\x54\xd4\x98\x2e\x58\x0d\x9b\x99\xd7\xb1\x08\x01\x1c\x03"  # eth / BCV / BitCapitalVendor Token
+    b"\x00\x00\x00\x01\x10\x3c\x3a\x20\x9d\xa5\x9d\x3e\x7c\x4a\x89\x30\x7e\x66\x52\x1e\x08\x1c\xfd\xf0\x12\x01\x1f\x03"  # eth / GVT / Genesis Vision
+    b"\x00\x00\x00\x01\x10\x63\xce\x52\x42\x65\xd5\xa3\xa6\x24\xf4\x91\x4a\xcd\x57\x3d\xd8\x9c\xe9\x88\x12\x01\x22\x03"  # eth / AIX / Aigang
+    b"\x00\x00\x00\x01\x10\x6a\xa4\x92\x95\xb5\x25\xfc\xf9\x59\xaa\x75\xec\x3f\x7d\xcb\xf5\x35\x2f\x1c\x12\x01\x25\x03"  # eth / RKT / Rock
+    b"\x00\x00\x00\x01\x10\x7c\x45\x04\xcd\x79\xc5\xd2\x69\x6e\xa0\x03\x0a\x8d\xd4\xe9\x26\x01\xb8\x2e\x12\x01\x28\x03"  # eth / BLT / Bloom
+    b"\x00\x00\x00\x01\x10\xb1\x23\xfd\xdd\xe0\x03\x24\x31\x99\xaa\xd0\x35\x22\x06\x5d\xc0\x58\x27\xa0\x12\x01\x2b\x03"  # eth / SYN / Synapse
+    b"\x00\x00\x00\x01\x11\x22\xb6\xa0\xe0\x0d\xce\x05\x63\x08\x2b\x6e\x29\x53\xf3\xa9\x43\x85\x5c\x1f\x12\x01\x2e\x05"  # eth / CENNZ / Centrality
+    b"\x00\x00\x00\x01\x11\x83\xf9\x2a\x56\x24\xd6\x8e\x85\xff\xb9\x17\x0f\x16\xbf\x04\x43\xb4\xc2\x42\x12\x01\x33\x03"  # eth / QVT / QVT
+    b"\x00\x00\x00\x01\x12\x34\x56\x74\x61\xd3\xf8\xdb\x74\x96\x58\x17\x74\xbd\x86\x9c\x83\xd5\x1c\x93\x12\x01\x36\x0e"  # eth / CAT (BitClave) / BitClave
+    b"\x00\x00\x00\x01\x12\x3a\xb1\x95\xdd\x38\xb1\xb4\x05\x10\xd4\x67\xa6\xa3\x59\xb2\x01\xaf\x05\x6f\x08\x01\x44\x03"  # eth / LGO / LGO Exchange
+    b"\x00\x00\x00\x01\x12\x45\xef\x80\xf4\xd9\xe0\x2e\xd9\x42\x53\x75\xe8\xf6\x49\xb9\x22\x1b\x31\xd8\x08\x01\x47\x04"  # eth / ARCT / ArbitrageCT
+    b"\x00\x00\x00\x01\x12\x48\x0e\x24\xeb\x5b\xec\x1a\x9d\x43\x69\xca\xb6\xa8\x0c\xad\x3c\x0a\x37\x7a\x02\x01\x4b\x03"  # eth / SUB / Substratum
+    b"\x00\x00\x00\x01\x12\x75\x95\x12\xd3\x26\x30\x3b\x45\xf1\xce\xc8\xf7\xb6\xfd\x96\xf3\x87\x77\x8e\x12\x01\x4e\x04"  # eth / TRAK / TrakInvest
+    b"\x00\x00\x00\x01\x12\xb1\x9d\x3e\x2c\xcc\x14\xda\x04\xfa\xe3\x3e\x63\x65\x2c\xe4\x69\xb3\xf2\xfd\x0c\x01\x52\x04"  # eth / GRID / Grid+
+    b"\x00\x00\x00\x01\x12\xb3\x06\xfa\x98\xf4\xcb\xb8\xd4\x45\x7f\xdf\xf3\xa0\xa0\xa5\x6f\x07\xcc\xdf\x12\x01\x56\x04"  # eth / SXDT / Spectre.ai D-Token
+    b"\x00\x00\x00\x01\x12\xfc\xd6\x46\x3e\x66\x97\x4c\xf7\xbb\xc2\x4f\xfc\x4d\x40\xd6\xbe\x45\x82\x83\x12\x01\x5a\x03"  # eth / GBX / Globitex
+    b"\x00\x00\x00\x01\x12\xfe\xf5\xe5\x7b\xf4\x58\x73\xcd\x9b\x62\xe9\xdb\xd7\xbf\xb9\x9e\x32\xd7\x3e\x12\x01\x5d\x03"  # eth / CFI / Cofound.it
+    b"\x00\x00\x00\x01\x13\x8a\x87\x52\x09\x3f\x4f\x9a\x79\xaa\xed\xf4\x8d\x4b\x92\x48\xfa\xb9\x3c\x9c\x12\x01\x60\x03"  # eth / MCI / Musiconomi
+    b"\x00\x00\x00\x01\x13\x9d\x93\x97\x27\x4b\xb9\xe2\xc2\x9a\x9a\xa8\xaa\x0b\x58\x74\xd3\x0d\x62\xe3\x12\x01\x63\x05"  # eth / BOUTS / BoutsPro
+    b"\x00\x00\x00\x01\x13\xc2\xfa\xb6\x35\x4d\x37\x90\xd8\xec\xe4\xf0\xf1\xa3\x28\x0b\x4a\x25\xad\x96\x12\x01\x68\x03"  # eth / PHI / PHI Token
+    b"\x00\x00\x00\x01\x13\xcb\x85\x82\x3f\x78\xcf\xf3\x8f\x0b\x0e\x90\xd3\xe9\x75\xb8\xcb\x3a\xad\x64\x12\x01\x6b\x04"  # eth / REMI / REMI
+    b"\x00\x00\x00\x01\x13\xdb\x74\xb3\xcf\x51\x2f\x65\xc4\xb9\x16\x83\x94\x0b\x4f\x39\x55\xe0\x50\x85\x08\x01\x6f\x03"  # eth / SKE / Super Keep Token
+    b"\x00\x00\x00\x01\x13\xf1\x1c\x99\x05\xa0\x8c\xa7\x6e\x3e\x85\x3b\xe6\x3d\x4f\x09\x44\x32\x6c\x72\x12\x01\x72\x04"  # eth / DIVX / DIVX
+    b"\x00\x00\x00\x01\x13\xf1\xb7\xfd\xfb\xe1\xfc\x66\x67\x6d\x56\x48\x3e\x21\xb1\xec\xb4\x0b\x58\xe2\x12\x01\x76\x03"  # eth / ACC / Accelerator Network
+    b"\x00\x00\x00\x01\x14\x10\x43\x4b\x03\x46\xf5\xbe\x67\x8d\x0f\xb5\x54\xe5\xc7\xab\x62\x0f\x8f\x4a\x12\x01\x79\x03"  # eth / KAN / BitKan
+    b"\x00\x00\x00\x01\x14\x60\xa5\x80\x96\xd8\x0a\x50\xa2\xf1\xf9\x56\xdd\xa4\x97\x61\x1f\xa4\xf1\x65\x12\x01\x7c\x03"  # eth / CHX / Own
+    b"\x00\x00\x00\x01\x14\xc9\x26\xf2\x29\x00\x44\xb6\x47\xe1\xbf\x20\x72\xe6\x7b\x49\x5e\xff\x19\x05\x12\x01\x7f\x06"  # eth / BETHER / Bethereum
+    b"\x00\x00\x00\x01\x14\xf3\x7b\x57\x42\x42\xd3\x66\x55\x8d\xb6\x1f\x33\x35\x28\x9a\x50\x35\xc5\x06\x03\x01\x85\x03"  # eth / HKG / HKG
+    b"\x00\x00\x00\x01\x15\x12\x02\xc9\xc1\x8e\x49\x56\x56\xf3\x72\x28\x1f\x49\x3e\xb7\x69\x89\x61\xd5\x12\x01\x88\x03"  # eth / DEB / DEBITUM
+    b"\x00\x00\x00\x01\x15\x3e\xd9\xcc\x1b\x79\x29\x79\xd2\xbd\xe0\xbb\xf4\x5c\xc2\xa7\xe4\x36\xa5\xf9\x12\x01\x8b\x03"  # eth / XOV / XOVBank
+    b"\x00\x00\x00\x01\x16\x37\x33\xbc\xc2\x8d\xbf\x26\xb4\x1a\x8c\xfa\x83\xe3\x69\xb5\xb3\xaf\x74\x1b\x12\x01\x8e\x03"  # eth / PRS / Persians
+    b"\x00\x00\x00\x01\x16\x66\x2f\x73\xdf\x3e\x79\xe5\x4c\x6c\x59\x38\xb4\x31\x3f\x92\xc5\x24\xc1\x20\x12\x01\x91\x03"  # eth / IIC / IIC
+    b"\x00\x00\x00\x01\x16\x82\x96\xbb\x09\xe2\x4a\x88\x80\x5c\xb9\xc3\x33\x56\x53\x6b\x98\x0d\x3f\xc5\x08\x01\x94\x04"  # eth / RHOC / RChain
+    b"\x00\x00\x00\x01\x16\xaf\x5b\xfb\x4a\xe7\xe4\x75\xb9\xad\xc3\xbf\x5c\xb2\xf1\xe6\xa5\x0d\x79\x40\x08\x01\x98\x03"  # eth / XFS / Fanship
+    b"\x00\x00\x00\x01\x16\xb0\xe6\x2a\xc1\x3a\x2f\xae\xd3\x6d\x18\xbc\xe2\x35\x6d\x25\xab\x3c\xfa\xd3\x12\x01\x9b\x03"  # eth / BTQ / Bitcoin Boutique
+    b"\x00\x00\x00\x01\x16\xf8\x12\xbe\x7f\xff\x02\xca\xf6\x62\xb8\x5d\x5d\x58\xa5\xda\x65\x72\xd4\xdf\x08\x01\x9e\x03"  # eth / UTT / United Traders Token
+    b"\x00\x00\x00\x01\x17\x0b\x27\x5c\xed\x08\x9f\xff\xae\xbf\xe9\x27\xf4\x45\xa3\x50\xed\x91\x60\xdc\x08\x01\xa1\x03"  # eth / OWN / OWNDATA
+    b"\x00\x00\x00\x01\x17\x1d\x75\x0d\x42\xd6\x61\xb6\x2c\x27\x7a\x6b\x48\x6a\xdb\x82\x34\x8c\x3e\xca\x12\x01\xa4\x04"  # eth / ECOM / Omnitude
+    b"\x00\x00\x00\x01\x17\x76\xe1\xf2\x6f\x98\xb1\xa5\xdf\x9c\xd3\x47\x95\x3a\x26\xdd\x3c\xb4\x66\x71\x12\x01\xa8\x03"  # eth / NMR / Numerai
+    b"\x00\x00\x00\x01\x17\x7d\x39\xac\x67\x6e\xd1\xc6\x7a\x2b\x26\x8a\xd7\xf1\xe5\x88\x26\xe5\xb0\xaf\x12\x01\xab\x03"  # eth / CDT / CoinDash
+    b"\x00\x00\x00\x01\x17\xe6\x7d\x1c\xb4\xe3\x49\xb9\xca\x4b\xc3\xe1\x7c\x7d\xf2\xa3\x97\xa7\xbb\x64\x12\x01\xae\x04"  # eth / FREC / Freyrchain
+    b"\x00\x00\x00\x01\x17\xf8\xaf\xb6\x3d\xfc\xdc\xc9\x0e\xbe\x6e\x84\xf0\x60\xcc\x30\x6a\x98\x25\x7d\x12\x01\xb2\x04"  # eth / NBAI / NebulaAiToken
+    b"\x00\x00\x00\x01\x17\xf9\x34\x75\xd2\xa9\x78\xf5\x27\xc3\xf7\xc4\x4a\xbf\x44\xad\xfb\xa6\x0d\x5c\x02\x01\xb6\x04"  # eth / ECO2 / EtherCO2
+    b"\x00\x00\x00\x01\x18\x1a\x63\x74\x6d\x3a\xdc\xf3\x56\xcb\xc7\x3a\xce\x22\x83\x2f\xfb\xb1\xee\x5a\x08\x01\xba\x04"  # eth / ALCO / ALCO
+    b"\x00\x00\x00\x01\x18\x29\xaa\x04\x5e\x21\xe0\xd5\x95\x80\x02\x4a\x95\x1d\xb4\x80\x96\xe0\x17\x82\x12\x01\xbe\x03"  # eth / FXT / FuzeX
+    b"\x00\x00\x00\x01\x18\x44\xb2\x15\x93\x26\x26\x68\xb7\x24\x8d\x0f\x57\xa2\x20\xca\xab\xa4\x6a\xb9\x12\x01\xc1\x03"  # eth / PRL / Oyster Pearl
+    b"\x00\x00\x00\x01\x19\x0e\x56\x9b\xe0\x71\xf4\x0c\x70\x4e\x15\x82\x5f\x28\x54\x81\xcb\x74\xb6\xcc\x0c\x01\xc4\x03"  # eth / FAM / FAM
+    b"\x00\x00\x00\x01\x19\x61\xb3\x33\x19\x69\xed\x52\x77\x07\x51\xfc\x71\x8e\xf5\x30\x83\x8b\x6d\xee\x12\x01\xc7\x03"  # eth / BDG / BitDegree Token
+    b"\x00\x00\x00\x01\x19\x66\xd7\x18\xa5\x65\x56\x6e\x8e\x20\x27\x92\x65\x8d\x7b\x5f\xf4\xec\xe4\x69\x12\x01\xca\x03"  # eth / NDX / nDEX
+    b"\x00\x00\x00\x01\x19\x85\x36\x5e\x9f\x78\x35\x9a\x9b\x6a\xd7\x60\xe3\x24\x12\xf4\xa4\x45\xe8\x62\x12\x01\xcd\x03"  # eth / REP / Augur
+    b"\x00\x00\x00\x01\x19\x8a\x87\xb3\x11\x41\x43\x91\x3d\x42\x29\xfb\x0f\x6d\x4b\xcb\x44\xaa\x8a\xff\x08\x01\xd0\x04"  # eth / SNBL / Snowball
+    b"\x00\x00\x00\x01\x1a\x0f\x2a\xb4\x6e\xc6\x30\xf9\xfd\x63\x80\x29\x02\x7b\x55\x2a\xfa\x64\xb9\x4c\x12\x01\xd4\x03"  # eth / ATX / Aston
+    b"\x00\x00\x00\x01\x1a\x7a\x8b\xd9\x10\x6f\x2b\x8d\x97\x7e\x08\x58\x2d\xc7\xd2\x4c\x72\x3a\xb0\xdb\x12\x01\xd7\x04"  # eth / APPC / AppCoins
+    b"\x00\x00\x00\x01\x1a\x95\xb2\x71\xb0\x53\x5d\x15\xfa\x49\x93\x2d\xab\xa3\x1b\xa6\x12\xb5\x29\x46\x08\x01\xdb\x03"  # eth / MNE / Minereum
+    b"\x00\x00\x00\x01\x1b\x22\xc3\x2c\xd9\x36\xcb\x97\xc2\x8c\x56\x90\xa0\x69\x5a\x82\xab\xf6\x88\xe6\x12\x01\xde\x04"  # eth / WISH / MyWish
+    b"\x00\x00\x00\x01\x1b\x5f\x21\xee\x98\xee\xd4\x8d\x29\x2e\x8e\x2d\x3e\xd8\x2b\x40\xa9\x72\x8a\x22\x12\x01\xe2\x0a"  # eth / DATABroker / DataBrokerDAO Token
+    b"\x00\x00\x00\x01\x1b\x79\x3e\x49\x23\x77\x58\xdb\xd8\xb7\x52\xaf\xc9\xeb\x4b\x32\x9d\x5d\xa0\x16\x12\x01\xec\x04"  # eth / VITE / Vite
+    b"\x00\x00\x00\x01\x1b\x97\x43\xf5\x56\xd6\x5e\x75\x7c\x4c\x65\x0b\x45\x55\xba\xf3\x54\xcb\x8b\xd3\x0c\x01\xf0\x04"  # eth / ETBS / Ethbits
+    b"\x00\x00\x00\x01\x1b\xcb\xc5\x41\x66\xf6\xba\x14\x99\x34\x87\x0b\x60\x50\x61\x99\xb6\xc9\xdb\x6d\x0a\x01\xf4\x03"  # eth / ROC / ROC
+    b"\x00\x00\x00\x01\x1c\x44\x81\x75\x0d\xaa\x5f\xf5\x21\xa2\xa7\x49\x0d\x99\x81\xed\x46\x46\x5d\xbd\x12\x01\xf7\x04"  # eth / BCPT / BlockMason Credit Protocol Token
+    b"\x00\x00\x00\x01\x1c\x62\xac\xa2\xb7\x60\x5d\xb3\x60\x6e\xac\xda\x7b\xc6\x7a\x18\x57\xdd\xb8\xff\x12\x01\xfb\x05"  # eth / SONIQ / Soniq
+    b"\x00\x00\x00\x01\x1c\x79\xab\x32\xc6\x6a\xca\xa1\xe9\xe8\x19\x52\xb8\xaa\xa5\x81\xb4\x3e\x54\xe7\x04\x02\x00\x04"  # eth / TEAM / TEAM (TokenStars)
+    b"\x00\x00\x00\x01\x1c\x83\x50\x14\x78\xf1\x32\x09\x77\x04\x70\x08\x49\x6d\xac\xbd\x60\xbb\x15\xef\x12\x02\x04\x04"  # eth / DGTX / DigitexFutures
+    b"\x00\x00\x00\x01\x1c\xa4\x3a\x17\x0b\xad\x61\x93\x22\xe6\xf5\x4d\x46\xb5\x7e\x50\x4d\xb6\x63\xaa\x12\x02\x08\x03"  # eth / AKC / ARTWOOK COIN
+    b"\x00\x00\x00\x01\x1c\xb3\x20\x9d\x45\xb2\xa6\x0b\x7f\xbc\xa1\xcc\xdb\xf8\x7f\x67\x42\x37\xa4\xaa\x04\x02\x0b\x03"  # eth / THR / ThoreCoin
+    b"\x00\x00\x00\x01\x1c\xca\xa0\xf2\xa7\x21\x0d\x76\xe1\xfd\xec\x74\x0d\x5f\x32\x3e\x2e\x1b\x16\x72\x12\x02\x0e\x04"  # eth / FACE / Faceter
+    b"\x00\x00\x00\x01\x1d\x46\x24\x14\xfe\x14\xcf\x48\x9c\x7a\x21\xca\xc7\x85\x09\xf4\xbf\x8c\xd7\xc0\x06\x02\x12\x03"  # eth / CAN / CanYaCoin
+    b"\x00\x00\x00\x01\x1d\x4c\xcc\x31\xda\xb6\xea\x20\xf4\x61\xd3\x29\xa0\x56\x2c\x1c\x58\x41\x25\x15\x12\x02\x15\x05"  # eth / TALAO / Talao
+    b"\x00\x00\x00\x01\x1d\xea\x97\x9a\xe7\x6f\x26\x07\x18\x70\xf8\x24\x08\x8d\xa7\x89\x79\xeb\x91\xc8\x12\x02\x1a\x03"  # eth / SPD / SPINDLE
+    b"\x00\x00\x00\x01\x1e\x09\xbd\x8c\xad\xb4\x41\x63\x2e\x44\x1d\xb3\xe1\xd7\x99\x09\xee\x0a\x22\x56\x01\x02\x1d\x03"  # eth / DSC / Digital Safe Coin
+    b"\x00\x00\x00\x01\x1e\x26\xb3\xd0\x7e\x57\xf4\x53\xca\xe3\x0f\x7d\xdd\x2f\x94\x5f\x5b\xf3\xef\x33\x08\x02\x20\x04"  # eth / XCLR / ClearCoin
+    b"\x00\x00\x00\x01\x1e\x49\xff\x77\xc3\x55\xa3\xe3\x8d\x66\x51\xce\x84\x04\xaf\x0e\x48\xc5\x39\x5f\x12\x02\x24\x04"  # eth / MTRc / MTRCToken
+    b"\x00\x00\x00\x01\x1e\x79\x7c\xe9\x86\xc3\xcf\xf4\x47\x2f\x7d\x38\xd5\xc4\xab\xa5\x5d\xfe\xfe\x40\x0f\x02\x28\x04"  # eth / BCDN / BlockCDN
+    b"\x00\x00\x00\x01\x1e\xc8\xfe\x51\xa9\xb6\xa3\xa6\xc4\x27\xd1\x7d\x9e\xcc\x30\x60\xfb\xc4\xa4\x5c\x12\x02\x2c\x07"  # eth / S-A-PAT / S-A-PAT
+    b"\x00\x00\x00\x01\x1f\x54\x63\x8b\x77\x37\x19\x3f\xfd\x86\xc1\x9e\xc5\x19\x07\xa7\xc4\x17\x55\xd8\x06\x02\x33\x03"  # eth / SOL / Sola Token
+    b"\x00\x00\x00\x01\x1f\x57\x3d\x6f\xb3\xf1\x3d\x68\x9f\xf8\x44\xb4\xce\x37\x79\x4d\x79\xa7\xff\x1c\x12\x02\x36\x03"  # eth / BNT / Bancor
+    b"\x00\x00\x00\x01\x1f\xe7\x0b\xe7\x34\xe4\x73\xe5\x72\x1e\xa5\x7c\x8b\x5b\x01\xe6\xca\xa5\x26\x86\x12\x02\x39\x04"  # eth / RNTB / BitRent
+    b"\x00\x00\x00\x01\x20\x08\xe3\x05\x7b\xd7\x34\xe1\x0a\xd1\x3c\x9e\xae\x45\xff\x13\x2a\xbc\x17\x22\x08\x02\x3d\x03"  # eth / ZCO / Zebi
+    b"\x00\x00\x00\x01\x20\x23\xdc\xf7\xc4\x38\xc8\xc8\xc0\xb0\xf2\x8d\xba\xe1\x55\x20\xb4\xf3\xee\x20\x12\x02\x40\x03"  # eth / FTR / Futourist Token
+    b"\x00\x00\x00\x01\x20\xe9\x48\x67\x79\x4d\xba\x03\x0e\xe2\x87\xf1\x40\x6e\x10\x0d\x03\xc8\x4c\xd3\x12\x02\x43\x03"  # eth / DEW / DEW
+    b"\x00\x00\x00\x01\x20\xf7\xa3\xdd\xf2\x44\xdc\x92\x99\x97\x5b\x4d\xa1\xc3\x9f\x8d\x5d\x75\xf0\x5a\x06\x02\x46\x03"  # eth / SPN / Sapien
+    b"\x00\x00\x00\x01\x21\x08\xe6\x2d\x33\x5b\xbd\xc8\x9e\xc3\xe9\xd8\x58\x2f\x18\xdc\xfb\x0c\xdf\xf4\x08\x02\x49\x05"  # eth / CARCO / CARCO
+    b"\x00\x00\x00\x01\x21\x34\x05\x7c\x0b\x46\x1f\x89\x8d\x37\x5c\xea\xd6\x52\xac\xae\x62\xb5\x95\x41\x12\x02\x4e\x03"  # eth / CXC / CoxxxCoin
+    b"\x00\x00\x00\x01\x21\xae\x23\xb8\x82\xa3\x40\xa2\x22\x82\x16\x20\x86\xbc\x98\xd3\xe2\xb7\x30\x18\x12\x02\x51\x03"  # eth / LOK / LOK
+    b"\x00\x00\x00\x01\x21\xf0\xf0\xfd\x31\x41\xee\x9e\x11\xb3\xd7\xf1\x3a\x10\x28\xcd\x51\x5f\x45\x9c\x12\x02\x54\x03"  # eth / MRP / MoneyRebel Token
+    b"\x00\x00\x00\x01\x22\x33\x79\x9e\xe2\x68\x3d\x75\xdf\xef\xac\xbc\xd2\xa2\x6c\x78\xd3\x4b\x47\x0d\x12\x02\x57\x04"  # eth / NTWK / Network
+    b"\x00\x00\x00\x01\x22\x60\xfa\xc5\xe5\x54\x2a\x77\x3a\xa4\x4f\xbc\xfe\xdf\x7c\x19\x3b\xc2\xc5\x99\x08\x02\x5b\x04"  # eth / WBTC / Wrapped Bitcoin
+    b"\x00\x00\x00\x01\x22\x8b\xa5\x14\x30\x9f\xfd\xf0\x3a\x81\xa2\x05\xa6\xd0\x40\xe4\x29\xd6\xe8\x0c\x12\x02\x5f\x03"  # eth / GSC / Global Social Chain
+    b"\x00\x00\x00\x01\x22\xf0\xaf\x8d\x78\x85\x1b\x72\xee\x79\x9e\x05\xf5\x4a\x77\x00\x15\x86\xb1\x8a\x0a\x02\x62\x04"  # eth / GXVC / Genevieve VC
+    b"\x00\x00\x00\x01\x23\x35\x20\x36\xe9\x11\xa2\x2c\xfc\x69\x2b\x5e\x2e\x19\x66\x92\x65\x8a\xde\xd9\x12\x02\x66\x03"  # eth / FDZ / Friendz
+    b"\x00\x00\x00\x01\x23\xae\x3c\x5b\x39\xb1\x2f\x06\x93\xe0\x54\x35\xee\xaa\x1e\x51\xd8\xc6\x15\x30\x12\x02\x69\x03"  # eth / APT / AIGang
+    b"\x00\x00\x00\x01\x23\xb7\x5b\xc7\xaa\xf2\x8e\x2d\x66\x28\xc3\xf4\x24\xb3\x88\x2f\x8f\x07\x2a\x3c\x12\x02\x6c\x03"  # eth / VIT / Vice Industry Token
+    b"\x00\x00\x00\x01\x24\x08\x3b\xb3\x00\x72\x64\x3c\x3b\xb9\x0b\x44\xb7\x28\x58\x60\xa7\x55\xe6\x87\x12\x02\x6f\x04"  # eth / GELD / GELD
+    b"\x00\x00\x00\x01\x24\x1b\xa6\x72\x57\x4a\x78\xa3\xa6\x04\xcd\xd0\xa9\x44\x29\xa7\x3a\x84\xa3\x24\x12\x02\x73\x05"  # eth / KWATT / 4NEW
+    b"\x00\x00\x00\x01\x24\x5e\xf4\x7d\x4d\x05\x05\xec\xf3\xac\x46\x3f\x4d\x81\xf4\x1a\xde\x8f\x1f\xd1\x12\x02\x78\x03"  # eth / NUG / Nuggets Token
+    b"\x00\x00\x00\x01\x24\x67\xaa\x6b\x5a\x23\x51\x41\x6f\xd4\xc3\xde\xf8\x46\x2d\x84\x1f\xee\xec\xec\x12\x02\x7b\x03"  # eth / QBX / qiibeeToken
+    b"\x00\x00\x00\x01\x24\x69\x27\x91\xbc\x44\x4c\x5c\xd0\xb8\x1e\x3c\xbc\xab\xa4\xb0\x4a\xcd\x1f\x3b\x12\x02\x7e\x03"  # eth / UKG / UnikoinGold
+    b"\x00\x00\x00\x01\x24\x75\x51\xf2\xeb\x33\x62\xe2\x22\xc7\x42\xe9\xc7\x88\xb8\x95\x7d\x9b\xc8\x7e\x12\x02\x81\x03"  # eth / GNY / GNY
+    b"\x00\x00\x00\x01\x24\xa7\x7c\x1f\x17\xc5\x47\x10\x5e\x14\x81\x3e\x51\x7b\xe0\x6b\x00\x40\xaa\x76\x12\x02\x84\x04"  # eth / LIVE / LIVE Token
+    b"\x00\x00\x00\x01\x24\xae\xf3\xbf\x1a\x47\x56\x15\x00\xf9\x43\x0d\x74\xed\x40\x97\xc4\x7f\x51\xf2\x04\x02\x88\x06"  # eth / SPARTA / SPARTA
+    b"\x00\x00\x00\x01\x24\xdc\xc8\x81\xe7\xdd\x73\x05\x46\x83\x44\x52\xf2\x18\x72\xd5\xcb\x4b\x52\x93\x12\x02\x8e\x04"  # eth / SCRL / SCRL
+    b"\x00\x00\x00\x01\x24\xdd\xff\x6d\x8b\x8a\x42\xd8\x35\xaf\x3b\x44\x0d\xe9\x1f\x33\x86\x55\x4a\xa4\x12\x02\x92\x03"  # eth / ING / Iungo
+    b"\x00\x00\x00\x01\x25\x3c\x7d\xd0\x74\xf4\xba\xcb\x30\x53\x87\xf9\x22\x22\x5a\x4f\x73\x7c\x08\xbd\x12\x02\x95\x04"  # eth / LOOK / LookRev
+    b"\x00\x00\x00\x01\x25\x5a\xa6\xdf\x07\x54\x0c\xb5\xd3\xd2\x97\xf0\xd0\xd4\xd8\x4c\xb5\x2b\xc8\xe6\x12\x02\x99\x03"  # eth / RDN / Raiden Network
+    b"\x00\x00\x00\x01\x25\xb6\x32\x5f\x5b\xb1\xc1\xe0\x3c\xfb\xc3\xe5\x3f\x47\x0e\x1f\x1c\xa0\x22\xe3\x12\x02\x9c\x03"  # eth / LML / Lisk Machine Learning
+    b"\x00\x00\x00\x01\x26\x04\xfa\x40\x6b\xe9\x57\xe5\x42\xbe\xb8\x9e\x67\x54\xfc\xde\x68\x15\xe8\x3f\x12\x02\x9f\x03"  # eth / PKT / Playkey
+    b"\x00\x00\x00\x01\x26\x3c\x61\x84\x80\xdb\xe3\x5c\x30\x0d\x8d\x5e\xcd\xa1\x9b\xbb\x98\x6a\xca\xed\x12\x02\xa2\x03"  # eth / MOT / Olympus Labs
+    b"\x00\x00\x00\x01\x26\x4d\xc2\xde\xdc\xdc\xbb\x89\x75\x61\xa5\x7c\xba\x50\x85\xca\x41\x6f\xb7\xb4\x12\x02\xa5\x03"  # eth / QUN / QunQun
+    b"\x00\x00\x00\x01\x26\xdb\x54\x39\xf6\x51\xca\xf4\x91\xa8\x7d\x48\x79\x9d\xa8\x1f\x19\x1b\xdb\x6b\x08\x02\xa8\x03"  # eth / CBC / CashBet Coin
+    b"\x00\x00\x00\x01\x26\xe7\x53\x07\xfc\x0c\x02\x14\x72\xfe\xb8\xf7\x27\x83\x95\x31\xf1\x12\xf3\x17\x12\x02\xab\x03"  # eth / C20 / Crypto20's Token
+    b"\x00\x00\x00\x01\x27\x05\x4b\x13\xb1\xb7\x98\xb3\x45\xb5\x91\xa4\xd2\x2e\x65\x62\xd4\x7e\xa7\x5a\x04\x02\xae\x03"  # eth / AST / Airswap
+    b"\x00\x00\x00\x01\x27\x69\x5e\x09\x14\x9a\xdc\x73\x8a\x97\x8e\x9a\x67\x8f\x99\xe4\xc3\x9e\x9e\xb9\x08\x02\xb1\x04"  # eth / KICK / KICK
+    b"\x00\x00\x00\x01\x27\xdc\xe1\xec\x4d\x3f\x72\xc3\xe4\x57\xcc\x50\x35\x4f\x1f\x97\x5d\xde\xf4\x88\x08\x02\xb5\x03"  # eth / AIR / AirToken
+    b"\x00\x00\x00\x01\x28\x57\x7a\x6d\x31\x55\x9b\xd2\x65\xce\x3a\xdb\x62\xd0\x45\x85\x50\xf7\xb8\xa7\x12\x02\xb8\x17"  # eth / CCC (CryptoCrashCourse) / CryptoCrashCourse
+    b"\x00\x00\x00\x01\x28\x59\x02\x1e\xe7\xf2\xcb\x10\x16\x2e\x67\xf3\x3a\xf2\xd2\x27\x64\xb3\x1a\xff\x04\x02\xcf\x04"  # eth / SNTR / Silent Notary
+    b"\x00\x00\x00\x01\x28\x67\x08\xf0\x69\x22\x59\x05\x19\x46\x73\x75\x5f\x12\x35\x9e\x6a\xff\x6f\xe1\x12\x02\xd3\x05"  # eth / STACS / STACS
+    b"\x00\x00\x00\x01\x28\x6b\xda\x14\x13\xa2\xdf\x81\x73\x1d\x49\x30\xce\x2f\x86\x2a\x35\xa6\x09\xfe\x12\x02\xd8\x04"  # eth / WABI / Tael
+    b"\x00\x00\x00\x01\x28\xb5\xe1\x2c\xce\x51\xf1\x55\x94\xb0\xb9\x1d\x5b\x5a\xda\xa7\x0f\x68\x4a\x02\x02\x02\xdc\x03"  # eth / NPX / NaPoleonX
+    b"\x00\x00\x00\x01\x28\xc8\xd0\x1f\xf6\x33\xea\x9c\xd8\xfc\x6a\x45\x1d\x74\x57\x88\x9e\x69\x8d\xe6\x00\x02\xdf\x03"  # eth / ETG / Ethereum Gold
+    b"\x00\x00\x00\x01\x28\xde\xe0\x1d\x53\xfe\xd0\xed\xf5\xf6\xe3\x10\xbf\x8e\xf9\x31\x15\x13\xae\x40\x12\x02\xe2\x03"  # eth / XBP / BlitzPredict
+    b"\x00\x00\x00\x01\x29\xd7\x52\x77\xac\x7f\x03\x35\xb2\x16\x5d\x08\x95\xe8\x72\x5c\xbf\x65\x8d\x73\x08\x02\xe5\x04"  # eth / CSNO / BitDice
+    b"\x00\x00\x00\x01\x2a\x05\xd2\x2d\xb0\x79\xbc\x40\xc2\xf7\x7a\x1d\x1f\xf7\x03\xa5\x6e\x63\x1c\xc1\x08\x02\xe9\x03"  # eth / BAS / BitAsean
+    b"\x00\x00\x00\x01\x2a\x09\x3b\xcf\x0c\x98\xef\x74\x4b\xb6\xf6\x9d\x74\xf2\xf8\x56\x05\x32\x42\x90\x08\x02\xec\x04"  # eth / FOOD / FoodCoin
+    b"\x00\x00\x00\x01\x2a\x1d\xba\xbe\x65\xc5\x95\xb0\x02\x2e\x75\x20\x8c\x34\x01\x41\x39\xd5\xd3\x57\x12\x02\xf0\x03"  # eth / TDH / TrustedHealth
+    b"\x00\x00\x00\x01\x2a\x22\xe5\xcc\xa0\x0a\x3d\x63\x30\x8f\xa3\x9f\x29\x20\x2e\xb1\xb3\x9e\xef\x52\x12\x02\xf3\x03"  # eth / EDU / EDU Token
+    b"\x00\x00\x00\x01\x2a\xec\x18\xc5\x50\x0f\x21\x35\x9c\xe1\xbe\xa5\xdc\x17\x77\x34\x4d\xf4\xc0\xdc\x12\x02\xf6\x03"  # eth / FTT / FarmaTrust Token
+    b"\x00\x00\x00\x01\x2b\xaa\xc9\x33\x0c\xf9\xac\x47\x9d\x81\x91\x95\x79\x4d\x79\xad\x0c\x76\x16\xe3\x12\x02\xf9\x03"  # eth / ADB / adbank
+    b"\x00\x00\x00\x01\x2b\xdc\x0d\x42\x99\x60\x17\xfc\xe2\x14\xb2\x16\x07\xa5\x15\xda\x41\xa9\xe0\xc5\x06\x02\xfc\x04"  # eth / SKIN / SKIN
+    b"\x00\x00\x00\x01\x2c\x3c\x1f\x05\x18\x7d\xba\x7a\x5f\x2d\xd4\x7d\xca\x57\x28\x1c\x4d\x4f\x18\x3f\x12\x03\x00\x03"  # eth / QTQ / TiiQu's Q Token
+    b"\x00\x00\x00\x01\x2c\x4e\x8f\x2d\x74\x61\x13\xd0\x69\x6c\xe8\x9b\x35\xf0\xd8\xbf\x88\xe0\xae\xca\x12\x03\x03\x03"  # eth / OST / Simple Token 'OST'
+    b"\x00\x00\x00\x01\x2c\x82\xc7\x3d\x5b\x34\xaa\x01\x59\x89\x46\x2b\x29\x48\xcd\x61\x6a\x37\x64\x1f\x12\x03\x06\x04"  # eth / SXUT / Spectre.ai U-Token
+    b"\x00\x00\x00\x01\x2c\x97\x4b\x2d\x0b\xa1\x71\x6e\x64\x4c\x1f\xc5\x99\x82\xa8\x9d\xdd\x2f\xf7\x24\x12\x03\x0a\x03"  # eth / VIB / Viberate
+    b"\x00\x00\x00\x01\x2c\xcb\xff\x3a\x04\x2c\x68\x71\x6e\xd2\xa2\xcb\x0c\x54\x4a\x9f\x1d\x19\x35\xe1\x08\x03\x0d\x03"  # eth / DMT / DMarket Token
+    b"\x00\x00\x00\x01\x2c\xf6\x18\xc1\x90\x41\xd9\xdb\x33\x0d\x82\x22\xb8\x60\xa6\x24\x02\x1f\x30\xfb\x12\x03\x10\x04"  # eth / CRBT / Cruisebit
+    b"\x00\x00\x00\x01\x2d\x0e\x95\xbd\x47\x95\xd7\xac\xe0\xda\x3c\x0f\xf7\xb7\x06\xa5\x97\x0e\xb9\xd3\x12\x03\x14\x03"  # eth / SOC / All Sports
+    b"\x00\x00\x00\x01\x2e\x07\x1d\x29\x66\xaa\x7d\x8d\xec\xb1\x00\x58\x85\xba\x19\x77\xd6\x03\x8a\x65\x10\x03\x17\x04"  # eth / DICE / Etheroll
+    b"\x00\x00\x00\x01\x2e\xb8\x6e\x8f\xc5\x20\xe0\xf6\xbb\x5d\x9a\xf0\x8f\x92\x4f\xe7\x05\x58\xab\x89\x08\x03\x1b\x03"  # eth / LGR / Logarithm
+    b"\x00\x00\x00\x01\x2e\xcb\x13\xa8\xc4\x58\xc3\x79\xc4\xd9\xa7\x25\x9e\x20\x2d\xe0\x3c\x8f\x3d\x19\x12\x03\x1e\x02"  # eth / BC / Block-Chain.com
+    b"\x00\x00\x00\x01\x2e\xf1\xab\x8a\x26\x18\x7c\x58\xbb\x8a\xae\xb1\x1b\x2f\xc6\xd2\x5c\x5c\x07\x16\x12\x03\x20\x03"  # eth / TWN / The World News
+    b"\x00\x00\x00\x01\x2f\x85\xe5\x02\xa9\x88\xaf\x76\xf7\xee\x6d\x83\xb7\xdb\x8d\x6c\x0a\x82\x3b\xf9\x08\x03\x23\x04"  # eth / LATX / LatiumX
+    b"\x00\x00\x00\x01\x2f\xa3\x2a\x39\xfc\x1c\x39\x9e\x0c\xc7\xb2\x93\x58\x68\xf5\x16\x5d\xe7\xce\x97\x08\x03\x27\x03"  # eth / PFR / Payfair
+    b"\x00\x00\x00\x01\x30\xce\xcb\x54\x61\xa4\x49\xa9\x00\x81\xf5\xa5\xf5\x5d\xb4\xe0\x48\x39\x7b\xab\x08\x03\x2a\x04"  # eth / TRCT / Tracto
+    b"\x00\x00\x00\x01\x30\xf4\xa3\xe0\xab\x7a\x76\x73\x3d\x8b\x60\xb8\x9d\xd9\x3c\x3d\x0b\x4c\x9e\x2f\x12\x03\x2e\x03"  # eth / XGT / XGT
+    b"\x00\x00\x00\x01\x31\x36\xef\x85\x15\x92\xac\xf4\x9c\xa4\xc8\x25\x13\x1e\x36\x41\x70\xfa\x32\xb3\x12\x03\x31\x04"  # eth / COFI / CoinFi Token
+    b"\x00\x00\x00\x01\x31\x5c\xe5\x9f\xaf\xd3\xa8\xd5\x62\xb7\xec\x1c\x85\x42\x38\x2d\x27\x10\xb0\x6c\x12\x03\x35\x03"  # eth / CCS / CacaoShares
+    b"\x00\x00\x00\x01\x31\xf3\xd9\xd1\xbe\xce\x0c\x03\x3f\xf7\x8f\xa6\xda\x60\xa6\x04\x8f\x3e\x13\xc5\x12\x03\x38\x03"  # eth / EBC / EBCoin
+    b"\x00\x00\x00\x01\x32\x09\xf9\x8b\xeb\xf0\x14\x9b\x76\x9c\xe2\x6d\x71\xf7\xae\xa8\xe4\x35\xef\xea\x12\x03\x3b\x03"  # eth / TMT / TRAXIA
+    b"\x00\x00\x00\x01\x32\x76\x82\x77\x9b\xab\x2b\xf4\xd1\x33\x7e\x89\x74\xab\x9d\xe8\x27\x5a\x7c\xa8\x12\x03\x3e\x03"  # eth / BPT / Blockport Token
+    b"\x00\x00\x00\x01\x33\x6f\x64\x6f\x87\xd9\xf6\xbc\x6e\xd4\x2d\xd4\x6e\x8b\x3f\xd9\xdb\xd1\x5c\x22\x12\x03\x41\x03"  # eth / CCT / Crystal Clear Token
+    b"\x00\x00\x00\x01\x33\xc6\x23\xa2\xba\xaf\xeb\x8d\x15\xdf\xaf\x3c\xe4\x40\x95\xef\xec\x83\xd7\x2c\x12\x03\x44\x03"  # eth / SGP / SGPay
+    b"\x00\x00\x00\x01\x33\xf9\x0d\xee\x07\xc6\xe8\xb9\x68\x2d\xd2\x0f\x73\xe6\xc3\x58\xb2\xed\x0f\x03\x00\x03\x47\x04"  # eth / TRDT / Trident Group
+    b"\x00\x00\x00\x01\x34\x0d\x2b\xde\x5e\xb2\x8c\x1e\xed\x91\xb2\xf7\x90\x72\x3e\x3b\x16\x06\x13\xb7\x12\x03\x4b\x03"  # eth / VEE / BLOCKv
+    b"\x00\x00\x00\x01\x35\x43\x63\x8e\xd4\xa9\x00\x6e\x48\x40\xb1\x05\x94\x42\x71\xbc\xea\x15\x60\x5d\x12\x03\x4e\x03"  # eth / UUU / U Networks
+    b"\x00\x00\x00\x01\x35\x97\xbf\xd5\x33\xa9\x9c\x9a\xa0\x83\x58\x7b\x07\x44\x34\xe6\x1e\xb0\xa2\x58\x08\x03\x51\x04"  # eth / DENT / DENT
+    b"\x00\x00\x00\x01\x35\xa6\x96\x42\x85\x70\x83\xba\x2f\x30\xbf\xab\x73\x5d\xac\xc7\xf0\xba\xc9\x69\x12\x03\x55\x03"  # eth / BBN / Banyan Network
+    b"\x00\x00\x00\x01\x35\xba\xa7\x20\x38\xf1\x27\xf9\xf8\xc8\xf9\xb4\x91\x04\x9f\x64\xf3\x77\x91\x4d\x04\x03\x58\x03"  # eth / EPX / ethPoker.io EPX
+    b"\x00\x00\x00\x01\x36\x18\x51\x6f\x45\xcd\x3c\x91\x3f\x81\xf9\x98\x7a\xf4\x10\x77\x93\x2b\xc4\x0d\x08\x03\x5b\x03"  # eth / PCL / Peculium
+    b"\x00\x00\x00\x01\x36\x90\x5f\xc9\x32\x80\xf5\x23\x62\xa1\xcb\xab\x15\x1f\x25\xdc\x46\x74\x2f\xb5\x12\x03\x5e\x03"  # eth / BTO / Bottos
+    b"\x00\x00\x00\x01\x37\x89\x03\xa0\x3f\xb2\xc3\xac\x76\xbb\x52\x77\x3e\x3c\xe1\x13\x40\x37\x7a\x32\x12\x03\x61\x04"  # eth / CCCX / Clipper Coin
+    b"\x00\x00\x00\x01\x37\xd4\x05\x10\xa2\xf5\xbc\x98\xaa\x7a\x0f\x7b\xf4\xb3\x45\x3b\xcf\xb9\x0a\xc1\x12\x03\x65\x03"  # eth / BBI / Beluga Banking Infrastructure Token
+    b"\x00\x00\x00\x01\x37\xe8\x78\x9b\xb9\x99\x6c\xac\x91\x56\xcd\x5f\x5f\xd3\x25\x99\xe6\xb9\x12\x89\x12\x03\x68\x03"  # eth / AID / AidCoin
+    b"\x00\x00\x00\x01\x38\x33\xdd\xa0\xae\xb6\x94\x7b\x98\xce\x45\x4d\x89\x36\x6c\xba\x8c\xc5\x55\x28\x12\x03\x6b\x05"  # eth / SPHTX / SPHTX
+    b"\x00\x00\x00\x01\x38\x39\xd8\xba\x31\x27\x51\xaa\x02\x48\xfe\xd6\xa8\xba\xcb\x84\x30\x8e\x20\xed\x12\x03\x70\x03"  # eth / BEZ / Bezop
+    b"\x00\x00\x00\x01\x38\x64\x67\xf1\xf3\xdd\xbe\x83\x24\x48\x65\x04\x18\x31\x1a\x47\x9e\xec\xfc\x57\x00\x03\x73\x04"  # eth / MBRS / Embers
+    b"\x00\x00\x00\x01\x38\x6f\xaa\x47\x03\xa3\x4a\x7f\xdb\x19\xbe\xc2\xe1\x4f\xd4\x27\xc9\x63\x84\x16\x12\x03\x77\x03"  # eth / DCA / DoBetAcceptBet
+    b"\x00\x00\x00\x01\x38\x83\xf5\xe1\x81\xfc\xca\xf8\x41\x0f\xa6\x1e\x12\xb5\x9b\xad\x96\x3f\xb6\x45\x12\x03\x7a\x05"  # eth / THETA / Theta Token
+    b"\x00\x00\x00\x01\x38\xc6\xa6\x83\x04\xcd\xef\xb9\xbe\xc4\x8b\xbf\xaa\xba\x5c\x5b\x47\x81\x8b\xb2\x12\x03\x7f\x03"  # eth / HPB / HPBCoin
+    b"\x00\x00\x00\x01\x38\xc8\x7a\xa8\x9b\x2b\x8c\xd9\xb9\x5b\x73\x6e\x1f\xa7\xb6\x12\xea\x97\x21\x69\x12\x03\x82\x03"  # eth / AMO / AMO Coin
+    b"\x00\x00\x00\x01\x39\x01\x3f\x96\x1c\x37\x8f\x02\xc2\xb8\x2a\x6e\x1d\x31\xe9\x81\x27\x86\xfd\x9d\x03\x03\x85\x03"  # eth / SMS / Speed Mining Service
+    b"\x00\x00\x00\x01\x39\x9a\x0e\x6f\xbe\xb3\xd7\x4c\x85\x35\x74\x39\xf4\xc8\xae\xd9\x67\x8a\x5c\xbf\x03\x03\x88\x03"  # eth / DCL / DCL
+    b"\x00\x00\x00\x01\x39\xbb\x25\x9f\x66\xe1\xc5\x9d\x5a\xbe\xf8\x83\x75\x97\x9b\x4d\x20\xd9\x80\x22\x08\x03\x8b\x03"  # eth / WAX / WAX
+    b"\x00\x00\x00\x01\x3a\x12\x37\xd3\x8d\x0f\xb9\x45\x13\xf8\x5d\x61\x67\x9c\xad\x7f\x38\x50\x72\x42\x12\x03\x8e\x03"  # eth / MIC / Mindexcoin
+    b"\x00\x00\x00\x01\x3a\x1b\xda\x28\xad\xb5\xb0\xa8\x12\xa7\xcf\x10\xa1\x95\x0c\x92\x0f\x79\xbc\xd3\x12\x03\x91\x03"  # eth / FLP / FLIP Token
+    b"\x00\x00\x00\x01\x3a\x26\x74\x6d\xdb\x79\xb1\xb8\xe4\x45\x0e\x3f\x4f\xfe\x32\x85\xa3\x07\x38\x7e\x08\x03\x94\x04"  # eth / ETHB / EtherBTC
+    b"\x00\x00\x00\x01\x3a\x92\xbd\x39\x6a\xef\x82\xaf\x98\xeb\xc0\xaa\x90\x30\xd2\x5a\x23\xb1\x1c\x6b\x12\x03\x98\x03"  # eth / TBX / Tokenbox
+    b"\x00\x00\x00\x01\x3a\xbd\xff\x32\xf7\x6b\x42\xe7\x63\x5b\xdb\x7e\x42\x5f\x02\x31\xa5\xf3\xab\x17\x12\x03\x9b\x03"  # eth / CJT / ConnectJob
+    b"\x00\x00\x00\x01\x3a\xdf\xc4\x99\x9f\x77\xd0\x4c\x83\x41\xba\xc5\xf3\xa7\x6f\x58\xdf\xf5\xb3\x7a\x08\x03\x9e\x04"  # eth / PRIX / Privatix
+    b"\x00\x00\x00\x01\x3c\x4a\x3f\xfd\x81\x3a\x10\x7f\xeb\xd5\x7b\x2f\x01\xbc\x34\x42\x64\xd9\x0f\xde\x02\x03\xa2\x03"  # eth / ETK / EnergiToken
+    b"\x00\x00\x00\x01\x3c\xf9\xe0\xc3\x85\xa5\xab\xec\x9f\xd2\xa7\x17\x90\xaa\x34\x4c\x4e\x8e\x35\x70\x12\x03\xa5\x04"  # eth / BKRx / BlockRx
+    b"\x00\x00\x00\x01\x3d\x1b\xa9\xbe\x9f\x66\xb8\xee\x10\x19\x11\xbc\x36\xd3\xfb\x56\x2e\xac\x22\x44\x12\x03\xa9\x03"  # eth / RVT / Rivetz
+    b"\x00\x00\x00\x01\x3d\xc9\xa4\x2f\xa7\xaf\xe5\x7b\xe0\x3c\x58\xfd\x7f\x44\x11\xb1\xe4\x66\xc5\x08\x12\x03\xac\x03"  # eth / CLL / CryptoLiveLeak
+    b"\x00\x00\x00\x01\x3e\xb9\x1d\x23\x7e\x49\x1e\x0d\xee\x85\x82\xc4\x02\xd8\x5c\xb4\x40\xfb\x6b\x54\x12\x03\xaf\x05"  # eth / S-ETH / S-ETH
+    b"\x00\x00\x00\x01\x3e\xdd\x23\x5c\x3e\x84\x0c\x1f\x29\x28\x6b\x2e\x39\x37\x0a\x25\x5c\x7b\x6f\xdb\x08\x03\xb4\x04"  # eth / CMBT / CMBToken
+    b"\x00\x00\x00\x01\x3f\x06\xb5\xd7\x84\x06\xcd\x97\xbd\xf1\x0f\x5c\x42\x0b\x24\x1d\x32\x75\x9c\x80\x12\x03\xb8\x04"  # eth / CYFM / CyberFM
+    b"\x00\x00\x00\x01\x3f\x4b\x72\x66\x68\xda\x46\xf5\xe0\xe7\x5a\xa5\xd4\x78\xac\xec\x9f\x38\x21\x0f\x12\x03\xbc\x05"  # eth / M-ETH / M-ETH
+    b"\x00\x00\x00\x01\x3f\xd8\xf3\x9a\x96\x2e\xfd\xa0\x49\x56\x98\x1c\x31\xab\x89\xfa\xb5\xfb\x8b\xc8\x12\x03\xc1\x03"  # eth / RTH / Rotharium
+    b"\x00\x00\x00\x01\x40\x39\x50\x44\xac\x3c\x0c\x57\x05\x19\x06\xda\x93\x8b\x54\xbd\x65\x57\xf2\x12\x08\x03\xc4\x03"  # eth / MGO / MobileGo
+    b"\x00\x00\x00\x01\x40\x8e\x41\x87\x6c\xcc\xdc\x0f\x92\x21\x06\x00\xef\x50\x37\x26\x56\x05\x2a\x38\x12\x03\xc7\x03"  # eth / REN / Republic Token
+    b"\x00\x00\x00\x01\x40\x92\x67\x8e\x4e\x78\x23\x0f\x46\xa1\x53\x4c\x0f\xbc\x8f\xa3\x97\x80\x89\x2b\x12\x03\xca\x03"  # eth / OCN / Odyssey
+    b"\x00\x00\x00\x01\x41\x56\xd3\x34\x2d\x5c\x38\x5a\x87\xd2\x64\xf9\x06\x53\x73\x35\x92\x00\x05\x81\x08\x03\xcd\x04"  # eth / SALT / Salt Lending Token
+    b"\x00\x00\x00\x01\x41\x62\x17\x8b\x78\xd6\x98\x54\x80\xa3\x08\xb2\x19\x0e\xe5\x51\x74\x60\x40\x6d\x12\x03\xd1\x03"  # eth / CLN / ColuLocalNetwork
+    b"\x00\x00\x00\x01\x41\x87\x5c\x23\x32\xb0\x87\x7c\xdf\xaa\x69\x9b\x64\x14\x02\xb7\xd4\x64\x2c\x32\x08\x03\xd4\x04"  # eth / FTXT / FUTURAX
+    b"\x00\x00\x00\x01\x41\x9c\x4d\xb4\xb9\xe2\x5d\x6d\xb2\xad\x96\x91\xcc\xb8\x32\xc8\xd9\xfd\xa0\x5e\x12\x03\xd8\x04"  # eth / DRGN / Dragon
+    b"\x00\x00\x00\x01\x41\x9d\x0d\x8b\xdd\x9a\xf5\xe6\x06\xae\x22\x32\xed\x28\x5a\xff\x19\x0e\x71\x1b\x08\x03\xdc\x03"  # eth / FUN / Funfair
+    b"\x00\x00\x00\x01\x41\xab\x1b\x6f\xcb\xb2\xfa\x9d\xce\xd8\x1a\xcb\xde\xc1\x3e\xa6\x31\x5f\x2b\xf2\x12\x03\xdf\x04"  # eth / XDCE / XinFin Network
+    b"\x00\x00\x00\x01\x41\xdb\xec\xc1\xcd\xc5\x51\x7c\x6f\x76\xf6\xa6\xe8\x36\xad\xbe\xe2\x75\x4d\xe3\x12\x03\xe3\x03"  # eth / MTN / MedToken
+    b"\x00\x00\x00\x01\x41\xe5\x56\x00\x54\x82\x4e\xa6\xb0\x73\x2e\x65\x6e\x3a\xd6\x4e\x20\xe9\x4e\x45\x08\x03\xe6\x03"  # eth / CVC / Civic
+    b"\x00\x00\x00\x01\x41\xf6\x15\xe2\x4f\xab\xd2\xb0\x97\xa3\x20\xe9\xe6\xc1\xf4\x48\xcb\x40\x52\x1c\x12\x03\xe9\x03"  # eth / RVL / RVL
+    b"\x00\x00\x00\x01\x42\x28\x66\xa8\xf0\xb0\x32\xc5\xcf\x1d\xfb\xde\xf3\x1a\x20\xf4\x50\x95\x62\xb0\x00\x03\xec\x04"  # eth / ADST / AdShares
+    b"\x00\x00\x00\x01\x42\x3b\x5f\x62\xb3\x28\xd0\xd6\xd4\x48\x70\xf4\xee\xe3\x16\xbe\xfa\x0b\x2d\xf5\x12\x03\xf0\x03"  # eth / GOT / GoNetwork
+    b"\x00\x00\x00\x01\x42\x70\xbb\x23\x8f\x6d\xd8\xb1\xc3\xca\x01\xf9\x6c\xa6\x5b\x26\x47\xc0\x6d\x3c\x12\x03\xf3\x04"  # eth / FOTA / Fortuna
+    b"\x00\x00\x00\x01\x42\x89\xc0\x43\xa1\x23\x92\xf1\x02\x73\x07\xfb\x58\x27\x2d\x8e\xbd\x85\x39\x12\x12\x03\xf7\x03"  # eth / ALI / AiLink Token
+    b"\x00\x00\x00\x01\x42\xd6\x62\x2d\xec\xe3\x94\xb5\x49\x99\xfb\xd7\x3d\x10\x81\x23\x80\x6f\x6a\x18\x12\x03\xfa\x05"  # eth / SPANK / SpankChain
+    b"\x00\x00\x00\x01\x43\x02\x41\x36\x8c\x1d\x29\x3f\xda\x21\xdb\xa8\xbb\x7a\xf3\x20\x07\xc5\x91\x09\x08\x03\xff\x03"  # eth / 3LT / TrillionToken
+    b"\x00\x00\x00\x01\x43\x55\xfc\x16\x0f\x74\x32\x8f\x9b\x38\x3d\xf2\xec\x58\x9b\xb3\xdf\xd8\x2b\xa0\x12\x04\x02\x03"  # eth / OPT / Opus Foundation
+    b"\x00\x00\x00\x01\x43\x75\xe7\xad\x8a\x01\xb8\xec\x3e\xd0\x41\x39\x9f\x62\xd9\xcd\x12\x0e\x00\x63\x12\x04\x05\x02"  # eth / BZ / Bit-Z Token
+    b"\x00\x00\x00\x01\x43\xf6\xa1\xbe\x99\x2d\xee\x40\x87\x21\x74\x84\x90\x77\x2b\x15\x14\x3c\xe0\xa7\x00\x04\x07\x04"  # eth / POIN / Potatoin
+    b"\x00\x00\x00\x01\x44\x19\x7a\x4c\x44\xd6\xa0\x59\x29\x7c\xaf\x6b\xe4\xf7\xe1\x72\xbd\x56\xca\xaf\x08\x04\x0b\x07"  # eth / ELTCOIN / ELTCOIN
+    b"\x00\x00\x00\x01\x44\x44\x9f\xa4\xd6\x07\xf8\x07\xd1\xed\x4a\x69\xad\x94\x29\x71\x72\x83\x91\xc8\x12\x04\x12\x04"  # eth / XMCT / XMED Chain
+    b"\x00\x00\x00\x01\x44\x49\x97\xb7\xe7\xfc\x83\x0e\x20\x08\x9a\xfe\xa3\x07\x8c\xd5\x18\xfc\xf2\xa2\x12\x04\x16\x03"  # eth / EWO / EWO Token
+    b"\x00\x00\x00\x01\x44\x70\xbb\x87\xd7\x7b\x96\x3a\x01\x3d\xb9\x39\xbe\x33\x2f\x92\x7f\x2b\x99\x2e\x04\x04\x19\x03"  # eth / ADX / AdEx Network
+    b"\x00\x00\x00\x01\x44\xbf\x22\x94\x9f\x9c\xc8\x4b\x61\xb9\x32\x8a\x9d\x88\x5d\x1b\x5c\x80\x6b\x41\x02\x04\x1c\x04"  # eth / MOZO / Mozo Token
+    b"\x00\x00\x00\x01\x44\xf5\x88\xae\xeb\x8c\x44\x47\x14\x39\xd1\x27\x0b\x36\x03\xc6\x6a\x92\x62\xf1\x12\x04\x20\x04"  # eth / SNIP / SNIP
+    b"\x00\x00\x00\x01\x45\x24\x5b\xc5\x92\x19\xee\xaa\xf6\xcd\x3f\x38\x2e\x07\x8a\x46\x1f\xf9\xde\x7b\x12\x04\x24\x03"  # eth / BKX / BANKEX
+    b"\x00\x00\x00\x01\x45\x45\x75\x0f\x39\xaf\x6b\xe4\xf2\x37\xb6\x86\x9d\x4e\xcc\xa9\x28\xfd\x5a\x85\x12\x04\x27\x03"  # eth / CTF / CryptoTask
+    b"\x00\x00\x00\x01\x45\xe4\x2d\x65\x9d\x9f\x94\x66\xcd\x5d\xf6\x22\x50\x60\x33\x14\x5a\x9b\x89\xbc\x03\x04\x2a\x03"  # eth / NxC / Nexium
+    b"\x00\x00\x00\x01\x45\xed\xb5\x35\x94\x2a\x8c\x84\xd9\xf4\xb5\xd3\x7e\x1b\x25\xf9\x1e\xa4\x80\x4c\x12\x04\x2d\x03"  # eth / RAO / RadioYo
+    b"\x00\x00\x00\x01\x46\x18\x51\x9d\xe4\xc3\x04\xf3\x44\x4f\xfa\x7f\x81\x2d\xdd\xc2\x97\x1c\xc6\x88\x08\x04\x30\x04"  # eth / KIND / Kind Ads Token
+    b"\x00\x00\x00\x01\x46\x49\x24\x73\x75\x5e\x8d\xf9\x60\xf8\x03\x48\x77\xf6\x17\x32\xd7\x18\xce\x96\x08\x04\x34\x04"  # eth / STRC / STRC
+    b"\x00\x00\x00\x01\x46\x4e\xbe\x77\xc2\x93\xe4\x73\xb4\x8c\xfe\x96\xdd\xcf\x88\xfc\xf7\xbf\xda\xc0\x12\x04\x38\x03"  # eth / KRL / Kryll
+    b"\x00\x00\x00\x01\x46\x89\xa4\xe1\x69\xeb\x39\xcc\x90\x78\xc0\x94\x0e\x21\xff\x1a\xa8\xa3\x9b\x9c\x12\x04\x3b\x03"  # eth / PTT / Proton Token
+    b"\x00\x00\x00\x01\x46\xb9\xad\x94\x4d\x10\x59\x45\x0d\xa1\x16\x35\x11\x06\x9c\x71\x8f\x69\x9d\x31\x06\x04\x3e\x02"  # eth / CS / Credits
+    b"\x00\x00\x00\x01\x47\xbc\x01\x59\x77\x98\xdc\xd7\x50\x6d\xcc\xa3\x6a\xc4\x30\x2f\xc9\x3a\x8c\xfb\x08\x04\x40\x04"  # eth / CMCT / Crowd Machine Compute Token
+    b"\x00\x00\x00\x01\x47\xdd\x62\xd4\xd0\x75\xde\xad\x71\xd0\xe0\x02\x99\xfc\x56\xa2\xd7\x47\xbe\xbb\x12\x04\x44\x03"  # eth / EQL / Equal
+    b"\x00\x00\x00\x01\x48\xc1\xb2\xf3\xef\xa8\x5f\xba\xfb\x2a\xb9\x51\xbf\x4b\xa8\x60\xa0\x8c\xdb\xb7\x00\x04\x47\x04"  # eth / HAND / ShowHand
+    b"\x00\x00\x00\x01\x48\xdf\x4e\x02\x96\xf9\x08\xce\xab\x04\x28\xa5\x18\x2d\x19\xb3\x1f\xc0\x37\xd6\x08\x04\x4b\x03"  # eth / FRV / Fitrova
+    b"\x00\x00\x00\x01\x48\xe5\x41\x3b\x73\xad\xd2\x43\x4e\x47\x50\x4e\x2a\x22\xd1\x49\x40\xdb\xfe\x78\x03\x04\x4e\x04"  # eth / INRM / Integrated Money
+    b"\x00\x00\x00\x01\x48\xf7\x75\xef\xbe\x4f\x5e\xce\x6e\x0d\xf2\xf7\xb5\x93\x2d\xf5\x68\x23\xb9\x90\x00\x04\x52\x01"  # eth / R / Revain
+    b"\x00\x00\x00\x01\x49\x1c\x9a\x23\xdb\x85\x62\x3e\xed\x45\x5a\x8e\xfd\xd6\xab\xa9\xb9\x11\xc5\xdf\x12\x04\x53\x03"  # eth / HER / HeroNode
+    b"\x00\x00\x00\x01\x49\x46\x58\x3c\x5b\x86\xe0\x1c\xcd\x30\xc7\x1a\x05\x61\x7d\x06\xe3\xe7\x30\x60\x12\x04\x56\x04"  # eth / PTON / PTON
+    b"\x00\x00\x00\x01\x49\x7b\xae\xf2\x94\xc1\x1a\x5f\x0f\x5b\xea\x3f\x2a\xdb\x30\x73\xdb\x44\x8b\x56\x12\x04\x5a\x03"  # eth / DEX / DEX
+    b"\x00\x00\x00\x01\x49\x93\xcb\x95\xc7\x44\x3b\xdc\x06\x15\x5c\x5f\x56\x88\xbe\x9d\x8f\x69\x99\xa5\x12\x04\x5d\x05"  # eth / ROUND / ROUND
+    b"\x00\x00\x00\x01\x49\x94\xe8\x18\x97\xa9\x20\xc0\xfe\xa2\x35\xeb\x8c\xed\xee\xd3\xc6\xff\xf6\x97\x12\x04\x62\x04"  # eth / SKO1 / Sikoba
+    b"\x00\x00\x00\x01\x49\x9a\x6b\x77\xbc\x25\xc2\x6b\xcf\x82\x65\xe2\x10\x2b\x1b\x3d\xd1\x61\x70\x24\x12\x04\x66\x03"  # eth / BTR / Bitether
+    b"\x00\x00\x00\x01\x49\xae\xc0\x75\x2e\x68\xd0\x28\x2d\xb5\x44\xc6\x77\xf6\xba\x40\x7b\xa1\x7e\xd7\x12\x04\x69\x03"  # eth / XBL / Billionaire Token
+    b"\x00\x00\x00\x01\x49\xb1\x27\xbc\x33\xce\x7e\x15\x86\xec\x28\xce\xc6\xa6\x5b\x11\x25\x96\xc8\x22\x12\x04\x6c\x03"  # eth / ALX / ALAX
+    b"\x00\x00\x00\x01\x49\xbd\x2d\xa7\x5b\x1f\x7a\xf1\xe4\xdf\xd6\xb1\x12\x5f\xec\xde\x59\xdb\xec\x58\x12\x04\x6f\x03"  # eth / LKY / Linkey
+    b"\x00\x00\x00\x01\x4a\x22\x0e\x60\x96\xb2\x5e\xad\xb8\x83\x58\xcb\x44\x06\x8a\x32\x48\x25\x46\x75\x12\x04\x72\x03"  # eth / QNT / Quant
+    b"\x00\x00\x00\x01\x4a\x42\xd2\xc5\x80\xf8\x3d\xce\x40\x4a\xca\xd1\x8d\xab\x26\xdb\x11\xa1\x75\x0e\x12\x04\x75\x03"  # eth / RLX / Relex
+    b"\x00\x00\x00\x01\x4a\x52\x7d\x8f\xc1\x3c\x52\x03\xab\x24\xba\x09\x44\xf4\xcb\x14\x65\x8d\x1d\xb6\x12\x04\x78\x04"  # eth / MITX / Morpheus Infrastructure Token
+    b"\x00\x00\x00\x01\x4a\x60\x58\x66\x6c\xf1\x05\x7e\xac\x3c\xd3\xa5\xa6\x14\x62\x05\x47\x55\x9f\xc9\x12\x04\x7c\x03"  # eth / BBK / BRICKBLOCK TOKEN
+    b"\x00\x00\x00\x01\x4a\x89\xcd\x48\x6f\xa9\x96\xad\x50\xc0\xa6\x3c\x35\xc7\x87\x02\xf5\x42\x2a\x50\x03\x04\x7f\x06"  # eth / STABIT / StabitCoin
+    b"\x00\x00\x00\x01\x4a\xac\x46\x1c\x86\xab\xfa\x71\xe9\xd0\x0d\x9a\x2c\xde\x8d\x74\xe4\xe1\xae\xea\x12\x04\x85\x04"  # eth / ZINC / ZINC
+    b"\x00\x00\x00\x01\x4a\xf3\x28\xc5\x29\x21\x70\x6d\xcb\x73\x9f\x25\x78\x62\x10\x49\x91\x69\xaf\xe6\x08\x04\x89\x03"  # eth / SKB / Sakura Bloom
+    b"\x00\x00\x00\x01\x4b\x96\xbf\x1f\xef\x93\xa2\x16\x91\x4f\xc8\x43\xd8\x12\x07\xa0\x27\xce\x52\xb3\x12\x04\x8c\x03"  # eth / VUU / Vuulr Token
+    b"\x00\x00\x00\x01\x4b\xbb\xc5\x7a\xf2\x70\x13\x8e\xf2\xff\x2c\x50\xdb\xfa\xd6\x84\xe9\xe0\xe6\x04\x12\x04\x8f\x03"  # eth / WAB / WABnetwork
+    b"\x00\x00\x00\x01\x4c\x0f\xbe\x1b\xb4\x66\x12\x91\x5e\x79\x67\xd2\xc3\x21\x3c\xd4\xd8\x72\x57\xad\x12\x04\x92\x04"  # eth / APIS / APIS
+    b"\x00\x00\x00\x01\x4c\x38\x2f\x8e\x09\x61\x5a\xc8\x6e\x08\xce\x58\x26\x6c\xc2\x27\xe7\xd4\xd9\x13\x06\x04\x96\x03"  # eth / SKR / SKR Token
+    b"\x00\x00\x00\x01\x4c\x38\x3b\xdc\xae\x52\xa6\xe1\xcb\x81\x0c\x76\xc7\x0d\x6f\x31\xa2\x49\xec\x9b\x08\x04\x99\x03"  # eth / RGS / Rusgas
+    b"\x00\x00\x00\x01\x4c\xa7\x41\x85\x53\x2d\xc1\x78\x95\x27\x19\x4e\x5b\x9c\x86\x6d\xd3\x3f\x4e\x82\x12\x04\x9c\x09"  # eth / SenSatorI / SenSatorI Token
+    b"\x00\x00\x00\x01\x4c\xe6\xb3\x62\xbc\x77\xa2\x49\x66\xdd\xa9\x07\x8f\x9c\xef\x81\xb3\xb8\x86\xa7\x12\x04\xa5\x04"  # eth / NPER / NPER
+    b"\x00\x00\x00\x01\x4c\xed\xa7\x90\x6a\x5e\xd2\x17\x97\x85\xcd\x3a\x40\xa6\x9e\xe8\xbc\x99\xc4\x66\x08\x04\xa9\x04"  # eth / AION / Aion
+    b"\x00\x00\x00\x01\x4c\xf4\x88\x38\x7f\x03\x5f\xf0\x8c\x37\x15\x15\x56\x2c\xba\x71\x2f\x90\x15\xd4\x12\x04\xad\x03"  # eth / WPR / WePower Token
+    b"\x00\x00\x00\x01\x4d\x80\x75\x09\xae\xce\x24\xc0\xfa\x5a\x10\x2b\x6a\x3b\x05\x9e\xc6\xe1\x43\x92\x12\x04\xb0\x03"  # eth / ONE / Menlo One
+    b"\x00\x00\x00\x01\x4d\x82\x9f\x8c\x92\xa6\x69\x1c\x56\x30\x0d\x02\x0c\x9e\x0d\xb9\x84\xcf\xe2\xba\x12\x04\xb3\x03"  # eth / XCC / CoinCrowd
+    b"\x00\x00\x00\x01\x4d\x8f\xc1\x45\x3a\x0f\x35\x9e\x99\xc9\x67\x59\x54\xe6\x56\xd8\x0d\x99\x6f\xbf\x12\x04\xb6\x03"  # eth / BEE / Bee Token
+    b"\x00\x00\x00\x01\x4d\xc3\x64\x3d\xbc\x64\x2b\x72\xc1\x58\xe7\xf3\xd2\xff\x23\x2d\xf6\x1c\xb6\xce\x12\x04\xb9\x03"  # eth / AMB / Amber Token
+    b"\x00\x00\x00\x01\x4d\xf4\x7b\x49\x69\xb2\x91\x1c\x96\x65\x06\xe3\x59\x2c\x41\x38\x94\x93\x95\x3b\x12\x04\xbc\x03"  # eth / FND / FundRequest
+    b"\x00\x00\x00\x01\x4d\xf8\x12\xf6\x06\x4d\xef\x1e\x5e\x02\x9f\x1c\xa8\x58\x77\x7c\xc9\x8d\x2d\x81\x08\x04\xbf\x04"  # eth / XAUR / Xaurum
+    b"\x00\x00\x00\x01\x4e\x06\x03\xe2\xa2\x7a\x30\x48\x0e\x5e\x3a\x4f\xe5\x48\xe2\x9e\xf1\x2f\x64\xbe\x12\x04\xc3\x05"  # eth / CREDO / Credo / Bitbounce
+    b"\x00\x00\x00\x01\x4e\x84\xe9\xe5\xfb\x0a\x97\x26\x28\xcf\x45\x68\xc4\x03\x16\x7e\xf1\xd4\x04\x31\x12\x04\xc8\x04"  # eth / $FFC / $Fluzcoin
+    b"\x00\x00\x00\x01\x4f\x27\x05\x3f\x32\xed\xa8\xaf\x84\x95\x64\x37\xbc\x00\xe5\xff\xa7\x00\x32\x87\x12\x04\xcc\x04"  # eth / THRT / Thrive Token
+    b"\x00\x00\x00\x01\x4f\x3a\xfe\xc4\xe5\xa3\xf2\xa6\xa1\xa4\x11\xde\xf7\xd7\xdf\xe5\x0e\xe0\x57\xbf\x09\x04\xd0\x03"  # eth / DGX / Digix Gold Token
+    b"\x00\x00\x00\x01\x4f\x4f\x0d\xb4\xde\x90\x3b\x88\xf2\xb1\xa2\x84\x79\x71\xe2\x31\xd5\x4f\x8f\xd3\x08\x04\xd3\x03"  # eth / GEE / Geens NPO
+    b"\x00\x00\x00\x01\x50\x9a\x38\xb7\xa1\xcc\x0d\xcd\x83\xaa\x9d\x06\x21\x46\x63\xd9\xec\x7c\x7f\x4a\x12\x04\xd6\x03"  # eth / BST / BlocksquareToken
+    b"\x00\x00\x00\x01\x50\xee\x67\x46\x89\xd7\x5c\x0f\x88\xe8\xf8\x3c\xfe\x8c\x4b\x69\xe8\xfd\x59\x0d\x08\x04\xd9\x03"  # eth / EPY / Emphy
+    b"\x00\x00\x00\x01\x51\x02\x79\x1c\xa0\x2f\xc3\x59\x53\x98\x40\x0b\xfe\x0e\x33\xd7\xb6\xc8\x22\x67\x12\x04\xdc\x03"  # eth / LDC / LEADCOIN
+    b"\x00\x00\x00\x01\x51\x21\xe3\x48\xe8\x97\xda\xef\x1e\xef\x23\x95\x9a\xb2\x90\xe5\x55\x7c\xf2\x74\x12\x04\xdf\x02"  # eth / AI / POLY AI
+    b"\x00\x00\x00\x01\x51\x36\xc9\x8a\x80\x81\x1c\x3f\x46\xbd\xda\x8b\x5c\x45\x55\xcf\xd9\xf8\x12\xf0\x06\x04\xe1\x03"  # eth / IDH / indaHash
+    b"\x00\x00\x00\x01\x51\x49\x10\x77\x1a\xf9\xca\x65\x6a\xf8\x40\xdf\xf8\x3e\x82\x64\xec\xf9\x86\xca\x12\x04\xe4\x10"  # eth / LINK (Chainlink) / LINK Chainlink
+    b"\x00\x00\x00\x01\x51\x56\x69\xd3\x08\xf8\x87\xfd\x83\xa4\x71\xc7\x76\x4f\x5d\x08\x48\x86\xd3\x4d\x12\x04\xf4\x04"  # eth / MUXE / MUXE
+    b"\x00\x00\x00\x01\x51\x6e\x54\x36\xba\xfd\xc1\x10\x83\x65\x4d\xe7\xbb\x9b\x95\x38\x2d\x08\xd5\xde\x08\x04\xf8\x04"  # eth / ORME / Ormeus Coin
+    b"\x00\x00\x00\x01\x51\x94\x75\xb3\x16\x53\xe4\x6d\x20\xcd\x09\xf9\xfd\xcf\x3b\x12\xbd\xac\xb4\xf5\x12\x04\xfc\x03"  # eth / VIU / Viuly
+    b"\x00\x00\x00\x01\x51\xdb\x5a\xd3\x5c\x67\x1a\x87\x20\x7d\x88\xfc\x11\xd5\x93\xac\x0c\x84\x15\xbd\x12\x04\xff\x03"  # eth / MDA / Moeda Loyalty Points
+    b"\x00\x00\x00\x01\x52\x36\x30\x97\x6e\xb6\x14\x76\x21\xb5\xc3\x1c\x78\x1e\xbe\x2e\xc2\xa8\x06\xe0\x12\x05\x02\x04"  # eth / eUSD / Ether-Backed USD Nomins (erc20)
+    b"\x00\x00\x00\x01\x52\xfb\x36\xc8\x3a\xd3\x3c\x18\x24\x91\x2f\xc8\x10\x71\xca\x5e\xeb\x8a\xb3\x90\x12\x05\x06\x03"  # eth / FID / Fidelium
+    b"\x00\x00\x00\x01\x53\x14\x8b\xb4\x55\x17\x07\xed\xf5\x1a\x1e\x8d\x7a\x93\x69\x8d\x18\x93\x12\x25\x08\x05\x09\x06"  # eth / PCLOLD / PeculiumOLD
+    b"\x00\x00\x00\x01\x53\x3e\xf0\x98\x4b\x2f\xaa\x22\x7a\xcc\x62\x0c\x67\xcc\xe1\x2a\xa3\x9c\xd8\xcd\x08\x05\x0f\x03"  # eth / XGM / XGM
+    b"\x00\x00\x00\x01\x53\x9e\xfe\x69\xbc\xdd\x21\xa8\x3e\xfd\x91\x22\x57\x1a\x64\xcc\x25\xe0\x28\x2b\x08\x05\x12\x04"  # eth / BLUE / Ethereum Blue
+    b"\x00\x00\x00\x01\x54\x3f\xf2\x27\xf6\x4a\xa1\x7e\xa1\x32\xbf\x98\x86\xca\xb5\xdb\x55\xdc\xad\xdf\x12\x05\x16\x03"  # eth / GEN / DAOstack
+    b"\x00\x00\x00\x01\x54\xb2\x93\x22\x60\x00\xcc\xbf\xc0\x4d\xf9\x02\xee\xc5\x67\xcb\x4c\x35\xa9\x03\x12\x05\x19\x03"  # eth / RTN / RiderToken
+    b"\x00\x00\x00\x01\x55\x12\xe1\xd6\xa7\xbe\x42\x4b\x43\x23\x12\x6b\x4f\x9e\x86\xd0\x23\xf9\x57\x64\x12\x05\x1c\x04"  # eth / PTWO / PornTokenV2
+    b"\x00\x00\x00\x01\x55\x29\x6f\x69\xf4\x0e\xa6\xd2\x0e\x47\x85\x33\xc1\x5a\x6b\x08\xb6\x54\xe7\x58\x12\x05\x20\x03"  # eth / XYO / XYO
+    b"\x00\x00\x00\x01\x55\x4c\x20\xb7\xc4\x86\xbe\xee\x43\x92\x77\xb4\x54\x0a\x43\x45\x66\xdc\x4c\x02\x12\x05\x23\x03"  # eth / HST / Decision Token
+    b"\x00\x00\x00\x01\x55\x4f\xfc\x77\xf4\x25\x1a\x9f\xb3\xc0\xe3\x59\x0a\x6a\x20\x5f\x8d\x4e\x06\x7d\x12\x05\x26\x03"  # eth / ZMN / ZMINE
+    b"\x00\x00\x00\x01\x55\x54\xe0\x4e\x76\x53\x3e\x1d\x14\xc5\x2f\x05\xbe\xef\x6c\x9d\x32\x9e\x1e\x30\x00\x05\x29\x03"  # eth / NIO / Autonio
+    b"\x00\x00\x00\x01\x55\x64\x8d\xe1\x98\x36\x33\x85\x49\x13\x0b\x1a\xf5\x87\xf1\x6b\xea\x46\xf6\x6b\x12\x05\x2c\x03"  # eth / PBL / PBL
+    b"\x00\x00\x00\x01\x55\x8e\xc3\x15\x2e\x2e\xb2\x17\x49\x05\xcd\x19\xae\xa4\xe3\x4a\x23\xde\x9a\xd6\x12\x05\x2f\x03"  # eth / BRD / Bread
+    b"\x00\x00\x00\x01\x55\xb9\xa1\x1c\x2e\x83\x51\xb4\xff\xc7\xb1\x15\x61\x14\x8b\xfa\xc9\x97\x78\x55\x09\x05\x32\x04"  # eth / DGX1 / Digix Gold Token 1.0
+    b"\x00\x00\x00\x01\x55\xc2\xa0\xc1\x71\xd9\x20\x84\x35\x60\x59\x4d\xe3\xd6\xee\xcc\x09\xef\xc0\x98\x04\x05\x36\x04"  # eth / PEXT / PEX-Token
+    b"\x00\x00\x00\x01\x56\x6f\xd7\x99\x9b\x1f\xc3\x98\x80\x22\xbd\x38\x50\x7a\x48\xf0\xbc\xf2\x2c\x77\x12\x05\x3a\x04"  # eth / TRCN / The Real Coin
+    b"\x00\x00\x00\x01\x56\xba\x2e\xe7\x89\x04\x61\xf4\x63\xf7\xbe\x02\xaa\xc3\x09\x9f\x6d\x58\x11\xa8\x12\x05\x3e\x0e"  # eth / CAT (BlockCAT) / BlockCAT
+    b"\x00\x00\x00\x01\x57\x2e\x6f\x31\x80\x56\xba\x0c\x5d\x47\xa4\x22\x65\x31\x13\x84\x3d\x25\x06\x91\x00\x05\x4c\x03"  # eth / XNT / XNT
+    b"\x00\x00\x00\x01\x57\x32\x04\x6a\x88\x37\x04\x40\x4f\x28\x4c\xe4\x1f\xfa\xdd\x5b\x00\x7f\xd6\x68\x12\x05\x4f\x03"  # eth / BLZ / Bluzelle
+    b"\x00\x00\x00\x01\x57\x4b\x36\xbc\xed\x44\x33\x38\x87\x5d\x17\x1c\xc3\x77\xe6\x91\xf7\xd4\xf8\x87\x12\x05\x52\x06"  # eth / CO2Bit / CO2Bit
+    b"\x00\x00\x00\x01\x57\xab\x1e\x02\xfe\xe2\x37\x74\x58\x0c\x11\x97\x40\x12\x9e\xac\x70\x81\xe9\xd3\x12\x05\x58\x04"  # eth / sUSD / USD Synth (sUSD)
+    b"\x00\x00\x00\x01\x57\xad\x67\xac\xf9\xbf\x01\x5e\x48\x20\xfb\xd6\x6e\xa1\xa2\x1b\xed\x88\x52\xec\x12\x05\x5c\x03"  # eth / LYM / Lympo
+    b"\x00\x00\x00\x01\x57\xc7\x5e\xcc\xc8\x55\x71\x36\xd3\x26\x19\xa1\x91\xfb\xcd\xc8\x85\x60\xd7\x11\x00\x05\x5f\x03"  # eth / VDG / VeriDocGlobal
+    b"\x00\x00\x00\x01\x58\x80\x47\x36\x5d\xf5\xba\x58\x9f\x92\x36\x04\xaa\xc2\x3d\x67\x35\x55\xc6\x23\x12\x05\x62\x04"  # eth / NAVI / NaviToken
+    b"\x00\x00\x00\x01\x58\x84\x96\x9e\xc0\x48\x05\x56\xe1\x1d\x11\x99\x80\x13\x6a\x4c\x17\xed\xde\xd1\x12\x05\x66\x03"  # eth / PET / PETHEREUM
+    b"\x00\x00\x00\x01\x58\xa4\x88\x41\x82\xd9\xe8\x35\x59\x7f\x40\x5e\x5f\x25\x82\x90\xe4\x6a\xe7\xc2\x12\x05\x69\x04"  # eth / NOAH / Noah Coin
+    b"\x00\x00\x00\x01\x58\xb6\xa8\xa3\x30\x23\x69\xda\xec\x38\x33\x34\x67\x24\x04\xee\x73\x3a\xb2\x39\x12\x05\x6d\x03"  # eth / LPT / Livepeer Token
+    b"\x00\x00\x00\x01\x58\xbf\x7d\xf5\x7d\x9d\xa7\x11\x3c\x4c\xcb\x49\xd8\x46\x3d\x49\x08\xc7\x35\xcb\x12\x05\x70\x05"  # eth / SPARC / SPARC
+    b"\x00\x00\x00\x01\x58\xca\x30\x65\xc0\xf2\x4c\x7c\x96\xae\xe8\xd6\x05\x6b\x5b\x5d\xec\xf9\xc2\xf8\x0a\x05\x75\x03"  # eth / GXC / GXC
+    b"\x00\x00\x00\x01\x59\x41\x6a\x25\x62\x8a\x76\xb4\x73\x0e\xc5\x14\x86\x11\x4c\x32\xe0\xb5\x82\xa1\x06\x05\x78\x06"  # eth / PLASMA / PLASMA
+    b"\x00\x00\x00\x01\x59\x58\x32\xf8\xfc\x6b\xf5\x9c\x85\xc5\x27\xfe\xc3\x74\x0a\x1b\x7a\x36\x12\x69\x06\x05\x7e\x04"  # eth / POWR / PowerLedger
+    b"\x00\x00\x00\x01\x59\x93\x46\x77\x9e\x90\xfc\x3f\x5f\x99\x7b\x5e\xa7\x15\x34\x98\x20\xf9\x15\x71\x04\x05\x82\x03"  # eth / STN / Saturn Network
+    b"\x00\x00\x00\x01\x5a\x27\x6a\xeb\x77\xbc\xfd\xac\x8a\xc6\xf3\x1b\xbc\x74\x16\xae\x1a\x85\xee\xf2\x00\x05\x85\x04"  # eth / LOVE / Love
+    b"\x00\x00\x00\x01\x5a\x56\x7e\x28\xdb\xfa\x2b\xbd\x3e\xf1\x3c\x0a\x01\xbe\x11\x47\x45\x34\x96\x57\x02\x05\x89\x05"  # eth / HAPPY / Happiness
+    b"\x00\x00\x00\x01\x5a\x84\x96\x9b\xb6\x63\xfb\x64\xf6\xd0\x15\xdc\xf9\xf6\x22\xae\xdc\x79\x67\x50\x12\x05\x8e\x03"  # eth / ICE / ICE
+    b"\x00\x00\x00\x01\x5a\xcd\x19\xb9\xc9\x1e\x59\x6b\x1f\x06\x2f\x18\xe3\xd0\x2d\xa7\xed\x8d\x1e\x50\x08\x05\x91\x04"  # eth / BTCL / BTC Lite
+    b"\x00\x00\x00\x01\x5a\xdc\x96\x1d\x6a\xc3\xf7\x06\x2d\x2e\xa4\x5f\xef\xb8\xd8\x16\x7d\x44\xb1\x90\x12\x05\x95\x03"  # eth / DTH / dether
+    b"\x00\x00\x00\x01\x5a\xf2\xbe\x19\x3a\x6a\xbc\xa9\xc8\x81\x70\x01\xf4\x57\x44\x77\x7d\xb3\x07\x56\x08\x05\x98\x03"  # eth / BQX / Bitquence
+    b"\x00\x00\x00\x01\x5b\x07\x51\x71\x3b\x25\x27\xd7\xf0\x02\xc0\xc4\xe2\xa3\x7e\x12\x19\x61\x0a\x6b\x12\x05\x9b\x05"  # eth / HORSE / Ethorse
+    b"\x00\x00\x00\x01\x5b\x09\xa0\x37\x1c\x1d\xa4\x4a\x8e\x24\xd3\x6b\xf5\xde\xb1\x14\x1a\x84\xd8\x75\x12\x05\xa0\x03"  # eth / MAD / MAD
+    b"\x00\x00\x00\x01\x5b\x26\xc5\xd0\x77\x2e\x5b\xba\xc8\xb3\x18\x2a\xe9\xa1\x3f\x9b\xb2\xd0\x37\x65\x08\x05\xa3\x04"  # eth / LEDU / Education Ecosystem
+    b"\x00\x00\x00\x01\x5b\x2e\x4a\x70\x0d\xfb\xc5\x60\x06\x1e\x95\x7e\xde\xc8\xf6\xee\xeb\x74\xa3\x20\x0a\x05\xa7\x03"  # eth / INS / Insolar
+    b"\x00\x00\x00\x01\x5b\x8d\x43\xff\xde\x4a\x29\x82\xb9\xa5\x38\x7c\xdf\x21\xd5\x4e\xad\x64\xac\x8d\x12\x05\xaa\x04"  # eth / MEST / Monaco Estate
+    b"\x00\x00\x00\x01\x5b\xc7\xe5\xf0\xab\x8b\x2e\x10\xd2\xd0\xa3\xf2\x17\x39\xfc\xe6\x24\x59\xae\xf3\x12\x05\xae\x05"  # eth / ENTRP / Hut34 Entropy Token
+    b"\x00\x00\x00\x01\x5c\x3a\x22\x85\x10\xd2\x46\xb7\x8a\x37\x65\xc2\x02\x21\xcb\xf3\x08\x2b\x44\xa4\x12\x05\xb3\x03"  # eth / STQ / Storiqa
+    b"\x00\x00\x00\x01\x5c\x54\x3e\x7a\xe0\xa1\x10\x4f\x78\x40\x6c\x34\x0e\x9c\x64\xfd\x9f\xce\x51\x70\x12\x05\xb6\x03"  # eth / VSL / Vdice
+    b"\x00\x00\x00\x01\x5c\x74\x3a\x35\xe9\x03\xf6\xc5\x84\x51\x4e\xc6\x17\xac\xee\x06\x11\xcf\x44\xf3\x12\x05\xb9\x03"  # eth / EXY / Experty
+    b"\x00\x00\x00\x01\x5c\xa9\xa7\x1b\x1d\x01\x84\x9c\x0a\x95\x49\x0c\xc0\x05\x59\x71\x7f\xcf\x0d\x1d\x12\x05\xbc\x02"  # eth / AE / aeternity
+    b"\x00\x00\x00\x01\x5d\x4a\xbc\x77\xb8\x40\x5a\xd1\x77\xd8\xac\x66\x82\xd5\x84\xec\xbf\xd4\x6c\xec\x12\x05\xbe\x03"  # eth / PST / Primas
+    b"\x00\x00\x00\x01\x5d\x51\xfc\xce\xd3\x11\x4a\x8b\xb5\xe9\x0c\xdd\x0f\x9d\x68\x2b\xcb\xcc\x53\x93\x12\x05\xc1\x04"  # eth / B2BX / B2BX
+    b"\x00\x00\x00\x01\x5d\x65\xd9\x71\x89\x5e\xdc\x43\x8f\x46\x5c\x17\xdb\x69\x92\x69\x8a\x52\x31\x8d\x12\x05\xc5\x03"  # eth / NAS / Nebula
+    b"\x00\x00\x00\x01\x5d\x85\x8b\xcd\x53\xe0\x85\x92\x06\x20\x54\x92\x14\xa8\xb2\x7c\xe2\xf0\x46\x70\x12\x05\xc8\x03"  # eth / POP / POP Network Token
+    b"\x00\x00\x00\x01\x5d\xba\xc2\x4e\x98\xe2\xa4\xf4\x3a\xdc\x0d\xc8\x2a\xf4\x03\xfc\xa0\x63\xce\x2c\x12\x05\xcb\x04"  # eth / ENGT / Engagement Token
+    b"\x00\x00\x00\x01\x5d\xbe\x29\x6f\x97\xb2\x3c\x4a\x6a\xa6\x18\x3d\x73\xe5\x74\xd0\x2b\xa5\xc7\x19\x12\x05\xcf\x03"  # eth / LUC / LUCToken
+    b"\x00\x00\x00\x01\x5d\xff\x89\xa2\xca\xa4\xd7\x6b\xc2\x86\xf7\x4d\x67\xbd\x71\x8e\xb8\x34\xda\x61\x12\x05\xd2\x03"  # eth / CFC / CryptFillCoin
+    b"\x00\x00\x00\x01\x5e\x33\x46\x44\x40\x10\x13\x53\x22\x26\x8a\x46\x30\xd2\xed\x5f\x8d\x09\x44\x6c\x12\x05\xd5\x03"  # eth / LOC / LockChain
+    b"\x00\x00\x00\x01\x5e\x60\x16\xae\x7d\x7c\x49\xd3\x47\xdc\xf8\x34\x86\x0b\x9f\x3e\xe2\x82\x81\x2b\x08\x05\xd8\x03"  # eth / EZT / EZToken
+    b"\x00\x00\x00\x01\x5e\x6b\x6d\x9a\xba\xd9\x09\x3f\xdc\x86\x1e\xa1\x60\x0e\xba\x1b\x35\x5c\xd9\x40\x12\x05\xdb\x03"  # eth / ITC / IoT Chain
+    b"\x00\x00\x00\x01\x5e\x88\x8b\x83\xb7\x28\x7e\xed\x4f\xb7\xda\x7b\x7d\x0a\x0d\x4c\x73\x5d\x94\xb3\x12\x05\xde\x03"  # eth / OAK / OAK
+    b"\x00\x00\x00\x01\x5f\x53\xf7\xa8\x07\x56\x14\xb6\x99\xba\xad\x0b\xc2\xc8\x99\xf4\xba\xd8\xfb\xbf\x12\x05\xe1\x04"  # eth / REBL / Rebellious
+    b"\x00\x00\x00\x01\x60\x7f\x4c\x5b\xb6\x72\x23\x0e\x86\x72\x08\x55\x32\xf7\xe9\x01\x54\x4a\x73\x75\x09\x05\xe5\x03"  # eth / RLC / IEx.ec
+    b"\x00\x00\x00\x01\x61\x72\x5f\x3d\xb4\x00\x4a\xfe\x01\x47\x45\xb2\x1d\xab\x1e\x16\x77\xcc\x32\x8b\x12\x05\xe8\x04"  # eth / DAXT / Digital Asset Exchange Token
+    b"\x00\x00\x00\x01\x61\x8e\x75\xac\x90\xb1\x2c\x60\x49\xba\x3b\x27\xf5\xd5\xf8\x65\x1b\x00\x37\xf6\x06\x05\xec\x04"  # eth / QASH / QASH
+    b"\x00\x00\x00\x01\x62\x08\x72\x45\x08\x71\x25\xd3\xdb\x5b\x9a\x3d\x71\x3d\x78\xe7\xbb\xc3\x1e\x54\x12\x05\xf0\x03"  # eth / WPC / WorldPeaceCoin
+    b"\x00\x00\x00\x01\x62\x2d\xff\xcc\x4e\x83\xc6\x4b\xa9\x59\x53\x0a\x5a\x55\x80\x68\x7a\x57\x58\x1b\x12\x05\xf3\x04"  # eth / AUTO / Cube
+    b"\x00\x00\x00\x01\x62\x4d\x52\x0b\xab\x2e\x4a\xd8\x39\x35\xfa\x50\x3f\xb1\x30\x61\x43\x74\xe8\x50\x04\x05\xf7\x03"  # eth / SSP / Smartshare
+    b"\x00\x00\x00\x01\x62\x9a\xee\x55\xed\x49\x58\x1c\x33\xab\x27\xf9\x40\x3f\x79\x92\xa2\x89\xff\xd5\x12\x05\xfa\x03"  # eth / STC / StrikeCoin Token
+    b"\x00\x00\x00\x01\x62\xd4\xc0\x46\x44\x31\x4f\x35\x86\x8b\xa4\xc6\x5c\xc2\x7a\x77\x68\x1d\xe7\xa9\x12\x05\xfd\x04"  # eth / DRVH / Driveholic Token
+    b"\x00\x00\x00\x01\x63\x39\x78\x4d\x94\x78\xda\x43\x10\x6a\x42\x91\x96\x77\x2a\x02\x9c\x2f\x17\x7d\x12\x06\x01\x04"  # eth / ATTN / Attention Token
+    b"\x00\x00\x00\x01\x63\x8a\xc1\x49\xea\x8e\xf9\xa1\x28\x6c\x41\xb9\x77\x01\x7a\xa7\x35\x9e\x6c\xfa\x12\x06\x05\x04"  # eth / ALTS / ALTS Token
+    b"\x00\x00\x00\x01\x64\x25\xc6\xbe\x90\x2d\x69\x2a\xe2\xdb\x75\x2b\x3c\x26\x8a\xfa\xdb\x09\x9d\x3b\x12\x06\x09\x04"  # eth / MWAT / RED MWAT
+    b"\x00\x00\x00\x01\x64\x3b\x68\x70\xbe\xab\xee\x94\x1b\x92\x60\xa0\xa8\x78\xbc\xf4\xa6\x1f\xb0\xf1\x00\x06\x0d\x04"  # eth / NONE / None
+    b"\x00\x00\x00\x01\x64\xa6\x04\x93\xd8\x88\x72\x8c\xf4\x26\x16\xe0\x34\xa0\xdf\xea\xe3\x8e\xfc\xf0\x12\x06\x11\x03"  # eth / OLT / OneLedger Token
+    b"\x00\x00\x00\x01\x64\xcd\xf8\x19\xd3\xe7\x5a\xc8\xec\x21\x7b\x34\x96\xd7\xce\x16\x7b\xe4\x2e\x80\x12\x06\x14\x03"  # eth / IPL / InsurePal token
+    b"\x00\x00\x00\x01\x65\x31\xf1\x33\xe6\xde\xeb\xe7\xf2\xdc\xe5\xa0\x44\x1a\xa7\xef\x33\x0b\x4e\x53\x08\x06\x17\x04"  # eth / TIME / Chronobank
+    b"\x00\x00\x00\x01\x65\xa1\x50\x14\x96\x4f\x21\x02\xff\x58\x64\x7e\x16\xa1\x6a\x6b\x9e\x14\xbc\xf6\x03\x06\x1b\x07"  # eth / Ox Fina / Ox Fina
+    b"\x00\x00\x00\x01\x66\x0e\x71\x48\x37\x85\xf6\x61\x33\x54\x8b\x10\xf6\x92\x6d\xc3\x32\xb0\x6e\x61\x12\x06\x22\x03"  # eth / ADL / Adelphoi
+    b"\x00\x00\x00\x01\x66\x18\x60\x08\xc1\x05\x06\x27\xf9\x79\xd4\x64\xea\xbb\x25\x88\x60\x56\x3d\xbe\x12\x06\x25\x03"  # eth / MDS / MediShares
+    b"\x00\x00\x00\x01\x66\x2a\xbc\xad\x0b\x7f\x34\x5a\xb7\xff\xb1\xb1\xfb\xb9\xdf\x78\x94\xf1\x8e\x66\x12\x06\x28\x03"  # eth / CTX / CarTaxi
+    b"\x00\x00\x00\x01\x66\x49\x7a\x28\x3e\x0a\x00\x7b\xa3\x97\x4e\x83\x77\x84\xc6\xae\x32\x34\x47\xde\x12\x06\x2b\x02"  # eth / PT / PornToken
+    b"\x00\x00\x00\x01\x66\x70\x88\xb2\x12\xce\x3d\x06\xa1\xb5\x53\xa7\x22\x1e\x1f\xd1\x90\x00\xd9\xaf\x12\x06\x2d\x05"  # eth / WINGS / WINGS
+    b"\x00\x00\x00\x01\x66\xeb\x65\xd7\xab\x8e\x95\x67\xba\x0f\xa6\xe3\x7c\x30\x59\x56\xc5\x34\x15\x74\x05\x06\x32\x03"  # eth / HLX / Helex
+    b"\x00\x00\x00\x01\x67\x10\xc6\x34\x32\xa2\xde\x02\x95\x4f\xc0\xf8\x51\xdb\x07\x14\x6a\x6c\x03\x12\x12\x06\x35\x03"  # eth / MFG / SyncFab Smart Manufacturing Blockchain
+    b"\x00\x00\x00\x01\x67\x1a\xbb\xe5\xce\x65\x24\x91\x98\x53\x42\xe8\x54\x28\xeb\x1b\x07\xbc\x6c\x64\x08\x06\x38\x03"  # eth / QAU / QAU
+    b"\x00\x00\x00\x01\x67\x2a\x1a\xd4\xf6\x67\xfb\x18\xa3\x33\xaf\x13\x66\x7a\xa0\xaf\x1f\x5b\x5b\xdd\x12\x06\x3b\x04"  # eth / CRED / Verify
+    b"\x00\x00\x00\x01\x67\x45\xfa\xb6\x80\x1e\x37\x6c\xd2\x4f\x03\x57\x2b\x9c\x9b\x0d\x4e\xdd\xdc\xcf\x08\x06\x3f\x05"  # eth / SENSE / Sensay
+    b"\x00\x00\x00\x01\x67\x58\xb7\xd4\x41\xa9\x73\x9b\x98\x55\x2b\x37\x37\x03\xd8\xd3\xd1\x4f\x9e\x62\x12\x06\x44\x05"  # eth / POA20 / POA ERC20 on Foundation
+    b"\x00\x00\x00\x01\x67\x81\xa0\xf8\x4c\x7e\x9e\x84\x6d\xcb\x84\xa9\xa5\xbd\x49\x33\x30\x67\xb1\x04\x12\x06\x49\x03"  # eth / ZAP / ZAP
+    b"\x00\x00\x00\x01\x67\x9b\xad\xc5\x51\x62\x6e\x01\xb2\x3c\xee\xce\xfb\xc9\xb8\x77\xea\x18\xfc\x46\x12\x06\x4c\x03"  # eth / CCO / Ccore
+    b"\x00\x00\x00\x01\x68\x10\xe7\x76\x88\x0c\x02\x93\x3d\x47\xdb\x1b\x9f\xc0\x59\x08\xe5\x38\x6b\x96\x12\x06\x4f\x03"  # eth / GNO / Gnosis
+    b"\x00\x00\x00\x01\x68\x63\xbe\x0e\x7c\xf7\xce\x86\x0a\x57\x47\x60\xe9\x02\x0d\x51\x9a\x8b\xdc\x47\x12\x06\x52\x03"  # eth / ONL / On.Live
+    b"\x00\x00\x00\x01\x68\x71\x74\xf8\xc4\x9c\xeb\x77\x29\xd9\x25\xc3\xa9\x61\x50\x7e\xa4\xac\x7b\x28\x12\x06\x55\x03"  # eth / GAT / Global Awards Token
+    b"\x00\x00\x00\x01\x68\x88\xa1\x6e\xa9\x79\x2c\x15\xa4\xdc\xf2\xf6\xc6\x23\xd0\x55\xc8\xed\xe7\x92\x12\x06\x58\x03"  # eth / SIG / Signal
+    b"\x00\x00\x00\x01\x68\xaa\x3f\x23\x2d\xa9\xbd\xc2\x34\x34\x65\x54\x57\x94\xef\x3e\xea\x52\x09\xbd\x12\x06\x5b\x03"  # eth / MSP / Mothership
+    b"\x00\x00\x00\x01\x68\xd5\x34\x41\xc0\xe2\x53\xf7\x6c\x50\x0e\x55\x1b\xde\xa3\xd1\x02\x20\x6c\x9a\x12\x06\x5e\x03"  # eth / DST / Dimensions Strike Token
+    b"\x00\x00\x00\x01\x68\xd5\x7c\x9a\x1c\x35\xf6\x3e\x2c\x83\xee\x8e\x49\xa6\x4e\x9d\x70\x52\x8d\x25\x12\x06\x61\x03"  # eth / SRN / Sirin Labs
+    b"\x00\x00\x00\x01\x68\xe1\x4b\xb5\xa4\x5b\x96\x81\x32\x7e\x16\xe5\x28\x08\x4b\x9d\x96\x2c\x1a\x39\x12\x06\x64\x13"  # eth / CATs (BitClave)_Old / CATs (BitClave)_Old
+    b"\x00\x00\x00\x01\x69\x27\xc6\x9f\xb4\xda\xf2\x04\x3f\xbb\x1c\xb7\xb8\x6c\x56\x61\x41\x6b\xea\x29\x12\x06\x77\x03"  # eth / ETR / Etheruem Risen
+    b"\x00\x00\x00\x01\x69\x44\x04\x59\x5e\x30\x75\xa9\x42\x39\x7f\x46\x6a\xac\xd4\x62\xff\x1a\x7b\xd0\x12\x06\x7a\x07"  # eth / PATENTS / PATENTS
+    b"\x00\x00\x00\x01\x69\x56\x98\x3f\x8b\x3c\xe1\x73\xb4\xab\x84\x36\x1a\xa0\xad\x52\xf3\x8d\x93\x6f\x08\x06\x81\x04"  # eth / CFTY / Crafty Token
+    b"\x00\x00\x00\x01\x69\x7b\xea\xc2\x8b\x09\xe1\x22\xc4\x33\x2d\x16\x39\x85\xe8\xa7\x31\x21\xb9\x7f\x08\x06\x85\x03"  # eth / QRL / QRL
+    b"\x00\x00\x00\x01\x6a\x0a\x97\xe4\x7d\x15\xaa\xd1\xd1\x32\xa1\xac\x79\xa4\x80\xe3\xf2\x07\x90\x63\x12\x06\x88\x03"  # eth / WCT / WePower
+    b"\x00\x00\x00\x01\x6a\xac\x8c\xb9\x86\x1e\x42\xbf\x82\x59\xf5\xab\xdc\x6a\xe3\xae\x89\x90\x9e\x11\x08\x06\x8b\x04"  # eth / BTCR / BitCoin Red
+    b"\x00\x00\x00\x01\x6a\xeb\x95\xf0\x6c\xda\x84\xca\x34\x5c\x2d\xe0\xf3\xb7\xf9\x69\x23\xa4\x4f\x4c\x0e\x06\x8f\x05"  # eth / BERRY / Berry
+    b"\x00\x00\x00\x01\x6a\xed\xbf\x8d\xff\x31\x43\x72\x20\xdf\x35\x19\x50\xba\x2a\x33\x62\x16\x8d\x1b\x08\x06\x94\x03"  # eth / DGS / Dragonglass
+    b"\x00\x00\x00\x01\x6b\x87\x99\x9b\xe8\x73\x58\x06\x5b\xbd\xe4\x1e\x8a\x0f\xe0\xb7\xb1\xcd\x25\x14\x12\x06\x97\x03"  # eth / TSW / TeslaWatt
+    b"\x00\x00\x00\x01\x6b\xa4\x60\xab\x75\xcd\x2c\x56\x34\x3b\x35\x17\xff\xeb\xa6\x07\x48\x65\x4d\x26\x08\x06\x9a\x02"  # eth / UP / UpToken
+    b"\x00\x00\x00\x01\x6c\x6e\xe5\xe3\x1d\x82\x8d\xe2\x41\x28\x2b\x96\x06\xc8\xe9\x8e\xa4\x85\x26\xe2\x12\x06\x9c\x0a"  # eth / HOT (Holo) / Holo Token
+    b"\x00\x00\x00\x01\x6d\xd4\xe4\xaa\xd2\x9a\x40\xed\xd6\xa4\x09\xb9\xc1\x62\x51\x86\xc9\x85\x5b\x4d\x08\x06\xa6\x04"  # eth / GENE / Parkgene
+    b"\x00\x00\x00\x01\x6e\x20\x50\xcb\xfb\x3e\xd8\xa4\xd3\x9b\x64\xcc\x9f\x47\xe7\x11\xa0\x3a\x5a\x89\x12\x06\xaa\x03"  # eth / SSH / StreamShares
+    b"\x00\x00\x00\x01\x6e\xc8\xa2\x4c\xab\xdc\x33\x9a\x06\xa1\x72\xf8\x22\x3e\xa5\x57\x05\x5a\xda\xa5\x09\x06\xad\x03"  # eth / GNX / Genaro Network
+    b"\x00\x00\x00\x01\x6f\x25\x96\x37\xdc\xd7\x4c\x76\x77\x81\xe3\x7b\xc6\x13\x3c\xd6\xa6\x8a\xa1\x61\x12\x06\xb0\x02"  # eth / HT / Huobi Token
+    b"\x00\x00\x00\x01\x6f\x59\xe0\x46\x1a\xe5\xe2\x79\x9f\x1f\xb3\x84\x7f\x05\xa6\x3b\x16\xd0\xdb\xf8\x12\x06\xb2\x04"  # eth / ORCA / ORCA Token
+    b"\x00\x00\x00\x01\x6f\xb3\xe0\xa2\x17\x40\x7e\xff\xf7\xca\x06\x2d\x46\xc2\x6e\x5d\x60\xa1\x4d\x69\x12\x06\xb6\x04"  # eth / IOTX / IoTeX Network
+    b"\x00\x00\x00\x01\x70\x1c\x24\x4b\x98\x8a\x51\x3c\x94\x59\x73\xde\xfa\x05\xde\x93\x3b\x23\xfe\x1d\x12\x06\xba\x03"  # eth / OAX / OAX
+    b"\x00\x00\x00\x01\x70\x5e\xe9\x6c\x1c\x16\x08\x42\xc9\x2c\x1a\xec\xfc\xff\xcc\xc9\xc4\x12\xe3\xd9\x12\x06\xbd\x04"  # eth / POLL / ClearPoll
+    b"\x00\x00\x00\x01\x70\x64\xaa\xb3\x9a\x0f\xcf\x72\x21\xc3\x39\x67\x19\xd0\x91\x7a\x65\xe3\x55\x15\x12\x06\xc1\x04"  # eth / CPLO / CPOLLO
+    b"\x00\x00\x00\x01\x70\x88\x76\xf4\x86\xe4\x48\xee\x89\xeb\x33\x2b\xfb\xc8\xe5\x93\x55\x30\x58\xb9\x12\x06\xc5\x05"  # eth / GAVEL / GAVEL
+    b"\x00\x00\x00\x01\x70\xa7\x28\x33\xd6\xbf\x7f\x50\x8c\x82\x24\xce\x59\xea\x1e\xf3\xd0\xea\x3a\x38\x12\x06\xca\x03"  # eth / UTK / UTRUST
+    b"\x00\x00\x00\x01\x70\xb1\x47\xe0\x1e\x92\x85\xe7\xce\x68\xb9\xba\x43\x7f\xe3\xa9\x19\x0e\x75\x6a\x12\x06\xcd\x03"  # eth / FLX / BitFlux
+    b"\x00\x00\x00\x01\x71\xd0\x1d\xb8\xd6\xa2\xfb\xea\x7f\x8d\x43\x45\x99\xc2\x37\x98\x0c\x23\x4e\x4c\x08\x06\xd0\x03"  # eth / GLA / Gladius
+    b"\x00\x00\x00\x01\x71\xe8\xd7\x4f\xf1\xc9\x23\xe3\x69\xd0\xe7\x0d\xfb\x09\x86\x66\x29\xc4\xdd\x35\x12\x06\xd3\x03"  # eth / WRK / WorkCoin
+    b"\x00\x00\x00\x01\x72\x5b\x19\x0b\xc0\x77\xff\xde\x17\xcf\x54\x9a\xa8\xba\x25\xe2\x98\x55\x0b\x18\x02\x06\xd6\x04"  # eth / CORI / Corrently Invest Token
+    b"\x00\x00\x00\x01\x72\x97\x86\x2b\x96\x70\xff\x01\x51\x92\x79\x9c\xc8\x49\x72\x6c\x88\xbf\x1d\x77\x12\x06\xda\x04"  # eth / SKYM / Skymap Token
+    b"\x00\x00\x00\x01\x72\xad\xad\xb4\x47\x78\x4d\xd7\xab\x1f\x47\x24\x67\x75\x0f\xc4\x85\xe4\xcb\x2d\x06\x06\xde\x03"  # eth / WRC / Worldcore
+    b"\x00\x00\x00\x01\x72\xd3\x2a\xc1\xc5\xe6\x6b\xfc\x5b\x08\x80\x62\x71\xf8\xee\xf9\x15\x54\x51\x64\x00\x06\xe1\x03"  # eth / KEE / CryptoKEE
+    b"\x00\x00\x00\x01\x72\xdd\x4b\x6b\xd8\x52\xa3\xaa\x17\x2b\xe4\xd6\xc5\xa6\xdb\xec\x58\x8c\xf1\x31\x12\x06\xe4\x03"  # eth / NGC / NAGA Coin
+    b"\x00\x00\x00\x01\x73\x67\xa6\x80\x39\xd4\x70\x4f\x30\xbf\xbf\x6d\x94\x80\x20\xc3\xb0\x7d\xfc\x59\x12\x06\xe7\x04"  # eth / BCBC / Beercoin
+    b"\x00\x00\x00\x01\x73\x7f\x98\xac\x8c\xa5\x9f\x2c\x68\xad\x65\x8e\x3c\x3d\x8c\x89\x63\xe4\x0a\x4c\x12\x06\xeb\x03"  # eth / AMN / Amon
+    b"\x00\x00\x00\x01\x73\xdd\x06\x9c\x29\x9a\x5d\x69\x1e\x98\x36\x24\x3b\xca\xec\x9c\x8c\x1d\x87\x34\x08\x06\xee\x03"  # eth / BTE / BTE
+    b"\x00\x00\x00\x01\x74\x4d\x70\xfd\xbe\x2b\xa4\xcf\x95\x13\x16\x26\x61\x4a\x17\x63\xdf\x80\x5b\x9e\x12\x06\xf1\x03"  # eth / SNT / Status Network Token
+    b"\x00\x00\x00\x01\x74\x95\x1b\x67\x7d\xe3\x2d\x59\x6e\xe8\x51\xa2\x33\x33\x69\x26\xe6\xa2\xcd\x09\x07\x06\xf4\x03"  # eth / WBA / WeBetCrypto
+    b"\x00\x00\x00\x01\x74\xc1\xe4\xb8\xca\xe5\x92\x69\xec\x1d\x85\xd3\xd4\xf3\x24\x39\x60\x48\xf4\xac\x00\x06\xf7\x08"  # eth / BeerCoin / BeerCoin
+    b"\x00\x00\x00\x01\x74\xce\xda\x77\x28\x1b\x33\x91\x42\xa3\x68\x17\xfa\x5f\x9e\x29\x41\x2b\xab\x85\x08\x06\xff\x03"  # eth / ERO / Eroscoin
+    b"\x00\x00\x00\x01\x75\x85\xf8\x35\xae\x2d\x52\x27\x22\xd2\x68\x43\x23\xa0\xba\x83\x40\x1f\x32\xf5\x12\x07\x02\x03"  # eth / GBT / GBT
+    b"\x00\x00\x00\x01\x75\xaa\x7b\x0d\x02\x53\x2f\x38\x33\xb6\x6c\x7f\x0a\xd3\x53\x76\xd3\x73\xdd\xf8\x12\x07\x05\x03"  # eth / ARD / Accord
+    b"\x00\x00\x00\x01\x76\x27\xde\x4b\x93\x26\x3a\x6a\x75\x70\xb8\xda\xfa\x64\xba\xe8\x12\xe5\xc3\x94\x08\x07\x08\x03"  # eth / NXX / NXX
+    b"\x00\x00\x00\x01\x76\x31\x86\xeb\x8d\x48\x56\xd5\x36\xed\x44\x78\x30\x29\x71\x21\x4f\xeb\xc6\xa9\x12\x07\x0b\x04"  # eth / BETR / BetterBetting
+    b"\x00\x00\x00\x01\x76\x54\x91\x5a\x1b\x82\xd6\xd2\xd0\xaf\xc3\x7c\x52\xaf\x55\x6e\xa8\x98\x3c\x7e\x12\x07\x0f\x03"  # eth / IFT / InvestFeed
+    b"\x00\x00\x00\x01\x76\x7b\xa2\x91\x5e\xc3\x44\x01\x5a\x79\x38\xe3\xee\xdf\xec\x27\x85\x19\x5d\x05\x12\x07\x12\x03"  # eth / REA / Realisto
+    b"\x00\x00\x00\x01\x76\x96\x0d\xcc\xd5\xa1\xfe\x79\x9f\x7c\x29\xbe\x9f\x19\xce\xb4\x62\x7a\xeb\x2f\x12\x07\x15\x03"  # eth / RED / Red Community Token
+    b"\x00\x00\x00\x01\x77\x03\xc3\x5c\xff\xdc\x5c\xda\x8d\x27\xaa\x3d\xf2\xf9\xba\x69\x64\x54\x4b\x6e\x12\x07\x18\x05"  # eth / PYLNT / Pylon Network
+    b"\x00\x00\x00\x01\x77\x05\xfa\xa3\x4b\x16\xeb\x6d\x77\xdf\xc7\x81\x2b\xe2\x36\x7b\xa6\xb0\x24\x8e\x08\x07\x1d\x03"  # eth / ARX / ARX
+    b"\x00\x00\x00\x01\x77\x28\xdf\xef\x5a\xbd\x46\x86\x69\xeb\x7f\x9b\x48\xa7\xf7\x0a\x50\x1e\xd2\x9d\x06\x07\x20\x03"  # eth / PRG / Paragon
+    b"\x00\x00\x00\x01\x77\x34\x50\x33\x5e\xd4\xec\x3d\xb4\x5a\xf7\x4f\x34\xf2\xc8\x53\x48\x64\x5d\x39\x12\x07\x23\x08"  # eth / JetCoins / JetCoins
+    b"\x00\x00\x00\x01\x77\x9b\x7b\x71\x3c\x86\xe3\xe6\x77\x4f\x50\x40\xd9\xcc\xc2\xd4\x3a\xd3\x75\xf8\x08\x07\x2b\x04"  # eth / POOL / Stake Pool
+    b"\x00\x00\x00\x01\x78\x01\x16\xd9\x1e\x55\x92\xe5\x8a\x3b\x3c\x76\xa3\x51\x57\x1b\x39\xab\xce\xc6\x0f\x07\x2f\x04"  # eth / BOXX / BOXX Token [Blockparty]
+    b"\x00\x00\x00\x01\x78\xa7\x3b\x6c\xbc\x5d\x18\x3c\xe5\x6e\x78\x6f\x6e\x90\x5c\xad\xec\x63\x54\x7b\x12\x07\x33\x02"  # eth / FT / Fabric Token
+    b"\x00\x00\x00\x01\x78\xb7\xfa\xda\x55\xa6\x4d\xd8\x95\xd8\xc8\xc3\x57\x79\xdd\x8b\x67\xfa\x8a\x05\x12\x07\x35\x03"  # eth / ATL / ATLANT
+    b"\x00\x00\x00\x01\x78\xc2\x92\xd1\x44\x5e\x6b\x95\x58\xbf\x42\xe8\xbc\x36\x92\x71\xde\xd0\x62\xea\x08\x07\x38\x04"  # eth / CYMT / CyberMusic
+    b"\x00\x00\x00\x01\x78\xfe\x18\xe4\x1f\x43\x6e\x19\x81\xa3\xa6\x0d\x15\x57\xc8\xa7\xa9\x37\x04\x61\x02\x07\x3c\x06"  # eth / SCANDI / Scandiweb Coin
+    b"\x00\x00\x00\x01\x79\x28\xc8\xab\xf1\xf7\x4e\xf9\xf9\x6d\x4d\x0a\x44\xe3\xb4\x20\x9d\x36\x07\x85\x12\x07\x42\x03"  # eth / SLY / Selfllery
+    b"\x00\x00\x00\x01\x79\x39\x88\x2b\x54\xfc\xf0\xbc\xae\x6b\x53\xde\xc3\x9a\xd6\xe8\x06\x17\x64\x42\x08\x07\x45\x03"  # eth / MKT / Mikado
+    b"\x00\x00\x00\x01\x7a\x41\xe0\x51\x7a\x5e\xca\x4f\xdb\xc7\xfb\xeb\xa4\xd4\xc4\x7b\x9f\xf6\xdc\x63\x12\x07\x48\x03"  # eth / ZCS / Zeusshield
+    b"\x00\x00\x00\x01\x7a\x5f\xf2\x95\xdc\x82\x39\xd5\xc2\x37\x4e\x4d\x89\x42\x02\xaa\xf0\x29\xca\xb6\x03\x07\x4b\x03"  # eth / SLT / Smartlands
+    b"\x00\x00\x00\x01\x7b\x22\x93\x8c\xa8\x41\xaa\x39\x2c\x93\xdb\xb7\xf4\xc4\x21\x78\xe3\xd6\x5e\x88\x04\x07\x4e\x05"  # eth / ASTRO / AstroTokens
+    b"\x00\x00\x00\x01\x7c\x5a\x0c\xe9\x26\x7e\xd1\x9b\x22\xf8\xca\xe6\x53\xf1\x98\xe3\xe8\xda\xf0\x98\x12\x07\x53\x03"  # eth / SAN / Santiment
+    b"\x00\x00\x00\x01\x7d\x4b\x8c\xce\x05\x91\xc9\x04\x4a\x22\xee\x54\x35\x33\xb7\x2e\x97\x6e\x36\xc3\x12\x07\x56\x03"  # eth / CAG / Change Bank
+    b"\x00\x00\x00\x01\x7d\xc4\xf4\x12\x94\x69\x7a\x79\x03\xc4\x02\x7f\x6a\xc5\x28\xc5\xd1\x4c\xd7\xeb\x08\x07\x59\x03"  # eth / RMC / RemiCoin
+    b"\x00\x00\x00\x01\x7d\xd7\xf5\x6d\x69\x7c\xc0\xf2\xb5\x2b\xd5\x5c\x05\x7f\x37\x8f\x1f\xe6\xab\x4b\x12\x07\x5c\x05"  # eth / $TEAK / $TEAK
+    b"\x00\x00\x00\x01\x7e\x66\x75\x25\x52\x1c\xf6\x13\x52\xe2\xe0\x1b\x50\xfa\xaa\xe7\xdf\x39\x74\x9a\x12\x07\x61\x03"  # eth / CMC / CryptoMart
+    b"\x00\x00\x00\x01\x7e\x9e\x43\x1a\x0b\x8c\x4d\x53\x2c\x74\x5b\x10\x43\xc7\xfa\x29\xa4\x8d\x4f\xba\x12\x07\x64\x06"  # eth / eosDAC / eosDAC
+    b"\x00\x00\x00\x01\x7f\x1e\x2c\x7d\x6a\x69\xbf\x34\x82\x4d\x72\xc5\x3b\x45\x50\xe8\x95\xc0\xd8\xc2\x08\x07\x6a\x03"  # eth / BOP / BlockOptiopns Token
+    b"\x00\x00\x00\x01\x7f\x58\x5b\x91\x30\xc6\x4e\x9e\x9f\x47\x0b\x61\x8a\x7b\xad\xd0\x3d\x79\xca\x7e\x12\x07\x6d\x03"  # eth / CR7 / CR7Coin
+    b"\x00\x00\x00\x01\x7f\xc4\x08\x01\x11\x65\x76\x0e\xe3\x1b\xe2\xbf\x20\xda\xf4\x50\x35\x66\x92\xaf\x08\x07\x70\x03"  # eth / MTR / Mitrav
+    b"\x00\x00\x00\x01\x7f\xce\x28\x56\x89\x9a\x68\x06\xee\xef\x70\x80\x79\x85\xfc\x75\x54\xc6\x63\x40\x09\x07\x73\x03"  # eth / CLP / CryptoLending
+    b"\x00\x00\x00\x01\x80\x04\x63\x05\xaa\xab\x08\xf6\x03\x3b\x56\xa3\x60\xc1\x84\x39\x11\x65\xdc\x2d\x12\x07\x76\x04"  # eth / BRLN / Berlin Coin
+    b"\x00\x00\x00\x01\x80\x98\x26\xcc\xea\xb6\x8c\x38\x77\x26\xaf\x96\x27\x13\xb6\x4c\xb5\xcb\x3c\xca\x12\x07\x7a\x05"  # eth / NCASH / Nucleus Vision
+    b"\x00\x00\x00\x01\x80\xa7\xe0\x48\xf3\x7a\x50\x50\x03\x51\xc2\x04\xcb\x40\x77\x66\xfa\x3b\xae\x7f\x12\x07\x7f\x04"  # eth / CRPT / CrypteriumToken
+    b"\x00\x00\x00\x01\x80\xbc\x55\x12\x56\x1c\x7f\x85\xa3\xa9\x50\x8c\x7d\xf7\x90\x1b\x37\x0f\xa1\xdf\x12\x07\x83\x03"  # eth / TIO / TIO
+    b"\x00\x00\x00\x01\x80\xfb\x78\x4b\x7e\xd6\x67\x30\xe8\xb1\xdb\xd9\x82\x0a\xfd\x29\x93\x1a\xab\x03\x12\x07\x86\x04"  # eth / LEND / EHTLend
+    b"\x00\x00\x00\x01\x81\x49\x64\xb1\xbc\xea\xf2\x4e\x26\x29\x6d\x03\x1e\xad\xf1\x34\xa2\xca\x41\x05\x00\x07\x8a\x04"  # eth / NEWB / Newbium
+    b"\x00\x00\x00\x01\x81\x4c\xaf\xd4\x78\x2d\x2e\x72\x81\x70\xfd\xa6\x82\x57\x98\x3f\x03\x32\x1c\x58\x00\x07\x8e\x04"  # eth / IDEA / IDEA Token
+    b"\x00\x00\x00\x01\x81\x4e\x09\x08\xb1\x2a\x99\xfe\xcf\x5b\xc1\x01\xbb\x5d\x0b\x8b\x5c\xdf\x7d\x26\x12\x07\x92\x03"  # eth / MDT / Measurable Data Token
+    b"\x00\x00\x00\x01\x81\x8f\xc6\xc2\xec\x59\x86\xbc\x6e\x2c\xbf\x00\x93\x9d\x90\x55\x6a\xb1\x2c\xe5\x12\x07\x95\x03"  # eth / KIN / Kin Foundation
+    b"\x00\x00\x00\x01\x81\xb4\xd0\x86\x45\xda\x11\x37\x4a\x03\x74\x9a\xb1\x70\x83\x6e\x4e\x53\x97\x67\x09\x07\x98\x04"  # eth / PMNT / Paymon
+    b"\x00\x00\x00\x01\x81\xc9\x15\x1d\xe0\xc8\xba\xfc\xd3\x25\xa5\x7e\x3d\xb5\xa5\xdf\x1c\xeb\xf7\x9c\x12\x07\x9c\x03"  # eth / DAT / Datum Token
+    b"\x00\x00\x00\x01\x82\x12\x5a\xfe\x01\x81\x9d\xff\x15\x35\xd0\xd6\x27\x6d\x57\x04\x52\x91\xb6\xc0\x12\x07\x9f\x03"  # eth / MRL / Marcelo
+    b"\x00\x00\x00\x01\x82\x9a\x4c\xa1\x30\x33\x83\xf1\x08\x2b\x6b\x1f\xb9\x37\x11\x6e\x4b\x3b\x56\x05\x12\x07\xa2\x04"  # eth / WATT / WorkChain App Token
+    b"\x00\x00\x00\x01\x82\xb0\xe5\x04\x78\xee\xaf\xde\x39\x2d\x45\xd1\x25\x9e\xd1\x07\x1b\x6f\xda\x81\x12\x07\xa6\x03"  # eth / DNA / EncrypGen
+    b"\x00\x00\x00\x01\x82\xbd\x52\x6b\xdb\x71\x8c\x6d\x4d\xd2\x29\x1e\xd0\x13\xa5\x18\x6c\xae\x2d\xca\x12\x07\xa9\x04"  # eth / VDOC / Duty of Care Token
+    b"\x00\x00\x00\x01\x82\xf4\xde\xd9\xce\xc9\xb5\x75\x0f\xbf\xf5\xc2\x18\x5a\xee\x35\xaf\xc1\x65\x87\x06\x07\xad\x05"  # eth / DREAM / DREAM
+    b"\x00\x00\x00\x01\x83\x29\x04\x86\x39\x78\xb9\x48\x02\x12\x31\x06\xe6\xeb\x49\x1b\xdf\x0d\xf9\x28\x12\x07\xb2\x04"  # eth / OPTI / OptiToken
+    b"\x00\x00\x00\x01\x83\x98\x4d\x61\x42\x93\x4b\xb5\x35\x79\x3a\x82\xad\xb0\xa4\x6e\xf0\xf6\x6b\x6d\x04\x07\xb6\x03"  # eth / REM / Remme
+    b"\x00\x00\x00\x01\x83\xce\xe9\xe0\x86\xa7\x7e\x49\x2e\xe0\xbb\x93\xc2\xb0\x43\x7a\xd6\xfd\xec\xcc\x12\x07\xb9\x04"  # eth / MNTP / Goldmint MNT Prelaunch Token
+    b"\x00\x00\x00\x01\x83\xe2\xbe\x8d\x11\x4f\x96\x61\x22\x13\x84\xb3\xa5\x0d\x24\xb9\x6a\x56\x53\xf5\x12\x07\xbd\x03"  # eth / ZXC / 0xcert Protocol Token
+    b"\x00\x00\x00\x01\x83\xee\xa0\x0d\x83\x8f\x92\xde\xc4\xd1\x47\x56\x97\xb9\xf4\xd3\x53\x7b\x56\xe3\x08\x07\xc0\x05"  # eth / VOISE / Voise
+    b"\x00\x00\x00\x01\x84\x00\xd9\x4a\x5c\xb0\xfa\x0d\x04\x1a\x37\x88\xe3\x95\x28\x5d\x61\xc9\xee\x5e\x08\x07\xc5\x03"  # eth / UBT / Unibright
+    b"\x00\x00\x00\x01\x84\x0f\xe7\x5a\xbf\xad\xc0\xf2\xd5\x40\x37\x82\x95\x71\xb2\x78\x2e\x91\x9c\xe4\x12\x07\xc8\x03"  # eth / WEB / Webcoin
+    b"\x00\x00\x00\x01\x84\x11\x9c\xb3\x3e\x8f\x59\x0d\x75\xc2\xd6\xea\x4e\x6b\x07\x41\xa7\x49\x4e\xda\x00\x07\xcb\x03"  # eth / WTT / WTT
+    b"\x00\x00\x00\x01\x84\x6c\x66\xcf\x71\xc4\x3f\x80\x40\x3b\x51\xfe\x39\x06\xb3\x59\x9d\x63\x33\x6f\x12\x07\xce\x03"  # eth / PMA / PumaPay
+    b"\x00\x00\x00\x01\x84\x93\x6c\xf7\x63\x0a\xa3\xe2\x7d\xd9\xaf\xf9\x68\xb1\x40\xd5\xae\xe4\x9f\x5a\x08\x07\xd1\x04"  # eth / AMTC / AmberTime Coin
+    b"\x00\x00\x00\x01\x84\xf7\xc4\x4b\x6f\xed\x10\x80\xf6\x47\xe3\x54\xd5\x52\x59\x5b\xe2\xcc\x60\x2f\x12\x07\xd5\x03"  # eth / BBO / Bigbom
+    b"\x00\x00\x00\x01\x85\x08\x93\x89\xc1\x4b\xd9\xc7\x7f\xc2\xb8\xf0\xc3\xd1\xdc\x33\x63\xbf\x06\xef\x12\x07\xd8\x03"  # eth / SPF / Sportify
+    b"\x00\x00\x00\x01\x85\x42\x32\x5b\x72\xc6\xd9\xfc\x0a\xd2\xca\x96\x5a\x78\x43\x54\x13\xa9\x15\xa0\x12\x07\xdb\x03"  # eth / SHL / Oyster Shell
+    b"\x00\x00\x00\x01\x85\x9a\x9c\x0b\x44\xcb\x70\x66\xd9\x56\xa9\x58\xb0\xb8\x2e\x54\xc9\xe4\x4b\x4b\x08\x07\xde\x04"  # eth / IETH / iEthereum
+    b"\x00\x00\x00\x01\x86\x5e\xc5\x8b\x06\xbf\x63\x05\xb8\x86\x79\x3a\xa2\x0a\x2d\xa3\x1d\x03\x4e\x68\x12\x07\xe2\x03"  # eth / MOC / Moss Coin
+    b"\x00\x00\x00\x01\x87\x13\xd2\x66\x37\xcf\x49\xe1\xb6\xb4\xa7\xce\x57\x10\x6a\xab\xc9\x32\x53\x43\x12\x07\xe5\x03"  # eth / CNN / Content Neutrality Network
+    b"\x00\x00\x00\x01\x87\x27\xc1\x12\xc7\x12\xc4\xa0\x33\x71\xac\x87\xa7\x4d\xd6\xab\x10\x4a\xf7\x68\x12\x07\xe8\x03"  # eth / JET / JET
+    b"\x00\x00\x00\x01\x87\xf5\xe8\xc3\x42\x52\x18\x83\x7f\x3c\xb6\x7d\xb9\x41\xaf\x0c\x01\x32\x3e\x56\x12\x07\xeb\x06"  # eth / BTCONE / BitCoin One
+    b"\x00\x00\x00\x01\x88\x10\xc6\x34\x70\xd3\x86\x39\x95\x4c\x6b\x41\xaa\xc5\x45\x84\x8c\x46\x48\x4a\x12\x07\xf1\x03"  # eth / ADI / Aditus
+    b"\x00\x00\x00\x01\x88\x1e\xf4\x82\x11\x98\x2d\x01\xe2\xcb\x70\x92\xc9\x15\xe6\x47\xcd\x40\xd8\x5c\x12\x07\xf4\x03"  # eth / OTN / Open Trading Network
+    b"\x00\x00\x00\x01\x88\x24\x48\xf8\x3d\x90\xb2\xbf\x47\x7a\xf2\xea\x79\x32\x7f\xde\xa1\x33\x5d\x93\x12\x07\xf7\x05"  # eth / VIBEX / VIBEX Exchange Token
+    b"\x00\x00\x00\x01\x88\x78\x34\xd3\xb8\xd4\x50\xb6\xba\xb1\x09\xc2\x52\xdf\x3d\xa2\x86\xd7\x3c\xe4\x12\x07\xfc\x03"  # eth / ATT / Atmatrix Token
+    b"\x00\x00\x00\x01\x88\x86\x66\xca\x69\xe0\xf1\x78\xde\xd6\xd7\x5b\x57\x26\xce\xe9\x9a\x87\xd6\x98\x12\x07\xff\x03"  # eth / ICN / ICONOMI
+    b"\x00\x00\x00\x01\x88\xa3\xe4\xf3\x5d\x64\xaa\xd4\x1a\x6d\x40\x30\xac\x9a\xfe\x43\x56\xcb\x84\xfa\x12\x08\x02\x03"  # eth / PRE / Presearch
+    b"\x00\x00\x00\x01\x88\xac\x94\xd5\xd1\x75\x13\x03\x47\xfc\x95\xe1\x09\xd7\x7a\xc0\x9d\xbf\x5a\xb7\x12\x08\x05\x03"  # eth / HKY / Hicky
+    b"\x00\x00\x00\x01\x88\xae\x96\x84\x5e\x15\x75\x58\xef\x59\xe9\xff\x90\xe7\x66\xe2\x2e\x48\x03\x90\x00\x08\x08\x03"  # eth / IKB / IKB
+    b"\x00\x00\x00\x01\x88\xfc\xfb\xc2\x2c\x6d\x3d\xba\xa2\x5a\xf4\x78\xc5\x78\x97\x83\x39\xbd\xe7\x7a\x12\x08\x0b\x03"  # eth / FYN / Fund Yourself Now
+    b"\x00\x00\x00\x01\x89\x20\x5a\x3a\x3b\x2a\x69\xde\x6d\xbf\x7f\x01\xed\x13\xb2\x10\x8b\x2c\x43\xe7\x00\x08\x0e\x07"  # eth / Unicorn / Unicorn
+    b"\x00\x00\x00\x01\x89\x30\x35\x00\xa7\xab\xfb\x17\x8b\x27\x4f\xd8\x9f\x24\x69\xc2\x64\x95\x1e\x1f\x08\x08\x15\x03"  # eth / REF / RefToken
+    b"\x00\x00\x00\x01\x89\x93\x38\xb8\x4d\x25\xac\x50\x5a\x33\x2a\xdc\xe7\x40\x2d\x69\x7d\x94\x74\x94\x08\x08\x18\x03"  # eth / WIN / WCOIN
+    b"\x00\x00\x00\x01\x89\xd2\x4a\x6b\x4c\xcb\x1b\x6f\xaa\x26\x25\xfe\x56\x2b\xdd\x9a\x23\x26\x03\x59\x12\x08\x1b\x03"  # eth / DAI / Dai Stablecoin v1.0
+    b"\x00\x00\x00\x01\x8a\x18\x7d\x52\x85\xd3\x16\xbc\xbc\x9a\xda\xfc\x08\xb5\x1d\x70\xa0\xd8\xe0\x00\x00\x08\x1e\x04"  # eth / SIFT / SIFT
+    b"\x00\x00\x00\x01\x8a\x77\xe4\x09\x36\xbb\xc2\x7e\x80\xe9\xa3\xf5\x26\x36\x8c\x96\x78\x69\xc8\x6d\x12\x08\x22\x03"  # eth / MVP / Merculet
+    b"\x00\x00\x00\x01\x8a\x85\x42\x88\xa5\x97\x60\x36\xa7\x25\x87\x91\x64\xca\x3e\x91\xd3\x0c\x6a\x1b\x12\x08\x25\x03"  # eth / GET / GET Protocol
+    b"\x00\x00\x00\x01\x8a\x88\xf0\x4e\x0c\x90\x50\x54\xd2\xf3\x3b\x26\xbb\x3a\x46\xd7\x09\x1a\x03\x9a\x12\x08\x28\x02"  # eth / IG / IGToken
+    b"\x00\x00\x00\x01\x8a\x95\xca\x44\x8a\x52\xc0\xad\xf0\x05\x4b\xb3\x40\x2d\xc5\xe0\x9c\xd6\xb2\x32\x12\x08\x2a\x03"  # eth / CDL / Confideal
+    b"\x00\x00\x00\x01\x8a\x99\xed\x8a\x1b\x20\x49\x03\xee\x46\xe7\x33\xf2\xc1\x28\x6f\x6d\x20\xb1\x77\x12\x08\x2d\x03"  # eth / NTO / Fujinto
+    b"\x00\x00\x00\x01\x8a\xa3\x3a\x78\x99\xfc\xc8\xea\x5f\xbe\x6a\x60\x8a\x10\x9c\x38\x93\xa1\xb8\xb2\x12\x08\x30\x03"  # eth / BET / DAO.Casino
+    b"\x00\x00\x00\x01\x8a\xe4\xbf\x2c\x33\xa8\xe6\x67\xde\x34\xb5\x49\x38\xb0\xcc\xd0\x3e\xb8\xcc\x06\x08\x08\x33\x04"  # eth / PTOY / Patientory
+    b"\x00\x00\x00\x01\x8a\xe5\x6a\x68\x50\xa7\xcb\xea\xc3\xc3\xab\x2c\xb3\x11\xe7\x62\x01\x67\xea\xc8\x12\x08\x37\x03"  # eth / PEG / PEG Network Token
+    b"\x00\x00\x00\x01\x8b\x35\x30\x21\x18\x93\x75\x59\x17\x23\xe7\x38\x42\x62\xf4\x57\x09\xa3\xc3\xdc\x12\x08\x3a\x04"  # eth / TOMO / Tomocoin
+    b"\x00\x00\x00\x01\x8c\x39\xaf\xdf\x7b\x17\xf1\x2c\x55\x32\x08\x55\x5e\x51\xab\x86\xe6\x9c\x35\xaa\x08\x08\x3e\x03"  # eth / FR8 / Fr8 Network
+    b"\x00\x00\x00\x01\x8c\x65\xe9\x92\x29\x7d\x5f\x09\x2a\x75\x6d\xef\x24\xf4\x78\x1a\x28\x01\x98\xff\x12\x08\x41\x03"  # eth / GZE / GazeCoin
+    b"\x00\x00\x00\x01\x8d\x56\x82\x94\x1c\xe4\x56\x90\x0b\x12\xd4\x7a\xc0\x6a\x88\xb4\x7c\x76\x4c\xe1\x12\x08\x44\x05"  # eth / RMESH / RightMesh Token
+    b"\x00\x00\x00\x01\x8d\x80\xde\x8a\x78\x19\x83\x96\x32\x9d\xfa\x76\x9a\xd5\x4d\x24\xbf\x90\xe7\xaa\x12\x08\x49\x03"  # eth / NAC / Nami ICO
+    b"\x00\x00\x00\x01\x8d\xb5\x4c\xa5\x69\xd3\x01\x9a\x2b\xa1\x26\xd0\x3c\x37\xc4\x4b\x5e\xf8\x1e\xf6\x08\x08\x4c\x03"  # eth / DXT / Datawallet
+    b"\x00\x00\x00\x01\x8d\xd5\xfb\xce\x2f\x6a\x95\x6c\x30\x22\xba\x36\x63\x75\x90\x11\xdd\x51\xe7\x3e\x12\x08\x4f\x11"  # eth / [deprecated] TUSD / TrueUSD
+    b"\x00\x00\x00\x01\x8e\x1b\x44\x8e\xc7\xad\xfc\x7f\xa3\x5f\xc2\xe8\x85\x67\x8b\xd3\x23\x17\x6e\x34\x12\x08\x60\x03"  # eth / EGT / Egretia Token
+    b"\x00\x00\x00\x01\x8e\x56\x10\xab\x5e\x39\xd2\x68\x28\x16\x76\x40\xea\x29\x82\x3f\xe1\xdd\x58\x43\x08\x08\x63\x04"  # eth / KNDC / KanadeCoin
+    b"\x00\x00\x00\x01\x8e\x87\x0d\x67\xf6\x60\xd9\x5d\x5b\xe5\x30\x38\x0d\x0e\xc0\xbd\x38\x82\x89\xe1\x12\x08\x67\x03"  # eth / PAX / Paxos Standard (PAX)
+    b"\x00\x00\x00\x01\x8e\xb2\x43\x19\x39\x37\x16\x66\x8d\x76\x8d\xce\xc2\x93\x56\xae\x9c\xff\xe2\x85\x08\x08\x6a\x03"  # eth / AGI / SingularityNET
+    b"\x00\x00\x00\x01\x8e\xb9\x65\xee\x9c\xcf\xbc\xe7\x6c\x0a\x06\x26\x44\x92\xc0\xaf\xef\xc2\x82\x6d\x12\x08\x6d\x04"  # eth / TOOR / ToorCoin
+    b"\x00\x00\x00\x01\x8e\xff\xd4\x94\xeb\x69\x8c\xc3\x99\xaf\x62\x31\xfc\xcd\x39\xe0\x8f\xd2\x0b\x15\x00\x08\x71\x03"  # eth / PIX / Lampix
+    b"\x00\x00\x00\x01\x8f\x09\x21\xf3\x05\x55\x62\x41\x43\xd4\x27\xb3\x40\xb1\x15\x69\x14\x88\x2c\x10\x12\x08\x74\x03"  # eth / FYP / FlypMe
+    b"\x00\x00\x00\x01\x8f\x34\x70\xa7\x38\x8c\x05\xee\x4e\x7a\xf3\xd0\x1d\x8c\x72\x2b\x0f\xf5\x23\x74\x12\x08\x77\x04"  # eth / VERI / Veritaseum
+    b"\x00\x00\x00\x01\x8f\x82\x21\xaf\xbb\x33\x99\x8d\x85\x84\xa2\xb0\x57\x49\xba\x73\xc3\x7a\x93\x8a\x12\x08\x7b\x03"  # eth / REQ / Request Network
+    b"\x00\x00\x00\x01\x8f\x93\x6f\xe0\xfa\xf0\x60\x4c\x9c\x0e\xf2\x40\x6b\xde\x0a\x65\x36\x55\x15\xd6\x12\x08\x7e\x03"  # eth / WCN / WorldCoinNetwork
+    b"\x00\x00\x00\x01\x90\x02\xd4\x48\x5b\x75\x94\xe3\xe8\x50\xf0\xa2\x06\x71\x3b\x30\x51\x13\xf6\x9e\x12\x08\x81\x03"  # eth / HAT / Hawala Today
+    b"\x00\x00\x00\x01\x90\x0b\x44\x49\x23\x6a\x7b\xb2\x6b\x28\x66\x01\xdd\x14\xd2\xbd\xe7\xa6\xac\x6c\x08\x08\x84\x05"  # eth / EARTH / Earth Token
+    b"\x00\x00\x00\x01\x90\x16\x2f\x41\x88\x6c\x09\x46\xd0\x99\x99\x73\x6f\x1c\x15\xc8\xa1\x05\xa4\x21\x12\x08\x89\x03"  # eth / FAN / Fan Token
+    b"\x00\x00\x00\x01\x90\x52\x8a\xeb\x3a\x2b\x73\x6b\x78\x0f\xd1\xb6\xc4\x78\xbb\x7e\x1d\x64\x31\x70\x12\x08\x8c\x03"  # eth / XPA / XPA
+    b"\x00\x00\x00\x01\x90\x6b\x3f\x8b\x78\x45\x84\x01\x88\xea\xb5\x3c\x3f\x5a\xd3\x48\xa7\x87\x75\x2f\x0f\x08\x8f\x03"  # eth / DOR / Dorado
+    b"\x00\x00\x00\x01\x91\x0d\xfc\x18\xd6\xea\x3d\x6a\x71\x24\xa6\xf8\xb5\x45\x8f\x28\x10\x60\xfa\x4c\x12\x08\x92\x03"  # eth / X8X / X8X
+    b"\x00\x00\x00\x01\x92\x14\xec\x02\xcb\x71\xcb\xa0\xad\xa6\x89\x6b\x8d\xa2\x60\x73\x6a\x67\xab\x10\x12\x08\x95\x04"  # eth / REAL / Real Estate Asset Ledger
+    b"\x00\x00\x00\x01\x92\x21\x05\xfa\xd8\x15\x3f\x51\x6b\xcf\xb8\x29\xf5\x6d\xc0\x97\xa0\xe1\xd7\x05\x12\x08\x99\x03"  # eth / YEE / Yee Token
+    b"\x00\x00\x00\x01\x92\x2a\xc4\x73\xa3\xcc\x24\x1f\xd3\xa0\x04\x9e\xd1\x45\x36\x45\x2d\x58\xd7\x3c\x12\x08\x9c\x03"  # eth / VLD / VETRI
+    b"\x00\x00\x00\x01\x92\x31\x08\xa4\x39\xc4\xe8\xc2\x31\x5c\x4f\x65\x21\xe5\xce\x95\xb4\x4e\x9b\x4c\x12\x08\x9f\x03"  # eth / EVE / Devery
+    b"\x00\x00\x00\x01\x92\x38\xbf\xb7\x81\xa5\x5e\xac\xc3\xcf\x05\xf7\xdf\x94\x03\x8c\x19\x8c\xd9\xb9\x08\x08\xa2\x04"  # eth / CRMT / Cremit
+    b"\x00\x00\x00\x01\x92\xa5\xb0\x4d\x0e\xd5\xd9\x4d\x7a\x19\x3d\x1d\x33\x4d\x3d\x16\x99\x6f\x4e\x13\x12\x08\xa6\x03"  # eth / ERT / Eristica
+    b"\x00\x00\x00\x01\x92\xe5\x2a\x1a\x23\x5d\x9a\x10\x3d\x97\x09\x01\x06\x6c\xe9\x10\xaa\xce\xfd\x37\x08\x08\xa9\x05"  # eth / UCASH / U.CASH
+    b"\x00\x00\x00\x01\x93\x16\x84\x13\x9f\x75\x6c\x24\xec\x07\x31\xe9\xf7\x4f\xe5\x0e\x55\x48\xdd\xef\x12\x08\xae\x03"  # eth / URB / Urbit Data
+    b"\x00\x00\x00\x01\x93\x89\x43\x48\x52\xb9\x4b\xba\xd4\xc8\xaf\xed\x5b\x7b\xdb\xc5\xff\x0c\x22\x75\x12\x08\xb1\x03"  # eth / TTC / TTC Protocol
+    b"\x00\x00\x00\x01\x93\xe6\x82\x10\x7d\x1e\x9d\xef\xb0\xb5\xee\x70\x1c\x71\x70\x7a\x4b\x2e\x46\xbc\x08\x08\xb4\x04"  # eth / MCAP / MCAP
+    b"\x00\x00\x00\x01\x93\xed\x3f\xbe\x21\x20\x7e\xc2\xe8\xf2\xd3\xc3\xde\x6e\x05\x8c\xb7\x3b\xc0\x4d\x12\x08\xb8\x03"  # eth / PNK / Pinakion
+    b"\x00\x00\x00\x01\x94\x3e\xd8\x52\xda\xdb\x5c\x39\x38\xec\xdc\x68\x83\x71\x8d\xf8\x14\x2d\xe4\xc8\x12\x08\xbb\x03"  # eth / FTI / FansTime
+    b"\x00\x00\x00\x01\x94\x9b\xed\x88\x6c\x73\x9f\x1a\x32\x73\x62\x9b\x33\x20\xdb\x0c\x50\x24\xc7\x19\x09\x08\xbe\x04"  # eth / AMIS / AMIS
+    b"\x00\x00\x00\x01\x95\x01\xbf\xc4\x88\x97\xdc\xee\xad\xf7\x31\x13\xef\x63\x5d\x2f\xf7\xee\x4b\x97\x12\x08\xc2\x03"  # eth / EMT / easyMINE Token
+    b"\x00\x00\x00\x01\x95\x41\xfd\x8b\x9b\x5f\xa9\x73\x81\x78\x37\x83\xce\xbf\x2f\x5f\xa7\x93\xc2\x62\x08\x08\xc5\x03"  # eth / KZN / KaizenCoin
+    b"\x00\x00\x00\x01\x95\x4b\x5d\xe0\x9a\x55\xe5\x97\x55\xac\xbd\xa2\x9e\x1e\xb7\x4a\x45\xd3\x01\x75\x12\x08\xc8\x04"  # eth / FLUZ / Fluz Fluz Global
+    b"\x00\x00\x00\x01\x95\x7c\x30\xab\x04\x26\xe0\xc9\x3c\xd8\x24\x1e\x2c\x60\x39\x2d\x08\xc6\xac\x8e\x00\x08\xcc\x03"  # eth / MOD / Modum
+    b"\x00\x00\x00\x01\x95\xc4\xbe\x85\x34\xd6\x9c\x24\x8c\x06\x23\xc4\xc9\xa7\xa2\xa0\x01\xc1\x73\x37\x12\x08\xcf\x03"  # eth / HDL / HOLDER.TECH
+    b"\x00\x00\x00\x01\x95\xda\xaa\xb9\x80\x46\x84\x6b\xf4\xb2\x85\x3e\x23\xcb\xa2\x36\xfa\x39\x4a\x31\x08\x08\xd2\x05"  # eth / EMONT / Etheremon Token
+    b"\x00\x00\x00\x01\x95\xef\xd1\xfe\x60\x99\xf6\x5a\x7e\xd5\x24\xde\xf4\x87\x48\x32\x21\x09\x49\x47\x12\x08\xd7\x03"  # eth / CBM / CryptoBonusMiles
+    b"\x00\x00\x00\x01\x96\x0b\x23\x6a\x07\xcf\x12\x26\x63\xc4\x30\x33\x50\x60\x9a\x66\xa7\xb2\x88\xc0\x12\x08\xda\x03"  # eth / ANT / Aragon
+    b"\x00\x00\x00\x01\x96\xa6\x56\x09\xa7\xb8\x4e\x88\x42\x73\x2d\xeb\x08\xf5\x6c\x3e\x21\xac\x6f\x8a\x12\x08\xdd\x03"  # eth / CTR / Centra
+    b"\x00\x00\x00\x01\x97\x20\xb4\x67\xa7\x10\x38\x2a\x23\x2a\x32\xf5\x40\xbd\xce\xd7\xd6\x62\xa1\x0b\x12\x08\xe0\x03"  # eth / VZT / Vezt
+    b"\x00\x00\x00\x01\x97\xae\xb5\x06\x6e\x1a\x59\x0e\x86\x8b\x51\x14\x57\xbe\xb6\xfe\x99\xd3\x29\xf5\x12\x08\xe3\x04"  # eth / ATMI / Atonomi
+    b"\x00\x00\x00\x01\x98\x3f\x6d\x60\xdb\x79\xea\x8c\xa4\xeb\x99\x68\xc6\xaf\xf8\xcf\xa0\x4b\x3c\x63\x12\x08\xe7\x03"  # eth / SNM / SONM
+    b"\x00\x00\x00\x01\x98\x47\x34\x5d\xe8\xb6\x14\xc9\x56\x14\x6b\xbe\xa5\x49\x33\x6d\x9c\x8d\x26\xb6\x08\x08\xea\x04"  # eth / GULD / GULD ERC20
+    b"\x00\x00\x00\x01\x98\x6e\xe2\xb9\x44\xc4\x2d\x01\x7f\x52\xaf\x21\xc4\xc6\x9b\x84\xdb\xea\x35\xd8\x12\x08\xee\x03"  # eth / BMX / BitMart Token
+    b"\x00\x00\x00\x01\x98\xf5\xe9\xb7\xf0\xe3\x39\x56\xc0\x44\x3e\x81\xbf\x7d\xeb\x8b\x5b\x1e\xd5\x45\x12\x08\xf1\x04"  # eth / SEXY / Sexy Token
+    b"\x00\x00\x00\x01\x99\x4f\x0d\xff\xdb\xae\x0b\xbf\x09\xb6\x52\xd6\xf1\x1a\x49\x3f\xd3\x3f\x42\xb9\x12\x08\xf5\x05"  # eth / EAGLE / EagleCoin
+    b"\x00\x00\x00\x01\x99\x72\xa0\xf2\x41\x94\x44\x7e\x73\xa7\xe8\xb6\xcd\x26\xa5\x2e\x02\xdd\xfa\xd5\x00\x08\xfa\x03"  # eth / TCH / Thore Cash
+    b"\x00\x00\x00\x01\x99\x8b\x3b\x82\xbc\x9d\xba\x17\x39\x90\xbe\x7a\xfb\x77\x27\x88\xb5\xac\xb8\xbd\x12\x08\xfd\x05"  # eth / BANCA / Banca
+    b"\x00\x00\x00\x01\x99\x92\xec\x3c\xf6\xa5\x5b\x00\x97\x8c\xdd\xf2\xb2\x7b\xc6\x88\x2d\x88\xd1\xec\x12\x09\x02\x04"  # eth / POLY / Polymath Network
+    b"\x00\x00\x00\x01\x99\x99\x67\xe2\xec\x8a\x74\xb7\xc8\xe9\xdb\x19\xe0\x39\xd9\x20\xb3\x1d\x39\xd0\x12\x09\x06\x03"  # eth / TIE / Ties.DB
+    b"\x00\x00\x00\x01\x99\xea\x4d\xb9\xee\x77\xac\xd4\x0b\x11\x9b\xd1\xdc\x4e\x33\xe1\xc0\x70\xb8\x0d\x12\x09\x09\x03"  # eth / QSP / Quantstamp Token
+    b"\x00\x00\x00\x01\x9a\x00\x5c\x9a\x89\xbd\x72\xa4\xbd\x27\x72\x1e\x7a\x09\xa3\xc1\x1d\x2b\x03\xc4\x12\x09\x0c\x04"  # eth / STAC / Starter Coin
+    b"\x00\x00\x00\x01\x9a\x02\x42\xb7\xa3\x3d\xac\xbe\x40\xed\xb9\x27\x83\x4f\x96\xeb\x39\xf8\xfb\xcb\x12\x09\x10\x03"  # eth / BAX / BABB
+    b"\x00\x00\x00\x01\x9a\x49\xf0\x2e\x12\x8a\x8e\x98\x9b\x44\x3a\x8f\x94\x84\x3c\x09\x18\xbf\x45\xe7\x08\x09\x13\x03"  # eth / TOK / TOKOK
+    b"\x00\x00\x00\x01\x9a\x64\x2d\x6b\x33\x68\xdd\xc6\x62\xca\x24\x4b\xad\xf3\x2c\xda\x71\x60\x05\xbc\x12\x09\x16\x04"  # eth / QTUM / Qtum
+    b"\x00\x00\x00\x01\x9a\xb1\x65\xd7\x95\x01\x9b\x6d\x8b\x3e\x97\x1d\xda\x91\x07\x14\x21\x30\x5e\x5a\x12\x09\x1a\x03"  # eth / AOA / Aurora
+    b"\x00\x00\x00\x01\x9a\xef\xbe\x0b\x3c\x3b\xa9\xea\xb2\x62\xcb\x98\x56\xe8\x15\x7a\xb7\x64\x8e\x09\x12\x09\x1d\x03"  # eth / FLR / Flair Coin
+    b"\x00\x00\x00\x01\x9a\xf2\xc6\xb1\xa2\x8d\x3d\x6b\xc0\x84\xbd\x26\x7f\x70\xe9\x0d\x49\x74\x1d\x5b\x08\x09\x20\x03"  # eth / AXP / AXP
+    b"\x00\x00\x00\x01\x9a\xf4\xf2\x69\x41\x67\x7c\x70\x6c\xfe\xcf\x6d\x33\x79\xff\x01\xbb\x85\xd5\xab\x08\x09\x23\x03"  # eth / DRT / DomRaider
+    b"\x00\x00\x00\x01\x9a\xf8\x39\x68\x7f\x6c\x94\x54\x2a\xc5\xec\xe2\xe3\x17\xda\xae\x35\x54\x93\xa1\x12\x09\x26\x0b"  # eth / HOT (Hydro) / Hydro Protocol
+    b"\x00\x00\x00\x01\x9b\x11\xef\xca\xaa\x18\x90\xf6\xee\x52\xc6\xbb\x7c\xf8\x15\x3a\xc5\xd7\x41\x39\x08\x09\x31\x03"  # eth / ATM / ATMChain
+    b"\x00\x00\x00\x01\x9b\x68\xbf\xae\x21\xdf\x5a\x51\x09\x31\xa2\x62\xce\xcf\x63\xf4\x13\x38\xf2\x64\x12\x09\x34\x04"  # eth / DBET / DecentBet
+    b"\x00\x00\x00\x01\x9b\x70\x74\x0e\x70\x8a\x08\x3c\x6f\xf3\x8d\xf5\x22\x97\x02\x0f\x5d\xfa\xa5\xee\x0a\x09\x38\x03"  # eth / DAN / DaneelToken
+    b"\x00\x00\x00\x01\x9b\xb1\xdb\x14\x45\xb8\x32\x13\xa5\x6d\x90\xd3\x31\x89\x4b\x3f\x26\x21\x8e\x4e\x12\x09\x3b\x04"  # eth / HIBT / HiBTC Token
+    b"\x00\x00\x00\x01\x9c\x23\xd6\x7a\xea\x7b\x95\xd8\x09\x42\xe3\x83\x6b\xcd\xf7\xe7\x08\xa7\x47\xc2\x12\x09\x3f\x04"  # eth / LOCI / LOCIcoin
+    b"\x00\x00\x00\x01\x9c\xda\x8a\x60\xdd\x5a\xfa\x15\x6c\x95\xbd\x97\x44\x28\xd9\x1a\x08\x12\xe0\x54\x12\x09\x43\x03"  # eth / TTU / TaTaTu
+    b"\x00\x00\x00\x01\x9d\x92\x23\x43\x6d\xdd\x46\x6f\xc2\x47\xe9\xdb\xbd\x20\x20\x7e\x64\x0f\xef\x58\x12\x09\x46\x03"  # eth / OLE / Olive
+    b"\x00\x00\x00\x01\x9d\xae\x8b\x7f\x6d\x37\xea\x8e\x5d\x32\xc6\xc3\xe8\x56\xa6\xd8\xa1\xd3\xb3\x63\x12\x09\x49\x03"  # eth / GZB / GigziBlack
+    b"\x00\x00\x00\x01\x9e\x33\x19\x63\x6e\x21\x26\xe3\xc0\xbc\x9e\x31\x34\xae\xc5\xe1\x50\x8a\x46\xc7\x12\x09\x4c\x04"  # eth / UTNP / Universa
+    b"\x00\x00\x00\x01\x9e\x46\xa3\x8f\x5d\xaa\xbe\x86\x83\xe1\x07\x93\xb0\x67\x49\xee\xf7\xd7\x33\xd1\x12\x09\x50\x03"  # eth / NCT / Nectar
+    b"\x00\x00\x00\x01\x9e\x6b\x2b\x11\x54\x2f\x2b\xc5\x2f\x30\x29\x07\x7a\xce\x37\xe8\xfd\x83\x8d\x7f\x08\x09\x53\x03"  # eth / HKN / Hacken
+    b"\x00\x00\x00\x01\x9e\x77\xd5\xa1\x25\x1b\x6f\x7d\x45\x67\x22\xa6\xea\xc6\xd2\xd5\x98\x0b\xd8\x91\x08\x09\x56\x04"  # eth / BRAT / BROTHER
+    b"\x00\x00\x00\x01\x9e\x7d\x29\xbd\x49\x9b\x6c\x7d\xa2\xa5\xb2\xea\xfc\xf4\xa3\x9d\x3b\xd8\x45\xd1\x12\x09\x5a\x04"  # eth / CTGC / Convenient To Go
+    b"\x00\x00\x00\x01\x9e\x88\x61\x34\x18\xcf\x03\xdc\xa5\x4d\x6a\x2c\xf6\xad\x93\x4a\x78\xc7\xa1\x7a\x12\x09\x5e\x03"  # eth / SWM / Swarm Fund Token
+    b"\x00\x00\x00\x01\x9f\x19\x56\x17\xfa\x8f\xba\xd9\x54\x0c\x5d\x11\x3a\x99\xa0\xa0\x17\x2a\xae\xdc\x12\x09\x61\x03"  # eth / NBC / Niobium Coin
+    b"\x00\x00\x00\x01\x9f\x8f\x72\xaa\x93\x04\xc8\xb5\x93\xd5\x55\xf1\x2e\xf6\x58\x9c\xc3\xa5\x79\xa2\x12\x09\x64\x03"  # eth / MKR / MakerDAO
+    b"\x00\x00\x00\x01\x9f\xc0\x58\x32\x20\xeb\x44\xfa\xee\x9e\x2d\xc1\xe6\x3f\x39\x20\x4d\xdd\x90\x90\x12\x09\x67\x03"  # eth / 2DC / DualChain
+    b"\x00\x00\x00\x01\xa0\x17\xac\x5f\xac\x59\x41\xf9\x50\x10\xb1\x25\x70\xb8\x12\xc9\x74\x46\x9c\x2c\x12\x09\x6a\x03"  # eth / XES / Proxeus
+    b"\x00\x00\x00\x01\xa0\x24\xe8\x05\x7e\xec\x47\x4a\x9b\x23\x56\x83\x37\x07\xdd\x05\x79\xe2\x6e\xf3\x12\x09\x6d\x04"  # eth / $FXY / $FIXY NETWORK
+    b"\x00\x00\x00\x01\xa0\x2e\x3b\xb9\xce\xbc\x03\x95\x26\x01\xb3\x72\x4b\x49\x40\xe0\x84\x5b\xeb\xcf\x12\x09\x71\x04"  # eth / BTHR / Bethereum
+    b"\x00\x00\x00\x01\xa0\xb8\x69\x91\xc6\x21\x8b\x36\xc1\xd1\x9d\x4a\x2e\x9e\xb0\xce\x36\x06\xeb\x48\x06\x09\x75\x04"  # eth / USDC / USD//Coin
+    b"\x00\x00\x00\x01\xa1\x3f\x07\x43\x95\x1b\x4f\x6e\x3e\x3a\xa0\x39\xf6\x82\xe1\x72\x79\xf5\x2b\xc3\x12\x09\x79\x04"  # eth / SENC / Sentinel Chain
+    b"\x00\x00\x00\x01\xa1\x5c\x7e\xbe\x1f\x07\xca\xf6\xbf\xf0\x97\xd8\xa5\x89\xfb\x8a\xc4\x9a\xe5\xb3\x12\x09\x7d\x04"  # eth / NPXS / Pundi X Token
+    b"\x00\x00\x00\x01\xa1\xcc\xc1\x66\xfa\xf0\xe9\x98\xb3\xe3\x32\x25\xa1\xa0\x30\x1b\x1c\x86\x11\x9d\x12\x09\x81\x04"  # eth / SGEL / SGELDER
+    b"\x00\x00\x00\x01\xa3\x11\x08\xe5\xba\xb5\x49\x45\x60\xdb\x34\xc9\x54\x92\x65\x8a\xf2\x39\x35\x7c\x12\x09\x85\x04"  # eth / DACS / DACSEE
+    b"\x00\x00\x00\x01\xa3\x14\x9e\x0f\xa0\x06\x1a\x90\x07\xfa\xf3\x07\x07\x4c\xdc\xd2\x90\xf0\xe2\xfd\x08\x09\x89\x04"  # eth / PRON / PronCoin
+    b"\x00\x00\x00\x01\xa3\x3e\x72\x9b\xf4\xfd\xeb\x86\x8b\x53\x4e\x1f\x20\x52\x34\x63\xd9\xc4\x6b\xee\x0a\x09\x8d\x03"  # eth / ICO / ICO
+    b"\x00\x00\x00\x01\xa3\xd5\x8c\x4e\x56\xfe\xdc\xae\x3a\x7c\x43\xa7\x25\xae\xe9\xa7\x1f\x0e\xce\x4e\x12\x09\x90\x03"  # eth / MET / Metronome
+    b"\x00\x00\x00\x01\xa4\x01\x06\x13\x4c\x5b\xf4\xc4\x14\x11\x55\x4e\x6d\xb9\x9b\x95\xa1\x5e\xd9\xd8\x12\x09\x93\x04"  # eth / ROCK / Rocket Token
+    b"\x00\x00\x00\x01\xa4\x4e\x51\x37\x29\x3e\x85\x5b\x1b\x7b\xc7\xe2\xc6\xf8\xcd\x79\x6f\xfc\xb0\x37\x08\x09\x97\x04"  # eth / SENT / SENTinel
+    b"\x00\x00\x00\x01\xa4\xbd\xb1\x1d\xc0\xa2\xbe\xc8\x8d\x24\xa3\xaa\x1e\x6b\xb1\x72\x01\x11\x2e\xbe\x06\x09\x9b\x04"  # eth / USDS / StableUSD
+    b"\x00\x00\x00\x01\xa4\xe8\xc3\xec\x45\x61\x07\xea\x67\xd3\x07\x5b\xf9\xe3\xdf\x3a\x75\x82\x3d\xb0\x12\x09\x9f\x04"  # eth / LOOM / Loom Network
+    b"\x00\x00\x00\x01\xa4\xea\x68\x7a\x2a\x7f\x29\xcf\x2d\xc6\x6b\x39\xc6\x8e\x44\x11\xc0\xd0\x0c\x49\x12\x09\xa3\x03"  # eth / IVY / IvyKoin Public Network Tokens
+    b"\x00\x00\x00\x01\xa5\x17\xa4\x6b\xaa\xd6\xb0\x54\xa7\x6b\xd1\x9c\x46\x84\x4f\x71\x7f\xe6\x9f\xea\x08\x09\xa6\x04"  # eth / CARB / CarbCoin
+    b"\x00\x00\x00\x01\xa5\x4d\xdc\x7b\x3c\xce\x7f\xc8\xb1\xe3\xfa\x02\x56\xd0\xdb\x80\xd2\xc1\x09\x70\x12\x09\xaa\x03"  # eth / NDC / Neverdie
+    b"\x00\x00\x00\x01\xa5\x78\xac\xc0\xcb\x78\x75\x78\x1b\x78\x80\x90\x3f\x45\x94\xd1\x3c\xfa\x8b\x98\x02\x09\xad\x03"  # eth / ECN / ECN
+    b"\x00\x00\x00\x01\xa5\xf8\xfc\x09\x21\x88\x0c\xb7\x34\x23\x68\xbd\x12\x8e\xb8\x05\x04\x42\xb1\xa1\x12\x09\xb0\x03"  # eth / ARY / Block Array
+    b"\x00\x00\x00\x01\xa5\xfd\x1a\x79\x1c\x4d\xfc\xaa\xcc\x96\x3d\x4f\x73\xc6\xae\x58\x24\x14\x9e\xa7\x12\x09\xb3\x03"  # eth / JNT / Jibrel Network
+    b"\x00\x00\x00\x01\xa6\x45\x26\x4c\x56\x03\xe9\x6c\x3b\x0b\x07\x8c\xda\xb6\x87\x33\x79\x4b\x0a\x71\x08\x09\xb6\x04"  # eth / MYST / Mysterium
+    b"\x00\x00\x00\x01\xa6\xa8\x40\xe5\x0b\xca\xa5\x0d\xa0\x17\xb9\x1a\x0d\x86\xb8\xb2\xd4\x11\x56\xee\x12\x09\xba\x03"  # eth / EKO / EchoLink
+    b"\x00\x00\x00\x01\xa7\x44\x76\x44\x31\x19\xa9\x42\xde\x49\x85\x90\xfe\x1f\x24\x54\xd7\xd4\xac\x0d\x12\x09\xbd\x03"  # eth / GNT / Golem
+    b"\x00\x00\x00\x01\xa7\xf9\x76\xc3\x60\xeb\xbe\xd4\x46\x5c\x28\x55\x68\x4d\x1a\xae\x52\x71\xef\xa9\x08\x09\xc0\x03"  # eth / TFL / TrueFlip
+    b"\x00\x00\x00\x01\xa8\x00\x6c\x4c\xa5\x6f\x24\xd6\x83\x67\x27\xd1\x06\x34\x93\x20\xdb\x7f\xef\x82\x08\x09\xc3\x04"  # eth / INXT / Internxt
+    b"\x00\x00\x00\x01\xa8\x23\xe6\x72\x20\x06\xaf\xe9\x9e\x91\xc3\x0f\xf5\x29\x50\x52\xfe\x6b\x8e\x32\x12\x09\xc7\x03"  # eth / NEU / NEU Fund
+    b"\x00\x00\x00\x01\xa8\x49\xea\xae\x99\x4f\xb8\x6a\xfa\x73\x38\x2e\x9b\xd8\x8c\x2b\x6b\x18\xdc\x71\x12\x09\xca\x03"  # eth / MVL / Mass Vehicle Ledger Token
+    b"\x00\x00\x00\x01\xa8\x9b\x59\x34\x86\x34\x47\xf6\xe4\xfc\x53\xb3\x15\xa9\x3e\x87\x3b\xda\x69\xa3\x12\x09\xcd\x03"  # eth / LUM / Lumino Coin
+    b"\x00\x00\x00\x01\xa9\x24\x0f\xbc\xac\x1f\x0b\x9a\x6a\xdf\xb0\x4a\x53\xc8\xe3\xb0\xcc\x1d\x14\x44\x12\x09\xd0\x03"  # eth / HIG / ethereumhigh
+    b"\x00\x00\x00\x01\xa9\x55\x92\xdc\xff\xa3\xc0\x80\xb4\xb4\x0e\x45\x9c\x5f\x56\x92\xf6\x7d\xb7\xf8\x12\x09\xd3\x03"  # eth / ELY / ELYCOIN
+    b"\x00\x00\x00\x01\xa9\x87\x7b\x1e\x05\xd0\x35\x89\x91\x31\xdb\xd1\xe4\x03\x82\x51\x66\xd0\x9f\x92\x12\x09\xd6\x03"  # eth / MNT / Media Network Token
+    b"\x00\x00\x00\x01\xa9\xd2\x92\x7d\x3a\x04\x30\x9e\x00\x8b\x6a\xf6\xe2\xe2\x82\xae\x29\x52\xe7\xfd\x12\x09\xd9\x03"  # eth / ZIP / Zipper
+    b"\x00\x00\x00\x01\xaa\x0b\xb1\x0c\xec\x1f\xa3\x72\xeb\x3a\xbc\x17\xc9\x33\xfc\x6b\xa8\x63\xdd\x9e\x12\x09\xdc\x03"  # eth / HMC / Hms Token
+    b"\x00\x00\x00\x01\xaa\x19\x96\x1b\x6b\x85\x8d\x9f\x18\xa1\x15\xf2\x5a\xa1\xd9\x8a\xbc\x1f\xdb\xa8\x12\x09\xdf\x03"  # eth / LCS / LocalCoinSwap
+    b"\x00\x00\x00\x01\xaa\x7a\x9c\xa8\x7d\x36\x94\xb5\x75\x5f\x21\x3b\x5d\x04\x09\x4b\x8d\x0f\x0a\x6f\x12\x09\xe2\x04"  # eth / TRAC / OriginTrail
+    b"\x00\x00\x00\x01\xaa\xaf\x91\xd9\xb9\x0d\xf8\x00\xdf\x4f\x55\xc2\x05\xfd\x69\x89\xc9\x77\xe7\x3a\x08\x09\xe6\x03"  # eth / TKN / TokenCard
+    b"\x00\x00\x00\x01\xaa\xb6\x06\x81\x78\x09\x84\x1e\x8b\x11\x68\xbe\x87\x79\xee\xaf\x67\x44\xef\x64\x12\x09\xe9\x03"  # eth / TTA / Tend Token
+    b"\x00\x00\x00\x01\xaa\xf3\x70\x55\x18\x8f\xee\xe4\x86\x9d\xe6\x34\x64\x93\x7e\x68\x3d\x61\xb2\xa1\x12\x09\xec\x03"  # eth / UCN / UChain
+    b"\x00\x00\x00\x01\xab\x6c\xf8\x7a\x50\xf1\x7d\x7f\x5e\x1f\xea\xf8\x1b\x6f\xe9\xff\xbe\x8e\xbf\x84\x12\x09\xef\x03"  # eth / MRV / MRV
+    b"\x00\x00\x00\x01\xab\x95\xe9\x15\xc1\x23\xfd\xed\x5b\xdf\xb6\x32\x5e\x35\xef\x55\x15\xf1\xea\x69\x12\x09\xf2\x03"  # eth / XNN / XENON
+    b"\x00\x00\x00\x01\xab\xbb\xb6\x44\x7b\x68\xff\xd6\x14\x1d\xa7\x7c\x18\xc7\xb5\x87\x6e\xd6\xc5\xab\x12\x09\xf5\x04"  # eth / DATX / DATx
+    b"\x00\x00\x00\x01\xab\xc1\x28\x0a\x01\x87\xa2\x02\x0c\xc6\x75\x43\x7a\xed\x40\x01\x85\xf8\x6d\xb6\x12\x09\xf9\x03"  # eth / SAC / Smart Application Chain
+    b"\x00\x00\x00\x01\xab\xdf\x14\x78\x70\x23\x5f\xcf\xc3\x41\x53\x82\x8c\x76\x9a\x70\xb3\xfa\xe0\x1f\x06\x09\xfc\x04"  # eth / EURT / EUR Tether (erc20)
+    b"\x00\x00\x00\x01\xac\x32\x11\xa5\x02\x54\x14\xaf\x28\x66\xff\x09\xc2\x3f\xc1\x8b\xc9\x7e\x79\xb1\x12\x0a\x00\x03"  # eth / DOV / Dovu
+    b"\x00\x00\x00\x01\xac\x3d\xa5\x87\xea\xc2\x29\xc9\x89\x6d\x91\x9a\xbc\x23\x5c\xa4\xfd\x7f\x72\xc1\x01\x0a\x03\x03"  # eth / TGT / Target Coin
+    b"\x00\x00\x00\x01\xac\x70\x9f\xcb\x44\xa4\x3c\x35\xf0\xda\x4e\x31\x63\xb1\x17\xa1\x7f\x37\x70\xf5\x12\x0a\x06\x03"  # eth / ARC / Arcade Token
+    b"\x00\x00\x00\x01\xac\xfa\x20\x9f\xb7\x3b\xf3\xdd\x5b\xbf\xb1\x10\x1b\x9b\xc9\x99\xc4\x90\x62\xa5\x12\x0a\x09\x04"  # eth / BCDT / Blockchain Certified Data Token
+    b"\x00\x00\x00\x01\xae\x4f\x56\xf0\x72\xc3\x4c\x0a\x65\xb3\xae\x3e\x4d\xb7\x97\xd8\x31\x43\x9d\x93\x08\x0a\x0d\x03"  # eth / GIM / Gimli
+    b"\x00\x00\x00\x01\xae\x73\xb3\x8d\x1c\x9a\x8b\x27\x41\x27\xec\x30\x16\x0a\x49\x27\xc4\xd7\x18\x24\x12\x0a\x10\x03"  # eth / STK / STK Token
+    b"\x00\x00\x00\x01\xae\xc2\xe8\x7e\x0a\x23\x52\x66\xd9\xc5\xad\xc9\xde\xb4\xb2\xe2\x9b\x54\xd0\x09\x00\x0a\x13\x05"  # eth / SNGLS / SingularDTV
+    b"\x00\x00\x00\x01\xae\xc9\x8a\x70\x88\x10\x41\x48\x78\xc3\xbc\xdf\x46\xaa\xd3\x1d\xed\x4a\x45\x57\x12\x0a\x18\x03"  # eth / 300 / 300 Token Sparta
+    b"\x00\x00\x00\x01\xae\xf3\x8f\xbf\xbf\x93\x2d\x1a\xef\x3b\x80\x8b\xc8\xfb\xd8\xcd\x8e\x1f\x8b\xc5\x08\x0a\x1b\x03"  # eth / CRB / Creditbit
+    b"\x00\x00\x00\x01\xaf\x30\xd2\xa7\xe9\x0d\x7d\xc3\x61\xc8\xc4\x58\x5e\x9b\xb7\xd2\xf6\xf1\x5b\xc7\x12\x0a\x1e\x03"  # eth / 1ST / FirstBlood
+    b"\x00\x00\x00\x01\xaf\x4d\xce\x16\xda\x28\x77\xf8\xc9\xe0\x05\x44\xc9\x3b\x62\xac\x40\x63\x1f\x16\x05\x0a\x21\x03"  # eth / MTH / Monetha
+    b"\x00\x00\x00\x01\xaf\xbe\xc4\xd6\x5b\xc7\xb1\x16\xd8\x51\x07\xfd\x05\xd9\x12\x49\x10\x29\xbf\x46\x12\x0a\x24\x03"  # eth / ARB / ARBITRAGE
+    b"\x00\x00\x00\x01\xaf\xc3\x97\x88\xc5\x1f\x0c\x1f\xf7\xb5\x53\x17\xf3\xe7\x02\x99\xe5\x21\xff\xf6\x08\x0a\x27\x04"  # eth / eBCH / eBCH
+    b"\x00\x00\x00\x01\xaf\xe6\x05\x11\x34\x1a\x37\x48\x8d\xe2\x5b\xef\x35\x19\x52\x56\x2e\x31\xfc\xc1\x08\x0a\x2b\x03"  # eth / TBT / TBitBot
+    b"\x00\x00\x00\x01\xb0\x28\x07\x43\xb4\x4b\xf7\xdb\x4b\x6b\xe4\x82\xb2\xba\x7b\x75\xe5\xda\x09\x6c\x12\x0a\x2e\x03"  # eth / TNS / Transcodium
+    b"\x00\x00\x00\x01\xb0\x56\xc3\x8f\x6b\x7d\xc4\x06\x43\x67\x40\x3e\x26\x42\x4c\xd2\xc6\x06\x55\xe1\x12\x0a\x31\x04"  # eth / CEEK / CEEK VR Token
+    b"\x00\x00\x00\x01\xb0\xd9\x26\xc1\xbc\x3d\x78\x06\x4f\x3e\x10\x75\xd5\xbd\x9a\x24\xf3\x5a\xe6\xc5\x12\x0a\x35\x04"  # eth / ARXT / Assistive Reality ARX
+    b"\x00\x00\x00\x01\xb1\x10\xec\x7b\x1d\xcb\x8f\xab\x8d\xed\xbf\x28\xf5\x3b\xc6\x3e\xa5\xbe\xdd\x84\x08\x0a\x39\x03"  # eth / XID / Sphere Identity
+    b"\x00\x00\x00\x01\xb1\xc1\xcb\x8c\x7c\x19\x92\xdb\xa2\x4e\x62\x8b\xf7\xd3\x8e\x71\xda\xd4\x6a\xeb\x12\x0a\x3c\x03"  # eth / CLB / Cloudbric
+    b"\x00\x00\x00\x01\xb1\xee\xf1\x47\x02\x8e\x9f\x48\x0d\xbc\x5c\xca\xa3\x27\x7d\x41\x7d\x1b\x85\xf0\x12\x0a\x3f\x05"  # eth / SEELE / Seele
+    b"\x00\x00\x00\x01\xb2\x13\x5a\xb9\x69\x5a\x76\x78\xdd\x59\x0b\x1a\x99\x6c\xb0\xf3\x7b\xcb\x07\x18\x09\x0a\x44\x03"  # eth / SGN / Signals Network
+    b"\x00\x00\x00\x01\xb2\x3b\xe7\x35\x73\xbc\x7e\x03\xdb\x6e\x5d\xfc\x62\x40\x53\x68\x71\x6d\x28\xa8\x12\x0a\x47\x04"  # eth / ONEK / One K Token
+    b"\x00\x00\x00\x01\xb2\x47\x54\xbe\x79\x28\x15\x53\xdc\x1a\xdc\x16\x0d\xdf\x5c\xd9\xb7\x43\x61\xa4\x09\x0a\x4b\x03"  # eth / XRL / XRL
+    b"\x00\x00\x00\x01\xb2\xbf\xeb\x70\xb9\x03\xf1\xba\xac\x7f\x2b\xa2\xc6\x29\x34\xc7\xe5\xb9\x74\xc4\x08\x0a\x4e\x03"  # eth / BKB / BetKing Bankroll Token
+    b"\x00\x00\x00\x01\xb2\xf7\xeb\x1f\x2c\x37\x64\x5b\xe6\x1d\x73\x95\x30\x35\x36\x0e\x76\x8d\x81\xe6\x12\x0a\x51\x03"  # eth / COB / Cobinhood Token
+    b"\x00\x00\x00\x01\xb3\x10\x4b\x4b\x9d\xa8\x20\x25\xe8\xb9\xf8\xfb\x28\xb3\x55\x3c\xe2\xf6\x70\x69\x12\x0a\x54\x03"  # eth / BIX / Bibox Token
+    b"\x00\x00\x00\x01\xb3\x61\x65\x50\xab\xc8\xaf\x79\xc7\xa5\x90\x2d\xef\x9e\xfa\x3b\xc9\xa9\x52\x00\x08\x0a\x57\x03"  # eth / TLX / Telex
+    b"\x00\x00\x00\x01\xb3\xbd\x49\xe2\x8f\x8f\x83\x2b\x8d\x1e\x24\x61\x06\x99\x1e\x54\x6c\x32\x35\x02\x12\x0a\x5a\x03"  # eth / GMT / GMT
+    b"\x00\x00\x00\x01\xb4\x27\x20\x71\xec\xad\xd6\x9d\x93\x3a\xdc\xd1\x9c\xa9\x9f\xe8\x06\x64\xfc\x08\x12\x0a\x5d\x04"  # eth / XCHF / CryptoFranc
+    b"\x00\x00\x00\x01\xb4\x44\x20\x8c\xb0\x51\x6c\x15\x01\x78\xfc\xf9\xa5\x26\x04\xbc\x04\xa1\xac\xea\x12\x0a\x61\x04"  # eth / GRMD / GreenMed
+    b"\x00\x00\x00\x01\xb4\x5a\x50\x54\x5b\xee\xab\x73\xf3\x8f\x31\xe5\x97\x37\x68\xc4\x21\x80\x5e\x5e\x12\x0a\x65\x03"  # eth / TKR / TKRToken
+    b"\x00\x00\x00\x01\xb4\x5d\x7b\xc4\xce\xbc\xab\x98\xad\x09\xba\xbd\xf8\xc8\x18\xb2\x29\x2b\x67\x2c\x12\x0a\x68\x04"  # eth / HODL / HODLCoin
+    b"\x00\x00\x00\x01\xb4\xb1\xd2\xc2\x17\xec\x07\x76\x58\x4c\xe0\x8d\x3d\xd9\x8f\x90\xed\xed\xa4\x4b\x12\x0a\x6c\x03"  # eth / CO2 / Climatecoin
+    b"\x00\x00\x00\x01\xb4\xd0\xfd\xfc\x84\x97\xae\xf9\x7d\x3c\x28\x92\xae\x68\x2e\xe0\x60\x64\xa2\xbc\x12\x0a\x6f\x03"  # eth / FMF / Formosa Financial Token
+    b"\x00\x00\x00\x01\xb4\xef\xd8\x5c\x19\x99\x9d\x84\x25\x13\x04\xbd\xa9\x9e\x90\xb9\x23\x00\xbd\x93\x12\x0a\x72\x03"  # eth / RPL / Rocket Pool
+    b"\x00\x00\x00\x01\xb5\x3a\x96\xbc\xbd\xd9\xcf\x78\xdf\xf2\x0b\xab\x6c\x2b\xe7\xba\xec\x8f\x00\xf8\x08\x0a\x75\x04"  # eth / eGAS / ETH GAS
+    b"\x00\x00\x00\x01\xb5\x63\x30\x0a\x3b\xac\x79\xfc\x09\xb9\x3b\x6f\x84\xce\x0d\x44\x65\xa2\xac\x27\x12\x0a\x79\x04"  # eth / REDC / RedCab
+    b"\x00\x00\x00\x01\xb5\xa5\xf2\x26\x94\x35\x2c\x15\xb0\x03\x23\x84\x4a\xd5\x45\xab\xb2\xb1\x10\x28\x12\x0a\x7d\x03"  # eth / ICX / ICON
+    b"\x00\x00\x00\x01\xb5\xb8\xf5\x61\x6f\xe4\x2d\x5c\xec\xa3\xe8\x7f\x3f\xdd\xbd\xd8\xf4\x96\xd7\x60\x12\x0a\x80\x03"  # eth / ZPR / ZPER
+    b"\x00\x00\x00\x01\xb5\xc3\x3f\x96\x5c\x88\x99\xd2\x55\xc3\x4c\xdd\x2a\x3e\xfa\x8a\xbc\xbb\x3d\xea\x12\x0a\x83\x03"  # eth / KPR / KPRCoin
+    b"\x00\x00\x00\x01\xb5\xdb\xc6\xd3\xcf\x38\x00\x79\xdf\x3b\x27\x13\x56\x64\xb6\xbc\xf4\x5d\x18\x69\x08\x0a\x86\x03"  # eth / OMX / Shivom
+    b"\x00\x00\x00\x01\xb6\x21\x32\xe3\x5a\x6c\x13\xee\x1e\xe0\xf8\x4d\xc5\xd4\x0b\xad\x8d\x81\x52\x06\x12\x0a\x89\x04"  # eth / NEXO / Nexo
+    b"\x00\x00\x00\x01\xb6\x2d\x18\xde\xa7\x40\x45\xe8\x22\x35\x2c\xe4\xb3\xee\x77\x31\x9d\xc5\xff\x2f\x12\x0a\x8d\x03"  # eth / EVC / EventChain
+    b"\x00\x00\x00\x01\xb6\x3b\x60\x6a\xc8\x10\xa5\x2c\xca\x15\xe4\x4b\xb6\x30\xfd\x42\xd8\xd1\xd8\x3d\x08\x0a\x90\x03"  # eth / MCO / Crypto.com
+    b"\x00\x00\x00\x01\xb6\x4e\xf5\x1c\x88\x89\x72\xc9\x08\xcf\xac\xf5\x9b\x47\xc1\xaf\xbc\x0a\xb8\xac\x08\x0a\x93\x05"  # eth / STORJ / STORJ
+    b"\x00\x00\x00\x01\xb6\x77\x34\x52\x1e\xab\xbe\x9c\x77\x37\x29\xdb\x73\xe1\x6c\xc2\xdf\xb2\x0a\x58\x02\x0a\x98\x04"  # eth / E₹ / eRupee
+    b"\x00\x00\x00\x01\xb6\x7b\x88\xa2\x57\x08\xa3\x5a\xe7\xc2\xd7\x36\xd3\x98\xd2\x68\xce\x4f\x7f\x83\x08\x0a\x9c\x04"  # eth / EMON / Etheremon
+    b"\x00\x00\x00\x01\xb6\x83\xd8\x3a\x53\x2e\x2c\xb7\xdf\xa5\x27\x5e\xed\x36\x98\x43\x63\x71\xcc\x9f\x12\x0a\xa0\x03"  # eth / BTU / BTU Protocol
+    b"\x00\x00\x00\x01\xb6\xed\x76\x44\xc6\x94\x16\xd6\x7b\x52\x2e\x20\xbc\x29\x4a\x9a\x9b\x40\x5b\x31\x08\x0a\xa3\x05"  # eth / 0xBTC / 0xBitcoin
+    b"\x00\x00\x00\x01\xb6\xee\x96\x68\x77\x1a\x79\xbe\x79\x67\xee\x29\xa6\x3d\x41\x84\xf8\x09\x71\x43\x12\x0a\xa8\x03"  # eth / CXO / CargoX
+    b"\x00\x00\x00\x01\xb7\x08\x35\xd7\x82\x2e\xbb\x94\x26\xb5\x65\x43\xe3\x91\x84\x6c\x10\x7b\xd3\x2c\x12\x0a\xab\x03"  # eth / GTC / GTC Token
+    b"\x00\x00\x00\x01\xb7\x87\xd4\xea\xc8\x89\x97\x30\xbb\x8c\x57\xfc\x3c\x99\x8c\x49\xc5\x24\x4e\xc0\x08\x0a\xae\x04"  # eth / CPEX / CoinPulseToken
+    b"\x00\x00\x00\x01\xb7\xcb\x1c\x96\xdb\x6b\x22\xb0\xd3\xd9\x53\x6e\x01\x08\xd0\x62\xbd\x48\x8f\x74\x12\x0a\xb2\x03"  # eth / WTC / Waltonchain
+    b"\x00\x00\x00\x01\xb8\x02\xb2\x4e\x06\x37\xc2\xb8\x7d\x2e\x8b\x77\x84\xc0\x55\xbb\xe9\x21\x01\x1a\x02\x0a\xb5\x03"  # eth / EMV / EMovieVenture
+    b"\x00\x00\x00\x01\xb8\xc7\x74\x82\xe4\x5f\x1f\x44\xde\x17\x45\xf5\x2c\x74\x42\x6c\x63\x1b\xdd\x52\x12\x0a\xb8\x03"  # eth / BNB / Binance Coin
+    b"\x00\x00\x00\x01\xb9\x13\x18\xf3\x5b\xdb\x26\x2e\x94\x23\xbc\x7c\x7c\x2a\x3a\x93\xdd\x93\xc9\x2c\x12\x0a\xbb\x04"  # eth / NULS / NULS
+    b"\x00\x00\x00\x01\xb9\x70\x48\x62\x8d\xb6\xb6\x61\xd4\xc2\xaa\x83\x3e\x95\xdb\xe1\xa9\x05\xb2\x80\x12\x0a\xbf\x03"  # eth / PAY / TenX
+    b"\x00\x00\x00\x01\xb9\x8d\x4c\x97\x42\x5d\x99\x08\xe6\x6e\x53\xa6\xfd\xf6\x73\xac\xca\x0b\xe9\x86\x12\x0a\xc2\x03"  # eth / ABT / ArcBlock Token
+    b"\x00\x00\x00\x01\xb9\xbb\x08\xab\x7e\x9f\xa0\xa1\x35\x6b\xd4\xa3\x9e\xc0\xca\x26\x7e\x03\xb0\xb3\x12\x0a\xc5\x03"  # eth / PAI / PCHAIN
+    b"\x00\x00\x00\x01\xb9\xe7\xf8\x56\x8e\x08\xd5\x65\x9f\x5d\x29\xc4\x99\x71\x73\xd8\x4c\xdf\x26\x07\x12\x0a\xc8\x03"  # eth / SWT / Swarm City Token
+    b"\x00\x00\x00\x01\xb9\xef\x77\x0b\x6a\x5e\x12\xe4\x59\x83\xc5\xd8\x05\x45\x25\x8a\xa3\x8f\x3b\x78\x0a\x0a\xcb\x03"  # eth / ZCN / 0chain
+    b"\x00\x00\x00\x01\xba\x18\x7b\x09\xff\xa8\xdd\xdc\x80\xd2\x57\x1e\xd3\xcb\xc4\xbe\x0a\xf6\x9e\x0c\x12\x0a\xce\x03"  # eth / DKP / Draggin Karma Points
+    b"\x00\x00\x00\x01\xba\x21\x84\x52\x0a\x1c\xc4\x9a\x61\x59\xc5\x7e\x61\xe1\x84\x4e\x08\x56\x15\xb6\x08\x0a\xd1\x03"  # eth / HGT / HelloGold
+    b"\x00\x00\x00\x01\xba\x5f\x11\xb1\x6b\x15\x57\x92\xcf\x3b\x2e\x68\x80\xe8\x70\x68\x59\xa8\xae\xb6\x08\x0a\xd4\x03"  # eth / ARN / Aeron
+    b"\x00\x00\x00\x01\xba\x9d\x41\x99\xfa\xb4\xf2\x6e\xfe\x35\x51\xd4\x90\xe3\x82\x14\x86\xf1\x35\xba\x08\x0a\xd7\x04"  # eth / CHSB / SwissBorg
+    b"\x00\x00\x00\x01\xba\xb1\x65\xdf\x94\x55\xaa\x0f\x2a\xed\x1f\x25\x65\x52\x0b\x91\xdd\xad\xb4\xc8\x08\x0a\xdb\x03"  # eth / EKT / EDUCare
+    b"\x00\x00\x00\x01\xba\xe2\x35\x82\x3d\x72\x55\xd9\xd4\x86\x35\xce\xd4\x73\x52\x27\x24\x4c\xd5\x83\x12\x0a\xde\x03"  # eth / STR / Staker
+    b"\x00\x00\x00\x01\xbb\x1f\x24\xc0\xc1\x55\x4b\x99\x90\x22\x2f\x03\x6b\x0a\xad\x6e\xe4\xca\xec\x29\x12\x0a\xe1\x04"  # eth / SOUL / CryptoSoul
+    b"\x00\x00\x00\x01\xbb\x1f\xa4\xfd\xeb\x34\x59\x73\x3b\xf6\x7e\xbc\x6f\x89\x30\x03\xfa\x97\x6a\x82\x12\x0a\xe5\x04"  # eth / XPAT / Pangea Arbitration Token
+    b"\x00\x00\x00\x01\xbb\x49\xa5\x1e\xe5\xa6\x6c\xa3\xa8\xcb\xe5\x29\x37\x9b\xa4\x4b\xa6\x7e\x67\x71\x12\x0a\xe9\x03"  # eth / CST / Cryptosolartech
+    b"\x00\x00\x00\x01\xbb\x9b\xc2\x44\xd7\x98\x12\x3f\xde\x78\x3f\xcc\x1c\x72\xd3\xbb\x8c\x18\x94\x13\x10\x0a\xec\x03"  # eth / DAO / DAO
+    b"\x00\x00\x00\x01\xbc\x12\x34\x55\x2e\xbe\xa3\x2b\x51\x21\x19\x03\x56\xbb\xa6\xd3\xbb\x22\x5b\xb5\x12\x0a\xef\x03"  # eth / BCL / BCL
+    b"\x00\x00\x00\x01\xbc\x86\x72\x7e\x77\x0d\xe6\x8b\x10\x60\xc9\x1f\x6b\xb6\x94\x5c\x73\xe1\x03\x88\x12\x0a\xf2\x03"  # eth / XNK / Ink Protocol
+    b"\x00\x00\x00\x01\xbd\x16\x8c\xbf\x9d\x3a\x37\x5b\x38\xdc\x51\xa2\x02\xb5\xe8\xa4\xe5\x20\x69\xed\x12\x0a\xf5\x03"  # eth / BWX / Blue Whale Token
+    b"\x00\x00\x00\x01\xbd\x4b\x60\xa1\x38\xb3\xfc\xe3\x58\x4e\xa0\x1f\x50\xc0\x90\x8c\x18\xf9\x67\x7a\x08\x0a\xf8\x04"  # eth / FNTB / Fintab
+    b"\x00\x00\x00\x01\xbd\xc5\xba\xc3\x9d\xbe\x13\x2b\x1e\x03\x0e\x89\x8a\xe3\x83\x00\x17\xd7\xd9\x69\x12\x0a\xfc\x04"  # eth / SNOV / Snovian.Space
+    b"\x00\x00\x00\x01\xbd\xcf\xbf\x5c\x4d\x91\xab\xc0\xbc\x97\x09\xc7\x28\x6d\x00\x06\x3c\x0e\x6f\x22\x02\x0b\x00\x05"  # eth / GUESS / Peerguess
+    b"\x00\x00\x00\x01\xbd\xeb\x4b\x83\x25\x1f\xb1\x46\x68\x7f\xa1\x9d\x1c\x66\x0f\x99\x41\x1e\xef\xe3\x12\x0b\x05\x03"  # eth / SVD / savedroid
+    b"\x00\x00\x00\x01\xbe\x11\xee\xb1\x86\xe6\x24\xb8\xf2\x6a\x50\x45\x57\x5a\x13\x40\xe4\x05\x45\x52\x12\x0b\x08\x0d"  # eth / CCC (ICONOMI) / CCC (ICONOMI)
+    b"\x00\x00\x00\x01\xbe\x42\x8c\x38\x67\xf0\x5d\xea\x2a\x89\xfc\x76\xa1\x02\xb5\x44\xea\xc7\xf7\x72\x12\x0b\x15\x03"  # eth / CVT / CyberVein
+    b"\x00\x00\x00\x01\xbe\x99\xb0\x97\x09\xfc\x75\x3b\x09\xbc\xf5\x57\xa9\x92\xf6\x60\x5d\x59\x97\xb0\x08\x0b\x18\x04"  # eth / RLTY / SMARTRealty
+    b"\x00\x00\x00\x01\xbe\xb9\xef\x51\x4a\x37\x9b\x99\x7e\x07\x98\xfd\xcc\x90\x1e\xe4\x74\xb6\xd9\xa1\x12\x0b\x1c\x16"  # eth / [deprecated] MLN (old) / Melonport
+    b"\x00\x00\x00\x01\xbe\xef\x54\x6a\xc8\xa4\xe0\xa8\x0d\xc1\xe2\xd6\x96\x96\x8e\xf5\x41\x38\xf1\xd4\x12\x0b\x32\x03"  # eth / OJX / Ojooo Coin
+    b"\x00\x00\x00\x01\xbf\x18\xf2\x46\xb9\x30\x1f\x23\x1e\x95\x61\xb3\x5a\x38\x79\x76\x9b\xb4\x63\x75\x12\x0b\x35\x04"  # eth / CARE / Token CARE
+    b"\x00\x00\x00\x01\xbf\x21\x79\x85\x9f\xc6\xd5\xbe\xe9\xbf\x91\x58\x63\x2d\xc5\x16\x78\xa4\x10\x0e\x12\x0b\x39\x03"  # eth / ELF / ELF Token
+    b"\x00\x00\x00\x01\xbf\x4c\xfd\x7d\x1e\xde\xee\xa5\xf6\x60\x08\x27\x41\x1b\x41\xa2\x1e\xb0\x8a\xbd\x02\x0b\x3c\x03"  # eth / CTL / CTL
+    b"\x00\x00\x00\x01\xbf\x52\xf2\xab\x39\xe2\x6e\x09\x51\xd2\xa0\x2b\x49\xb7\x70\x2a\xbe\x30\x40\x6a\x12\x0b\x3f\x03"  # eth / ODE / ODEM Token
+    b"\x00\x00\x00\x01\xbf\xbe\x53\x32\xf1\x72\xd7\x78\x11\xbc\x6c\x27\x28\x44\xf3\xe5\x4a\x7b\x23\xbb\x12\x0b\x42\x03"  # eth / WMK / WemarkToken
+    b"\x00\x00\x00\x01\xc0\x11\xa7\x24\x00\xe5\x8e\xcd\x99\xee\x49\x7c\xf8\x9e\x37\x75\xd4\xbd\x73\x2f\x12\x0b\x45\x03"  # eth / SNX / Synthetix Network Token
+    b"\x00\x00\x00\x01\xc0\x2a\xaa\x39\xb2\x23\xfe\x8d\x0a\x0e\x5c\x4f\x27\xea\xd9\x08\x3c\x75\x6c\xc2\x12\x0b\x48\x04"  # eth / WETH / WETH
+    b"\x00\x00\x00\x01\xc0\xeb\x85\x28\x5d\x83\x21\x7c\xd7\xc8\x91\x70\x2b\xcb\xc0\xfc\x40\x1e\x2d\x9d\x08\x0b\x4c\x03"  # eth / HVN / Hiveterminal Token
+    b"\x00\x00\x00\x01\xc1\x2d\x09\x9b\xe3\x15\x67\xad\xd4\xe4\xe4\xd0\xd4\x56\x91\xc3\xf5\x8f\x56\x63\x12\x0b\x4f\x03"  # eth / AUC / Auctus
+    b"\x00\x00\x00\x01\xc1\x48\x30\xe5\x3a\xa3\x44\xe8\xc1\x46\x03\xa9\x12\x29\xa0\xb9\x25\xb0\xb2\x62\x08\x0b\x52\x03"  # eth / PXT / Populous XBRL Token (PXT)
+    b"\x00\x00\x00\x01\xc1\x66\x03\x87\x05\xff\xba\xb3\x79\x41\x85\xb3\xa9\xd9\x25\x63\x2a\x1d\xf3\x7d\x12\x0b\x55\x03"  # eth / CC3 / Coal Coin
+    b"\x00\x00\x00\x01\xc1\x6b\x54\x2f\xf4\x90\xe0\x1f\xcc\x0d\xc5\x8a\x60\xe1\xef\xdc\x3e\x35\x7c\xa6\x00\x0b\x58\x05"  # eth / ROCK2 / ICE ROCK MINING
+    b"\x00\x00\x00\x01\xc1\x71\x95\xbd\xe4\x9d\x70\xce\xfc\xf8\xa9\xf2\xee\x17\x59\xff\xc2\x7b\xf0\xb1\x12\x0b\x5d\x04"  # eth / GROO / Groocoin
+    b"\x00\x00\x00\x01\xc1\xe2\x09\x7d\x78\x8d\x33\x70\x1b\xa3\xcc\x27\x73\xbf\x67\x15\x5e\xc9\x3f\xc4\x12\x0b\x61\x03"  # eth / IAD / IADOWR Coin
+    b"\x00\x00\x00\x01\xc2\x04\x64\xe0\xc3\x73\x48\x6d\x2b\x33\x35\x57\x6e\x83\xa2\x18\xb1\x61\x8a\x5e\x12\x0b\x64\x04"  # eth / DTRC / Datarius Credit
+    b"\x00\x00\x00\x01\xc2\x7a\x2f\x05\xfa\x57\x7a\x83\xba\x0f\xdb\x4c\x38\x44\x3c\x07\x18\x35\x65\x01\x12\x0b\x68\x03"  # eth / TAU / Lamden Tau
+    b"\x00\x00\x00\x01\xc2\xc6\x3f\x23\xec\x5e\x97\xef\xbd\x75\x65\xdf\x9e\xc7\x64\xfd\xc7\xd4\xe9\x1d\x12\x0b\x6b\x03"  # eth / BOU / Boule Coin
+    b"\x00\x00\x00\x01\xc3\x4b\x21\xf6\xf8\xe5\x1c\xc9\x65\xc2\x39\x3b\x3c\xcf\xa3\xb8\x2b\xeb\x24\x03\x06\x0b\x6e\x03"  # eth / IoT / IoTコイン
+    b"\x00\x00\x00\x01\xc3\x9e\x62\x6a\x04\xc5\x97\x1d\x77\x0e\x31\x97\x60\xd7\x92\x65\x02\x97\x5e\x47\x12\x0b\x71\x04"  # eth / AXPR / aXpire
+    b"\x00\x00\x00\x01\xc3\xbc\x9e\xb7\x1f\x75\xec\x43\x9a\x6b\x6c\x8e\x8b\x74\x6f\xcf\x5b\x62\xf7\x03\x12\x0b\x75\x03"  # eth / VOC / VORMACOIN
+    b"\x00\x00\x00\x01\xc4\x22\x09\xac\xcc\x14\x02\x9c\x10\x12\xfb\x56\x80\xd9\x5f\xbd\x60\x36\xe2\xa0\x12\x0b\x78\x03"  # eth / PPP / PayPie
+    b"\x00\x00\x00\x01\xc4\xbc\xd6\x4c\xb2\x16\xd4\x9f\xd3\xc6\x43\xa3\x27\x62\xf3\x46\x26\xb4\x5a\x1a\x12\x0b\x7b\x04"  # eth / COSM / Cosmo Coin
+    b"\x00\x00\x00\x01\xc5\x20\xf3\xac\x30\x3a\x10\x7d\x8f\x4b\x08\xb3\x26\xb6\xea\x66\xa4\xf9\x61\xcd\x12\x0b\x7f\x02"  # eth / LG / LG
+    b"\x00\x00\x00\x01\xc5\x28\xc2\x8f\xec\x0a\x90\xc0\x83\x32\x8b\xc4\x5f\x58\x7e\xe2\x15\x76\x0a\x0f\x12\x0b\x81\x03"  # eth / EDR / Endor Protocol Token
+    b"\x00\x00\x00\x01\xc5\xbb\xae\x50\x78\x1b\xe1\x66\x93\x06\xb9\xe0\x01\xef\xf5\x7a\x29\x57\xb0\x9d\x05\x0b\x84\x03"  # eth / GTO / Gifto
+    b"\x00\x00\x00\x01\xc6\x45\x00\xdd\x7b\x0f\x17\x94\x80\x7e\x67\x80\x2f\x8a\xbb\xf5\xf8\xff\xb0\x54\x12\x0b\x87\x05"  # eth / LOCUS / Locus Chain
+    b"\x00\x00\x00\x01\xc6\x6e\xa8\x02\x71\x7b\xfb\x98\x33\x40\x02\x64\xdd\x12\xc2\xbc\xea\xa3\x4a\x6d\x12\x0b\x8c\x07"  # eth / OLD_MKR / MakerDAO
+    b"\x00\x00\x00\x01\xc7\x19\xd0\x10\xb6\x3e\x5b\xbf\x2c\x05\x51\x87\x2c\xd5\x31\x6e\xd2\x6a\xcd\x83\x12\x0b\x93\x03"  # eth / DIP / Decentralized Insurance Protocol
+    b"\x00\x00\x00\x01\xc7\x2f\xe8\xe3\xdd\x5b\xef\x0f\x9f\x31\xf2\x59\x39\x9f\x30\x12\x72\xef\x2a\x2d\x12\x0b\x96\x06"  # eth / INSTAR / Insights Network
+    b"\x00\x00\x00\x01\xc7\x98\xcd\x1c\x49\xdb\x0e\x29\x73\x12\xe4\xc6\x82\x75\x26\x68\xce\x1d\xb2\xad\x05\x0b\x9c\x03"  # eth / LFR / LifeRun Coin
+    b"\x00\x00\x00\x01\xc7\xbb\xa5\xb7\x65\x58\x1e\xfb\x2c\xdd\x26\x79\xdb\x5b\xea\x9e\xe7\x9b\x20\x1f\x12\x0b\x9f\x03"  # eth / GEM / Gems
+    b"\x00\x00\x00\x01\xc8\x6d\x05\x48\x09\x62\x34\x32\x21\x0c\x10\x7a\xf2\xe3\xf6\x19\xdc\xfb\xf6\x52\x12\x0b\xa2\x03"  # eth / UPP / Sentinel Protocol
+    b"\x00\x00\x00\x01\xc8\x7c\x5d\xd8\x6a\x3d\x56\x7f\xf2\x87\x01\x88\x6f\xb0\x74\x5a\xaa\x89\x8d\xa4\x12\x0b\xa5\x03"  # eth / CTG / CT Global Token
+    b"\x00\x00\x00\x01\xc8\xc6\xa3\x1a\x4a\x80\x6d\x37\x10\xa7\xb3\x8b\x7b\x29\x6d\x2f\xab\xcc\xdb\xa8\x12\x0b\xa8\x04"  # eth / ELIX / Elixir Token
+    b"\x00\x00\x00\x01\xc9\x2d\x6e\x3e\x64\x30\x2c\x59\xd7\x34\xf3\x29\x2e\x2a\x13\xa1\x3d\x7e\x18\x17\x08\x0b\xac\x03"  # eth / FXC / FUTURAX
+    b"\x00\x00\x00\x01\xc9\x8e\x06\x39\xc6\xd2\xec\x03\x7a\x61\x53\x41\xc3\x69\x66\x6b\x11\x0e\x80\xe5\x08\x0b\xaf\x04"  # eth / EXMR / eXMRcoin
+    b"\x00\x00\x00\x01\xc9\xde\x4b\x7f\x0c\x3d\x99\x1e\x96\x71\x58\xe4\xd4\xbf\xa4\xb5\x1e\xc0\xb1\x14\x12\x0b\xb3\x03"  # eth / ROK / Rocketchain
+    b"\x00\x00\x00\x01\xca\x0e\x72\x69\x60\x0d\x35\x3f\x70\xb1\x4a\xd1\x18\xa4\x95\x75\x45\x5c\x0f\x2f\x12\x0b\xb6\x04"  # eth / AMLT / AMLT
+    b"\x00\x00\x00\x01\xca\x29\xdb\x42\x21\xc1\x11\x88\x8a\x7e\x80\xb1\x2e\xac\x8a\x26\x6d\xa3\xee\x0d\x12\x0b\xba\x03"  # eth / BLN / Bolenum
+    b"\x00\x00\x00\x01\xca\x3c\x18\xa6\x5b\x80\x2e\xc2\x67\xf8\xf4\x80\x25\x45\xe7\xf5\x3d\x24\xc7\x5e\x12\x0b\xbd\x03"  # eth / BUC / BeeUnity Chain
+    b"\x00\x00\x00\x01\xcb\x5a\x05\xbe\xf3\x25\x76\x13\xe9\x84\xc1\x7d\xbc\xf0\x39\x95\x2b\x6d\x88\x3f\x08\x0b\xc0\x03"  # eth / SGR / Sugar Exchange
+    b"\x00\x00\x00\x01\xcb\x5e\xa3\xc1\x90\xd8\xf8\x2d\xea\xdf\x7c\xe5\xaf\x85\x5d\xdb\xf3\x3e\x39\x62\x06\x0b\xc3\x04"  # eth / QBIT / Qubitica
+    b"\x00\x00\x00\x01\xcb\x94\xbe\x6f\x13\xa1\x18\x2e\x4a\x4b\x61\x40\xcb\x7b\xf2\x02\x5d\x28\xe4\x1b\x06\x0b\xc7\x04"  # eth / TRST / WeTrust
+    b"\x00\x00\x00\x01\xcb\x97\xe6\x5f\x07\xda\x24\xd4\x6b\xcd\xd0\x78\xeb\xeb\xd7\xc6\xe6\xe3\xd7\x50\x08\x0b\xcb\x03"  # eth / BTM / Bytom
+    b"\x00\x00\x00\x01\xcb\xcc\x0f\x03\x6e\xd4\x78\x8f\x63\xfc\x0f\xee\x32\x87\x3d\x6a\x74\x87\xb9\x08\x08\x0b\xce\x03"  # eth / HMQ / Humaniq
+    b"\x00\x00\x00\x01\xcb\xea\xec\x69\x94\x31\x85\x7f\xdb\x4d\x37\xad\xdb\xbd\xc2\x0e\x13\x2d\x49\x03\x12\x0b\xd1\x05"  # eth / YOYOW / YOYOW
+    b"\x00\x00\x00\x01\xcc\x13\xfc\x62\x7e\xff\xd6\xe3\x5d\x2d\x27\x06\xea\x3c\x4d\x73\x96\xc6\x10\xea\x08\x0b\xd6\x04"  # eth / IDXM / IDEX Membership
+    b"\x00\x00\x00\x01\xcc\x34\x36\x6e\x38\x42\xca\x1b\xd3\x6c\x1f\x32\x4d\x15\x25\x79\x60\xfc\xc8\x01\x12\x0b\xda\x03"  # eth / BON / Bonpay
+    b"\x00\x00\x00\x01\xcc\x4e\xf9\xee\xaf\x65\x6a\xc1\xa2\xab\x88\x67\x43\xe9\x8e\x97\xe0\x90\xed\x38\x12\x0b\xdd\x03"  # eth / DDF / DDF
+    b"\x00\x00\x00\x01\xcc\x7d\x26\xd8\xea\x62\x81\xbb\x36\x3c\x84\x48\x51\x5f\x2c\x61\xf7\xbc\x19\xf0\x12\x0b\xe0\x04"  # eth / ABCH / ABBC Cash
+    b"\x00\x00\x00\x01\xcc\x80\xc0\x51\x05\x7b\x77\x4c\xd7\x50\x67\xdc\x48\xf8\x98\x7c\x4e\xb9\x7a\x5e\x12\x0b\xe4\x03"  # eth / NEC / Ethfinex Nectar Token
+    b"\x00\x00\x00\x01\xcc\xed\x5b\x82\x88\x08\x6b\xe8\xc3\x8e\x23\x56\x7e\x68\x4c\x37\x40\xbe\x4d\x48\x0a\x0b\xe7\x03"  # eth / RLT / RouletteToken
+    b"\x00\x00\x00\x01\xcd\x4b\x4b\x0f\x32\x84\xa3\x3a\xc4\x9c\x67\x96\x1e\xc6\xe1\x11\x70\x83\x18\xcf\x05\x0b\xea\x03"  # eth / AX1 / AX1 Mining Token
+    b"\x00\x00\x00\x01\xcd\xb7\xec\xfd\x34\x03\xee\xf3\x88\x2c\x65\xb7\x61\xef\x9b\x50\x54\x89\x0a\x47\x12\x0b\xed\x04"  # eth / $HUR / $Hurify Token
+    b"\x00\x00\x00\x01\xcd\xcf\xc0\xf6\x6c\x52\x2f\xd0\x86\xa1\xb7\x25\xea\x3c\x0e\xeb\x9f\x9e\x88\x14\x12\x0b\xf1\x04"  # eth / AURA / Aurora DAO
+    b"\x00\x00\x00\x01\xce\x59\xd2\x9b\x09\xaa\xe5\x65\xfe\xee\xf8\xe5\x2f\x47\xc3\xcd\x53\x68\xc6\x63\x12\x0b\xf5\x0d"  # eth / BLX (Bullion) / Bullion Crypto
+    b"\x00\x00\x00\x01\xce\x5c\x60\x3c\x78\xd0\x47\xef\x43\x03\x2e\x96\xb5\xb7\x85\x32\x4f\x75\x3a\x4f\x02\x0c\x02\x05"  # eth / E4ROW / E4ROW
+    b"\x00\x00\x00\x01\xce\xd4\xe9\x31\x98\x73\x4d\xda\xff\x84\x92\xd5\x25\xbd\x25\x8d\x49\xeb\x38\x8e\x12\x0c\x07\x03"  # eth / EDO / Eidoo
+    b"\x00\x00\x00\x01\xcf\xb9\x86\x37\xbc\xae\x43\xc1\x33\x23\xea\xa1\x73\x1c\xed\x2b\x71\x69\x62\xfd\x12\x0c\x0a\x03"  # eth / NET / NIMIQ
+    b"\x00\x00\x00\x01\xcf\xd6\xae\x8b\xf1\x3f\x42\xde\x14\x86\x73\x51\xea\xff\x7a\x8a\x3b\x9f\xbb\xe7\x08\x0c\x0d\x03"  # eth / SNG / SINERGIA
+    b"\x00\x00\x00\x01\xd0\x1d\xb7\x3e\x04\x78\x55\xef\xb4\x14\xe6\x20\x20\x98\xc4\xbe\x4c\xd2\x42\x3b\x12\x0c\x10\x03"  # eth / UQC / Uquid Coin
+    b"\x00\x00\x00\x01\xd0\x35\x2a\x01\x9e\x9a\xb9\xd7\x57\x77\x6f\x53\x23\x77\xaa\xeb\xd3\x6f\xd5\x41\x12\x0c\x13\x03"  # eth / FSN / Fusion
+    b"\x00\x00\x00\x01\xd0\x92\x9d\x41\x19\x54\xc4\x74\x38\xdc\x1d\x87\x1d\xd6\x08\x1f\x5c\x5e\x14\x9c\x04\x0c\x16\x03"  # eth / RFR / Refereum
+    b"\x00\x00\x00\x01\xd0\xa4\xb8\x94\x6c\xb5\x2f\x06\x61\x27\x3b\xfb\xc6\xfd\x0e\x0c\x75\xfc\x64\x33\x12\x0c\x19\x05"  # eth / STORM / Storm Token
+    b"\x00\x00\x00\x01\xd0\xd6\xd6\xc5\xfe\x4a\x67\x7d\x34\x3c\xc4\x33\x53\x6b\xb7\x17\xba\xe1\x67\xdd\x09\x0c\x1e\x03"  # eth / ADT / AdToken
+    b"\x00\x00\x00\x01\xd2\x34\xbf\x24\x10\xa0\x00\x9d\xf9\xc3\xc6\x3b\x61\x0c\x09\x73\x8f\x18\xcc\xd7\x08\x0c\x21\x03"  # eth / DTR / Dynamic Trading Rights
+    b"\x00\x00\x00\x01\xd2\x61\x14\xcd\x6e\xe2\x89\xac\xcf\x82\x35\x0c\x8d\x84\x87\xfe\xdb\x8a\x0c\x07\x12\x0c\x24\x03"  # eth / OMG / OmiseGO
+    b"\x00\x00\x00\x01\xd2\x94\x6b\xe7\x86\xf3\x5c\x3c\xc4\x02\xc2\x9b\x32\x36\x47\xab\xda\x79\x90\x71\x08\x0c\x27\x05"  # eth / VIKKY / VikkyToken
+    b"\x00\x00\x00\x01\xd2\xd6\x15\x86\x83\xae\xe4\xcc\x83\x80\x67\x72\x72\x09\xa0\xaa\xf4\x35\x9d\xe3\x12\x0c\x2c\x04"  # eth / BNTY / Bounty0x Token
+    b"\x00\x00\x00\x01\xd2\xfa\x8f\x92\xea\x72\xab\xb3\x5d\xbd\x6d\xec\xa5\x71\x73\xd2\x2d\xb2\xba\x49\x12\x0c\x30\x03"  # eth / ORI / Origami
+    b"\x00\x00\x00\x01\xd3\x41\xd1\x68\x0e\xee\xe3\x25\x5b\x8c\x4c\x75\xbc\xce\x7e\xb5\x7f\x14\x4d\xae\x12\x0c\x33\x03"  # eth / ONG / SoMee.Social
+    b"\x00\x00\x00\x01\xd3\x48\xe0\x7a\x28\x06\x50\x5b\x85\x61\x23\x04\x5d\x27\xae\xed\x90\x92\x4b\x50\x08\x0c\x36\x04"  # eth / CCLC / Christ Coin
+    b"\x00\x00\x00\x01\xd3\xc0\x07\x72\xb2\x4d\x99\x7a\x81\x22\x49\xca\x63\x7a\x92\x1e\x81\x35\x77\x01\x12\x0c\x3a\x04"  # eth / WILD / WILD Token
+    b"\x00\x00\x00\x01\xd4\x2d\xeb\xe4\xed\xc9\x2b\xd5\xa3\xfb\xb4\x24\x3e\x1e\xcc\xf6\xd6\x3a\x4a\x5d\x12\x0c\x3e\x02"  # eth / C8 / Carboneum
+    b"\x00\x00\x00\x01\xd4\x9f\xf1\x36\x61\x45\x13\x13\xca\x15\x53\xfd\x69\x54\xbd\x1d\x9b\x6e\x02\xb9\x12\x0c\x40\x04"  # eth / ELEC / Electrify.Asia
+    b"\x00\x00\x00\x01\xd4\xc4\x35\xf5\xb0\x9f\x85\x5c\x33\x17\xc8\x52\x4c\xb1\xf5\x86\xe4\x27\x95\xfa\x12\x0c\x44\x03"  # eth / CND / Cindicator
+    b"\x00\x00\x00\x01\xd4\xfa\x14\x60\xf5\x37\xbb\x90\x85\xd2\x2c\x7b\xcc\xb5\xdd\x45\x0e\xf2\x8e\x3a\x08\x0c\x47\x03"  # eth / PPT / Populous
+    b"\x00\x00\x00\x01\xd5\x59\xf2\x02\x96\xff\x48\x95\xda\x39\xb5\xbd\x9a\xdd\x54\xb4\x42\x59\x6a\x61\x12\x0c\x4a\x03"  # eth / FTX / FintruX Network
+    b"\x00\x00\x00\x01\xd6\x59\x60\xfa\xcb\x8e\x4a\x2d\xfc\xb2\xc2\x21\x2c\xb2\xe4\x4a\x02\xe2\xa5\x7e\x06\x0c\x4d\x04"  # eth / SOAR / Soarcoin
+    b"\x00\x00\x00\x01\xd7\x3a\x66\xb8\xfb\x26\xbe\x8b\x0a\xcd\x7c\x52\xbd\x32\x50\x54\xac\x7d\x46\x8b\x12\x0c\x51\x03"  # eth / WNK / Woonk
+    b"\x00\x00\x00\x01\xd7\x60\xad\xdf\xb2\x4d\x9c\x01\xfe\x4b\xfe\xa7\x47\x5c\x5e\x36\x36\x68\x40\x58\x02\x0c\x54\x04"  # eth / USDM / Mether (USDM)
+    b"\x00\x00\x00\x01\xd7\x63\x17\x87\xb4\xdc\xc8\x7b\x12\x54\xcf\xd1\xe5\xce\x48\xe9\x68\x23\xde\xe8\x08\x0c\x58\x03"  # eth / SCL / SocialCoin
+    b"\x00\x00\x00\x01\xd8\x2d\xf0\xab\xd3\xf5\x14\x25\xeb\x15\xef\x75\x80\xfd\xa5\x57\x27\x87\x5f\x14\x12\x0c\x5b\x03"  # eth / DAV / DAV Token
+    b"\x00\x00\x00\x01\xd8\x44\x62\x36\xfa\x95\xb9\xb5\xf9\xfd\x0f\x8e\x7d\xf1\xa9\x44\x82\x3c\x68\x3d\x12\x0c\x5e\x04"  # eth / NEEO / NEEO
+    b"\x00\x00\x00\x01\xd8\x50\x94\x2e\xf8\x81\x1f\x2a\x86\x66\x92\xa6\x23\x01\x1b\xde\x52\xa4\x62\xc1\x12\x0c\x62\x03"  # eth / VEN / VeChain
+    b"\x00\x00\x00\x01\xd8\x91\x2c\x10\x68\x1d\x8b\x21\xfd\x37\x42\x24\x4f\x44\x65\x8d\xba\x12\x26\x4e\x12\x0c\x65\x03"  # eth / PLU / Pluton
+    b"\x00\x00\x00\x01\xd8\x95\x0f\xde\xaa\x10\x30\x4b\x7a\x7f\xd0\x3a\x2f\xc6\x6b\xc3\x9f\x3c\x71\x1a\x12\x0c\x68\x03"  # eth / WYS / wystoken
+    b"\x00\x00\x00\x01\xd9\x9b\x8a\x7f\xa4\x8e\x25\xcc\xe8\x3b\x81\x81\x22\x20\xa3\xe0\x3b\xf6\x4e\x5f\x12\x0c\x6b\x03"  # eth / SKM / Skrumble Network
+    b"\x00\x00\x00\x01\xd9\xa1\x2c\xde\x03\xa8\x6e\x80\x04\x96\x46\x98\x58\xde\x85\x81\xd3\xa5\x35\x3d\x12\x0c\x6e\x03"  # eth / YUP / Crowdholding
+    b"\x00\x00\x00\x01\xd9\xa8\xcf\xe2\x1c\x23\x2d\x48\x50\x65\xcb\x62\xa9\x68\x66\x79\x9d\x46\x45\xf7\x12\x0c\x71\x03"  # eth / FGP / FingerPrint
+    b"\x00\x00\x00\x01\xda\x2c\x42\x4f\xc9\x8c\x74\x1c\x2d\x4e\xf2\xf4\x28\x97\xce\xfe\xd8\x97\xca\x75\x09\x0c\x74\x04"  # eth / BNFT / Benefits Coin
+    b"\x00\x00\x00\x01\xda\x6c\xb5\x8a\x0d\x0c\x01\x61\x0a\x29\xc5\xa6\x5c\x30\x3e\x13\xe8\x85\x88\x7c\x12\x0c\x78\x02"  # eth / cV / carVertical
+    b"\x00\x00\x00\x01\xda\x80\xb2\x00\x38\xbd\xf9\x68\xc7\x30\x7b\xb5\x90\x7a\x46\x94\x82\xcf\x62\x51\x08\x0c\x7a\x03"  # eth / BNN / BrokerNekoNetwork
+    b"\x00\x00\x00\x01\xda\xb0\xc3\x1b\xf3\x4c\x89\x7f\xb0\xfe\x90\xd1\x2e\xc9\x40\x1c\xaf\x5c\x36\xec\x00\x0c\x7d\x03"  # eth / DAB / DAB
+    b"\x00\x00\x00\x01\xda\xc1\x7f\x95\x8d\x2e\xe5\x23\xa2\x20\x62\x06\x99\x45\x97\xc1\x3d\x83\x1e\xc7\x06\x0c\x80\x04"  # eth / USDT / USD Tether (erc20)
+    b"\x00\x00\x00\x01\xda\xe1\xba\xf2\x49\x96\x4b\xc4\xb6\xac\x98\xc3\x12\x2f\x0e\x3e\x78\x5f\xd2\x79\x12\x0c\x84\x03"  # eth / TKA / Tokia
+    b"\x00\x00\x00\x01\xdb\x0f\x69\x30\x6f\xf8\xf9\x49\xf2\x58\xe8\x3f\x6b\x87\xee\x5d\x05\x2d\x0b\x23\x12\x0c\x87\x03"  # eth / GCP / Globcoin Crypto Platform
+    b"\x00\x00\x00\x01\xdb\x25\xf2\x11\xab\x05\xb1\xc9\x7d\x59\x55\x16\xf4\x57\x94\x52\x8a\x80\x7a\xd8\x02\x0c\x8a\x04"  # eth / EURS / STASIS EURS
+    b"\x00\x00\x00\x01\xdb\x45\x5c\x71\xc1\xbc\x2d\xe4\xe8\x0c\xa4\x51\x18\x40\x41\xef\x32\x05\x40\x01\x12\x0c\x8e\x03"  # eth / JOT / Jury.Online Token
+    b"\x00\x00\x00\x01\xdb\x86\x46\xf5\xb4\x87\xb5\xdd\x97\x9f\xac\x61\x83\x50\xe8\x50\x18\xf5\x57\xd4\x12\x0c\x91\x03"  # eth / BTK / Bitcoin Token
+    b"\x00\x00\x00\x01\xdb\xfb\x42\x3e\x9b\xbf\x16\x29\x43\x88\xe0\x76\x96\xa5\x12\x0e\x4c\xeb\xa0\xc5\x12\x0c\x94\x04"  # eth / ETHD / Ethereum Dark
+    b"\x00\x00\x00\x01\xdd\x00\x72\x78\xb6\x67\xf6\xbe\xf5\x2f\xd0\xa4\xc2\x36\x04\xaa\x1f\x96\x03\x9a\x08\x0c\x98\x04"  # eth / RIPT / RiptideCoin
+    b"\x00\x00\x00\x01\xdd\x16\xec\x0f\x66\xe5\x4d\x45\x3e\x67\x56\x71\x3e\x53\x33\x55\x98\x90\x40\xe4\x12\x0c\x9c\x03"  # eth / TEN / Tokenomy
+    b"\x00\x00\x00\x01\xdd\x41\xfb\xd1\xae\x95\xc5\xd9\xb1\x98\x17\x4a\x28\xe0\x4b\xe6\xb3\xd1\xaa\x27\x08\x0c\x9f\x03"  # eth / LYS / Lightyears
+    b"\x00\x00\x00\x01\xdd\x6c\x68\xbb\x32\x46\x2e\x01\x70\x50\x11\xa4\xe2\xad\x1a\x60\x74\x0f\x21\x7f\x0f\x0c\xa2\x03"  # eth / HBT / Hubii Network
+    b"\x00\x00\x00\x01\xdd\x74\xa7\xa3\x76\x9f\xa7\x25\x61\xb3\xa6\x9e\x65\x96\x8f\x49\x74\x8c\x69\x0c\x12\x0c\xa5\x04"  # eth / ETCH / ETCH
+    b"\x00\x00\x00\x01\xdd\x94\xde\x9c\xfe\x06\x35\x77\x05\x1a\x5e\xb7\x46\x5d\x08\x31\x7d\x88\x08\xb6\x00\x0c\xa9\x0d"  # eth / Devcon2 Token / Devcon2 Token
+    b"\x00\x00\x00\x01\xdd\x97\x4d\x5c\x2e\x29\x28\xde\xa5\xf7\x1b\x98\x25\xb8\xb6\x46\x68\x6b\xd2\x00\x12\x0c\xb6\x03"  # eth / KNC / Kyber Network
+    b"\x00\x00\x00\x01\xdd\xe1\x2a\x12\xa6\xf6\x71\x56\xe0\xda\x67\x2b\xe0\x5c\x37\x4e\x1b\x0a\x3e\x57\x06\x0c\xb9\x03"  # eth / JOY / JOYSO
+    b"\x00\x00\x00\x01\xde\x1e\x0a\xe6\x10\x1b\x46\x52\x0c\xf6\x6f\xdc\x0b\x10\x59\xc5\xcc\x3d\x10\x6c\x08\x0c\xbc\x05"  # eth / DELTA / DeltaChain
+    b"\x00\x00\x00\x01\xde\xe0\x2d\x94\xbe\x49\x29\xd2\x6f\x67\xb6\x4a\xda\x7a\xcf\x19\x14\x00\x7f\x10\x12\x0c\xc1\x04"  # eth / RUNE / Rune
+    b"\x00\x00\x00\x01\xdf\x13\x38\xfb\xaf\xe7\xaf\x17\x89\x15\x16\x27\xb8\x86\x78\x1b\xa5\x56\xef\x9a\x12\x0c\xc5\x03"  # eth / KUE / Kuende Token
+    b"\x00\x00\x00\x01\xdf\x2c\x72\x38\x19\x8a\xd8\xb3\x89\x66\x65\x74\xf2\xd8\xbc\x41\x1a\x4b\x74\x28\x12\x0c\xc8\x03"  # eth / MFT / Mainframe Token
+    b"\x00\x00\x00\x01\xdf\x34\x79\x11\x91\x0b\x6c\x9a\x42\x86\xba\x8e\x2e\xe5\xea\x4a\x39\xeb\x21\x34\x12\x0c\xcb\x03"  # eth / BOB / Bob's repair
+    b"\x00\x00\x00\x01\xdf\x6e\xf3\x43\x35\x07\x80\xbf\x8c\x34\x10\xbf\x06\x2e\x0c\x01\x5b\x1d\xd6\x71\x08\x0c\xce\x03"  # eth / BMC / Blackmoon Crypto BMC Token
+    b"\x00\x00\x00\x01\xdf\xc3\xe8\x57\xc8\xcc\xea\x76\x57\xe0\xed\x98\xab\x92\xe0\x48\xe3\x8d\xee\x0f\x12\x0c\xd1\x03"  # eth / FIH / FidelityHouse Token
+    b"\x00\x00\x00\x01\xe0\x6e\xda\x74\x35\xba\x74\x9b\x04\x73\x80\xce\xd4\x91\x21\xdd\xe9\x33\x34\xae\x00\x0c\xd4\x03"  # eth / SET / SET
+    b"\x00\x00\x00\x01\xe0\xb7\x92\x7c\x4a\xf2\x37\x65\xcb\x51\x31\x4a\x0e\x05\x21\xa9\x64\x5f\x0e\x2a\x09\x0c\xd7\x03"  # eth / DGD / Digix DAO
+    b"\x00\x00\x00\x01\xe1\x20\xc1\xec\xbf\xdf\xea\x7f\x0a\x8f\x0e\xe3\x00\x63\x49\x1e\x8c\x26\xfe\xdf\x08\x0c\xda\x03"  # eth / SUR / Suretly
+    b"\x00\x00\x00\x01\xe1\xae\xe9\x84\x95\x36\x5f\xc1\x79\x69\x9c\x1b\xb3\xe7\x61\xfa\x71\x6b\xee\x62\x12\x0c\xdd\x04"  # eth / BZNT / Bezant
+    b"\x00\x00\x00\x01\xe2\x49\x2f\x8d\x2a\x26\x18\xd8\x70\x9c\xa9\x9b\x1d\x8d\x75\x71\x3b\xd8\x40\x89\x12\x0c\xe1\x02"  # eth / HB / HeartBout
+    b"\x00\x00\x00\x01\xe2\x5b\x0b\xba\x01\xdc\x56\x30\x31\x2b\x6a\x21\x92\x7e\x57\x80\x61\xa1\x3f\x55\x12\x0c\xe3\x04"  # eth / SHIP / ShipChain
+    b"\x00\x00\x00\x01\xe2\x5b\xce\xc5\xd3\x80\x1c\xe3\xa7\x94\x07\x9b\xf9\x4a\xdf\x1b\x8c\xcd\x80\x2d\x12\x0c\xe7\x03"  # eth / MAN / Matrix AI Network
+    b"\x00\x00\x00\x01\xe2\x5f\xf6\xeb\x95\x9b\xce\x67\x97\x57\x78\xe4\x6a\x47\x75\x0c\x24\x3b\x6b\x99\x12\x0c\xea\x04"  # eth / PURC / PureCarbon
+    b"\x00\x00\x00\x01\xe2\x65\x17\xa9\x96\x72\x99\x45\x3d\x3f\x1b\x48\xaa\x00\x5e\x61\x27\xe6\x72\x10\x12\x0c\xee\x05"  # eth / NIMFA / Ninfa Money
+    b"\x00\x00\x00\x01\xe2\xd8\x2d\xc7\xda\x0e\x6f\x88\x2e\x96\x84\x64\x51\xf4\xfa\xbc\xc8\xf9\x05\x28\x12\x0c\xf3\x02"  # eth / JC / Jesus Coin
+    b"\x00\x00\x00\x01\xe2\xfb\x65\x29\xef\x56\x6a\x08\x0e\x6d\x23\xde\x0b\xd3\x51\x31\x10\x87\xd5\x67\x12\x0c\xf5\x03"  # eth / COV / Covesting
+    b"\x00\x00\x00\x01\xe3\x0e\x02\xf0\x49\x95\x7e\x2a\x59\x07\x58\x9e\x06\xba\x64\x6f\xb2\xc3\x21\xba\x08\x0c\xf8\x04"  # eth / DRPU / DCORP Utility
+    b"\x00\x00\x00\x01\xe3\x4e\x19\x44\xe7\x76\xf3\x9b\x92\x52\x79\x0a\x05\x27\xeb\xda\x64\x7a\xe6\x68\x12\x0c\xfc\x03"  # eth / HBZ / HBZ coin
+    b"\x00\x00\x00\x01\xe3\x81\x85\x04\xc1\xb3\x2b\xf1\x55\x7b\x16\xc2\x38\xb2\xe0\x1f\xd3\x14\x9c\x17\x12\x0c\xff\x03"  # eth / PLR / Pillar Project
+    b"\x00\x00\x00\x01\xe3\x83\x1c\x5a\x98\x2b\x27\x9a\x19\x84\x56\xd5\x77\xcf\xb9\x04\x24\xcb\x63\x40\x06\x0d\x02\x03"  # eth / IMC / Immune Coin
+    b"\x00\x00\x00\x01\xe3\x86\xb1\x39\xed\x37\x15\xca\x4b\x18\xfd\x52\x67\x1b\xdc\xea\x1c\xdf\xe4\xb1\x08\x0d\x05\x03"  # eth / ZST / Zeus Exchange
+    b"\x00\x00\x00\x01\xe3\xfa\x17\x7a\xce\xcf\xb8\x67\x21\xcf\x6f\x9f\x42\x06\xbd\x3b\xd6\x72\xd7\xd5\x12\x0d\x08\x03"  # eth / CTT / ChainTrade Token
+    b"\x00\x00\x00\x01\xe4\x1d\x24\x89\x57\x1d\x32\x21\x89\x24\x6d\xaf\xa5\xeb\xde\x1f\x46\x99\xf4\x98\x12\x0d\x0b\x03"  # eth / ZRX / 0x Project
+    b"\x00\x00\x00\x01\xe4\x3a\xc1\x71\x4f\x73\x94\x17\x3b\x15\xe7\xcf\xf3\x1a\x63\xd5\x23\xce\x4f\xb9\x12\x0d\x0e\x03"  # eth / PLS / DACPLAY Token
+    b"\x00\x00\x00\x01\xe4\x3e\x20\x41\xdc\x37\x86\xe1\x66\x96\x1e\xd9\x48\x4a\x55\x39\x03\x3d\x10\xfb\x12\x0d\x11\x03"  # eth / DNX / DenCity
+    b"\x00\x00\x00\x01\xe4\x69\xc4\x47\x3a\xf8\x22\x17\xb3\x0c\xf1\x7b\x10\xbc\xdb\x6c\x8c\x79\x6e\x75\x00\x0d\x14\x04"  # eth / EXRN / EXRNchain
+    b"\x00\x00\x00\x01\xe4\xc9\x4d\x45\xf7\xae\xf7\x01\x8a\x5d\x66\xf4\x4a\xf7\x80\xec\x60\x23\x37\x8e\x06\x0d\x18\x0c"  # eth / CryptoCarbon / CryptoCarbon
+    b"\x00\x00\x00\x01\xe5\x03\x65\xf5\xd6\x79\xcb\x98\xa1\xdd\x62\xd6\xf6\xe5\x8e\x59\x32\x1b\xcd\xdf\x12\x0d\x24\x02"  # eth / LA / LATOKEN
+    b"\x00\x00\x00\x01\xe5\x30\x44\x1f\x4f\x73\xbd\xb6\xdc\x2f\xa5\xaf\x7c\x3f\xc5\xfd\x55\x1e\xc8\x38\x04\x0d\x26\x03"  # eth / GSE / GSENetwork
+    b"\x00\x00\x00\x01\xe5\xa7\xc1\x29\x72\xf3\xbb\xfe\x70\xed\x29\x52\x1c\x89\x49\xb8\xaf\x6a\x09\x70\x12\x0d\x29\x0d"  # eth / BLX (Iconomi) / Iconomi
+    b"\x00\x00\x00\x01\xe5\xae\xe1\x63\x51\x31\x19\xf4\xf7\x50\x37\x6c\x71\x87\x66\xb4\x0f\xa3\x7a\x5f\x12\x0d\x36\x06"  # eth / Fzcoin / Frozencoin Network
+    b"\x00\x00\x00\x01\xe5\xda\xda\x80\xaa\x64\x77\xe8\x5d\x09\x74\x7f\x28\x42\xf7\x99\x3d\x0d\xf7\x1c\x12\x0d\x3c\x04"  # eth / DOCK / Dock
+    b"\x00\x00\x00\x01\xe5\xf1\x66\xc0\xd8\x87\x2b\x68\x79\x00\x61\x31\x7b\xb6\xcc\xa0\x45\x82\xc9\x12\x12\x0d\x40\x03"  # eth / TFD / TE-FOOD
+    b"\x00\x00\x00\x01\xe5\xf8\x67\xde\x1e\xa8\x13\x46\xdf\x51\x81\xb8\xb4\x8d\xd6\xb0\xbb\x33\x57\xb0\x12\x0d\x43\x03"  # eth / BTZ / BTZ by Bunz
+    b"\x00\x00\x00\x01\xe6\x38\xdc\x39\xb6\xad\xbe\xe8\x52\x6b\x5c\x22\x38\x0b\x4b\x45\xda\xf4\x6d\x8e\x06\x0d\x46\x03"  # eth / GZR / Gizer
+    b"\x00\x00\x00\x01\xe6\x45\x09\xf0\xbf\x07\xce\x2d\x29\xa7\xef\x19\xa8\xa9\xbc\x06\x54\x77\xc1\xb4\x08\x0d\x49\x04"  # eth / PIPL / PIPL Coin
+    b"\x00\x00\x00\x01\xe6\x9a\x35\x3b\x31\x52\xdd\x7b\x70\x6f\xf7\xdd\x40\xfe\x1d\x18\xb7\x80\x2d\x31\x12\x0d\x4d\x03"  # eth / ADH / AdHive Token
+    b"\x00\x00\x00\x01\xe6\xdf\xbf\x1f\xac\xa9\x50\x36\xb8\xe7\x6e\x1f\xb2\x89\x33\xd0\x25\xb7\x6c\xc0\x12\x0d\x50\x05"  # eth / LIBER / Libereum
+    b"\x00\x00\x00\x01\xe7\x77\x5a\x6e\x9b\xcf\x90\x4e\xb3\x9d\xa2\xb6\x8c\x5e\xfb\x4f\x93\x60\xe0\x8c\x06\x0d\x55\x04"  # eth / TaaS / Token-as-a-Service
+    b"\x00\x00\x00\x01\xe7\xd3\xe4\x41\x3e\x29\xae\x35\xb0\x89\x31\x40\xf4\x50\x09\x65\xc7\x43\x65\xe5\x12\x0d\x59\x03"  # eth / BBC / TraDove B2BCoin
+    b"\x00\x00\x00\x01\xe7\xe4\x27\x9b\x80\xd3\x19\xed\xe2\x88\x98\x55\x13\x5a\x22\x02\x1b\xaf\x09\x07\x12\x0d\x5c\x04"  # eth / ZEUS / ZeusNetwork
+    b"\x00\x00\x00\x01\xe8\x14\xae\xe9\x60\xa8\x52\x08\xc3\xdb\x54\x2c\x53\xe7\xd4\xa6\xc8\xd5\xf6\x0f\x12\x0d\x60\x03"  # eth / DAY / ChronoLogic DAY
+    b"\x00\x00\x00\x01\xe8\x1d\x72\xd1\x4b\x15\x16\xe6\x8a\xc3\x19\x0a\x46\xc9\x33\x02\xcc\x8e\xd6\x0f\x12\x0d\x63\x02"  # eth / CL / Coinlancer
+    b"\x00\x00\x00\x01\xe8\x66\x3a\x64\xa9\x61\x69\xff\x4d\x95\xb4\x29\x9e\x7a\xe9\xa7\x6b\x90\x5b\x31\x08\x0d\x65\x06"  # eth / RATING / DPRating
+    b"\x00\x00\x00\x01\xe8\x78\x0b\x48\xbd\xb0\x5f\x92\x86\x97\xa5\xe8\x15\x5f\x67\x2e\xd9\x14\x62\xf7\x12\x0d\x6b\x03"  # eth / CAS / Cashaa
+    b"\x00\x00\x00\x01\xe8\xa1\xdf\x95\x8b\xe3\x79\x04\x5e\x2b\x46\xa3\x1a\x98\xb9\x3a\x2e\xcd\xfd\xed\x12\x0d\x6e\x03"  # eth / ESZ / ESZCoin
+    b"\x00\x00\x00\x01\xe8\xf9\xfa\x97\x7e\xa5\x85\x59\x1d\x9f\x39\x46\x81\x31\x8c\x16\x55\x25\x77\xfb\x12\x0d\x71\x03"  # eth / ZTX / ZTX
+    b"\x00\x00\x00\x01\xe8\xff\x5c\x9c\x75\xde\xb3\x46\xac\xac\x49\x3c\x46\x3c\x89\x50\xbe\x03\xdf\xba\x12\x0d\x74\x04"  # eth / VIBE / VIBE Coin
+    b"\x00\x00\x00\x01\xe9\x43\x27\xd0\x7f\xc1\x79\x07\xb4\xdb\x78\x8e\x5a\xdf\x2e\xd4\x24\xad\xdf\xf6\x12\x0d\x78\x10"  # eth / [deprecated] REP / Augur
+    b"\x00\x00\x00\x01\xea\x09\x7a\x2b\x1d\xb0\x06\x27\xb2\xfa\x17\x46\x0a\xd2\x60\xc0\x16\x01\x69\x77\x12\x0d\x88\x03"  # eth / UFR / Upfiring
+    b"\x00\x00\x00\x01\xea\x11\x75\x5a\xe4\x1d\x88\x9c\xee\xc3\x9a\x63\xe6\xff\x75\xa0\x2b\xc1\xc0\x0d\x12\x0d\x8b\x04"  # eth / CTXC / Cortex
+    b"\x00\x00\x00\x01\xea\x1f\x34\x6f\xaf\x02\x3f\x97\x4e\xb5\xad\xaf\x08\x8b\xbc\xdf\x02\xd7\x61\xf4\x12\x0d\x8f\x03"  # eth / TIX / Blocktix
+    b"\x00\x00\x00\x01\xea\x26\xc4\xac\x16\xd4\xa5\xa1\x06\x82\x0b\xc8\xae\xe8\x5f\xd0\xb7\xb2\xb6\x64\x12\x0d\x92\x03"  # eth / QKC / QuarkChain
+    b"\x00\x00\x00\x01\xea\x38\xea\xa3\xc8\x6c\x8f\x9b\x75\x15\x33\xba\x2e\x56\x2d\xeb\x9a\xcd\xed\x40\x12\x0d\x95\x04"  # eth / FUEL / Etherparty FUEL
+    b"\x00\x00\x00\x01\xea\x5f\x88\xe5\x4d\x98\x2c\xbb\x0c\x44\x1c\xde\x4e\x79\xbc\x30\x5e\x5b\x43\xbc\x12\x0d\x99\x06"  # eth / PARETO / PARETO
+    b"\x00\x00\x00\x01\xea\x61\x0b\x11\x53\x47\x77\x20\x74\x8d\xc1\x3e\xd3\x78\x00\x39\x41\xd8\x4f\xab\x12\x0d\x9f\x04"  # eth / ALIS / ALIS Token
+    b"\x00\x00\x00\x01\xea\xb4\x31\x93\xcf\x06\x23\x07\x3c\xa8\x9d\xb9\xb7\x12\x79\x63\x56\xfa\x74\x14\x12\x0d\xa3\x05"  # eth / GOLDX / GOLDX
+    b"\x00\x00\x00\x01\xeb\x7c\x20\x02\x71\x72\xe5\xd1\x43\xfb\x03\x0d\x50\xf9\x1c\xec\xe2\xd1\x48\x5d\x08\x0d\xa8\x04"  # eth / EBTC / eBitcoin
+    b"\x00\x00\x00\x01\xeb\x99\x51\x02\x16\x98\xb4\x2e\x43\x99\xf9\xcb\xb6\x26\x7a\xa3\x5f\x82\xd5\x9d\x12\x0d\xac\x03"  # eth / LIF / Winding Tree
+    b"\x00\x00\x00\x01\xeb\x9a\x4b\x18\x58\x16\xc3\x54\xdb\x92\xdb\x09\xcc\x3b\x50\xbe\x60\xb9\x01\xb6\x12\x0d\xaf\x03"  # eth / ORS / Origin Sport
+    b"\x00\x00\x00\x01\xeb\xbd\xf3\x02\xc9\x40\xc6\xbf\xd4\x9c\x6b\x16\x5f\x45\x7f\xdb\x32\x46\x49\xbc\x12\x0d\xb2\x05"  # eth / HYDRO / Hydro
+    b"\x00\x00\x00\x01\xeb\xed\x4f\xf9\xfe\x34\x41\x3d\xb8\xfc\x82\x94\x55\x6b\xbd\x15\x28\xa4\xda\xca\x03\x0d\xb7\x05"  # eth / VENUS / VENUS
+    b"\x00\x00\x00\x01\xeb\xf2\xf9\xe8\xde\x96\x0f\x64\xec\x0f\xdc\xda\x6c\xb2\x82\x42\x31\x33\x34\x7b\x08\x0d\xbc\x03"  # eth / CNB / Canabio
+    b"\x00\x00\x00\x01\xec\x18\xf8\x98\xb4\x07\x6a\x3e\x18\xf1\x08\x9d\x33\x37\x6c\xc3\x80\xbd\xe6\x1d\x12\x0d\xbf\x05"  # eth / PETRO / PETRO
+    b"\x00\x00\x00\x01\xec\x46\xf8\x20\x7d\x76\x60\x12\x45\x4c\x40\x8d\xe2\x10\xbc\xbc\x22\x43\xe7\x1c\x12\x0d\xc4\x03"  # eth / NOX / Nitro
+    b"\x00\x00\x00\x01\xec\x49\x1c\x10\x88\xea\xe9\x92\xb7\xa2\x14\xef\xb0\xa2\x66\xad\x09\x27\xa7\x2a\x12\x0d\xc7\x03"  # eth / RTB / AB-Chain RTB
+    b"\x00\x00\x00\x01\xec\x67\x00\x5c\x4e\x49\x8e\xc7\xf5\x5e\x09\x2b\xd1\xd3\x5c\xbc\x47\xc9\x18\x92\x12\x0d\xca\x09"  # eth / MLN (new) / Melonport
+    b"\x00\x00\x00\x01\xec\xd5\x70\xbb\xf7\x47\x61\xb9\x60\xfa\x04\xcc\x10\xfe\x2c\x4e\x86\xff\xda\x36\x08\x0d\xd3\x03"  # eth / STP / StashPay
+    b"\x00\x00\x00\x01\xec\xe8\x36\x17\xdb\x20\x8a\xd2\x55\xad\x4f\x45\xda\xf8\x1e\x25\x13\x75\x35\xbb\x08\x0d\xd6\x03"  # eth / INV / Invacio
+    b"\x00\x00\x00\x01\xed\x24\x79\x80\x39\x6b\x10\x16\x9b\xb1\xd3\x6f\x6e\x27\x8e\xd1\x67\x00\xa6\x0f\x04\x0d\xd9\x03"  # eth / AVA / AVA
+    b"\x00\x00\x00\x01\xed\xa8\xb0\x16\xef\xa8\xb1\x16\x12\x08\xcf\x04\x1c\xd8\x69\x72\xee\xe0\xf3\x1e\x12\x0d\xdc\x03"  # eth / IHT / I HOUSE TOKEN
+    b"\x00\x00\x00\x01\xed\xd7\xc9\x4f\xd7\xb4\x97\x1b\x91\x6d\x15\x06\x7b\xc4\x54\xb9\xe1\xba\xd9\x80\x12\x0d\xdf\x04"  # eth / ZIPT / Zippie
+    b"\x00\x00\x00\x01\xee\x60\x9f\xe2\x92\x12\x8c\xad\x03\xb7\x86\xdb\xb9\xbc\x26\x34\xcc\xdb\xe7\xfc\x12\x0d\xe3\x03"  # eth / POS / PoSToken
+    b"\x00\x00\x00\x01\xee\x74\x11\x0f\xb5\xa1\x00\x7b\x06\x28\x2e\x0d\xe5\xd7\x3a\x61\xbf\x41\xd9\xcd\x12\x0d\xe6\x04"  # eth / BHPC / BHPCash
+    b"\x00\x00\x00\x01\xee\xe2\xd0\x0e\xb7\xde\xb8\xdd\x69\x24\x18\x7f\x5a\xa3\x49\x6b\x7d\x06\xe6\x2a\x12\x0d\xea\x03"  # eth / TIG / Tigereum
+    b"\x00\x00\x00\x01\xef\x24\x63\x09\x93\x60\xa0\x85\xf1\xf1\x0b\x07\x6e\xd7\x2e\xf6\x25\x49\x7a\x06\x12\x0d\xed\x03"  # eth / SHP / Sharpe Platform Token
+    b"\x00\x00\x00\x01\xef\x2e\x99\x66\xeb\x61\xbb\x49\x4e\x53\x75\xd5\xdf\x8d\x67\xb7\xdb\x8a\x78\x0d\x00\x0d\xf0\x04"  # eth / SHIT / SHIT
+    b"\x00\x00\x00\x01\xef\x68\xe7\xc6\x94\xf4\x0c\x82\x02\x82\x1e\xdf\x52\x5d\xe3\x78\x24\x58\x63\x9f\x12\x0d\xf4\x03"  # eth / LRC / Loopring
+    b"\x00\x00\x00\x01\xef\x6b\x4c\xe8\xc9\xbc\x83\x74\x4f\xbc\xde\x26\x57\xb3\x2e\xc1\x87\x90\x45\x8a\x00\x0d\xf7\x03"  # eth / PUC / Pour Coin
+    b"\x00\x00\x00\x01\xf0\x28\xad\xee\x51\x53\x3b\x1b\x47\xbe\xaa\x89\x0f\xeb\x54\xa4\x57\xf5\x1e\x89\x12\x0d\xfa\x03"  # eth / BMT / BMT
+    b"\x00\x00\x00\x01\xf0\x3f\x8d\x65\xba\xfa\x59\x86\x11\xc3\x49\x51\x24\x09\x3c\x56\xe8\xf6\x38\xf0\x12\x0d\xfd\x04"  # eth / VIEW / Viewly
+    b"\x00\x00\x00\x01\xf0\x4a\x8a\xc5\x53\xfc\xed\xb5\xba\x99\xa6\x47\x99\x15\x58\x26\xc1\x36\xb0\xbe\x12\x0e\x01\x05"  # eth / FLIXX / Flixxo
+    b"\x00\x00\x00\x01\xf0\x5a\x93\x82\xa4\xc3\xf2\x9e\x27\x84\x50\x27\x54\x29\x3d\x88\xb8\x35\x10\x9c\x12\x0e\x06\x03"  # eth / REX / imbrex
+    b"\x00\x00\x00\x01\xf0\xda\x11\x86\xa4\x97\x72\x26\xb9\x13\x5d\x06\x13\xee\x72\xe2\x29\xec\x3f\x4d\x12\x0e\x09\x03"  # eth / CRT / CreamtoeCoin
+    b"\x00\x00\x00\x01\xf0\xee\x6b\x27\xb7\x59\xc9\x89\x3c\xe4\xf0\x94\xb4\x9a\xd2\x8f\xd1\x5a\x23\xe4\x08\x0e\x0c\x03"  # eth / ENG / Enigma
+    b"\x00\x00\x00\x01\xf1\x49\x22\x00\x1a\x2f\xb8\x54\x1a\x43\x39\x05\x43\x7a\xe9\x54\x41\x9c\x24\x39\x08\x0e\x0f\x03"  # eth / DIT / Digital Insurance Token
+    b"\x00\x00\x00\x01\xf2\x6e\xf5\xe0\x54\x53\x84\xb7\xdc\xc0\xf2\x97\xf2\x67\x41\x89\x58\x68\x30\xdf\x12\x0e\x12\x04"  # eth / BSDC / BSDC
+    b"\x00\x00\x00\x01\xf2\x78\xc1\xca\x96\x90\x95\xff\xdd\xde\xd0\x20\x29\x0c\xf8\xb5\xc4\x24\xac\xe2\x12\x0e\x16\x04"  # eth / RUFF / Ruff
+    b"\x00\x00\x00\x01\xf3\x33\xb2\xac\xe9\x92\xac\x2b\xbd\x87\x98\xbf\x57\xbc\x65\xa0\x61\x84\xaf\xba\x00\x0e\x1a\x03"  # eth / SND / Sandcoin
+    b"\x00\x00\x00\x01\xf3\xb3\xca\xd0\x94\xb8\x93\x92\xfc\xe5\xfa\xfd\x40\xbc\x03\xb8\x0f\x2b\xc6\x24\x12\x0e\x1d\x03"  # eth / PAT / Patron
+    b"\x00\x00\x00\x01\xf3\xc0\x92\xca\x8c\xd6\xd3\xd4\xca\x00\x4d\xc1\xd0\xf1\xfe\x8c\xca\xb5\x35\x99\x12\x0e\x20\x03"  # eth / ZIX / ZIX
+    b"\x00\x00\x00\x01\xf3\xd2\x9f\xb9\x8d\x2d\xc5\xe7\x8c\x87\x19\x8d\xee\xf9\x93\x77\x34\x5f\xd6\xf1\x08\x0e\x23\x07"  # eth / BITPARK / BITPARK
+    b"\x00\x00\x00\x01\xf3\xdb\x5f\xa2\xc6\x6b\x7a\xf3\xeb\x0c\x0b\x78\x25\x10\x81\x6c\xbe\x48\x13\xb8\x04\x0e\x2a\x03"  # eth / EVX / EVX Token
+    b"\x00\x00\x00\x01\xf3\xdb\x75\x60\xe8\x20\x83\x46\x58\xb5\x90\xc9\x62\x34\xc3\x33\xcd\x3d\x5e\x5e\x12\x0e\x2d\x03"  # eth / CHP / CoinPoker
+    b"\x00\x00\x00\x01\xf3\xe0\x14\xfe\x81\x26\x78\x70\x62\x41\x32\xef\x3a\x64\x6b\x8e\x83\x85\x3a\x96\x12\x0e\x30\x03"  # eth / VIN / VIN
+    b"\x00\x00\x00\x01\xf4\x13\x41\x46\xaf\x2d\x51\x1d\xd5\xea\x8c\xdb\x1c\x4a\xc8\x8c\x57\xd6\x04\x04\x12\x0e\x33\x03"  # eth / SNC / SunContract
+    b"\x00\x00\x00\x01\xf4\x1e\x5f\xbc\x2f\x6a\xac\x20\x0d\xd8\x61\x9e\x12\x1c\xe1\xf0\x5d\x15\x00\x77\x12\x0e\x36\x03"  # eth / CRC / CryCash
+    b"\x00\x00\x00\x01\xf4\x33\x08\x93\x66\x89\x9d\x83\xa9\xf2\x6a\x77\x3d\x59\xec\x7e\xcf\x30\x35\x5e\x08\x0e\x39\x03"  # eth / MTL / Metal
+    b"\x00\x00\x00\x01\xf4\x47\x45\xfb\xd4\x1f\x6a\x1b\xa1\x51\xdf\x19\x0d\xb0\x56\x4c\x5f\xcc\x44\x10\x12\x0e\x3c\x03"  # eth / CPY / COPYTRACK
+    b"\x00\x00\x00\x01\xf4\x53\xb5\xb9\xd4\xe0\xb5\xc6\x2f\xfb\x25\x6b\xb2\x37\x8c\xc2\xbc\x8e\x8a\x89\x08\x0e\x3f\x03"  # eth / MRK / MARK.SPACE
+    b"\x00\x00\x00\x01\xf4\x9c\xdd\x50\xad\x40\x8d\x38\x7d\x61\x1f\x88\xa6\x47\x17\x9c\x3d\xe3\x49\x2b\x12\x0e\x42\x04"  # eth / CRGO / CargoCoin
+    b"\x00\x00\x00\x01\xf4\xc0\x7b\x18\x65\xbc\x32\x6a\x3c\x01\x33\x94\x92\xca\x75\x38\xfd\x03\x8c\xc0\x04\x0e\x46\x03"  # eth / PBT / Primalbase Token (PBT)
+    b"\x00\x00\x00\x01\xf4\xfa\xea\x45\x55\x75\x35\x4d\x26\x99\xbc\x20\x9b\x0a\x65\xca\x99\xf6\x99\x82\x12\x0e\x49\x04"  # eth / NOBS / No BS Crypto
+    b"\x00\x00\x00\x01\xf4\xfe\x95\x60\x38\x81\xd0\xe0\x79\x54\xfd\x76\x05\xe0\xe9\xa9\x16\xe4\x2c\x44\x12\x0e\x4d\x04"  # eth / WHEN / WHEN Token
+    b"\x00\x00\x00\x01\xf6\x29\xcb\xd9\x4d\x37\x91\xc9\x25\x01\x52\xbd\x8d\xfb\xdf\x38\x0e\x2a\x3b\x9c\x12\x0e\x51\x03"  # eth / ENJ / ENJIN
+    b"\x00\x00\x00\x01\xf6\x60\xca\x1e\x22\x8e\x7b\xe1\xfa\x8b\x4f\x55\x83\x14\x5e\x31\x14\x7f\xb5\x77\x12\x0e\x54\x03"  # eth / CET / DICE Money Dicet
+    b"\x00\x00\x00\x01\xf6\x74\x51\xdc\x84\x21\xf0\xe0\xaf\xeb\x52\xfa\xa8\x10\x10\x34\xed\x08\x1e\xd9\x08\x0e\x57\x03"  # eth / GAM / Gambit
+    b"\x00\x00\x00\x01\xf6\xb6\xaa\x0e\xf0\xf5\xed\xc2\xc1\xc5\xd9\x25\x47\x7f\x97\xea\xf6\x63\x03\xe7\x08\x0e\x5a\x03"  # eth / XGG / Going Gems
+    b"\x00\x00\x00\x01\xf6\xcf\xe5\x3d\x6f\xeb\xae\xea\x05\x1f\x40\x0f\xf5\xfc\x14\xf0\xcb\xbd\xac\xa1\x12\x0e\x5d\x04"  # eth / DGPT / DigiPulse
+    b"\x00\x00\x00\x01\xf7\x0a\x64\x2b\xd3\x87\xf9\x43\x80\xff\xb9\x04\x51\xc2\xc8\x1d\x4e\xb8\x2c\xbc\x12\x0e\x61\x04"  # eth / STAR / Star Token
+    b"\x00\x00\x00\x01\xf7\x5f\xbf\xa2\xf6\x81\x86\x0b\x9a\x6d\x19\xfc\x3f\xf3\xd3\x4c\xb3\x22\xe2\xd6\x12\x0e\x65\x04"  # eth / CIYA / CRYPTORIYA
+    b"\x00\x00\x00\x01\xf7\xb0\x98\x29\x8f\x7c\x69\xfc\x14\x61\x0b\xf7\x1d\x5e\x02\xc6\x07\x92\x89\x4c\x03\x0e\x69\x03"  # eth / GUP / Matchpool
+    b"\x00\x00\x00\x01\xf7\xe9\x83\x78\x16\x09\x01\x23\x07\xf2\x51\x4f\x63\xd5\x26\xd8\x3d\x24\xf4\x66\x10\x0e\x6c\x03"  # eth / MYD / MYD
+    b"\x00\x00\x00\x01\xf8\x13\xf3\x90\x2b\xbc\x00\xa6\xdc\xe3\x78\x63\x4d\x3b\x79\xd8\x4f\x98\x03\xd7\x12\x0e\x6f\x04"  # eth / PATH / PATH
+    b"\x00\x00\x00\x01\xf8\x5f\xee\xa2\xfd\xd8\x1d\x51\x17\x7f\x6b\x8f\x35\xf0\xe6\x73\x4c\xe4\x5f\x5f\x12\x0e\x73\x03"  # eth / CMT / CyberMiles Token
+    b"\x00\x00\x00\x01\xf8\x7f\x0d\x91\x53\xfe\xa5\x49\xc7\x28\xad\x61\xcb\x80\x15\x95\xa6\x8b\x73\xde\x12\x0e\x76\x04"  # eth / BANX / BANX
+    b"\x00\x00\x00\x01\xf8\xe0\x6e\x4e\x4a\x80\x28\x7f\xdc\xa5\xb0\x2d\xcc\xec\xaa\x9d\x09\x54\x84\x0f\x12\x0e\x7a\x05"  # eth / TGAME / Truegame
+    b"\x00\x00\x00\x01\xf8\xe3\x86\xed\xa8\x57\x48\x4f\x5a\x12\xe4\xb5\xda\xa9\x98\x4e\x06\xe7\x37\x05\x12\x0e\x7f\x03"  # eth / IND / Indorse
+    b"\x00\x00\x00\x01\xf9\x70\xb8\xe3\x6e\x23\xf7\xfc\x3f\xd7\x52\xee\xa8\x6f\x8b\xe8\xd8\x33\x75\xa6\x12\x0e\x82\x03"  # eth / RCN / Ripio Credit Network
+    b"\x00\x00\x00\x01\xf9\xd9\x70\x2d\x03\x14\x07\xf4\x25\xa4\x41\x26\x82\xfd\xc5\x6b\x07\xd0\x52\x62\x00\x0e\x85\x03"  # eth / WOC / WallOfChain
+    b"\x00\x00\x00\x01\xf9\xf0\xfc\x71\x67\xc3\x11\xdd\x2f\x1e\x21\xe9\x20\x4f\x87\xeb\xa9\x01\x2f\xb2\x08\x0e\x88\x03"  # eth / EHT / EasyHomes
+    b"\x00\x00\x00\x01\xf9\xf7\xc2\x9c\xfd\xf1\x9f\xcf\x1f\x2a\xa6\xb8\x4a\xa3\x67\xbc\xf1\xbd\x16\x76\x12\x0e\x8b\x03"  # eth / DTT / Delphi Tech Token
+    b"\x00\x00\x00\x01\xfa\x05\xa7\x3f\xfe\x78\xef\x8f\x1a\x73\x94\x73\xe4\x62\xc5\x4b\xae\x65\x67\xd9\x12\x0e\x8e\x03"  # eth / LUN / Lunyr
+    b"\x00\x00\x00\x01\xfa\x0e\xf5\xe0\x34\xca\xe1\xae\x75\x2d\x59\xbd\xb8\xad\xcd\xe3\x7e\xd7\xab\x97\x12\x0e\x91\x03"  # eth / TCA / TangguoTao Token
+    b"\x00\x00\x00\x01\xfa\x1a\x85\x6c\xfa\x34\x09\xcf\xa1\x45\xfa\x4e\x20\xeb\x27\x0d\xf3\xeb\x21\xab\x12\x0e\x94\x04"  # eth / IOST / IOSToken
+    b"\x00\x00\x00\x01\xfa\x1d\xe2\xee\x97\xe4\xc1\x0c\x94\xc9\x1c\xb2\xb5\x06\x2b\x89\xfb\x14\x0b\x82\x06\x0e\x98\x03"  # eth / EDC / Education Credits
+    b"\x00\x00\x00\x01\xfa\x45\x6c\xf5\x52\x50\xa8\x39\x08\x8b\x27\xee\x32\xa4\x24\xd7\xda\xcb\x54\xff\x12\x0e\x9b\x04"  # eth / BTTX / Blocktrade.com
+    b"\x00\x00\x00\x01\xfa\xcc\xd5\xfc\x83\xc3\xe4\xc3\xc1\xac\x1e\xf3\x5d\x15\xad\xf0\x6b\xcf\x20\x9c\x08\x0e\x9f\x04"  # eth / TBC2 / TBC2
+    b"\x00\x00\x00\x01\xfa\xd5\x72\xdb\x56\x6e\x52\x34\xac\x9f\xc3\xd5\x70\xc4\xed\xc0\x05\x0e\xaa\x92\x12\x0e\xa3\x03"  # eth / BTH / Bytether
+    b"\x00\x00\x00\x01\xfb\x12\xe3\xcc\xa9\x83\xb9\xf5\x9d\x90\x91\x2f\xd1\x7f\x8d\x74\x5a\x8b\x29\x53\x00\x0e\xa6\x04"  # eth / LUCK / LUCK
+    b"\x00\x00\x00\x01\xfb\x2f\x26\xf2\x66\xfb\x28\x05\xa3\x87\x23\x0f\x2a\xa0\xa3\x31\xb4\xd9\x6f\xba\x12\x0e\xaa\x04"  # eth / DADI / DADI
+    b"\x00\x00\x00\x01\xfb\x48\xe0\xde\xa8\x37\xf9\x43\x83\x09\xa7\xe9\xf0\xcf\xe7\xee\x33\x53\xa8\x4e\x02\x0e\xae\x03"  # eth / AFA / Africahead Ipparts
+    b"\x00\x00\x00\x01\xfb\xd0\xd1\xc7\x7b\x50\x17\x96\xa3\x5d\x86\xcf\x91\xd6\x5d\x97\x78\xee\xe6\x95\x03\x0e\xb1\x05"  # eth / TWNKL / Twinkle
+    b"\x00\x00\x00\x01\xfc\x2c\x4d\x8f\x95\x00\x2c\x14\xed\x0a\x7a\xa6\x51\x02\xca\xc9\xe5\x95\x3b\x5e\x12\x0e\xb6\x04"  # eth / RBLX / Rublix
+    b"\x00\x00\x00\x01\xfc\xa4\x79\x62\xd4\x5a\xdf\xdf\xd1\xab\x2d\x97\x23\x15\xdb\x4c\xe7\xcc\xf0\x94\x08\x0e\xba\x03"  # eth / IXT / InsureX
+    b"\x00\x00\x00\x01\xfc\xd8\x62\x98\x56\x28\xb2\x54\x06\x1f\x7a\x91\x80\x35\xb8\x03\x40\xd0\x45\xd3\x12\x0e\xbd\x03"  # eth / GIF / GIFcoin Token
+    b"\x00\x00\x00\x01\xfd\x10\x7b\x47\x3a\xb9\x0e\x8f\xbd\x89\x87\x21\x44\xa3\xdc\x92\xc4\x0f\xa8\xc9\x12\x0e\xc0\x04"  # eth / LALA / LALA World Token
+    b"\x00\x00\x00\x01\xfd\x1e\x80\x50\x8f\x24\x3e\x64\xce\x23\x4e\xa8\x8a\x5f\xd2\x82\x7c\x71\xd4\xb7\x08\x0e\xc4\x04"  # eth / MEDX / MediBloc [ERC20]
+    b"\x00\x00\x00\x01\xfd\x89\x71\xd5\xe8\xe1\x74\x0c\xe2\xd0\xa8\x40\x95\xfc\xa4\xde\x72\x9d\x0c\x16\x12\x0e\xc8\x03"  # eth / ZLA / Zilla
+    b"\x00\x00\x00\x01\xfd\xbc\x1a\xdc\x26\xf0\xf8\xf8\x60\x6a\x5d\x63\xb7\xd3\xa3\xcd\x21\xc2\x2b\x23\x08\x0e\xcb\x03"  # eth / 1WO / 1World
+    b"\x00\x00\x00\x01\xfd\xcc\x07\xab\x60\x66\x0d\xe5\x33\xb5\xad\x26\xe1\x45\x7b\x56\x5a\x9d\x59\xbd\x12\x0e\xce\x04"  # eth / MART / Martcoin
+    b"\x00\x00\x00\x01\xfe\x5d\x90\x8c\x9a\xd8\x5f\x65\x11\x85\xda\xa6\xa4\x77\x07\x26\xe2\xb2\x7d\x09\x12\x0e\xd2\x03"  # eth / BHR / BETHER
+    b"\x00\x00\x00\x01\xfe\x5f\x14\x1b\xf9\x4f\xe8\x4b\xc2\x8d\xed\x0a\xb9\x66\xc1\x6b\x17\x49\x06\x57\x12\x0e\xd5\x03"  # eth / LBA / Cred
+    b"\x00\x00\x00\x01\xfe\x7b\x91\x5a\x0b\xaa\x0e\x79\xf8\x5c\x55\x53\x26\x65\x13\xf7\xc1\xc0\x3e\xd0\x12\x0e\xd8\x04"  # eth / THUG / THUG
+    b"\x00\x00\x00\x01\xfe\xc0\xcf\x7f\xe0\x78\xa5\x00\xab\xf1\x5f\x12\x84\x95\x8f\x22\x04\x9c\x2c\x7e\x12\x0e\xdc\x03"  # eth / ART / Maecenas
+    b"\x00\x00\x00\x01\xfe\xda\xe5\x64\x26\x68\xf8\x63\x6a\x11\x98\x7f\xf3\x86\xbf\xd2\x15\xf9\x42\xee\x12\x0e\xdf\x03"  # eth / PAL / PolicyPal Network
+    b"\x00\x00\x00\x01\xfe\xf3\x88\x4b\x60\x3c\x33\xef\x8e\xd4\x18\x33\x46\xe0\x93\xa1\x73\xc9\x4d\xa6\x12\x0e\xe2\x04"  # eth / METM / MetaMorph
+    b"\x00\x00\x00\x01\xff\x18\xdb\xc4\x87\xb4\xc2\xe3\x22\x2d\x11\x59\x52\xba\xbf\xda\x8b\xa5\x2f\x5f\x12\x0e\xe6\x04"  # eth / LIFE / LIFE
+    b"\x00\x00\x00\x01\xff\x56\xcc\x6b\x1e\x6d\xed\x34\x7a\xa0\xb7\x67\x6c\x85\xab\x0b\x3d\x08\xb0\xfa\x12\x0e\xea\x04"  # eth / ORBS / Orbs
+    b"\x00\x00\x00\x01\xff\x5c\x25\xd2\xf4\x0b\x47\xc4\xa3\x7f\x98\x9d\xe9\x33\xe2\x65\x62\xef\x0a\xc0\x10\x0e\xee\x03"  # eth / KNT / Kora Network Token
+    b"\x00\x00\x00\x01\xff\x60\x3f\x43\x94\x6a\x3a\x28\xdf\x5e\x6a\x73\x17\x25\x55\xd8\xc8\xb0\x23\x86\x12\x0e\xf1\x03"  # eth / RNT / OneRoot Network
+    b"\x00\x00\x00\x01\xff\xa9\x3a\xac\xf4\x92\x97\xd5\x1e\x21\x18\x17\x45\x28\x39\x05\x2f\xdf\xb9\x61\x12\x0e\xf4\x03"  # eth / DCC / Distributed Credit Chain
+    b"\x00\x00\x00\x01\xff\xaa\x5f\xfc\x45\x5d\x91\x31\xf8\xa2\x71\x3a\x74\x1f\xd1\x96\x03\x30\x50\x8b\x12\x0e\xf7\x03"  # eth / QRG / QRG
+    b"\x00\x00\x00\x01\xff\xe0\x2e\xe4\xc6\x9e\xdf\x1b\x34\x0f\xca\xd6\x4f\xbd\x6b\x37\xa7\xb9\xe2\x65\x08\x0e\xfa\x04"  # eth / NANJ / NANJCOIN
+    b"\x00\x00\x00\x01\xff\xe8\x19\x6b\xc2\x59\xe8\xde\xdc\x54\x4d\x93\x57\x86\xaa\x47\x09\xec\x3e\x64\x12\x0e\xfe\x03"  # eth / HDG / Hedge Crypto
+    b"\x00\x00\x00\x03\x6f\x95\xa3\xb6\x82\xf8\xe9\xaa\xcc\x86\xd0\x57\xa6\xdf\x88\xa0\xe6\x81\x45\xa8\x02\x0f\x01\x04"  # rop / ILSC / IsraCoin
+    b"\x00\x00\x00\x03\x95\xd7\x32\x1e\xdc\xe5\x19\x41\x9b\xa1\xdb\xc6\x0a\x89\xba\xfb\xf5\x5e\xac\x0d\x06\x0f\x05\x07"  # rop / *PLASMA / *PLASMA
+    b"\x00\x00\x00\x03\xa1\xba\xcc\xa0\xe1\x2d\x40\x91\xec\x1f\x92\xe7\xca\xe3\x39\x4c\xc9\x85\x4d\x3d\x12\x0f\x0c\x05"  # rop / dqr30 / DQR
+    b"\x00\x00\x00\x03\xfd\x5a\x69\xa1\x30\x95\x95\xff\x51\x21\x55\x3f\x52\xc8\xa5\xb2\xb1\xb3\x10\x31\x00\x0f\x11\x04"  # rop / NONE / None
+    b"\x00\x00\x00\x04\x0a\x05\x7a\x87\xce\x9c\x56\xd7\xe3\x36\xb4\x17\xc7\x9c\xf3\x0e\x8d\x27\x86\x0b\x0f\x0f\x15\x04"  # rin / WALL / WALLETH Community-Token
+    b"\x00\x00\x00\x04\x12\xfe\x17\x4c\x09\x7f\x6b\x3e\x87\x6b\x3b\x06\x0c\x90\x61\xf4\xb9\xde\xbb\x80\x12\x0f\x19\x03"  # rin / PPD / PP Donation
+    b"\x00\x00\x00\x04\x27\x5a\x5b\x34\x65\x99\xb5\x69\x17\xe7\xb1\xc9\xde\x01\x9d\xcf\x9e\xad\x86\x1a\x12\x0f\x1c\x02"  # rin / KC / Karma Token
+    b"\x00\x00\x00\x04\x36\x15\x75\x70\x11\x11\x25\x60\x52\x15\x36\x25\x8c\x1e\x73\x25\xae\x3b\x48\xae\x12\x0f\x1e\x03"  # rin / RDN / Raiden
+    b"\x00\x00\x00\x04\x39\x8a\x7a\x69\xf3\xc5\x91\x81\xa1\xff\xe3\x4b\xed\x11\xdc\xb5\xdf\x86\x3a\x8a\x12\x0f\x21\x04"  # rin / AETH / AKASHA Tokens
+    b"\x00\x00\x00\x04\x64\x75\xa7\xfa\x6e\xd2\xd5\x18\x0f\x0e\x0a\x07\xc2\xd9\x51\xd1\x2c\x0e\xdb\x91\x00\x0f\x25\x04"  # rin / NONE / None
+    b"\x00\x00\x00\x04\x8b\x65\xd4\xb7\xee\x3f\xff\xa9\x86\xc5\x77\xf0\xf4\xb7\x0a\x21\xba\xe3\xdd\x54\x12\x0f\x29\x04"  # rin / CTGA / Convenient To Go
+    b"\x00\x00\x00\x04\xe2\x78\x26\xee\x77\x8b\x6f\x78\xa4\x9a\x68\x6d\xa7\xd6\x4f\x6e\x7b\x08\x4a\x4f\x00\x0f\x2d\x04"  # rin / BHNT / Berlin Hack&Tell winner token
+    b"\x00\x00\x00\x08\x08\x53\x3d\x6a\x06\xce\x36\x52\x98\xb1\x2e\xf9\x2e\xb4\x07\xcb\xa8\xaa\x82\x73\x08\x0f\x31\x04"  # ubq / CEFS / CEFS
+    b"\x00\x00\x00\x08\x4b\x48\x99\xa1\x0f\x3e\x50\x7d\xb2\x07\xb0\xee\x24\x26\x02\x9e\xfa\x16\x8a\x67\x08\x0f\x35\x05"  # ubq / QWARK / QWARK
+    b"\x00\x00\x00\x08\x5e\x17\x15\xbb\x79\x80\x5b\xd6\x72\x72\x97\x60\xb3\xf7\xf3\x4d\x6f\x48\x50\x98\x08\x0f\x3a\x05"  # ubq / RICKS / RICKS
+    b"\x00\x00\x00\x08\x94\xad\x7e\x41\xc1\xd4\x40\x22\xc4\xf4\x7c\xb1\xba\x01\x9f\xd1\xa0\x22\xc5\x36\x08\x0f\x3f\x03"  # ubq / DOT / DOT
+    b"\x00\x00\x00\x08\xff\x3b\xf0\x57\xad\xf3\xb0\xe0\x15\xb6\x46\x53\x31\xa6\x23\x6e\x55\x68\x82\x74\x00\x0f\x42\x04"  # ubq / BEER / BEER
+    b"\x00\x00\x00\x2a\x1d\xad\x47\x83\xcf\x3f\xe3\x08\x5c\x14\x26\x15\x7a\xb1\x75\xa6\x11\x9a\x04\xba\x12\x0f\x46\x03"  # kov / MKR / RadarRelay test MakerDAO
+    b"\x00\x00\x00\x2a\x32\x3b\x5d\x4c\x32\x34\x5c\xed\x77\x39\x3b\x35\x30\xb1\xee\xd0\xf3\x46\x42\x9d\x12\x0f\x49\x03"  # kov / MLN / RadarRelay test Melon Tokens
+    b"\x00\x00\x00\x2a\x3c\x67\xf7\xd4\xde\xcf\x77\x95\x22\x5f\x51\xb5\x41\x34\xf8\x11\x37\x38\x5f\x83\x03\x0f\x4c\x03"  # kov / GUP / GUP
+    b"\x00\x00\x00\x2a\x6f\xf6\xc0\xff\x1d\x68\xb9\x64\x90\x1f\x98\x6d\x4c\x9f\xa3\xac\x68\x34\x65\x70\x12\x0f\x4f\x03"  # kov / ZRX / RadarRelay test 0x Protocol Token
+    b"\x00\x00\x00\x2a\x86\x67\x55\x92\x54\x24\x1d\xde\xd4\xd1\x13\x92\xf8\x68\xd7\x20\x92\x76\x53\x67\x12\x0f\x52\x09"  # kov / Aeternity / Aeternity
+    b"\x00\x00\x00\x2a\xb1\x88\x45\xc2\x60\xf6\x80\xd5\xb9\xd8\x46\x49\x63\x88\x13\xe3\x42\xe4\xf8\xc9\x12\x0f\x5b\x03"  # kov / REP / RadarRelay test Augur Reputation Token
+    b"\x00\x00\x00\x2a\xc4\x37\x5b\x7d\xe8\xaf\x5a\x38\xa9\x35\x48\xeb\x84\x53\xa4\x98\x22\x2c\x4f\xf2\x12\x0f\x5e\x03"  # kov / DAI / RadarRelay test Dai Stablecoin v1.0
+    b"\x00\x00\x00\x2a\xee\xe3\x87\x06\x57\xe4\x71\x66\x70\xf1\x85\xdf\x08\x65\x2d\xd8\x48\xfe\x8f\x7e\x12\x0f\x61\x03"  # kov / DGD / RadarRelay test Digix DAO Token
+    b"\x00\x00\x00\x2a\xef\x7f\xff\x64\x38\x9b\x81\x4a\x94\x6f\x3e\x92\x10\x55\x13\x70\x5c\xa6\xb9\x90\x12\x0f\x64\x03"  # kov / GNT / RadarRelay test Golem Network Token
+    b"\x00\x00\x00\x3d\x08\x5f\xb4\xf2\x40\x31\xea\xed\xbc\x2b\x61\x1a\xa5\x28\xf2\x23\x43\xeb\x52\xdb\x08\x0f\x67\x03"  # etc / BEC / BEC
+    b"\x00\x00\x00\x3d\x6a\xda\x6f\x48\xc8\x15\x68\x95\x02\xc4\x3e\xc1\xa5\x9f\x1b\x5d\xd3\xc0\x4e\x1f\x12\x0f\x6a\x03"  # etc / UNV / UniversalCoin
+    b"\x00\x00\x00\x40\x99\x1e\x7f\xe4\xb0\x5f\x2b\x3d\xb1\xd7\x88\xe7\x05\x96\x3f\x5d\x64\x7b\x00\x44\x12\x0f\x6d\x06"  # ella / MINING / Ella Mining Tokens
+    b"\x00\x00\x79\x7e\x01\x46\xb9\xdc\xd9\xfb\x2a\xbc\x1b\x5b\x13\x6c\x28\xd2\x0d\x00\x37\x52\x69\x61\x12\x0f\x73\x04"  # esn / TOPM / TOPM
+    b"\x00\x00\x79\x7e\x72\xea\x35\x08\xd9\xd8\x17\xa9\x14\x65\xab\xb5\x9b\xe1\x0f\xef\x98\x57\xa0\x55\x00\x0f\x77\x03"  # esn / DGT / DGT
+)
+
+_SYMBOLS = (
+    b"\x54\x55\x53\x44\x49\x50\x53\x58\x53\x54\x58\x32\x32\x78\x46\x4b\x58\x45\x58\x43\x49\x43\x4f\x53\x44\x50\x50\x43\x5a\x52\x4f\x43\x43\x47\x54\x4b\x54\x42\x54\x43\x41\x50\x4b\x47\x4c\x49\x4b\x45\x53\x50\x49\x43\x45\x53\x54\x55"
+    b"\x45\x4e\x43\x42\x54\x52\x4e\x44\x53\x43\x50\x4f\x4d\x54\x46\x4c\x4f\x54\x43\x41\x50\x50\x58\x45\x54\x57\x59\x56\x47\x55\x53\x44\x53\x50\x58\x43\x42\x49\x58\x4d\x46\x54\x55\x5a\x49\x4c\x43\x4b\x41\x43\x45\x54\x4b\x4c\x4e"
+    b"\x46\x4e\x4b\x4f\x53\x44\x45\x45\x5a\x43\x42\x54\x44\x41\x4c\x43\x44\x4c\x54\x42\x54\x54\x45\x44\x47\x42\x54\x43\x45\x42\x49\x54\x42\x49\x54\x43\x41\x52\x44\x43\x4e\x54\x4e\x54\x4c\x4e\x44\x52\x4e\x44\x52\x53\x54\x42\x46\x41\x42\x41"
+    b"\x47\x52\x4f\x57\x44\x4e\x54\x46\x52\x44\x49\x54\x54\x4d\x54\x58\x50\x4c\x42\x54\x52\x49\x59\x41\x44\x41\x58\x49\x4e\x54\x53\x57\x46\x54\x43\x50\x52\x53\x50\x43\x4f\x49\x4c\x44\x41\x54\x41\x49\x53\x54\x33\x34\x4a\x38\x54\x4b\x43"
+    b"\x42\x41\x54\x41\x56\x54\x50\x44\x41\x54\x41\x49\x51\x4e\x50\x4f\x45\x52\x4f\x43\x4b\x32\x50\x41\x59\x41\x42\x59\x53\x53\x43\x50\x41\x59\x59\x55\x50\x49\x45\x4c\x45\x56\x58\x53\x43\x4d\x41\x4e\x41\x31\x53\x47\x58\x4d\x58\x50\x49\x54\x42\x43\x56"
+    b"\x47\x56\x54\x41\x49\x58\x52\x4b\x54\x42\x4c\x54\x53\x59\x4e\x43\x45\x4e\x4e\x5a\x51\x56\x54\x43\x41\x54\x20\x28\x42\x69\x74\x43\x6c\x61\x76\x65\x29\x4c\x47\x4f\x41\x52\x43\x54\x53\x55\x42\x54\x52\x41\x4b\x47\x52\x49\x44\x53\x58\x44\x54\x47\x42\x58\x43\x46\x49"
+    b"\x4d\x43\x49\x42\x4f\x55\x54\x53\x50\x48\x49\x52\x45\x4d\x49\x53\x4b\x45\x44\x49\x56\x58\x41\x43\x43\x4b\x41\x4e\x43\x48\x58\x42\x45\x54\x48\x45\x52\x48\x4b\x47\x44\x45\x42\x58\x4f\x56\x50\x52\x53\x49\x49\x43\x52\x48\x4f\x43"
+    b"\x58\x46\x53\x42\x54\x51\x55\x54\x54\x4f\x57\x4e\x45\x43\x4f\x4d\x4e\x4d\x52\x43\x44\x54\x46\x52\x45\x43\x4e\x42\x41\x49\x45\x43\x4f\x32\x41\x4c\x43\x4f\x46\x58\x54\x50\x52\x4c\x46\x41\x4d\x42\x44\x47\x4e\x44\x58"
+    b"\x52\x45\x50\x53\x4e\x42\x4c\x41\x54\x58\x41\x50\x50\x43\x4d\x4e\x45\x57\x49\x53\x48\x44\x41\x54\x41\x42\x72\x6f\x6b\x65\x72\x56\x49\x54\x45\x45\x54\x42\x53\x52\x4f\x43\x42\x43\x50\x54\x53\x4f\x4e\x49\x51\x54\x45\x41\x4d\x44\x47\x54\x58\x41\x4b\x43\x54\x48\x52"
+    b"\x46\x41\x43\x45\x43\x41\x4e\x54\x41\x4c\x41\x4f\x53\x50\x44\x44\x53\x43\x58\x43\x4c\x52\x4d\x54\x52\x63\x42\x43\x44\x4e\x53\x2d\x41\x2d\x50\x41\x54\x53\x4f\x4c\x42\x4e\x54\x52\x4e\x54\x42\x5a\x43\x4f\x46\x54\x52\x44\x45\x57\x53\x50\x4e"
+    b"\x43\x41\x52\x43\x4f\x43\x58\x43\x4c\x4f\x4b\x4d\x52\x50\x4e\x54\x57\x4b\x57\x42\x54\x43\x47\x53\x43\x47\x58\x56\x43\x46\x44\x5a\x41\x50\x54\x56\x49\x54\x47\x45\x4c\x44\x4b\x57\x41\x54\x54\x4e\x55\x47\x51\x42\x58\x55\x4b\x47"
+    b"\x47\x4e\x59\x4c\x49\x56\x45\x53\x50\x41\x52\x54\x41\x53\x43\x52\x4c\x49\x4e\x47\x4c\x4f\x4f\x4b\x52\x44\x4e\x4c\x4d\x4c\x50\x4b\x54\x4d\x4f\x54\x51\x55\x4e\x43\x42\x43\x43\x32\x30\x41\x53\x54\x4b\x49\x43\x4b\x41\x49\x52"
+    b"\x43\x43\x43\x20\x28\x43\x72\x79\x70\x74\x6f\x43\x72\x61\x73\x68\x43\x6f\x75\x72\x73\x65\x29\x53\x4e\x54\x52\x53\x54\x41\x43\x53\x57\x41\x42\x49\x4e\x50\x58\x45\x54\x47\x58\x42\x50\x43\x53\x4e\x4f\x42\x41\x53\x46\x4f\x4f\x44\x54\x44\x48\x45\x44\x55\x46\x54\x54\x41\x44\x42\x53\x4b\x49\x4e\x51\x54\x51"
+    b"\x4f\x53\x54\x53\x58\x55\x54\x56\x49\x42\x44\x4d\x54\x43\x52\x42\x54\x53\x4f\x43\x44\x49\x43\x45\x4c\x47\x52\x42\x43\x54\x57\x4e\x4c\x41\x54\x58\x50\x46\x52\x54\x52\x43\x54\x58\x47\x54\x43\x4f\x46\x49\x43\x43\x53"
+    b"\x45\x42\x43\x54\x4d\x54\x42\x50\x54\x43\x43\x54\x53\x47\x50\x54\x52\x44\x54\x56\x45\x45\x55\x55\x55\x44\x45\x4e\x54\x42\x42\x4e\x45\x50\x58\x50\x43\x4c\x42\x54\x4f\x43\x43\x43\x58\x42\x42\x49\x41\x49\x44"
+    b"\x53\x50\x48\x54\x58\x42\x45\x5a\x4d\x42\x52\x53\x44\x43\x41\x54\x48\x45\x54\x41\x48\x50\x42\x41\x4d\x4f\x53\x4d\x53\x44\x43\x4c\x57\x41\x58\x4d\x49\x43\x46\x4c\x50\x45\x54\x48\x42\x54\x42\x58\x43\x4a\x54\x50\x52\x49\x58"
+    b"\x45\x54\x4b\x42\x4b\x52\x78\x52\x56\x54\x43\x4c\x4c\x53\x2d\x45\x54\x48\x43\x4d\x42\x54\x43\x59\x46\x4d\x4d\x2d\x45\x54\x48\x52\x54\x48\x4d\x47\x4f\x52\x45\x4e\x4f\x43\x4e\x53\x41\x4c\x54\x43\x4c\x4e\x46\x54\x58\x54\x44\x52\x47\x4e"
+    b"\x46\x55\x4e\x58\x44\x43\x45\x4d\x54\x4e\x43\x56\x43\x52\x56\x4c\x41\x44\x53\x54\x47\x4f\x54\x46\x4f\x54\x41\x41\x4c\x49\x53\x50\x41\x4e\x4b\x33\x4c\x54\x4f\x50\x54\x42\x5a\x50\x4f\x49\x4e\x45\x4c\x54\x43\x4f\x49\x4e\x58\x4d\x43\x54"
+    b"\x45\x57\x4f\x41\x44\x58\x4d\x4f\x5a\x4f\x53\x4e\x49\x50\x42\x4b\x58\x43\x54\x46\x4e\x78\x43\x52\x41\x4f\x4b\x49\x4e\x44\x53\x54\x52\x43\x4b\x52\x4c\x50\x54\x54\x43\x53\x43\x4d\x43\x54\x45\x51\x4c\x48\x41\x4e\x44"
+    b"\x46\x52\x56\x49\x4e\x52\x4d\x52\x48\x45\x52\x50\x54\x4f\x4e\x44\x45\x58\x52\x4f\x55\x4e\x44\x53\x4b\x4f\x31\x42\x54\x52\x58\x42\x4c\x41\x4c\x58\x4c\x4b\x59\x51\x4e\x54\x52\x4c\x58\x4d\x49\x54\x58\x42\x42\x4b"
+    b"\x53\x54\x41\x42\x49\x54\x5a\x49\x4e\x43\x53\x4b\x42\x56\x55\x55\x57\x41\x42\x41\x50\x49\x53\x53\x4b\x52\x52\x47\x53\x53\x65\x6e\x53\x61\x74\x6f\x72\x49\x4e\x50\x45\x52\x41\x49\x4f\x4e\x57\x50\x52\x4f\x4e\x45\x58\x43\x43\x42\x45\x45\x41\x4d\x42"
+    b"\x46\x4e\x44\x58\x41\x55\x52\x43\x52\x45\x44\x4f\x24\x46\x46\x43\x54\x48\x52\x54\x44\x47\x58\x47\x45\x45\x42\x53\x54\x45\x50\x59\x4c\x44\x43\x41\x49\x49\x44\x48\x4c\x49\x4e\x4b\x20\x28\x43\x68\x61\x69\x6e\x6c\x69\x6e\x6b\x29\x4d\x55\x58\x45\x4f\x52\x4d\x45\x56\x49\x55"
+    b"\x4d\x44\x41\x65\x55\x53\x44\x46\x49\x44\x50\x43\x4c\x4f\x4c\x44\x58\x47\x4d\x42\x4c\x55\x45\x47\x45\x4e\x52\x54\x4e\x50\x54\x57\x4f\x58\x59\x4f\x48\x53\x54\x5a\x4d\x4e\x4e\x49\x4f\x50\x42\x4c\x42\x52\x44\x44\x47\x58\x31"
+    b"\x50\x45\x58\x54\x54\x52\x43\x4e\x43\x41\x54\x20\x28\x42\x6c\x6f\x63\x6b\x43\x41\x54\x29\x58\x4e\x54\x42\x4c\x5a\x43\x4f\x32\x42\x69\x74\x73\x55\x53\x44\x4c\x59\x4d\x56\x44\x47\x4e\x41\x56\x49\x50\x45\x54\x4e\x4f\x41\x48\x4c\x50\x54\x53\x50\x41\x52\x43\x47\x58\x43\x50\x4c\x41\x53\x4d\x41"
+    b"\x50\x4f\x57\x52\x53\x54\x4e\x4c\x4f\x56\x45\x48\x41\x50\x50\x59\x49\x43\x45\x42\x54\x43\x4c\x44\x54\x48\x42\x51\x58\x48\x4f\x52\x53\x45\x4d\x41\x44\x4c\x45\x44\x55\x49\x4e\x53\x4d\x45\x53\x54\x45\x4e\x54\x52\x50\x53\x54\x51\x56\x53\x4c"
+    b"\x45\x58\x59\x41\x45\x50\x53\x54\x42\x32\x42\x58\x4e\x41\x53\x50\x4f\x50\x45\x4e\x47\x54\x4c\x55\x43\x43\x46\x43\x4c\x4f\x43\x45\x5a\x54\x49\x54\x43\x4f\x41\x4b\x52\x45\x42\x4c\x52\x4c\x43\x44\x41\x58\x54"
+    b"\x51\x41\x53\x48\x57\x50\x43\x41\x55\x54\x4f\x53\x53\x50\x53\x54\x43\x44\x52\x56\x48\x41\x54\x54\x4e\x41\x4c\x54\x53\x4d\x57\x41\x54\x4e\x4f\x4e\x45\x4f\x4c\x54\x49\x50\x4c\x54\x49\x4d\x45\x4f\x78\x20\x46\x69\x6e\x61\x41\x44\x4c\x4d\x44\x53"
+    b"\x43\x54\x58\x50\x54\x57\x49\x4e\x47\x53\x48\x4c\x58\x4d\x46\x47\x51\x41\x55\x43\x52\x45\x44\x53\x45\x4e\x53\x45\x50\x4f\x41\x32\x30\x5a\x41\x50\x43\x43\x4f\x47\x4e\x4f\x4f\x4e\x4c\x47\x41\x54\x53\x49\x47\x4d\x53\x50"
+    b"\x44\x53\x54\x53\x52\x4e\x43\x41\x54\x73\x20\x28\x42\x69\x74\x43\x6c\x61\x76\x65\x29\x5f\x4f\x6c\x64\x45\x54\x52\x50\x41\x54\x45\x4e\x54\x53\x43\x46\x54\x59\x51\x52\x4c\x57\x43\x54\x42\x54\x43\x52\x42\x45\x52\x52\x59\x44\x47\x53\x54\x53\x57\x55\x50\x48\x4f\x54\x20\x28\x48\x6f\x6c\x6f\x29\x47\x45\x4e\x45\x53\x53\x48"
+    b"\x47\x4e\x58\x48\x54\x4f\x52\x43\x41\x49\x4f\x54\x58\x4f\x41\x58\x50\x4f\x4c\x4c\x43\x50\x4c\x4f\x47\x41\x56\x45\x4c\x55\x54\x4b\x46\x4c\x58\x47\x4c\x41\x57\x52\x4b\x43\x4f\x52\x49\x53\x4b\x59\x4d\x57\x52\x43\x4b\x45\x45"
+    b"\x4e\x47\x43\x42\x43\x42\x43\x41\x4d\x4e\x42\x54\x45\x53\x4e\x54\x57\x42\x41\x42\x65\x65\x72\x43\x6f\x69\x6e\x45\x52\x4f\x47\x42\x54\x41\x52\x44\x4e\x58\x58\x42\x45\x54\x52\x49\x46\x54\x52\x45\x41\x52\x45\x44\x50\x59\x4c\x4e\x54"
+    b"\x41\x52\x58\x50\x52\x47\x4a\x65\x74\x43\x6f\x69\x6e\x73\x50\x4f\x4f\x4c\x42\x4f\x58\x58\x46\x54\x41\x54\x4c\x43\x59\x4d\x54\x53\x43\x41\x4e\x44\x49\x53\x4c\x59\x4d\x4b\x54\x5a\x43\x53\x53\x4c\x54\x41\x53\x54\x52\x4f\x53\x41\x4e\x43\x41\x47"
+    b"\x52\x4d\x43\x24\x54\x45\x41\x4b\x43\x4d\x43\x65\x6f\x73\x44\x41\x43\x42\x4f\x50\x43\x52\x37\x4d\x54\x52\x43\x4c\x50\x42\x52\x4c\x4e\x4e\x43\x41\x53\x48\x43\x52\x50\x54\x54\x49\x4f\x4c\x45\x4e\x44\x4e\x45\x57\x42\x49\x44\x45\x41\x4d\x44\x54"
+    b"\x4b\x49\x4e\x50\x4d\x4e\x54\x44\x41\x54\x4d\x52\x4c\x57\x41\x54\x54\x44\x4e\x41\x56\x44\x4f\x43\x44\x52\x45\x41\x4d\x4f\x50\x54\x49\x52\x45\x4d\x4d\x4e\x54\x50\x5a\x58\x43\x56\x4f\x49\x53\x45\x55\x42\x54\x57\x45\x42\x57\x54\x54"
+    b"\x50\x4d\x41\x41\x4d\x54\x43\x42\x42\x4f\x53\x50\x46\x53\x48\x4c\x49\x45\x54\x48\x4d\x4f\x43\x43\x4e\x4e\x4a\x45\x54\x42\x54\x43\x4f\x4e\x45\x41\x44\x49\x4f\x54\x4e\x56\x49\x42\x45\x58\x41\x54\x54\x49\x43\x4e\x50\x52\x45"
+    b"\x48\x4b\x59\x49\x4b\x42\x46\x59\x4e\x55\x6e\x69\x63\x6f\x72\x6e\x52\x45\x46\x57\x49\x4e\x44\x41\x49\x53\x49\x46\x54\x4d\x56\x50\x47\x45\x54\x49\x47\x43\x44\x4c\x4e\x54\x4f\x42\x45\x54\x50\x54\x4f\x59\x50\x45\x47"
+    b"\x54\x4f\x4d\x4f\x46\x52\x38\x47\x5a\x45\x52\x4d\x45\x53\x48\x4e\x41\x43\x44\x58\x54\x5b\x64\x65\x70\x72\x65\x63\x61\x74\x65\x64\x5d\x20\x54\x55\x53\x44\x45\x47\x54\x4b\x4e\x44\x43\x50\x41\x58\x41\x47\x49\x54\x4f\x4f\x52\x50\x49\x58\x46\x59\x50\x56\x45\x52\x49\x52\x45\x51"
+    b"\x57\x43\x4e\x48\x41\x54\x45\x41\x52\x54\x48\x46\x41\x4e\x58\x50\x41\x44\x4f\x52\x58\x38\x58\x52\x45\x41\x4c\x59\x45\x45\x56\x4c\x44\x45\x56\x45\x43\x52\x4d\x54\x45\x52\x54\x55\x43\x41\x53\x48\x55\x52\x42\x54\x54\x43"
+    b"\x4d\x43\x41\x50\x50\x4e\x4b\x46\x54\x49\x41\x4d\x49\x53\x45\x4d\x54\x4b\x5a\x4e\x46\x4c\x55\x5a\x4d\x4f\x44\x48\x44\x4c\x45\x4d\x4f\x4e\x54\x43\x42\x4d\x41\x4e\x54\x43\x54\x52\x56\x5a\x54\x41\x54\x4d\x49\x53\x4e\x4d"
+    b"\x47\x55\x4c\x44\x42\x4d\x58\x53\x45\x58\x59\x45\x41\x47\x4c\x45\x54\x43\x48\x42\x41\x4e\x43\x41\x50\x4f\x4c\x59\x54\x49\x45\x51\x53\x50\x53\x54\x41\x43\x42\x41\x58\x54\x4f\x4b\x51\x54\x55\x4d\x41\x4f\x41\x46\x4c\x52\x41\x58\x50"
+    b"\x44\x52\x54\x48\x4f\x54\x20\x28\x48\x79\x64\x72\x6f\x29\x41\x54\x4d\x44\x42\x45\x54\x44\x41\x4e\x48\x49\x42\x54\x4c\x4f\x43\x49\x54\x54\x55\x4f\x4c\x45\x47\x5a\x42\x55\x54\x4e\x50\x4e\x43\x54\x48\x4b\x4e\x42\x52\x41\x54\x43\x54\x47\x43\x53\x57\x4d"
+    b"\x4e\x42\x43\x4d\x4b\x52\x32\x44\x43\x58\x45\x53\x24\x46\x58\x59\x42\x54\x48\x52\x55\x53\x44\x43\x53\x45\x4e\x43\x4e\x50\x58\x53\x53\x47\x45\x4c\x44\x41\x43\x53\x50\x52\x4f\x4e\x49\x43\x4f\x4d\x45\x54\x52\x4f\x43\x4b\x53\x45\x4e\x54"
+    b"\x55\x53\x44\x53\x4c\x4f\x4f\x4d\x49\x56\x59\x43\x41\x52\x42\x4e\x44\x43\x45\x43\x4e\x41\x52\x59\x4a\x4e\x54\x4d\x59\x53\x54\x45\x4b\x4f\x47\x4e\x54\x54\x46\x4c\x49\x4e\x58\x54\x4e\x45\x55\x4d\x56\x4c\x4c\x55\x4d"
+    b"\x48\x49\x47\x45\x4c\x59\x4d\x4e\x54\x5a\x49\x50\x48\x4d\x43\x4c\x43\x53\x54\x52\x41\x43\x54\x4b\x4e\x54\x54\x41\x55\x43\x4e\x4d\x52\x56\x58\x4e\x4e\x44\x41\x54\x58\x53\x41\x43\x45\x55\x52\x54\x44\x4f\x56"
+    b"\x54\x47\x54\x41\x52\x43\x42\x43\x44\x54\x47\x49\x4d\x53\x54\x4b\x53\x4e\x47\x4c\x53\x33\x30\x30\x43\x52\x42\x31\x53\x54\x4d\x54\x48\x41\x52\x42\x65\x42\x43\x48\x54\x42\x54\x54\x4e\x53\x43\x45\x45\x4b\x41\x52\x58\x54"
+    b"\x58\x49\x44\x43\x4c\x42\x53\x45\x45\x4c\x45\x53\x47\x4e\x4f\x4e\x45\x4b\x58\x52\x4c\x42\x4b\x42\x43\x4f\x42\x42\x49\x58\x54\x4c\x58\x47\x4d\x54\x58\x43\x48\x46\x47\x52\x4d\x44\x54\x4b\x52\x48\x4f\x44\x4c\x43\x4f\x32"
+    b"\x46\x4d\x46\x52\x50\x4c\x65\x47\x41\x53\x52\x45\x44\x43\x49\x43\x58\x5a\x50\x52\x4b\x50\x52\x4f\x4d\x58\x4e\x45\x58\x4f\x45\x56\x43\x4d\x43\x4f\x53\x54\x4f\x52\x4a\x45\xe2\x82\xb9\x45\x4d\x4f\x4e\x42\x54\x55\x30\x78\x42\x54\x43"
+    b"\x43\x58\x4f\x47\x54\x43\x43\x50\x45\x58\x57\x54\x43\x45\x4d\x56\x42\x4e\x42\x4e\x55\x4c\x53\x50\x41\x59\x41\x42\x54\x50\x41\x49\x53\x57\x54\x5a\x43\x4e\x44\x4b\x50\x48\x47\x54\x41\x52\x4e\x43\x48\x53\x42"
+    b"\x45\x4b\x54\x53\x54\x52\x53\x4f\x55\x4c\x58\x50\x41\x54\x43\x53\x54\x44\x41\x4f\x42\x43\x4c\x58\x4e\x4b\x42\x57\x58\x46\x4e\x54\x42\x53\x4e\x4f\x56\x47\x55\x45\x53\x53\x53\x56\x44\x43\x43\x43\x20\x28\x49\x43\x4f\x4e\x4f\x4d\x49\x29\x43\x56\x54\x52\x4c\x54\x59"
+    b"\x5b\x64\x65\x70\x72\x65\x63\x61\x74\x65\x64\x5d\x20\x4d\x4c\x4e\x20\x28\x6f\x6c\x64\x29\x4f\x4a\x58\x43\x41\x52\x45\x45\x4c\x46\x43\x54\x4c\x4f\x44\x45\x57\x4d\x4b\x53\x4e\x58\x57\x45\x54\x48\x48\x56\x4e\x41\x55\x43\x50\x58\x54\x43\x43\x33\x52\x4f\x43\x4b\x32\x47\x52\x4f\x4f\x49\x41\x44"
+    b"\x44\x54\x52\x43\x54\x41\x55\x42\x4f\x55\x49\x6f\x54\x41\x58\x50\x52\x56\x4f\x43\x50\x50\x50\x43\x4f\x53\x4d\x4c\x47\x45\x44\x52\x47\x54\x4f\x4c\x4f\x43\x55\x53\x4f\x4c\x44\x5f\x4d\x4b\x52\x44\x49\x50\x49\x4e\x53\x54\x41\x52\x4c\x46\x52"
+    b"\x47\x45\x4d\x55\x50\x50\x43\x54\x47\x45\x4c\x49\x58\x46\x58\x43\x45\x58\x4d\x52\x52\x4f\x4b\x41\x4d\x4c\x54\x42\x4c\x4e\x42\x55\x43\x53\x47\x52\x51\x42\x49\x54\x54\x52\x53\x54\x42\x54\x4d\x48\x4d\x51\x59\x4f\x59\x4f\x57"
+    b"\x49\x44\x58\x4d\x42\x4f\x4e\x44\x44\x46\x41\x42\x43\x48\x4e\x45\x43\x52\x4c\x54\x41\x58\x31\x24\x48\x55\x52\x41\x55\x52\x41\x42\x4c\x58\x20\x28\x42\x75\x6c\x6c\x69\x6f\x6e\x29\x45\x34\x52\x4f\x57\x45\x44\x4f\x4e\x45\x54\x53\x4e\x47\x55\x51\x43\x46\x53\x4e"
+    b"\x52\x46\x52\x53\x54\x4f\x52\x4d\x41\x44\x54\x44\x54\x52\x4f\x4d\x47\x56\x49\x4b\x4b\x59\x42\x4e\x54\x59\x4f\x52\x49\x4f\x4e\x47\x43\x43\x4c\x43\x57\x49\x4c\x44\x43\x38\x45\x4c\x45\x43\x43\x4e\x44\x50\x50\x54\x46\x54\x58"
+    b"\x53\x4f\x41\x52\x57\x4e\x4b\x55\x53\x44\x4d\x53\x43\x4c\x44\x41\x56\x4e\x45\x45\x4f\x56\x45\x4e\x50\x4c\x55\x57\x59\x53\x53\x4b\x4d\x59\x55\x50\x46\x47\x50\x42\x4e\x46\x54\x63\x56\x42\x4e\x4e\x44\x41\x42"
+    b"\x55\x53\x44\x54\x54\x4b\x41\x47\x43\x50\x45\x55\x52\x53\x4a\x4f\x54\x42\x54\x4b\x45\x54\x48\x44\x52\x49\x50\x54\x54\x45\x4e\x4c\x59\x53\x48\x42\x54\x45\x54\x43\x48\x44\x65\x76\x63\x6f\x6e\x32\x20\x54\x6f\x6b\x65\x6e\x4b\x4e\x43\x4a\x4f\x59\x44\x45\x4c\x54\x41"
+    b"\x52\x55\x4e\x45\x4b\x55\x45\x4d\x46\x54\x42\x4f\x42\x42\x4d\x43\x46\x49\x48\x53\x45\x54\x44\x47\x44\x53\x55\x52\x42\x5a\x4e\x54\x48\x42\x53\x48\x49\x50\x4d\x41\x4e\x50\x55\x52\x43\x4e\x49\x4d\x46\x41\x4a\x43"
+    b"\x43\x4f\x56\x44\x52\x50\x55\x48\x42\x5a\x50\x4c\x52\x49\x4d\x43\x5a\x53\x54\x43\x54\x54\x5a\x52\x58\x50\x4c\x53\x44\x4e\x58\x45\x58\x52\x4e\x43\x72\x79\x70\x74\x6f\x43\x61\x72\x62\x6f\x6e\x4c\x41\x47\x53\x45\x42\x4c\x58\x20\x28\x49\x63\x6f\x6e\x6f\x6d\x69\x29\x46\x7a\x63\x6f\x69\x6e"
+    b"\x44\x4f\x43\x4b\x54\x46\x44\x42\x54\x5a\x47\x5a\x52\x50\x49\x50\x4c\x41\x44\x48\x4c\x49\x42\x45\x52\x54\x61\x61\x53\x42\x42\x43\x5a\x45\x55\x53\x44\x41\x59\x43\x4c\x52\x41\x54\x49\x4e\x47\x43\x41\x53\x45\x53\x5a\x5a\x54\x58"
+    b"\x56\x49\x42\x45\x5b\x64\x65\x70\x72\x65\x63\x61\x74\x65\x64\x5d\x20\x52\x45\x50\x55\x46\x52\x43\x54\x58\x43\x54\x49\x58\x51\x4b\x43\x46\x55\x45\x4c\x50\x41\x52\x45\x54\x4f\x41\x4c\x49\x53\x47\x4f\x4c\x44\x58\x45\x42\x54\x43\x4c\x49\x46\x4f\x52\x53\x48\x59\x44\x52\x4f\x56\x45\x4e\x55\x53\x43\x4e\x42"
+    b"\x50\x45\x54\x52\x4f\x4e\x4f\x58\x52\x54\x42\x4d\x4c\x4e\x20\x28\x6e\x65\x77\x29\x53\x54\x50\x49\x4e\x56\x41\x56\x41\x49\x48\x54\x5a\x49\x50\x54\x50\x4f\x53\x42\x48\x50\x43\x54\x49\x47\x53\x48\x50\x53\x48\x49\x54\x4c\x52\x43\x50\x55\x43"
+    b"\x42\x4d\x54\x56\x49\x45\x57\x46\x4c\x49\x58\x58\x52\x45\x58\x43\x52\x54\x45\x4e\x47\x44\x49\x54\x42\x53\x44\x43\x52\x55\x46\x46\x53\x4e\x44\x50\x41\x54\x5a\x49\x58\x42\x49\x54\x50\x41\x52\x4b\x45\x56\x58\x43\x48\x50\x56\x49\x4e"
+    b"\x53\x4e\x43\x43\x52\x43\x4d\x54\x4c\x43\x50\x59\x4d\x52\x4b\x43\x52\x47\x4f\x50\x42\x54\x4e\x4f\x42\x53\x57\x48\x45\x4e\x45\x4e\x4a\x43\x45\x54\x47\x41\x4d\x58\x47\x47\x44\x47\x50\x54\x53\x54\x41\x52\x43\x49\x59\x41"
+    b"\x47\x55\x50\x4d\x59\x44\x50\x41\x54\x48\x43\x4d\x54\x42\x41\x4e\x58\x54\x47\x41\x4d\x45\x49\x4e\x44\x52\x43\x4e\x57\x4f\x43\x45\x48\x54\x44\x54\x54\x4c\x55\x4e\x54\x43\x41\x49\x4f\x53\x54\x45\x44\x43\x42\x54\x54\x58"
+    b"\x54\x42\x43\x32\x42\x54\x48\x4c\x55\x43\x4b\x44\x41\x44\x49\x41\x46\x41\x54\x57\x4e\x4b\x4c\x52\x42\x4c\x58\x49\x58\x54\x47\x49\x46\x4c\x41\x4c\x41\x4d\x45\x44\x58\x5a\x4c\x41\x31\x57\x4f\x4d\x41\x52\x54\x42\x48\x52\x4c\x42\x41"
+    b"\x54\x48\x55\x47\x41\x52\x54\x50\x41\x4c\x4d\x45\x54\x4d\x4c\x49\x46\x45\x4f\x52\x42\x53\x4b\x4e\x54\x52\x4e\x54\x44\x43\x43\x51\x52\x47\x4e\x41\x4e\x4a\x48\x44\x47\x49\x4c\x53\x43\x2a\x50\x4c\x41\x53\x4d\x41\x64\x71\x72\x33\x30\x4e\x4f\x4e\x45"
+    b"\x57\x41\x4c\x4c\x50\x50\x44\x4b\x43\x52\x44\x4e\x41\x45\x54\x48\x4e\x4f\x4e\x45\x43\x54\x47\x41\x42\x48\x4e\x54\x43\x45\x46\x53\x51\x57\x41\x52\x4b\x52\x49\x43\x4b\x53\x44\x4f\x54\x42\x45\x45\x52\x4d\x4b\x52\x4d\x4c\x4e\x47\x55\x50"
+    b"\x5a\x52\x58\x41\x65\x74\x65\x72\x6e\x69\x74\x79\x52\x45\x50\x44\x41\x49\x44\x47\x44\x47\x4e\x54\x42\x45\x43\x55\x4e\x56\x4d\x49\x4e\x49\x4e\x47\x54\x4f\x50\x4d\x44\x47\x54"
+)
 # fmt: on
@@ -1,21 +1,76 @@
 # generated from tokens.py.mako
 # do not edit manually!
+import ustruct
+from micropython import const
+
+# every token is a record of _RECORD_LEN bytes in _TOKENS, sorted by its key:
+# chain_id (uint32 big endian) + address (20 bytes), then decimals (uint8),
+# offset (uint16 big endian) and length (uint8) of the symbol in _SYMBOLS
+_KEY_LEN = const(24)
+_RECORD_LEN = const(28)
 
 
 def token_by_chain_address(chain_id, address):
-    for token in tokens:
-        if chain_id == token[0] and address == token[1]:
-            return token
+    if chain_id is None or not 0 <= chain_id <= 0xFFFFFFFF or len(address) != 20:
+        return UNKNOWN_TOKEN
+    key = ustruct.pack(">L", chain_id) + address
+    lo = 0
+    hi = len(_TOKENS) // _RECORD_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ofs = mid * _RECORD_LEN
+        k = _TOKENS[ofs : ofs + _KEY_LEN]
+        if k < key:
+            lo = mid + 1
+        elif k > key:
+            hi = mid
+        else:
+            decimals, sym_ofs, sym_len = ustruct.unpack_from(
+                ">BHB", _TOKENS, ofs + _KEY_LEN
+            )
+            symbol = _SYMBOLS[sym_ofs : sym_ofs + sym_len].decode()
+            return (chain_id, bytes(address), symbol, decimals)
     return UNKNOWN_TOKEN
 
 
 UNKNOWN_TOKEN = (None, None, None, None)
 
+<%
+def hexbytes(b):
+    return 'b"' + "".join("\\x%02x" % x for x in b) + '"'
 
+tokens = sorted(
+    supported_on("trezor2", erc20),
+    key=lambda t: (t.chain_id, t.address_bytes),
+)
+symbols = []
+records = []
+sym_ofs = 0
+for t in tokens:
+    symbol = t.symbol.encode()
+    assert 0 <= t.chain_id <= 0xFFFFFFFF and len(t.address_bytes) == 20
+    assert t.decimals <= 0xFF and len(symbol) <= 0xFF and sym_ofs + len(symbol) <= 0xFFFF
+    record = (
+        t.chain_id.to_bytes(4, "big")
+        + t.address_bytes
+        + bytes([t.decimals])
+        + sym_ofs.to_bytes(2, "big")
+        + bytes([len(symbol)])
+    )
+    records.append((record, t))
+    symbols.append(symbol)
+    sym_ofs += len(symbol)
+%>\
 # fmt: off
-tokens = [
-% for t in supported_on("trezor2", erc20):
-    (${t.chain_id}, ${black_repr(t.address_bytes)}, ${black_repr(t.symbol)}, ${t.decimals}),  # ${t.chain} / ${t.name.strip()}
+_TOKENS = (
+% for record, t in records:
+    ${hexbytes(record)}  # ${t.chain} / ${t.symbol} / ${t.name.strip()}
+% endfor
+)
+
+_SYMBOLS = (
+% for i in range(0, len(symbols), 16):
+    ${hexbytes(b"".join(symbols[i:i + 16]))}
 % endfor
-]
+)
 # fmt: on
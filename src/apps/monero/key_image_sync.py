@@ -1,4 +1,5 @@
 import gc
+from micropython import const
 
 from trezor import log, wire
 from trezor.messages import MessageType
@@ -8,11 +9,15 @@ from trezor.messages.MoneroKeyImageSyncFinalAck import MoneroKeyImageSyncFinalAc
 from trezor.messages.MoneroKeyImageSyncStepAck import MoneroKeyImageSyncStepAck
 
 from apps.common import paths
+from apps.common.writers import empty_bytearray
 from apps.monero import misc
 from apps.monero.layout import confirms
 from apps.monero.xmr import crypto, key_image, monero
 from apps.monero.xmr.crypto import chacha_poly
 
+# key image + signature (c, r) of one output
+_KI_SIZE = const(3 * 32)
+
 
 async def key_image_sync(ctx, msg, keychain):
     state = KeyImageSync()
@@ -44,6 +49,14 @@ class KeyImageSync:
         self.creds = None
         self.subaddresses = {}
         self.hasher = crypto.get_keccak()
+        self.batch = False
+
+        # scratch buffer for the exported key image, reused for all outputs
+        self.buff = bytearray(_KI_SIZE)
+        buff_mv = memoryview(self.buff)
+        self.buff_ki = buff_mv[0:32]
+        self.buff_c = buff_mv[32:64]
+        self.buff_r = buff_mv[64:]
 
 
 async def _init_step(s, ctx, msg, keychain):
@@ -56,10 +69,12 @@ async def _init_step(s, ctx, msg, keychain):
     s.num_outputs = msg.num
     s.expected_hash = msg.hash
     s.enc_key = crypto.random_bytes(32)
+    s.batch = bool(msg.batch)
 
+    sub_cache = misc.get_subaddress_cache(s.creds)
     for sub in msg.subs:
         monero.compute_subaddresses(
-            s.creds, sub.account, sub.minor_indices, s.subaddresses
+            s.creds, sub.account, sub.minor_indices, s.subaddresses, sub_cache
         )
 
     return MoneroKeyImageExportInitAck()
@@ -70,8 +85,9 @@ async def _sync_step(s, ctx, tds):
         raise wire.DataError("Empty")
 
     kis = []
-    buff = bytearray(32 * 3)
-    buff_mv = memoryview(buff)
+    if s.batch:
+        # key images of the whole step are encrypted as one blob
+        blob = empty_bytearray(_KI_SIZE * len(tds.tdis))
 
     await confirms.keyimage_sync_step(ctx, s.current_output, s.num_outputs)
 
@@ -90,13 +106,19 @@ async def _sync_step(s, ctx, tds):
         ki, sig = key_image.export_key_image(s.creds, s.subaddresses, td)
 
         # Serialize into buff
-        crypto.encodepoint_into(buff_mv[0:32], ki)
-        crypto.encodeint_into(buff_mv[32:64], sig[0][0])
-        crypto.encodeint_into(buff_mv[64:], sig[0][1])
+        crypto.encodepoint_into(s.buff_ki, ki)
+        crypto.encodeint_into(s.buff_c, sig[0][0])
+        crypto.encodeint_into(s.buff_r, sig[0][1])
 
-        # Encrypt with enc_key
-        nonce, ciph, _ = chacha_poly.encrypt(s.enc_key, buff)
+        if s.batch:
+            blob.extend(s.buff)
+        else:
+            # Encrypt with enc_key
+            nonce, ciph, _ = chacha_poly.encrypt(s.enc_key, s.buff)
+            kis.append(MoneroExportedKeyImage(iv=nonce, blob=ciph))
 
+    if s.batch:
+        nonce, ciph, _ = chacha_poly.encrypt(s.enc_key, blob)
         kis.append(MoneroExportedKeyImage(iv=nonce, blob=ciph))
 
     return MoneroKeyImageSyncStepAck(kis=kis)
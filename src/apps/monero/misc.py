@@ -1,4 +1,6 @@
-from apps.common import HARDENED
+from micropython import const
+
+from apps.common import HARDENED, cache
 from apps.monero import CURVE
 
 if False:
@@ -18,6 +20,27 @@ def get_creds(keychain, address_n=None, network_type=None):
     return creds
 
 
+# Maximal number of subaddress spend keys kept in the session cache.  One key
+# takes 64 B of heap (bytes object and its 33 B buffer, in 16 B GC blocks) and
+# about 12 B of dict slots, 128 keys hold about 10 KB for the whole session.
+_SUBADDRESS_CACHE_SIZE = const(128)
+
+
+def get_subaddress_cache(creds):
+    """
+    Returns the session cache of the subaddress spend keys of the account.
+    It is cleared together with the seed and passphrase cache.
+    """
+    from apps.monero.xmr import crypto, monero
+
+    spend_key_public = crypto.encodepoint(creds.spend_key_public)
+    sub_cache = cache.get_session_data("monero_subaddresses")
+    if sub_cache is None or sub_cache.spend_key_public != spend_key_public:
+        sub_cache = monero.SubaddressCache(spend_key_public, _SUBADDRESS_CACHE_SIZE)
+        cache.set_session_data("monero_subaddresses", sub_cache)
+    return sub_cache
+
+
 def validate_full_path(path: list) -> bool:
     """
     Validates derivation path to equal 44'/128'/a',
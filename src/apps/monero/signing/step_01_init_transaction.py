@@ -282,7 +282,13 @@ def _precompute_subaddr(state: State, account: int, indices):
     Subaddresses have to be stored in encoded form - unique representation.
     Single point can have multiple extended coordinates representation - would not match during subaddress search.
     """
-    monero.compute_subaddresses(state.creds, account, indices, state.subaddresses)
+    monero.compute_subaddresses(
+        state.creds,
+        account,
+        indices,
+        state.subaddresses,
+        misc.get_subaddress_cache(state.creds),
+    )
 
 
 def _process_payment_id(state: State, tsx_data: MoneroTransactionData):
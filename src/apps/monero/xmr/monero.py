@@ -206,7 +206,36 @@ def generate_tx_spend_and_key_image_and_derivation(
     return xi, ki, recv_derivation
 
 
-def compute_subaddresses(creds, account: int, indices, subaddresses=None):
+class SubaddressCache:
+    """
+    Subaddress public spend keys of one account, kept across workflows.
+    Holds at most `max_size` keys, indices requested when full are computed
+    but not cached.
+    """
+
+    def __init__(self, spend_key_public: bytes, max_size: int):
+        self.spend_key_public = spend_key_public  # encoded, identifies the account
+        self.max_size = max_size
+        self.keys = {}  # major -> {minor: encoded subaddress spend key}
+        self.size = 0
+
+    def get(self, major: int, minor: int):
+        minors = self.keys.get(major)
+        return minors.get(minor) if minors is not None else None
+
+    def add(self, major: int, minor: int, pub: bytes):
+        if self.size >= self.max_size:
+            return
+        minors = self.keys.get(major)
+        if minors is None:
+            minors = self.keys[major] = {}
+        minors[minor] = pub
+        self.size += 1
+
+
+def compute_subaddresses(
+    creds, account: int, indices, subaddresses=None, sub_cache=None
+):
     """
     Computes subaddress public spend key for receiving transactions.
 
@@ -214,6 +243,7 @@ def compute_subaddresses(creds, account: int, indices, subaddresses=None):
     :param account: major index
     :param indices: array of minor indices
     :param subaddresses: subaddress dict. optional.
+    :param sub_cache: SubaddressCache of the credentials. optional.
     :return:
     """
     if subaddresses is None:
@@ -224,10 +254,14 @@ def compute_subaddresses(creds, account: int, indices, subaddresses=None):
             subaddresses[crypto.encodepoint(creds.spend_key_public)] = (0, 0)
             continue
 
-        pub = get_subaddress_spend_public_key(
-            creds.view_key_private, creds.spend_key_public, major=account, minor=idx
-        )
-        pub = crypto.encodepoint(pub)
+        pub = sub_cache.get(account, idx) if sub_cache is not None else None
+        if pub is None:
+            pub = get_subaddress_spend_public_key(
+                creds.view_key_private, creds.spend_key_public, major=account, minor=idx
+            )
+            pub = crypto.encodepoint(pub)
+            if sub_cache is not None:
+                sub_cache.add(account, idx, pub)
         subaddresses[pub] = (account, idx)
     return subaddresses
 
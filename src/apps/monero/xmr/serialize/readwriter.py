@@ -1,7 +1,19 @@
 import gc
 
+from trezor.utils import memcpy
+
 
 class MemoryReaderWriter:
+    """
+    Reader / writer over a single buffer. Data are written at `woffset`, into
+    the preallocated space first, then by extending the buffer. Data are read
+    from `offset` up to `woffset`.
+
+    When `offset` reaches `threshold`, the data already read are dropped: the
+    unread rest is moved to the front of the buffer in place and the freed
+    space is reused by the following writes.
+    """
+
     def __init__(
         self,
         buffer=None,
@@ -31,7 +43,7 @@ class MemoryReaderWriter:
             self.woffset = len(buffer)
 
     def is_empty(self):
-        return self.offset == len(self.buffer) or self.offset == self.woffset
+        return self.offset == self.woffset
 
     def preallocate(self, size):
         self.buffer = bytearray(size)
@@ -40,12 +52,10 @@ class MemoryReaderWriter:
 
     def readinto(self, buf):
         ln = len(buf)
-        if not self.read_empty and ln > 0 and self.offset == len(self.buffer):
+        if not self.read_empty and ln > 0 and self.offset == self.woffset:
             raise EOFError
 
-        nread = min(ln, len(self.buffer) - self.offset)
-        for idx in range(nread):
-            buf[idx] = self.buffer[self.offset + idx]
+        nread = memcpy(buf, 0, self.buffer, self.offset, self.woffset - self.offset)
 
         self.offset += nread
         self.nread += nread
@@ -53,9 +63,7 @@ class MemoryReaderWriter:
 
         # Deallocation threshold triggered
         if self.threshold is not None and self.offset >= self.threshold:
-            self.buffer = self.buffer[self.offset :]
-            self.woffset -= self.offset
-            self.offset = 0
+            self._compact()
 
             if self.do_gc:
                 gc.collect()
@@ -65,35 +73,29 @@ class MemoryReaderWriter:
     async def areadinto(self, buf):
         return self.readinto(buf)
 
+    def _compact(self):
+        if self.offset == self.woffset:
+            pass  # everything was read, nothing to move
+        elif isinstance(self.buffer, memoryview):
+            self.buffer = self.buffer[self.offset :]  # no copy, just a view
+        else:
+            memcpy(self.buffer, 0, self.buffer, self.offset, self.woffset - self.offset)
+        self.woffset -= self.offset
+        self.offset = 0
+
     def write(self, buf):
         nwritten = len(buf)
-        nall = len(self.buffer)
-        towrite = nwritten
-        bufoff = 0
 
         # Fill existing place in the buffer
-        while towrite > 0 and nall - self.woffset > 0:
-            self.buffer[self.woffset] = buf[bufoff]
-            self.woffset += 1
-            bufoff += 1
-            towrite -= 1
-
-        # Allocate next chunk if needed
-        while towrite > 0:
-            _towrite = min(32, towrite)
-            chunk = bytearray(32)  # chunk size typical for EC point
-
-            for i in range(_towrite):
-                chunk[i] = buf[bufoff]
-                self.woffset += 1
-                bufoff += 1
-                towrite -= 1
-
-            self.buffer.extend(chunk)
+        nfill = memcpy(self.buffer, self.woffset, buf, 0, nwritten)
+
+        # Extend the buffer by the rest
+        if nfill < nwritten:
+            self.buffer.extend(memoryview(buf)[nfill:] if nfill else buf)
             if self.do_gc:
-                chunk = None  # dereference
                 gc.collect()
 
+        self.woffset += nwritten
         self.nwritten += nwritten
         self.ndata += nwritten
         return nwritten
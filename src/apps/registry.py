@@ -0,0 +1,63 @@
+# generated by tools/build_registry
+# do not edit manually!
+from trezor import wire
+
+# fmt: off
+# wire type of a message starting a workflow, app package handling it
+WORKFLOWS = (
+    (4, "apps.management"),  # ChangePin, change_pin
+    (5, "apps.management"),  # WipeDevice, wipe_device
+    (9, "apps.wallet"),  # GetEntropy, get_entropy
+    (11, "apps.wallet"),  # GetPublicKey, get_public_key
+    (13, "apps.management"),  # LoadDevice, load_device
+    (14, "apps.management"),  # ResetDevice, reset_device
+    (15, "apps.wallet"),  # SignTx, sign_tx
+    (23, "apps.wallet"),  # CipherKeyValue, cipher_key_value
+    (25, "apps.management"),  # ApplySettings, apply_settings
+    (28, "apps.management"),  # ApplyFlags, apply_flags
+    (29, "apps.wallet"),  # GetAddress, get_address
+    (34, "apps.management"),  # BackupDevice, backup_device
+    (38, "apps.wallet"),  # SignMessage, sign_message
+    (39, "apps.wallet"),  # VerifyMessage, verify_message
+    (45, "apps.management"),  # RecoveryDevice, recovery_device
+    (53, "apps.wallet"),  # SignIdentity, sign_identity
+    (56, "apps.ethereum"),  # EthereumGetAddress, get_address
+    (58, "apps.ethereum"),  # EthereumSignTx, sign_tx
+    (61, "apps.wallet"),  # GetECDHSessionKey, get_ecdh_session_key
+    (63, "apps.management"),  # SetU2FCounter, set_u2f_counter
+    (64, "apps.ethereum"),  # EthereumSignMessage, sign_message
+    (65, "apps.ethereum"),  # EthereumVerifyMessage, verify_message
+    (67, "apps.nem"),  # NEMGetAddress, get_address
+    (69, "apps.nem"),  # NEMSignTx, sign_tx
+    (114, "apps.lisk"),  # LiskGetAddress, get_address
+    (116, "apps.lisk"),  # LiskSignTx, sign_tx
+    (118, "apps.lisk"),  # LiskSignMessage, sign_message
+    (120, "apps.lisk"),  # LiskVerifyMessage, verify_message
+    (121, "apps.lisk"),  # LiskGetPublicKey, get_public_key
+    (150, "apps.tezos"),  # TezosGetAddress, get_address
+    (152, "apps.tezos"),  # TezosSignTx, sign_tx
+    (154, "apps.tezos"),  # TezosGetPublicKey, get_public_key
+    (202, "apps.stellar"),  # StellarSignTx, sign_tx
+    (207, "apps.stellar"),  # StellarGetAddress, get_address
+    (303, "apps.cardano"),  # CardanoSignTx, sign_tx
+    (305, "apps.cardano"),  # CardanoGetPublicKey, get_public_key
+    (307, "apps.cardano"),  # CardanoGetAddress, get_address
+    (400, "apps.ripple"),  # RippleGetAddress, get_address
+    (402, "apps.ripple"),  # RippleSignTx, sign_tx
+    (450, "apps.ethereum"),  # EthereumGetPublicKey, get_public_key
+    (501, "apps.monero"),  # MoneroTransactionInitRequest, sign_tx
+    (530, "apps.monero"),  # MoneroKeyImageExportInitRequest, key_image_sync
+    (540, "apps.monero"),  # MoneroGetAddress, get_address
+    (542, "apps.monero"),  # MoneroGetWatchKey, get_watch_only
+    (546, "apps.monero"),  # DebugMoneroDiagRequest, diag
+    (550, "apps.monero"),  # MoneroGetTxKeyRequest, get_tx_keys
+    (552, "apps.monero"),  # MoneroLiveRefreshStartRequest, live_refresh
+    (57344, "apps.wallet"),  # GetAddresses, get_addresses
+    (57347, "apps.wallet"),  # SignTxBatch, sign_tx_batch
+)
+# fmt: on
+
+
+def boot():
+    for mtype, pkgname in WORKFLOWS:
+        wire.add_lazy(mtype, pkgname)
@@ -5,6 +5,7 @@ from trezor.crypto.hashlib import sha256
 from trezor.messages.StellarSignedTx import StellarSignedTx
 from trezor.messages.StellarSignTx import StellarSignTx
 from trezor.messages.StellarTxOpRequest import StellarTxOpRequest
+from trezor.utils import HashWriter
 from trezor.wire import ProcessError
 
 from apps.common import paths, seed
@@ -21,7 +22,8 @@ async def sign_tx(ctx, msg: StellarSignTx, keychain):
     if msg.num_operations == 0:
         raise ProcessError("Stellar: At least one operation is required")
 
-    w = bytearray()
+    # the transaction is hashed as it is serialized, operation by operation
+    w = HashWriter(sha256())
     await _init(ctx, w, pubkey, msg)
     _timebounds(w, msg.timebounds_start, msg.timebounds_end)
     await _memo(ctx, w, msg)
@@ -29,21 +31,21 @@ async def sign_tx(ctx, msg: StellarSignTx, keychain):
     await _final(ctx, w, msg)
 
     # sign
-    digest = sha256(w).digest()
+    digest = w.get_digest()
     signature = ed25519.sign(node.private_key(), digest)
 
     # Add the public key for verification that the right account was used for signing
     return StellarSignedTx(pubkey, signature)
 
 
-async def _final(ctx, w: bytearray, msg: StellarSignTx):
+async def _final(ctx, w: HashWriter, msg: StellarSignTx):
     # 4 null bytes representing a (currently unused) empty union
     writers.write_uint32(w, 0)
     # final confirm
     await layout.require_confirm_final(ctx, msg.fee, msg.num_operations)
 
 
-async def _init(ctx, w: bytearray, pubkey: bytes, msg: StellarSignTx):
+async def _init(ctx, w: HashWriter, pubkey: bytes, msg: StellarSignTx):
     network_passphrase_hash = sha256(msg.network_passphrase).digest()
     writers.write_bytes(w, network_passphrase_hash)
     writers.write_bytes(w, consts.TX_TYPE)
@@ -61,7 +63,7 @@ async def _init(ctx, w: bytearray, pubkey: bytes, msg: StellarSignTx):
     )
 
 
-def _timebounds(w: bytearray, start: int, end: int):
+def _timebounds(w: HashWriter, start: int, end: int):
     # timebounds are only present if timebounds_start or timebounds_end is non-zero
     if start or end:
         writers.write_bool(w, True)
@@ -72,14 +74,14 @@ def _timebounds(w: bytearray, start: int, end: int):
         writers.write_bool(w, False)
 
 
-async def _operations(ctx, w: bytearray, num_operations: int):
+async def _operations(ctx, w: HashWriter, num_operations: int):
     writers.write_uint32(w, num_operations)
     for i in range(num_operations):
         op = await ctx.call(StellarTxOpRequest(), *consts.op_wire_types)
         await process_operation(ctx, w, op)
 
 
-async def _memo(ctx, w: bytearray, msg: StellarSignTx):
+async def _memo(ctx, w: HashWriter, msg: StellarSignTx):
     if msg.memo_type is None:
         msg.memo_type = consts.MEMO_TYPE_NONE
     writers.write_uint32(w, msg.memo_type)
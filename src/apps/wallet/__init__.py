@@ -1,6 +1,8 @@
-from trezor import wire
+from trezor import messages, wire
 from trezor.messages import MessageType
 
+from apps.wallet.messages import AddressesAck, GetAddresses, SignTxBatch
+
 
 def boot():
     ns = [
@@ -15,8 +17,13 @@ def boot():
     ]
     wire.add(MessageType.GetPublicKey, __name__, "get_public_key", ns)
     wire.add(MessageType.GetAddress, __name__, "get_address", ns)
+    messages.register(GetAddresses)
+    messages.register(AddressesAck)
+    wire.add(GetAddresses.MESSAGE_WIRE_TYPE, __name__, "get_addresses", ns)
     wire.add(MessageType.GetEntropy, __name__, "get_entropy")
     wire.add(MessageType.SignTx, __name__, "sign_tx", ns)
+    messages.register(SignTxBatch)
+    wire.add(SignTxBatch.MESSAGE_WIRE_TYPE, __name__, "sign_tx_batch", ns)
     wire.add(MessageType.SignMessage, __name__, "sign_message", ns)
     wire.add(MessageType.VerifyMessage, __name__, "verify_message")
     wire.add(MessageType.SignIdentity, __name__, "sign_identity", ns)
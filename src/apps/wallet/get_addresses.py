@@ -0,0 +1,57 @@
+from micropython import const
+
+from trezor import wire
+from trezor.messages import InputScriptType
+
+from apps.common import coins
+from apps.common.paths import validate_path
+from apps.wallet.messages import Addresses, AddressesAck
+from apps.wallet.sign_tx import addresses
+
+_MAX_COUNT = const(1000)  # maximum number of addresses in one request
+_CHUNK_SIZE = const(20)  # number of addresses in one Addresses message
+
+
+async def get_addresses(ctx, msg, keychain):
+    coin_name = msg.coin_name or "Bitcoin"
+    coin = coins.by_name(coin_name)
+    start = msg.start or 0
+    count = msg.count or 0
+    script_type = msg.script_type
+    if script_type is None:
+        script_type = InputScriptType.SPENDADDRESS
+
+    if count < 1 or count > _MAX_COUNT:
+        raise wire.DataError("Invalid address count")
+    if script_type == InputScriptType.SPENDMULTISIG:
+        raise wire.DataError("Multisig addresses are not supported")
+
+    # all the addresses share the chain path, so it is enough to validate the
+    # path of the address with the highest index
+    await validate_path(
+        ctx,
+        addresses.validate_full_path,
+        keychain,
+        msg.address_n + [start + count - 1],
+        coin=coin,
+        script_type=script_type,
+    )
+
+    # derive the chain node once, addresses are its direct children
+    chain = keychain.derive(msg.address_n, coin.curve_name)
+    try:
+        res = Addresses(start=start)
+        for index in range(start, start + count):
+            node = chain.clone()
+            node.derive(index)
+            res.addresses.append(addresses.get_address(script_type, coin, node))
+            node.__del__()
+
+            if len(res.addresses) == _CHUNK_SIZE and index < start + count - 1:
+                # stream out the full chunk, the last one is the final response
+                await ctx.call(res, AddressesAck.MESSAGE_WIRE_TYPE)
+                res = Addresses(start=index + 1)
+    finally:
+        chain.__del__()
+
+    return res
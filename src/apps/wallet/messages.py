@@ -0,0 +1,76 @@
+"""
+Wallet-specific messages that are not part of the generated `trezor.messages`
+and are registered in runtime, see `trezor.messages.register`.  Wire types are
+taken from the private range, above the types defined by trezor-common.
+"""
+
+import protobuf as p
+from trezor.messages.SignTx import SignTx
+
+if __debug__:
+    try:
+        from typing import List
+    except ImportError:
+        List = None  # type: ignore
+
+
+class GetAddresses(p.MessageType):
+    MESSAGE_WIRE_TYPE = 0xE000
+
+    def __init__(
+        self,
+        address_n: List[int] = None,
+        start: int = None,
+        count: int = None,
+        coin_name: str = None,
+        script_type: int = None,
+    ) -> None:
+        self.address_n = address_n if address_n is not None else []
+        self.start = start
+        self.count = count
+        self.coin_name = coin_name
+        self.script_type = script_type
+
+    @classmethod
+    def get_fields(cls):
+        return {
+            1: ("address_n", p.UVarintType, p.FLAG_REPEATED),  # chain path
+            2: ("start", p.UVarintType, 0),  # default=0
+            3: ("count", p.UVarintType, 0),
+            4: ("coin_name", p.UnicodeType, 0),  # default=Bitcoin
+            5: ("script_type", p.UVarintType, 0),  # default=SPENDADDRESS
+        }
+
+
+class Addresses(p.MessageType):
+    MESSAGE_WIRE_TYPE = 0xE001
+
+    def __init__(self, start: int = None, addresses: List[str] = None) -> None:
+        self.start = start
+        self.addresses = addresses if addresses is not None else []
+
+    @classmethod
+    def get_fields(cls):
+        return {
+            1: ("start", p.UVarintType, 0),  # index of the first address
+            2: ("addresses", p.UnicodeType, p.FLAG_REPEATED),
+        }
+
+
+class AddressesAck(p.MessageType):
+    MESSAGE_WIRE_TYPE = 0xE002
+
+
+class SignTxBatch(p.MessageType):
+    MESSAGE_WIRE_TYPE = 0xE003
+
+    def __init__(self, count: int = None, tx: SignTx = None) -> None:
+        self.count = count
+        self.tx = tx
+
+    @classmethod
+    def get_fields(cls):
+        return {
+            1: ("count", p.UVarintType, 0),  # number of transactions
+            2: ("tx", SignTx, 0),  # the first transaction
+        }
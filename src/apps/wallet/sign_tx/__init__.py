@@ -6,6 +6,7 @@ from trezor.messages.TxRequest import TxRequest
 from apps.common import paths
 from apps.wallet.sign_tx import (
     addresses,
+    checkpoint,
     helpers,
     layout,
     multisig,
@@ -16,8 +17,8 @@ from apps.wallet.sign_tx import (
 )
 
 
-async def sign_tx(ctx, msg, keychain):
-    signer = signing.sign_tx(msg, keychain)
+async def sign_tx(ctx, msg, keychain, coin=None):
+    signer = signing.sign_tx(msg, keychain, coin)
 
     res = None
     while True:
@@ -29,6 +30,8 @@ async def sign_tx(ctx, msg, keychain):
             raise wire.Error(*e.args)
         except addresses.AddressError as e:
             raise wire.Error(*e.args)
+        except checkpoint.CheckpointError as e:
+            raise wire.Error(*e.args)
         except scripts.ScriptsError as e:
             raise wire.Error(*e.args)
         except segwit_bip143.Bip143Error as e:
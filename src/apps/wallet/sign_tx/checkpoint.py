@@ -0,0 +1,168 @@
+import ustruct
+from micropython import const
+
+from trezor.crypto import hmac, random
+from trezor.crypto.hashlib import sha256
+from trezor.messages import FailureType
+from trezor.messages.SignTx import SignTx
+from trezor.utils import HashWriter, consteq
+
+from apps.common import cache
+from apps.wallet.sign_tx.writers import (
+    get_tx_hash,
+    write_bytes,
+    write_uint32,
+    write_varint,
+)
+
+# version, index of the next input, authorized amount, wallet path length
+_HEADER = "<BIQB"
+_HEADER_SIZE = const(14)
+_VERSION = const(1)
+_DIGEST_SIZE = const(32)
+_MAC_SIZE = const(32)
+# wallet path length of a transaction without a common wallet path
+_NO_WALLET_PATH = const(0xFF)
+
+
+class CheckpointError(ValueError):
+    pass
+
+
+class Digest:
+    """
+    Final digest of a hash that was computed before the checkpoint, it stands
+    in for the HashWriter when the digest is read.
+    """
+
+    def __init__(self, digest: bytes):
+        self.digest = digest
+
+    def get_digest(self) -> bytes:
+        return self.digest
+
+
+class Checkpoint:
+    """
+    Authenticated state of a transaction after phase 1, sent to the host
+    along with every signed input.  The host can start signing again with
+    the last checkpoint it received (see `load`), phase 1 and the signing
+    of the inputs before the checkpoint are then skipped.
+
+    The checkpoints are authenticated by a random key kept in the session
+    cache, they are valid only until the device is locked or restarted.
+    """
+
+    def __init__(
+        self, tx: SignTx, h_first: HashWriter, hash143, segwit: dict, wallet_path: list
+    ):
+        if wallet_path is not None and len(wallet_path) >= _NO_WALLET_PATH:
+            raise CheckpointError(FailureType.DataError, "Wallet path too long")
+        self.wallet_path = wallet_path
+
+        state = bytearray()
+        write_bytes(state, get_tx_params_hash(tx))
+        write_bytes(state, get_tx_hash(h_first))
+        write_bytes(state, get_tx_hash(hash143.h_prevouts))
+        write_bytes(state, get_tx_hash(hash143.h_sequence))
+        write_bytes(state, get_tx_hash(hash143.h_outputs))
+        for n in wallet_path or ():
+            write_uint32(state, n)
+        segwit_bits = bytearray((tx.inputs_count + 7) // 8)
+        for i in range(tx.inputs_count):
+            if segwit[i]:
+                segwit_bits[i // 8] |= 1 << (i % 8)
+        write_bytes(state, segwit_bits)
+        self.state = state
+
+    def dump(self, i_next: int, authorized_in: int) -> bytes:
+        """
+        Checkpoint before the input `i_next`, `authorized_in` is the amount of
+        the segwit inputs authorized in phase 1 that was not spent yet.
+        """
+        if self.wallet_path is None:
+            path_len = _NO_WALLET_PATH
+        else:
+            path_len = len(self.wallet_path)
+        w = bytearray(ustruct.pack(_HEADER, _VERSION, i_next, authorized_in, path_len))
+        write_bytes(w, self.state)
+        write_bytes(w, hmac.new(_get_key(), w, sha256).digest())
+        return w
+
+
+def load(tx: SignTx, data: bytes, hash143) -> tuple:
+    """
+    Verifies the checkpoint of `tx` and restores the state of phase 1 from it.
+    The hashes of `hash143` are replaced by their digests.
+    """
+    if len(data) < _HEADER_SIZE + _MAC_SIZE:
+        raise CheckpointError(FailureType.DataError, "Invalid checkpoint")
+    data = memoryview(data)
+    mac = hmac.new(_get_key(), data[:-_MAC_SIZE], sha256).digest()
+    if not consteq(mac, data[-_MAC_SIZE:]):
+        raise CheckpointError(FailureType.DataError, "Invalid checkpoint")
+
+    version, i_next, authorized_in, path_len = ustruct.unpack_from(_HEADER, data)
+    if path_len == _NO_WALLET_PATH:
+        wallet_path = None
+        path_len = 0
+    else:
+        wallet_path = []
+    size = (
+        _HEADER_SIZE
+        + 5 * _DIGEST_SIZE
+        + 4 * path_len
+        + (tx.inputs_count + 7) // 8
+        + _MAC_SIZE
+    )
+    if version != _VERSION or len(data) != size or i_next > tx.inputs_count:
+        raise CheckpointError(FailureType.DataError, "Invalid checkpoint")
+
+    digests = []
+    ofs = _HEADER_SIZE
+    for _ in range(5):
+        digests.append(bytes(data[ofs : ofs + _DIGEST_SIZE]))
+        ofs += _DIGEST_SIZE
+    if digests[0] != get_tx_params_hash(tx):
+        raise CheckpointError(
+            FailureType.DataError, "Checkpoint of a different transaction"
+        )
+    h_first = Digest(digests[1])
+    hash143.h_prevouts = Digest(digests[2])
+    hash143.h_sequence = Digest(digests[3])
+    hash143.h_outputs = Digest(digests[4])
+
+    for _ in range(path_len):
+        wallet_path.append(ustruct.unpack_from("<I", data, ofs)[0])
+        ofs += 4
+
+    segwit = {}
+    for i in range(tx.inputs_count):
+        segwit[i] = bool(data[ofs + i // 8] & (1 << (i % 8)))
+
+    return h_first, segwit, authorized_in, wallet_path, i_next
+
+
+def get_tx_params_hash(tx: SignTx) -> bytes:
+    h = HashWriter(sha256())
+    write_varint(h, tx.inputs_count)
+    write_varint(h, tx.outputs_count)
+    coin_name = tx.coin_name.encode()
+    write_varint(h, len(coin_name))
+    write_bytes(h, coin_name)
+    write_uint32(h, tx.version)
+    write_uint32(h, tx.lock_time)
+    write_uint32(h, tx.expiry)
+    write_uint32(h, 1 if tx.overwintered else 0)
+    write_uint32(h, tx.version_group_id or 0)
+    write_uint32(h, tx.timestamp)
+    write_uint32(h, tx.branch_id or 0)
+    return h.get_digest()
+
+
+def _get_key() -> bytes:
+    key = cache.get_session_data("sign_tx_checkpoint")
+    if key is None:
+        key = random.bytes(32)
+        cache.set_session_data("sign_tx_checkpoint", key)
+    return key
@@ -1,3 +1,7 @@
+import gc
+from micropython import const
+
+from trezor import wire
 from trezor.messages import InputScriptType
 from trezor.messages.RequestType import (
     TXEXTRADATA,
@@ -16,6 +20,11 @@ from trezor.utils import obj_eq
 
 from apps.common.coininfo import CoinInfo
 
+# largest number of inputs or outputs requested in a single TxRequest
+_BATCH_MAX_SIZE = const(32)
+# free heap required for every input or output of a batch
+_BATCH_ITEM_HEAP = const(2048)
+
 # Machine instructions
 # ===
 
@@ -92,25 +101,115 @@ def request_tx_extra_data(
     return ack.tx.extra_data
 
 
-def request_tx_input(tx_req: TxRequest, i: int, tx_hash: bytes = None):
-    tx_req.request_type = TXINPUT
-    tx_req.details.request_index = i
-    tx_req.details.tx_hash = tx_hash
-    ack = yield tx_req
-    tx_req.serialized = None
-    return sanitize_tx_input(ack.tx)
+class TxBatch:
+    """
+    Inputs or outputs received ahead of time.  If the host negotiated a batch
+    size in SignTx, TxRequest asks for `request_count` consecutive items
+    starting at `request_index` and the host returns all of them in a single
+    TxAck.  The items that were not requested yet are then handed out from
+    here, every one of them only once.
+    """
+
+    def __init__(self, size: int):
+        self.size = min(size, _BATCH_MAX_SIZE)
+        self.request_type = None
+        self.tx_hash = None
+        self.index = 0  # index of the first item in `items`
+        self.items = []
+        self.requested = 1  # number of items asked for by the last TxRequest
+
+    def pop(self, tx_req: TxRequest, request_type: int, tx_hash: bytes, i: int):
+        if tx_req.serialized is not None:
+            # serialized data are sent along with the next TxRequest
+            return None
+        if request_type != self.request_type or tx_hash != self.tx_hash:
+            return None
+        k = i - self.index
+        if k < 0 or k >= len(self.items):
+            return None
+        item = self.items[k]
+        self.items[k] = None
+        return item
+
+    def push(self, request_type: int, tx_hash: bytes, i: int, items: list):
+        self.request_type = request_type
+        self.tx_hash = tx_hash
+        self.index = i
+        self.items = items
+        items[0] = None  # handed out right away
+
+    def clear(self):
+        self.request_type = None
+        self.items = []
+
+    def request_count(self, i: int, count: int) -> int:
+        n = min(self.size, count - i, gc.mem_free() // _BATCH_ITEM_HEAP)
+        return n if n > 1 else 1
+
+
+def request_tx_input(
+    tx_req: TxRequest,
+    i: int,
+    tx_hash: bytes = None,
+    batch: TxBatch = None,
+    count: int = 0,
+):
+    txi = batch.pop(tx_req, TXINPUT, tx_hash, i) if batch is not None else None
+    if txi is None:
+        items = yield from request_tx_items(tx_req, TXINPUT, i, tx_hash, batch, count)
+        txi = items[0]
+        if batch is not None:
+            batch.push(TXINPUT, tx_hash, i, items)
+    return sanitize_tx_input(txi)
+
+
+def request_tx_output(
+    tx_req: TxRequest,
+    i: int,
+    tx_hash: bytes = None,
+    batch: TxBatch = None,
+    count: int = 0,
+):
+    txo = batch.pop(tx_req, TXOUTPUT, tx_hash, i) if batch is not None else None
+    if txo is None:
+        items = yield from request_tx_items(tx_req, TXOUTPUT, i, tx_hash, batch, count)
+        txo = items[0]
+        if batch is not None:
+            batch.push(TXOUTPUT, tx_hash, i, items)
+    if tx_hash is None:
+        return sanitize_tx_output(txo)
+    else:
+        return sanitize_tx_binoutput(txo)
 
 
-def request_tx_output(tx_req: TxRequest, i: int, tx_hash: bytes = None):
-    tx_req.request_type = TXOUTPUT
+def request_tx_items(
+    tx_req: TxRequest,
+    request_type: int,
+    i: int,
+    tx_hash: bytes,
+    batch: TxBatch,
+    count: int,
+):
+    tx_req.request_type = request_type
     tx_req.details.request_index = i
     tx_req.details.tx_hash = tx_hash
+    if batch is not None and batch.size > 1:
+        batch.clear()  # release the previous batch before receiving the next
+        batch.requested = batch.request_count(i, count)
+        if batch.requested > 1:
+            tx_req.details.request_count = batch.requested
     ack = yield tx_req
     tx_req.serialized = None
-    if tx_hash is None:
-        return sanitize_tx_output(ack.tx)
+    tx_req.details.request_count = None
+    if request_type == TXINPUT:
+        items = ack.tx.inputs
+    elif tx_hash is None:
+        items = ack.tx.outputs
     else:
-        return sanitize_tx_binoutput(ack.tx)
+        items = ack.tx.bin_outputs
+    if batch is not None and len(items) > batch.requested:
+        raise wire.DataError("Too many inputs or outputs")
+    return items
 
 
 def request_tx_finish(tx_req: TxRequest):
@@ -133,6 +232,9 @@ def sanitize_sign_tx(tx: SignTx) -> SignTx:
     tx.expiry = tx.expiry if tx.expiry is not None else 0
     tx.overwintered = tx.overwintered if tx.overwintered is not None else False
     tx.timestamp = tx.timestamp if tx.timestamp is not None else 0
+    tx.batch_size = tx.batch_size if tx.batch_size is not None else 1
+    tx.checkpoints = tx.checkpoints if tx.checkpoints is not None else False
+    tx.legacy_cache = tx.legacy_cache if tx.legacy_cache is not None else False
     return tx
 
 
@@ -148,8 +250,7 @@ def sanitize_tx_meta(tx: TransactionType) -> TransactionType:
     return tx
 
 
-def sanitize_tx_input(tx: TransactionType) -> TxInputType:
-    txi = tx.inputs[0]
+def sanitize_tx_input(txi: TxInputType) -> TxInputType:
     if txi.script_type is None:
         txi.script_type = InputScriptType.SPENDADDRESS
     if txi.sequence is None:
@@ -157,9 +258,9 @@ def sanitize_tx_input(tx: TransactionType) -> TxInputType:
     return txi
 
 
-def sanitize_tx_output(tx: TransactionType) -> TxOutputType:
-    return tx.outputs[0]
+def sanitize_tx_output(txo: TxOutputType) -> TxOutputType:
+    return txo
 
 
-def sanitize_tx_binoutput(tx: TransactionType) -> TxOutputBinType:
-    return tx.bin_outputs[0]
+def sanitize_tx_binoutput(txo_bin: TxOutputBinType) -> TxOutputBinType:
+    return txo_bin
@@ -0,0 +1,113 @@
+from micropython import const
+
+from trezor.crypto.hashlib import sha256
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.utils import HashWriter
+
+from apps.common.coininfo import CoinInfo
+from apps.wallet.sign_tx import zcash
+from apps.wallet.sign_tx.writers import (
+    empty_bytearray,
+    get_tx_hash,
+    write_bytes,
+    write_bytes_reversed,
+    write_tx_input,
+    write_tx_input_check,
+    write_tx_output,
+    write_uint8,
+    write_uint32,
+    write_varint,
+)
+
+# size of one input serialized with an empty scriptSig
+_INPUT_SIZE = const(32 + 4 + 1 + 4)
+# size of the check digest kept for every input
+_CHECK_SIZE = const(32)
+# expected size of one serialized output (amount + p2wsh script)
+_OUTPUT_SIZE = const(8 + 1 + 34)
+
+
+def estimate_size(inputs_count: int, outputs_count: int) -> int:
+    return inputs_count * (_INPUT_SIZE + _CHECK_SIZE) + outputs_count * _OUTPUT_SIZE
+
+
+class LegacyPreimage:
+    """
+    Serialized parts of the legacy sighash preimage that are the same for all
+    signed inputs: every input with an empty scriptSig and every output.
+    The preimage of input `i` is then hashed from the cached data, only the
+    scriptSig of input `i` itself differs.
+
+    Each cached input is accompanied by the digest of its check serialization
+    (see `write_tx_input_check`), so the input re-requested for signing can
+    be matched against the one streamed in the verified pass.
+    """
+
+    def __init__(self, tx: SignTx):
+        self.inputs = empty_bytearray(tx.inputs_count * _INPUT_SIZE)
+        self.input_offsets = [0]
+        self.input_checks = empty_bytearray(tx.inputs_count * _CHECK_SIZE)
+        self.outputs = empty_bytearray(tx.outputs_count * _OUTPUT_SIZE)
+        self.complete = False
+
+    def add_input(self, txi: TxInputType):
+        w = self.inputs
+        write_bytes_reversed(w, txi.prev_hash)
+        write_uint32(w, txi.prev_index)
+        write_uint8(w, 0)  # empty scriptSig
+        write_uint32(w, txi.sequence)
+        self.input_offsets.append(len(w))
+        self.input_checks.extend(get_input_check(txi))
+
+    def add_output(self, txo_bin: TxOutputBinType):
+        write_tx_output(self.outputs, txo_bin)
+
+    def check_input(self, i: int, txi: TxInputType) -> bool:
+        ofs = i * _CHECK_SIZE
+        return self.input_checks[ofs : ofs + _CHECK_SIZE] == get_input_check(txi)
+
+    def preimage_hash(
+        self,
+        coin: CoinInfo,
+        tx: SignTx,
+        i_sign: int,
+        txi_sign: TxInputType,
+        sighash: int,
+    ) -> bytes:
+        h_sign = HashWriter(sha256())
+
+        if tx.overwintered:
+            write_uint32(
+                h_sign, tx.version | zcash.OVERWINTERED
+            )  # nVersion | fOverwintered
+            write_uint32(h_sign, tx.version_group_id)  # nVersionGroupId
+        else:
+            write_uint32(h_sign, tx.version)  # nVersion
+            if tx.timestamp:
+                write_uint32(h_sign, tx.timestamp)
+
+        inputs = memoryview(self.inputs)
+        write_varint(h_sign, tx.inputs_count)
+        write_bytes(h_sign, inputs[: self.input_offsets[i_sign]])
+        write_tx_input(h_sign, txi_sign)
+        write_bytes(h_sign, inputs[self.input_offsets[i_sign + 1] :])
+
+        write_varint(h_sign, tx.outputs_count)
+        write_bytes(h_sign, self.outputs)
+
+        write_uint32(h_sign, tx.lock_time)
+        if tx.overwintered:
+            write_uint32(h_sign, tx.expiry)  # expiryHeight
+            write_varint(h_sign, 0)  # nJoinSplit
+
+        write_uint32(h_sign, sighash)
+
+        return get_tx_hash(h_sign, double=coin.sign_hash_double)
+
+
+def get_input_check(txi: TxInputType) -> bytes:
+    h_check = HashWriter(sha256())
+    write_tx_input_check(h_check, txi)
+    return h_check.get_digest()
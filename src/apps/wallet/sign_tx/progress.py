@@ -12,9 +12,9 @@ def init(inputs, outputs):
     report()
 
 
-def advance():
+def advance(steps: int = 1):
     global _progress
-    _progress += 1
+    _progress += steps
     report()
 
 
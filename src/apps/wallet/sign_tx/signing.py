@@ -16,8 +16,10 @@ from trezor.messages.TxRequestSerializedType import TxRequestSerializedType
 from apps.common import address_type, coininfo, coins, seed
 from apps.wallet.sign_tx import (
     addresses,
+    checkpoint,
     decred,
     helpers,
+    legacy,
     multisig,
     progress,
     scripts,
@@ -37,11 +39,46 @@ _BIP32_CHANGE_CHAIN = const(1)
 # use and still allow to quickly brute-force the correct bip32 path
 _BIP32_MAX_LAST_ELEMENT = const(1000000)
 
+# the maximum memory used to cache the constant parts of the legacy sighash
+# preimage, larger transactions stream all inputs and outputs for every input
+_LEGACY_PREIMAGE_MAX_SIZE = const(32 * 1024)
+
+# the number of previous transactions with cached output amounts, and the
+# maximum number of outputs of a previous transaction to be cached
+_PREVTX_CACHE_SIZE = const(4)
+_PREVTX_CACHE_MAX_OUTPUTS = const(256)
+
 
 class SigningError(ValueError):
     pass
 
 
+class PrevTxCache:
+    """
+    Output amounts of already verified previous transactions, keyed by their
+    hash.  Lives for one signing session, so that a previous transaction
+    spent by several inputs is streamed and hashed only once.  Outputs that
+    cannot be spent are stored as None.
+    """
+
+    def __init__(self):
+        self.amounts = {}  # prev_hash -> list of output amounts
+        self.lru = []  # keys of self.amounts, most recently used last
+
+    def get(self, prev_hash: bytes) -> list:
+        amounts = self.amounts.get(prev_hash)
+        if amounts is not None:
+            self.lru.remove(prev_hash)
+            self.lru.append(prev_hash)
+        return amounts
+
+    def add(self, prev_hash: bytes, amounts: list):
+        if len(self.lru) >= _PREVTX_CACHE_SIZE:
+            del self.amounts[self.lru.pop(0)]
+        self.amounts[prev_hash] = amounts
+        self.lru.append(prev_hash)
+
+
 # Transaction signing
 # ===
 # see https://github.com/trezor/trezor-mcu/blob/master/firmware/signing.c#L84
@@ -53,33 +90,18 @@ class SigningError(ValueError):
 # - check inputs, previous transactions, and outputs
 # - ask for confirmations
 # - check fee
-async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
-    coin = coins.by_name(tx.coin_name)
-
+async def check_tx_fee(tx: SignTx, keychain: seed.Keychain, coin: coininfo.CoinInfo):
     # h_first is used to make sure the inputs and outputs streamed in Phase 1
     # are the same as in Phase 2.  it is thus not required to fully hash the
     # tx, as the SignTx info is streamed only once
     h_first = utils.HashWriter(sha256())  # not a real tx hash
 
+    hash143 = get_hash143(coin, tx)
     if coin.decred:
-        hash143 = decred.DecredPrefixHasher(tx)  # pseudo BIP-0143 prefix hashing
         tx_ser = TxRequestSerializedType()
-    elif tx.overwintered:
-        if tx.version == 3:
-            branch_id = tx.branch_id or 0x5BA81B19  # Overwinter
-            hash143 = zcash.Zip143(branch_id)  # ZIP-0143 transaction hashing
-        elif tx.version == 4:
-            branch_id = tx.branch_id or 0x76B809BB  # Sapling
-            hash143 = zcash.Zip243(branch_id)  # ZIP-0243 transaction hashing
-        else:
-            raise SigningError(
-                FailureType.DataError,
-                "Unsupported version for overwintered transaction",
-            )
-    else:
-        hash143 = segwit_bip143.Bip143()  # BIP-0143 transaction hashing
 
     multifp = multisig.MultisigFingerprint()  # control checksum of multisig inputs
+    prevtx_cache = PrevTxCache()  # verified amounts of previous transactions
     weight = tx_weight.TxWeightCalculator(tx.inputs_count, tx.outputs_count)
 
     total_in = 0  # sum of input amounts
@@ -94,10 +116,16 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
     tx_req = TxRequest()
     tx_req.details = TxRequestDetailsType()
 
+    # decred serializes every input and output right away, it cannot batch them
+    batch = helpers.TxBatch(tx.batch_size) if not coin.decred else None
+    prevtx_batch = helpers.TxBatch(tx.batch_size)
+
     for i in range(tx.inputs_count):
         progress.advance()
         # STAGE_REQUEST_1_INPUT
-        txi = await helpers.request_tx_input(tx_req, i)
+        txi = await helpers.request_tx_input(
+            tx_req, i, batch=batch, count=tx.inputs_count
+        )
         wallet_path = input_extract_wallet_path(txi, wallet_path)
         writers.write_tx_input_check(h_first, txi)
         weight.add_input(txi)
@@ -139,7 +167,12 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
             else:
                 segwit[i] = False
                 total_in += await get_prevtx_output_value(
-                    coin, tx_req, txi.prev_hash, txi.prev_index
+                    coin,
+                    tx_req,
+                    txi.prev_hash,
+                    txi.prev_index,
+                    prevtx_cache,
+                    prevtx_batch,
                 )
 
         else:
@@ -158,7 +191,9 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
 
     for o in range(tx.outputs_count):
         # STAGE_REQUEST_3_OUTPUT
-        txo = await helpers.request_tx_output(tx_req, o)
+        txo = await helpers.request_tx_output(
+            tx_req, o, batch=batch, count=tx.outputs_count
+        )
         txo_bin.amount = txo.amount
         txo_bin.script_pubkey = output_derive_script(txo, coin, keychain)
         weight.add_output(txo_bin.script_pubkey)
@@ -209,33 +244,81 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
     return h_first, hash143, segwit, total_in, wallet_path
 
 
-async def sign_tx(tx: SignTx, keychain: seed.Keychain):
+def get_hash143(coin: coininfo.CoinInfo, tx: SignTx):
+    if coin.decred:
+        return decred.DecredPrefixHasher(tx)  # pseudo BIP-0143 prefix hashing
+    elif tx.overwintered:
+        if tx.version == 3:
+            branch_id = tx.branch_id or 0x5BA81B19  # Overwinter
+            return zcash.Zip143(branch_id)  # ZIP-0143 transaction hashing
+        elif tx.version == 4:
+            branch_id = tx.branch_id or 0x76B809BB  # Sapling
+            return zcash.Zip243(branch_id)  # ZIP-0243 transaction hashing
+        else:
+            raise SigningError(
+                FailureType.DataError,
+                "Unsupported version for overwintered transaction",
+            )
+    else:
+        return segwit_bip143.Bip143()  # BIP-0143 transaction hashing
+
+
+async def sign_tx(tx: SignTx, keychain: seed.Keychain, coin: coininfo.CoinInfo = None):
     tx = helpers.sanitize_sign_tx(tx)
+    if coin is None:
+        coin = coins.by_name(tx.coin_name)
 
     progress.init(tx.inputs_count, tx.outputs_count)
 
-    # Phase 1
+    if tx.checkpoint is not None:
+        # resume signing from the checkpoint the host received the last time
+        if coin.decred:
+            raise SigningError(
+                FailureType.DataError, "Checkpoints are not supported for Decred"
+            )
+        hash143 = get_hash143(coin, tx)
+        h_first, segwit, authorized_in, wallet_path, i_start = checkpoint.load(
+            tx, tx.checkpoint, hash143
+        )
+        progress.advance(tx.inputs_count + i_start)
 
-    h_first, hash143, segwit, authorized_in, wallet_path = await check_tx_fee(
-        tx, keychain
-    )
+    else:
+        # Phase 1
+
+        h_first, hash143, segwit, authorized_in, wallet_path = await check_tx_fee(
+            tx, keychain, coin
+        )
+        i_start = 0
 
     # Phase 2
     # - sign inputs
     # - check that nothing changed
 
-    coin = coins.by_name(tx.coin_name)
     tx_ser = TxRequestSerializedType()
 
+    if tx.checkpoints and not coin.decred:
+        tx_checkpoint = checkpoint.Checkpoint(tx, h_first, hash143, segwit, wallet_path)
+    else:
+        tx_checkpoint = None
+
     txo_bin = TxOutputBinType()
     tx_req = TxRequest()
     tx_req.details = TxRequestDetailsType()
     tx_req.serialized = None
 
+    # only the inputs and outputs streamed for the legacy sighash are batched,
+    # the other requests carry serialized data with them
+    batch = helpers.TxBatch(tx.batch_size)
+
     if coin.decred:
         prefix_hash = hash143.prefix_hash()
 
-    for i_sign in range(tx.inputs_count):
+    # constant parts of the legacy sighash preimage, streamed and checked once
+    # while signing the first legacy input if the host opted in by
+    # SignTx.legacy_cache, the later legacy inputs are then requested alone
+    legacy_cache = None
+
+    for i_sign in range(i_start, tx.inputs_count):
         progress.advance()
         txi_sign = None
         key_sign = None
@@ -379,87 +462,107 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
             tx_req.serialized = tx_ser
 
         else:
-            # hash of what we are signing with this input
-            h_sign = utils.HashWriter(sha256())
-            # same as h_first, checked before signing the digest
-            h_second = utils.HashWriter(sha256())
-
-            if tx.overwintered:
-                writers.write_uint32(
-                    h_sign, tx.version | zcash.OVERWINTERED
-                )  # nVersion | fOverwintered
-                writers.write_uint32(h_sign, tx.version_group_id)  # nVersionGroupId
+            if legacy_cache is None and tx.legacy_cache:
+                legacy_size = legacy.estimate_size(tx.inputs_count, tx.outputs_count)
+                if legacy_size <= _LEGACY_PREIMAGE_MAX_SIZE:
+                    legacy_cache = legacy.LegacyPreimage(tx)
+
+            if legacy_cache is not None and legacy_cache.complete:
+                # STAGE_REQUEST_4_INPUT
+                # the rest of the preimage was streamed and checked while
+                # signing the first legacy input, only this input is requested
+                txi_sign = await helpers.request_tx_input(tx_req, i_sign)
+                input_check_wallet_path(txi_sign, wallet_path)
+                if not legacy_cache.check_input(i_sign, txi_sign):
+                    raise SigningError(
+                        FailureType.ProcessError,
+                        "Transaction has changed during signing",
+                    )
+                key_sign = keychain.derive(txi_sign.address_n, coin.curve_name)
+                key_sign_pub = key_sign.public_key()
+                txi_sign.script_sig = input_derive_script_code(
+                    coin, txi_sign, key_sign_pub
+                )
+                tx_digest = legacy_cache.preimage_hash(
+                    coin, tx, i_sign, txi_sign, get_hash_type(coin)
+                )
+
             else:
-                writers.write_uint32(h_sign, tx.version)  # nVersion
-                if tx.timestamp:
-                    writers.write_uint32(h_sign, tx.timestamp)
+                # hash of what we are signing with this input
+                h_sign = utils.HashWriter(sha256())
+                # same as h_first, checked before signing the digest
+                h_second = utils.HashWriter(sha256())
+
+                if tx.overwintered:
+                    writers.write_uint32(
+                        h_sign, tx.version | zcash.OVERWINTERED
+                    )  # nVersion | fOverwintered
+                    writers.write_uint32(h_sign, tx.version_group_id)  # nVersionGroupId
+                else:
+                    writers.write_uint32(h_sign, tx.version)  # nVersion
+                    if tx.timestamp:
+                        writers.write_uint32(h_sign, tx.timestamp)
 
-            writers.write_varint(h_sign, tx.inputs_count)
+                writers.write_varint(h_sign, tx.inputs_count)
 
-            for i in range(tx.inputs_count):
-                # STAGE_REQUEST_4_INPUT
-                txi = await helpers.request_tx_input(tx_req, i)
-                input_check_wallet_path(txi, wallet_path)
-                writers.write_tx_input_check(h_second, txi)
-                if i == i_sign:
-                    txi_sign = txi
-                    key_sign = keychain.derive(txi.address_n, coin.curve_name)
-                    key_sign_pub = key_sign.public_key()
-                    # for the signing process the script_sig is equal
-                    # to the previous tx's scriptPubKey (P2PKH) or a redeem script (P2SH)
-                    if txi_sign.script_type == InputScriptType.SPENDMULTISIG:
-                        txi_sign.script_sig = scripts.output_script_multisig(
-                            multisig.multisig_get_pubkeys(txi_sign.multisig),
-                            txi_sign.multisig.m,
-                        )
-                    elif txi_sign.script_type == InputScriptType.SPENDADDRESS:
-                        txi_sign.script_sig = scripts.output_script_p2pkh(
-                            addresses.ecdsa_hash_pubkey(key_sign_pub, coin)
+                for i in range(tx.inputs_count):
+                    # STAGE_REQUEST_4_INPUT
+                    txi = await helpers.request_tx_input(
+                        tx_req, i, batch=batch, count=tx.inputs_count
+                    )
+                    input_check_wallet_path(txi, wallet_path)
+                    writers.write_tx_input_check(h_second, txi)
+                    if legacy_cache is not None:
+                        legacy_cache.add_input(txi)
+                    if i == i_sign:
+                        txi_sign = txi
+                        key_sign = keychain.derive(txi.address_n, coin.curve_name)
+                        key_sign_pub = key_sign.public_key()
+                        txi_sign.script_sig = input_derive_script_code(
+                            coin, txi_sign, key_sign_pub
                         )
-                        if coin.bip115:
-                            txi_sign.script_sig += scripts.script_replay_protection_bip115(
-                                txi_sign.prev_block_hash_bip115,
-                                txi_sign.prev_block_height_bip115,
-                            )
                     else:
-                        raise SigningError(
-                            FailureType.ProcessError, "Unknown transaction type"
-                        )
-                else:
-                    txi.script_sig = bytes()
-                writers.write_tx_input(h_sign, txi)
-
-            writers.write_varint(h_sign, tx.outputs_count)
+                        txi.script_sig = bytes()
+                    writers.write_tx_input(h_sign, txi)
 
-            for o in range(tx.outputs_count):
-                # STAGE_REQUEST_4_OUTPUT
-                txo = await helpers.request_tx_output(tx_req, o)
-                txo_bin.amount = txo.amount
-                txo_bin.script_pubkey = output_derive_script(txo, coin, keychain)
-                writers.write_tx_output(h_second, txo_bin)
-                writers.write_tx_output(h_sign, txo_bin)
+                writers.write_varint(h_sign, tx.outputs_count)
 
-            writers.write_uint32(h_sign, tx.lock_time)
-            if tx.overwintered:
-                writers.write_uint32(h_sign, tx.expiry)  # expiryHeight
-                writers.write_varint(h_sign, 0)  # nJoinSplit
+                for o in range(tx.outputs_count):
+                    # STAGE_REQUEST_4_OUTPUT
+                    txo = await helpers.request_tx_output(
+                        tx_req, o, batch=batch, count=tx.outputs_count
+                    )
+                    txo_bin.amount = txo.amount
+                    txo_bin.script_pubkey = output_derive_script(txo, coin, keychain)
+                    writers.write_tx_output(h_second, txo_bin)
+                    writers.write_tx_output(h_sign, txo_bin)
+                    if legacy_cache is not None:
+                        legacy_cache.add_output(txo_bin)
+
+                writers.write_uint32(h_sign, tx.lock_time)
+                if tx.overwintered:
+                    writers.write_uint32(h_sign, tx.expiry)  # expiryHeight
+                    writers.write_varint(h_sign, 0)  # nJoinSplit
+
+                writers.write_uint32(h_sign, get_hash_type(coin))
+
+                # check the control digests
+                if writers.get_tx_hash(h_first, False) != writers.get_tx_hash(h_second):
+                    raise SigningError(
+                        FailureType.ProcessError,
+                        "Transaction has changed during signing",
+                    )
+                if legacy_cache is not None:
+                    legacy_cache.complete = True
 
-            writers.write_uint32(h_sign, get_hash_type(coin))
-
-            # check the control digests
-            if writers.get_tx_hash(h_first, False) != writers.get_tx_hash(h_second):
-                raise SigningError(
-                    FailureType.ProcessError, "Transaction has changed during signing"
-                )
+                tx_digest = writers.get_tx_hash(h_sign, double=coin.sign_hash_double)
 
             # if multisig, check if signing with a key that is included in multisig
             if txi_sign.multisig:
                 multisig.multisig_pubkey_index(txi_sign.multisig, key_sign_pub)
 
             # compute the signature from the tx digest
-            signature = ecdsa_sign(
-                key_sign, writers.get_tx_hash(h_sign, double=coin.sign_hash_double)
-            )
+            signature = ecdsa_sign(key_sign, tx_digest)
             tx_ser.signature_index = i_sign
             tx_ser.signature = signature
 
@@ -477,6 +580,9 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
 
             tx_req.serialized = tx_ser
 
+        if tx_checkpoint is not None:
+            tx_ser.checkpoint = tx_checkpoint.dump(i_sign + 1, authorized_in)
+
     if coin.decred:
         return await helpers.request_tx_finish(tx_req)
 
@@ -496,6 +602,7 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
         tx_ser.signature_index = None
         tx_ser.signature = None
         tx_ser.serialized_tx = w_txo_bin
+        tx_ser.checkpoint = None
 
         tx_req.serialized = tx_ser
 
@@ -570,13 +677,36 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
 
 
 async def get_prevtx_output_value(
-    coin: coininfo.CoinInfo, tx_req: TxRequest, prev_hash: bytes, prev_index: int
+    coin: coininfo.CoinInfo,
+    tx_req: TxRequest,
+    prev_hash: bytes,
+    prev_index: int,
+    prevtx_cache: PrevTxCache = None,
+    batch: helpers.TxBatch = None,
 ) -> int:
+    if prevtx_cache is not None:
+        amounts = prevtx_cache.get(bytes(prev_hash))
+        if amounts is not None:
+            if prev_index >= len(amounts):
+                return 0
+            if amounts[prev_index] is None:
+                raise SigningError(
+                    FailureType.ProcessError,
+                    "Cannot use utxo that has script_version != 0",
+                )
+            return amounts[prev_index]
+
     total_out = 0  # sum of output amounts
 
     # STAGE_REQUEST_2_PREV_META
     tx = await helpers.request_tx_meta(tx_req, prev_hash)
 
+    # amounts of all outputs, cached once the tx hash is verified
+    if prevtx_cache is not None and tx.outputs_cnt <= _PREVTX_CACHE_MAX_OUTPUTS:
+        amounts = []
+    else:
+        amounts = None
+
     if coin.decred:
         txh = utils.HashWriter(blake256())
     else:
@@ -598,7 +728,7 @@ async def get_prevtx_output_value(
 
     for i in range(tx.inputs_cnt):
         # STAGE_REQUEST_2_PREV_INPUT
-        txi = await helpers.request_tx_input(tx_req, i, prev_hash)
+        txi = await helpers.request_tx_input(tx_req, i, prev_hash, batch, tx.inputs_cnt)
         if coin.decred:
             writers.write_tx_input_decred(txh, txi)
         else:
@@ -608,15 +738,20 @@ async def get_prevtx_output_value(
 
     for o in range(tx.outputs_cnt):
         # STAGE_REQUEST_2_PREV_OUTPUT
-        txo_bin = await helpers.request_tx_output(tx_req, o, prev_hash)
+        txo_bin = await helpers.request_tx_output(
+            tx_req, o, prev_hash, batch, tx.outputs_cnt
+        )
         writers.write_tx_output(txh, txo_bin)
+        spendable = not (
+            coin.decred
+            and txo_bin.decred_script_version is not None
+            and txo_bin.decred_script_version != 0
+        )
+        if amounts is not None:
+            amounts.append(txo_bin.amount if spendable else None)
         if o == prev_index:
             total_out += txo_bin.amount
-            if (
-                coin.decred
-                and txo_bin.decred_script_version is not None
-                and txo_bin.decred_script_version != 0
-            ):
+            if not spendable:
                 raise SigningError(
                     FailureType.ProcessError,
                     "Cannot use utxo that has script_version != 0",
@@ -640,6 +775,9 @@ async def get_prevtx_output_value(
     ):
         raise SigningError(FailureType.ProcessError, "Encountered invalid prev_hash")
 
+    if amounts is not None:
+        prevtx_cache.add(bytes(prev_hash), amounts)
+
     return total_out
 
 
@@ -830,6 +968,28 @@ def input_derive_script(
         raise SigningError(FailureType.ProcessError, "Invalid script type")
 
 
+def input_derive_script_code(
+    coin: coininfo.CoinInfo, i: TxInputType, pubkey: bytes
+) -> bytes:
+    # for the signing process the script_sig is equal
+    # to the previous tx's scriptPubKey (P2PKH) or a redeem script (P2SH)
+    if i.script_type == InputScriptType.SPENDMULTISIG:
+        return scripts.output_script_multisig(
+            multisig.multisig_get_pubkeys(i.multisig), i.multisig.m
+        )
+    elif i.script_type == InputScriptType.SPENDADDRESS:
+        script_code = scripts.output_script_p2pkh(
+            addresses.ecdsa_hash_pubkey(pubkey, coin)
+        )
+        if coin.bip115:
+            script_code += scripts.script_replay_protection_bip115(
+                i.prev_block_hash_bip115, i.prev_block_height_bip115
+            )
+        return script_code
+    else:
+        raise SigningError(FailureType.ProcessError, "Unknown transaction type")
+
+
 def input_is_segwit(i: TxInputType) -> bool:
     return (
         i.script_type == InputScriptType.SPENDWITNESS
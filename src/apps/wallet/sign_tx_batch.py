@@ -0,0 +1,50 @@
+import utime
+from micropython import const
+
+from trezor import log, wire
+from trezor.messages.MessageType import SignTx
+
+from apps.common import coins
+from apps.wallet.sign_tx import sign_tx
+
+_MAX_COUNT = const(100)  # maximum number of transactions in one batch
+
+
+async def sign_tx_batch(ctx, msg, keychain):
+    """
+    Signs `msg.count` independent transactions in a single workflow, the
+    keychain, the coin and the signing modules are set up only once.  Each
+    transaction is confirmed and streamed exactly as in SignTx, the TxRequest
+    finishing a transaction is answered by SignTx of the next one.
+    """
+    count = msg.count or 0
+    if count < 1 or count > _MAX_COUNT:
+        raise wire.DataError("Invalid transaction count")
+    if msg.tx is None:
+        raise wire.DataError("Missing transaction")
+
+    tx = msg.tx
+    coin_name = tx.coin_name or "Bitcoin"
+    coin = coins.by_name(coin_name)
+
+    if __debug__:
+        start = utime.ticks_ms()
+
+    for i in range(count):
+        if (tx.coin_name or "Bitcoin") != coin_name:
+            raise wire.DataError("All transactions must be of the same coin")
+        res = await sign_tx(ctx, tx, keychain, coin)
+        if i < count - 1:
+            tx = await ctx.call(res, SignTx)
+
+    if __debug__:
+        elapsed = utime.ticks_diff(utime.ticks_ms(), start)
+        log.debug(
+            __name__,
+            "%d transactions in %d ms, %d per minute",
+            count,
+            elapsed,
+            count * 60000 // max(elapsed, 1),
+        )
+
+    return res
@@ -8,18 +8,9 @@ import usb
 
 from trezor import loop, wire, workflow, utils
 
-# load applications
+# load applications, the rest of them is imported on their first message
 import apps.homescreen
-import apps.management
-import apps.wallet
-import apps.ethereum
-import apps.lisk
-import apps.monero
-import apps.nem
-import apps.stellar
-import apps.ripple
-import apps.cardano
-import apps.tezos
+import apps.registry
 
 if __debug__:
     import apps.debug
@@ -28,16 +19,7 @@ else:
 
 # boot applications
 apps.homescreen.boot()
-apps.management.boot()
-apps.wallet.boot()
-apps.ethereum.boot()
-apps.lisk.boot()
-apps.monero.boot()
-apps.nem.boot()
-apps.stellar.boot()
-apps.ripple.boot()
-apps.cardano.boot()
-apps.tezos.boot()
+apps.registry.boot()
 if __debug__:
     apps.debug.boot()
 else:
@@ -10,6 +10,18 @@ interface is required:
 >>>         """
 >>>         Reads `len(buffer)` bytes into `buffer`, or raises `EOFError`.
 >>>         """
+>>>
+>>>     async def readinto_view(self, buffer, offset, nbytes):
+>>>         """
+>>>         Optional.  Reads `nbytes` bytes into `buffer` at `offset`, or raises
+>>>         `EOFError`.
+>>>         """
+>>>
+>>>     def readbyte(self):
+>>>         """
+>>>         Optional.  Returns the next byte if it is already buffered, without
+>>>         waiting, or -1 otherwise.
+>>>         """
 
 For serializing (dumping) protobuf types, object with `AsyncWriter` interface is
 required:
@@ -23,17 +35,25 @@ required:
 
 from micropython import const
 
+from trezor import utils
+
 _UVARINT_BUFFER = bytearray(1)
 
 
-async def load_uvarint(reader):
+async def load_uvarint(reader, readbyte=None):
     buffer = _UVARINT_BUFFER
     result = 0
     shift = 0
     byte = 0x80
     while byte & 0x80:
-        await reader.areadinto(buffer)
-        byte = buffer[0]
+        if readbyte is not None:
+            # decode from the data the reader has already buffered, if any
+            byte = readbyte()
+        else:
+            byte = -1
+        if byte < 0:
+            await reader.areadinto(buffer)
+            byte = buffer[0]
         result += (byte & 0x7F) << shift
         shift += 7
     return result
@@ -51,6 +71,19 @@ async def dump_uvarint(writer, n):
         n = shifted
 
 
+def _write_uvarint(buf, ofs, n):
+    """Encode `n` into `buf` at `ofs` and return the offset after it."""
+    if n < 0:
+        raise ValueError("Cannot dump signed value, convert it to unsigned first.")
+    shifted = True
+    while shifted:
+        shifted = n >> 7
+        buf[ofs] = (n & 0x7F) | (0x80 if shifted else 0x00)
+        ofs += 1
+        n = shifted
+    return ofs
+
+
 def count_uvarint(n):
     if n < 0:
         raise ValueError("Cannot dump signed value, convert it to unsigned first.")
@@ -152,6 +185,15 @@ class LimitedReader:
     def __init__(self, reader, limit):
         self.reader = reader
         self.limit = limit
+        self.readbyte_inner = getattr(reader, "readbyte", None)
+
+    def readbyte(self):
+        if self.limit <= 0 or self.readbyte_inner is None:
+            return -1
+        byte = self.readbyte_inner()
+        if byte >= 0:
+            self.limit -= 1
+        return byte
 
     async def areadinto(self, buf):
         if self.limit < len(buf):
@@ -161,6 +203,14 @@ class LimitedReader:
             self.limit -= nread
             return nread
 
+    async def readinto_view(self, buf, ofs, nbytes):
+        if self.limit < nbytes:
+            raise EOFError
+        else:
+            nread = await self.reader.readinto_view(buf, ofs, nbytes)
+            self.limit -= nread
+            return nread
+
 
 class CountingWriter:
     def __init__(self):
@@ -174,55 +224,100 @@ class CountingWriter:
 
 FLAG_REPEATED = const(1)
 
+# field kinds, resolved once per field type in `get_field_table`
+_KIND_UVARINT = const(0)
+_KIND_SVARINT = const(1)
+_KIND_BOOL = const(2)
+_KIND_BYTES = const(3)
+_KIND_UNICODE = const(4)
+_KIND_MESSAGE = const(5)
+
+
+def get_field_table(msg_type):
+    """
+    Return the compiled field table of `msg_type`, as a tuple of
+    `(msg_type, fields_by_tag, fields)`.  Every field entry is a tuple of
+    `(ftag, fname, ftype, fflags, fkind, fkey)`, where `fkey` is the encoded
+    field key.  The table is built on first use and cached on the class, so it
+    gets collected together with the message module.
+    """
+    table = getattr(msg_type, "_field_table", None)
+    if table is not None and table[0] is msg_type:
+        return table
+
+    by_tag = {}
+    entries = []
+    fields = msg_type.get_fields()
+    for ftag in fields:
+        fname, ftype, fflags = fields[ftag]
+        if ftype is UVarintType:
+            fkind = _KIND_UVARINT
+        elif ftype is SVarintType:
+            fkind = _KIND_SVARINT
+        elif ftype is BoolType:
+            fkind = _KIND_BOOL
+        elif ftype is BytesType:
+            fkind = _KIND_BYTES
+        elif ftype is UnicodeType:
+            fkind = _KIND_UNICODE
+        elif issubclass(ftype, MessageType):
+            fkind = _KIND_MESSAGE
+        else:
+            raise TypeError  # field type is unknown
+        entry = (ftag, fname, ftype, fflags, fkind, (ftag << 3) | ftype.WIRE_TYPE)
+        by_tag[ftag] = entry
+        entries.append(entry)
+
+    table = (msg_type, by_tag, tuple(entries))
+    msg_type._field_table = table
+    return table
+
 
 async def load_message(reader, msg_type):
-    fields = msg_type.get_fields()
+    _, fields, entries = get_field_table(msg_type)
+    readbyte = getattr(reader, "readbyte", None)
     msg = msg_type()
 
     while True:
         try:
-            fkey = await load_uvarint(reader)
+            fkey = await load_uvarint(reader, readbyte)
         except EOFError:
             break  # no more fields to load
 
-        ftag = fkey >> 3
-        wtype = fkey & 7
-
-        field = fields.get(ftag, None)
+        field = fields.get(fkey >> 3, None)
 
         if field is None:  # unknown field, skip it
+            wtype = fkey & 7
             if wtype == 0:
-                await load_uvarint(reader)
+                await load_uvarint(reader, readbyte)
             elif wtype == 2:
-                ivalue = await load_uvarint(reader)
+                ivalue = await load_uvarint(reader, readbyte)
                 await reader.areadinto(bytearray(ivalue))
             else:
                 raise ValueError
             continue
 
-        fname, ftype, fflags = field
-        if wtype != ftype.WIRE_TYPE:
+        _, fname, ftype, fflags, fkind, fkey_schema = field
+        if fkey != fkey_schema:
             raise TypeError  # parsed wire type differs from the schema
 
-        ivalue = await load_uvarint(reader)
+        ivalue = await load_uvarint(reader, readbyte)
 
-        if ftype is UVarintType:
+        if fkind == _KIND_UVARINT:
             fvalue = ivalue
-        elif ftype is SVarintType:
-            fvalue = uint_to_sint(ivalue)
-        elif ftype is BoolType:
-            fvalue = bool(ivalue)
-        elif ftype is BytesType:
+        elif fkind == _KIND_BYTES:
             fvalue = bytearray(ivalue)
             await reader.areadinto(fvalue)
-        elif ftype is UnicodeType:
+        elif fkind == _KIND_MESSAGE:
+            fvalue = await load_message(LimitedReader(reader, ivalue), ftype)
+        elif fkind == _KIND_BOOL:
+            fvalue = bool(ivalue)
+        elif fkind == _KIND_SVARINT:
+            fvalue = uint_to_sint(ivalue)
+        else:  # _KIND_UNICODE
             fvalue = bytearray(ivalue)
             await reader.areadinto(fvalue)
             fvalue = bytes(fvalue).decode()
-        elif issubclass(ftype, MessageType):
-            fvalue = await load_message(LimitedReader(reader, ivalue), ftype)
-        else:
-            raise TypeError  # field type is unknown
 
         if fflags & FLAG_REPEATED:
             pvalue = getattr(msg, fname, [])
@@ -231,88 +326,123 @@ async def load_message(reader, msg_type):
         setattr(msg, fname, fvalue)
 
     # fill missing fields
-    for tag in fields:
-        field = fields[tag]
-        if not hasattr(msg, field[0]):
-            setattr(msg, field[0], None)
+    for field in entries:
+        if not hasattr(msg, field[1]):
+            setattr(msg, field[1], None)
 
     return msg
 
 
-async def dump_message(writer, msg, fields=None):
-    repvalue = [0]
-
-    if fields is None:
-        fields = msg.get_fields()
-
-    for ftag in fields:
-        fname, ftype, fflags = fields[ftag]
-
-        fvalue = getattr(msg, fname, None)
-        if fvalue is None:
-            continue
-
-        fkey = (ftag << 3) | ftype.WIRE_TYPE
-
-        if not fflags & FLAG_REPEATED:
-            repvalue[0] = fvalue
-            fvalue = repvalue
-
-        if issubclass(ftype, MessageType):
-            ffields = ftype.get_fields()
+_DUMP_BUFFER_LEN = const(64)  # size of the output buffer, one HID report
+_DUMP_BUFFER_FLUSH = const(44)  # flush before a key and a value could overflow it
+
+
+class _Dumper:
+    """
+    Serializes a message tree into a fixed-size buffer that is flushed to the
+    `AsyncWriter` only when full.  Sizes of the embedded messages are taken in
+    pre-order from the list filled in by `count_message`.
+    """
+
+    def __init__(self, writer, sizes):
+        self.writer = writer
+        self.sizes = sizes
+        self.sizes_ofs = 0
+        self.buf = bytearray(_DUMP_BUFFER_LEN)
+        self.ofs = 0
+
+    async def flush(self):
+        if self.ofs == _DUMP_BUFFER_LEN:
+            await self.writer.awrite(self.buf)
+        elif self.ofs:
+            await self.writer.awrite(memoryview(self.buf)[: self.ofs])
+        self.ofs = 0
+
+    async def key_and_uvarint(self, fkey, n):
+        if self.ofs > _DUMP_BUFFER_FLUSH:
+            await self.flush()
+        self.ofs = _write_uvarint(self.buf, self.ofs, fkey)
+        self.ofs = _write_uvarint(self.buf, self.ofs, n)
+
+    async def bytes(self, value):
+        if len(value) <= _DUMP_BUFFER_LEN - self.ofs:
+            self.ofs += utils.memcpy(self.buf, self.ofs, value, 0, len(value))
         else:
-            ffields = None
-
-        for svalue in fvalue:
-            await dump_uvarint(writer, fkey)
+            # large values bypass the buffer
+            await self.flush()
+            await self.writer.awrite(value)
 
-            if ftype is UVarintType:
-                await dump_uvarint(writer, svalue)
+    async def message(self, msg):
+        repvalue = [0]
 
-            elif ftype is SVarintType:
-                await dump_uvarint(writer, sint_to_uint(svalue))
+        for _, fname, ftype, fflags, fkind, fkey in get_field_table(msg.__class__)[2]:
+            fvalue = getattr(msg, fname, None)
+            if fvalue is None:
+                continue
 
-            elif ftype is BoolType:
-                await dump_uvarint(writer, int(svalue))
-
-            elif ftype is BytesType:
-                if isinstance(svalue, list):
-                    await dump_uvarint(writer, _count_bytes_list(svalue))
-                    for sub_svalue in svalue:
-                        await writer.awrite(sub_svalue)
-                else:
-                    await dump_uvarint(writer, len(svalue))
-                    await writer.awrite(svalue)
+            if not fflags & FLAG_REPEATED:
+                repvalue[0] = fvalue
+                fvalue = repvalue
 
-            elif ftype is UnicodeType:
-                svalue = svalue.encode()
-                await dump_uvarint(writer, len(svalue))
-                await writer.awrite(svalue)
-
-            elif issubclass(ftype, MessageType):
-                await dump_uvarint(writer, count_message(svalue, ffields))
-                await dump_message(writer, svalue, ffields)
-
-            else:
-                raise TypeError
-
-
-def count_message(msg, fields=None):
+            for svalue in fvalue:
+                if fkind == _KIND_UVARINT:
+                    await self.key_and_uvarint(fkey, svalue)
+
+                elif fkind == _KIND_BYTES:
+                    if isinstance(svalue, list):
+                        await self.key_and_uvarint(fkey, _count_bytes_list(svalue))
+                        for sub_svalue in svalue:
+                            await self.bytes(sub_svalue)
+                    else:
+                        await self.key_and_uvarint(fkey, len(svalue))
+                        await self.bytes(svalue)
+
+                elif fkind == _KIND_MESSAGE:
+                    fsize = self.sizes[self.sizes_ofs]
+                    self.sizes_ofs += 1
+                    await self.key_and_uvarint(fkey, fsize)
+                    await self.message(svalue)
+
+                elif fkind == _KIND_BOOL:
+                    await self.key_and_uvarint(fkey, int(svalue))
+
+                elif fkind == _KIND_SVARINT:
+                    await self.key_and_uvarint(fkey, sint_to_uint(svalue))
+
+                else:  # _KIND_UNICODE
+                    svalue = svalue.encode()
+                    await self.key_and_uvarint(fkey, len(svalue))
+                    await self.bytes(svalue)
+
+
+async def dump_message(writer, msg, sizes=None):
+    """
+    Serialize `msg` into `writer`.  `sizes` is the list of embedded message
+    sizes filled in by a preceding `count_message(msg, sizes)` call; if it is
+    not given, the sizes are computed here, once per embedded message.
+    """
+    if sizes is None:
+        sizes = []
+        count_message(msg, sizes)
+    dumper = _Dumper(writer, sizes)
+    await dumper.message(msg)
+    await dumper.flush()
+
+
+def count_message(msg, sizes=None):
+    """
+    Return the serialized size of `msg`.  If `sizes` list is given, the sizes
+    of all embedded messages are appended to it in pre-order, so that
+    `dump_message` does not have to compute them again.
+    """
     nbytes = 0
     repvalue = [0]
 
-    if fields is None:
-        fields = msg.get_fields()
-
-    for ftag in fields:
-        fname, ftype, fflags = fields[ftag]
-
+    for _, fname, ftype, fflags, fkind, fkey in get_field_table(msg.__class__)[2]:
         fvalue = getattr(msg, fname, None)
         if fvalue is None:
             continue
 
-        fkey = (ftag << 3) | ftype.WIRE_TYPE
-
         if not fflags & FLAG_REPEATED:
             repvalue[0] = fvalue
             fvalue = repvalue
@@ -320,19 +450,11 @@ def count_message(msg, fields=None):
         # length of all the field keys
         nbytes += count_uvarint(fkey) * len(fvalue)
 
-        if ftype is UVarintType:
+        if fkind == _KIND_UVARINT:
             for svalue in fvalue:
                 nbytes += count_uvarint(svalue)
 
-        elif ftype is SVarintType:
-            for svalue in fvalue:
-                nbytes += count_uvarint(sint_to_uint(svalue))
-
-        elif ftype is BoolType:
-            for svalue in fvalue:
-                nbytes += count_uvarint(int(svalue))
-
-        elif ftype is BytesType:
+        elif fkind == _KIND_BYTES:
             for svalue in fvalue:
                 if isinstance(svalue, list):
                     svalue = _count_bytes_list(svalue)
@@ -341,22 +463,31 @@ def count_message(msg, fields=None):
                 nbytes += count_uvarint(svalue)
                 nbytes += svalue
 
-        elif ftype is UnicodeType:
-            for svalue in fvalue:
-                svalue = len(svalue.encode())
-                nbytes += count_uvarint(svalue)
-                nbytes += svalue
-
-        elif issubclass(ftype, MessageType):
-            ffields = ftype.get_fields()
+        elif fkind == _KIND_MESSAGE:
             for svalue in fvalue:
-                fsize = count_message(svalue, ffields)
+                if sizes is not None:
+                    # reserve the slot first to keep the pre-order
+                    sizes_ofs = len(sizes)
+                    sizes.append(0)
+                fsize = count_message(svalue, sizes)
+                if sizes is not None:
+                    sizes[sizes_ofs] = fsize
                 nbytes += count_uvarint(fsize)
                 nbytes += fsize
-            del ffields
 
-        else:
-            raise TypeError
+        elif fkind == _KIND_BOOL:
+            for svalue in fvalue:
+                nbytes += count_uvarint(int(svalue))
+
+        elif fkind == _KIND_SVARINT:
+            for svalue in fvalue:
+                nbytes += count_uvarint(sint_to_uint(svalue))
+
+        else:  # _KIND_UNICODE
+            for svalue in fvalue:
+                svalue = len(svalue.encode())
+                nbytes += count_uvarint(svalue)
+                nbytes += svalue
 
     return nbytes
 
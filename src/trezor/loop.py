@@ -27,6 +27,23 @@ if __debug__:
     log_delay_rb_len = const(10)
     log_delay_rb = array.array("i", [0] * log_delay_rb_len)
 
+    # per-task step stats, see `_log_step` and `stats_dump`
+    stats_tasks_len = const(16)  # number of tracked tasks
+    stats_slots = {}  # id(task) -> index into the arrays below
+    stats_ids = [0] * stats_tasks_len  # id(task) of the slot owner
+    stats_names = [None] * stats_tasks_len  # repr(task) of the slot owner
+    stats_steps = array.array("L", [0] * stats_tasks_len)  # number of steps
+    stats_time = array.array("L", [0] * stats_tasks_len)  # cumulative usec
+    stats_max = array.array("L", [0] * stats_tasks_len)  # longest step usec
+    stats_pos = 0  # next slot to recycle when all are taken
+    # step latency histogram, bucket i counts steps shorter than 2**i ms,
+    # the last bucket counts all the longer ones
+    stats_hist_len = const(12)
+    stats_hist = array.array("L", [0] * stats_hist_len)
+    stats_queue_max = 0  # maximum number of scheduled tasks
+    stats_poll_time = 0  # cumulative usec spent waiting in io.poll
+    stats_poll_count = 0
+
 
 def schedule(task, value=None, deadline=None):
     """
@@ -61,7 +78,7 @@ def run():
     """
 
     if __debug__:
-        global log_delay_pos
+        global log_delay_pos, stats_queue_max, stats_poll_time, stats_poll_count
 
     max_delay = const(1000000)  # usec delay if queue is empty
 
@@ -78,8 +95,18 @@ def run():
             # add current delay to ring buffer for performance stats
             log_delay_rb[log_delay_pos] = delay
             log_delay_pos = (log_delay_pos + 1) % log_delay_rb_len
+            # track the queue depth and time spent waiting for I/O
+            if len(_queue) > stats_queue_max:
+                stats_queue_max = len(_queue)
+            poll_start = utime.ticks_us()
+
+        received = io.poll(_paused, msg_entry, delay)
 
-        if io.poll(_paused, msg_entry, delay):
+        if __debug__:
+            stats_poll_time += utime.ticks_diff(utime.ticks_us(), poll_start)
+            stats_poll_count += 1
+
+        if received:
             # message received, run tasks paused on the interface
             msg_tasks = _paused.pop(msg_entry[0], ())
             for task in msg_tasks:
@@ -92,6 +119,8 @@ def run():
 
 
 def _step(task, value):
+    if __debug__:
+        step_start = utime.ticks_us()
     try:
         if isinstance(value, Exception):
             result = task.throw(value)
@@ -113,6 +142,83 @@ def _step(task, value):
                 log.error(__name__, "unknown syscall: %s", result)
         if after_step_hook:
             after_step_hook()
+    if __debug__:
+        _log_step(task, utime.ticks_diff(utime.ticks_us(), step_start))
+
+
+if __debug__:
+
+    def _log_step(task, elapsed):
+        global stats_pos
+
+        # step latency histogram
+        bucket = 0
+        limit = 1000
+        while elapsed >= limit and bucket < stats_hist_len - 1:
+            bucket += 1
+            limit <<= 1
+        stats_hist[bucket] += 1
+
+        # per-task stats, least recently added task is replaced if full
+        task_id = id(task)
+        slot = stats_slots.get(task_id, None)
+        if slot is None:
+            slot = stats_pos
+            stats_pos = (stats_pos + 1) % stats_tasks_len
+            stats_slots.pop(stats_ids[slot], None)
+            stats_slots[task_id] = slot
+            stats_ids[slot] = task_id
+            stats_names[slot] = repr(task)
+            stats_steps[slot] = 0
+            stats_time[slot] = 0
+            stats_max[slot] = 0
+        stats_steps[slot] += 1
+        stats_time[slot] += elapsed
+        if elapsed > stats_max[slot]:
+            stats_max[slot] = elapsed
+
+    def stats_reset():
+        """Clear all the collected step stats."""
+        global stats_pos, stats_queue_max, stats_poll_time, stats_poll_count
+
+        stats_slots.clear()
+        for i in range(stats_tasks_len):
+            stats_ids[i] = 0
+            stats_names[i] = None
+            stats_steps[i] = 0
+            stats_time[i] = 0
+            stats_max[i] = 0
+        for i in range(stats_hist_len):
+            stats_hist[i] = 0
+        stats_pos = 0
+        stats_queue_max = 0
+        stats_poll_time = 0
+        stats_poll_count = 0
+
+    def stats_dump():
+        """
+        Log the collected step stats, tasks with the highest cumulative step
+        time first.
+        """
+        log.info(
+            __name__,
+            "queue max: %d, poll: %d calls, %d us",
+            stats_queue_max,
+            stats_poll_count,
+            stats_poll_time,
+        )
+        slots = [i for i in range(stats_tasks_len) if stats_names[i] is not None]
+        slots.sort(key=lambda i: stats_time[i], reverse=True)
+        for i in slots:
+            log.info(
+                __name__,
+                "steps: %d, total: %d us, max: %d us, task: %s",
+                stats_steps[i],
+                stats_time[i],
+                stats_max[i],
+                stats_names[i],
+            )
+        log.info(__name__, "step histogram (<1ms, <2ms, ...): %s", list(stats_hist))
 
 
 class Syscall:
@@ -21,12 +21,14 @@ class MoneroKeyImageExportInitRequest(p.MessageType):
         address_n: List[int] = None,
         network_type: int = None,
         subs: List[MoneroSubAddressIndicesList] = None,
+        batch: bool = None,
     ) -> None:
         self.num = num
         self.hash = hash
         self.address_n = address_n if address_n is not None else []
         self.network_type = network_type
         self.subs = subs if subs is not None else []
+        self.batch = batch
 
     @classmethod
     def get_fields(cls):
@@ -36,4 +38,5 @@ class MoneroKeyImageExportInitRequest(p.MessageType):
             3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
             4: ('network_type', p.UVarintType, 0),
             5: ('subs', MoneroSubAddressIndicesList, p.FLAG_REPEATED),
+            6: ('batch', p.BoolType, 0),
         }
@@ -18,6 +18,10 @@ class SignTx(p.MessageType):
         version_group_id: int = None,
         timestamp: int = None,
         branch_id: int = None,
+        batch_size: int = None,
+        checkpoints: bool = None,
+        checkpoint: bytes = None,
+        legacy_cache: bool = None,
     ) -> None:
         self.outputs_count = outputs_count
         self.inputs_count = inputs_count
@@ -29,6 +33,10 @@ class SignTx(p.MessageType):
         self.version_group_id = version_group_id
         self.timestamp = timestamp
         self.branch_id = branch_id
+        self.batch_size = batch_size
+        self.checkpoints = checkpoints
+        self.checkpoint = checkpoint
+        self.legacy_cache = legacy_cache
 
     @classmethod
     def get_fields(cls):
@@ -43,4 +51,8 @@ class SignTx(p.MessageType):
             8: ('version_group_id', p.UVarintType, 0),
             9: ('timestamp', p.UVarintType, 0),
             10: ('branch_id', p.UVarintType, 0),
+            11: ('batch_size', p.UVarintType, 0),  # default=1
+            12: ('checkpoints', p.BoolType, 0),  # default=false
+            13: ('checkpoint', p.BytesType, 0),
+            14: ('legacy_cache', p.BoolType, 0),  # default=false
         }
@@ -11,11 +11,13 @@ class TxRequestDetailsType(p.MessageType):
         tx_hash: bytes = None,
         extra_data_len: int = None,
         extra_data_offset: int = None,
+        request_count: int = None,
     ) -> None:
         self.request_index = request_index
         self.tx_hash = tx_hash
         self.extra_data_len = extra_data_len
         self.extra_data_offset = extra_data_offset
+        self.request_count = request_count
 
     @classmethod
     def get_fields(cls):
@@ -24,4 +26,5 @@ class TxRequestDetailsType(p.MessageType):
             2: ('tx_hash', p.BytesType, 0),
             3: ('extra_data_len', p.UVarintType, 0),
             4: ('extra_data_offset', p.UVarintType, 0),
+            5: ('request_count', p.UVarintType, 0),
         }
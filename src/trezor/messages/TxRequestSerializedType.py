@@ -10,10 +10,12 @@ class TxRequestSerializedType(p.MessageType):
         signature_index: int = None,
         signature: bytes = None,
         serialized_tx: bytes = None,
+        checkpoint: bytes = None,
     ) -> None:
         self.signature_index = signature_index
         self.signature = signature
         self.serialized_tx = serialized_tx
+        self.checkpoint = checkpoint
 
     @classmethod
     def get_fields(cls):
@@ -21,4 +23,5 @@ class TxRequestSerializedType(p.MessageType):
             1: ('signature_index', p.UVarintType, 0),
             2: ('signature', p.BytesType, 0),
             3: ('serialized_tx', p.BytesType, 0),
+            4: ('checkpoint', p.BytesType, 0),
         }
@@ -21,24 +21,84 @@ def unimport_begin():
 def unimport_end(mods):
     for mod in sys.modules:
         if mod not in mods:
-            # remove reference from sys.modules
-            del sys.modules[mod]
-            # remove reference from the parent module
-            i = mod.rfind(".")
-            if i < 0:
-                continue
-            path = mod[:i]
-            name = mod[i + 1 :]
-            try:
-                delattr(sys.modules[path], name)
-            except KeyError:
-                # either path is not present in sys.modules, or module is not
-                # referenced from the parent package. both is fine.
-                pass
+            _unimport(mod)
     # collect removed modules
     gc.collect()
 
 
+def _unimport(mod):
+    # remove reference from sys.modules
+    try:
+        del sys.modules[mod]
+    except KeyError:
+        return  # already unimported
+    # remove reference from the parent module
+    i = mod.rfind(".")
+    if i < 0:
+        return
+    path = mod[:i]
+    name = mod[i + 1 :]
+    try:
+        delattr(sys.modules[path], name)
+    except KeyError:
+        # either path is not present in sys.modules, or module is not
+        # referenced from the parent package. both is fine.
+        pass
+
+
+class ModuleResidency:
+    """
+    Alternative to `unimport_begin`/`unimport_end` that keeps the modules
+    imported by recently used workflows loaded, so that their next run does
+    not import and compile them again.  Every workflow is a group of all the
+    modules it uses.  Once less than `min_free` bytes of heap remain free
+    after a workflow, the least recently used groups are evicted and their
+    modules that no resident group lists are unimported.
+
+    Modules shared with a resident group are not imported again, so the first
+    run of a workflow starts with no resident groups, to learn its full set of
+    modules.
+    """
+
+    def __init__(self, min_free: int):
+        self.min_free = min_free
+        self.groups = {}  # workflow key -> names of all modules it uses
+        self.resident = []  # keys of the resident groups, least recent first
+
+    def begin(self, key):
+        if key not in self.groups and self.resident:
+            self.evict(len(self.resident))
+        return set(sys.modules)
+
+    def end(self, key, mods):
+        group = self.groups.setdefault(key, set())
+        for mod in sys.modules:
+            if mod not in mods:
+                group.add(mod)
+        if key in self.resident:
+            self.resident.remove(key)
+        self.resident.append(key)
+
+        if gc.mem_free() >= self.min_free:
+            return
+        gc.collect()
+        while self.resident and gc.mem_free() < self.min_free:
+            self.evict(1)
+
+    def evict(self, count: int):
+        evicted = self.resident[:count]
+        self.resident = self.resident[count:]
+        listed = set()
+        for key in self.resident:
+            listed.update(self.groups[key])
+        for key in evicted:
+            for mod in self.groups[key]:
+                if mod not in listed:
+                    _unimport(mod)
+        # collect removed modules
+        gc.collect()
+
+
 def ensure(cond, msg=None):
     if not cond:
         if msg is None:
@@ -1,3 +1,6 @@
+import gc
+import utime
+
 import protobuf
 from trezor import log, loop, messages, utils, workflow
 from trezor.wire import codec_v1
@@ -7,6 +10,10 @@ from apps.common import seed
 
 workflow_handlers = {}
 
+# modules of recently used workflows stay imported while at least a quarter of
+# the heap is free
+residency = utils.ModuleResidency((gc.mem_free() + gc.mem_alloc()) // 4)
+
 
 def add(mtype, pkgname, modname, namespace=None):
     """Shortcut for registering a dynamically-imported Protobuf workflow."""
@@ -33,6 +40,34 @@ def register(mtype, handler, *args):
     workflow_handlers[mtype] = (handler, args)
 
 
+def add_lazy(mtype, pkgname):
+    """
+    Shortcut for registering an app package that is imported and booted only
+    when `mtype` message is received for the first time.  The `boot()` of the
+    package then registers the actual workflows.
+    """
+    register(mtype, lazy_workflow, pkgname)
+
+
+def boot_lazy(pkgname):
+    """
+    Boot an app package registered by `add_lazy`.  If the package fails to
+    import or boot, it stays registered for the next attempt.
+    """
+    mtypes = []
+    for mtype, (handler, args) in list(workflow_handlers.items()):
+        if handler is lazy_workflow and args[0] == pkgname:
+            mtypes.append(mtype)
+            del workflow_handlers[mtype]
+    try:
+        module = __import__(pkgname, None, None, ("boot",), 0)
+        module.boot()
+    except Exception:
+        for mtype in mtypes:
+            workflow_handlers[mtype] = (lazy_workflow, (pkgname,))
+        raise
+
+
 def setup(iface):
     """Initialize the wire stack on passed USB interface."""
     loop.schedule(session_handler(iface, codec_v1.SESSION_ID))
@@ -87,13 +122,13 @@ class Context:
                 __name__, "%s:%x write: %s", self.iface.iface_num(), self.sid, msg
             )
 
-        # get the message size
-        fields = msg.get_fields()
-        size = protobuf.count_message(msg, fields)
+        # get the message size, keep the embedded message sizes for dumping
+        sizes = []
+        size = protobuf.count_message(msg, sizes)
 
         # write the message
         writer.setheader(msg.MESSAGE_WIRE_TYPE, size)
-        await protobuf.dump_message(writer, msg, fields)
+        await protobuf.dump_message(writer, msg, sizes)
         await writer.aclose()
 
     def wait(self, *tasks):
@@ -131,14 +166,24 @@ async def session_handler(iface, sid):
             except KeyError:
                 handler, args = unexpected_msg, ()
 
-            m = utils.unimport_begin()
+            if __debug__:
+                start = utime.ticks_ms()
+            mtype = reader.type
+            m = residency.begin(mtype)
             w = handler(ctx, reader, *args)
             try:
                 workflow.onstart(w)
                 await w
             finally:
                 workflow.onclose(w)
-                utils.unimport_end(m)
+                residency.end(mtype, m)
+                if __debug__:
+                    log.debug(
+                        __name__,
+                        "message %d handled in %d ms",
+                        mtype,
+                        utime.ticks_diff(utime.ticks_ms(), start),
+                    )
 
         except UnexpectedMessageError as exc:
             # retry with opened reader from the exception
@@ -197,6 +242,28 @@ def import_workflow(ctx, req, pkgname, modname, *args):
     return handler(ctx, req, *args)
 
 
+async def lazy_workflow(ctx, reader, pkgname):
+    from trezor.messages.Failure import Failure
+
+    try:
+        boot_lazy(pkgname)
+    except Exception:
+        # receive the message and throw it away
+        while reader.size > 0:
+            buf = bytearray(reader.size)
+            await reader.areadinto(buf)
+        # respond with a generic code and message
+        await ctx.write(
+            Failure(code=FailureType.FirmwareError, message="Firmware error")
+        )
+        raise
+    try:
+        handler, args = workflow_handlers[reader.type]
+    except KeyError:
+        handler, args = unexpected_msg, ()
+    await handler(ctx, reader, *args)
+
+
 async def unexpected_msg(ctx, reader):
     from trezor.messages.Failure import Failure
 
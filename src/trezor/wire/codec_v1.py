@@ -10,6 +10,9 @@ _REP_MAGIC = const(35)  # org('#')
 _REP_INIT = ">BBBHL"  # marker, magic, magic, wire type, data length
 _REP_INIT_DATA = const(9)  # offset of data in the initial report
 _REP_CONT_DATA = const(1)  # offset of data in the continuation report
+_REP_PADDING = bytes(_REP_LEN)
+
+_WRITE_QUEUE_LEN = const(4)  # number of complete reports flushed in one batch
 
 SESSION_ID = const(0)
 
@@ -17,15 +20,17 @@ SESSION_ID = const(0)
 class Reader:
     """
     Decoder for legacy codec over the HID layer.  Provides readable
-    async-file-like interface.
+    async-file-like interface.  Received reports are kept as they are, and
+    message data are copied straight from them into the target buffers.
     """
 
     def __init__(self, iface):
         self.iface = iface
         self.type = None
         self.size = None
-        self.data = None
-        self.ofs = 0
+        self.data = None  # last received report
+        self.ofs = 0  # offset of the next message byte in `self.data`
+        self.end = 0  # offset after the last message byte in `self.data`
 
     def __repr__(self):
         return "<ReaderV1: type=%d size=%dB>" % (self.type, self.size)
@@ -50,8 +55,9 @@ class Reader:
         # load received message header
         self.type = mtype
         self.size = msize
-        self.data = report[_REP_INIT_DATA : _REP_INIT_DATA + msize]
-        self.ofs = 0
+        self.data = report
+        self.ofs = _REP_INIT_DATA
+        self.end = min(len(report), _REP_INIT_DATA + msize)
 
     async def areadinto(self, buf):
         """
@@ -59,13 +65,22 @@ class Reader:
         reports, if needed.  Raises `EOFError` if end-of-message is encountered
         before the full read can be completed.
         """
-        if self.size < len(buf):
+        return await self.readinto_view(buf, 0, len(buf))
+
+    async def readinto_view(self, buf, ofs, nbytes):
+        """
+        Read exactly `nbytes` bytes into `buf`, starting at offset `ofs`.  Data
+        of every continuation report are copied directly into `buf`, no
+        intermediate objects are allocated.  Raises `EOFError` if
+        end-of-message is encountered before the full read can be completed.
+        """
+        if self.size < nbytes:
             raise EOFError
 
         read = loop.wait(self.iface.iface_num() | io.POLL_READ)
         nread = 0
-        while nread < len(buf):
-            if self.ofs == len(self.data):
+        while nread < nbytes:
+            if self.ofs == self.end:
                 # we are at the end of received data
                 # wait for continuation report
                 while True:
@@ -73,30 +88,48 @@ class Reader:
                     marker = report[0]
                     if marker == _REP_MARKER:
                         break
-                self.data = report[_REP_CONT_DATA : _REP_CONT_DATA + self.size]
-                self.ofs = 0
+                self.data = report
+                self.ofs = _REP_CONT_DATA
+                self.end = min(len(report), _REP_CONT_DATA + self.size)
 
             # copy as much as possible to target buffer
-            nbytes = utils.memcpy(buf, nread, self.data, self.ofs, len(buf))
-            nread += nbytes
-            self.ofs += nbytes
-            self.size -= nbytes
+            n = utils.memcpy(buf, ofs + nread, self.data, self.ofs, nbytes - nread)
+            nread += n
+            self.ofs += n
+            self.size -= n
 
         return nread
 
+    def readbyte(self):
+        """
+        Return the next message byte if it is already buffered from the last
+        received report, or -1 if a continuation report has to be awaited
+        first.  Never waits.
+        """
+        ofs = self.ofs
+        if ofs == self.end:
+            return -1
+        self.ofs = ofs + 1
+        self.size -= 1
+        return self.data[ofs]
+
 
 class Writer:
     """
     Encoder for legacy codec over the HID layer.  Provides writable
-    async-file-like interface.
+    async-file-like interface.  Complete reports are queued and flushed in
+    batches, see `_flush()`.
     """
 
     def __init__(self, iface):
         self.iface = iface
         self.type = None
         self.size = None
-        self.data = bytearray(_REP_LEN)
+        self.data = bytearray(_REP_LEN)  # report that is being filled
         self.ofs = 0
+        self.buffers = [self.data]  # report buffers, allocated on demand
+        self.current = 0  # index of `self.data` in `self.buffers`
+        self.queue = []  # complete reports waiting for flush
 
     def __repr__(self):
         return "<WriterV1: type=%d size=%dB>" % (self.type, self.size)
@@ -122,7 +155,6 @@ class Writer:
         if self.size < len(buf):
             raise EOFError
 
-        write = loop.wait(self.iface.iface_num() | io.POLL_WRITE)
         nwritten = 0
         while nwritten < len(buf):
             # copy as much as possible to report buffer
@@ -132,13 +164,12 @@ class Writer:
             self.size -= nbytes
 
             if self.ofs == _REP_LEN:
-                # we are at the end of the report, flush it
-                while True:
-                    await write
-                    n = self.iface.write(self.data)
-                    if n == len(self.data):
-                        break
-                self.ofs = _REP_CONT_DATA
+                # we are at the end of the report, queue it and flush the
+                # queue if all report buffers are used
+                self.queue.append(self.data)
+                if len(self.queue) == _WRITE_QUEUE_LEN:
+                    await self._flush()
+                self._next_report()
 
         return nwritten
 
@@ -146,14 +177,37 @@ class Writer:
         """Flush and close the message transmission."""
         if self.ofs != _REP_CONT_DATA:
             # we didn't write anything or last write() wasn't report-aligned,
-            # pad the final report and flush it
-            while self.ofs < _REP_LEN:
-                self.data[self.ofs] = 0x00
-                self.ofs += 1
-
-            write = loop.wait(self.iface.iface_num() | io.POLL_WRITE)
+            # pad the final report and queue it
+            utils.memcpy(self.data, self.ofs, _REP_PADDING, 0, _REP_LEN)
+            self.ofs = _REP_LEN
+            self.queue.append(self.data)
+        if self.queue:
+            await self._flush()
+
+    def _next_report(self):
+        self.current = (self.current + 1) % _WRITE_QUEUE_LEN
+        if self.current == len(self.buffers):
+            self.buffers.append(bytearray(_REP_LEN))
+        self.data = self.buffers[self.current]
+        self.data[0] = _REP_MARKER
+        self.ofs = _REP_CONT_DATA
+
+    async def _flush(self):
+        """
+        Write all queued reports.  After each poll wakeup, as many reports as
+        the interface accepts without waiting are written in one go.
+        """
+        iface = self.iface
+        write = loop.wait(iface.iface_num() | io.POLL_WRITE)
+        poll_ifaces = (iface.iface_num() | io.POLL_WRITE,)
+        poll_entry = [0, 0]
+        ready = False
+        for report in self.queue:
             while True:
-                await write
-                n = self.iface.write(self.data)
-                if n == len(self.data):
+                if not ready:
+                    await write
+                n = iface.write(report)
+                ready = io.poll(poll_ifaces, poll_entry, 0)
+                if n == len(report):
                     break
+        self.queue.clear()
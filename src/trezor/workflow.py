@@ -17,6 +17,10 @@ def onclose(w):
     workflows.remove(w)
     if not layouts and default_layout:
         startdefault(default_layout)
+    if __debug__ and not workflows:
+        # no workflow is running anymore, report where the time went
+        loop.stats_dump()
+        loop.stats_reset()
 
 
 def closedefault():
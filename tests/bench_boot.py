@@ -0,0 +1,61 @@
+from common import *
+
+import gc
+import utime
+
+from trezor import utils, wire
+
+from apps import registry
+
+APPS = [
+    "apps.management",
+    "apps.wallet",
+    "apps.ethereum",
+    "apps.lisk",
+    "apps.monero",
+    "apps.nem",
+    "apps.stellar",
+    "apps.ripple",
+    "apps.cardano",
+    "apps.tezos",
+]
+
+
+def boot_eager():
+    # previous behaviour: import and boot all the apps
+    for pkgname in APPS:
+        module = __import__(pkgname, None, None, ("boot",), 0)
+        module.boot()
+
+
+def boot_lazy():
+    registry.boot()
+
+
+def bench(boot):
+    handlers = wire.workflow_handlers
+    wire.workflow_handlers = {}
+    m = utils.unimport_begin()
+    gc.collect()
+    alloc = gc.mem_alloc()
+    start = utime.ticks_us()
+    boot()
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    gc.collect()
+    ram = gc.mem_alloc() - alloc
+    utils.unimport_end(m)
+    wire.workflow_handlers = handlers
+    return elapsed, ram
+
+
+def main():
+    for label, boot in (
+        ("import and boot all apps", boot_eager),
+        ("lazy registry", boot_lazy),
+    ):
+        elapsed, ram = bench(boot)
+        print("%s: %d us, %d bytes of heap" % (label, elapsed, ram))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+from common import *
+
+import gc
+import utime
+
+from apps.common import coins
+from apps.common.coininfo import COIN_DATA
+
+ROUNDS = 1000
+
+# coins at the end of the coin definitions, the worst case of a linear scan
+LOOKUPS = [
+    ("Zcash Testnet", "TAZ"),
+    ("Zcoin", "XZC"),
+    ("Zcoin Testnet", "tXZC"),
+    ("Zencash", "ZEN"),
+]
+
+
+def linear_by_name(name):
+    # previous behaviour: scan all coins
+    for data in COIN_DATA:
+        if data[0] == name:
+            return data
+    raise ValueError
+
+
+def bench(lookup, keys):
+    gc.collect()
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        for key in keys:
+            lookup(key)
+    return utime.ticks_diff(utime.ticks_us(), start)
+
+
+def main():
+    names = [n for n, _ in LOOKUPS]
+    shortcuts = [s for _, s in LOOKUPS]
+    slip44s = [coins.by_name(n).slip44 for n in names]
+    count = ROUNDS * len(LOOKUPS)
+    print("coins: %d, lookups per run: %d" % (len(COIN_DATA), count))
+    for label, lookup, keys in (
+        ("linear scan by name", linear_by_name, names),
+        ("by_name", coins.by_name, names),
+        ("by_shortcut", coins.by_shortcut, shortcuts),
+        ("by_slip44", coins.by_slip44, slip44s),
+    ):
+        elapsed = bench(lookup, keys)
+        print("%s: %d ns per lookup" % (label, elapsed * 1000 // count))
+
+
+if __name__ == '__main__':
+    main()
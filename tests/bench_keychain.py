@@ -0,0 +1,46 @@
+from common import *
+
+import gc
+import utime
+
+from trezor.crypto import bip32, bip39
+
+from apps.common.seed import Keychain
+
+HARDENED = 0x80000000
+ACCOUNT = [44 | HARDENED, 0 | HARDENED, 0 | HARDENED]
+
+
+def bench_uncached(seed, count):
+    # previous behaviour: clone the namespace root and derive the full suffix
+    root = bip32.from_seed(seed, 'secp256k1')
+    start = utime.ticks_us()
+    for i in range(count):
+        node = root.clone()
+        node.derive_path(ACCOUNT + [0, i])
+    return utime.ticks_diff(utime.ticks_us(), start)
+
+
+def bench_keychain(seed, count):
+    keychain = Keychain(seed, [['secp256k1']])
+    start = utime.ticks_us()
+    for i in range(count):
+        keychain.derive(ACCOUNT + [0, i])
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    keychain.__del__()
+    return elapsed
+
+
+def main():
+    seed = bip39.seed(' '.join(['all'] * 12), '')
+    print("inputs | uncached us/input | keychain us/input")
+    for count in (1, 10, 50, 200):
+        gc.collect()
+        uncached = bench_uncached(seed, count)
+        gc.collect()
+        cached = bench_keychain(seed, count)
+        print("%6d | %17d | %17d" % (count, uncached // count, cached // count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+from common import *
+
+import gc
+import utime
+
+from apps.monero.xmr import bulletproof as bp, crypto
+
+
+def bench(muex, scalars, points):
+    gc.collect()
+    start = utime.ticks_us()
+    for sc, pt in zip(scalars, points):
+        muex.add_pair(sc, pt)
+    res = bp.multiexp(None, muex)
+    return res, utime.ticks_diff(utime.ticks_us(), start)
+
+
+def main():
+    print("pairs | sequential us | pippenger us")
+    for count in (8, 32, 128, 256):
+        scalars = [crypto.encodeint(crypto.random_scalar()) for _ in range(count)]
+        points = [
+            crypto.encodepoint(crypto.scalarmult_base(crypto.random_scalar()))
+            for _ in range(count)
+        ]
+        res_seq, seq = bench(bp.MultiExpSequential(), scalars, points)
+        res_pip, pip = bench(bp.MultiExpPippenger(), scalars, points)
+        assert res_seq == res_pip
+        print("%5d | %13d | %12d" % (count, seq, pip))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+from common import *
+
+import gc
+import utime
+
+import protobuf
+from trezor import messages
+
+ROUNDS = 20
+
+
+class ByteReader:
+    def __init__(self, data, buffered):
+        self.data = data
+        self.ofs = 0
+        if not buffered:
+            self.readbyte = None
+
+    async def areadinto(self, buf):
+        if len(self.data) - self.ofs < len(buf):
+            raise EOFError
+        buf[:] = self.data[self.ofs : self.ofs + len(buf)]
+        self.ofs += len(buf)
+        return len(buf)
+
+    def readbyte(self):
+        if self.ofs == len(self.data):
+            return -1
+        self.ofs += 1
+        return self.data[self.ofs - 1]
+
+
+class ByteWriter:
+    def __init__(self):
+        self.data = bytearray()
+
+    async def awrite(self, buf):
+        self.data.extend(buf)
+        return len(buf)
+
+
+def populate(msg_type, depth=0):
+    """Fill every field of `msg_type` with a representative value."""
+    msg = msg_type()
+    for ftag, fname, ftype, fflags, _, _ in protobuf.get_field_table(msg_type)[2]:
+        if ftype is protobuf.UVarintType:
+            value = 0x12345678
+        elif ftype is protobuf.SVarintType:
+            value = -0x1234
+        elif ftype is protobuf.BoolType:
+            value = True
+        elif ftype is protobuf.BytesType:
+            value = bytes(32)
+        elif ftype is protobuf.UnicodeType:
+            value = "benchmark"
+        elif depth < 3:
+            value = populate(ftype, depth + 1)
+        else:
+            continue
+        if fflags & protobuf.FLAG_REPEATED:
+            value = [value] * 3
+        setattr(msg, fname, value)
+    return msg
+
+
+def load_all_types():
+    msg_types = []
+    for wire_type in sorted(messages.type_to_name):
+        try:
+            msg_types.append(messages.get_type(wire_type))
+        except ImportError:
+            pass
+    return msg_types
+
+
+def bench_load(payloads, buffered):
+    gc.collect()
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        for msg_type, data in payloads:
+            run_sync(protobuf.load_message(ByteReader(data, buffered), msg_type))
+    return utime.ticks_diff(utime.ticks_us(), start)
+
+
+def bench_dump(msgs):
+    gc.collect()
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        for msg in msgs:
+            sizes = []
+            protobuf.count_message(msg, sizes)
+            run_sync(protobuf.dump_message(ByteWriter(), msg, sizes))
+    return utime.ticks_diff(utime.ticks_us(), start)
+
+
+def main():
+    msgs = []
+    payloads = []
+    nbytes = 0
+    for msg_type in load_all_types():
+        msg = populate(msg_type)
+        writer = ByteWriter()
+        run_sync(protobuf.dump_message(writer, msg))
+        msgs.append(msg)
+        payloads.append((msg_type, bytes(writer.data)))
+        nbytes += len(writer.data)
+
+    print("message types: %d, encoded bytes per round: %d" % (len(payloads), nbytes))
+    for buffered in (False, True):
+        elapsed = bench_load(payloads, buffered)
+        print(
+            "load_message (%s): %d us per round"
+            % ("buffered" if buffered else "per-byte", elapsed // ROUNDS)
+        )
+    elapsed = bench_dump(msgs)
+    print("count_message + dump_message: %d us per round" % (elapsed // ROUNDS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+from common import *
+
+import gc
+import utime
+
+from trezor import utils
+
+ROUNDS = 20
+
+# modules imported by the GetAddress and SignTx workflows
+WORKFLOWS = [
+    ("apps.wallet", "get_address"),
+    ("apps.wallet", "sign_tx"),
+]
+
+
+def run_workflow(pkgname, modname):
+    __import__("%s.%s" % (pkgname, modname), None, None, (modname,), 0)
+
+
+def bench_unimport():
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        for pkgname, modname in WORKFLOWS:
+            m = utils.unimport_begin()
+            run_workflow(pkgname, modname)
+            utils.unimport_end(m)
+    return utime.ticks_diff(utime.ticks_us(), start)
+
+
+def bench_residency():
+    residency = utils.ModuleResidency((gc.mem_free() + gc.mem_alloc()) // 4)
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        for pkgname, modname in WORKFLOWS:
+            m = residency.begin(modname)
+            run_workflow(pkgname, modname)
+            residency.end(modname, m)
+    return utime.ticks_diff(utime.ticks_us(), start)
+
+
+def main():
+    count = ROUNDS * len(WORKFLOWS)
+    for label, bench in (
+        ("unimport after every message", bench_unimport),
+        ("module residency", bench_residency),
+    ):
+        gc.collect()
+        m = utils.unimport_begin()
+        elapsed = bench()
+        utils.unimport_end(m)
+        print("%s: %d us per message" % (label, elapsed // count))
+
+
+if __name__ == '__main__':
+    main()
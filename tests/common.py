@@ -5,3 +5,12 @@ sys.path.append('../src')
 from ubinascii import hexlify, unhexlify  # noqa: F401
 
 import unittest  # noqa: F401
+
+
+def run_sync(coro):
+    # runs a coroutine that never waits for an event to its end
+    try:
+        while True:
+            coro.send(None)
+    except StopIteration as e:
+        return e.value
@@ -0,0 +1,17 @@
+#!/bin/bash
+
+cd $(dirname $0)
+MICROPYTHON=../build/unix/micropython
+PYOPT=1
+
+if [ -z "$*" ]; then
+    list="bench_*.py"
+else
+    list="$*"
+fi
+
+for i in $list; do
+    echo
+    echo "$i:"
+    $MICROPYTHON -O$PYOPT $i || exit 1
+done
@@ -3,10 +3,59 @@ from common import *
 from apps.cardano.cbor import (
     Tagged,
     IndefiniteLengthArray,
-    encode
+    Raw,
+    decode,
+    decode_from,
+    decode_stream,
+    encode,
+    encode_into
 )
 from ubinascii import unhexlify
 
+
+class ChunkReader:
+    """Async reader serving the data in chunks, like wire reports."""
+
+    def __init__(self, data, chunk_len):
+        self.data = data
+        self.ofs = 0
+        self.chunk_len = chunk_len
+        self.reads = 0
+
+    async def areadinto(self, buf):
+        if len(self.data) - self.ofs < len(buf):
+            raise EOFError
+        nread = 0
+        while nread < len(buf):
+            n = min(self.chunk_len, len(buf) - nread)
+            buf[nread:nread + n] = self.data[self.ofs:self.ofs + n]
+            self.ofs += n
+            nread += n
+            self.reads += 1
+        return nread
+
+
+DECODE_VECTORS = [
+    (0, '00'),
+    (23, '17'),
+    (24, '1818'),
+    (255, '18ff'),
+    (1000, '1903e8'),
+    (1000000, '1a000f4240'),
+    (1000000000000, '1b000000e8d4a51000'),
+    (b'', '40'),
+    (unhexlify('01020304'), '4401020304'),
+    ([], '80'),
+    ([1, [2, 3], [4, 5]], '8301820203820405'),
+    (list(range(1, 26)), '98190102030405060708090a0b0c0d0e0f101112131415161718181819'),
+    ({}, 'a0'),
+    ([1, [2, 3], [4, 5]], '9f01820203820405ff'),
+    # integer 255 inside an indefinite-length array is not a break code
+    ([255, 1], '9f18ff01ff'),
+    # tag 24 is decoded as the tagged value
+    (unhexlify('01020304'), 'd8184401020304'),
+]
+
 class TestCardanoCbor(unittest.TestCase):
     def test_cbor_encoding(self):
         test_vectors = [
@@ -52,5 +101,55 @@ class TestCardanoCbor(unittest.TestCase):
             encoded = encode(val)
             self.assertEqual(unhexlify(expected), encoded)
 
+    def test_cbor_encode_into(self):
+        value = [IndefiniteLengthArray([1, [2, 3]]), Raw(unhexlify('8200')), unhexlify('0102'), 1000000]
+        expected = encode(value)
+
+        w = bytearray()
+        encode_into(w, value)
+        self.assertEqual(w, expected)
+
+        # appends to a preallocated buffer, after the existing data
+        w = bytearray(b'\x01')
+        encode_into(w, value)
+        self.assertEqual(w, b'\x01' + expected)
+
+    def test_cbor_decoding(self):
+        for expected, data in DECODE_VECTORS:
+            self.assertEqual(decode(unhexlify(data)), expected)
+
+        # trailing and truncated data
+        with self.assertRaises(ValueError):
+            decode(unhexlify('0102'))
+        with self.assertRaises(ValueError):
+            decode(unhexlify('4401'))
+        with self.assertRaises(ValueError):
+            decode(unhexlify('9f01'))
+        with self.assertRaises(ValueError):
+            decode(unhexlify('1903'))
+
+    def test_cbor_decode_from(self):
+        data = unhexlify('8301820203820405' + '4401020304' + '18ff')
+        view = memoryview(data)
+        item, ofs = decode_from(view)
+        self.assertEqual(item, [1, [2, 3], [4, 5]])
+        self.assertEqual(ofs, 8)
+        item, ofs = decode_from(view, ofs)
+        self.assertEqual(item, unhexlify('01020304'))
+        self.assertTrue(isinstance(item, bytes))
+        item, ofs = decode_from(view, ofs)
+        self.assertEqual(item, 255)
+        self.assertEqual(ofs, len(data))
+
+    def test_cbor_decode_stream(self):
+        for expected, data in DECODE_VECTORS:
+            for chunk_len in (1, 3, 64):
+                reader = ChunkReader(unhexlify(data), chunk_len)
+                self.assertEqual(run_sync(decode_stream(reader)), expected)
+                self.assertEqual(reader.ofs, len(reader.data))
+
+        with self.assertRaises(EOFError):
+            run_sync(decode_stream(ChunkReader(unhexlify('9f01'), 64)))
+
 if __name__ == '__main__':
     unittest.main()
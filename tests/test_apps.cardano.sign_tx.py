@@ -0,0 +1,41 @@
+from common import *
+
+from trezor.crypto import hashlib
+from trezor.messages.CardanoTxInputType import CardanoTxInputType
+
+from apps.cardano import cbor
+from apps.cardano.sign_tx import Transaction
+
+
+def prev_tx(amounts, seed):
+    inputs = cbor.IndefiniteLengthArray([[0, cbor.Tagged(24, cbor.encode([bytes([seed]) * 32, 0]))]])
+    outputs = cbor.IndefiniteLengthArray([[cbor.Raw(b'\x80'), amount] for amount in amounts])
+    raw = cbor.encode([inputs, outputs, {}])
+    return raw, hashlib.blake2b(data=raw, outlen=32).digest()
+
+
+class TestCardanoSignTx(unittest.TestCase):
+
+    def test_add_prev_tx(self):
+        raw_a, hash_a = prev_tx([1000, 2000, 3000], 1)
+        raw_b, hash_b = prev_tx([40000], 2)
+        raw_c, _ = prev_tx([5], 3)  # not spent by any input
+        inputs = [
+            CardanoTxInputType(address_n=[0], prev_hash=hash_a, prev_index=2),
+            CardanoTxInputType(address_n=[1], prev_hash=hash_b, prev_index=0),
+            CardanoTxInputType(address_n=[2], prev_hash=hash_a, prev_index=0),
+        ]
+        transaction = Transaction(inputs, [], None, 764824073)
+        self.assertEqual(transaction.input_coins, [None, None, None])
+
+        transaction.add_prev_tx(raw_a)
+        self.assertEqual(transaction.input_coins, [3000, None, 1000])
+        transaction.add_prev_tx(raw_c)
+        self.assertEqual(transaction.input_coins, [3000, None, 1000])
+        transaction.add_prev_tx(raw_b)
+        self.assertEqual(transaction.input_coins, [3000, 40000, 1000])
+        self.assertEqual(transaction.network_name, "Mainnet")
+
+
+if __name__ == '__main__':
+    unittest.main()
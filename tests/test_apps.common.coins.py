@@ -20,11 +20,28 @@ class TestCoins(unittest.TestCase):
             self.assertEqual(c1, c2)
             self.assertEqual(c1.address_type, a)
 
+    def test_slip44(self):
+        self.assertEqual(coins.by_slip44(0), coins.by_name('Bitcoin'))
+        self.assertEqual(coins.by_slip44(2), coins.by_name('Litecoin'))
+        # the first coin of the definitions is returned for a shared slip44
+        self.assertEqual(coins.by_slip44(1), coins.by_name('Testnet'))
+
+    def test_last(self):
+        # coins at the end of the definitions and of the sorted indexes
+        for s, n in (('ZEN', 'Zencash'), ('tXZC', 'Zcoin Testnet'), ('ACM', 'Actinium')):
+            c = coins.by_shortcut(s)
+            self.assertEqual(c.coin_name, n)
+            self.assertEqual(coins.by_name(n), c)
+
     def test_failure(self):
         with self.assertRaises(ValueError):
             coins.by_shortcut('XXX')
         with self.assertRaises(ValueError):
             coins.by_name('XXXXX')
+        with self.assertRaises(ValueError):
+            coins.by_name('Zzzz')
+        with self.assertRaises(ValueError):
+            coins.by_slip44(0x7FFFFFFF)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+from common import *
+
+from trezor import wire
+from trezor.crypto import bip32, bip39
+
+from apps.common.seed import Keychain
+
+HARDENED = 0x80000000
+
+
+class TestKeychain(unittest.TestCase):
+
+    def setUp(self):
+        self.seed = bip39.seed(' '.join(['all'] * 12), '')
+
+    def derive_uncached(self, path, curve_name='secp256k1'):
+        node = bip32.from_seed(self.seed, curve_name)
+        node.derive_path(path)
+        return node
+
+    def test_derive(self):
+        keychain = Keychain(self.seed, [['secp256k1']])
+        account = [44 | HARDENED, 0 | HARDENED, 0 | HARDENED]
+        paths = [account + [chain, i] for i in range(12) for chain in (0, 1)]
+        paths += [[], account, account + [0], [49 | HARDENED, 0 | HARDENED, 0 | HARDENED, 0, 0]]
+        # derive every path twice, so that the second pass hits the cache
+        for path in paths + paths:
+            node = keychain.derive(path)
+            self.assertEqual(node.private_key(), self.derive_uncached(path).private_key())
+            self.assertEqual(node.depth(), len(path))
+        keychain.__del__()
+
+    def test_derive_namespace(self):
+        namespace = [44 | HARDENED, 1 | HARDENED]
+        keychain = Keychain(self.seed, [['secp256k1'] + namespace, ['ed25519'] + namespace])
+        for i in range(3):
+            path = namespace + [i | HARDENED, 0 | HARDENED, 5 | HARDENED]
+            for curve_name in ('secp256k1', 'ed25519'):
+                node = keychain.derive(path, curve_name)
+                self.assertEqual(node.private_key(), self.derive_uncached(path, curve_name).private_key())
+        keychain.__del__()
+
+    def test_derive_forbidden(self):
+        keychain = Keychain(self.seed, [['secp256k1', 44 | HARDENED]])
+        with self.assertRaises(wire.DataError):
+            keychain.derive([49 | HARDENED, 0, 0])
+        keychain.__del__()
+
+
+if __name__ == '__main__':
+    unittest.main()
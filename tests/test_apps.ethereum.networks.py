@@ -0,0 +1,41 @@
+from common import *
+from apps.common import HARDENED
+from apps.ethereum import networks
+
+
+class TestEthereumNetworks(unittest.TestCase):
+
+    def test_by_chain_id(self):
+        self.assertEqual(networks.by_chain_id(1).shortcut, 'ETH')
+        self.assertEqual(networks.by_chain_id(61).shortcut, 'ETC')
+        self.assertEqual(networks.by_chain_id(3125659152).shortcut, 'PIRL')
+        self.assertIs(networks.by_chain_id(0), None)
+        self.assertIs(networks.by_chain_id(5), None)
+        self.assertIs(networks.by_chain_id(None), None)
+        for n in networks.NETWORKS:
+            self.assertIs(networks.by_chain_id(n.chain_id), n)
+
+    def test_by_slip44(self):
+        self.assertEqual(networks.by_slip44(60).chain_id, 1)
+        # the first network of the definitions is returned for a shared slip44
+        self.assertEqual(networks.by_slip44(1).chain_id, 3)
+        self.assertIs(networks.by_slip44(199), None)
+        for n in networks.NETWORKS:
+            self.assertEqual(networks.by_slip44(n.slip44).slip44, n.slip44)
+
+    def test_shortcut_by_chain_id(self):
+        self.assertEqual(networks.shortcut_by_chain_id(2), 'EXP')
+        self.assertEqual(networks.shortcut_by_chain_id(999), 'UNKN')
+        self.assertEqual(networks.shortcut_by_chain_id(1, tx_type=1), 'WAN')
+
+    def test_all_slip44_ids_hardened(self):
+        ids = networks.all_slip44_ids_hardened()
+        self.assertIs(ids, networks.all_slip44_ids_hardened())
+        self.assertTrue(60 | HARDENED in ids)
+        self.assertTrue(1 | HARDENED in ids)
+        self.assertFalse(60 in ids)
+        self.assertEqual(len(ids), len(set(n.slip44 for n in networks.NETWORKS)))
+
+
+if __name__ == '__main__':
+    unittest.main()
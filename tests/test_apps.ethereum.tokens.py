@@ -20,10 +20,19 @@ class TestEthereumTokens(unittest.TestCase):
         token = tokens.token_by_chain_address(8, b'\x4b\x48\x99\xa1\x0f\x3e\x50\x7d\xb2\x07\xb0\xee\x24\x26\x02\x9e\xfa\x16\x8a\x67')
         self.assertEqual(token[2], 'QWARK')
 
+        # symbol with a multi-byte character
+        token = tokens.token_by_chain_address(1, b'\xb6\x77\x34\x52\x1e\xab\xbe\x9c\x77\x37\x29\xdb\x73\xe1\x6c\xc2\xdf\xb2\x0a\x58')
+        self.assertEqual(token, (1, b'\xb6\x77\x34\x52\x1e\xab\xbe\x9c\x77\x37\x29\xdb\x73\xe1\x6c\xc2\xdf\xb2\x0a\x58', 'E\u20b9', 2))
+
         # invalid adress, invalid chain
         token = tokens.token_by_chain_address(999, b'\x00\xFF')
         self.assertIs(token, tokens.UNKNOWN_TOKEN)
 
+        # unknown address on a known chain, missing or too large chain id
+        self.assertIs(tokens.token_by_chain_address(1, bytes(20)), tokens.UNKNOWN_TOKEN)
+        self.assertIs(tokens.token_by_chain_address(None, bytes(20)), tokens.UNKNOWN_TOKEN)
+        self.assertIs(tokens.token_by_chain_address(1 << 40, bytes(20)), tokens.UNKNOWN_TOKEN)
+
 
 if __name__ == '__main__':
     unittest.main()
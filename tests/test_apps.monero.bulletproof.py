@@ -428,6 +428,36 @@ class TestMoneroBulletproof(unittest.TestCase):
         )
         self.assertEqual(res, res2)
 
+    def test_generators(self):
+        bpi = bp.BulletProofBuilder()
+        self.assertEqual(len(bpi.Gprec), bp.BP_M * bp.BP_N)
+        self.assertEqual(len(bpi.Hprec), bp.BP_M * bp.BP_N)
+        for i in (0, 1, 255, 256, 700, bp.BP_M * bp.BP_N - 1):
+            self.assertEqual(bpi.Gprec.to(i), bp.get_exponent(None, bp.XMR_H, i * 2 + 1))
+            self.assertEqual(bpi.Hprec.to(i), bp.get_exponent(None, bp.XMR_H, i * 2))
+
+    def test_multiexp_pippenger(self):
+        points = [crypto.encodepoint(crypto.scalarmult_base(crypto.sc_init(i + 1))) for i in range(20)]
+        scalars = [crypto.encodeint(crypto.random_scalar()) for _ in range(20)]
+        scalars[3] = bp.ZERO
+        scalars[4] = bp.MINUS_ONE
+
+        seq = bp.MultiExpSequential(points=points)
+        for sc in scalars:
+            seq.add_scalar(sc)
+        res = bp.multiexp(None, seq)
+
+        for budget, window in ((8 * 1024, 3), (1024, 2), (4096, 5), (0, 4)):
+            muex = bp.MultiExpPippenger(points=points, budget=budget, window=window)
+            for sc in scalars:
+                muex.add_scalar(sc)
+            self.assertEqual(bp.multiexp(None, muex), res)
+
+    def test_pippenger_window(self):
+        for window in (0, 10):
+            with self.assertRaises(ValueError):
+                bp.MultiExpPippenger(window=window)
+
     def test_prove_batch(self):
         bpi = bp.BulletProofBuilder()
         sv = [crypto.sc_init(123), crypto.sc_init(768)]
@@ -1,5 +1,7 @@
 from common import *
 
+from apps.common import cache
+from apps.monero import misc
 from apps.monero.xmr import crypto, monero
 from apps.monero.xmr.addresses import encode_addr
 from apps.monero.xmr.credentials import AccountCreds
@@ -233,6 +235,36 @@ class TestMoneroCrypto(unittest.TestCase):
         )
         self.assertEqual(pkey_ex, crypto.encodepoint(pkey_comp))
 
+    def test_subaddress_cache(self):
+        creds = AccountCreds.new_wallet(crypto.random_scalar(), crypto.random_scalar())
+        expected = monero.compute_subaddresses(creds, 1, range(6))
+
+        sub_cache = monero.SubaddressCache(b"", 4)
+        res = monero.compute_subaddresses(creds, 1, [0, 1, 2], None, sub_cache)
+        res = monero.compute_subaddresses(creds, 1, range(6), res, sub_cache)
+        self.assertEqual(res, expected)
+        # the cache is bounded
+        self.assertEqual(sub_cache.size, 4)
+        self.assertEqual(sub_cache.get(1, 4), None)
+        self.assertEqual(res[sub_cache.get(1, 3)], (1, 3))
+
+        # cached keys are used instead of computing them
+        sub_cache.keys[1][0] = b"cached"
+        res = monero.compute_subaddresses(creds, 1, [0], None, sub_cache)
+        self.assertEqual(res, {b"cached": (1, 0)})
+
+    def test_subaddress_session_cache(self):
+        creds = AccountCreds.new_wallet(crypto.random_scalar(), crypto.random_scalar())
+        sub_cache = misc.get_subaddress_cache(creds)
+        self.assertIs(misc.get_subaddress_cache(creds), sub_cache)
+
+        other = AccountCreds.new_wallet(crypto.random_scalar(), crypto.random_scalar())
+        self.assertIsNot(misc.get_subaddress_cache(other), sub_cache)
+
+        sub_cache = misc.get_subaddress_cache(creds)
+        cache.clear()
+        self.assertIsNot(misc.get_subaddress_cache(creds), sub_cache)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+from common import *
+
+from trezor.messages.MoneroKeyImageSyncStepRequest import (
+    MoneroKeyImageSyncStepRequest,
+)
+from trezor.messages.MoneroTransferDetails import MoneroTransferDetails
+
+from apps.monero import key_image_sync
+from apps.monero.xmr import crypto, monero
+from apps.monero.xmr.credentials import AccountCreds
+from apps.monero.xmr.crypto import chacha_poly
+
+
+async def no_confirm(ctx, current, total_num):
+    pass
+
+
+def fixed_scalar(r=None):
+    # the ring signatures of the key images are made deterministic
+    return crypto.sc_init(7)
+
+
+class TestMoneroKeyImageSync(unittest.TestCase):
+    def setUp(self):
+        self.creds = AccountCreds.new_wallet(
+            crypto.random_scalar(), crypto.random_scalar()
+        )
+        self.enc_key = crypto.random_bytes(32)
+        self.confirm = key_image_sync.confirms.keyimage_sync_step
+        self.random_scalar = crypto.random_scalar
+        key_image_sync.confirms.keyimage_sync_step = no_confirm
+        crypto.random_scalar = fixed_scalar
+
+    def tearDown(self):
+        key_image_sync.confirms.keyimage_sync_step = self.confirm
+        crypto.random_scalar = self.random_scalar
+
+    def transfer_details(self, num):
+        tdis = []
+        for i in range(num):
+            r = crypto.sc_init(1000 + i)
+            derivation = crypto.generate_key_derivation(
+                self.creds.view_key_public, r
+            )
+            out_key = crypto.derive_public_key(
+                derivation, i, self.creds.spend_key_public
+            )
+            tdis.append(
+                MoneroTransferDetails(
+                    out_key=crypto.encodepoint(out_key),
+                    tx_pub_key=crypto.encodepoint(crypto.scalarmult_base(r)),
+                    internal_output_index=i,
+                )
+            )
+        return tdis
+
+    def sync_state(self, num, batch):
+        s = key_image_sync.KeyImageSync()
+        s.creds = self.creds
+        s.num_outputs = num
+        s.enc_key = self.enc_key
+        s.batch = batch
+        monero.compute_subaddresses(self.creds, 0, [0], s.subaddresses)
+        return s
+
+    def test_sync_step_batch(self):
+        num = 4
+        tds = MoneroKeyImageSyncStepRequest(tdis=self.transfer_details(num))
+
+        s = self.sync_state(num, False)
+        res = run_sync(key_image_sync._sync_step(s, None, tds))
+        self.assertEqual(len(res.kis), num)
+        single = b""
+        for ki in res.kis:
+            plain = chacha_poly.decrypt(self.enc_key, ki.iv, ki.blob)
+            self.assertEqual(len(plain), 96)
+            single += plain
+        digest = s.hasher.digest()
+
+        s = self.sync_state(num, True)
+        res = run_sync(key_image_sync._sync_step(s, None, tds))
+        self.assertEqual(len(res.kis), 1)
+        batch = chacha_poly.decrypt(self.enc_key, res.kis[0].iv, res.kis[0].blob)
+        self.assertEqual(batch, single)
+
+        # both modes hash the transfer details the same way
+        self.assertEqual(s.current_output, num - 1)
+        self.assertEqual(s.hasher.digest(), digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -76,6 +76,43 @@ class TestMoneroSerializer(unittest.TestCase):
     def setUp(self):
         self.tdata.reset()
 
+    def test_readwriter(self):
+        writer = MemoryReaderWriter(preallocate=4)
+        writer.write(b"\x01\x02")
+        writer.write(bytes(range(3, 40)))
+        writer.write(b"")
+        self.assertEqual(bytes(writer.get_buffer()), bytes(range(1, 40)))
+
+        buf = bytearray(10)
+        self.assertEqual(writer.readinto(buf), 10)
+        self.assertEqual(buf, bytes(range(1, 11)))
+        self.assertEqual(bytes(writer.get_buffer()), bytes(range(11, 40)))
+        self.assertEqual(writer.readinto(bytearray(100)), 29)
+        self.assertTrue(writer.is_empty())
+        with self.assertRaises(EOFError):
+            writer.readinto(bytearray(1))
+
+    def test_readwriter_threshold(self):
+        writer = MemoryReaderWriter(threshold=8)
+        writer.write(bytes(range(20)))
+        buf = bytearray(6)
+        writer.readinto(buf)
+        writer.readinto(buf)
+        # read data are dropped, the buffer is not reallocated
+        self.assertEqual(writer.offset, 0)
+        self.assertEqual(len(writer.buffer), 20)
+        self.assertEqual(bytes(writer.get_buffer()), bytes(range(12, 20)))
+
+        writer.write(bytes(range(20, 30)))
+        self.assertEqual(len(writer.buffer), 20)
+        self.assertEqual(bytes(writer.get_buffer()), bytes(range(12, 30)))
+
+        reader = MemoryReaderWriter(memoryview(bytes(range(20))), threshold=8)
+        reader.readinto(bytearray(10))
+        self.assertEqual(bytes(reader.get_buffer()), bytes(range(10, 20)))
+        self.assertEqual(reader.readinto(bytearray(20)), 10)
+        self.assertTrue(reader.is_empty())
+
     def test_varint(self):
         """
         Var int
@@ -0,0 +1,52 @@
+from common import *
+
+from trezor import wire
+from trezor.messages import MessageType
+
+from apps import registry
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.handlers = wire.workflow_handlers
+        wire.workflow_handlers = {}
+
+    def tearDown(self):
+        wire.workflow_handlers = self.handlers
+
+    def test_lazy_boot(self):
+        registry.boot()
+        mtypes = set(mtype for mtype, _ in registry.WORKFLOWS)
+        self.assertEqual(set(wire.workflow_handlers), mtypes)
+        for handler, _ in wire.workflow_handlers.values():
+            self.assertIs(handler, wire.lazy_workflow)
+
+        for pkgname in set(pkgname for _, pkgname in registry.WORKFLOWS):
+            wire.boot_lazy(pkgname)
+
+        # the packages registered their workflows for all the types in the
+        # registry, and for nothing else
+        registered = set(wire.workflow_handlers)
+        if __debug__:
+            self.assertEqual(registered, mtypes)
+        else:
+            debug_only = set((MessageType.LoadDevice, MessageType.DebugMoneroDiagRequest))
+            self.assertEqual(registered, mtypes - debug_only)
+        for handler, _ in wire.workflow_handlers.values():
+            self.assertIsNot(handler, wire.lazy_workflow)
+
+    def test_lazy_boot_failure(self):
+        wire.add_lazy(MessageType.GetAddress, 'apps.nonexistent')
+        wire.add_lazy(MessageType.SignTx, 'apps.nonexistent')
+        with self.assertRaises(ImportError):
+            wire.boot_lazy('apps.nonexistent')
+        # the package is booted again with the next message
+        self.assertEqual(wire.workflow_handlers, {
+            MessageType.GetAddress: (wire.lazy_workflow, ('apps.nonexistent',)),
+            MessageType.SignTx: (wire.lazy_workflow, ('apps.nonexistent',)),
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
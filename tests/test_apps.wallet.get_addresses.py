@@ -0,0 +1,50 @@
+from common import *
+
+from trezor import wire
+from trezor.crypto import bip32, bip39
+from trezor.messages import InputScriptType
+
+from apps.common import coins
+from apps.common.paths import HARDENED
+from apps.common.seed import Keychain
+from apps.wallet.get_addresses import get_addresses
+from apps.wallet.messages import GetAddresses
+from apps.wallet.sign_tx.addresses import get_address
+
+
+class TestGetAddresses(unittest.TestCase):
+
+    def setUp(self):
+        self.seed = bip39.seed(' '.join(['all'] * 12), '')
+
+    def test_get_addresses(self):
+        coin = coins.by_name('Testnet')
+        chain_path = [84 | HARDENED, 1 | HARDENED, 0 | HARDENED, 0]
+        keychain = Keychain(self.seed, [['secp256k1']])
+        msg = GetAddresses(
+            address_n=chain_path,
+            start=5,
+            count=10,
+            coin_name='Testnet',
+            script_type=InputScriptType.SPENDWITNESS,
+        )
+        res = run_sync(get_addresses(None, msg, keychain))
+
+        root = bip32.from_seed(self.seed, 'secp256k1')
+        self.assertEqual(res.start, 5)
+        self.assertEqual(len(res.addresses), 10)
+        for i, address in enumerate(res.addresses):
+            node = root.clone()
+            node.derive_path(chain_path + [5 + i])
+            self.assertEqual(address, get_address(InputScriptType.SPENDWITNESS, coin, node))
+
+    def test_invalid_count(self):
+        keychain = Keychain(self.seed, [['secp256k1']])
+        for count in (None, 0, 1001):
+            msg = GetAddresses(address_n=[44 | HARDENED, 0 | HARDENED, 0 | HARDENED, 0], count=count)
+            with self.assertRaises(wire.DataError):
+                run_sync(get_addresses(None, msg, keychain))
+
+
+if __name__ == '__main__':
+    unittest.main()
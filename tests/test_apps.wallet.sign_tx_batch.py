@@ -0,0 +1,109 @@
+from common import *
+
+from trezor import wire
+from trezor.crypto import bip39
+from trezor.messages import InputScriptType, MessageType, OutputScriptType
+from trezor.messages.RequestType import TXINPUT, TXOUTPUT, TXMETA, TXFINISHED
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxOutputType import TxOutputType
+
+from apps.common.seed import Keychain
+from apps.wallet.messages import SignTxBatch
+from apps.wallet.sign_tx import layout
+from apps.wallet.sign_tx_batch import sign_tx_batch
+
+PREV_HASH = unhexlify('dbd1a797646bb0776d5389dcebf675344292080f5cee10c086af67da2cf5266b')
+
+
+def new_tx(coin_name='Bitcoin'):
+    return SignTx(coin_name=coin_name, version=1, lock_time=0, inputs_count=1, outputs_count=2)
+
+
+def tx_ack(req):
+    # the host side of a transaction spending output 0 of PREV_HASH
+    i = req.details.request_index
+    if req.request_type == TXMETA:
+        return TransactionType(version=1, lock_time=0, inputs_cnt=1, outputs_cnt=2, extra_data_len=0)
+    elif req.request_type == TXINPUT and req.details.tx_hash is not None:
+        return TransactionType(inputs=[TxInputType(script_sig=unhexlify('51'), prev_hash=b'\x11' * 32, prev_index=0)])
+    elif req.request_type == TXOUTPUT and req.details.tx_hash is not None:
+        amount, script_pubkey = [
+            (100000, unhexlify('76a9149c9d21f47382762df3ad81391ee0964b28dd951788ac')),
+            (200000, unhexlify('76a914c50c21df6dc132a95b0e70249d6dffd6e95b0d1388ac')),
+        ][i]
+        return TransactionType(bin_outputs=[TxOutputBinType(amount=amount, script_pubkey=script_pubkey)])
+    elif req.request_type == TXINPUT:
+        return TransactionType(inputs=[TxInputType(address_n=[44 | 0x80000000, 0x80000000, 0x80000000, 0, 0], prev_hash=PREV_HASH, prev_index=0, script_type=InputScriptType.SPENDADDRESS)])
+    elif req.request_type == TXOUTPUT:
+        if i == 0:
+            txo = TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1', amount=80000, script_type=OutputScriptType.PAYTOADDRESS)
+        else:
+            txo = TxOutputType(address_n=[44 | 0x80000000, 0x80000000, 0x80000000, 1, 0], amount=10000, script_type=OutputScriptType.PAYTOADDRESS)
+        return TransactionType(outputs=[txo])
+
+
+class FakeContext:
+
+    def __init__(self, txs):
+        self.txs = txs  # SignTx of the transactions after the first one
+        self.finished = []  # wire types expected after every finished transaction
+
+    async def call(self, req, *types):
+        if req.request_type == TXFINISHED:
+            self.finished.append(types)
+            return self.txs.pop(0)
+        return TxAck(tx=tx_ack(req))
+
+
+async def confirm(ctx, *args):
+    return True
+
+
+class TestSignTxBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.seed = bip39.seed(' '.join(['all'] * 12), '')
+        self.confirm_output = layout.confirm_output
+        self.confirm_total = layout.confirm_total
+        layout.confirm_output = confirm
+        layout.confirm_total = confirm
+
+    def tearDown(self):
+        layout.confirm_output = self.confirm_output
+        layout.confirm_total = self.confirm_total
+
+    def test_invalid_count(self):
+        keychain = Keychain(self.seed, [['secp256k1']])
+        tx = SignTx(coin_name='Bitcoin', inputs_count=1, outputs_count=1)
+        for count in (None, 0, 101):
+            with self.assertRaises(wire.DataError):
+                run_sync(sign_tx_batch(None, SignTxBatch(count=count, tx=tx), keychain))
+
+    def test_missing_tx(self):
+        keychain = Keychain(self.seed, [['secp256k1']])
+        with self.assertRaises(wire.DataError):
+            run_sync(sign_tx_batch(None, SignTxBatch(count=2), keychain))
+
+    def test_two_transactions(self):
+        keychain = Keychain(self.seed, [['secp256k1']])
+        ctx = FakeContext([new_tx()])
+        res = run_sync(sign_tx_batch(ctx, SignTxBatch(count=2, tx=new_tx()), keychain))
+        # the first transaction is finished by SignTx of the second one
+        self.assertEqual(ctx.finished, [(MessageType.SignTx,)])
+        self.assertEqual(ctx.txs, [])
+        self.assertEqual(res.request_type, TXFINISHED)
+
+    def test_coin_mismatch(self):
+        keychain = Keychain(self.seed, [['secp256k1']])
+        ctx = FakeContext([new_tx('Testnet')])
+        with self.assertRaises(wire.DataError):
+            run_sync(sign_tx_batch(ctx, SignTxBatch(count=2, tx=new_tx()), keychain))
+        self.assertEqual(ctx.finished, [(MessageType.SignTx,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,269 @@
+from common import *
+
+from trezor import wire
+from trezor.utils import chunks
+from trezor.crypto import bip39
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputType import TxOutputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.RequestType import TXINPUT, TXOUTPUT, TXMETA, TXFINISHED
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+from trezor.messages.TxRequestSerializedType import TxRequestSerializedType
+from trezor.messages import InputScriptType, OutputScriptType
+
+from apps.common import coins
+from apps.common.seed import Keychain
+from apps.wallet.sign_tx import helpers, signing
+
+
+# previous transaction with two outputs, both spent below
+PREV_HASH = unhexlify('dbd1a797646bb0776d5389dcebf675344292080f5cee10c086af67da2cf5266b')
+
+
+def new_tx_req(serialized=None):
+    tx_req = TxRequest()
+    tx_req.details = TxRequestDetailsType()
+    tx_req.serialized = serialized
+    return tx_req
+
+
+class TestSignTxBatch(unittest.TestCase):
+    # pylint: disable=C0301
+
+    def test_two_two_batch(self):
+        coin_bitcoin = coins.by_name('Bitcoin')
+
+        ptx1 = TransactionType(version=1, lock_time=0, inputs_cnt=1, outputs_cnt=2, extra_data_len=0)
+        pinp1 = TxInputType(script_sig=unhexlify('51'),
+                            prev_hash=b'\x11' * 32,
+                            prev_index=0,
+                            script_type=None,
+                            sequence=None)
+        pout1 = TxOutputBinType(script_pubkey=unhexlify('76a9149c9d21f47382762df3ad81391ee0964b28dd951788ac'),
+                                amount=100000)
+        pout2 = TxOutputBinType(script_pubkey=unhexlify('76a914c50c21df6dc132a95b0e70249d6dffd6e95b0d1388ac'),
+                                amount=200000)
+
+        inp1 = TxInputType(address_n=[44 | 0x80000000, 0 | 0x80000000, 0 | 0x80000000, 0, 0],
+                           prev_hash=PREV_HASH,
+                           prev_index=0,
+                           script_type=InputScriptType.SPENDADDRESS,
+                           sequence=None)
+        inp2 = TxInputType(address_n=[44 | 0x80000000, 0 | 0x80000000, 0 | 0x80000000, 0, 1],
+                           prev_hash=PREV_HASH,
+                           prev_index=1,
+                           script_type=InputScriptType.SPENDADDRESS,
+                           sequence=None)
+        out1 = TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                            amount=250000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            address_n=[],
+                            multisig=None)
+        out2 = TxOutputType(address_n=[44 | 0x80000000, 0 | 0x80000000, 0 | 0x80000000, 1, 0],
+                            amount=40000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            multisig=None)
+        tx = SignTx(coin_name='Bitcoin', version=1, lock_time=0, inputs_count=2, outputs_count=2, batch_size=8)
+
+        messages = [
+            None,
+
+            # phase 1, both inputs are received in one TxAck
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(inputs=[inp1, inp2])),
+            TxRequest(request_type=TXMETA, details=TxRequestDetailsType(request_index=None, tx_hash=PREV_HASH), serialized=None),
+            TxAck(tx=ptx1),
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=PREV_HASH), serialized=None),
+            TxAck(tx=TransactionType(inputs=[pinp1])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=PREV_HASH, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(bin_outputs=[pout1, pout2])),
+            # the second input is taken from the batch, its previous
+            # transaction from the cache
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(outputs=[out1, out2])),
+            helpers.UiConfirmOutput(out1, coin_bitcoin),
+            True,
+            helpers.UiConfirmTotal(250000 + 10000, 10000, coin_bitcoin),
+            True,
+
+            # phase 2, each legacy sighash is streamed in batches
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(inputs=[inp1, inp2])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(outputs=[out1, out2])),
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=TxRequestSerializedType(
+                signature_index=0,
+                signature=unhexlify('3045022100f0214429b68b4f4fcd9a590b70655000dcedcf6f2468da32972e6f25665db2bc02202942286ad0ef332f2cee12444fd1fe404bb716763fd18fa8b1267d79662bcbb1'),
+                serialized_tx=unhexlify('01000000026b26f52cda67af86c010ee5c0f0892423475f6ebdc89536d77b06b6497a7d1db000000006b483045022100f0214429b68b4f4fcd9a590b70655000dcedcf6f2468da32972e6f25665db2bc02202942286ad0ef332f2cee12444fd1fe404bb716763fd18fa8b1267d79662bcbb10121027a4cebff51c97c047637cda66838e8b64421a4af6bf8ef3c99717f92d09b3c1dffffffff'))),
+            TxAck(tx=TransactionType(inputs=[inp1, inp2])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(outputs=[out1, out2])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None), serialized=TxRequestSerializedType(
+                signature_index=1,
+                signature=unhexlify('304402200f279ed05fb39b59f63cee8bd8ae48dfb33c486cb7d7c758dd85fe1028c7d7f8022034ddc8b83a239360794e7ab262b7e5f4afd20d213f10d6dba9df5b3e795e85ed'),
+                serialized_tx=unhexlify('6b26f52cda67af86c010ee5c0f0892423475f6ebdc89536d77b06b6497a7d1db010000006a47304402200f279ed05fb39b59f63cee8bd8ae48dfb33c486cb7d7c758dd85fe1028c7d7f8022034ddc8b83a239360794e7ab262b7e5f4afd20d213f10d6dba9df5b3e795e85ed01210211f631d650690124c152853ad1cc86349264ea2c62080544c8c7f6949c727414ffffffff'))),
+            TxAck(tx=TransactionType(outputs=[out1])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=1, tx_hash=None), serialized=TxRequestSerializedType(
+                signature_index=None,
+                signature=None,
+                serialized_tx=unhexlify('0290d00300000000001976a914de9b2a8da088824e8fe51debea566617d851537888ac'))),
+            TxAck(tx=TransactionType(outputs=[out2])),
+            TxRequest(request_type=TXFINISHED, details=None, serialized=TxRequestSerializedType(
+                signature_index=None,
+                signature=None,
+                serialized_tx=unhexlify('409c0000000000001976a9141c07afb85ee3408f8fd1fc9c5b5361800c28d2eb88ac00000000'),
+            )),
+        ]
+
+        seed = bip39.seed('alcohol woman abuse must during monitor noble actual mixed trade anger aisle', '')
+        keychain = Keychain(seed, [[coin_bitcoin.curve_name]])
+        signer = signing.sign_tx(tx, keychain)
+
+        for request, response in chunks(messages, 2):
+            res = signer.send(request)
+            self.assertEqual(res, response)
+
+        with self.assertRaises(StopIteration):
+            signer.send(None)
+
+    def test_two_two_batch_legacy_cache(self):
+        coin_bitcoin = coins.by_name('Bitcoin')
+
+        ptx1 = TransactionType(version=1, lock_time=0, inputs_cnt=1, outputs_cnt=2, extra_data_len=0)
+        pinp1 = TxInputType(script_sig=unhexlify('51'),
+                            prev_hash=b'\x11' * 32,
+                            prev_index=0,
+                            script_type=None,
+                            sequence=None)
+        pout1 = TxOutputBinType(script_pubkey=unhexlify('76a9149c9d21f47382762df3ad81391ee0964b28dd951788ac'),
+                                amount=100000)
+        pout2 = TxOutputBinType(script_pubkey=unhexlify('76a914c50c21df6dc132a95b0e70249d6dffd6e95b0d1388ac'),
+                                amount=200000)
+
+        inp1 = TxInputType(address_n=[44 | 0x80000000, 0 | 0x80000000, 0 | 0x80000000, 0, 0],
+                           prev_hash=PREV_HASH,
+                           prev_index=0,
+                           script_type=InputScriptType.SPENDADDRESS,
+                           sequence=None)
+        inp2 = TxInputType(address_n=[44 | 0x80000000, 0 | 0x80000000, 0 | 0x80000000, 0, 1],
+                           prev_hash=PREV_HASH,
+                           prev_index=1,
+                           script_type=InputScriptType.SPENDADDRESS,
+                           sequence=None)
+        out1 = TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                            amount=250000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            address_n=[],
+                            multisig=None)
+        out2 = TxOutputType(address_n=[44 | 0x80000000, 0 | 0x80000000, 0 | 0x80000000, 1, 0],
+                            amount=40000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            multisig=None)
+        tx = SignTx(coin_name='Bitcoin', version=1, lock_time=0, inputs_count=2, outputs_count=2, batch_size=8, legacy_cache=True)
+
+        messages = [
+            None,
+
+            # phase 1, both inputs are received in one TxAck
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(inputs=[inp1, inp2])),
+            TxRequest(request_type=TXMETA, details=TxRequestDetailsType(request_index=None, tx_hash=PREV_HASH), serialized=None),
+            TxAck(tx=ptx1),
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=PREV_HASH), serialized=None),
+            TxAck(tx=TransactionType(inputs=[pinp1])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=PREV_HASH, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(bin_outputs=[pout1, pout2])),
+            # the second input is taken from the batch, its previous
+            # transaction from the cache
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(outputs=[out1, out2])),
+            helpers.UiConfirmOutput(out1, coin_bitcoin),
+            True,
+            helpers.UiConfirmTotal(250000 + 10000, 10000, coin_bitcoin),
+            True,
+
+            # phase 2, the legacy sighash of the first input is streamed in
+            # batches, the second input is then requested alone
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(inputs=[inp1, inp2])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None, request_count=2), serialized=None),
+            TxAck(tx=TransactionType(outputs=[out1, out2])),
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=1, tx_hash=None), serialized=TxRequestSerializedType(
+                signature_index=0,
+                signature=unhexlify('3045022100f0214429b68b4f4fcd9a590b70655000dcedcf6f2468da32972e6f25665db2bc02202942286ad0ef332f2cee12444fd1fe404bb716763fd18fa8b1267d79662bcbb1'),
+                serialized_tx=unhexlify('01000000026b26f52cda67af86c010ee5c0f0892423475f6ebdc89536d77b06b6497a7d1db000000006b483045022100f0214429b68b4f4fcd9a590b70655000dcedcf6f2468da32972e6f25665db2bc02202942286ad0ef332f2cee12444fd1fe404bb716763fd18fa8b1267d79662bcbb10121027a4cebff51c97c047637cda66838e8b64421a4af6bf8ef3c99717f92d09b3c1dffffffff'))),
+            TxAck(tx=TransactionType(inputs=[inp2])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None), serialized=TxRequestSerializedType(
+                signature_index=1,
+                signature=unhexlify('304402200f279ed05fb39b59f63cee8bd8ae48dfb33c486cb7d7c758dd85fe1028c7d7f8022034ddc8b83a239360794e7ab262b7e5f4afd20d213f10d6dba9df5b3e795e85ed'),
+                serialized_tx=unhexlify('6b26f52cda67af86c010ee5c0f0892423475f6ebdc89536d77b06b6497a7d1db010000006a47304402200f279ed05fb39b59f63cee8bd8ae48dfb33c486cb7d7c758dd85fe1028c7d7f8022034ddc8b83a239360794e7ab262b7e5f4afd20d213f10d6dba9df5b3e795e85ed01210211f631d650690124c152853ad1cc86349264ea2c62080544c8c7f6949c727414ffffffff'))),
+            TxAck(tx=TransactionType(outputs=[out1])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=1, tx_hash=None), serialized=TxRequestSerializedType(
+                signature_index=None,
+                signature=None,
+                serialized_tx=unhexlify('0290d00300000000001976a914de9b2a8da088824e8fe51debea566617d851537888ac'))),
+            TxAck(tx=TransactionType(outputs=[out2])),
+            TxRequest(request_type=TXFINISHED, details=None, serialized=TxRequestSerializedType(
+                signature_index=None,
+                signature=None,
+                serialized_tx=unhexlify('409c0000000000001976a9141c07afb85ee3408f8fd1fc9c5b5361800c28d2eb88ac00000000'),
+            )),
+        ]
+
+        seed = bip39.seed('alcohol woman abuse must during monitor noble actual mixed trade anger aisle', '')
+        keychain = Keychain(seed, [[coin_bitcoin.curve_name]])
+        signer = signing.sign_tx(tx, keychain)
+
+        for request, response in chunks(messages, 2):
+            res = signer.send(request)
+            self.assertEqual(res, response)
+
+        with self.assertRaises(StopIteration):
+            signer.send(None)
+
+    def test_handed_out_once(self):
+        batch = helpers.TxBatch(8)
+        batch.requested = 3
+        inputs = [TxInputType(prev_index=i) for i in range(3)]
+        batch.push(TXINPUT, None, 4, inputs)
+        tx_req = new_tx_req()
+
+        self.assertEqual(batch.pop(tx_req, TXINPUT, None, 4), None)  # returned by the request
+        self.assertEqual(batch.pop(tx_req, TXINPUT, None, 5), inputs[1])
+        self.assertEqual(batch.pop(tx_req, TXINPUT, None, 5), None)
+        self.assertEqual(batch.pop(tx_req, TXOUTPUT, None, 6), None)
+        self.assertEqual(batch.pop(tx_req, TXINPUT, PREV_HASH, 6), None)
+        self.assertEqual(batch.pop(tx_req, TXINPUT, None, 6), inputs[2])
+        self.assertEqual(batch.pop(tx_req, TXINPUT, None, 7), None)
+
+    def test_too_many_items(self):
+        batch = helpers.TxBatch(2)
+        getter = helpers.request_tx_input(new_tx_req(), 0, batch=batch, count=4)
+        req = getter.send(None)
+        self.assertEqual(req.details.request_count, 2)
+        # the host must not send more than requested
+        inputs = [TxInputType(prev_index=i) for i in range(3)]
+        with self.assertRaises(wire.DataError):
+            getter.send(TxAck(tx=TransactionType(inputs=inputs)))
+
+    def test_serialized_pending(self):
+        batch = helpers.TxBatch(8)
+        batch.requested = 2
+        inputs = [TxInputType(prev_index=i) for i in range(2)]
+        batch.push(TXINPUT, None, 0, inputs)
+
+        # the serialized data must be sent with a request, the item is not
+        # taken from the batch
+        tx_req = new_tx_req(TxRequestSerializedType(serialized_tx=b'\x00'))
+        self.assertEqual(batch.pop(tx_req, TXINPUT, None, 1), None)
+
+        tx_req.serialized = None
+        self.assertEqual(batch.pop(tx_req, TXINPUT, None, 1), inputs[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+from common import *
+
+from trezor.crypto import bip39
+from trezor.crypto.hashlib import sha256
+from trezor.messages import InputScriptType, OutputScriptType
+from trezor.messages.RequestType import TXINPUT, TXOUTPUT, TXFINISHED
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputType import TxOutputType
+from trezor.messages.TxRequest import TxRequest
+from trezor.utils import HashWriter
+
+from apps.common import cache, coins
+from apps.common.seed import Keychain
+from apps.wallet.sign_tx import checkpoint, helpers, segwit_bip143, signing
+from apps.wallet.sign_tx.writers import get_tx_hash
+
+
+def new_tx(lock_time=0):
+    return helpers.sanitize_sign_tx(SignTx(coin_name='Bitcoin', inputs_count=10, outputs_count=2, lock_time=lock_time))
+
+
+def phase1_state():
+    h_first = HashWriter(sha256())
+    h_first.extend(b'inputs and outputs')
+    hash143 = segwit_bip143.Bip143()
+    hash143.h_prevouts.extend(b'prevouts')
+    hash143.h_sequence.extend(b'sequence')
+    hash143.h_outputs.extend(b'outputs')
+    segwit = {i: i % 3 == 0 for i in range(10)}
+    wallet_path = [0x80000000 | 44, 0x80000000, 0x80000000]
+    return h_first, hash143, segwit, wallet_path
+
+
+def bgold_tx(inputs, outputs, **kwargs):
+    return SignTx(coin_name='Bgold', version=1, lock_time=0, inputs_count=len(inputs), outputs_count=len(outputs), checkpoints=True, **kwargs)
+
+
+def run_signer(signer, inputs, outputs):
+    # answers every request of the signer, returns the first request and the
+    # checkpoints received along with the signed inputs
+    first = None
+    checkpoints = []
+    res = signer.send(None)
+    while True:
+        if isinstance(res, TxRequest):
+            if first is None:
+                first = (res.request_type, res.details.request_index)
+            if res.serialized is not None and res.serialized.checkpoint is not None:
+                checkpoints.append(bytes(res.serialized.checkpoint))
+            if res.request_type == TXFINISHED:
+                break
+            elif res.request_type == TXINPUT:
+                res = signer.send(TxAck(tx=TransactionType(inputs=[inputs[res.details.request_index]])))
+            elif res.request_type == TXOUTPUT:
+                res = signer.send(TxAck(tx=TransactionType(outputs=[outputs[res.details.request_index]])))
+        else:
+            res = signer.send(True)  # confirmation dialogs
+    return first, checkpoints
+
+
+class TestSignTxCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_roundtrip(self):
+        tx = new_tx()
+        h_first, hash143, segwit, wallet_path = phase1_state()
+        cp = checkpoint.Checkpoint(tx, h_first, hash143, segwit, wallet_path)
+
+        restored = segwit_bip143.Bip143()
+        h, sw, ai, wp, i_next = checkpoint.load(tx, cp.dump(4, 123456789), restored)
+        self.assertEqual(get_tx_hash(h), get_tx_hash(h_first))
+        self.assertEqual(get_tx_hash(restored.h_prevouts), get_tx_hash(hash143.h_prevouts))
+        self.assertEqual(get_tx_hash(restored.h_sequence), get_tx_hash(hash143.h_sequence))
+        self.assertEqual(get_tx_hash(restored.h_outputs), get_tx_hash(hash143.h_outputs))
+        self.assertEqual(sw, segwit)
+        self.assertEqual(ai, 123456789)
+        self.assertEqual(wp, wallet_path)
+        self.assertEqual(i_next, 4)
+
+    def test_no_wallet_path(self):
+        tx = new_tx()
+        h_first, hash143, segwit, _ = phase1_state()
+        cp = checkpoint.Checkpoint(tx, h_first, hash143, segwit, None)
+        _, _, _, wp, _ = checkpoint.load(tx, cp.dump(0, 0), segwit_bip143.Bip143())
+        self.assertEqual(wp, None)
+
+    def test_invalid(self):
+        tx = new_tx()
+        cp = checkpoint.Checkpoint(tx, *phase1_state())
+        data = cp.dump(4, 123456789)
+
+        tampered = bytearray(data)
+        tampered[1] = 9  # index of the next input
+        with self.assertRaises(checkpoint.CheckpointError):
+            checkpoint.load(tx, tampered, segwit_bip143.Bip143())
+
+        with self.assertRaises(checkpoint.CheckpointError):
+            checkpoint.load(tx, data[:-1], segwit_bip143.Bip143())
+
+        with self.assertRaises(checkpoint.CheckpointError):
+            checkpoint.load(new_tx(lock_time=1), data, segwit_bip143.Bip143())
+
+        # the key is dropped together with the session
+        cache.clear()
+        with self.assertRaises(checkpoint.CheckpointError):
+            checkpoint.load(tx, data, segwit_bip143.Bip143())
+
+    def test_resume_bip143(self):
+        # bitcoin gold signs every input with bip143, the authorized amount
+        # is spent already in the first signing loop
+        coin = coins.by_name('Bgold')
+        seed = bip39.seed('alcohol woman abuse must during monitor noble actual mixed trade anger aisle', '')
+        keychain = Keychain(seed, [[coin.curve_name]])
+        path = [0x80000000 | 44, 0x80000000 | 156, 0x80000000]
+        amounts = [31000, 42000, 53000]
+        inputs = [
+            TxInputType(address_n=path + [0, i], prev_hash=bytes([i + 1]) * 32, prev_index=0, amount=amount, script_type=InputScriptType.SPENDADDRESS, sequence=0xffffffff)
+            for i, amount in enumerate(amounts)
+        ]
+        outputs = [
+            TxOutputType(address_n=path + [1, 0], amount=sum(amounts) - 1000, script_type=OutputScriptType.PAYTOADDRESS),
+        ]
+
+        first, checkpoints = run_signer(signing.sign_tx(bgold_tx(inputs, outputs), keychain), inputs, outputs)
+        self.assertEqual(first, (TXINPUT, 0))
+        self.assertEqual(len(checkpoints), len(inputs))
+        for i, data in enumerate(checkpoints):
+            _, _, authorized_in, _, i_next = checkpoint.load(bgold_tx(inputs, outputs), data, segwit_bip143.Bip143())
+            self.assertEqual(i_next, i + 1)
+            self.assertEqual(authorized_in, sum(amounts[i + 1:]))
+
+        # signing resumes at the input after the checkpoint
+        tx = bgold_tx(inputs, outputs, checkpoint=checkpoints[0])
+        first, _ = run_signer(signing.sign_tx(tx, keychain), inputs, outputs)
+        self.assertEqual(first, (TXINPUT, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
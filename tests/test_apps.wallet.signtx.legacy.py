@@ -0,0 +1,88 @@
+from common import *
+from trezor.crypto.hashlib import sha256
+from trezor.messages import InputScriptType
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.utils import HashWriter
+
+from apps.common import coins
+from apps.wallet.sign_tx import writers
+from apps.wallet.sign_tx.legacy import LegacyPreimage
+
+
+def sample_inputs():
+    return [
+        TxInputType(
+            address_n=[0x8000002C, 0x80000000, 0x80000000, 0, i],
+            prev_hash=bytes([i]) * 32,
+            prev_index=i,
+            script_type=InputScriptType.SPENDADDRESS,
+            sequence=0xFFFFFFFF - i,
+        )
+        for i in range(3)
+    ]
+
+
+def sample_outputs():
+    return [
+        TxOutputBinType(amount=100000 + o, script_pubkey=bytes([o]) * 25)
+        for o in range(2)
+    ]
+
+
+def full_preimage_hash(coin, tx, inputs, outputs, i_sign, script_code, sighash):
+    # the preimage streamed the way sign_tx did before caching
+    h_sign = HashWriter(sha256())
+    writers.write_uint32(h_sign, tx.version)
+    writers.write_varint(h_sign, len(inputs))
+    for i, txi in enumerate(inputs):
+        script_sig = txi.script_sig
+        txi.script_sig = script_code if i == i_sign else bytes()
+        writers.write_tx_input(h_sign, txi)
+        txi.script_sig = script_sig
+    writers.write_varint(h_sign, len(outputs))
+    for txo in outputs:
+        writers.write_tx_output(h_sign, txo)
+    writers.write_uint32(h_sign, tx.lock_time)
+    writers.write_uint32(h_sign, sighash)
+    return writers.get_tx_hash(h_sign, double=coin.sign_hash_double)
+
+
+class TestSignTxLegacy(unittest.TestCase):
+
+    def setUp(self):
+        self.coin = coins.by_name('Bitcoin')
+        self.tx = SignTx(coin_name='Bitcoin', version=1, lock_time=0, inputs_count=3, outputs_count=2)
+        self.inputs = sample_inputs()
+        self.outputs = sample_outputs()
+        self.legacy = LegacyPreimage(self.tx)
+        for txi in self.inputs:
+            self.legacy.add_input(txi)
+        for txo in self.outputs:
+            self.legacy.add_output(txo)
+
+    def test_preimage_hash(self):
+        script_code = unhexlify('76a914' + '11' * 20 + '88ac')
+        for i_sign in range(len(self.inputs)):
+            txi_sign = sample_inputs()[i_sign]
+            txi_sign.script_sig = script_code
+            self.assertEqual(
+                self.legacy.preimage_hash(self.coin, self.tx, i_sign, txi_sign, 1),
+                full_preimage_hash(self.coin, self.tx, self.inputs, self.outputs, i_sign, script_code, 1),
+            )
+
+    def test_check_input(self):
+        for i, txi in enumerate(sample_inputs()):
+            self.assertTrue(self.legacy.check_input(i, txi))
+        self.assertFalse(self.legacy.check_input(0, sample_inputs()[1]))
+
+        changed = sample_inputs()
+        changed[1].address_n[-1] = 5
+        self.assertFalse(self.legacy.check_input(1, changed[1]))
+        changed[2].sequence = 0
+        self.assertFalse(self.legacy.check_input(2, changed[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
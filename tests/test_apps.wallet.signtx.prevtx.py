@@ -0,0 +1,120 @@
+from common import *
+
+from trezor.utils import chunks
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.RequestType import TXINPUT, TXOUTPUT, TXMETA
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+
+from apps.common import coins
+from apps.wallet.sign_tx import helpers, signing
+
+
+PREV_HASH = unhexlify('d5f65ee80147b4bcc70b75e4bbf2d7382021b871bd8867ef8fa525ef50864882')
+
+
+def prevtx_messages():
+    ptx1 = TransactionType(version=1, lock_time=0, inputs_cnt=2, outputs_cnt=1, extra_data_len=0)
+    pinp1 = TxInputType(script_sig=unhexlify('483045022072ba61305fe7cb542d142b8f3299a7b10f9ea61f6ffaab5dca8142601869d53c0221009a8027ed79eb3b9bc13577ac2853269323434558528c6b6a7e542be46e7e9a820141047a2d177c0f3626fc68c53610b0270fa6156181f46586c679ba6a88b34c6f4874686390b4d92e5769fbb89c8050b984f4ec0b257a0e5c4ff8bd3b035a51709503'),
+                        prev_hash=unhexlify('c16a03f1cf8f99f6b5297ab614586cacec784c2d259af245909dedb0e39eddcf'),
+                        prev_index=1,
+                        script_type=None,
+                        sequence=None)
+    pinp2 = TxInputType(script_sig=unhexlify('48304502200fd63adc8f6cb34359dc6cca9e5458d7ea50376cbd0a74514880735e6d1b8a4c0221008b6ead7fe5fbdab7319d6dfede3a0bc8e2a7c5b5a9301636d1de4aa31a3ee9b101410486ad608470d796236b003635718dfc07c0cac0cfc3bfc3079e4f491b0426f0676e6643a39198e8e7bdaffb94f4b49ea21baa107ec2e237368872836073668214'),
+                        prev_hash=unhexlify('1ae39a2f8d59670c8fc61179148a8e61e039d0d9e8ab08610cb69b4a19453eaf'),
+                        prev_index=1,
+                        script_type=None,
+                        sequence=None)
+    pout1 = TxOutputBinType(script_pubkey=unhexlify('76a91424a56db43cf6f2b02e838ea493f95d8d6047423188ac'),
+                            amount=390000)
+
+    return [
+        None,
+        TxRequest(request_type=TXMETA, details=TxRequestDetailsType(request_index=None, tx_hash=PREV_HASH), serialized=None),
+        TxAck(tx=ptx1),
+        TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=PREV_HASH), serialized=None),
+        TxAck(tx=TransactionType(inputs=[pinp1])),
+        TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=1, tx_hash=PREV_HASH), serialized=None),
+        TxAck(tx=TransactionType(inputs=[pinp2])),
+        TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=PREV_HASH), serialized=None),
+        TxAck(tx=TransactionType(bin_outputs=[pout1])),
+    ]
+
+
+def prevtx_messages_batch():
+    messages = prevtx_messages()
+    pinp1 = messages[4].tx.inputs[0]
+    pinp2 = messages[6].tx.inputs[0]
+
+    return messages[:3] + [
+        TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=PREV_HASH, request_count=2), serialized=None),
+        TxAck(tx=TransactionType(inputs=[pinp1, pinp2])),
+    ] + messages[7:]
+
+
+def finish(getter, response):
+    try:
+        getter.send(response)
+    except StopIteration as e:
+        return e.value
+    raise AssertionError("unexpected request")
+
+
+def new_tx_req():
+    tx_req = TxRequest()
+    tx_req.details = TxRequestDetailsType()
+    return tx_req
+
+
+class TestSignTxPrevTx(unittest.TestCase):
+
+    def setUp(self):
+        self.coin = coins.by_name('Bitcoin')
+
+    def stream_prevtx(self, cache, prev_index=0):
+        getter = signing.get_prevtx_output_value(self.coin, new_tx_req(), PREV_HASH, prev_index, cache)
+        messages = prevtx_messages()
+        for request, response in chunks(messages[:-1], 2):
+            self.assertEqual(getter.send(request), response)
+        return finish(getter, messages[-1])
+
+    def cached_value(self, cache, prev_index=0):
+        getter = signing.get_prevtx_output_value(self.coin, new_tx_req(), PREV_HASH, prev_index, cache)
+        # no request is sent to the host
+        return finish(getter, None)
+
+    def test_cached(self):
+        cache = signing.PrevTxCache()
+        self.assertEqual(self.stream_prevtx(cache), 390000)
+        self.assertEqual(cache.lru, [PREV_HASH])
+        self.assertEqual(self.cached_value(cache), 390000)
+        self.assertEqual(self.cached_value(cache, 1), 0)
+
+    def test_no_cache(self):
+        self.assertEqual(self.stream_prevtx(None), 390000)
+        self.assertEqual(self.stream_prevtx(None), 390000)
+
+    def test_batch(self):
+        getter = signing.get_prevtx_output_value(self.coin, new_tx_req(), PREV_HASH, 0, None, helpers.TxBatch(8))
+        messages = prevtx_messages_batch()
+        for request, response in chunks(messages[:-1], 2):
+            self.assertEqual(getter.send(request), response)
+        self.assertEqual(finish(getter, messages[-1]), 390000)
+
+    def test_eviction(self):
+        cache = signing.PrevTxCache()
+        for i in range(signing._PREVTX_CACHE_SIZE):
+            cache.add(bytes([i]) * 32, [i])
+        self.assertEqual(cache.get(bytes(32)), [0])
+        cache.add(PREV_HASH, [390000])
+        # the least recently used entry is evicted
+        self.assertEqual(cache.get(bytes([1]) * 32), None)
+        self.assertEqual(cache.get(bytes(32)), [0])
+        self.assertEqual(len(cache.amounts), signing._PREVTX_CACHE_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+from common import *
+
+import protobuf
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+
+
+class ByteReader:
+    def __init__(self, data, buffered=True):
+        self.data = data
+        self.ofs = 0
+        if not buffered:
+            self.readbyte = None
+
+    async def areadinto(self, buf):
+        if len(self.data) - self.ofs < len(buf):
+            raise EOFError
+        buf[:] = self.data[self.ofs : self.ofs + len(buf)]
+        self.ofs += len(buf)
+        return len(buf)
+
+    def readbyte(self):
+        if self.ofs == len(self.data):
+            return -1
+        self.ofs += 1
+        return self.data[self.ofs - 1]
+
+
+class ByteWriter:
+    def __init__(self):
+        self.data = bytearray()
+
+    async def awrite(self, buf):
+        self.data.extend(buf)
+        return len(buf)
+
+
+def dump(msg):
+    writer = ByteWriter()
+    run_sync(protobuf.dump_message(writer, msg))
+    return bytes(writer.data)
+
+
+def load(data, msg_type, buffered=True):
+    return run_sync(protobuf.load_message(ByteReader(data, buffered), msg_type))
+
+
+def sample_txack():
+    inputs = [
+        TxInputType(
+            address_n=[0x8000002C, 0x80000000, 0x80000000, 0, i],
+            prev_hash=bytes(range(32)),
+            prev_index=i,
+            amount=123456789 + i,
+            sequence=0xFFFFFFFF,
+        )
+        for i in range(3)
+    ]
+    bin_outputs = [
+        TxOutputBinType(amount=0x7FFFFFFFFFFF, script_pubkey=bytes(25))
+    ]
+    tx = TransactionType(
+        version=2,
+        inputs=inputs,
+        bin_outputs=bin_outputs,
+        lock_time=500000,
+        overwintered=True,
+    )
+    return TxAck(tx=tx)
+
+
+class TestProtobuf(unittest.TestCase):
+
+    def test_uvarint(self):
+        for n in (0, 1, 0x7F, 0x80, 0x3FFF, 0x4000, 0xFFFFFFFF, 0xFFFFFFFFFFFF):
+            writer = ByteWriter()
+            run_sync(protobuf.dump_uvarint(writer, n))
+            self.assertEqual(len(writer.data), protobuf.count_uvarint(n))
+            for buffered in (True, False):
+                reader = ByteReader(writer.data, buffered)
+                res = run_sync(protobuf.load_uvarint(reader, reader.readbyte))
+                self.assertEqual(res, n)
+
+    def test_roundtrip(self):
+        msg = sample_txack()
+        data = dump(msg)
+        self.assertEqual(len(data), protobuf.count_message(msg))
+        for buffered in (True, False):
+            res = load(data, TxAck, buffered)
+            self.assertEqual(res, msg)
+            self.assertEqual(res.tx.inputs[2].prev_index, 2)
+            self.assertEqual(res.tx.outputs, [])
+            self.assertEqual(res.tx.expiry, None)
+
+    def test_dump_large_bytes(self):
+        extra_data = bytes(range(256)) * 2
+        msg = TransactionType(version=1, extra_data=extra_data, extra_data_len=512)
+        data = dump(msg)
+        self.assertEqual(len(data), protobuf.count_message(msg))
+        self.assertEqual(data[:5], bytes([0x08, 0x01, 0x42, 0x80, 0x04]))
+        self.assertEqual(data[5:517], extra_data)
+        self.assertEqual(load(data, TransactionType), msg)
+
+        # chunked bytes value is dumped as one field
+        chunked = TransactionType(version=1, extra_data=[extra_data[:100], extra_data[100:]], extra_data_len=512)
+        self.assertEqual(dump(chunked), data)
+
+    def test_count_sizes(self):
+        msg = sample_txack()
+        sizes = []
+        size = protobuf.count_message(msg, sizes)
+        # tx, 3 inputs, 1 bin output, in pre-order
+        self.assertEqual(len(sizes), 5)
+        self.assertEqual(sizes[0], protobuf.count_message(msg.tx))
+        self.assertEqual(sizes[1], protobuf.count_message(msg.tx.inputs[0]))
+        self.assertEqual(sizes[4], protobuf.count_message(msg.tx.bin_outputs[0]))
+        writer = ByteWriter()
+        run_sync(protobuf.dump_message(writer, msg, sizes))
+        self.assertEqual(len(writer.data), size)
+        self.assertEqual(bytes(writer.data), dump(msg))
+
+    def test_unknown_field(self):
+        # field 15 (varint) and field 16 (bytes) are not in the schema
+        data = bytes([0x08, 0x02, 0x78, 0xAC, 0x02, 0x82, 0x01, 0x02, 0xAA, 0xBB])
+        res = load(data, TransactionType)
+        self.assertEqual(res.version, 2)
+        self.assertEqual(res.inputs, [])
+
+    def test_wire_type_mismatch(self):
+        # field 1 (version) encoded as length-delimited
+        with self.assertRaises(TypeError):
+            load(bytes([0x0A, 0x01, 0x00]), TransactionType)
+
+    def test_field_table(self):
+        table = protobuf.get_field_table(TxAck)
+        self.assertIs(table, protobuf.get_field_table(TxAck))
+        self.assertIs(table[0], TxAck)
+        self.assertEqual(table[1][1][1], "tx")
+        self.assertEqual(table[1][1][5], (1 << 3) | 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 from common import *
 
+import sys
+
 from trezor import utils
 
 
@@ -13,6 +15,44 @@ class TestUtils(unittest.TestCase):
             self.assertEqual(c[i].stop, 100 if (i == 14) else (i + 1) * 7)
             self.assertEqual(c[i].step, 1)
 
+    def test_module_residency(self):
+        residency = utils.ModuleResidency(0)
+        m = residency.begin('a')
+        sys.modules['residency_test_a'] = object()
+        sys.modules['residency_test_shared'] = object()
+        residency.end('a', m)
+        # no memory pressure, the modules stay imported
+        self.assertIn('residency_test_a', sys.modules)
+        self.assertIn('residency_test_shared', sys.modules)
+
+        # the first run of a workflow starts with no resident modules
+        m = residency.begin('b')
+        self.assertNotIn('residency_test_a', sys.modules)
+        self.assertNotIn('residency_test_shared', sys.modules)
+        sys.modules['residency_test_b'] = object()
+        sys.modules['residency_test_shared'] = object()
+        residency.end('b', m)
+
+        m = residency.begin('a')
+        sys.modules['residency_test_a'] = object()
+        residency.end('a', m)
+        self.assertEqual(residency.resident, ['b', 'a'])
+        self.assertEqual(residency.groups['a'], set(['residency_test_a', 'residency_test_shared']))
+
+        # the least recently used group is evicted first, its modules listed
+        # by a resident group stay imported
+        residency.evict(1)
+        self.assertNotIn('residency_test_b', sys.modules)
+        self.assertIn('residency_test_a', sys.modules)
+        self.assertIn('residency_test_shared', sys.modules)
+
+        residency.min_free = 1 << 30
+        m = residency.begin('a')
+        residency.end('a', m)
+        self.assertNotIn('residency_test_a', sys.modules)
+        self.assertNotIn('residency_test_shared', sys.modules)
+        self.assertEqual(residency.resident, [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -94,6 +94,64 @@ def test_reader():
     assert_async(reader.areadinto(onebyte_buffer), [(None, EOFError()), ])
 
 
+def test_reader_readbyte():
+    rep_len = 64
+    interface_num = 0xdeadbeef
+    message_len = 60
+    interface = MockHID(interface_num)
+    reader = codec_v1.Reader(interface)
+
+    message = bytearray(range(message_len))
+    report_header = bytearray(unhexlify('3f232343210000003c'))
+
+    first_report = report_header + message[:rep_len - len(report_header)]
+    assert_async(reader.aopen(), [(None, wait(io.POLL_READ | interface_num)), (first_report, StopIteration()), ])
+
+    # bytes buffered in the initial report are returned without waiting
+    for i in range(rep_len - len(report_header)):
+        assert_eq(reader.readbyte(), message[i])
+    assert_eq(reader.size, message_len - (rep_len - len(report_header)))
+
+    # report is exhausted, continuation has to be awaited
+    assert_eq(reader.readbyte(), -1)
+    next_report = bytearray(unhexlify('3f')) + message[rep_len - len(report_header):]
+    next_report += bytearray(rep_len - len(next_report))
+    onebyte_buffer = bytearray(1)
+    assert_async(reader.areadinto(onebyte_buffer), [(None, wait(io.POLL_READ | interface_num)), (next_report, StopIteration()), ])
+    assert_eq(onebyte_buffer[0], message[rep_len - len(report_header)])
+
+    # padding after the end of message is never returned
+    while reader.size:
+        reader.readbyte()
+    assert_eq(reader.readbyte(), -1)
+
+
+def test_reader_readinto_view():
+    rep_len = 64
+    interface_num = 0xdeadbeef
+    message_len = 200
+    interface = MockHID(interface_num)
+    reader = codec_v1.Reader(interface)
+
+    message = bytearray(range(message_len))
+    report_header = bytearray(unhexlify('3f23234321000000c8'))
+    first_report = report_header + message[:rep_len - len(report_header)]
+    next_reports = [bytearray(unhexlify('3f')) + r for r in chunks(message[rep_len - len(report_header):], rep_len - 1)]
+    next_reports[-1] += bytearray(rep_len - len(next_reports[-1]))
+    assert_async(reader.aopen(), [(None, wait(io.POLL_READ | interface_num)), (first_report, StopIteration()), ])
+
+    # read the whole message into the middle of a larger buffer
+    ofs = 10
+    buffer = bytearray(ofs + message_len + ofs)
+    expected_syscalls = [(None, wait(io.POLL_READ | interface_num))]
+    for report in next_reports[:-1]:
+        expected_syscalls.append((report, wait(io.POLL_READ | interface_num)))
+    expected_syscalls.append((next_reports[-1], StopIteration()))
+    assert_async(reader.readinto_view(buffer, ofs, message_len), expected_syscalls)
+    assert_eq(buffer, bytearray(ofs) + message + bytearray(ofs))
+    assert_eq(reader.size, 0)
+
+
 def test_writer():
     rep_len = 64
     interface_num = 0xdeadbeef
@@ -124,16 +182,17 @@ def test_writer():
               short_payload +
               bytearray(rep_len - len(report_header) - len(short_payload)))
 
-    # aligned write, expected one report
+    # aligned write, expected one queued report
     start_size = writer.size
     aligned_payload = bytearray(range(rep_len - len(report_header) - len(short_payload)))
-    assert_async(writer.awrite(aligned_payload), [(None, wait(io.POLL_WRITE | interface_num)), (None, StopIteration()), ])
-    assert_eq(interface.data, [report_header +
-                               short_payload +
-                               aligned_payload +
-                               bytearray(rep_len - len(report_header) - len(short_payload) - len(aligned_payload)), ])
+    assert_async(writer.awrite(aligned_payload), [(None, StopIteration()), ])
+    first_report = (report_header +
+                    short_payload +
+                    aligned_payload +
+                    bytearray(rep_len - len(report_header) - len(short_payload) - len(aligned_payload)))
+    assert_eq(interface.data, [])
+    assert_eq(writer.queue, [first_report])
     assert_eq(writer.size, start_size - len(aligned_payload))
-    interface.data.clear()
 
     # short write, expected no report, but data starts with correct seq and cont marker
     report_header = bytearray(unhexlify('3f'))
@@ -143,29 +202,44 @@ def test_writer():
     assert_eq(writer.data[:len(report_header) + len(short_payload)],
               report_header + short_payload)
 
-    # long write, expected multiple reports
+    # long write, expected multiple reports, flushed in batches
     start_size = writer.size
     long_payload_head = bytearray(range(rep_len - len(report_header) - len(short_payload)))
     long_payload_rest = bytearray(range(start_size - len(long_payload_head)))
     long_payload = long_payload_head + long_payload_rest
     expected_payloads = [short_payload + long_payload_head] + list(chunks(long_payload_rest, rep_len - len(report_header)))
-    expected_reports = [report_header + r for r in expected_payloads]
+    expected_reports = [first_report] + [report_header + r for r in expected_payloads]
     expected_reports[-1] += bytearray(bytes(1) * (rep_len - len(expected_reports[-1])))
     # test write
-    expected_write_reports = expected_reports[:-1]
+    batch_len = 4
+    complete_reports = expected_reports[:-1]
+    expected_write_reports = complete_reports[:len(complete_reports) // batch_len * batch_len]
     assert_async(writer.awrite(long_payload), len(expected_write_reports) * [(None, wait(io.POLL_WRITE | interface_num))] + [(None, StopIteration())])
     assert_eq(interface.data, expected_write_reports)
+    assert_eq(writer.queue, complete_reports[len(expected_write_reports):])
     assert_eq(writer.size, start_size - len(long_payload))
     interface.data.clear()
     # test write raises eof
     assert_async(writer.awrite(bytearray(1)), [(None, EOFError())])
     assert_eq(interface.data, [])
     # test close
-    expected_close_reports = expected_reports[-1:]
+    expected_close_reports = expected_reports[len(expected_write_reports):]
     assert_async(writer.aclose(), len(expected_close_reports) * [(None, wait(io.POLL_WRITE | interface_num))] + [(None, StopIteration())])
     assert_eq(interface.data, expected_close_reports)
+    assert_eq(writer.queue, [])
     assert_eq(writer.size, 0)
 
 
+def test_writer_empty():
+    interface_num = 0xdeadbeef
+    interface = MockHID(interface_num)
+    writer = codec_v1.Writer(interface)
+    writer.setheader(0x0002, 0)
+
+    # close of an empty message pads and flushes the initial report
+    assert_async(writer.aclose(), [(None, wait(io.POLL_WRITE | interface_num)), (None, StopIteration())])
+    assert_eq(interface.data, [bytearray(unhexlify('3f2323000200000000')) + bytearray(64 - 9)])
+
+
 if __name__ == '__main__':
     run_tests()